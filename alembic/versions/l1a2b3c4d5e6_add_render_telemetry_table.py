@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""add_render_telemetry_table
+
+Revision ID: l1a2b3c4d5e6
+Revises: k1b2c3d4e5f6
+Create Date: 2026-10-19 00:00:00.000000
+
+Add render_telemetry table recording encoder speed and bitrate per completed
+render, used by the encoder preset planner and output size/ETA estimates.
+Downgrade is a no-op (append-only table; dropping would erase telemetry).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "l1a2b3c4d5e6"
+down_revision: str | Sequence[str] | None = "k1b2c3d4e5f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create render_telemetry table and encoder index (idempotent)."""
+    op.execute(
+        sa.text("""
+        CREATE TABLE IF NOT EXISTS render_telemetry (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL,
+            encoder TEXT NOT NULL,
+            preset TEXT NOT NULL,
+            quality TEXT NOT NULL,
+            width INTEGER NOT NULL,
+            height INTEGER NOT NULL,
+            fps REAL NOT NULL,
+            filter_cost INTEGER NOT NULL,
+            duration_s REAL NOT NULL,
+            elapsed_s REAL NOT NULL,
+            speed_ratio REAL NOT NULL,
+            output_bytes INTEGER NOT NULL,
+            bitrate_bps REAL NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """)
+    )
+    op.execute(
+        sa.text(
+            "CREATE INDEX IF NOT EXISTS idx_render_telemetry_encoder "
+            "ON render_telemetry(encoder, quality)"
+        )
+    )
+
+
+def downgrade() -> None:
+    """No-op downgrade for render_telemetry (append-only table)."""
+    pass
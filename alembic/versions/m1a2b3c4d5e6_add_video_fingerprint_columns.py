@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""add_video_fingerprint_columns
+
+Revision ID: m1a2b3c4d5e6
+Revises: l1a2b3c4d5e6
+Create Date: 2026-10-19 12:00:00.000000
+
+Add the stored source fingerprint (stat identity plus sampled and full
+SHA-256) to the videos table, so proxy staleness checks can answer from
+``stat`` while a source is unchanged.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "m1a2b3c4d5e6"
+down_revision: str | Sequence[str] | None = "l1a2b3c4d5e6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add file_mtime_ns, file_inode, sampled_sha256, content_sha256 columns to videos.
+
+    Idempotent: checks existing columns via PRAGMA table_info before each
+    ALTER TABLE, so re-running after a no-op downgrade does not error.
+    All columns are nullable; rows scanned before this revision fall back to
+    hashing until the next scan records their fingerprint.
+    """
+    bind = op.get_bind()
+    existing = {row[1] for row in bind.execute(sa.text("PRAGMA table_info(videos)")).fetchall()}
+    if "file_mtime_ns" not in existing:
+        op.execute("ALTER TABLE videos ADD COLUMN file_mtime_ns INTEGER")
+    if "file_inode" not in existing:
+        op.execute("ALTER TABLE videos ADD COLUMN file_inode INTEGER")
+    if "sampled_sha256" not in existing:
+        op.execute("ALTER TABLE videos ADD COLUMN sampled_sha256 TEXT")
+    if "content_sha256" not in existing:
+        op.execute("ALTER TABLE videos ADD COLUMN content_sha256 TEXT")
+
+
+def downgrade() -> None:
+    """No-op: SQLite does not support DROP COLUMN in older versions.
+
+    The columns remain NULL-able; existing rows are unaffected.
+    """
+    pass
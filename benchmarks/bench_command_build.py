@@ -0,0 +1,197 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Render command build time on a large timeline, with and without memoization.
+
+Builds the multi-clip FFmpeg command for a synthetic timeline (500 clips by
+default, cut from a handful of source videos, each clip carrying video and
+audio effects) the way a render, a retry and a re-render of an unchanged
+project do:
+
+- ``uncached``: no fragment cache; every build rebuilds every effect filter.
+- ``cold cache``: first build with an empty `ClipFragmentCache`.
+- ``warm cache``: later builds of the unchanged timeline.
+
+Video lookups are memoized within each build in every mode. Does not run
+FFmpeg. Requires the built Rust core (the render graph translator).
+
+Run with: uv run python -m benchmarks.bench_command_build [--clips 500] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from stoat_ferret.db.async_repository import AsyncInMemoryVideoRepository
+from stoat_ferret.db.clip_repository import AsyncInMemoryClipRepository
+from stoat_ferret.db.models import Clip, Video
+from stoat_ferret.effects.definitions import create_default_registry
+from stoat_ferret.effects.registry import EffectRegistry
+from stoat_ferret.render.fragment_cache import ClipFragmentCache
+from stoat_ferret.render.models import OutputFormat, QualityPreset, RenderJob, RenderStatus
+from stoat_ferret.render.worker import build_command_for_job
+
+_PROJECT_ID = "bench-command-build"
+_SOURCE_COUNT = 5
+_FPS = 30
+_CLIP_FRAMES = 15
+
+
+@dataclass
+class BuildResult:
+    """Command build timings for one mode."""
+
+    mode: str
+    clip_count: int
+    times: list[float]
+
+    @property
+    def median_ms(self) -> float:
+        """Median build time in milliseconds."""
+        return statistics.median(self.times) * 1000
+
+    @property
+    def best_ms(self) -> float:
+        """Fastest build time in milliseconds."""
+        return min(self.times) * 1000
+
+
+def _effects(i: int) -> list[dict[str, object]]:
+    return [
+        {"effect_type": "blur", "parameters": {"sigma": 1.0 + i % 4}},
+        {"effect_type": "sharpen", "parameters": {"amount": 0.5}},
+        {"effect_type": "volume", "parameters": {"volume": 0.8}},
+    ]
+
+
+async def _repositories(
+    clip_count: int,
+) -> tuple[AsyncInMemoryClipRepository, AsyncInMemoryVideoRepository]:
+    now = datetime.now(timezone.utc)
+    videos = AsyncInMemoryVideoRepository()
+    for s in range(_SOURCE_COUNT):
+        await videos.add(
+            Video(
+                id=f"src-{s}",
+                path=f"/media/source_{s}.mp4",
+                filename=f"source_{s}.mp4",
+                duration_frames=600 * _FPS,
+                frame_rate_numerator=_FPS,
+                frame_rate_denominator=1,
+                width=1920,
+                height=1080,
+                video_codec="h264",
+                audio_codec="aac",
+                file_size=1,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+    clips = AsyncInMemoryClipRepository()
+    for i in range(clip_count):
+        await clips.add(
+            Clip(
+                id=f"clip-{i:04d}",
+                project_id=_PROJECT_ID,
+                source_video_id=f"src-{i % _SOURCE_COUNT}",
+                in_point=i % 100,
+                out_point=i % 100 + _CLIP_FRAMES,
+                timeline_position=i * _CLIP_FRAMES,
+                created_at=now,
+                updated_at=now,
+                effects=_effects(i),
+            )
+        )
+    return clips, videos
+
+
+def _job(clip_count: int) -> RenderJob:
+    now = datetime.now(timezone.utc)
+    settings = {"codec": "libx264", "fps": _FPS, "width": 1920, "height": 1080}
+    return RenderJob(
+        id=f"bench-{clip_count}",
+        project_id=_PROJECT_ID,
+        status=RenderStatus.RUNNING,
+        output_path=f"/tmp/bench_command_build_{clip_count}.mp4",
+        output_format=OutputFormat.MP4,
+        quality_preset=QualityPreset.STANDARD,
+        render_plan=json.dumps(
+            {"settings": settings, "total_duration": clip_count * _CLIP_FRAMES / _FPS}
+        ),
+        progress=0.0,
+        error_message=None,
+        retry_count=0,
+        created_at=now,
+        updated_at=now,
+        completed_at=None,
+    )
+
+
+async def _time_build(
+    job: RenderJob,
+    clips: AsyncInMemoryClipRepository,
+    videos: AsyncInMemoryVideoRepository,
+    registry: EffectRegistry,
+    cache: ClipFragmentCache | None,
+) -> float:
+    start = time.perf_counter()
+    await build_command_for_job(job, clips, videos, effect_registry=registry, fragment_cache=cache)
+    return time.perf_counter() - start
+
+
+async def run_all(clip_count: int, repeat: int) -> list[BuildResult]:
+    """Time command builds in each mode.
+
+    Args:
+        clip_count: Clips on the synthetic timeline.
+        repeat: Builds per mode (cold cache uses a fresh cache each time).
+
+    Returns:
+        One result per mode.
+    """
+    clips, videos = await _repositories(clip_count)
+    registry = create_default_registry()
+    job = _job(clip_count)
+    uncached = [await _time_build(job, clips, videos, registry, None) for _ in range(repeat)]
+    cold = [
+        await _time_build(job, clips, videos, registry, ClipFragmentCache()) for _ in range(repeat)
+    ]
+    cache = ClipFragmentCache()
+    await _time_build(job, clips, videos, registry, cache)
+    warm = [await _time_build(job, clips, videos, registry, cache) for _ in range(repeat)]
+    return [
+        BuildResult("uncached", clip_count, uncached),
+        BuildResult("cold cache", clip_count, cold),
+        BuildResult("warm cache", clip_count, warm),
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clips", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = asyncio.run(run_all(args.clips, args.repeat))
+    baseline = results[0].median_ms
+    print(
+        f"\n  {'Mode':<12s} {'Clips':>6s} {'Median (ms)':>12s} {'Best (ms)':>10s} {'Speedup':>8s}"
+    )
+    print(f"  {'-' * 52}")
+    for r in results:
+        speedup = baseline / r.median_ms if r.median_ms else 0.0
+        print(
+            f"  {r.mode:<12s} {r.clip_count:>6d} {r.median_ms:>12.2f} "
+            f"{r.best_ms:>10.2f} {speedup:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Effect parameter validation: per-request validators vs precompiled ones.
+
+Validates a synthetic project's stored effects (text overlays, volume,
+blur, sharpen, crop, EQ) the way the API does:
+
+- ``per-request``: builds a ``jsonschema.Draft7Validator`` for every effect,
+  as ``_validate_scalar_parameters`` did before validators were precompiled.
+- ``precompiled``: ``EffectRegistry.validate`` with the validator built at
+  registration.
+- ``bulk stack``: one ``EffectRegistry.validate_stack`` call per clip, as
+  ``POST /projects/{id}/effects/validate`` does.
+
+Run with: uv run python -m benchmarks.bench_effect_validation [--effects 2000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import jsonschema
+
+from stoat_ferret.effects.definitions import create_default_registry
+from stoat_ferret.effects.registry import EffectRegistry
+
+_EFFECTS_PER_CLIP = 4
+
+_SAMPLES: list[dict[str, Any]] = [
+    {"effect_type": "text_overlay", "parameters": {"text": "Title", "fontsize": 48}},
+    {"effect_type": "volume", "parameters": {"volume": 0.8}},
+    {"effect_type": "blur", "parameters": {"sigma": 2.0}},
+    {"effect_type": "sharpen", "parameters": {"amount": 0.5}},
+    {"effect_type": "crop", "parameters": {"width": 1280, "height": 720}},
+    {
+        "effect_type": "parametric_eq",
+        "parameters": {"bands": [{"frequency": 1000, "gain": 3.0, "width": 1.0}]},
+    },
+]
+
+
+@dataclass
+class ValidationResult:
+    """Validation timings for one mode."""
+
+    mode: str
+    effect_count: int
+    times: list[float]
+
+    @property
+    def median_ms(self) -> float:
+        """Median time to validate every effect, in milliseconds."""
+        return statistics.median(self.times) * 1000
+
+    @property
+    def per_effect_us(self) -> float:
+        """Median time per effect, in microseconds."""
+        return statistics.median(self.times) * 1_000_000 / self.effect_count
+
+
+def _stack(effect_count: int) -> list[dict[str, Any]]:
+    return [_SAMPLES[i % len(_SAMPLES)] for i in range(effect_count)]
+
+
+def _per_request(registry: EffectRegistry, stack: list[dict[str, Any]]) -> None:
+    for entry in stack:
+        definition = registry.get(entry["effect_type"])
+        assert definition is not None
+        validator = jsonschema.Draft7Validator(definition.parameter_schema)
+        list(validator.iter_errors(entry["parameters"]))
+
+
+def _precompiled(registry: EffectRegistry, stack: list[dict[str, Any]]) -> None:
+    for entry in stack:
+        registry.validate(entry["effect_type"], entry["parameters"])
+
+
+def _bulk(registry: EffectRegistry, stack: list[dict[str, Any]]) -> None:
+    for start in range(0, len(stack), _EFFECTS_PER_CLIP):
+        registry.validate_stack(stack[start : start + _EFFECTS_PER_CLIP])
+
+
+def _time(
+    fn: Callable[[EffectRegistry, list[dict[str, Any]]], None],
+    registry: EffectRegistry,
+    stack: list[dict[str, Any]],
+    repeat: int,
+) -> list[float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(registry, stack)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run_all(effect_count: int, repeat: int) -> list[ValidationResult]:
+    """Time validation of ``effect_count`` stored effects in each mode.
+
+    Args:
+        effect_count: Effects in the synthetic project.
+        repeat: Timed runs per mode.
+
+    Returns:
+        One result per mode.
+    """
+    registry = create_default_registry()
+    stack = _stack(effect_count)
+    if registry.validate_stack(stack):
+        raise SystemExit("benchmark samples no longer match the effect schemas")
+    return [
+        ValidationResult("per-request", effect_count, _time(_per_request, registry, stack, repeat)),
+        ValidationResult("precompiled", effect_count, _time(_precompiled, registry, stack, repeat)),
+        ValidationResult("bulk stack", effect_count, _time(_bulk, registry, stack, repeat)),
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--effects", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run_all(args.effects, args.repeat)
+    baseline = results[0].median_ms
+    print(
+        f"\n  {'Mode':<12s} {'Effects':>8s} {'Median (ms)':>12s} {'Per effect (us)':>16s}"
+        f" {'Speedup':>8s}"
+    )
+    print(f"  {'-' * 60}")
+    for r in results:
+        speedup = baseline / r.median_ms if r.median_ms else 0.0
+        print(
+            f"  {r.mode:<12s} {r.effect_count:>8d} {r.median_ms:>12.2f} "
+            f"{r.per_effect_us:>16.2f} {speedup:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
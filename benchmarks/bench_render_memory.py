@@ -0,0 +1,233 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Peak FFmpeg RSS versus clip count: single-pass vs hierarchical rendering.
+
+Renders synthetic timelines of increasing clip count twice — once with the
+single multi-clip command (every clip an ``-i`` input) and once with the
+windowed mezzanine strategy — and reports the peak resident set size of the
+largest FFmpeg process in each run, measured with ``os.wait4``.
+
+Requires ``ffmpeg`` on PATH, the built Rust core, and a POSIX platform.
+
+Run with: uv run python -m benchmarks.bench_render_memory [--clips 8 32 128 256]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from stoat_ferret.db.async_repository import AsyncInMemoryVideoRepository
+from stoat_ferret.db.clip_repository import AsyncInMemoryClipRepository
+from stoat_ferret.db.models import Clip, Video
+from stoat_ferret.render.hierarchical import HierarchicalRenderCommands
+from stoat_ferret.render.models import OutputFormat, QualityPreset, RenderJob, RenderStatus
+from stoat_ferret.render.worker import build_command_for_job, build_hierarchical_render_for_job
+
+_PROJECT_ID = "bench-render-memory"
+_SOURCE_SECONDS = 2
+_FPS = 30
+_CLIP_FRAMES = 15  # half a second per clip
+_MAX_CLIPS_PER_PASS = 32
+
+
+@dataclass
+class MemoryResult:
+    """Peak RSS for one strategy at one clip count."""
+
+    strategy: str
+    clip_count: int
+    peak_rss_mib: float
+    elapsed_seconds: float
+    ok: bool
+
+
+def _run_measured(command: list[str]) -> tuple[float, bool]:
+    """Run ``command`` and return (peak RSS in MiB, success)."""
+    proc = subprocess.Popen(  # noqa: S603 - benchmark runs locally built argv
+        command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return usage.ru_maxrss / 1024, proc.returncode == 0
+
+
+def _make_source(work_dir: Path) -> Path:
+    source = work_dir / "source.mp4"
+    subprocess.run(  # noqa: S603, S607 - fixed argv
+        [
+            "ffmpeg",
+            "-v",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            f"testsrc2=size=1280x720:rate={_FPS}:duration={_SOURCE_SECONDS}",
+            "-f",
+            "lavfi",
+            "-i",
+            f"sine=frequency=440:duration={_SOURCE_SECONDS}",
+            "-c:v",
+            "libx264",
+            "-c:a",
+            "aac",
+            "-shortest",
+            "-y",
+            str(source),
+        ],
+        check=True,
+    )
+    return source
+
+
+async def _repositories(
+    source: Path, source_size: int, clip_count: int
+) -> tuple[AsyncInMemoryClipRepository, AsyncInMemoryVideoRepository]:
+    now = datetime.now(timezone.utc)
+    videos = AsyncInMemoryVideoRepository()
+    await videos.add(
+        Video(
+            id="src",
+            path=str(source),
+            filename=source.name,
+            duration_frames=_SOURCE_SECONDS * _FPS,
+            frame_rate_numerator=_FPS,
+            frame_rate_denominator=1,
+            width=1280,
+            height=720,
+            video_codec="h264",
+            audio_codec="aac",
+            file_size=source_size,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    clips = AsyncInMemoryClipRepository()
+    for i in range(clip_count):
+        await clips.add(
+            Clip(
+                id=f"clip-{i:04d}",
+                project_id=_PROJECT_ID,
+                source_video_id="src",
+                in_point=0,
+                out_point=_CLIP_FRAMES,
+                timeline_position=i * _CLIP_FRAMES,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+    return clips, videos
+
+
+def _job(output_path: Path, clip_count: int) -> RenderJob:
+    now = datetime.now(timezone.utc)
+    settings = {"codec": "libx264", "fps": _FPS, "width": 1280, "height": 720}
+    return RenderJob(
+        id=f"bench-{clip_count}",
+        project_id=_PROJECT_ID,
+        status=RenderStatus.RUNNING,
+        output_path=str(output_path),
+        output_format=OutputFormat.MP4,
+        quality_preset=QualityPreset.DRAFT,
+        render_plan=json.dumps(
+            {"settings": settings, "total_duration": clip_count * _CLIP_FRAMES / _FPS}
+        ),
+        progress=0.0,
+        error_message=None,
+        retry_count=0,
+        created_at=now,
+        updated_at=now,
+        completed_at=None,
+    )
+
+
+async def _build_commands(
+    source: Path, source_size: int, clip_count: int, work_dir: Path
+) -> tuple[list[str], HierarchicalRenderCommands | None]:
+    clips, videos = await _repositories(source, source_size, clip_count)
+    flat = await build_command_for_job(
+        _job(work_dir / f"flat_{clip_count}.mp4", clip_count), clips, videos
+    )
+    hierarchical = await build_hierarchical_render_for_job(
+        _job(work_dir / f"hier_{clip_count}.mp4", clip_count),
+        clips,
+        videos,
+        work_dir / f"hier_{clip_count}",
+        _MAX_CLIPS_PER_PASS,
+    )
+    return flat, hierarchical
+
+
+def _measure(source: Path, clip_count: int, work_dir: Path) -> list[MemoryResult]:
+    flat, hierarchical = asyncio.run(
+        _build_commands(source, source.stat().st_size, clip_count, work_dir)
+    )
+    results: list[MemoryResult] = []
+
+    start = time.perf_counter()
+    peak, ok = _run_measured(flat)
+    results.append(MemoryResult("single-pass", clip_count, peak, time.perf_counter() - start, ok))
+
+    passes = [flat]
+    if hierarchical is not None:
+        hierarchical.concat_list_path.parent.mkdir()
+        hierarchical.concat_list_path.write_text(hierarchical.concat_list)
+        passes = [*hierarchical.window_commands, hierarchical.concat]
+    start = time.perf_counter()
+    peaks: list[float] = []
+    for command in passes:
+        peak, ok = _run_measured(command)
+        peaks.append(peak)
+        if not ok:
+            break
+    results.append(
+        MemoryResult("hierarchical", clip_count, max(peaks), time.perf_counter() - start, ok)
+    )
+    return results
+
+
+def run_all(clip_counts: list[int]) -> list[MemoryResult]:
+    """Measure both strategies at each clip count.
+
+    Args:
+        clip_counts: Timeline sizes to render.
+
+    Returns:
+        One result per strategy and clip count.
+    """
+    results: list[MemoryResult] = []
+    with tempfile.TemporaryDirectory(prefix="bench_render_memory_") as tmp:
+        work_dir = Path(tmp)
+        source = _make_source(work_dir)
+        for clip_count in clip_counts:
+            results.extend(_measure(source, clip_count, work_dir))
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clips", type=int, nargs="+", default=[8, 32, 128, 256])
+    args = parser.parse_args()
+
+    print(f"\n  {'Strategy':<14s} {'Clips':>6s} {'Peak RSS (MiB)':>15s} {'Time (s)':>9s} Status")
+    print(f"  {'-' * 56}")
+    for r in run_all(args.clips):
+        status = "ok" if r.ok else "FAILED"
+        print(
+            f"  {r.strategy:<14s} {r.clip_count:>6d} {r.peak_rss_mib:>15.1f} "
+            f"{r.elapsed_seconds:>9.2f} {status}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -22,9 +22,13 @@ export interface paths {
          * @description Upload an asset file (multipart/form-data).
          *
          *     - Validates content via Pillow magic-bytes sniff (image kind only in v090).
-         *     - Enforces STOAT_ASSETS_MAX_SIZE_BYTES.
+         *     - Enforces STOAT_ASSETS_MAX_SIZE_BYTES: up front from Content-Length, and
+         *       while the body streams in.
          *     - Deduplicates by content hash; re-upload of a soft-deleted asset restores it.
          *     - File is stored under STOAT_ASSETS_DIR as <sha256hex>.<ext>.
+         *     - The multipart body is parsed as it streams in and the ``file`` field is
+         *       written to disk once, hashed in chunks, never held whole in memory.
+         *       Use the ``/uploads`` endpoints for large or resumable uploads.
          */
         post: operations["upload_asset_api_v1_assets_post"];
         delete?: never;
@@ -33,6 +37,83 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/v1/assets/uploads": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Create Upload
+         * @description Start a resumable upload.
+         *
+         *     Send the content with ``PATCH /uploads/{upload_id}`` in one or more
+         *     byte ranges, then call ``POST /uploads/{upload_id}/complete``.
+         */
+        post: operations["create_upload_api_v1_assets_uploads_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/api/v1/assets/uploads/{upload_id}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Upload
+         * @description Get the current offset of a resumable upload (to resume after a failure).
+         */
+        get: operations["get_upload_api_v1_assets_uploads__upload_id__get"];
+        put?: never;
+        post?: never;
+        /**
+         * Abort Upload
+         * @description Abandon a resumable upload and delete its partial file.
+         */
+        delete: operations["abort_upload_api_v1_assets_uploads__upload_id__delete"];
+        options?: never;
+        head?: never;
+        /**
+         * Append Upload
+         * @description Append the raw request body to a resumable upload.
+         *
+         *     The body is streamed to the part file and hashed in chunks. If the
+         *     connection drops, bytes already written are kept: fetch the upload's
+         *     offset and resend from there.
+         */
+        patch: operations["append_upload_api_v1_assets_uploads__upload_id__patch"];
+        trace?: never;
+    };
+    "/api/v1/assets/uploads/{upload_id}/complete": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Complete Upload
+         * @description Finish a resumable upload and store it as an asset.
+         *
+         *     Validation, deduplication and storage match ``POST /api/v1/assets``.
+         */
+        post: operations["complete_upload_api_v1_assets_uploads__upload_id__complete_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/v1/assets/{asset_id}": {
         parameters: {
             query?: never;
@@ -225,15 +306,18 @@ export interface paths {
          * @description Return the Pydantic JSON Schema for a domain resource.
          *
          *     The schema is generated directly from the Pydantic response model's
-         *     ``model_json_schema()`` method — no custom serialization. Pydantic V2
-         *     caches the result after the first call, so repeated lookups are cheap.
+         *     ``model_json_schema()`` method — no custom serialization. It is
+         *     serialised once per process and served with a strong ``ETag`` (gzip
+         *     or Brotli when accepted); ``If-None-Match`` hits return 304.
          *
          *     Args:
          *         resource: One of ``project``, ``clip``, ``timeline``, ``render_job``,
          *             ``effect``, ``video``. Any other value returns 404.
+         *         request: The incoming request (``Accept-Encoding``, ``If-None-Match``).
+         *         cache: Discovery payload cache.
          *
          *     Returns:
-         *         The JSON Schema dict for the requested resource.
+         *         The JSON Schema for the requested resource.
          *
          *     Raises:
          *         HTTPException: 404 when ``resource`` is not a supported name.
@@ -315,10 +399,12 @@ export interface paths {
          * @description Get thumbnail image for a video.
          *
          *     Returns the generated thumbnail if available, or a placeholder image
-         *     if thumbnail generation failed or hasn't been run.
+         *     if thumbnail generation failed or hasn't been run. Either is streamed
+         *     with a file-identity ETag, so revalidation returns 304.
          *
          *     Args:
          *         video_id: The unique video identifier.
+         *         request: The FastAPI request object.
          *         repo: Video repository dependency.
          *
          *     Returns:
@@ -939,6 +1025,10 @@ export interface paths {
          * List Effects
          * @description List all available effects with metadata, schemas, and previews.
          *
+         *     The catalogue is built once per registry version and served
+         *     pre-serialised (gzip or Brotli when accepted) with a strong ``ETag``;
+         *     ``If-None-Match`` hits return 304.
+         *
          *     Returns:
          *         List of all registered effects with their parameter schemas,
          *         AI hints, filter preview strings, structured parameter list,
@@ -1173,6 +1263,43 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/v1/projects/{project_id}/effects/validate": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Validate Project Effects
+         * @description Validate every stored clip effect and transition in a project.
+         *
+         *     Re-checks each clip's effect stack and the project's transitions
+         *     against the current effect registry in one call, using the
+         *     registry's precompiled parameter validators. Invalid entries are
+         *     reported rather than rejected; nothing is modified.
+         *
+         *     Args:
+         *         project_id: The unique project identifier.
+         *         registry: Effect registry dependency.
+         *         project_repo: Project repository dependency.
+         *         clip_repo: Clip repository dependency.
+         *
+         *     Returns:
+         *         Counts of checked clips and effects, and the invalid entries.
+         *
+         *     Raises:
+         *         HTTPException: 404 if the project is not found.
+         */
+        post: operations["validate_project_effects_api_v1_projects__project_id__effects_validate_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/v1/compose/presets": {
         parameters: {
             query?: never;
@@ -1539,6 +1666,38 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/v1/projects/{project_id}/tts/synthesise-all": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Dispatch TTS synthesis for every cue in a project
+         * @description Dispatch synthesis for all project cues that lack usable audio.
+         *
+         *     Pending and failed cues are dispatched, as are ready cues whose cached
+         *     audio has been evicted. Synthesis runs concurrently up to
+         *     STOAT_TTS_MAX_CONCURRENT_SYNTHESIS; a ``tts.synthesis_progress``
+         *     WebSocket event is broadcast as each cue finishes.
+         *
+         *     Args:
+         *         project_id: The project UUID.
+         *         request: The incoming HTTP request (provides TtsService access).
+         *
+         *     Returns:
+         *         Counts of dispatched, in-progress and already-ready cues.
+         */
+        post: operations["synthesise_all_tts_cues_api_v1_projects__project_id__tts_synthesise_all_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/v1/tts/voices": {
         parameters: {
             query?: never;
@@ -1749,6 +1908,49 @@ export interface paths {
         patch: operations["update_timeline_clip_api_v1_projects__project_id__timeline_clips__clip_id__patch"];
         trace?: never;
     };
+    "/api/v1/projects/{project_id}/timeline/batch": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Batch Timeline
+         * @description Apply a list of timeline operations atomically.
+         *
+         *     Operations are validated in order against a working copy of the
+         *     project's clips, so later operations see the effect of earlier ones.
+         *     Nothing is written unless every operation succeeds; the modified clips
+         *     are then persisted in a single transaction.
+         *
+         *     Args:
+         *         project_id: The unique project identifier.
+         *         batch: The operations to apply.
+         *         request: The FastAPI request object.
+         *         registry: Effect registry dependency.
+         *         project_repo: Project repository dependency.
+         *         timeline_repo: Timeline repository dependency.
+         *         clip_repo: Clip repository dependency.
+         *
+         *     Returns:
+         *         Full timeline response after the batch is applied.
+         *
+         *     Raises:
+         *         HTTPException: 404 if the project is not found. Errors from an
+         *             operation use the same status and code as the equivalent
+         *             single-operation endpoint, with ``operation_index`` added to
+         *             the detail.
+         */
+        post: operations["batch_timeline_api_v1_projects__project_id__timeline_batch_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/v1/projects/{project_id}/timeline/transitions": {
         parameters: {
             query?: never;
@@ -2120,10 +2322,14 @@ export interface paths {
          * Get Segment
          * @description Serve an HLS segment file for a preview session.
          *
+         *     The segment is streamed from disk with ``Range`` support and a strong
+         *     file-identity ``ETag``; ``If-None-Match`` hits return 304.
+         *
          *     Args:
          *         session_id: The preview session ID.
          *         index: The segment index number.
          *         request: The FastAPI request object.
+         *         v: Segment version token written into the manifest URI.
          *
          *     Returns:
          *         MPEG-TS segment with Content-Type video/MP2T.
@@ -2337,7 +2543,8 @@ export interface paths {
          *         Created render job with 201 status.
          *
          *     Raises:
-         *         HTTPException: 400 for invalid format/preset/plan, 422 for pre-flight failure.
+         *         HTTPException: 400 for invalid format/preset/plan, 422 for invalid outputs
+         *             or pre-flight failure.
          */
         post: operations["create_render_job_api_v1_render_post"];
         delete?: never;
@@ -2485,15 +2692,18 @@ export interface paths {
          * @description Return current render queue status with capacity, disk space, and throughput.
          *
          *     Aggregates live queue counts from RenderQueue, disk space from the
-         *     render output directory, and today's completed/failed job counts
-         *     from the repository. Read-only — no state mutations (NFR-001).
+         *     render output directory, today's completed/failed job counts from the
+         *     repository, and the render service's start/finish forecast for every
+         *     running and queued job. Read-only — no state mutations (NFR-001).
          *
          *     Args:
          *         queue: Render queue dependency.
          *         repo: Render repository dependency.
+         *         render_service: Render service dependency (queue forecast).
          *
          *     Returns:
-         *         Queue status with active/pending counts, capacity, disk, and throughput.
+         *         Queue status with active/pending counts, capacity, disk, throughput,
+         *         and per-job forecasts.
          */
         get: operations["get_queue_status_api_v1_render_queue_get"];
         put?: never;
@@ -2695,19 +2905,25 @@ export interface paths {
          * Get System State
          * @description Return aggregate in-memory system state.
          *
-         *     Performs a single-pass scan over the job queue, WebSocket
-         *     connection manager, and render repository (INV-SNAP-1 updated:
-         *     includes async SQLite reads for RUNNING/QUEUED render jobs).
-         *     Missing or transiently-broken subsystems are reported as empty
-         *     collections rather than raising (NFR-003): the snapshot is
-         *     best-effort.
+         *     Generic queue jobs and WebSocket connections are read from memory on
+         *     each call; render jobs come from the tracker's incrementally updated
+         *     view, seeded once from ``render_repository``. Missing or
+         *     transiently-broken subsystems are reported as empty collections rather
+         *     than raising (NFR-003): the snapshot is best-effort.
+         *
+         *     Every response carries a weak ``ETag`` derived from the tracker
+         *     ``version``; ``timestamp`` and ``uptime_seconds`` are not part of it.
          *
          *     Args:
          *         request: FastAPI request, used to reach ``app.state``.
+         *         response: Outgoing response, used to set the ``ETag`` header.
+         *         wait_for_version: Version the caller already has; enables long-poll.
+         *         timeout: Long-poll deadline in seconds.
          *
          *     Returns:
          *         ``SystemState`` describing active jobs, open WebSocket
-         *         connections, and process uptime.
+         *         connections, process uptime and the change ``version``, or an
+         *         empty 304 response when ``If-None-Match`` matches.
          */
         get: operations["get_system_state_api_v1_system_state_get"];
         put?: never;
@@ -2860,10 +3076,11 @@ export interface paths {
          *
          *     Args:
          *         video_id: The source video ID.
+         *         request: The FastAPI request object.
          *         thumbnail_service: Thumbnail service dependency.
          *
          *     Returns:
-         *         JPEG image response.
+         *         JPEG image response (streamed, with ETag revalidation).
          *
          *     Raises:
          *         HTTPException: 404 if no strip exists or file not ready.
@@ -2967,6 +3184,82 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/v1/projects/{project_id}/versions/{from_version}/diff/{to_version}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Diff Versions
+         * @description Structurally diff two versions of a project.
+         *
+         *     Tracks, clips and other id-keyed items are matched by id, and subtrees
+         *     with matching checksums are skipped, so the response lists only what
+         *     changed.
+         *
+         *     Args:
+         *         project_id: The unique project identifier.
+         *         from_version: Source version number.
+         *         to_version: Target version number.
+         *         project_repo: Project repository dependency.
+         *         version_repo: Version repository dependency.
+         *
+         *     Returns:
+         *         The changes that turn ``from_version`` into ``to_version``.
+         *
+         *     Raises:
+         *         HTTPException: 404 if the project or either version is not found,
+         *             422 if a version does not contain JSON.
+         */
+        get: operations["diff_versions_api_v1_projects__project_id__versions__from_version__diff__to_version__get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/api/v1/projects/{project_id}/versions/merge": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Merge Versions
+         * @description Three-way merge two versions that diverged from a common base.
+         *
+         *     Non-overlapping changes from both versions are combined and saved as a
+         *     new version. The live timeline is not modified; restore the new
+         *     version to apply it.
+         *
+         *     Args:
+         *         project_id: The unique project identifier.
+         *         body: Base, ours and theirs version numbers plus conflict strategy.
+         *         project_repo: Project repository dependency.
+         *         version_repo: Version repository dependency.
+         *
+         *     Returns:
+         *         The new version and a summary of the merge.
+         *
+         *     Raises:
+         *         HTTPException: 404 if the project or a version is not found, 409 if
+         *             the versions conflict and strategy is ``fail``, 422 if a version
+         *             does not contain JSON.
+         */
+        post: operations["merge_versions_api_v1_projects__project_id__versions_merge_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/v1/videos/{video_id}/waveform": {
         parameters: {
             query?: never;
@@ -3028,10 +3321,11 @@ export interface paths {
          *
          *     Args:
          *         video_id: The source video ID.
+         *         request: The FastAPI request object.
          *         waveform_service: Waveform service dependency.
          *
          *     Returns:
-         *         PNG image response.
+         *         PNG image response (streamed, with ETag revalidation).
          *
          *     Raises:
          *         HTTPException: 404 if no waveform exists or file not ready.
@@ -3250,6 +3544,76 @@ export interface components {
              */
             updated_at: string;
         };
+        /**
+         * AssetUploadCreate
+         * @description Request body starting a resumable asset upload.
+         */
+        AssetUploadCreate: {
+            /**
+             * Kind
+             * @description Asset kind the completed upload is stored as.
+             * @default image
+             * @enum {string}
+             */
+            kind: "image" | "audio" | "subtitle" | "font" | "lut";
+            /**
+             * Filename
+             * @description Original filename.
+             */
+            filename: string;
+            /**
+             * Size Bytes
+             * @description Total upload size, if known. Appends beyond it are rejected with 413.
+             */
+            size_bytes?: number | null;
+            /**
+             * Content Type
+             * @description MIME type recorded for non-image kinds (images are content-sniffed).
+             */
+            content_type?: string | null;
+        };
+        /**
+         * AssetUploadStatus
+         * @description Progress of a resumable asset upload.
+         */
+        AssetUploadStatus: {
+            /**
+             * Upload Id
+             * @description Upload session ID.
+             */
+            upload_id: string;
+            /**
+             * Kind
+             * @description Asset kind.
+             * @enum {string}
+             */
+            kind: "image" | "audio" | "subtitle" | "font" | "lut";
+            /**
+             * Filename
+             * @description Original filename.
+             */
+            filename: string;
+            /**
+             * Offset
+             * @description Bytes received so far; the next append must start here.
+             */
+            offset: number;
+            /**
+             * Size Bytes
+             * @description Declared total size, if any.
+             */
+            size_bytes?: number | null;
+            /**
+             * Max Size Bytes
+             * @description Configured maximum asset size.
+             */
+            max_size_bytes: number;
+            /**
+             * Expires In Seconds
+             * @description Seconds until the session is discarded if no further bytes arrive.
+             */
+            expires_in_seconds: number;
+        };
         /**
          * AudioMixRequest
          * @description Request schema for audio mix configuration.
@@ -3286,6 +3650,25 @@ export interface components {
             /** Tracks Configured */
             tracks_configured: number;
         };
+        /**
+         * BatchAddClip
+         * @description Batch operation: place a clip on a track.
+         */
+        BatchAddClip: {
+            /**
+             * Op
+             * @constant
+             */
+            op: "add_clip";
+            /** Clip Id */
+            clip_id: string;
+            /** Track Id */
+            track_id: string;
+            /** Timeline Start */
+            timeline_start: number;
+            /** Timeline End */
+            timeline_end: number;
+        };
         /**
          * BatchJobConfig
          * @description Configuration for a single job in a batch render request.
@@ -3354,18 +3737,46 @@ export interface components {
             jobs: components["schemas"]["BatchJobStatusResponse"][];
         };
         /**
-         * BatchRequest
-         * @description Request to submit a batch of render jobs.
-         *
-         *     Contains a list of job configurations. The list must have at least one job.
-         *     Maximum job count is enforced by the endpoint against Settings.batch_max_jobs.
+         * BatchRemoveClip
+         * @description Batch operation: clear a clip's timeline placement.
          */
-        BatchRequest: {
+        BatchRemoveClip: {
             /**
-             * Jobs
-             * @description List of render job configurations
+             * Op
+             * @constant
              */
-            jobs: components["schemas"]["BatchJobConfig"][];
+            op: "remove_clip";
+            /** Clip Id */
+            clip_id: string;
+        };
+        /**
+         * BatchRemoveEffect
+         * @description Batch operation: remove a clip effect.
+         */
+        BatchRemoveEffect: {
+            /**
+             * Op
+             * @constant
+             */
+            op: "remove_effect";
+            /** Clip Id */
+            clip_id: string;
+            /** Index */
+            index: number;
+        };
+        /**
+         * BatchRequest
+         * @description Request to submit a batch of render jobs.
+         *
+         *     Contains a list of job configurations. The list must have at least one job.
+         *     Maximum job count is enforced by the endpoint against Settings.batch_max_jobs.
+         */
+        BatchRequest: {
+            /**
+             * Jobs
+             * @description List of render job configurations
+             */
+            jobs: components["schemas"]["BatchJobConfig"][];
         };
         /**
          * BatchResponse
@@ -3386,13 +3797,43 @@ export interface components {
              */
             job_ids?: string[];
         };
-        /** Body_upload_asset_api_v1_assets_post */
-        Body_upload_asset_api_v1_assets_post: {
+        /**
+         * BatchUpdateClip
+         * @description Batch operation: move a placed clip or change its track.
+         */
+        BatchUpdateClip: {
+            /**
+             * Op
+             * @constant
+             */
+            op: "update_clip";
+            /** Clip Id */
+            clip_id: string;
+            /** Timeline Start */
+            timeline_start?: number | null;
+            /** Timeline End */
+            timeline_end?: number | null;
+            /** Track Id */
+            track_id?: string | null;
+        };
+        /**
+         * BatchUpdateEffect
+         * @description Batch operation: replace the parameters of a clip effect.
+         */
+        BatchUpdateEffect: {
             /**
-             * File
-             * Format: binary
+             * Op
+             * @constant
              */
-            file: string;
+            op: "update_effect";
+            /** Clip Id */
+            clip_id: string;
+            /** Index */
+            index: number;
+            /** Parameters */
+            parameters: {
+                [key: string]: unknown;
+            };
         };
         /**
          * ClipCreate
@@ -3891,6 +4332,56 @@ export interface components {
             /** Automatable Parameters */
             automatable_parameters: string[];
         };
+        /**
+         * EffectStackIssue
+         * @description An invalid entry in a project's stored effects or transitions.
+         *
+         *     Attributes:
+         *         target: ``clip`` for clip effects, ``transition`` for project transitions.
+         *         target_id: Clip ID, or the transition's ID.
+         *         index: Zero-based position in the clip's effect stack or the project's
+         *             transition list.
+         *         effect_type: Stored effect or transition type.
+         *         errors: Validation errors for the entry.
+         */
+        EffectStackIssue: {
+            /**
+             * Target
+             * @enum {string}
+             */
+            target: "clip" | "transition";
+            /** Target Id */
+            target_id: string;
+            /** Index */
+            index: number;
+            /** Effect Type */
+            effect_type: string;
+            /** Errors */
+            errors: components["schemas"]["EffectValidationErrorResponse"][];
+        };
+        /**
+         * EffectStackValidationResponse
+         * @description Result of validating every effect stack in a project.
+         *
+         *     Attributes:
+         *         project_id: The validated project.
+         *         valid: True when no issues were found.
+         *         clips_checked: Number of clips whose effect stacks were validated.
+         *         effects_checked: Number of clip effects and transitions validated.
+         *         issues: Invalid entries, in timeline order.
+         */
+        EffectStackValidationResponse: {
+            /** Project Id */
+            project_id: string;
+            /** Valid */
+            valid: boolean;
+            /** Clips Checked */
+            clips_checked: number;
+            /** Effects Checked */
+            effects_checked: number;
+            /** Issues */
+            issues: components["schemas"]["EffectStackIssue"][];
+        };
         /**
          * EffectThumbnailRequest
          * @description Request schema for generating an effect preview thumbnail.
@@ -3935,6 +4426,20 @@ export interface components {
                 [key: string]: unknown;
             };
         };
+        /**
+         * EffectValidationErrorResponse
+         * @description One parameter validation error.
+         *
+         *     Attributes:
+         *         path: Dotted path of the invalid parameter ("" for the whole entry).
+         *         message: Human-readable error description.
+         */
+        EffectValidationErrorResponse: {
+            /** Path */
+            path: string;
+            /** Message */
+            message: string;
+        };
         /**
          * EncoderInfoResponse
          * @description Response representing a single detected encoder.
@@ -4301,6 +4806,21 @@ export interface components {
             /** Name */
             name?: string | null;
         };
+        /**
+         * MergeConflictResponse
+         * @description Conflicting changes made by both sides of a merge.
+         *
+         *     Attributes:
+         *         path: JSON Pointer to the contested node.
+         *         ours: The change from ``ours_version``.
+         *         theirs: The change from ``theirs_version``.
+         */
+        MergeConflictResponse: {
+            /** Path */
+            path: string;
+            ours: components["schemas"]["VersionChangeResponse"];
+            theirs: components["schemas"]["VersionChangeResponse"];
+        };
         /**
          * OutputFormatSpec
          * @description A single output format specification within a delivery profile.
@@ -4666,6 +5186,56 @@ export interface components {
              */
             video_bitrate_kbps: number;
         };
+        /**
+         * QueueJobForecast
+         * @description Predicted start and finish time for one running or queued render job.
+         */
+        QueueJobForecast: {
+            /**
+             * Job Id
+             * @description Render job ID
+             */
+            job_id: string;
+            /**
+             * Status
+             * @description Current job status
+             * @enum {string}
+             */
+            status: "running" | "queued";
+            /**
+             * Predicted Seconds
+             * @description Predicted wall-clock time for the job
+             */
+            predicted_seconds: number;
+            /**
+             * Starts In Seconds
+             * @description Seconds until the job starts
+             */
+            starts_in_seconds: number;
+            /**
+             * Finishes In Seconds
+             * @description Seconds until the job finishes
+             */
+            finishes_in_seconds: number;
+            /**
+             * Starts At
+             * Format: date-time
+             * @description Predicted start time (UTC)
+             */
+            starts_at: string;
+            /**
+             * Finishes At
+             * Format: date-time
+             * @description Predicted finish time (UTC)
+             */
+            finishes_at: string;
+            /**
+             * Basis
+             * @description Prediction source: completed jobs with the same encoder, encoder telemetry, or real-time playback speed when neither is available
+             * @enum {string}
+             */
+            basis: "observed" | "telemetry" | "default";
+        };
         /**
          * QueueStatusResponse
          * @description Render queue status with capacity, disk space, and throughput metrics.
@@ -4711,6 +5281,11 @@ export interface components {
              * @description Jobs failed since midnight UTC
              */
             failed_today: number;
+            /**
+             * Forecast
+             * @description Predicted start and finish times: running jobs, then queued jobs in order
+             */
+            forecast?: components["schemas"]["QueueJobForecast"][];
         };
         /**
          * RenderJobEvidenceResponse
@@ -4798,6 +5373,11 @@ export interface components {
             partial_file_detected: boolean;
             /** Warnings */
             warnings?: string[] | null;
+            /**
+             * Outputs
+             * @default []
+             */
+            outputs: components["schemas"]["RenderOutputResponse"][];
         };
         /**
          * RenderListResponse
@@ -4813,6 +5393,32 @@ export interface components {
             /** Offset */
             offset: number;
         };
+        /**
+         * RenderOutputResponse
+         * @description An extra deliverable of a multi-output render job.
+         */
+        RenderOutputResponse: {
+            /**
+             * Name
+             * @description Output name from the render plan
+             */
+            name: string;
+            /**
+             * Output Path
+             * @description Path of the output file
+             */
+            output_path: string;
+            /**
+             * Output Format
+             * @description Output container format
+             */
+            output_format: string;
+            /**
+             * Progress
+             * @description Progress 0.0-1.0 (outputs share one FFmpeg process and advance together)
+             */
+            progress: number;
+        };
         /**
          * RenderPreviewRequest
          * @description Request for FFmpeg command preview given render settings.
@@ -4959,9 +5565,9 @@ export interface components {
          * SystemState
          * @description Aggregate in-memory system state returned by ``/api/v1/system/state``.
          *
-         *     Produced by a single-pass scan over the in-process job queue and
-         *     WebSocket connection manager (INV-SNAP-1). The handler never issues
-         *     database round-trips.
+         *     Served from the incrementally maintained ``SystemStateTracker``:
+         *     render jobs are followed through render repository change events, so
+         *     steady-state polls issue no database round-trips (INV-SNAP-1).
          * @example {
          *       "active_connections": 3,
          *       "active_jobs": [
@@ -4974,7 +5580,8 @@ export interface components {
          *         }
          *       ],
          *       "timestamp": "2026-04-24T17:05:00Z",
-         *       "uptime_seconds": 1820.5
+         *       "uptime_seconds": 1820.5,
+         *       "version": 42
          *     }
          */
         SystemState: {
@@ -4999,6 +5606,12 @@ export interface components {
              * @description Seconds elapsed since the application startup gate opened. ``0.0`` before startup completes.
              */
             uptime_seconds: number;
+            /**
+             * Version
+             * @description Change counter, bumped whenever ``active_jobs`` or ``active_connections`` changes. Pass it back as ``wait_for_version`` to long-poll for the next change. Restarts from 0 with the process.
+             * @default 0
+             */
+            version: number;
         };
         /**
          * ThumbnailStripGenerateRequest
@@ -5060,6 +5673,17 @@ export interface components {
             /** Rows */
             rows: number;
         };
+        /**
+         * TimelineBatchRequest
+         * @description Ordered list of timeline mutations applied atomically.
+         */
+        TimelineBatchRequest: {
+            /**
+             * Operations
+             * @description Operations applied in order; later operations see earlier results
+             */
+            operations: (components["schemas"]["BatchAddClip"] | components["schemas"]["BatchUpdateClip"] | components["schemas"]["BatchRemoveClip"] | components["schemas"]["BatchUpdateEffect"] | components["schemas"]["BatchRemoveEffect"])[];
+        };
         /**
          * TimelineClipCreate
          * @description Assign clip to timeline track.
@@ -5430,6 +6054,37 @@ export interface components {
              */
             pan?: number | null;
         };
+        /**
+         * TtsSynthesiseAllResponse
+         * @description Response schema for dispatching synthesis of every cue in a project.
+         */
+        TtsSynthesiseAllResponse: {
+            /**
+             * Project Id
+             * Format: uuid
+             */
+            project_id: string;
+            /**
+             * Total
+             * @description Cues in the project
+             */
+            total: number;
+            /**
+             * Dispatched
+             * @description Cues newly dispatched for synthesis
+             */
+            dispatched: number;
+            /**
+             * In Progress
+             * @description Cues that were already synthesising
+             */
+            in_progress: number;
+            /**
+             * Ready
+             * @description Cues whose audio was already available
+             */
+            ready: number;
+        };
         /** ValidationError */
         ValidationError: {
             /** Location */
@@ -5439,6 +6094,31 @@ export interface components {
             /** Error Type */
             type: string;
         };
+        /**
+         * VersionChangeResponse
+         * @description One structural change between two versions.
+         *
+         *     Attributes:
+         *         op: ``add``, ``remove`` or ``replace``.
+         *         path: JSON Pointer to the changed node. Tracks, clips and other
+         *             id-keyed list items are addressed by id, e.g.
+         *             ``/tracks/t1/clips/c7/timeline_start``.
+         *         before: Value in the source version (None for ``add``).
+         *         after: Value in the target version (None for ``remove``).
+         */
+        VersionChangeResponse: {
+            /**
+             * Op
+             * @enum {string}
+             */
+            op: "add" | "remove" | "replace";
+            /** Path */
+            path: string;
+            /** Before */
+            before?: unknown;
+            /** After */
+            after?: unknown;
+        };
         /**
          * VersionCreateRequest
          * @description Request body for creating a new version snapshot.
@@ -5451,6 +6131,35 @@ export interface components {
             /** Timeline Json */
             timeline_json?: string | null;
         };
+        /**
+         * VersionDiffResponse
+         * @description Structural diff between two versions of a project.
+         *
+         *     Attributes:
+         *         project_id: The project the versions belong to.
+         *         from_version: Source version number.
+         *         to_version: Target version number.
+         *         from_checksum: SHA-256 of the source version.
+         *         to_checksum: SHA-256 of the target version.
+         *         identical: True when the checksums match (no changes computed).
+         *         changes: Changes that turn the source into the target.
+         */
+        VersionDiffResponse: {
+            /** Project Id */
+            project_id: string;
+            /** From Version */
+            from_version: number;
+            /** To Version */
+            to_version: number;
+            /** From Checksum */
+            from_checksum: string;
+            /** To Checksum */
+            to_checksum: string;
+            /** Identical */
+            identical: boolean;
+            /** Changes */
+            changes: components["schemas"]["VersionChangeResponse"][];
+        };
         /**
          * VersionListResponse
          * @description Paginated list of project versions.
@@ -5471,6 +6180,63 @@ export interface components {
             /** Versions */
             versions: components["schemas"]["VersionResponse"][];
         };
+        /**
+         * VersionMergeRequest
+         * @description Request body for a three-way merge of two versions.
+         *
+         *     Attributes:
+         *         base_version: Common ancestor both versions were edited from.
+         *         ours_version: First edited version.
+         *         theirs_version: Second edited version.
+         *         strategy: ``fail`` rejects conflicting merges with 409; ``ours`` or
+         *             ``theirs`` resolves each conflict in favour of that side.
+         */
+        VersionMergeRequest: {
+            /** Base Version */
+            base_version: number;
+            /** Ours Version */
+            ours_version: number;
+            /** Theirs Version */
+            theirs_version: number;
+            /**
+             * Strategy
+             * @default fail
+             * @enum {string}
+             */
+            strategy: "fail" | "ours" | "theirs";
+        };
+        /**
+         * VersionMergeResponse
+         * @description Result of a successful merge, saved as a new version.
+         *
+         *     Attributes:
+         *         version_number: The newly created version number.
+         *         created_at: ISO-8601 timestamp of the new version.
+         *         checksum: SHA-256 hex digest of the merged timeline data.
+         *         base_version: The common ancestor version.
+         *         ours_version: First merged version.
+         *         theirs_version: Second merged version.
+         *         changes_applied: Number of changes applied on top of the base.
+         *         conflicts: Conflicts resolved by the requested strategy.
+         */
+        VersionMergeResponse: {
+            /** Version Number */
+            version_number: number;
+            /** Created At */
+            created_at: string;
+            /** Checksum */
+            checksum: string;
+            /** Base Version */
+            base_version: number;
+            /** Ours Version */
+            ours_version: number;
+            /** Theirs Version */
+            theirs_version: number;
+            /** Changes Applied */
+            changes_applied: number;
+            /** Conflicts */
+            conflicts: components["schemas"]["MergeConflictResponse"][];
+        };
         /**
          * VersionResponse
          * @description Single version entry in a project's history.
@@ -5760,26 +6526,243 @@ export interface components {
             event_id: string;
         };
     };
-    responses: never;
-    parameters: never;
-    requestBodies: never;
-    headers: never;
-    pathItems: never;
-}
-export type $defs = Record<string, never>;
-export interface operations {
-    list_assets_api_v1_assets_get: {
+    responses: never;
+    parameters: never;
+    requestBodies: never;
+    headers: never;
+    pathItems: never;
+}
+export type $defs = Record<string, never>;
+export interface operations {
+    list_assets_api_v1_assets_get: {
+        parameters: {
+            query?: {
+                /** @description Filter by asset kind. */
+                kind?: string | null;
+                /** @description Pagination offset. */
+                offset?: number;
+                /** @description Page size. */
+                limit?: number;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["AssetListResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    upload_asset_api_v1_assets_post: {
+        parameters: {
+            query?: {
+                kind?: "image" | "audio" | "subtitle" | "font" | "lut";
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "multipart/form-data": {
+                    /**
+                     * File
+                     * Format: binary
+                     */
+                    file: string;
+                };
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            201: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["AssetRead"];
+                };
+            };
+            /** @description Malformed multipart body */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Payload too large */
+            413: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Unsupported media type */
+            415: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+            /** @description Upload processing error */
+            500: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+        };
+    };
+    create_upload_api_v1_assets_uploads_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["AssetUploadCreate"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            201: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["AssetUploadStatus"];
+                };
+            };
+            /** @description Declared size exceeds the maximum asset size */
+            413: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_upload_api_v1_assets_uploads__upload_id__get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                upload_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["AssetUploadStatus"];
+                };
+            };
+            /** @description Upload session not found or expired */
+            404: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    abort_upload_api_v1_assets_uploads__upload_id__delete: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                upload_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            204: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Upload session not found or expired */
+            404: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    append_upload_api_v1_assets_uploads__upload_id__patch: {
         parameters: {
-            query?: {
-                /** @description Filter by asset kind. */
-                kind?: string | null;
-                /** @description Pagination offset. */
-                offset?: number;
-                /** @description Page size. */
-                limit?: number;
+            query?: never;
+            header: {
+                /** @description Offset this byte range starts at. */
+                "Upload-Offset": number;
+            };
+            path: {
+                upload_id: string;
             };
-            header?: never;
-            path?: never;
             cookie?: never;
         };
         requestBody?: never;
@@ -5790,8 +6773,29 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["AssetListResponse"];
+                    "application/json": components["schemas"]["AssetUploadStatus"];
+                };
+            };
+            /** @description Upload session not found or expired */
+            404: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Upload-Offset does not match, or another append is running */
+            409: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Payload too large; the session is discarded */
+            413: {
+                headers: {
+                    [name: string]: unknown;
                 };
+                content?: never;
             };
             /** @description Validation Error */
             422: {
@@ -5804,20 +6808,16 @@ export interface operations {
             };
         };
     };
-    upload_asset_api_v1_assets_post: {
+    complete_upload_api_v1_assets_uploads__upload_id__complete_post: {
         parameters: {
-            query?: {
-                kind?: "image" | "audio" | "subtitle" | "font" | "lut";
-            };
+            query?: never;
             header?: never;
-            path?: never;
-            cookie?: never;
-        };
-        requestBody: {
-            content: {
-                "multipart/form-data": components["schemas"]["Body_upload_asset_api_v1_assets_post"];
+            path: {
+                upload_id: string;
             };
+            cookie?: never;
         };
+        requestBody?: never;
         responses: {
             /** @description Successful Response */
             201: {
@@ -5828,8 +6828,15 @@ export interface operations {
                     "application/json": components["schemas"]["AssetRead"];
                 };
             };
-            /** @description Payload too large */
-            413: {
+            /** @description Upload session not found or expired */
+            404: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Fewer bytes received than the declared size */
+            409: {
                 headers: {
                     [name: string]: unknown;
                 };
@@ -5842,7 +6849,7 @@ export interface operations {
                 };
                 content?: never;
             };
-            /** @description Validation error */
+            /** @description Validation Error */
             422: {
                 headers: {
                     [name: string]: unknown;
@@ -5851,13 +6858,6 @@ export interface operations {
                     "application/json": components["schemas"]["HTTPValidationError"];
                 };
             };
-            /** @description Upload processing error */
-            500: {
-                headers: {
-                    [name: string]: unknown;
-                };
-                content?: never;
-            };
         };
     };
     get_asset_api_v1_assets__asset_id__get: {
@@ -6096,6 +7096,13 @@ export interface operations {
                     };
                 };
             };
+            /** @description The ``If-None-Match`` header matches the schema's ``ETag``. */
+            304: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
             /** @description ``resource`` is not one of ``project``, ``clip``, ``timeline``, ``render_job``, ``effect``, ``video``. */
             404: {
                 headers: {
@@ -7063,6 +8070,13 @@ export interface operations {
                     "application/json": components["schemas"]["EffectListResponse"];
                 };
             };
+            /** @description The ``If-None-Match`` header matches the current ``ETag``: the effect catalogue has not changed. */
+            304: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
         };
     };
     preview_effect_api_v1_effects_preview_post: {
@@ -7304,6 +8318,37 @@ export interface operations {
             };
         };
     };
+    validate_project_effects_api_v1_projects__project_id__effects_validate_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                project_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["EffectStackValidationResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     list_presets_api_v1_compose_presets_get: {
         parameters: {
             query?: never;
@@ -7789,6 +8834,37 @@ export interface operations {
             };
         };
     };
+    synthesise_all_tts_cues_api_v1_projects__project_id__tts_synthesise_all_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                project_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            202: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["TtsSynthesiseAllResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     list_tts_voices_api_v1_tts_voices_get: {
         parameters: {
             query?: never;
@@ -8010,6 +9086,41 @@ export interface operations {
             };
         };
     };
+    batch_timeline_api_v1_projects__project_id__timeline_batch_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                project_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["TimelineBatchRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["TimelineResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     add_transition_api_v1_projects__project_id__timeline_transitions_post: {
         parameters: {
             query?: never;
@@ -8398,7 +9509,10 @@ export interface operations {
     };
     get_segment_api_v1_preview__session_id__segment__index__ts_get: {
         parameters: {
-            query?: never;
+            query?: {
+                /** @description Segment version from the manifest. When it matches the file on disk the response is cacheable as immutable. */
+                v?: string | null;
+            };
             header?: never;
             path: {
                 session_id: string;
@@ -9019,7 +10133,12 @@ export interface operations {
     };
     get_system_state_api_v1_system_state_get: {
         parameters: {
-            query?: never;
+            query?: {
+                /** @description Long-poll: when the current ``version`` equals this value, block until it changes or ``timeout`` expires. Any other value returns immediately. */
+                wait_for_version?: number | null;
+                /** @description Maximum seconds to wait when ``wait_for_version`` is set. On expiry the unchanged state (or 304) is returned. */
+                timeout?: number;
+            };
             header?: never;
             path?: never;
             cookie?: never;
@@ -9035,6 +10154,22 @@ export interface operations {
                     "application/json": components["schemas"]["SystemState"];
                 };
             };
+            /** @description The ``If-None-Match`` header matches the current ``ETag``: neither ``active_jobs`` nor ``active_connections`` changed (after waiting, when ``wait_for_version`` was supplied). */
+            304: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
         };
     };
     create_seed_fixture_api_v1_testing_seed_post: {
@@ -9318,6 +10453,74 @@ export interface operations {
             };
         };
     };
+    diff_versions_api_v1_projects__project_id__versions__from_version__diff__to_version__get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                project_id: string;
+                from_version: number;
+                to_version: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["VersionDiffResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    merge_versions_api_v1_projects__project_id__versions_merge_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                project_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["VersionMergeRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            201: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["VersionMergeResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     get_waveform_metadata_api_v1_videos__video_id__waveform_get: {
         parameters: {
             query?: {
@@ -3,6 +3,7 @@
 
 //! Concentric rings procedural generator.
 
+use super::parallel::rgba_from_fn;
 use image::{ImageBuffer, Rgba};
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
@@ -41,7 +42,19 @@ impl ConcentricRingsGenerator {
     /// AC-4 placeholder: parent directory is std::env::temp_dir()/snf_shapes.
     /// Stable snf-managed asset path integration is deferred to BL-511 (v090).
     #[pyo3(name = "render_to_file")]
-    pub fn py_render_to_file(&self, output_path: &str, width: u32, height: u32) -> PyResult<()> {
+    pub fn py_render_to_file(
+        &self,
+        py: Python<'_>,
+        output_path: &str,
+        width: u32,
+        height: u32,
+    ) -> PyResult<()> {
+        py.detach(|| self.render_to_path(output_path, width, height))
+    }
+}
+
+impl ConcentricRingsGenerator {
+    fn render_to_path(&self, output_path: &str, width: u32, height: u32) -> PyResult<()> {
         if width == 0 || height == 0 {
             return Err(PyValueError::new_err("width and height must be > 0"));
         }
@@ -53,15 +66,13 @@ impl ConcentricRingsGenerator {
             .map_err(|e| PyValueError::new_err(format!("Cannot write PNG: {e}")))?;
         Ok(())
     }
-}
 
-impl ConcentricRingsGenerator {
     pub(crate) fn generate(&self, width: u32, height: u32) -> ImageBuffer<Rgba<u8>, Vec<u8>> {
         let cx = width as f32 / 2.0;
         let cy = height as f32 / 2.0;
         let max_r = cx.min(cy);
 
-        ImageBuffer::from_fn(width, height, |x, y| {
+        rgba_from_fn(width, height, |x, y| {
             let dx = x as f32 - cx;
             let dy = y as f32 - cy;
             let r = (dx * dx + dy * dy).sqrt();
@@ -2,30 +2,54 @@
 // Copyright (C) 2026 Grant Wickman
 
 //! GenericProceduralImageBuilder: per-pixel expression evaluator with PNG output.
+//!
+//! The parsed expression is compiled once to flat bytecode
+//! (`procedural_bytecode`) and evaluated row-parallel across cores with the
+//! GIL released. Animated output renders a frame sequence over a time range
+//! and streams raw frames to a writable sink such as an FFmpeg stdin pipe.
 
-use super::procedural_parser::{eval, parse, Expr, ParseError};
+use super::parallel::fill_rows;
+use super::procedural_bytecode::{compile, Program};
+use super::procedural_parser::{parse, ParseError};
 use image::{ImageBuffer, Luma, Rgba};
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
 use pyo3_stub_gen::derive::gen_stub_pyclass;
+use std::sync::mpsc::sync_channel;
 use std::time::{Duration, Instant};
 
+/// Maximum evaluation steps per pixel (worst case over `if` branches).
+const EVAL_BUDGET: usize = 10_000;
+
+/// Frames rendered ahead of the sink in `write_frames`.
+const FRAME_QUEUE_DEPTH: usize = 2;
+
 #[derive(Debug, Clone, PartialEq)]
 enum OutputFormat {
     Rgba,
     Grayscale,
 }
 
+impl OutputFormat {
+    fn channels(&self) -> usize {
+        match self {
+            OutputFormat::Rgba => 4,
+            OutputFormat::Grayscale => 1,
+        }
+    }
+}
+
 /// Procedural image builder using a bespoke recursive-descent expression parser.
 ///
 /// Evaluates a user-supplied expression per pixel and saves RGBA or grayscale PNG output.
-/// The expression is parsed at construction for fail-fast error reporting.
+/// The expression is parsed and compiled at construction for fail-fast error reporting.
 #[gen_stub_pyclass]
 #[pyclass]
 #[derive(Debug, Clone)]
 pub struct GenericProceduralImageBuilder {
     expression: String,
-    parsed: Expr,
+    program: Program,
     width: u32,
     height: u32,
     output_format: OutputFormat,
@@ -65,9 +89,11 @@ impl GenericProceduralImageBuilder {
             )),
             _ => PyValueError::new_err(format!("expression parse error: {e}")),
         })?;
+        let program = compile(&parsed, EVAL_BUDGET)
+            .map_err(|e| PyValueError::new_err(format!("eval error: {e}")))?;
         Ok(Self {
             expression: expression.to_string(),
-            parsed,
+            program,
             width,
             height,
             output_format: fmt,
@@ -77,81 +103,114 @@ impl GenericProceduralImageBuilder {
 
     /// Render and save the procedural image to a PNG file.
     ///
+    /// Rendering runs across all cores with the GIL released.
+    ///
     /// Args:
     ///     output_path: Destination file path (parent directories are created).
     ///
     /// Raises:
-    ///     ValueError: If render times out, eval budget exceeded, or file cannot be written.
+    ///     ValueError: If render times out or file cannot be written.
     #[pyo3(name = "synthesise")]
-    pub fn py_synthesise(&self, output_path: &str) -> PyResult<()> {
-        let path = std::path::Path::new(output_path);
-        std::fs::create_dir_all(path.parent().unwrap_or(std::path::Path::new(".")))
-            .map_err(|e| PyValueError::new_err(format!("cannot create output dir: {e}")))?;
+    pub fn py_synthesise(&self, py: Python<'_>, output_path: &str) -> PyResult<()> {
+        py.detach(|| self.synthesise_to_path(output_path))
+            .map_err(PyValueError::new_err)
+    }
 
-        let w = self.width;
-        let h = self.height;
-        let t = self.at_time;
-        let w_norm = (w.saturating_sub(1)).max(1) as f64;
-        let h_norm = (h.saturating_sub(1)).max(1) as f64;
+    /// Raw pixel format of frames from `render_frame` / `write_frames`.
+    ///
+    /// Returns the FFmpeg rawvideo `-pix_fmt` name: "rgba" or "gray".
+    #[getter]
+    pub fn pix_fmt(&self) -> &'static str {
+        match self.output_format {
+            OutputFormat::Rgba => "rgba",
+            OutputFormat::Grayscale => "gray",
+        }
+    }
 
-        // Per-render timeout: 5s base scaled by resolution vs 720p, clamped [5s, 60s]
-        let pixel_count = w as u64 * h as u64;
-        let base_pixels: u64 = 1280 * 720;
-        let timeout_ms = (5000u64 * pixel_count / base_pixels).clamp(5000, 60000);
-        let timeout = Duration::from_millis(timeout_ms);
-        let start = Instant::now();
+    /// Render a single raw frame at the given time.
+    ///
+    /// Args:
+    ///     at_time: The t value. Defaults to the builder's at_time.
+    ///
+    /// Returns:
+    ///     Raw packed pixels (width * height * channels bytes) in `pix_fmt`.
+    ///
+    /// Raises:
+    ///     ValueError: If the render times out.
+    #[pyo3(name = "render_frame", signature = (at_time=None))]
+    pub fn py_render_frame<'py>(
+        &self,
+        py: Python<'py>,
+        at_time: Option<f64>,
+    ) -> PyResult<Bound<'py, PyBytes>> {
+        let t = at_time.unwrap_or(self.at_time);
+        let frame = py
+            .detach(|| self.render(t))
+            .map_err(PyValueError::new_err)?;
+        Ok(PyBytes::new(py, &frame))
+    }
 
-        match self.output_format {
-            OutputFormat::Rgba => {
-                let mut img: ImageBuffer<Rgba<u8>, Vec<u8>> = ImageBuffer::new(w, h);
-                for py in 0..h {
-                    // Per-row timeout check
-                    if start.elapsed() > timeout {
-                        return Err(PyValueError::new_err(format!(
-                            "render timeout after {}ms",
-                            timeout_ms
-                        )));
-                    }
-                    let y = py as f64 / h_norm;
-                    for px in 0..w {
-                        let x = px as f64 / w_norm;
-                        let mut budget = 10_000usize;
-                        let v = eval(&self.parsed, x, y, t, &mut budget).map_err(|e| {
-                            PyValueError::new_err(format!("eval error at ({px},{py}): {e}"))
-                        })?;
-                        let byte = (v.clamp(0.0, 1.0) * 255.0).round() as u8;
-                        img.put_pixel(px, py, Rgba([byte, byte, byte, 255]));
-                    }
-                }
-                img.save(path)
-                    .map_err(|e| PyValueError::new_err(format!("cannot write PNG: {e}")))?;
-            }
-            OutputFormat::Grayscale => {
-                let mut img: ImageBuffer<Luma<u8>, Vec<u8>> = ImageBuffer::new(w, h);
-                for py in 0..h {
-                    if start.elapsed() > timeout {
-                        return Err(PyValueError::new_err(format!(
-                            "render timeout after {}ms",
-                            timeout_ms
-                        )));
-                    }
-                    let y = py as f64 / h_norm;
-                    for px in 0..w {
-                        let x = px as f64 / w_norm;
-                        let mut budget = 10_000usize;
-                        let v = eval(&self.parsed, x, y, t, &mut budget).map_err(|e| {
-                            PyValueError::new_err(format!("eval error at ({px},{py}): {e}"))
-                        })?;
-                        let byte = (v.clamp(0.0, 1.0) * 255.0).round() as u8;
-                        img.put_pixel(px, py, Luma([byte]));
+    /// Render frames over [start_time, end_time) and write each to `sink`.
+    ///
+    /// Frame i is rendered at t = start_time + i / fps. Frames are rendered on
+    /// a background thread (GIL released) up to two frames ahead of the sink,
+    /// and each frame is passed to `sink.write(bytes)` — typically the stdin
+    /// of an FFmpeg process reading `-f rawvideo -pix_fmt <pix_fmt>
+    /// -s <width>x<height> -r <fps> -i pipe:0`.
+    ///
+    /// Args:
+    ///     sink: Object with a `write(bytes)` method.
+    ///     start_time: t value of the first frame.
+    ///     end_time: Exclusive end of the time range.
+    ///     fps: Frames per second. Must be > 0.
+    ///
+    /// Returns:
+    ///     Number of frames written.
+    ///
+    /// Raises:
+    ///     ValueError: If the time range or fps is invalid, or a frame render times out.
+    #[pyo3(name = "write_frames")]
+    pub fn py_write_frames(
+        &self,
+        py: Python<'_>,
+        sink: &Bound<'_, PyAny>,
+        start_time: f64,
+        end_time: f64,
+        fps: f64,
+    ) -> PyResult<u64> {
+        let count = frame_count(start_time, end_time, fps).map_err(PyValueError::new_err)?;
+        let (tx, rx) = sync_channel::<Result<Vec<u8>, String>>(FRAME_QUEUE_DEPTH);
+
+        std::thread::scope(|s| -> PyResult<u64> {
+            s.spawn(move || {
+                for i in 0..count {
+                    let frame = self.render(start_time + i as f64 / fps);
+                    let failed = frame.is_err();
+                    // A closed channel means the sink failed; stop rendering.
+                    if tx.send(frame).is_err() || failed {
+                        break;
                     }
                 }
-                img.save(path)
-                    .map_err(|e| PyValueError::new_err(format!("cannot write PNG: {e}")))?;
-            }
-        }
+            });
 
-        Ok(())
+            // Receiver is !Sync, so ownership moves in and out of each detach.
+            let mut rx = rx;
+            let mut written = 0u64;
+            while written < count {
+                let (returned, received) = py.detach(move || {
+                    let received = rx.recv();
+                    (rx, received)
+                });
+                rx = returned;
+                let frame = match received {
+                    Ok(frame) => frame.map_err(PyValueError::new_err)?,
+                    Err(_) => break,
+                };
+                sink.call_method1("write", (PyBytes::new(py, &frame),))?;
+                written += 1;
+            }
+            Ok(written)
+        })
     }
 
     fn __repr__(&self) -> String {
@@ -169,6 +228,80 @@ impl GenericProceduralImageBuilder {
     }
 }
 
+/// Number of frames in [start_time, end_time) at `fps`.
+fn frame_count(start_time: f64, end_time: f64, fps: f64) -> Result<u64, String> {
+    if !fps.is_finite() || fps <= 0.0 {
+        return Err(format!("fps must be > 0, got {fps}"));
+    }
+    if !start_time.is_finite() || !end_time.is_finite() || end_time <= start_time {
+        return Err(format!(
+            "end_time must be greater than start_time, got [{start_time}, {end_time})"
+        ));
+    }
+    Ok(((end_time - start_time) * fps).ceil() as u64)
+}
+
+impl GenericProceduralImageBuilder {
+    /// Render one frame at time `t` into a packed pixel buffer.
+    ///
+    /// Per-render timeout: 5s base scaled by resolution vs 720p, clamped [5s, 60s].
+    pub(crate) fn render(&self, t: f64) -> Result<Vec<u8>, String> {
+        let w = self.width;
+        let h = self.height;
+        let w_norm = (w.saturating_sub(1)).max(1) as f64;
+        let h_norm = (h.saturating_sub(1)).max(1) as f64;
+
+        let pixel_count = w as u64 * h as u64;
+        let base_pixels: u64 = 1280 * 720;
+        let timeout_ms = (5000u64 * pixel_count / base_pixels).clamp(5000, 60000);
+        let timeout = Duration::from_millis(timeout_ms);
+        let start = Instant::now();
+
+        let channels = self.output_format.channels();
+        let mut buf = vec![0u8; w as usize * h as usize * channels];
+        fill_rows(&mut buf, w as usize * channels, |py, row| {
+            // Per-row timeout check
+            if start.elapsed() > timeout {
+                return Err(format!("render timeout after {timeout_ms}ms"));
+            }
+            let y = py as f64 / h_norm;
+            let mut stack = self.program.new_stack();
+            for (px, out) in row.chunks_exact_mut(channels).enumerate() {
+                let x = px as f64 / w_norm;
+                let v = self.program.run(x, y, t, &mut stack);
+                let byte = (v.clamp(0.0, 1.0) * 255.0).round() as u8;
+                out.fill(byte);
+                if channels == 4 {
+                    out[3] = 255;
+                }
+            }
+            Ok(())
+        })?;
+        Ok(buf)
+    }
+
+    fn synthesise_to_path(&self, output_path: &str) -> Result<(), String> {
+        let path = std::path::Path::new(output_path);
+        std::fs::create_dir_all(path.parent().unwrap_or(std::path::Path::new(".")))
+            .map_err(|e| format!("cannot create output dir: {e}"))?;
+
+        let buf = self.render(self.at_time)?;
+        let saved = match self.output_format {
+            OutputFormat::Rgba => {
+                ImageBuffer::<Rgba<u8>, Vec<u8>>::from_raw(self.width, self.height, buf)
+                    .expect("buffer sized for frame")
+                    .save(path)
+            }
+            OutputFormat::Grayscale => {
+                ImageBuffer::<Luma<u8>, Vec<u8>>::from_raw(self.width, self.height, buf)
+                    .expect("buffer sized for frame")
+                    .save(path)
+            }
+        };
+        saved.map_err(|e| format!("cannot write PNG: {e}"))
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -191,7 +324,7 @@ mod tests {
         let out = tmp_path("budget_test.png");
         ensure_dir(&out);
         let start = std::time::Instant::now();
-        builder.py_synthesise(out.to_str().unwrap()).unwrap();
+        builder.synthesise_to_path(out.to_str().unwrap()).unwrap();
         let elapsed = start.elapsed().as_millis();
         assert!(elapsed < 2000, "render exceeded 2000ms budget: {elapsed}ms");
     }
@@ -209,8 +342,8 @@ mod tests {
         let out1 = tmp_path("det1.png");
         let out2 = tmp_path("det2.png");
         ensure_dir(&out1);
-        builder.py_synthesise(out1.to_str().unwrap()).unwrap();
-        builder.py_synthesise(out2.to_str().unwrap()).unwrap();
+        builder.synthesise_to_path(out1.to_str().unwrap()).unwrap();
+        builder.synthesise_to_path(out2.to_str().unwrap()).unwrap();
         let img1 = image::open(&out1).unwrap().to_rgba8();
         let img2 = image::open(&out2).unwrap().to_rgba8();
         assert_eq!(img1.as_raw(), img2.as_raw(), "render is not deterministic");
@@ -221,7 +354,7 @@ mod tests {
         let builder = GenericProceduralImageBuilder::py_new("x", 64, 64, None, None).unwrap();
         let out = tmp_path("gradient.png");
         ensure_dir(&out);
-        builder.py_synthesise(out.to_str().unwrap()).unwrap();
+        builder.synthesise_to_path(out.to_str().unwrap()).unwrap();
         let img = image::open(&out).unwrap().to_rgba8();
         // First pixel (x=0) should have R ≈ 0; last pixel in first row (x=63/63=1.0) should be ≈ 255
         let first = img.get_pixel(0, 0)[0];
@@ -237,7 +370,7 @@ mod tests {
                 .unwrap();
         let out = tmp_path("radial.png");
         ensure_dir(&out);
-        builder.py_synthesise(out.to_str().unwrap()).unwrap();
+        builder.synthesise_to_path(out.to_str().unwrap()).unwrap();
         let img = image::open(&out).unwrap().to_rgba8();
         let center = img.get_pixel(32, 32)[0];
         let corner = img.get_pixel(0, 0)[0];
@@ -271,11 +404,67 @@ mod tests {
             GenericProceduralImageBuilder::py_new("x", 64, 64, Some("grayscale"), None).unwrap();
         let out = tmp_path("gray.png");
         ensure_dir(&out);
-        builder.py_synthesise(out.to_str().unwrap()).unwrap();
+        builder.synthesise_to_path(out.to_str().unwrap()).unwrap();
         let img = image::open(&out).unwrap().to_luma8();
         let first = img.get_pixel(0, 0)[0];
         let last = img.get_pixel(63, 0)[0];
         assert!(first < 5, "first gray pixel={first}, expected ~0");
         assert!(last > 250, "last gray pixel={last}, expected ~255");
     }
+
+    #[test]
+    fn test_render_matches_tree_eval() {
+        use super::super::procedural_parser::eval;
+        let expr = "if(x - 0.5, sin(x*6.28+t), hypot(x-0.5, y-0.5)) * 0.5 + 0.5";
+        let builder = GenericProceduralImageBuilder::py_new(expr, 33, 17, None, None).unwrap();
+        let parsed = parse(expr).unwrap();
+        let buf = builder.render(0.75).unwrap();
+        assert_eq!(buf.len(), 33 * 17 * 4);
+        for py in 0..17u32 {
+            for px in 0..33u32 {
+                let mut budget = EVAL_BUDGET;
+                let v = eval(
+                    &parsed,
+                    px as f64 / 32.0,
+                    py as f64 / 16.0,
+                    0.75,
+                    &mut budget,
+                )
+                .unwrap();
+                let expected = (v.clamp(0.0, 1.0) * 255.0).round() as u8;
+                let i = ((py * 33 + px) * 4) as usize;
+                assert_eq!(&buf[i..i + 4], &[expected, expected, expected, 255]);
+            }
+        }
+    }
+
+    #[test]
+    fn test_render_frame_varies_with_time() {
+        let builder =
+            GenericProceduralImageBuilder::py_new("sin(t)*0.5+0.5", 8, 8, Some("grayscale"), None)
+                .unwrap();
+        let f0 = builder.render(0.0).unwrap();
+        let f1 = builder.render(1.0).unwrap();
+        assert_eq!(f0.len(), 64);
+        assert_ne!(f0, f1);
+    }
+
+    #[test]
+    fn test_frame_count() {
+        assert_eq!(frame_count(0.0, 1.0, 30.0).unwrap(), 30);
+        assert_eq!(frame_count(0.0, 0.5, 25.0).unwrap(), 13);
+        assert!(frame_count(1.0, 1.0, 30.0).is_err());
+        assert!(frame_count(0.0, 1.0, 0.0).is_err());
+        assert!(frame_count(0.0, f64::NAN, 30.0).is_err());
+    }
+
+    #[test]
+    fn test_over_budget_expression_error() {
+        let expr = vec!["x"; 6000].join("+");
+        let r = GenericProceduralImageBuilder::py_new(&expr, 8, 8, None, None);
+        assert!(
+            r.is_err(),
+            "over-budget expression should error at construction"
+        );
+    }
 }
@@ -6,6 +6,8 @@
 pub mod checkerboard;
 pub mod concentric_rings;
 pub mod generic_procedural;
+mod parallel;
+pub mod procedural_bytecode;
 pub mod procedural_parser;
 pub mod radial_burst;
 pub mod spiral;
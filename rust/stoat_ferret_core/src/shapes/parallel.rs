@@ -0,0 +1,145 @@
+// SPDX-License-Identifier: AGPL-3.0-or-later
+// Copyright (C) 2026 Grant Wickman
+
+//! Row-parallel pixel fill shared by the shape generators.
+//!
+//! The frame buffer is split into contiguous bands of rows, one band per
+//! worker, using scoped threads so workers borrow the buffer and the pixel
+//! closure directly. Each pixel is still computed by the same per-pixel
+//! function, so output is bit-identical to a sequential fill regardless of
+//! the worker count.
+
+use image::{ImageBuffer, Rgba};
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::thread;
+
+/// Number of workers to use for a frame with `rows` rows.
+pub(crate) fn worker_count(rows: usize) -> usize {
+    let cores = thread::available_parallelism()
+        .map(|n| n.get())
+        .unwrap_or(1);
+    cores.min(rows).max(1)
+}
+
+/// Fill `buf` row by row in parallel.
+///
+/// `buf` holds `buf.len() / row_len` rows of `row_len` bytes. `fill_row` is
+/// called once per row with the row index and that row's bytes. An error
+/// stops the remaining workers at their next row boundary and is returned
+/// (the lowest band's error if several workers fail).
+pub(crate) fn fill_rows<E, F>(buf: &mut [u8], row_len: usize, fill_row: F) -> Result<(), E>
+where
+    E: Send,
+    F: Fn(u32, &mut [u8]) -> Result<(), E> + Sync,
+{
+    if row_len == 0 || buf.is_empty() {
+        return Ok(());
+    }
+    let rows = buf.len() / row_len;
+    let workers = worker_count(rows);
+    if workers == 1 {
+        for (y, row) in buf.chunks_mut(row_len).enumerate() {
+            fill_row(y as u32, row)?;
+        }
+        return Ok(());
+    }
+
+    let band_rows = rows.div_ceil(workers);
+    let cancelled = AtomicBool::new(false);
+    let fill_row = &fill_row;
+    let cancelled = &cancelled;
+
+    let results: Vec<Result<(), E>> = thread::scope(|s| {
+        let handles: Vec<_> = buf
+            .chunks_mut(band_rows * row_len)
+            .enumerate()
+            .map(|(band, chunk)| {
+                s.spawn(move || {
+                    let first_row = band * band_rows;
+                    for (i, row) in chunk.chunks_mut(row_len).enumerate() {
+                        if cancelled.load(Ordering::Relaxed) {
+                            break;
+                        }
+                        if let Err(e) = fill_row((first_row + i) as u32, row) {
+                            cancelled.store(true, Ordering::Relaxed);
+                            return Err(e);
+                        }
+                    }
+                    Ok(())
+                })
+            })
+            .collect();
+        handles
+            .into_iter()
+            .map(|h| h.join().expect("pixel worker panicked"))
+            .collect()
+    });
+    results.into_iter().collect()
+}
+
+/// Build a `width` x `height` buffer of `channels`-byte pixels in parallel.
+///
+/// Equivalent to `ImageBuffer::from_fn` but spreads rows across cores.
+pub(crate) fn pixels_from_fn<F>(width: u32, height: u32, channels: usize, pixel: F) -> Vec<u8>
+where
+    F: Fn(u32, u32) -> [u8; 4] + Sync,
+{
+    let row_len = width as usize * channels;
+    let mut buf = vec![0u8; row_len * height as usize];
+    let filled: Result<(), ()> = fill_rows(&mut buf, row_len, |y, row| {
+        for (x, out) in row.chunks_exact_mut(channels).enumerate() {
+            out.copy_from_slice(&pixel(x as u32, y)[..channels]);
+        }
+        Ok(())
+    });
+    filled.expect("infallible pixel fill");
+    buf
+}
+
+/// Parallel drop-in for `ImageBuffer::from_fn` over RGBA pixels.
+pub(crate) fn rgba_from_fn<F>(width: u32, height: u32, pixel: F) -> ImageBuffer<Rgba<u8>, Vec<u8>>
+where
+    F: Fn(u32, u32) -> Rgba<u8> + Sync,
+{
+    let buf = pixels_from_fn(width, height, 4, |x, y| pixel(x, y).0);
+    ImageBuffer::from_raw(width, height, buf).expect("buffer sized for image")
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_fill_rows_matches_sequential() {
+        let (w, h) = (37u32, 53u32);
+        let par = pixels_from_fn(w, h, 4, |x, y| {
+            [(x * 7) as u8, (y * 3) as u8, (x ^ y) as u8, 255]
+        });
+        let mut seq = Vec::new();
+        for y in 0..h {
+            for x in 0..w {
+                seq.extend_from_slice(&[(x * 7) as u8, (y * 3) as u8, (x ^ y) as u8, 255]);
+            }
+        }
+        assert_eq!(par, seq);
+    }
+
+    #[test]
+    fn test_fill_rows_single_channel() {
+        let buf = pixels_from_fn(4, 2, 1, |x, y| [(x + y * 4) as u8, 0, 0, 0]);
+        assert_eq!(buf, vec![0, 1, 2, 3, 4, 5, 6, 7]);
+    }
+
+    #[test]
+    fn test_fill_rows_propagates_error() {
+        let mut buf = vec![0u8; 64 * 8];
+        let r = fill_rows(&mut buf, 8, |y, _row| if y >= 10 { Err(y) } else { Ok(()) });
+        assert!(matches!(r, Err(y) if y >= 10));
+    }
+
+    #[test]
+    fn test_worker_count_bounded_by_rows() {
+        assert_eq!(worker_count(1), 1);
+        assert!(worker_count(10_000) >= 1);
+    }
+}
@@ -0,0 +1,395 @@
+// SPDX-License-Identifier: AGPL-3.0-or-later
+// Copyright (C) 2026 Grant Wickman
+
+//! Flat stack-machine bytecode for procedural expressions.
+//!
+//! `procedural_parser::eval` walks the boxed AST once per pixel, re-matching on
+//! every node and re-checking the step budget as it goes. For a 4K frame that is
+//! ~8.3M tree walks. [`compile`] lowers the AST once into a linear `Vec<Op>`
+//! evaluated by a tight loop over a reusable value stack, folds variable-free
+//! subtrees to constants, and checks the step budget statically (worst case
+//! over both `if` branches) so the per-pixel loop carries no budget accounting.
+//!
+//! Arithmetic is identical to the tree-walking evaluator: division and modulo
+//! by zero yield 0.0 and power exponents are clamped to [-100, 100], so a
+//! compiled program produces bit-identical output to `eval`.
+
+use super::procedural_parser::{BinOp, EvalError, Expr, FnName, VarKind};
+
+#[derive(Debug, Clone, Copy, PartialEq)]
+enum Op {
+    Const(f64),
+    X,
+    Y,
+    T,
+    Neg,
+    Add,
+    Sub,
+    Mul,
+    Div,
+    Mod,
+    Pow,
+    Sin,
+    Cos,
+    Tan,
+    Sqrt,
+    Exp,
+    Log,
+    Abs,
+    Floor,
+    Ceil,
+    Atan2,
+    Hypot,
+    /// Pop the condition; jump to the target when it is exactly 0.0.
+    JumpIfZero(usize),
+    Jump(usize),
+}
+
+/// A compiled procedural expression.
+#[derive(Debug, Clone)]
+pub struct Program {
+    ops: Vec<Op>,
+    max_stack: usize,
+}
+
+/// Worst-case node visits of the tree-walking evaluator for `expr`.
+///
+/// Mirrors the per-node budget decrement in `procedural_parser::eval`; for
+/// `if` the more expensive branch is counted.
+pub fn worst_case_steps(expr: &Expr) -> usize {
+    match expr {
+        Expr::Literal(_) | Expr::Var(_) => 1,
+        Expr::UnaryNeg(e) => 1 + worst_case_steps(e),
+        Expr::BinOp(_, l, r) => 1 + worst_case_steps(l) + worst_case_steps(r),
+        Expr::FnCall(_, args) => 1 + args.iter().map(worst_case_steps).sum::<usize>(),
+        Expr::IfExpr(c, a, b) => {
+            1 + worst_case_steps(c) + worst_case_steps(a).max(worst_case_steps(b))
+        }
+    }
+}
+
+/// Compile `expr` into a [`Program`].
+///
+/// Returns `EvalError::BudgetExceeded` when the worst-case evaluation of the
+/// expression would exceed `budget` steps.
+pub fn compile(expr: &Expr, budget: usize) -> Result<Program, EvalError> {
+    if worst_case_steps(expr) > budget {
+        return Err(EvalError::BudgetExceeded);
+    }
+    let mut ops = Vec::new();
+    emit(expr, &mut ops);
+    let max_stack = max_stack_depth(&ops);
+    Ok(Program { ops, max_stack })
+}
+
+fn binop_op(op: &BinOp) -> Op {
+    match op {
+        BinOp::Add => Op::Add,
+        BinOp::Sub => Op::Sub,
+        BinOp::Mul => Op::Mul,
+        BinOp::Div => Op::Div,
+        BinOp::Mod => Op::Mod,
+        BinOp::Pow => Op::Pow,
+    }
+}
+
+fn fn_op(name: &FnName) -> Op {
+    match name {
+        FnName::Sin => Op::Sin,
+        FnName::Cos => Op::Cos,
+        FnName::Tan => Op::Tan,
+        FnName::Sqrt => Op::Sqrt,
+        FnName::Exp => Op::Exp,
+        FnName::Log => Op::Log,
+        FnName::Abs => Op::Abs,
+        FnName::Floor => Op::Floor,
+        FnName::Ceil => Op::Ceil,
+        FnName::Atan2 => Op::Atan2,
+        FnName::Hypot => Op::Hypot,
+        FnName::Pow => Op::Pow,
+        FnName::Mod => Op::Mod,
+    }
+}
+
+/// Emit `op` over operands whose constant values (if any) are `consts`.
+///
+/// When every operand folded to a constant, the operand ops are replaced by
+/// a single `Const` holding the result.
+fn emit_op(op: Op, consts: Vec<Option<f64>>, ops: &mut Vec<Op>) -> Option<f64> {
+    let values: Option<Vec<f64>> = consts.into_iter().collect();
+    match values {
+        Some(mut stack) => {
+            ops.truncate(ops.len() - stack.len());
+            apply(op, &mut stack);
+            let v = stack[0];
+            ops.push(Op::Const(v));
+            Some(v)
+        }
+        None => {
+            ops.push(op);
+            None
+        }
+    }
+}
+
+/// Emit ops for `expr`; returns its value when the subtree folded to a constant.
+fn emit(expr: &Expr, ops: &mut Vec<Op>) -> Option<f64> {
+    match expr {
+        Expr::Literal(n) => {
+            ops.push(Op::Const(*n));
+            Some(*n)
+        }
+        Expr::Var(v) => {
+            ops.push(match v {
+                VarKind::X => Op::X,
+                VarKind::Y => Op::Y,
+                VarKind::T => Op::T,
+            });
+            None
+        }
+        Expr::UnaryNeg(e) => {
+            let a = emit(e, ops);
+            emit_op(Op::Neg, vec![a], ops)
+        }
+        Expr::BinOp(op, l, r) => {
+            let a = emit(l, ops);
+            let b = emit(r, ops);
+            emit_op(binop_op(op), vec![a, b], ops)
+        }
+        Expr::FnCall(name, args) => {
+            let consts = args.iter().map(|a| emit(a, ops)).collect();
+            emit_op(fn_op(name), consts, ops)
+        }
+        Expr::IfExpr(cond, then_e, else_e) => {
+            if let Some(c) = emit(cond, ops) {
+                ops.pop();
+                return if c != 0.0 {
+                    emit(then_e, ops)
+                } else {
+                    emit(else_e, ops)
+                };
+            }
+            let jz = ops.len();
+            ops.push(Op::JumpIfZero(0));
+            emit(then_e, ops);
+            let jmp = ops.len();
+            ops.push(Op::Jump(0));
+            ops[jz] = Op::JumpIfZero(ops.len());
+            emit(else_e, ops);
+            ops[jmp] = Op::Jump(ops.len());
+            None
+        }
+    }
+}
+
+/// Stack effect of each op: (values popped, values pushed).
+fn stack_effect(op: &Op) -> (usize, usize) {
+    match op {
+        Op::Const(_) | Op::X | Op::Y | Op::T => (0, 1),
+        Op::Neg
+        | Op::Sin
+        | Op::Cos
+        | Op::Tan
+        | Op::Sqrt
+        | Op::Exp
+        | Op::Log
+        | Op::Abs
+        | Op::Floor
+        | Op::Ceil => (1, 1),
+        Op::Add | Op::Sub | Op::Mul | Op::Div | Op::Mod | Op::Pow | Op::Atan2 | Op::Hypot => (2, 1),
+        Op::JumpIfZero(_) => (1, 0),
+        Op::Jump(_) => (0, 0),
+    }
+}
+
+/// Upper bound on stack depth, walking ops linearly.
+///
+/// Both `if` branches push exactly one value, so a linear walk that ignores
+/// jumps over-counts by at most one slot per nested `if` — fine for a
+/// preallocation hint.
+fn max_stack_depth(ops: &[Op]) -> usize {
+    let mut depth = 0usize;
+    let mut max = 0usize;
+    for op in ops {
+        let (pop, push) = stack_effect(op);
+        depth = depth.saturating_sub(pop) + push;
+        max = max.max(depth);
+    }
+    max
+}
+
+/// Apply a non-control op to the top of `stack`.
+#[inline(always)]
+fn apply(op: Op, stack: &mut Vec<f64>) {
+    match op {
+        Op::Const(_) | Op::X | Op::Y | Op::T | Op::JumpIfZero(_) | Op::Jump(_) => {
+            unreachable!("operand and control ops are handled by Program::run")
+        }
+        Op::Neg => unary(stack, |a| -a),
+        Op::Sin => unary(stack, f64::sin),
+        Op::Cos => unary(stack, f64::cos),
+        Op::Tan => unary(stack, f64::tan),
+        Op::Sqrt => unary(stack, f64::sqrt),
+        Op::Exp => unary(stack, f64::exp),
+        Op::Log => unary(stack, f64::ln),
+        Op::Abs => unary(stack, f64::abs),
+        Op::Floor => unary(stack, f64::floor),
+        Op::Ceil => unary(stack, f64::ceil),
+        Op::Add => binary(stack, |a, b| a + b),
+        Op::Sub => binary(stack, |a, b| a - b),
+        Op::Mul => binary(stack, |a, b| a * b),
+        Op::Div => binary(stack, |a, b| if b == 0.0 { 0.0 } else { a / b }),
+        Op::Mod => binary(stack, |a, b| if b == 0.0 { 0.0 } else { a % b }),
+        Op::Pow => binary(stack, |a, b| a.powf(b.clamp(-100.0, 100.0))),
+        Op::Atan2 => binary(stack, f64::atan2),
+        Op::Hypot => binary(stack, f64::hypot),
+    }
+}
+
+#[inline(always)]
+fn unary(stack: &mut [f64], f: impl Fn(f64) -> f64) {
+    let top = stack.len() - 1;
+    stack[top] = f(stack[top]);
+}
+
+#[inline(always)]
+fn binary(stack: &mut Vec<f64>, f: impl Fn(f64, f64) -> f64) {
+    let b = stack.pop().unwrap_or(0.0);
+    let top = stack.len() - 1;
+    stack[top] = f(stack[top], b);
+}
+
+impl Program {
+    /// Allocate a value stack sized for this program.
+    pub fn new_stack(&self) -> Vec<f64> {
+        Vec::with_capacity(self.max_stack.max(1))
+    }
+
+    /// Number of instructions after constant folding.
+    pub fn len(&self) -> usize {
+        self.ops.len()
+    }
+
+    /// Whether the program has no instructions (never true for a parsed expression).
+    pub fn is_empty(&self) -> bool {
+        self.ops.is_empty()
+    }
+
+    /// Evaluate the program at (x, y, t) using `stack` as scratch space.
+    pub fn run(&self, x: f64, y: f64, t: f64, stack: &mut Vec<f64>) -> f64 {
+        stack.clear();
+        let ops = &self.ops;
+        let mut pc = 0;
+        while pc < ops.len() {
+            match ops[pc] {
+                Op::Const(v) => stack.push(v),
+                Op::X => stack.push(x),
+                Op::Y => stack.push(y),
+                Op::T => stack.push(t),
+                Op::JumpIfZero(target) => {
+                    if stack.pop().unwrap_or(0.0) == 0.0 {
+                        pc = target;
+                        continue;
+                    }
+                }
+                Op::Jump(target) => {
+                    pc = target;
+                    continue;
+                }
+                op => apply(op, stack),
+            }
+            pc += 1;
+        }
+        stack.pop().unwrap_or(0.0)
+    }
+}
+
+// ───────────────────────────────────────────────────────────── tests ────
+
+#[cfg(test)]
+mod tests {
+    use super::super::procedural_parser::{eval, parse};
+    use super::*;
+
+    const BUDGET: usize = 10_000;
+
+    fn assert_matches_tree_eval(src: &str) {
+        let expr = parse(src).unwrap();
+        let program = compile(&expr, BUDGET).unwrap();
+        let mut stack = program.new_stack();
+        for &(x, y, t) in &[
+            (0.0, 0.0, 0.0),
+            (0.25, 0.75, 0.5),
+            (1.0, 0.5, 2.0),
+            (0.5, 0.5, -1.0),
+            (0.9, 0.1, 10.0),
+        ] {
+            let mut b = BUDGET;
+            let expected = eval(&expr, x, y, t, &mut b).unwrap();
+            let got = program.run(x, y, t, &mut stack);
+            assert!(
+                expected.to_bits() == got.to_bits() || (expected.is_nan() && got.is_nan()),
+                "{src} at ({x},{y},{t}): tree={expected} bytecode={got}"
+            );
+        }
+    }
+
+    #[test]
+    fn test_bytecode_matches_tree_eval() {
+        for src in [
+            "x",
+            "x+y+t",
+            "-x^2",
+            "2^200",
+            "x/0",
+            "mod(x, 0)",
+            "x % 0.3",
+            "sin(x*6.28)*cos(y*6.28)",
+            "sin(atan2(y-0.5,x-0.5)*4+t*6.28)*0.5+0.5",
+            "hypot(x-0.5, y-0.5)",
+            "if(x, 1.0, 0.0)",
+            "if(floor(x*2), sqrt(y), if(y, exp(-t), log(x+1)))",
+            "pow(abs(x-0.5), 0.5) + ceil(y*3)/3 - tan(t)",
+        ] {
+            assert_matches_tree_eval(src);
+        }
+    }
+
+    #[test]
+    fn test_constant_subtrees_are_folded() {
+        let program = compile(&parse("x * (2 * 3 + sin(0))").unwrap(), BUDGET).unwrap();
+        // X, Const(6.0), Mul
+        assert_eq!(program.len(), 3);
+        let mut stack = program.new_stack();
+        assert_eq!(program.run(0.5, 0.0, 0.0, &mut stack), 3.0);
+    }
+
+    #[test]
+    fn test_if_result_is_not_folded_with_sibling_constant() {
+        // The else-branch constant must not be mistaken for an operand of `+ 3`.
+        assert_matches_tree_eval("if(x, 1, 2) + 3");
+        assert_matches_tree_eval("if(x - 0.5, y, 2) * (1 + 1)");
+    }
+
+    #[test]
+    fn test_constant_if_selects_branch() {
+        let program = compile(&parse("if(1 - 1, x, y)").unwrap(), BUDGET).unwrap();
+        assert_eq!(program.len(), 1);
+        let mut stack = program.new_stack();
+        assert_eq!(program.run(0.2, 0.7, 0.0, &mut stack), 0.7);
+    }
+
+    #[test]
+    fn test_worst_case_steps_counts_costlier_branch() {
+        let expr = parse("if(x, y, y+y+y)").unwrap();
+        // if(1) + cond(1) + max(then=1, else=5)
+        assert_eq!(worst_case_steps(&expr), 7);
+    }
+
+    #[test]
+    fn test_compile_budget_exceeded() {
+        let expr = parse("x+x").unwrap();
+        assert!(matches!(compile(&expr, 2), Err(EvalError::BudgetExceeded)));
+        assert!(compile(&expr, 3).is_ok());
+    }
+}
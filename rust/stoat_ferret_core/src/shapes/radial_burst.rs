@@ -3,6 +3,7 @@
 
 //! Radial burst (sunburst) procedural generator.
 
+use super::parallel::rgba_from_fn;
 use image::{ImageBuffer, Rgba};
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
@@ -42,7 +43,19 @@ impl RadialBurstGenerator {
     /// AC-4 placeholder: parent directory is std::env::temp_dir()/snf_shapes.
     /// Stable snf-managed asset path integration is deferred to BL-511 (v090).
     #[pyo3(name = "render_to_file")]
-    pub fn py_render_to_file(&self, output_path: &str, width: u32, height: u32) -> PyResult<()> {
+    pub fn py_render_to_file(
+        &self,
+        py: Python<'_>,
+        output_path: &str,
+        width: u32,
+        height: u32,
+    ) -> PyResult<()> {
+        py.detach(|| self.render_to_path(output_path, width, height))
+    }
+}
+
+impl RadialBurstGenerator {
+    fn render_to_path(&self, output_path: &str, width: u32, height: u32) -> PyResult<()> {
         if width == 0 || height == 0 {
             return Err(PyValueError::new_err("width and height must be > 0"));
         }
@@ -54,15 +67,13 @@ impl RadialBurstGenerator {
             .map_err(|e| PyValueError::new_err(format!("Cannot write PNG: {e}")))?;
         Ok(())
     }
-}
 
-impl RadialBurstGenerator {
     pub(crate) fn generate(&self, width: u32, height: u32) -> ImageBuffer<Rgba<u8>, Vec<u8>> {
         let cx = width as f32 / 2.0;
         let cy = height as f32 / 2.0;
         let half = self.ray_width / 2.0;
 
-        ImageBuffer::from_fn(width, height, |x, y| {
+        rgba_from_fn(width, height, |x, y| {
             let dx = x as f32 - cx;
             let dy = y as f32 - cy;
             if dx.abs() < 1e-6 && dy.abs() < 1e-6 {
@@ -3,6 +3,7 @@
 
 //! Archimedean spiral procedural generator.
 
+use super::parallel::rgba_from_fn;
 use image::{ImageBuffer, Rgba};
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
@@ -45,7 +46,19 @@ impl SpiralGenerator {
     /// AC-4 placeholder: parent directory is std::env::temp_dir()/snf_shapes.
     /// Stable snf-managed asset path integration is deferred to BL-511 (v090).
     #[pyo3(name = "render_to_file")]
-    pub fn py_render_to_file(&self, output_path: &str, width: u32, height: u32) -> PyResult<()> {
+    pub fn py_render_to_file(
+        &self,
+        py: Python<'_>,
+        output_path: &str,
+        width: u32,
+        height: u32,
+    ) -> PyResult<()> {
+        py.detach(|| self.render_to_path(output_path, width, height))
+    }
+}
+
+impl SpiralGenerator {
+    fn render_to_path(&self, output_path: &str, width: u32, height: u32) -> PyResult<()> {
         if width == 0 || height == 0 {
             return Err(PyValueError::new_err("width and height must be > 0"));
         }
@@ -57,9 +70,7 @@ impl SpiralGenerator {
             .map_err(|e| PyValueError::new_err(format!("Cannot write PNG: {e}")))?;
         Ok(())
     }
-}
 
-impl SpiralGenerator {
     pub(crate) fn generate(&self, width: u32, height: u32) -> ImageBuffer<Rgba<u8>, Vec<u8>> {
         let cx = width as f32 / 2.0;
         let cy = height as f32 / 2.0;
@@ -67,7 +78,7 @@ impl SpiralGenerator {
         // Normalise thickness to fraction of max_r, halved for one-sided band
         let norm_thickness = self.thickness / max_r / 2.0;
 
-        ImageBuffer::from_fn(width, height, |x, y| {
+        rgba_from_fn(width, height, |x, y| {
             let dx = x as f32 - cx;
             let dy = y as f32 - cy;
             let r = (dx * dx + dy * dy).sqrt();
@@ -134,8 +145,8 @@ mod tests {
         let gen = SpiralGenerator::py_new(3.0, 2.0).unwrap();
         let tmp = std::env::temp_dir().join("snf_shapes/test_err.png");
         std::fs::create_dir_all(tmp.parent().unwrap()).unwrap();
-        assert!(gen.py_render_to_file(tmp.to_str().unwrap(), 0, 64).is_err());
-        assert!(gen.py_render_to_file(tmp.to_str().unwrap(), 64, 0).is_err());
+        assert!(gen.render_to_path(tmp.to_str().unwrap(), 0, 64).is_err());
+        assert!(gen.render_to_path(tmp.to_str().unwrap(), 64, 0).is_err());
     }
 
     #[test]
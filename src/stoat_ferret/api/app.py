@@ -14,8 +14,9 @@ import sqlite3
 import subprocess
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
 
 import aiosqlite
 import httpx
@@ -25,7 +26,7 @@ from fastapi.exception_handlers import http_exception_handler as _default_http_e
 from fastapi.responses import FileResponse, JSONResponse, Response
 from prometheus_client import make_asgi_app
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from starlette.routing import Match
+from starlette.routing import Match, Route
 
 from stoat_ferret.api.lifespan import record_feature_flags, run_startup_migrations
 from stoat_ferret.api.middleware.correlation import CorrelationIdMiddleware
@@ -61,6 +62,9 @@ from stoat_ferret.api.routers import (
 )
 from stoat_ferret.api.routers.ws import websocket_endpoint
 from stoat_ferret.api.schemas.websocket_event import WebSocketEvent
+from stoat_ferret.api.services.asset_uploads import PARTS_DIRNAME, open_upload_store
+from stoat_ferret.api.services.discovery_cache import get_discovery_cache, payload_response
+from stoat_ferret.api.services.health_cache import HealthCache
 from stoat_ferret.api.services.proxy_service import (
     PROXY_JOB_TYPE,
     ProxyService,
@@ -69,6 +73,7 @@ from stoat_ferret.api.services.proxy_service import (
 from stoat_ferret.api.services.qc_service import QCService
 from stoat_ferret.api.services.scan import SCAN_JOB_TYPE, make_scan_handler
 from stoat_ferret.api.services.synthetic_monitoring import SyntheticMonitoringTask
+from stoat_ferret.api.services.system_state import SystemStateTracker
 from stoat_ferret.api.services.thumbnail import ThumbnailService
 from stoat_ferret.api.services.waveform import WaveformService
 from stoat_ferret.api.settings import Settings, get_settings
@@ -79,9 +84,10 @@ from stoat_ferret.db.async_repository import (
     AsyncSQLiteVideoRepository,
     AsyncVideoRepository,
 )
-from stoat_ferret.db.audit import AuditLogger
+from stoat_ferret.db.audit import AuditLogger, BufferedAuditLogger
 from stoat_ferret.db.batch_repository import AsyncBatchRepository, AsyncSQLiteBatchRepository
 from stoat_ferret.db.clip_repository import AsyncClipRepository, AsyncSQLiteClipRepository
+from stoat_ferret.db.connection_pool import SQLiteConnectionPool
 from stoat_ferret.db.ducking_pair_repository import AsyncDuckingPairRepository
 from stoat_ferret.db.markers_repository import AsyncSQLiteMarkerRepository
 from stoat_ferret.db.models import ProxyQuality, ProxyStatus
@@ -96,13 +102,15 @@ from stoat_ferret.db.waveform_repository import SQLiteWaveformRepository
 from stoat_ferret.effects.registry import EffectRegistry
 from stoat_ferret.ffmpeg.async_executor import RealAsyncFFmpegExecutor
 from stoat_ferret.ffmpeg.executor import FFmpegExecutor, RealFFmpegExecutor
+from stoat_ferret.ffmpeg.governor import ThreadGovernor
 from stoat_ferret.ffmpeg.observable import ObservableFFmpegExecutor
 from stoat_ferret.jobs.queue import AsyncioJobQueue, JobStatus
-from stoat_ferret.logging import configure_logging
+from stoat_ferret.logging import configure_logging, shutdown_logging
 from stoat_ferret.preview.cache import PreviewCache
 from stoat_ferret.preview.manager import PreviewManager
 from stoat_ferret.render.checkpoints import RenderCheckpointManager
 from stoat_ferret.render.executor import RenderExecutor
+from stoat_ferret.render.fragment_cache import ClipFragmentCache
 from stoat_ferret.render.queue import RenderQueue
 from stoat_ferret.render.render_repository import (
     AsyncRenderRepository,
@@ -110,6 +118,8 @@ from stoat_ferret.render.render_repository import (
 )
 from stoat_ferret.render.service import RenderService
 from stoat_ferret.render.sweeper import StaleRenderSweeper
+from stoat_ferret.render.telemetry import AsyncSQLiteRenderTelemetryRepository
+from stoat_ferret.render.tuning import EncoderTuner
 from stoat_ferret.render.worker import RenderWorkerLoop
 
 logger = structlog.get_logger(__name__)
@@ -231,8 +241,8 @@ async def _shutdown_preview(app: FastAPI) -> None:
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Manage application lifespan resources.
 
-    Opens database connection on startup and closes on shutdown.
-    The connection is stored in app.state.db for access by routes.
+    Opens the database connection pool on startup and closes it on shutdown.
+    The pool is stored in app.state.db for access by routes.
     Starts and stops the job queue worker.
     Skips database setup when repositories have been injected via create_app().
 
@@ -249,6 +259,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         level=getattr(logging, settings.log_level),
         max_bytes=settings.log_max_bytes,
         backup_count=settings.log_backup_count,
+        queue_mode=settings.log_queue_enabled,
+        queue_max_records=settings.log_queue_max_records,
+        sample_rate=settings.log_sample_rate,
     )
 
     # Create ConnectionManager if not injected
@@ -273,25 +286,50 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # audit logging (BL-266) before opening the long-lived connection.
     await run_startup_migrations(app=app, settings=settings)
 
-    # Startup: open database connection
-    app.state.db = await aiosqlite.connect(settings.database_path_resolved)
+    # Startup: open the database connection pool. Repositories share it like a
+    # single connection; it routes reads to read-only WAL connections and
+    # everything else to one serialized writer. The writer enables FK
+    # enforcement per-connection on open (BL-413).
+    app.state.db = SQLiteConnectionPool(
+        settings.database_path_resolved,
+        read_pool_size=settings.database_read_pool_size,
+        mmap_size_bytes=settings.database_mmap_size_bytes,
+        cache_size_kib=settings.database_cache_size_kib,
+        busy_timeout_ms=settings.database_busy_timeout_ms,
+        commit_window_ms=settings.database_commit_window_ms,
+    )
+    await app.state.db.open()
     app.state.db.row_factory = aiosqlite.Row
 
     # Ensure schema exists (idempotent, uses IF NOT EXISTS)
     await create_tables_async(app.state.db)
-    # Enable FK enforcement on the async connection (BL-413).
-    # Must be set per-connection after Phase 6 DB open.
-    await app.state.db.execute("PRAGMA foreign_keys=ON")
 
     # Record feature flag state to feature_flag_log (BL-268) after schema
     # creation so the table definitely exists for the insert.
     record_feature_flags(settings=settings, db_path=str(settings.database_path_resolved))
 
-    # Open a separate sync connection for audit logging
-    sync_conn = sqlite3.connect(str(settings.database_path_resolved))
+    # Open a separate sync connection for audit logging. With buffering
+    # enabled, entries are queued and written in batches on a worker thread.
+    sync_conn = sqlite3.connect(str(settings.database_path_resolved), check_same_thread=False)
     sync_conn.execute("PRAGMA journal_mode=WAL")
     sync_conn.execute("PRAGMA foreign_keys=ON")
-    audit_logger = AuditLogger(conn=sync_conn)
+    sync_conn.execute(f"PRAGMA busy_timeout={int(settings.database_busy_timeout_ms)}")
+    audit_logger: AuditLogger
+    if settings.audit_queue_max_entries > 0:
+        audit_logger = BufferedAuditLogger(
+            sync_conn,
+            max_pending=settings.audit_queue_max_entries,
+            batch_size=settings.audit_batch_size,
+            flush_interval_s=settings.audit_flush_interval_ms / 1000,
+            retention=(
+                timedelta(days=settings.audit_retention_days)
+                if settings.audit_retention_days > 0
+                else None
+            ),
+        )
+        await audit_logger.start()
+    else:
+        audit_logger = AuditLogger(conn=sync_conn)
     app.state.audit_logger = audit_logger
 
     # Create batch repository backed by the same database
@@ -310,6 +348,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Create asset repository (Phase 10: after DB open, before Phase 11 services)
     app.state.asset_repository = AsyncSQLiteAssetRepository(app.state.db)
 
+    # Resumable upload store; building it sweeps orphaned part files left by
+    # a restart, so it runs in a worker thread rather than on first request.
+    app.state.asset_upload_store = await open_upload_store(
+        Path(settings.assets_dir) / PARTS_DIRNAME,
+        ttl_seconds=settings.assets_upload_session_ttl_seconds,
+    )
+
     # Create ducking pair repository (Phase 10: after DB open, before Phase 11 services, BL-517)
     from stoat_ferret.db.ducking_pair_repository import AsyncSQLiteDuckingPairRepository
 
@@ -326,8 +371,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.tts_service = TtsService(
         repository=app.state.tts_cue_repository,
         settings=settings,
+        connection_manager=app.state.ws_manager,
     )
 
+    # Shared CPU thread budget for every FFmpeg process spawned below
+    thread_governor = ThreadGovernor(
+        settings.ffmpeg_thread_budget, batch_slots=settings.render_max_concurrent
+    )
+    app.state.thread_governor = thread_governor
+
     # Phase 11 — QCService (after Phase 10 repositories, before Phase 12 worker)
     from stoat_ferret.db.qc_repository import AsyncSQLiteQCReportRepository
 
@@ -335,6 +387,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         repository=AsyncSQLiteQCReportRepository(app.state.db),
         connection_manager=app.state.ws_manager,
         settings=settings,
+        governor=thread_governor,
     )
 
     # Phase 11 — DeliveryProfileRepository (same phase as QCService)
@@ -348,12 +401,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.video_repository = repo
     clip_repository = AsyncSQLiteClipRepository(app.state.db)
     app.state.clip_repository = clip_repository
-    app.state.ffmpeg_executor = ObservableFFmpegExecutor(RealFFmpegExecutor())
-    async_executor = RealAsyncFFmpegExecutor()
+    app.state.ffmpeg_executor = ObservableFFmpegExecutor(
+        RealFFmpegExecutor(governor=thread_governor, workload="thumbnail")
+    )
     thumbnail_service = ThumbnailService(
         executor=app.state.ffmpeg_executor,
         thumbnail_dir=settings.thumbnail_dir,
-        async_executor=async_executor,
+        async_executor=RealAsyncFFmpegExecutor(governor=thread_governor, workload="thumbnail"),
         ws_manager=app.state.ws_manager,
         strip_repository=app.state.thumbnail_strip_repository,
     )
@@ -361,7 +415,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Create waveform service
     app.state.waveform_service = WaveformService(
-        async_executor=async_executor,
+        async_executor=RealAsyncFFmpegExecutor(governor=thread_governor, workload="waveform"),
         waveform_dir=settings.waveform_dir,
         ws_manager=app.state.ws_manager,
         waveform_repository=app.state.waveform_repository,
@@ -370,9 +424,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Create proxy service before scan handler so it can be injected
     proxy_service = ProxyService(
         proxy_repository=app.state.proxy_repository,
-        async_executor=RealAsyncFFmpegExecutor(),
+        async_executor=RealAsyncFFmpegExecutor(governor=thread_governor, workload="proxy"),
         ws_manager=app.state.ws_manager,
         job_queue=job_queue,
+        video_repository=repo,
         proxy_dir=settings.proxy_output_dir,
         max_storage_bytes=settings.proxy_max_storage_bytes,
         cleanup_threshold=settings.proxy_cleanup_threshold,
@@ -391,10 +446,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     render_executor = RenderExecutor(
         timeout_seconds=settings.render_timeout_seconds,
         cancel_grace_seconds=settings.render_cancel_grace_seconds,
+        governor=thread_governor,
     )
     app.state.render_executor = render_executor
     checkpoint_manager = RenderCheckpointManager(app.state.db)
     app.state.checkpoint_manager = checkpoint_manager
+    # Encoder telemetry drives preset planning, output size estimates and ETAs
+    encoder_tuner: EncoderTuner | None = None
+    if settings.render_telemetry_max_samples > 0:
+        encoder_tuner = EncoderTuner(
+            AsyncSQLiteRenderTelemetryRepository(app.state.db),
+            max_samples=settings.render_telemetry_max_samples,
+        )
+        await encoder_tuner.load()
+    app.state.encoder_tuner = encoder_tuner
     render_service = RenderService(
         repository=render_repo,
         queue=render_queue,
@@ -404,9 +469,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         settings=settings,
         qc_service=app.state.qc_service,
         dp_repo=app.state.delivery_profile_repository,
+        tuner=encoder_tuner,
     )
     app.state.render_service = render_service
     await render_service.recover()
+    # Built effect filters per clip, reused across retries and re-renders
+    app.state.clip_fragment_cache = ClipFragmentCache()
 
     # Phase 9.5: Register render worker (after services, before job queue worker)
     # Noop mode handles all jobs inline in service.submit(); the render worker
@@ -426,6 +494,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             tts_service=getattr(app.state, "tts_service", None),
             tts_cue_repository=getattr(app.state, "tts_cue_repository", None),
             asset_repository=getattr(app.state, "asset_repository", None),
+            max_clips_per_pass=settings.render_max_clips_per_pass,
+            fragment_cache=app.state.clip_fragment_cache,
         )
         render_worker_task = asyncio.create_task(render_worker.run())
         app.state.render_worker_task = render_worker_task
@@ -436,7 +506,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     preview_repo = SQLitePreviewRepository(app.state.db)
     hls_generator = HLSGenerator(
-        async_executor=RealAsyncFFmpegExecutor(),
+        async_executor=RealAsyncFFmpegExecutor(governor=thread_governor, workload="preview"),
         output_base_dir=settings.preview_output_dir,
     )
     app.state.preview_manager = PreviewManager(
@@ -547,9 +617,26 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         if isinstance(tts_svc, _TtsService):
             await tts_svc.shutdown()
 
+    # Shutdown: cancel readiness cache background refreshes (created on first probe)
+    health_cache: HealthCache | None = getattr(app.state, "health_cache", None)
+    if health_cache is not None:
+        await health_cache.aclose()
+
+    # Shutdown: detach the system state tracker from the render repository
+    state_tracker: SystemStateTracker | None = getattr(app.state, "system_state_tracker", None)
+    if state_tracker is not None:
+        state_tracker.close()
+
+    # Shutdown: write any buffered audit entries before the connection closes
+    if isinstance(audit_logger, BufferedAuditLogger):
+        await audit_logger.aclose()
+
     sync_conn.close()
     await app.state.db.close()
 
+    # Shutdown: drain queued log records last so teardown events are written
+    shutdown_logging()
+
 
 async def _fix_405_allow_header(request: Request, exc: StarletteHTTPException) -> Response:
     """Aggregate Allow header across all routes matching the request path.
@@ -646,6 +733,40 @@ def _mount_gui_routes(app: FastAPI, gui_dir: Path) -> None:
         return FileResponse(index_html)
 
 
+def _serve_cached_openapi(app: FastAPI) -> None:
+    """Replace FastAPI's ``/openapi.json`` route with a cached, conditional one.
+
+    The document is serialised and compressed once (per ASGI ``root_path``)
+    and served from the discovery cache with a strong ``ETag``, so agent
+    session bootstraps revalidate with a 304 instead of re-rendering it.
+    """
+    openapi_url = app.openapi_url
+    if not openapi_url:
+        return
+    app.router.routes[:] = [
+        route
+        for route in app.router.routes
+        if not (isinstance(route, Route) and route.path == openapi_url)
+    ]
+
+    def _document(root_path: str) -> dict[str, Any]:
+        schema = app.openapi()
+        if root_path and app.root_path_in_servers:
+            server_urls = {s.get("url") for s in schema.get("servers", [])}
+            if root_path not in server_urls:
+                schema = {**schema, "servers": [{"url": root_path}, *schema.get("servers", [])]}
+        return schema
+
+    async def openapi(request: Request) -> Response:
+        root_path = request.scope.get("root_path", "").rstrip("/")
+        payload = get_discovery_cache(request).get(
+            f"openapi:{root_path}", None, lambda: _document(root_path)
+        )
+        return payload_response(request, payload)
+
+    app.add_route(openapi_url, openapi, include_in_schema=False)
+
+
 def create_app(
     *,
     video_repository: AsyncVideoRepository | None = None,
@@ -878,6 +999,7 @@ def create_app(
         return schema
 
     app.openapi = _custom_openapi  # type: ignore[method-assign]
+    _serve_cached_openapi(app)
 
     # Fix 405 Allow header to aggregate all methods for the matched path.
     # Starlette 0.50.0 only includes the first matching route's methods.
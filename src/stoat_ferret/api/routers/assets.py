@@ -6,23 +6,50 @@
 Provides upload, list, metadata, download, and soft-delete for user assets.
 Business logic (content-sniff, path safety, dedup) lives here following the
 asyncio.to_thread pattern for blocking I/O.
+
+Uploads never hold the whole file in memory: single-request multipart
+uploads are parsed straight from the request stream into a temp file while
+hashing (so the body is written to disk once and the size limit applies
+mid-stream), and large files can use the
+resumable ``/uploads`` endpoints (see
+:mod:`stoat_ferret.api.services.asset_uploads`). Either way the file is
+renamed atomically to its content-addressed name.
 """
 
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import io
+import os
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Annotated, Literal
 
 import structlog
-from fastapi import APIRouter, HTTPException, Query, Request, UploadFile
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import FileResponse
 
-from stoat_ferret.api.schemas.assets import AssetListResponse, AssetRead
+from stoat_ferret.api.schemas.assets import (
+    AssetListResponse,
+    AssetRead,
+    AssetUploadCreate,
+    AssetUploadStatus,
+)
+from stoat_ferret.api.services.asset_uploads import (
+    MULTIPART_OVERHEAD_BYTES,
+    PARTS_DIRNAME,
+    AssetUploadStore,
+    InvalidMultipartError,
+    SpooledUpload,
+    UploadBusyError,
+    UploadOffsetMismatchError,
+    UploadSession,
+    UploadTooLargeError,
+    open_upload_store,
+    spool_form_file,
+)
 from stoat_ferret.db.asset_repository import AssetRecord, AsyncSQLiteAssetRepository
 
 logger = structlog.get_logger(__name__)
@@ -40,6 +67,24 @@ _KIND_MIME_MAP: dict[str, frozenset[str]] = {
 # Shared 404 detail for asset-not-found responses (get/download/delete).
 _ASSET_NOT_FOUND_DETAIL = "Asset not found."
 
+# Request body of POST /assets. The route reads the multipart stream itself
+# (so FastAPI does not spool it first), so the form is declared here.
+_UPLOAD_REQUEST_BODY: dict[str, object] = {
+    "required": True,
+    "content": {
+        "multipart/form-data": {
+            "schema": {
+                "type": "object",
+                "properties": {"file": {"type": "string", "format": "binary", "title": "File"}},
+                "required": ["file"],
+            }
+        }
+    },
+}
+
+# Shared 404 detail for unknown or expired resumable upload sessions.
+_UPLOAD_NOT_FOUND_DETAIL = "Upload session not found or expired."
+
 
 def _get_repo(request: Request) -> AsyncSQLiteAssetRepository:
     repo: AsyncSQLiteAssetRepository = request.app.state.asset_repository
@@ -54,31 +99,36 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-# ---------------------------------------------------------------------------
-# Blocking helpers (run via asyncio.to_thread)
-# ---------------------------------------------------------------------------
-
+async def _get_upload_store(request: Request) -> AssetUploadStore:
+    """Return the app's resumable upload store.
 
-def _hash_and_write(data: bytes, dest_path: Path) -> str:
-    """Compute SHA-256 of data and write to dest_path.
+    The lifespan builds it at startup. It is only rebuilt here (off the
+    event loop) when there is none yet or ``assets_dir`` has changed since,
+    as with injected dependencies or settings swapped in tests.
+    """
+    settings = _get_settings(request)
+    parts_dir = Path(settings.assets_dir) / PARTS_DIRNAME  # type: ignore[attr-defined]
+    store: AssetUploadStore | None = getattr(request.app.state, "asset_upload_store", None)
+    if store is None or store.parts_dir != parts_dir:
+        store = await open_upload_store(
+            parts_dir,
+            ttl_seconds=settings.assets_upload_session_ttl_seconds,  # type: ignore[attr-defined]
+        )
+        request.app.state.asset_upload_store = store
+    return store
 
-    Args:
-        data: Raw file bytes.
-        dest_path: Destination path (parent must exist).
 
-    Returns:
-        Hex-encoded SHA-256 digest.
-    """
-    digest = hashlib.sha256(data).hexdigest()
-    dest_path.write_bytes(data)
-    return digest
+# ---------------------------------------------------------------------------
+# Blocking helpers (run via asyncio.to_thread)
+# ---------------------------------------------------------------------------
 
 
-def _validate_image_magic_bytes(data: bytes) -> tuple[str, str]:
+def _validate_image_magic_bytes(data: bytes | Path) -> tuple[str, str]:
     """Validate data as an image via Pillow magic-bytes sniff.
 
     Args:
-        data: Raw uploaded bytes.
+        data: Raw uploaded bytes, or the path of a spooled upload (only the
+            header is read).
 
     Returns:
         Tuple of (pillow_format, mime_type) for an accepted image.
@@ -92,8 +142,8 @@ def _validate_image_magic_bytes(data: bytes) -> tuple[str, str]:
         raise ValueError("Pillow is required for content validation") from None
 
     try:
-        img = Image.open(io.BytesIO(data))
-        fmt = img.format
+        with Image.open(io.BytesIO(data) if isinstance(data, bytes) else data) as img:
+            fmt = img.format
     except Exception as exc:
         raise ValueError(f"Cannot identify image format: {exc}") from exc
 
@@ -170,33 +220,31 @@ async def _check_dedup(repo: AsyncSQLiteAssetRepository, content_hash: str) -> A
     return _to_schema(restored)
 
 
-def _validate_upload_size(data: bytes, max_bytes: int) -> None:
-    """Raise 413 if the uploaded payload exceeds the configured size limit.
+def _upload_too_large(max_bytes: int) -> HTTPException:
+    """Build the 413 raised when an upload exceeds the configured size limit.
 
     Args:
-        data: Raw uploaded bytes.
         max_bytes: Configured STOAT_ASSETS_MAX_SIZE_BYTES limit.
 
-    Raises:
-        HTTPException: 413 if `data` exceeds `max_bytes`.
+    Returns:
+        The HTTPException to raise.
     """
-    if len(data) > max_bytes:
-        raise HTTPException(
-            status_code=413,
-            detail=f"Upload exceeds maximum allowed size of {max_bytes} bytes.",
-        )
+    return HTTPException(
+        status_code=413,
+        detail=f"Upload exceeds maximum allowed size of {max_bytes} bytes.",
+    )
 
 
 async def _sniff_content(
-    kind: str, data: bytes, original_filename: str, file: UploadFile
+    kind: str, path: Path, original_filename: str, content_type: str | None
 ) -> tuple[str, str]:
     """Detect MIME type and extension, validating content for image kind.
 
     Args:
         kind: Asset kind (e.g. "image", "audio").
-        data: Raw uploaded bytes.
+        path: Spooled upload file.
         original_filename: Client-supplied filename, used for extension fallback.
-        file: The original UploadFile, used for its declared content-type.
+        content_type: Client-declared content-type.
 
     Returns:
         Tuple of (mime_type, ext).
@@ -206,17 +254,112 @@ async def _sniff_content(
     """
     if kind == "image":
         try:
-            _fmt, mime_type = await asyncio.to_thread(_validate_image_magic_bytes, data)
+            _fmt, mime_type = await asyncio.to_thread(_validate_image_magic_bytes, path)
         except ValueError as exc:
             raise HTTPException(status_code=415, detail=str(exc)) from exc
         ext = "png" if _fmt == "PNG" else "jpg"
     else:
         # Non-image kinds: use uploaded content-type (v090 out of scope for magic-bytes)
-        mime_type = file.content_type or "application/octet-stream"
+        mime_type = content_type or "application/octet-stream"
         ext = Path(original_filename).suffix.lstrip(".") or "bin"
     return mime_type, ext
 
 
+async def _store_spooled(
+    request: Request,
+    spooled: SpooledUpload,
+    *,
+    kind: str,
+    original_filename: str,
+    content_type: str | None,
+) -> AssetRead:
+    """Validate, deduplicate and atomically store a fully received upload.
+
+    The spooled file is renamed to ``<sha256>.<ext>`` under the assets
+    directory, or deleted if the upload is rejected or deduplicated.
+
+    Args:
+        request: The incoming request (for settings and repository).
+        spooled: The received file and its digest.
+        kind: Asset kind.
+        original_filename: Client-supplied filename.
+        content_type: Client-declared content-type (non-image kinds).
+
+    Returns:
+        The new, existing or restored asset.
+
+    Raises:
+        HTTPException: 422 if empty, 415 if content-sniffing fails.
+    """
+    repo = _get_repo(request)
+    assets_dir: Path = _get_settings(request).assets_dir  # type: ignore[attr-defined]
+    try:
+        if spooled.size_bytes == 0:
+            raise HTTPException(status_code=422, detail="Uploaded file is empty.")
+
+        # Content-sniff validation (v090: image kind only)
+        mime_type, ext = await _sniff_content(kind, spooled.path, original_filename, content_type)
+
+        # Deduplication: check existing record before touching the final path
+        dedup_hit = await _check_dedup(repo, spooled.sha256)
+        if dedup_hit is not None:
+            return dedup_hit
+
+        # Validate path safety (defence-in-depth; hash-derived names should never escape)
+        try:
+            dest_path = _resolve_safe_path(assets_dir, f"{spooled.sha256}.{ext}")
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+        # Same filesystem as the spool directory, so the rename is atomic.
+        await asyncio.to_thread(os.replace, spooled.path, dest_path)
+    finally:
+        await asyncio.to_thread(spooled.path.unlink, missing_ok=True)
+
+    now = _now_iso()
+    record = AssetRecord(
+        id=str(uuid.uuid4()),
+        original_filename=original_filename,
+        content_hash=spooled.sha256,
+        mime_type=mime_type,
+        kind=kind,
+        size_bytes=spooled.size_bytes,
+        file_path=str(dest_path),
+        deleted_at=None,
+        created_at=now,
+        updated_at=now,
+    )
+    saved = await repo.insert(record)
+    logger.info(
+        "asset.uploaded",
+        asset_id=saved.id,
+        kind=kind,
+        size_bytes=saved.size_bytes,
+    )
+    return _to_schema(saved)
+
+
+def _upload_status(
+    request: Request, store: AssetUploadStore, session: UploadSession
+) -> AssetUploadStatus:
+    return AssetUploadStatus(
+        upload_id=session.id,
+        kind=session.kind,  # type: ignore[arg-type]
+        filename=session.filename,
+        offset=session.offset,
+        size_bytes=session.size_bytes,
+        max_size_bytes=_get_settings(request).assets_max_size_bytes,  # type: ignore[attr-defined]
+        expires_in_seconds=store.remaining_seconds(session),
+    )
+
+
+def _get_upload_session(store: AssetUploadStore, upload_id: str) -> UploadSession:
+    session = store.get(upload_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=_UPLOAD_NOT_FOUND_DETAIL)
+    return session
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -225,7 +368,9 @@ async def _sniff_content(
 @router.post(
     "",
     status_code=201,
+    openapi_extra={"requestBody": _UPLOAD_REQUEST_BODY},
     responses={
+        400: {"description": "Malformed multipart body"},
         413: {"description": "Payload too large"},
         415: {"description": "Unsupported media type"},
         422: {
@@ -239,79 +384,177 @@ async def _sniff_content(
 )
 async def upload_asset(
     request: Request,
-    file: UploadFile,
     kind: Annotated[Literal["image", "audio", "subtitle", "font", "lut"], Query()] = "image",
 ) -> AssetRead:
     """Upload an asset file (multipart/form-data).
 
     - Validates content via Pillow magic-bytes sniff (image kind only in v090).
-    - Enforces STOAT_ASSETS_MAX_SIZE_BYTES.
+    - Enforces STOAT_ASSETS_MAX_SIZE_BYTES: up front from Content-Length, and
+      while the body streams in.
     - Deduplicates by content hash; re-upload of a soft-deleted asset restores it.
     - File is stored under STOAT_ASSETS_DIR as <sha256hex>.<ext>.
+    - The multipart body is parsed as it streams in and the ``file`` field is
+      written to disk once, hashed in chunks, never held whole in memory.
+      Use the ``/uploads`` endpoints for large or resumable uploads.
     """
     settings = _get_settings(request)
-    repo = _get_repo(request)
-
     max_bytes: int = settings.assets_max_size_bytes  # type: ignore[attr-defined]
     assets_dir: Path = settings.assets_dir  # type: ignore[attr-defined]
 
-    # Read uploaded bytes (bounded by max_size)
-    data = await file.read(max_bytes + 1)
-    _validate_upload_size(data, max_bytes)
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > max_bytes + MULTIPART_OVERHEAD_BYTES:
+        raise _upload_too_large(max_bytes)
 
-    if len(data) == 0:
-        raise HTTPException(status_code=422, detail="Uploaded file is empty.")
+    # Parse the request stream directly (FastAPI's UploadFile would spool the
+    # whole body first); blocks are written and hashed in worker threads
+    # (NFR-001: non-blocking I/O), so memory stays bounded by the chunk size.
+    try:
+        spooled = await spool_form_file(
+            request.stream(),
+            request.headers.get("content-type"),
+            assets_dir / PARTS_DIRNAME,
+            max_bytes,
+        )
+    except UploadTooLargeError:
+        raise _upload_too_large(max_bytes) from None
+    except InvalidMultipartError as exc:
+        raise HTTPException(status_code=400, detail=f"Malformed multipart body: {exc}") from None
+    if spooled is None:
+        raise RequestValidationError(
+            [{"type": "missing", "loc": ("body", "file"), "msg": "Field required", "input": None}]
+        )
 
-    original_filename = file.filename or "upload"
+    return await _store_spooled(
+        request,
+        spooled,
+        kind=kind,
+        original_filename=spooled.filename or "upload",
+        content_type=spooled.content_type,
+    )
 
-    # Content-sniff validation (v090: image kind only)
-    mime_type, ext = await _sniff_content(kind, data, original_filename, file)
 
-    # Compute content hash (blocking) — also needed for dedup check before file write
-    content_hash = hashlib.sha256(data).hexdigest()
+@router.post(
+    "/uploads",
+    status_code=201,
+    responses={413: {"description": "Declared size exceeds the maximum asset size"}},
+)
+async def create_upload(body: AssetUploadCreate, request: Request) -> AssetUploadStatus:
+    """Start a resumable upload.
+
+    Send the content with ``PATCH /uploads/{upload_id}`` in one or more
+    byte ranges, then call ``POST /uploads/{upload_id}/complete``.
+    """
+    max_bytes: int = _get_settings(request).assets_max_size_bytes  # type: ignore[attr-defined]
+    if body.size_bytes is not None and body.size_bytes > max_bytes:
+        raise _upload_too_large(max_bytes)
+    store = await _get_upload_store(request)
+    session = store.create(
+        kind=body.kind,
+        filename=body.filename,
+        content_type=body.content_type,
+        size_bytes=body.size_bytes,
+    )
+    logger.info("asset.upload_started", upload_id=session.id, kind=body.kind)
+    return _upload_status(request, store, session)
 
-    # Deduplication: check existing record before touching disk
-    dedup_hit = await _check_dedup(repo, content_hash)
-    if dedup_hit is not None:
-        return dedup_hit
 
-    # Ensure assets_dir exists
-    assets_dir.mkdir(parents=True, exist_ok=True)
+@router.get(
+    "/uploads/{upload_id}",
+    responses={404: {"description": "Upload session not found or expired"}},
+)
+async def get_upload(upload_id: str, request: Request) -> AssetUploadStatus:
+    """Get the current offset of a resumable upload (to resume after a failure)."""
+    store = await _get_upload_store(request)
+    return _upload_status(request, store, _get_upload_session(store, upload_id))
 
-    # Derive safe filename from content hash
-    dest_filename = f"{content_hash}.{ext}"
 
-    # Validate path safety (defence-in-depth; hash-derived names should never escape)
+@router.patch(
+    "/uploads/{upload_id}",
+    responses={
+        404: {"description": "Upload session not found or expired"},
+        409: {"description": "Upload-Offset does not match, or another append is running"},
+        413: {"description": "Payload too large; the session is discarded"},
+    },
+)
+async def append_upload(
+    upload_id: str,
+    request: Request,
+    upload_offset: Annotated[
+        int,
+        Header(alias="Upload-Offset", ge=0, description="Offset this byte range starts at."),
+    ],
+) -> AssetUploadStatus:
+    """Append the raw request body to a resumable upload.
+
+    The body is streamed to the part file and hashed in chunks. If the
+    connection drops, bytes already written are kept: fetch the upload's
+    offset and resend from there.
+    """
+    store = await _get_upload_store(request)
+    session = _get_upload_session(store, upload_id)
+    max_bytes: int = _get_settings(request).assets_max_size_bytes  # type: ignore[attr-defined]
     try:
-        dest_path = _resolve_safe_path(assets_dir, dest_filename)
-    except ValueError as exc:
-        raise HTTPException(status_code=422, detail=str(exc)) from exc
+        await store.append(session, request.stream(), offset=upload_offset, max_bytes=max_bytes)
+    except UploadOffsetMismatchError as exc:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Upload-Offset {upload_offset} does not match current offset {exc.offset}.",
+        ) from None
+    except UploadBusyError:
+        raise HTTPException(
+            status_code=409, detail="Another append to this upload is in progress."
+        ) from None
+    except UploadTooLargeError:
+        limit = max_bytes if session.size_bytes is None else min(max_bytes, session.size_bytes)
+        raise _upload_too_large(limit) from None
+    return _upload_status(request, store, session)
 
-    # Write file via asyncio.to_thread (NFR-001: non-blocking I/O)
-    await asyncio.to_thread(_hash_and_write, data, dest_path)
 
-    asset_id = str(uuid.uuid4())
-    now = _now_iso()
-    record = AssetRecord(
-        id=asset_id,
-        original_filename=original_filename,
-        content_hash=content_hash,
-        mime_type=mime_type,
-        kind=kind,
-        size_bytes=len(data),
-        file_path=str(dest_path),
-        deleted_at=None,
-        created_at=now,
-        updated_at=now,
-    )
-    saved = await repo.insert(record)
-    logger.info(
-        "asset.uploaded",
-        asset_id=saved.id,
-        kind=kind,
-        size_bytes=saved.size_bytes,
+@router.post(
+    "/uploads/{upload_id}/complete",
+    status_code=201,
+    responses={
+        404: {"description": "Upload session not found or expired"},
+        409: {"description": "Fewer bytes received than the declared size"},
+        415: {"description": "Unsupported media type"},
+    },
+)
+async def complete_upload(upload_id: str, request: Request) -> AssetRead:
+    """Finish a resumable upload and store it as an asset.
+
+    Validation, deduplication and storage match ``POST /api/v1/assets``.
+    """
+    store = await _get_upload_store(request)
+    session = _get_upload_session(store, upload_id)
+    if session.busy:
+        raise HTTPException(status_code=409, detail="Another append to this upload is in progress.")
+    if session.size_bytes is not None and session.offset != session.size_bytes:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Received {session.offset} of {session.size_bytes} declared bytes.",
+        )
+    store.detach(upload_id)
+    spooled = SpooledUpload(path=session.path, sha256=session.sha256, size_bytes=session.offset)
+    return await _store_spooled(
+        request,
+        spooled,
+        kind=session.kind,
+        original_filename=session.filename,
+        content_type=session.content_type,
     )
-    return _to_schema(saved)
+
+
+@router.delete(
+    "/uploads/{upload_id}",
+    status_code=204,
+    responses={404: {"description": "Upload session not found or expired"}},
+)
+async def abort_upload(upload_id: str, request: Request) -> None:
+    """Abandon a resumable upload and delete its partial file."""
+    store = await _get_upload_store(request)
+    _get_upload_session(store, upload_id)
+    store.discard(upload_id)
+    logger.info("asset.upload_aborted", upload_id=upload_id)
 
 
 @router.get("")
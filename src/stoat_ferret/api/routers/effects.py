@@ -8,10 +8,10 @@ from __future__ import annotations
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.responses import FileResponse
 from prometheus_client import Counter
 
@@ -24,12 +24,20 @@ from stoat_ferret.api.schemas.effect import (
     EffectPreviewRequest,
     EffectPreviewResponse,
     EffectResponse,
+    EffectStackIssue,
+    EffectStackValidationResponse,
     EffectThumbnailRequest,
     EffectTransitionResponse,
     EffectUpdateRequest,
+    EffectValidationErrorResponse,
     ParameterSchemaResponse,
     TransitionRequest,
 )
+from stoat_ferret.api.services.discovery_cache import (
+    DiscoveryCache,
+    get_discovery_cache,
+    payload_response,
+)
 from stoat_ferret.api.services.thumbnail import ThumbnailService
 from stoat_ferret.db.clip_repository import AsyncClipRepository, AsyncSQLiteClipRepository
 from stoat_ferret.db.project_repository import (
@@ -37,7 +45,7 @@ from stoat_ferret.db.project_repository import (
     AsyncSQLiteProjectRepository,
 )
 from stoat_ferret.effects.definitions import EffectDefinition, create_default_registry
-from stoat_ferret.effects.registry import EffectRegistry
+from stoat_ferret.effects.registry import EffectRegistry, EffectValidationError
 from stoat_ferret.ffmpeg.executor import FFmpegExecutor, RealFFmpegExecutor
 from stoat_ferret_core import parameter_schemas_from_dict
 
@@ -116,6 +124,7 @@ RegistryDep = Annotated[EffectRegistry, Depends(get_effect_registry)]
 ProjectRepoDep = Annotated[AsyncProjectRepository, Depends(_get_project_repository)]
 ClipRepoDep = Annotated[AsyncClipRepository, Depends(_get_clip_repository)]
 ThumbnailDep = Annotated[ThumbnailService, Depends(_get_thumbnail_service)]
+DiscoveryCacheDep = Annotated[DiscoveryCache, Depends(get_discovery_cache)]
 
 
 def _resolve_effect_helper(
@@ -254,15 +263,44 @@ def _build_filter_helper(
         ) from None
 
 
-@router.get("/effects")
-async def list_effects(registry: RegistryDep) -> EffectListResponse:
+@router.get(
+    "/effects",
+    response_model=EffectListResponse,
+    responses={
+        304: {
+            "description": (
+                "The ``If-None-Match`` header matches the current ``ETag``: "
+                "the effect catalogue has not changed."
+            ),
+        },
+    },
+)
+async def list_effects(
+    request: Request,
+    registry: RegistryDep,
+    cache: DiscoveryCacheDep,
+) -> Response:
     """List all available effects with metadata, schemas, and previews.
 
+    The catalogue is built once per registry version and served
+    pre-serialised (gzip or Brotli when accepted) with a strong ``ETag``;
+    ``If-None-Match`` hits return 304.
+
     Returns:
         List of all registered effects with their parameter schemas,
         AI hints, filter preview strings, structured parameter list,
         AI summary, and example prompt.
     """
+    payload = cache.get(
+        "effects",
+        (id(registry), registry.version),
+        lambda: _effect_catalogue(registry).model_dump(mode="json"),
+    )
+    return payload_response(request, payload)
+
+
+def _effect_catalogue(registry: EffectRegistry) -> EffectListResponse:
+    """Build the effect catalogue served by ``GET /effects``."""
     effects = []
     for effect_type, definition in registry.list_all():
         parameters = [
@@ -894,3 +932,111 @@ async def apply_transition(
         parameters=request.parameters,
         filter_string=filter_string,
     )
+
+
+@router.post("/projects/{project_id}/effects/validate")
+async def validate_project_effects(
+    project_id: str,
+    registry: RegistryDep,
+    project_repo: ProjectRepoDep,
+    clip_repo: ClipRepoDep,
+) -> EffectStackValidationResponse:
+    """Validate every stored clip effect and transition in a project.
+
+    Re-checks each clip's effect stack and the project's transitions
+    against the current effect registry in one call, using the
+    registry's precompiled parameter validators. Invalid entries are
+    reported rather than rejected; nothing is modified.
+
+    Args:
+        project_id: The unique project identifier.
+        registry: Effect registry dependency.
+        project_repo: Project repository dependency.
+        clip_repo: Clip repository dependency.
+
+    Returns:
+        Counts of checked clips and effects, and the invalid entries.
+
+    Raises:
+        HTTPException: 404 if the project is not found.
+    """
+    project = await project_repo.get(project_id)
+    if project is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "NOT_FOUND", "message": f"Project {project_id} not found"},
+        )
+
+    clips = await clip_repo.list_by_project(project_id)
+    issues: list[EffectStackIssue] = []
+    effects_checked = 0
+    for clip in clips:
+        stack = clip.effects or []
+        effects_checked += len(stack)
+        issues.extend(
+            _stack_issue("clip", clip.id, index, effect_type, errors)
+            for index, effect_type, errors in registry.validate_stack(stack)
+        )
+
+    transitions = project.transitions or []
+    effects_checked += len(transitions)
+    issues.extend(_transition_issues(registry, transitions))
+
+    if issues:
+        logger.info(
+            "effect_stack_validation_failed",
+            project_id=project_id,
+            issue_count=len(issues),
+        )
+    return EffectStackValidationResponse(
+        project_id=project_id,
+        valid=not issues,
+        clips_checked=len(clips),
+        effects_checked=effects_checked,
+        issues=issues,
+    )
+
+
+def _transition_issues(
+    registry: EffectRegistry, transitions: list[dict[str, Any]]
+) -> list[EffectStackIssue]:
+    """Check stored transitions the way `apply_transition` checks new ones.
+
+    Transitions take scalar parameters only, so they go through
+    ``registry.validate`` rather than the automation-aware stack check.
+    """
+    issues: list[EffectStackIssue] = []
+    for index, transition in enumerate(transitions):
+        transition_type = str(transition.get("transition_type", ""))
+        if registry.get(transition_type) is None:
+            errors = [
+                EffectValidationError(
+                    path="", message=f"Unknown transition type: {transition_type}"
+                )
+            ]
+        else:
+            errors = registry.validate(transition_type, transition.get("parameters") or {})
+        if errors:
+            issues.append(
+                _stack_issue(
+                    "transition", str(transition.get("id", "")), index, transition_type, errors
+                )
+            )
+    return issues
+
+
+def _stack_issue(
+    target: Literal["clip", "transition"],
+    target_id: str,
+    index: int,
+    effect_type: str,
+    errors: list[EffectValidationError],
+) -> EffectStackIssue:
+    """Convert one invalid stack entry to its response model."""
+    return EffectStackIssue(
+        target=target,
+        target_id=target_id,
+        index=index,
+        effect_type=effect_type,
+        errors=[EffectValidationErrorResponse(path=e.path, message=e.message) for e in errors],
+    )
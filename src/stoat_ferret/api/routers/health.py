@@ -11,7 +11,7 @@ import os
 import shutil
 import subprocess
 import time
-from collections.abc import Coroutine
+from collections.abc import Awaitable
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -19,6 +19,7 @@ from typing import Any
 from fastapi import APIRouter, Request, status
 from fastapi.responses import JSONResponse
 
+from stoat_ferret.api.services.health_cache import HealthCache, ReadinessSnapshot
 from stoat_ferret.api.settings import get_settings
 from stoat_ferret.db.models import ProxyStatus
 from stoat_ferret.models.health import HealthStatus
@@ -32,9 +33,14 @@ _CACHE_DEGRADED_THRESHOLD = 90.0
 # Error literal used by _run_check for every check that exceeds its timeout.
 _CHECK_TIMEOUT_ERROR = "check timed out"
 
+# Check names in the order _collect_checks runs them. Only critical checks
+# cause HTTP 503; the rest report "degraded".
+_CRITICAL_CHECKS = ("database", "rust_core", "filesystem")
+_NON_CRITICAL_CHECKS = ("ffmpeg", "preview", "proxy", "render")
+
 
 async def _run_check(
-    check_coro: Coroutine[Any, Any, dict[str, Any]],
+    check_coro: Awaitable[dict[str, Any]],
     *,
     timeout_status: str = "error",
 ) -> dict[str, Any]:
@@ -91,6 +97,10 @@ async def readiness(request: Request) -> JSONResponse:
     filesystem). Preview, proxy, and render issues result in "degraded" (not
     "unhealthy") overall status. Only the critical checks cause HTTP 503.
 
+    Checks run concurrently and their results are cached for
+    STOAT_HEALTH_SNAPSHOT_TTL_SECONDS; an expired snapshot is still served
+    while a background refresh runs, so probes rarely wait on checks.
+
     Returns HTTP 503 with ready=false until the startup gate is open and all
     critical checks pass. Returns HTTP 200 with ready=true when ready.
 
@@ -114,54 +124,15 @@ async def readiness(request: Request) -> JSONResponse:
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
         )
 
-    checks: dict[str, dict[str, Any]] = {}
-    critical_healthy = True
-    any_degraded = False
-
-    # Database check (critical)
-    db_check = await _run_check(_check_database(request))
-    checks["database"] = db_check
-    if db_check["status"] != "ok":
-        critical_healthy = False
-
-    # Rust core check (critical)
-    rust_check = await _run_check(_check_rust_core())
-    checks["rust_core"] = rust_check
-    if rust_check["status"] != "ok":
-        critical_healthy = False
-
-    # Filesystem check (critical)
-    fs_check = await _run_check(_check_filesystem())
-    checks["filesystem"] = fs_check
-    if fs_check["status"] != "ok":
-        critical_healthy = False
-
-    # FFmpeg check (non-critical — degraded only)
-    ffmpeg_check = await _run_check(_check_ffmpeg())
-    checks["ffmpeg"] = ffmpeg_check
-    if ffmpeg_check["status"] != "ok":
-        any_degraded = True
-
-    # Preview check (non-critical — degraded only)
-    preview_check = await _run_check(_check_preview(request), timeout_status="degraded")
-    checks["preview"] = preview_check
-    if preview_check["status"] != "ok":
-        any_degraded = True
-
-    # Proxy check (non-critical — degraded only)
-    proxy_check = await _run_check(_check_proxy(request), timeout_status="degraded")
-    checks["proxy"] = proxy_check
-    if proxy_check["status"] != "ok":
-        any_degraded = True
-
-    # Render check (non-critical — degraded only, per LRN-136)
-    render_check = await _run_check(_check_render(request), timeout_status="degraded")
-    checks["render"] = render_check
-    if render_check["status"] != "ok":
-        any_degraded = True
+    cache = _get_health_cache(request)
+    snapshot = await cache.snapshot.get(lambda: _collect_checks(request, cache))
+    checks = snapshot.checks
+    critical_healthy = snapshot.critical_healthy
+    db_check = checks["database"]
+    rust_check = checks["rust_core"]
 
     is_ready = critical_healthy
-    overall, status_code = _resolve_overall_status(critical_healthy, any_degraded)
+    overall, status_code = _resolve_overall_status(critical_healthy, snapshot.any_degraded)
 
     # Extract version info from check results.
     # sqlite_version is the SQLite runtime version (e.g., "3.50.4") — distinct
@@ -189,11 +160,58 @@ async def readiness(request: Request) -> JSONResponse:
         core_version=core_version,
         ws_buffer_utilization=ws_util,
         uptime_seconds=uptime,
+        snapshot_age_seconds=round(cache.snapshot.age_seconds or 0.0, 3),
         checks=checks,
     )
     return JSONResponse(content=response_body.model_dump(), status_code=status_code)
 
 
+def _get_health_cache(request: Request) -> HealthCache:
+    """Return the app's readiness cache, creating it on first use."""
+    cache: HealthCache | None = getattr(request.app.state, "health_cache", None)
+    if cache is None:
+        settings = get_settings()
+        cache = HealthCache.create(
+            snapshot_ttl_seconds=settings.health_snapshot_ttl_seconds,
+            capability_ttl_seconds=settings.health_capability_ttl_seconds,
+        )
+        request.app.state.health_cache = cache
+    return cache
+
+
+async def _collect_checks(request: Request, cache: HealthCache) -> ReadinessSnapshot:
+    """Run every readiness check concurrently.
+
+    Database, Rust core and filesystem are critical; FFmpeg, preview, proxy
+    and render only degrade the overall status. The FFmpeg version is served
+    from the capability cache rather than spawning ``ffmpeg -version`` on
+    every run.
+
+    Args:
+        request: The FastAPI request object, used to access app state.
+        cache: The app's readiness cache.
+
+    Returns:
+        The check results and their critical/degraded rollup.
+    """
+    results = await asyncio.gather(
+        _run_check(_check_database(request)),
+        _run_check(_check_rust_core()),
+        _run_check(_check_filesystem()),
+        _run_check(cache.ffmpeg.get(_check_ffmpeg)),
+        _run_check(_check_preview(request), timeout_status="degraded"),
+        _run_check(_check_proxy(request), timeout_status="degraded"),
+        # Render is non-critical — degraded only, per LRN-136
+        _run_check(_check_render(request), timeout_status="degraded"),
+    )
+    checks = dict(zip(_CRITICAL_CHECKS + _NON_CRITICAL_CHECKS, results, strict=True))
+    return ReadinessSnapshot(
+        checks=checks,
+        critical_healthy=all(checks[name]["status"] == "ok" for name in _CRITICAL_CHECKS),
+        any_degraded=any(checks[name]["status"] != "ok" for name in _NON_CRITICAL_CHECKS),
+    )
+
+
 async def _check_database(request: Request) -> dict[str, Any]:
     """Check database connectivity and retrieve the SQLite version.
 
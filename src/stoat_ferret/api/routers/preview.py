@@ -13,9 +13,10 @@ from __future__ import annotations
 
 import shutil
 from pathlib import Path
+from typing import Annotated
 
 import structlog
-from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 from stoat_ferret.api.schemas.preview import (
     PreviewCacheClearResponse,
@@ -27,6 +28,11 @@ from stoat_ferret.api.schemas.preview import (
     PreviewStatusResponse,
     PreviewStopResponse,
 )
+from stoat_ferret.api.services.file_serving import (
+    REVALIDATE_CACHE_CONTROL,
+    file_version,
+    serve_file,
+)
 from stoat_ferret.db.clip_repository import AsyncClipRepository, AsyncSQLiteClipRepository
 from stoat_ferret.db.models import PreviewQuality
 from stoat_ferret.db.project_repository import (
@@ -476,7 +482,7 @@ async def get_manifest(
             detail={"code": "NOT_FOUND", "message": "Manifest file not found on disk"},
         )
 
-    content = manifest_file.read_text()
+    content = _version_segment_uris(manifest_file.read_text(), manifest_file.parent)
     # media_type is a hardcoded HLS manifest MIME type (not attacker-influenced)
     # and X-Content-Type-Options: nosniff prevents browser MIME-sniffing, so the reflected
     # content cannot be interpreted as executable script by any browser (S5131 accepted
@@ -484,10 +490,30 @@ async def get_manifest(
     return Response(  # NOSONAR
         content=content,
         media_type=HLS_MANIFEST_CONTENT_TYPE,
-        headers={"X-Content-Type-Options": "nosniff"},
+        headers={"X-Content-Type-Options": "nosniff", "Cache-Control": REVALIDATE_CACHE_CONTROL},
     )
 
 
+def _version_segment_uris(manifest: str, session_dir: Path) -> str:
+    """Append ``?v=<file_version>`` to each segment URI present on disk.
+
+    A seek regenerates segments under the same names, so the plain URI does
+    not identify the content. The versioned URI does, which lets
+    `get_segment` mark it immutable.
+    """
+    lines = manifest.splitlines(keepends=True)
+    for i, line in enumerate(lines):
+        uri = line.strip()
+        if not uri or uri.startswith("#") or "/" in uri or "?" in uri:
+            continue
+        try:
+            version = file_version((session_dir / uri).stat())
+        except OSError:
+            continue
+        lines[i] = line.replace(uri, f"{uri}?v={version}", 1)
+    return "".join(lines)
+
+
 @router.get(
     "/preview/{session_id}/segment_{index}.ts",
 )
@@ -495,13 +521,26 @@ async def get_segment(
     session_id: str,
     index: int,
     request: Request,
+    v: Annotated[
+        str | None,
+        Query(
+            description=(
+                "Segment version from the manifest. When it matches the file on disk "
+                "the response is cacheable as immutable."
+            ),
+        ),
+    ] = None,
 ) -> Response:
     """Serve an HLS segment file for a preview session.
 
+    The segment is streamed from disk with ``Range`` support and a strong
+    file-identity ``ETag``; ``If-None-Match`` hits return 304.
+
     Args:
         session_id: The preview session ID.
         index: The segment index number.
         request: The FastAPI request object.
+        v: Segment version token written into the manifest URI.
 
     Returns:
         MPEG-TS segment with Content-Type video/MP2T.
@@ -538,13 +577,16 @@ async def get_segment(
             },
         )
 
-    content = segment_file.read_bytes()
+    segment_stat = segment_file.stat()
     # media_type is a hardcoded MPEG-TS MIME type (not attacker-influenced) and
     # X-Content-Type-Options: nosniff prevents browser MIME-sniffing, so the reflected
     # content cannot be interpreted as executable script by any browser (S5131 accepted
     # risk, BL-636).
-    return Response(  # NOSONAR
-        content=content,
+    return serve_file(  # NOSONAR
+        request,
+        segment_file,
         media_type=HLS_SEGMENT_CONTENT_TYPE,
+        immutable=v is not None and v == file_version(segment_stat),
         headers={"X-Content-Type-Options": "nosniff"},
+        stat_result=segment_stat,
     )
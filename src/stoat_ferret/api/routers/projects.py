@@ -34,6 +34,7 @@ from stoat_ferret.db.project_repository import (
     AsyncProjectRepository,
     AsyncSQLiteProjectRepository,
 )
+from stoat_ferret.render.fragment_cache import ClipFragmentCache
 
 router = APIRouter(prefix="/api/v1/projects", tags=["projects"])
 
@@ -659,6 +660,11 @@ async def delete_clip(
         )
 
     await clip_repo.delete(clip_id)
+    fragment_cache: ClipFragmentCache | None = getattr(
+        request.app.state, "clip_fragment_cache", None
+    )
+    if fragment_cache is not None:
+        fragment_cache.invalidate(clip_id)
     ws_manager: ConnectionManager | None = getattr(request.app.state, "ws_manager", None)
     if ws_manager is not None:
         await ws_manager.broadcast(
@@ -13,6 +13,7 @@ and JSON:API-style error responses.
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import os
 import re
@@ -20,13 +21,14 @@ import shutil
 import subprocess
 import uuid
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Annotated, Any
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import Response
+from pydantic import ValidationError
 
 from stoat_ferret.api.routers.projects import ClipRepoDep, ProjectRepoDep
 from stoat_ferret.api.schemas.render import (
@@ -37,10 +39,14 @@ from stoat_ferret.api.schemas.render import (
     FormatInfo,
     FormatListResponse,
     QualityPresetInfo,
+    QueueJobForecast,
     QueueStatusResponse,
     RenderJobEvidenceResponse,
     RenderJobResponse,
     RenderListResponse,
+    RenderOutputResponse,
+    RenderOutputSpec,
+    RenderPlanSettings,
     RenderPreviewRequest,
     RenderPreviewResponse,
 )
@@ -53,6 +59,7 @@ from stoat_ferret.render.encoder_cache import (
     EncoderCacheEntry,
 )
 from stoat_ferret.render.models import OutputFormat, QualityPreset, RenderJob, RenderStatus
+from stoat_ferret.render.multi_output import assign_output_paths, plan_outputs
 from stoat_ferret.render.queue import RenderQueue
 from stoat_ferret.render.render_repository import (
     AsyncRenderRepository,
@@ -232,6 +239,15 @@ def _job_to_response(job: RenderJob) -> RenderJobResponse:
         updated_at=job.updated_at,
         completed_at=job.completed_at,
         partial_file_detected=job.partial_file_detected,
+        outputs=[
+            RenderOutputResponse(
+                name=spec.name,
+                output_path=spec.output_path or "",
+                output_format=spec.output_format,
+                progress=job.progress,
+            )
+            for spec in plan_outputs(job.render_plan)
+        ],
     )
 
 
@@ -300,6 +316,33 @@ def _validate_and_translate_plan(
     return output_format, quality_preset, plan_data, render_plan_json
 
 
+def _validate_render_outputs(plan_data: dict[str, Any]) -> list[RenderOutputSpec]:
+    """Validate the extra deliverables in ``settings.outputs``.
+
+    Args:
+        plan_data: Parsed render plan.
+
+    Returns:
+        The validated output specs (empty when the plan declares none).
+
+    Raises:
+        HTTPException: 422 if an output spec is invalid or names repeat.
+    """
+    raw = plan_data["settings"].get("outputs")
+    if not raw:
+        return []
+    try:
+        return RenderPlanSettings.model_validate({"outputs": raw}).outputs
+    except ValidationError as err:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail={
+                "code": "INVALID_RENDER_OUTPUTS",
+                "message": "; ".join(e["msg"] for e in err.errors()),
+            },
+        ) from err
+
+
 def _validate_encoder_compatibility(output_format_value: str, encoder: str | None) -> None:
     """Validate encoder is compatible with the chosen output format.
 
@@ -573,13 +616,15 @@ async def create_render_job(
         Created render job with 201 status.
 
     Raises:
-        HTTPException: 400 for invalid format/preset/plan, 422 for pre-flight failure.
+        HTTPException: 400 for invalid format/preset/plan, 422 for invalid outputs
+            or pre-flight failure.
     """
     settings = get_settings()
 
     output_format, quality_preset, plan_data, render_plan_json = _validate_and_translate_plan(body)
 
     _validate_encoder_compatibility(body.output_format, body.encoder)
+    outputs = _validate_render_outputs(plan_data)
 
     project_id_str = str(body.project_id)
 
@@ -626,6 +671,12 @@ async def create_render_job(
     output_path = str(
         Path(settings.render_output_dir) / f"{project_id_str}_{job_token}.{output_format.value}"
     )
+    # Extra deliverables are written next to the primary output
+    if outputs:
+        plan_data["settings"]["outputs"] = [
+            spec.model_dump(mode="json") for spec in assign_output_paths(outputs, output_path)
+        ]
+        render_plan_json = json.dumps(plan_data)
 
     try:
         job = await render_service.submit_job(
@@ -893,6 +944,9 @@ async def get_output_formats() -> FormatListResponse:
 # native extension (mirrors the pattern in _detect_encoders_sync).
 _QUALITY_PRESET_NAMES = ("draft", "standard", "high")
 
+# Distinct (format, quality, encoder) preview commands kept
+_PREVIEW_CACHE_SIZE = 128
+
 
 @router.post("/render/preview")
 def render_preview(body: RenderPreviewRequest) -> RenderPreviewResponse:
@@ -912,18 +966,6 @@ def render_preview(body: RenderPreviewRequest) -> RenderPreviewResponse:
     Raises:
         HTTPException: 422 if settings are invalid.
     """
-    from stoat_ferret_core import (
-        EncoderInfo,
-        EncoderType,
-        RenderSegment,
-        RenderSettings,
-        build_render_command,
-        validate_render_settings,
-    )
-    from stoat_ferret_core._core import (
-        QualityPreset as CoreQualityPreset,
-    )
-
     # Validate quality_preset value
     if body.quality_preset not in _QUALITY_PRESET_NAMES:
         raise HTTPException(
@@ -974,12 +1016,40 @@ def render_preview(body: RenderPreviewRequest) -> RenderPreviewResponse:
                 },
             )
 
+    return RenderPreviewResponse(
+        command=_preview_command(body.output_format, body.quality_preset, body.encoder)
+    )
+
+
+@functools.lru_cache(maxsize=_PREVIEW_CACHE_SIZE)
+def _preview_command(output_format: str, quality_preset: str, encoder: str) -> str:
+    """Build the preview command for one settings combination.
+
+    The command depends only on the three settings, and clients re-request
+    the same few combinations as users change options, so results are
+    memoized. Rejected settings raise and are not cached.
+
+    Raises:
+        HTTPException: 422 if Rust rejects the render settings.
+    """
+    from stoat_ferret_core import (
+        EncoderInfo,
+        EncoderType,
+        RenderSegment,
+        RenderSettings,
+        build_render_command,
+        validate_render_settings,
+    )
+    from stoat_ferret_core._core import (
+        QualityPreset as CoreQualityPreset,
+    )
+
     # Build RenderSettings with placeholder resolution/fps for validation
     settings = RenderSettings(
-        output_format=body.output_format,
+        output_format=output_format,
         width=1920,
         height=1080,
-        codec=body.encoder,
+        codec=encoder,
         quality_preset="medium",
         fps=30.0,
     )
@@ -1001,7 +1071,7 @@ def render_preview(body: RenderPreviewRequest) -> RenderPreviewResponse:
         "standard": CoreQualityPreset.Standard,
         "high": CoreQualityPreset.High,
     }
-    quality = quality_map[body.quality_preset]
+    quality = quality_map[quality_preset]
 
     # Placeholder segment: 10 s, 1920×1080, 300 frames @ 30 fps
     segment = RenderSegment(
@@ -1013,11 +1083,11 @@ def render_preview(body: RenderPreviewRequest) -> RenderPreviewResponse:
     )
 
     encoder_info = EncoderInfo(
-        name=body.encoder,
-        codec=body.encoder,
+        name=encoder,
+        codec=encoder,
         is_hardware=False,
         encoder_type=EncoderType.Software,
-        description=f"Software encoder {body.encoder}",
+        description=f"Software encoder {encoder}",
     )
 
     cmd = build_render_command(
@@ -1026,11 +1096,11 @@ def render_preview(body: RenderPreviewRequest) -> RenderPreviewResponse:
         quality,
         settings,
         "/tmp/input.mp4",
-        f"/tmp/output.{body.output_format}",
+        f"/tmp/output.{output_format}",
         None,
     )
 
-    return RenderPreviewResponse(command="ffmpeg " + " ".join(cmd.args()))
+    return "ffmpeg " + " ".join(cmd.args())
 
 
 # ---------- Queue status ----------
@@ -1040,19 +1110,23 @@ def render_preview(body: RenderPreviewRequest) -> RenderPreviewResponse:
 async def get_queue_status(
     queue: RenderQueueDep,
     repo: RenderRepoDep,
+    render_service: RenderServiceDep,
 ) -> QueueStatusResponse:
     """Return current render queue status with capacity, disk space, and throughput.
 
     Aggregates live queue counts from RenderQueue, disk space from the
-    render output directory, and today's completed/failed job counts
-    from the repository. Read-only — no state mutations (NFR-001).
+    render output directory, today's completed/failed job counts from the
+    repository, and the render service's start/finish forecast for every
+    running and queued job. Read-only — no state mutations (NFR-001).
 
     Args:
         queue: Render queue dependency.
         repo: Render repository dependency.
+        render_service: Render service dependency (queue forecast).
 
     Returns:
-        Queue status with active/pending counts, capacity, disk, and throughput.
+        Queue status with active/pending counts, capacity, disk, throughput,
+        and per-job forecasts.
     """
     settings = get_settings()
 
@@ -1077,6 +1151,21 @@ async def get_queue_status(
         1 for j in failed_jobs if j.completed_at is not None and j.completed_at >= midnight
     )
 
+    now = datetime.now(timezone.utc)
+    forecast = [
+        QueueJobForecast(
+            job_id=f.job_id,
+            status=f.status,
+            predicted_seconds=f.predicted_seconds,
+            starts_in_seconds=f.starts_in_seconds,
+            finishes_in_seconds=f.finishes_in_seconds,
+            starts_at=now + timedelta(seconds=f.starts_in_seconds),
+            finishes_at=now + timedelta(seconds=f.finishes_in_seconds),
+            basis=f.basis,
+        )
+        for f in await render_service.forecast_queue()
+    ]
+
     return QueueStatusResponse(
         active_count=active_count,
         pending_count=pending_count,
@@ -1086,6 +1175,7 @@ async def get_queue_status(
         disk_total_bytes=usage.total,
         completed_today=completed_today,
         failed_today=failed_today,
+        forecast=forecast,
     )
 
 
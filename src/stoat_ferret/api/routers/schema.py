@@ -8,14 +8,17 @@ primary domain entities — ``project``, ``clip``, ``timeline``, ``render_job``,
 ``effect``, ``video`` — without having to parse the full OpenAPI document.
 Each resource maps to a concrete Pydantic response model; the endpoint returns
 that model's ``model_json_schema()`` verbatim. Unknown resources return 404.
+
+Schemas are fixed for the life of the process, so each is serialised once
+and served from the discovery cache with a strong ``ETag``.
 """
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Annotated, Any
 
 import structlog
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel
 
 from stoat_ferret.api.schemas.clip import ClipResponse
@@ -24,6 +27,11 @@ from stoat_ferret.api.schemas.project import ProjectResponse
 from stoat_ferret.api.schemas.render import RenderJobResponse
 from stoat_ferret.api.schemas.timeline import TimelineResponse
 from stoat_ferret.api.schemas.video import VideoResponse
+from stoat_ferret.api.services.discovery_cache import (
+    DiscoveryCache,
+    get_discovery_cache,
+    payload_response,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -41,6 +49,7 @@ _RESOURCE_MODELS: dict[str, type[BaseModel]] = {
 
 @router.get(
     "/schema/{resource}",
+    response_model=dict[str, Any],
     responses={
         200: {
             "description": (
@@ -61,6 +70,9 @@ _RESOURCE_MODELS: dict[str, type[BaseModel]] = {
                 },
             },
         },
+        304: {
+            "description": ("The ``If-None-Match`` header matches the schema's ``ETag``."),
+        },
         404: {
             "description": (
                 "``resource`` is not one of ``project``, ``clip``, "
@@ -76,19 +88,26 @@ _RESOURCE_MODELS: dict[str, type[BaseModel]] = {
         },
     },
 )
-async def get_resource_schema(resource: str) -> dict[str, Any]:
+async def get_resource_schema(
+    resource: str,
+    request: Request,
+    cache: Annotated[DiscoveryCache, Depends(get_discovery_cache)],
+) -> Response:
     """Return the Pydantic JSON Schema for a domain resource.
 
     The schema is generated directly from the Pydantic response model's
-    ``model_json_schema()`` method — no custom serialization. Pydantic V2
-    caches the result after the first call, so repeated lookups are cheap.
+    ``model_json_schema()`` method — no custom serialization. It is
+    serialised once per process and served with a strong ``ETag`` (gzip
+    or Brotli when accepted); ``If-None-Match`` hits return 304.
 
     Args:
         resource: One of ``project``, ``clip``, ``timeline``, ``render_job``,
             ``effect``, ``video``. Any other value returns 404.
+        request: The incoming request (``Accept-Encoding``, ``If-None-Match``).
+        cache: Discovery payload cache.
 
     Returns:
-        The JSON Schema dict for the requested resource.
+        The JSON Schema for the requested resource.
 
     Raises:
         HTTPException: 404 when ``resource`` is not a supported name.
@@ -100,4 +119,5 @@ async def get_resource_schema(resource: str) -> dict[str, Any]:
             status_code=404,
             detail=f"Unknown resource: {resource}",
         )
-    return model.model_json_schema()
+    payload = cache.get(f"schema:{resource}", None, model.model_json_schema)
+    return payload_response(request, payload)
@@ -3,125 +3,121 @@
 
 """System state snapshot endpoint (BL-275).
 
-Exposes ``GET /api/v1/system/state`` — a single-pass aggregate of the
-in-memory job queue, render repository, and WebSocket connection manager.
-The endpoint is read-only, issues async SQLite reads from render_repository
-for RUNNING/QUEUED render jobs only (INV-SNAP-1 updated), and preserves
-the path expected by the synthetic monitoring probe (INV-SNAP-2).
+Exposes ``GET /api/v1/system/state`` — an aggregate of the in-memory job
+queue, active render jobs, and WebSocket connection manager, served from
+the incrementally maintained `SystemStateTracker` (INV-SNAP-1: render jobs
+come from repository change events, not per-request SQLite reads). The
+endpoint is read-only and preserves the path expected by the synthetic
+monitoring probe (INV-SNAP-2).
+
+Polling clients can avoid re-downloading an unchanged snapshot with
+``If-None-Match`` (304) or block until the next change with
+``wait_for_version``.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from typing import Annotated
 
 import structlog
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Query, Request, Response, status
 
 from stoat_ferret.api.middleware.metrics import stoat_system_state_duration_seconds
-from stoat_ferret.api.schemas.system_state import JobSummary, SystemState
-from stoat_ferret.render.models import RenderStatus
+from stoat_ferret.api.schemas.system_state import SystemState
+from stoat_ferret.api.services.system_state import SystemStateTracker
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1/system", tags=["system"])
 
 
-def _compute_uptime_seconds(app_state: object) -> float:
-    """Return seconds elapsed since the startup gate opened.
-
-    Uses ``app.state._startup_timestamp`` (an ISO8601 string set by the
-    lifespan once all subsystems are ready). Returns ``0.0`` before the
-    startup gate opens so the response schema (``uptime_seconds: float``)
-    stays populated even during boot races.
-    """
-    startup_ts = getattr(app_state, "_startup_timestamp", None)
-    if not startup_ts:
-        return 0.0
-    try:
-        started = datetime.fromisoformat(startup_ts)
-    except (TypeError, ValueError):
-        return 0.0
-    if started.tzinfo is None:
-        started = started.replace(tzinfo=timezone.utc)
-    now = datetime.now(timezone.utc)
-    return max(0.0, (now - started).total_seconds())
-
-
-@router.get("/state")
-async def get_system_state(request: Request) -> SystemState:
+def _get_tracker(request: Request) -> SystemStateTracker:
+    """Return the app's system state tracker, creating it on first use."""
+    tracker = getattr(request.app.state, "system_state_tracker", None)
+    if tracker is None:
+        tracker = SystemStateTracker(request.app.state)
+        request.app.state.system_state_tracker = tracker
+    return tracker
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against ``etag``."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+@router.get(
+    "/state",
+    response_model=SystemState,
+    responses={
+        304: {
+            "description": (
+                "The ``If-None-Match`` header matches the current ``ETag``: "
+                "neither ``active_jobs`` nor ``active_connections`` changed "
+                "(after waiting, when ``wait_for_version`` was supplied)."
+            ),
+        },
+    },
+)
+async def get_system_state(
+    request: Request,
+    response: Response,
+    wait_for_version: Annotated[
+        int | None,
+        Query(
+            ge=0,
+            description=(
+                "Long-poll: when the current ``version`` equals this value, "
+                "block until it changes or ``timeout`` expires. Any other "
+                "value returns immediately."
+            ),
+        ),
+    ] = None,
+    timeout: Annotated[  # NOSONAR S7483 — FastAPI Query param, not asyncio timeout (BL-776)
+        float,
+        Query(
+            ge=0.0,
+            le=300.0,
+            description=(
+                "Maximum seconds to wait when ``wait_for_version`` is set. On "
+                "expiry the unchanged state (or 304) is returned."
+            ),
+        ),
+    ] = 30.0,
+) -> SystemState | Response:
     """Return aggregate in-memory system state.
 
-    Performs a single-pass scan over the job queue, WebSocket
-    connection manager, and render repository (INV-SNAP-1 updated:
-    includes async SQLite reads for RUNNING/QUEUED render jobs).
-    Missing or transiently-broken subsystems are reported as empty
-    collections rather than raising (NFR-003): the snapshot is
-    best-effort.
+    Generic queue jobs and WebSocket connections are read from memory on
+    each call; render jobs come from the tracker's incrementally updated
+    view, seeded once from ``render_repository``. Missing or
+    transiently-broken subsystems are reported as empty collections rather
+    than raising (NFR-003): the snapshot is best-effort.
+
+    Every response carries a weak ``ETag`` derived from the tracker
+    ``version``; ``timestamp`` and ``uptime_seconds`` are not part of it.
 
     Args:
         request: FastAPI request, used to reach ``app.state``.
+        response: Outgoing response, used to set the ``ETag`` header.
+        wait_for_version: Version the caller already has; enables long-poll.
+        timeout: Long-poll deadline in seconds.
 
     Returns:
         ``SystemState`` describing active jobs, open WebSocket
-        connections, and process uptime.
+        connections, process uptime and the change ``version``, or an
+        empty 304 response when ``If-None-Match`` matches.
     """
+    tracker = _get_tracker(request)
+    if wait_for_version is not None:
+        await tracker.wait_for_change(wait_for_version, timeout)
+
     with stoat_system_state_duration_seconds.time():
-        return await _build_system_state(request)
-
-
-async def _build_system_state(request: Request) -> SystemState:
-    """Inner helper kept separate so the histogram timer wraps it cleanly."""
-    app_state = request.app.state
-
-    active_jobs: list[JobSummary] = []
-    job_queue = getattr(app_state, "job_queue", None)
-    if job_queue is not None:
-        try:
-            for snap in job_queue.list_jobs():
-                active_jobs.append(
-                    JobSummary(
-                        job_id=snap.job_id,
-                        job_type=snap.job_type,
-                        status=snap.status.value,
-                        progress=snap.progress,
-                        submitted_at=snap.submitted_at,
-                    )
-                )
-        except Exception as exc:
-            # NFR-003: graceful partial state — log and return empty
-            # jobs list rather than surfacing a 500 when the queue is
-            # momentarily unavailable.
-            logger.warning("system_state.job_queue_unavailable", error=str(exc))
-
-    render_repo = getattr(app_state, "render_repository", None)
-    if render_repo is not None:
-        try:
-            running_render = await render_repo.list_by_status(RenderStatus.RUNNING)
-            queued_render = await render_repo.list_by_status(RenderStatus.QUEUED)
-            for render_job in running_render + queued_render:
-                active_jobs.append(
-                    JobSummary(
-                        job_id=render_job.id,
-                        job_type="render",
-                        status=render_job.status.value,
-                        progress=render_job.progress,
-                        submitted_at=render_job.created_at,
-                    )
-                )
-        except Exception as exc:
-            logger.warning("system_state.render_repository_unavailable", error=str(exc))
-
-    active_connections = 0
-    ws_manager = getattr(app_state, "ws_manager", None)
-    if ws_manager is not None:
-        try:
-            active_connections = int(ws_manager.active_connections)
-        except Exception as exc:
-            logger.warning("system_state.ws_manager_unavailable", error=str(exc))
-
-    return SystemState(
-        timestamp=datetime.now(timezone.utc),
-        active_jobs=active_jobs,
-        active_connections=active_connections,
-        uptime_seconds=_compute_uptime_seconds(app_state),
-    )
+        state = await tracker.snapshot()
+
+    etag = tracker.etag
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return state
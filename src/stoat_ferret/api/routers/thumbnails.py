@@ -14,14 +14,14 @@ from pathlib import Path
 from typing import Annotated
 
 import structlog
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
 
 from stoat_ferret.api.schemas.thumbnail import (
     ThumbnailStripGenerateRequest,
     ThumbnailStripGenerateResponse,
     ThumbnailStripMetadataResponse,
 )
+from stoat_ferret.api.services.file_serving import serve_file
 from stoat_ferret.api.services.thumbnail import ThumbnailService
 from stoat_ferret.db.async_repository import (
     AsyncSQLiteVideoRepository,
@@ -178,16 +178,18 @@ async def get_strip_metadata(
 @router.get("/videos/{video_id}/thumbnails/strip.jpg")
 async def get_strip_image(
     video_id: str,
+    request: Request,
     thumbnail_service: ThumbnailServiceDep,
-) -> FileResponse:
+) -> Response:
     """Serve the thumbnail strip sprite sheet as a JPEG image.
 
     Args:
         video_id: The source video ID.
+        request: The FastAPI request object.
         thumbnail_service: Thumbnail service dependency.
 
     Returns:
-        JPEG image response.
+        JPEG image response (streamed, with ETag revalidation).
 
     Raises:
         HTTPException: 404 if no strip exists or file not ready.
@@ -212,4 +214,4 @@ async def get_strip_image(
             },
         )
 
-    return FileResponse(str(file_path), media_type="image/jpeg")
+    return serve_file(request, file_path, media_type="image/jpeg")
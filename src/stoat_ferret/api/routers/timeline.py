@@ -12,8 +12,20 @@ from typing import Annotated, Any
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
+from stoat_ferret.api.routers.effects import (
+    _build_filter_helper,
+    _resolve_effect_helper,
+    _validate_params_helper,
+    get_effect_registry,
+)
 from stoat_ferret.api.schemas.timeline import (
     AdjustedClipPosition,
+    BatchAddClip,
+    BatchRemoveClip,
+    BatchRemoveEffect,
+    BatchUpdateClip,
+    TimelineBatchOperation,
+    TimelineBatchRequest,
     TimelineClipCreate,
     TimelineClipResponse,
     TimelineClipUpdate,
@@ -26,7 +38,7 @@ from stoat_ferret.api.schemas.timeline import (
 from stoat_ferret.api.websocket.events import EventType, build_event
 from stoat_ferret.api.websocket.manager import ConnectionManager
 from stoat_ferret.db.clip_repository import AsyncClipRepository, AsyncSQLiteClipRepository
-from stoat_ferret.db.models import Track
+from stoat_ferret.db.models import Clip, Track
 from stoat_ferret.db.project_repository import (
     AsyncProjectRepository,
     AsyncSQLiteProjectRepository,
@@ -35,6 +47,7 @@ from stoat_ferret.db.timeline_repository import (
     AsyncSQLiteTimelineRepository,
     AsyncTimelineRepository,
 )
+from stoat_ferret.effects.registry import EffectRegistry
 
 logger = structlog.get_logger(__name__)
 
@@ -98,6 +111,7 @@ def get_clip_repository(request: Request) -> AsyncClipRepository:
 TimelineRepoDep = Annotated[AsyncTimelineRepository, Depends(get_timeline_repository)]
 ProjectRepoDep = Annotated[AsyncProjectRepository, Depends(get_project_repository)]
 ClipRepoDep = Annotated[AsyncClipRepository, Depends(get_clip_repository)]
+RegistryDep = Annotated[EffectRegistry, Depends(get_effect_registry)]
 
 
 # ---------------------------------------------------------------------------
@@ -180,9 +194,20 @@ async def _get_clips_by_track(
     Returns:
         Dict mapping track_id to sorted list of TimelineClipResponse.
     """
-    all_clips = await clip_repo.list_by_project(project_id)
+    return _group_clips_by_track(await clip_repo.list_by_project(project_id))
+
+
+def _group_clips_by_track(clips: list[Clip]) -> dict[str, list[TimelineClipResponse]]:
+    """Group placed clips by track_id.
+
+    Args:
+        clips: Clips of a single project.
+
+    Returns:
+        Dict mapping track_id to sorted list of TimelineClipResponse.
+    """
     result: dict[str, list[TimelineClipResponse]] = {}
-    for clip in all_clips:
+    for clip in clips:
         if clip.track_id is None:
             continue
         resp = TimelineClipResponse(
@@ -241,15 +266,9 @@ async def put_timeline(
             detail={"code": "NOT_FOUND", "message": f"Project {project_id} not found"},
         )
 
-    # Delete existing tracks
-    existing_tracks = await timeline_repo.get_tracks_by_project(project_id)
-    for track in existing_tracks:
-        await timeline_repo.delete_track(track.id)
-
     # Create new tracks with auto-assigned z_index where needed
-    new_tracks: list[Track] = []
-    for i, td in enumerate(tracks_data):
-        track = Track(
+    new_tracks = [
+        Track(
             id=Track.new_id(),
             project_id=project_id,
             track_type=td.track_type,
@@ -261,8 +280,10 @@ async def put_timeline(
             volume_envelope=td.volume_envelope,
             weight=td.weight,
         )
-        await timeline_repo.create_track(track)
-        new_tracks.append(track)
+        for i, td in enumerate(tracks_data)
+    ]
+    # Existing tracks are deleted and the new ones inserted in one transaction
+    await timeline_repo.replace_tracks(project_id, new_tracks)
 
     clips_by_track = await _get_clips_by_track(clip_repo, project_id)
     response = _build_timeline_response(project_id, new_tracks, clips_by_track)
@@ -562,6 +583,181 @@ async def remove_timeline_clip(
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
+# ---------------------------------------------------------------------------
+# POST /projects/{project_id}/timeline/batch
+# ---------------------------------------------------------------------------
+
+
+def _batch_error(status_code: int, code: str, message: str) -> HTTPException:
+    return HTTPException(status_code=status_code, detail={"code": code, "message": message})
+
+
+def _apply_batch_operation(
+    op: TimelineBatchOperation,
+    clips: dict[str, Clip],
+    track_ids: set[str],
+    registry: EffectRegistry,
+) -> Clip:
+    """Apply one batch operation to the in-memory working copy.
+
+    Args:
+        op: The operation to apply.
+        clips: Working copy of the project's clips, keyed by ID.
+        track_ids: IDs of the project's tracks.
+        registry: Effect registry for effect parameter validation.
+
+    Returns:
+        The clip the operation modified.
+
+    Raises:
+        HTTPException: With the same codes as the single-operation endpoints.
+    """
+    clip = clips.get(op.clip_id)
+    if clip is None:
+        raise _batch_error(status.HTTP_404_NOT_FOUND, "NOT_FOUND", f"Clip {op.clip_id} not found")
+
+    if isinstance(op, BatchAddClip | BatchUpdateClip):
+        if op.track_id is not None and op.track_id not in track_ids:
+            raise _batch_error(
+                status.HTTP_404_NOT_FOUND, "TRACK_NOT_FOUND", f"Track {op.track_id} not found"
+            )
+        if isinstance(op, BatchAddClip):
+            if clip.track_id is not None:
+                raise _batch_error(
+                    status.HTTP_409_CONFLICT,
+                    "CLIP_ALREADY_PLACED",
+                    f"Clip {op.clip_id} is already placed on track {clip.track_id}",
+                )
+            clip.track_id = op.track_id
+            clip.timeline_start = op.timeline_start
+            clip.timeline_end = op.timeline_end
+        else:
+            if op.track_id is not None:
+                clip.track_id = op.track_id
+            if op.timeline_start is not None:
+                clip.timeline_start = op.timeline_start
+            if op.timeline_end is not None:
+                clip.timeline_end = op.timeline_end
+        if (
+            clip.timeline_start is not None
+            and clip.timeline_end is not None
+            and clip.timeline_start >= clip.timeline_end
+        ):
+            raise _batch_error(
+                status.HTTP_422_UNPROCESSABLE_CONTENT,
+                "INVALID_POSITION",
+                "timeline_start must be less than timeline_end",
+            )
+        return clip
+
+    if isinstance(op, BatchRemoveClip):
+        clip.track_id = None
+        clip.timeline_start = None
+        clip.timeline_end = None
+        return clip
+
+    effects = clip.effects or []
+    if op.index >= len(effects):
+        raise _batch_error(
+            status.HTTP_404_NOT_FOUND,
+            "NOT_FOUND",
+            f"Effect index {op.index} out of range (0..{len(effects) - 1})",
+        )
+    if isinstance(op, BatchRemoveEffect):
+        effects.pop(op.index)
+        return clip
+
+    effect_type = effects[op.index]["effect_type"]
+    definition = _resolve_effect_helper(registry, effect_type)
+    compiled_expression = _validate_params_helper(registry, effect_type, op.parameters)
+    filter_string = _build_filter_helper(
+        registry, definition, effect_type, op.parameters, compiled_expression
+    )
+    effects[op.index] = {
+        **effects[op.index],
+        "parameters": op.parameters,
+        "filter_string": filter_string,
+    }
+    return clip
+
+
+@router.post("/{project_id}/timeline/batch")
+async def batch_timeline(
+    project_id: str,
+    batch: TimelineBatchRequest,
+    request: Request,
+    registry: RegistryDep,
+    project_repo: ProjectRepoDep,
+    timeline_repo: TimelineRepoDep,
+    clip_repo: ClipRepoDep,
+) -> TimelineResponse:
+    """Apply a list of timeline operations atomically.
+
+    Operations are validated in order against a working copy of the
+    project's clips, so later operations see the effect of earlier ones.
+    Nothing is written unless every operation succeeds; the modified clips
+    are then persisted in a single transaction.
+
+    Args:
+        project_id: The unique project identifier.
+        batch: The operations to apply.
+        request: The FastAPI request object.
+        registry: Effect registry dependency.
+        project_repo: Project repository dependency.
+        timeline_repo: Timeline repository dependency.
+        clip_repo: Clip repository dependency.
+
+    Returns:
+        Full timeline response after the batch is applied.
+
+    Raises:
+        HTTPException: 404 if the project is not found. Errors from an
+            operation use the same status and code as the equivalent
+            single-operation endpoint, with ``operation_index`` added to
+            the detail.
+    """
+    project = await project_repo.get(project_id)
+    if project is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "NOT_FOUND", "message": f"Project {project_id} not found"},
+        )
+
+    tracks = await timeline_repo.get_tracks_by_project(project_id)
+    track_ids = {track.id for track in tracks}
+    clips = {clip.id: clip for clip in await clip_repo.list_by_project(project_id)}
+
+    touched: dict[str, Clip] = {}
+    for i, op in enumerate(batch.operations):
+        try:
+            clip = _apply_batch_operation(op, clips, track_ids, registry)
+        except HTTPException as exc:
+            detail: dict[str, Any] = (
+                dict(exc.detail) if isinstance(exc.detail, dict) else {"message": exc.detail}
+            )
+            detail["operation_index"] = i
+            raise HTTPException(status_code=exc.status_code, detail=detail) from None
+        touched[clip.id] = clip
+
+    now = datetime.now(timezone.utc)
+    for clip in touched.values():
+        clip.updated_at = now
+    await clip_repo.update_many(list(touched.values()))
+
+    logger.info(
+        "timeline_batch_applied",
+        project_id=project_id,
+        operation_count=len(batch.operations),
+        clip_count=len(touched),
+    )
+    await _broadcast(
+        request,
+        EventType.TIMELINE_UPDATED,
+        {"project_id": project_id, "clip_ids": list(touched)},
+    )
+    return _build_timeline_response(project_id, tracks, _group_clips_by_track(list(clips.values())))
+
+
 # ---------------------------------------------------------------------------
 # POST /projects/{project_id}/timeline/transitions
 # ---------------------------------------------------------------------------
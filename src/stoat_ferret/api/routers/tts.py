@@ -19,6 +19,7 @@ from stoat_ferret.api.schemas.tts import (
     TtsCueListResponse,
     TtsCueResponse,
     TtsCueUpdate,
+    TtsSynthesiseAllResponse,
     VoiceInfo,
     VoicesResponse,
     _compute_cache_key,
@@ -321,6 +322,45 @@ async def synthesise_tts_cue(
     return {"status": dispatch_status, "cue_id": str(cue_id)}
 
 
+@router.post(
+    "/projects/{project_id}/tts/synthesise-all",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Dispatch TTS synthesis for every cue in a project",
+)
+async def synthesise_all_tts_cues(
+    project_id: UUID,
+    request: Request,
+) -> TtsSynthesiseAllResponse:
+    """Dispatch synthesis for all project cues that lack usable audio.
+
+    Pending and failed cues are dispatched, as are ready cues whose cached
+    audio has been evicted. Synthesis runs concurrently up to
+    STOAT_TTS_MAX_CONCURRENT_SYNTHESIS; a ``tts.synthesis_progress``
+    WebSocket event is broadcast as each cue finishes.
+
+    Args:
+        project_id: The project UUID.
+        request: The incoming HTTP request (provides TtsService access).
+
+    Returns:
+        Counts of dispatched, in-progress and already-ready cues.
+    """
+    from stoat_ferret.api.services.tts_service import TtsService
+
+    tts_service: TtsService | None = getattr(request.app.state, "tts_service", None)
+    if tts_service is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "code": "TTS_SERVICE_UNAVAILABLE",
+                "message": "TTS service not initialised",
+            },
+        )
+
+    counts = await tts_service.synthesise_project(str(project_id))
+    return TtsSynthesiseAllResponse(project_id=project_id, **counts)
+
+
 @router.get(
     "/tts/voices",
     summary="List available TTS voices",
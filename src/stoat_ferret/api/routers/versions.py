@@ -12,9 +12,14 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
 from stoat_ferret.api.routers.timeline import _build_timeline_response, _get_clips_by_track
 from stoat_ferret.api.schemas.version import (
+    MergeConflictResponse,
     RestoreResponse,
+    VersionChangeResponse,
     VersionCreateRequest,
+    VersionDiffResponse,
     VersionListResponse,
+    VersionMergeRequest,
+    VersionMergeResponse,
     VersionResponse,
 )
 from stoat_ferret.api.settings import get_settings
@@ -27,9 +32,17 @@ from stoat_ferret.db.timeline_repository import (
     AsyncSQLiteTimelineRepository,
     AsyncTimelineRepository,
 )
+from stoat_ferret.db.version_diff import (
+    MISSING,
+    TimelineChange,
+    diff_snapshots,
+    index_snapshot,
+    merge_snapshots,
+)
 from stoat_ferret.db.version_repository import (
     AsyncSQLiteVersionRepository,
     AsyncVersionRepository,
+    VersionRecord,
 )
 
 router = APIRouter(prefix="/api/v1", tags=["versions"])
@@ -62,7 +75,10 @@ def get_version_repository(request: Request) -> AsyncVersionRepository:
     repo: AsyncVersionRepository | None = getattr(request.app.state, "version_repository", None)
     if repo is not None:
         return repo
-    return AsyncSQLiteVersionRepository(request.app.state.db)
+    return AsyncSQLiteVersionRepository(
+        request.app.state.db,
+        keyframe_interval=get_settings().version_keyframe_interval,
+    )
 
 
 def get_timeline_repository(request: Request) -> AsyncTimelineRepository:
@@ -102,6 +118,63 @@ TimelineRepoDep = Annotated[AsyncTimelineRepository, Depends(get_timeline_reposi
 ClipRepoDep = Annotated[AsyncClipRepository, Depends(get_clip_repository)]
 
 
+async def _require_project(project_repo: AsyncProjectRepository, project_id: str) -> None:
+    """Raise 404 unless the project exists."""
+    project = await project_repo.get(project_id)
+    if project is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "NOT_FOUND", "message": f"Project {project_id} not found"},
+        )
+
+
+async def _require_version(
+    version_repo: AsyncVersionRepository, project_id: str, version: int
+) -> VersionRecord:
+    """Load a version or raise 404."""
+    record = await version_repo.get_version(project_id, version)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "code": "PROJECT_VERSION_NOT_FOUND",
+                "message": f"Version {version} not found for project {project_id}",
+            },
+        )
+    return record
+
+
+def _index_version(record: VersionRecord) -> object:
+    """Index a version snapshot for structural diffing, or raise 422."""
+    try:
+        return index_snapshot(record.timeline_json, record.checksum)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail={
+                "code": "VERSION_NOT_STRUCTURED",
+                "message": f"Version {record.version_number} does not contain timeline JSON",
+            },
+        ) from None
+
+
+def _change_response(change: TimelineChange) -> VersionChangeResponse:
+    """Convert a structural change to its API representation."""
+    return VersionChangeResponse(
+        op=change.op,
+        path=change.pointer,
+        before=None if change.before is MISSING else change.before,
+        after=None if change.after is MISSING else change.after,
+    )
+
+
+async def _apply_retention(version_repo: AsyncVersionRepository, project_id: str) -> None:
+    """Prune old versions when a retention count is configured."""
+    retention_count = get_settings().version_retention_count
+    if retention_count is not None:
+        await version_repo.delete_old_versions(project_id, retention_count)
+
+
 @router.get("/projects/{project_id}/versions")
 async def list_versions(
     project_id: str,
@@ -132,9 +205,8 @@ async def list_versions(
             detail={"code": "NOT_FOUND", "message": f"Project {project_id} not found"},
         )
 
-    all_versions = await version_repo.list_versions(project_id)
-    total = len(all_versions)
-    page = all_versions[offset : offset + limit]
+    total = await version_repo.count_versions(project_id)
+    page = await version_repo.list_version_summaries(project_id, limit=limit, offset=offset)
 
     return VersionListResponse(
         total=total,
@@ -199,9 +271,7 @@ async def create_version(
     else:
         record = await version_repo.save(project_id, body.timeline_json)
 
-    retention_count = get_settings().version_retention_count
-    if retention_count is not None:
-        await version_repo.delete_old_versions(project_id, retention_count)
+    await _apply_retention(version_repo, project_id)
 
     return VersionResponse(
         version_number=record.version_number,
@@ -259,3 +329,147 @@ async def restore_version(
         new_version=new_record.version_number,
         message=f"Restored version {version} as version {new_record.version_number}",
     )
+
+
+@router.get("/projects/{project_id}/versions/{from_version}/diff/{to_version}")
+async def diff_versions(
+    project_id: str,
+    from_version: int,
+    to_version: int,
+    project_repo: ProjectRepoDep,
+    version_repo: VersionRepoDep,
+) -> VersionDiffResponse:
+    """Structurally diff two versions of a project.
+
+    Tracks, clips and other id-keyed items are matched by id, and subtrees
+    with matching checksums are skipped, so the response lists only what
+    changed.
+
+    Args:
+        project_id: The unique project identifier.
+        from_version: Source version number.
+        to_version: Target version number.
+        project_repo: Project repository dependency.
+        version_repo: Version repository dependency.
+
+    Returns:
+        The changes that turn ``from_version`` into ``to_version``.
+
+    Raises:
+        HTTPException: 404 if the project or either version is not found,
+            422 if a version does not contain JSON.
+    """
+    await _require_project(project_repo, project_id)
+    source = await _require_version(version_repo, project_id, from_version)
+    target = await _require_version(version_repo, project_id, to_version)
+
+    identical = source.checksum == target.checksum
+    changes = [] if identical else diff_snapshots(_index_version(source), _index_version(target))
+    return VersionDiffResponse(
+        project_id=project_id,
+        from_version=from_version,
+        to_version=to_version,
+        from_checksum=source.checksum,
+        to_checksum=target.checksum,
+        identical=identical,
+        changes=[_change_response(c) for c in changes],
+    )
+
+
+@router.post(
+    "/projects/{project_id}/versions/merge",
+    status_code=status.HTTP_201_CREATED,
+)
+async def merge_versions(
+    project_id: str,
+    body: VersionMergeRequest,
+    project_repo: ProjectRepoDep,
+    version_repo: VersionRepoDep,
+) -> VersionMergeResponse:
+    """Three-way merge two versions that diverged from a common base.
+
+    Non-overlapping changes from both versions are combined and saved as a
+    new version. The live timeline is not modified; restore the new
+    version to apply it.
+
+    Args:
+        project_id: The unique project identifier.
+        body: Base, ours and theirs version numbers plus conflict strategy.
+        project_repo: Project repository dependency.
+        version_repo: Version repository dependency.
+
+    Returns:
+        The new version and a summary of the merge.
+
+    Raises:
+        HTTPException: 404 if the project or a version is not found, 409 if
+            the versions conflict and strategy is ``fail`` or the combined
+            changes do not apply to the base, 422 if a version does not
+            contain JSON.
+    """
+    await _require_project(project_repo, project_id)
+    base = await _require_version(version_repo, project_id, body.base_version)
+    ours = await _require_version(version_repo, project_id, body.ours_version)
+    theirs = await _require_version(version_repo, project_id, body.theirs_version)
+
+    conflicts: list[MergeConflictResponse] = []
+    changes_applied = 0
+    if ours.checksum == base.checksum:
+        merged_json = theirs.timeline_json
+    elif theirs.checksum in (base.checksum, ours.checksum):
+        merged_json = ours.timeline_json
+    else:
+        try:
+            result = merge_snapshots(
+                _index_version(base),
+                _index_version(ours),
+                _index_version(theirs),
+                strategy=body.strategy,
+            )
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "code": "VERSION_MERGE_NOT_APPLICABLE",
+                    "message": (
+                        f"Versions {body.ours_version} and {body.theirs_version} "
+                        f"cannot be merged onto version {body.base_version}: {exc}"
+                    ),
+                },
+            ) from None
+        conflicts = [
+            MergeConflictResponse(
+                path=TimelineChange("replace", c.path).pointer,
+                ours=_change_response(c.ours),
+                theirs=_change_response(c.theirs),
+            )
+            for c in result.conflicts
+        ]
+        if result.document is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "code": "VERSION_MERGE_CONFLICT",
+                    "message": (
+                        f"Versions {body.ours_version} and {body.theirs_version} "
+                        f"have {len(conflicts)} conflicting change(s)"
+                    ),
+                    "conflicts": [c.model_dump(mode="json") for c in conflicts],
+                },
+            )
+        merged_json = json.dumps(result.document)
+        changes_applied = len(result.applied)
+
+    record = await version_repo.save(project_id, merged_json)
+    await _apply_retention(version_repo, project_id)
+
+    return VersionMergeResponse(
+        version_number=record.version_number,
+        created_at=record.created_at.isoformat(),
+        checksum=record.checksum,
+        base_version=body.base_version,
+        ours_version=body.ours_version,
+        theirs_version=body.theirs_version,
+        changes_applied=changes_applied,
+        conflicts=conflicts,
+    )
@@ -13,7 +13,6 @@ from typing import Annotated
 import aiosqlite
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
-from fastapi.responses import FileResponse
 
 from stoat_ferret.api.schemas.job import JobSubmitResponse
 from stoat_ferret.api.schemas.video import (
@@ -22,6 +21,7 @@ from stoat_ferret.api.schemas.video import (
     VideoResponse,
     VideoSearchResponse,
 )
+from stoat_ferret.api.services.file_serving import serve_file
 from stoat_ferret.api.services.scan import SCAN_JOB_TYPE, validate_scan_path
 from stoat_ferret.api.settings import get_settings
 from stoat_ferret.api.websocket.events import EventType, build_event
@@ -119,15 +119,18 @@ async def search_videos(
 @router.get("/{video_id}/thumbnail")
 async def get_thumbnail(
     video_id: str,
+    request: Request,
     repo: RepoDep,
-) -> FileResponse:
+) -> Response:
     """Get thumbnail image for a video.
 
     Returns the generated thumbnail if available, or a placeholder image
-    if thumbnail generation failed or hasn't been run.
+    if thumbnail generation failed or hasn't been run. Either is streamed
+    with a file-identity ETag, so revalidation returns 304.
 
     Args:
         video_id: The unique video identifier.
+        request: The FastAPI request object.
         repo: Video repository dependency.
 
     Returns:
@@ -144,9 +147,9 @@ async def get_thumbnail(
         )
 
     if video.thumbnail_path and Path(video.thumbnail_path).is_file():
-        return FileResponse(video.thumbnail_path, media_type="image/jpeg")
+        return serve_file(request, video.thumbnail_path, media_type="image/jpeg")
 
-    return FileResponse(str(_PLACEHOLDER_PATH), media_type="image/jpeg")
+    return serve_file(request, _PLACEHOLDER_PATH, media_type="image/jpeg")
 
 
 @router.get("/{video_id}")
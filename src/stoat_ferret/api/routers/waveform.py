@@ -15,8 +15,8 @@ from pathlib import Path
 from typing import Annotated
 
 import structlog
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
 
 from stoat_ferret.api.schemas.waveform import (
     WaveformGenerateRequest,
@@ -25,6 +25,7 @@ from stoat_ferret.api.schemas.waveform import (
     WaveformSample,
     WaveformSamplesResponse,
 )
+from stoat_ferret.api.services.file_serving import serve_file
 from stoat_ferret.api.services.waveform import WaveformService
 from stoat_ferret.db.async_repository import (
     AsyncSQLiteVideoRepository,
@@ -195,16 +196,18 @@ async def get_waveform_metadata(
 @router.get("/videos/{video_id}/waveform.png")
 async def get_waveform_image(
     video_id: str,
+    request: Request,
     waveform_service: WaveformServiceDep,
-) -> FileResponse:
+) -> Response:
     """Serve the waveform as a PNG image.
 
     Args:
         video_id: The source video ID.
+        request: The FastAPI request object.
         waveform_service: Waveform service dependency.
 
     Returns:
-        PNG image response.
+        PNG image response (streamed, with ETag revalidation).
 
     Raises:
         HTTPException: 404 if no waveform exists or file not ready.
@@ -229,7 +232,7 @@ async def get_waveform_image(
             },
         )
 
-    return FileResponse(str(file_path), media_type="image/png")
+    return serve_file(request, file_path, media_type="image/png")
 
 
 @router.get(
@@ -38,3 +38,35 @@ class AssetListResponse(BaseModel):
     offset: int = Field(description="Pagination offset used in this response.")
     limit: int = Field(description="Page size used in this response.")
     total: int = Field(description="Total count of matching active assets.")
+
+
+class AssetUploadCreate(BaseModel):
+    """Request body starting a resumable asset upload."""
+
+    kind: Literal["image", "audio", "subtitle", "font", "lut"] = Field(
+        default="image", description="Asset kind the completed upload is stored as."
+    )
+    filename: str = Field(min_length=1, max_length=255, description="Original filename.")
+    size_bytes: int | None = Field(
+        default=None,
+        ge=1,
+        description="Total upload size, if known. Appends beyond it are rejected with 413.",
+    )
+    content_type: str | None = Field(
+        default=None,
+        description="MIME type recorded for non-image kinds (images are content-sniffed).",
+    )
+
+
+class AssetUploadStatus(BaseModel):
+    """Progress of a resumable asset upload."""
+
+    upload_id: str = Field(description="Upload session ID.")
+    kind: Literal["image", "audio", "subtitle", "font", "lut"] = Field(description="Asset kind.")
+    filename: str = Field(description="Original filename.")
+    offset: int = Field(description="Bytes received so far; the next append must start here.")
+    size_bytes: int | None = Field(default=None, description="Declared total size, if any.")
+    max_size_bytes: int = Field(description="Configured maximum asset size.")
+    expires_in_seconds: float = Field(
+        description="Seconds until the session is discarded if no further bytes arrive."
+    )
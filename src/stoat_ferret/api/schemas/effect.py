@@ -208,3 +208,52 @@ class EffectTransitionResponse(BaseModel):
     transition_type: str
     parameters: dict[str, Any]
     filter_string: str
+
+
+class EffectValidationErrorResponse(BaseModel):
+    """One parameter validation error.
+
+    Attributes:
+        path: Dotted path of the invalid parameter ("" for the whole entry).
+        message: Human-readable error description.
+    """
+
+    path: str
+    message: str
+
+
+class EffectStackIssue(BaseModel):
+    """An invalid entry in a project's stored effects or transitions.
+
+    Attributes:
+        target: ``clip`` for clip effects, ``transition`` for project transitions.
+        target_id: Clip ID, or the transition's ID.
+        index: Zero-based position in the clip's effect stack or the project's
+            transition list.
+        effect_type: Stored effect or transition type.
+        errors: Validation errors for the entry.
+    """
+
+    target: Literal["clip", "transition"]
+    target_id: str
+    index: int
+    effect_type: str
+    errors: list[EffectValidationErrorResponse]
+
+
+class EffectStackValidationResponse(BaseModel):
+    """Result of validating every effect stack in a project.
+
+    Attributes:
+        project_id: The validated project.
+        valid: True when no issues were found.
+        clips_checked: Number of clips whose effect stacks were validated.
+        effects_checked: Number of clip effects and transitions validated.
+        issues: Invalid entries, in timeline order.
+    """
+
+    project_id: str
+    valid: bool
+    clips_checked: int
+    effects_checked: int
+    issues: list[EffectStackIssue]
@@ -7,8 +7,9 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 # Hand-pinned BCP-47 base → ISO-639-2/B dict (10 languages; no external babel dependency)
 _BCP47_TO_ISO639_2B: dict[str, str] = {
@@ -47,6 +48,108 @@ class SoftSubtitleSpec(BaseModel):
         return v
 
 
+# x264/x265 -preset values (see render/tuning.py)
+EncoderPreset = Literal[
+    "ultrafast",
+    "superfast",
+    "veryfast",
+    "faster",
+    "fast",
+    "medium",
+    "slow",
+    "slower",
+    "veryslow",
+]
+
+# Containers an audio-only deliverable can be written to
+AUDIO_ONLY_FORMATS = frozenset({"m4a", "mp3", "wav"})
+
+# Packagings that write an adaptive bitrate ladder (see render/abr.py)
+LADDER_FORMATS = frozenset({"hls", "dash"})
+
+# Upper bound on extra deliverables per render (each adds an encoder to the process)
+MAX_RENDER_OUTPUTS = 8
+
+# Upper bound on renditions in one ladder
+MAX_LADDER_RENDITIONS = 8
+
+
+class AbrRendition(BaseModel):
+    """One rung of an adaptive bitrate ladder.
+
+    The width follows the rendered aspect ratio. ``max_bitrate_kbps``
+    defaults to ``video_bitrate_kbps``; the rate-control buffer is twice the
+    maximum bitrate.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    height: int = Field(..., gt=0)
+    video_bitrate_kbps: int = Field(..., gt=0)
+    max_bitrate_kbps: int | None = Field(default=None, gt=0)
+
+    @model_validator(mode="after")
+    def validate_max_bitrate(self) -> AbrRendition:
+        """Reject a maximum bitrate below the target bitrate."""
+        if self.max_bitrate_kbps is not None and self.max_bitrate_kbps < self.video_bitrate_kbps:
+            raise ValueError("max_bitrate_kbps must not be below video_bitrate_kbps")
+        return self
+
+
+class RenderOutputSpec(BaseModel):
+    """An extra deliverable encoded from the same decode as the primary output.
+
+    See render/multi_output.py. Unset fields inherit the primary output's
+    dimensions, quality and encoder preset. ``hls`` and ``dash`` outputs are
+    adaptive bitrate ladders: they need ``renditions`` and take their sizes
+    and bitrates from them instead of ``width``/``height``/``quality_preset``.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    name: str = Field(..., pattern=r"^[A-Za-z0-9_-]{1,32}$")
+    output_format: Literal["mp4", "webm", "mov", "mkv", "m4a", "mp3", "wav", "hls", "dash"] = "mp4"
+    width: int | None = Field(default=None, gt=0)
+    height: int | None = Field(default=None, gt=0)
+    # Centre crop to this aspect ratio (e.g. "9:16") before scaling
+    crop_aspect: str | None = Field(default=None, pattern=r"^[1-9][0-9]*:[1-9][0-9]*$")
+    codec: str | None = None
+    quality_preset: Literal["draft", "standard", "high"] | None = None
+    encoder_preset: EncoderPreset | None = None
+    renditions: list[AbrRendition] = Field(default=[], max_length=MAX_LADDER_RENDITIONS)
+    # Ladder segment length; every rendition gets a keyframe on each boundary
+    segment_seconds: float = Field(default=4.0, gt=0, le=30)
+    audio_bitrate_kbps: int = Field(default=128, gt=0)
+    # Assigned by the server next to the primary output; client values are replaced
+    output_path: str | None = None
+
+    @property
+    def audio_only(self) -> bool:
+        """Whether the deliverable carries audio only."""
+        return self.output_format in AUDIO_ONLY_FORMATS
+
+    @property
+    def is_ladder(self) -> bool:
+        """Whether the deliverable is an adaptive bitrate ladder."""
+        return self.output_format in LADDER_FORMATS
+
+    @model_validator(mode="after")
+    def validate_ladder_fields(self) -> RenderOutputSpec:
+        """Require renditions exactly for ladder outputs."""
+        if self.is_ladder:
+            if not self.renditions:
+                raise ValueError(f"{self.output_format} output '{self.name}' needs renditions")
+            if self.width or self.height:
+                raise ValueError(
+                    f"{self.output_format} output '{self.name}' takes sizes from its renditions"
+                )
+        elif self.renditions:
+            raise ValueError(
+                f"renditions only apply to hls and dash outputs, not {self.output_format}"
+            )
+        return self
+
+
 class RenderPlanSettings(BaseModel):
     """Parsed from render_plan.settings JSON string.
 
@@ -58,6 +161,23 @@ class RenderPlanSettings(BaseModel):
 
     quality_preset: str = "standard"
     soft_subtitles: list[SoftSubtitleSpec] = []
+    # Stream-copy untouched GOP-aligned clip ranges (see render/smart.py)
+    smart_render: bool = False
+    # x264/x265 -preset; chosen from telemetry when a target below is set (see render/tuning.py)
+    encoder_preset: EncoderPreset | None = None
+    deadline_seconds: float | None = Field(default=None, gt=0)
+    max_output_bytes: int | None = Field(default=None, gt=0)
+    # Extra deliverables fanned out from one decode (see render/multi_output.py)
+    outputs: list[RenderOutputSpec] = Field(default=[], max_length=MAX_RENDER_OUTPUTS)
+
+    @field_validator("outputs")
+    @classmethod
+    def validate_output_names(cls, v: list[RenderOutputSpec]) -> list[RenderOutputSpec]:
+        """Reject duplicate output names (they name the output files)."""
+        names = [spec.name for spec in v]
+        if len(set(names)) != len(names):
+            raise ValueError("render output names must be unique")
+        return v
 
 
 def bcp47_to_iso639(language: str) -> str:
@@ -100,6 +220,18 @@ class CreateRenderRequest(BaseModel):
     )
 
 
+class RenderOutputResponse(BaseModel):
+    """An extra deliverable of a multi-output render job."""
+
+    name: str = Field(..., description="Output name from the render plan")
+    output_path: str = Field(..., description="Path of the output file")
+    output_format: str = Field(..., description="Output container format")
+    progress: float = Field(
+        ...,
+        description="Progress 0.0-1.0 (outputs share one FFmpeg process and advance together)",
+    )
+
+
 class RenderJobResponse(BaseModel):
     """Response representing a single render job."""
 
@@ -117,6 +249,7 @@ class RenderJobResponse(BaseModel):
     completed_at: datetime | None = None
     partial_file_detected: bool = False
     warnings: list[str] | None = None
+    outputs: list[RenderOutputResponse] = []
 
 
 class RenderListResponse(BaseModel):
@@ -128,6 +261,23 @@ class RenderListResponse(BaseModel):
     offset: int
 
 
+class QueueJobForecast(BaseModel):
+    """Predicted start and finish time for one running or queued render job."""
+
+    job_id: str = Field(..., description="Render job ID")
+    status: Literal["running", "queued"] = Field(..., description="Current job status")
+    predicted_seconds: float = Field(..., description="Predicted wall-clock time for the job")
+    starts_in_seconds: float = Field(..., description="Seconds until the job starts")
+    finishes_in_seconds: float = Field(..., description="Seconds until the job finishes")
+    starts_at: datetime = Field(..., description="Predicted start time (UTC)")
+    finishes_at: datetime = Field(..., description="Predicted finish time (UTC)")
+    basis: Literal["observed", "telemetry", "default"] = Field(
+        ...,
+        description="Prediction source: completed jobs with the same encoder, "
+        "encoder telemetry, or real-time playback speed when neither is available",
+    )
+
+
 class QueueStatusResponse(BaseModel):
     """Render queue status with capacity, disk space, and throughput metrics."""
 
@@ -141,6 +291,10 @@ class QueueStatusResponse(BaseModel):
     disk_total_bytes: int = Field(..., description="Total disk space on the render output volume")
     completed_today: int = Field(..., description="Jobs completed since midnight UTC")
     failed_today: int = Field(..., description="Jobs failed since midnight UTC")
+    forecast: list[QueueJobForecast] = Field(
+        default_factory=list,
+        description="Predicted start and finish times: running jobs, then queued jobs in order",
+    )
 
 
 class EncoderInfoResponse(BaseModel):
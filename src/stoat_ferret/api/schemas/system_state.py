@@ -42,9 +42,9 @@ class JobSummary(BaseModel):
 class SystemState(BaseModel):
     """Aggregate in-memory system state returned by ``/api/v1/system/state``.
 
-    Produced by a single-pass scan over the in-process job queue and
-    WebSocket connection manager (INV-SNAP-1). The handler never issues
-    database round-trips.
+    Served from the incrementally maintained ``SystemStateTracker``:
+    render jobs are followed through render repository change events, so
+    steady-state polls issue no database round-trips (INV-SNAP-1).
     """
 
     model_config = ConfigDict(
@@ -64,6 +64,7 @@ class SystemState(BaseModel):
                     ],
                     "active_connections": 3,
                     "uptime_seconds": 1820.5,
+                    "version": 42,
                 }
             ]
         },
@@ -88,3 +89,10 @@ class SystemState(BaseModel):
         "opened. ``0.0`` before startup completes.",
         ge=0.0,
     )
+    version: int = Field(
+        default=0,
+        description="Change counter, bumped whenever ``active_jobs`` or "
+        "``active_connections`` changes. Pass it back as ``wait_for_version`` "
+        "to long-poll for the next change. Restarts from 0 with the process.",
+        ge=0,
+    )
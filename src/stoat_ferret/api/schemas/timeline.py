@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 import math
-from typing import Literal
+from typing import Annotated, Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -100,6 +100,79 @@ class TimelineClipUpdate(BaseModel):
     track_id: str | None = None
 
 
+class BatchAddClip(BaseModel):
+    """Batch operation: place a clip on a track."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["add_clip"]
+    clip_id: str
+    track_id: str
+    timeline_start: float = Field(..., ge=0)
+    timeline_end: float = Field(..., gt=0)
+
+
+class BatchUpdateClip(BaseModel):
+    """Batch operation: move a placed clip or change its track."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["update_clip"]
+    clip_id: str
+    timeline_start: float | None = Field(default=None, ge=0)
+    timeline_end: float | None = Field(default=None, gt=0)
+    track_id: str | None = None
+
+
+class BatchRemoveClip(BaseModel):
+    """Batch operation: clear a clip's timeline placement."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["remove_clip"]
+    clip_id: str
+
+
+class BatchUpdateEffect(BaseModel):
+    """Batch operation: replace the parameters of a clip effect."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["update_effect"]
+    clip_id: str
+    index: int = Field(..., ge=0)
+    parameters: dict[str, Any]
+
+
+class BatchRemoveEffect(BaseModel):
+    """Batch operation: remove a clip effect."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["remove_effect"]
+    clip_id: str
+    index: int = Field(..., ge=0)
+
+
+TimelineBatchOperation = Annotated[
+    BatchAddClip | BatchUpdateClip | BatchRemoveClip | BatchUpdateEffect | BatchRemoveEffect,
+    Field(discriminator="op"),
+]
+
+
+class TimelineBatchRequest(BaseModel):
+    """Ordered list of timeline mutations applied atomically."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    operations: list[TimelineBatchOperation] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Operations applied in order; later operations see earlier results",
+    )
+
+
 class TimelineClipResponse(BaseModel):
     """Timeline clip response."""
 
@@ -155,6 +155,16 @@ class TtsCueListResponse(BaseModel):
     total: int
 
 
+class TtsSynthesiseAllResponse(BaseModel):
+    """Response schema for dispatching synthesis of every cue in a project."""
+
+    project_id: UUID
+    total: int = Field(description="Cues in the project")
+    dispatched: int = Field(description="Cues newly dispatched for synthesis")
+    in_progress: int = Field(description="Cues that were already synthesising")
+    ready: int = Field(description="Cues whose audio was already available")
+
+
 class VoiceInfo(BaseModel):
     """Information about an available TTS voice."""
 
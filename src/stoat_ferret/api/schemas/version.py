@@ -5,7 +5,9 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
 
 
 class VersionCreateRequest(BaseModel):
@@ -61,3 +63,98 @@ class RestoreResponse(BaseModel):
     restored_version: int
     new_version: int
     message: str
+
+
+class VersionChangeResponse(BaseModel):
+    """One structural change between two versions.
+
+    Attributes:
+        op: ``add``, ``remove`` or ``replace``.
+        path: JSON Pointer to the changed node. Tracks, clips and other
+            id-keyed list items are addressed by id, e.g.
+            ``/tracks/t1/clips/c7/timeline_start``.
+        before: Value in the source version (None for ``add``).
+        after: Value in the target version (None for ``remove``).
+    """
+
+    op: Literal["add", "remove", "replace"]
+    path: str
+    before: Any = None
+    after: Any = None
+
+
+class VersionDiffResponse(BaseModel):
+    """Structural diff between two versions of a project.
+
+    Attributes:
+        project_id: The project the versions belong to.
+        from_version: Source version number.
+        to_version: Target version number.
+        from_checksum: SHA-256 of the source version.
+        to_checksum: SHA-256 of the target version.
+        identical: True when the checksums match (no changes computed).
+        changes: Changes that turn the source into the target.
+    """
+
+    project_id: str
+    from_version: int
+    to_version: int
+    from_checksum: str
+    to_checksum: str
+    identical: bool
+    changes: list[VersionChangeResponse]
+
+
+class VersionMergeRequest(BaseModel):
+    """Request body for a three-way merge of two versions.
+
+    Attributes:
+        base_version: Common ancestor both versions were edited from.
+        ours_version: First edited version.
+        theirs_version: Second edited version.
+        strategy: ``fail`` rejects conflicting merges with 409; ``ours`` or
+            ``theirs`` resolves each conflict in favour of that side.
+    """
+
+    base_version: int = Field(..., ge=1)
+    ours_version: int = Field(..., ge=1)
+    theirs_version: int = Field(..., ge=1)
+    strategy: Literal["fail", "ours", "theirs"] = "fail"
+
+
+class MergeConflictResponse(BaseModel):
+    """Conflicting changes made by both sides of a merge.
+
+    Attributes:
+        path: JSON Pointer to the contested node.
+        ours: The change from ``ours_version``.
+        theirs: The change from ``theirs_version``.
+    """
+
+    path: str
+    ours: VersionChangeResponse
+    theirs: VersionChangeResponse
+
+
+class VersionMergeResponse(BaseModel):
+    """Result of a successful merge, saved as a new version.
+
+    Attributes:
+        version_number: The newly created version number.
+        created_at: ISO-8601 timestamp of the new version.
+        checksum: SHA-256 hex digest of the merged timeline data.
+        base_version: The common ancestor version.
+        ours_version: First merged version.
+        theirs_version: Second merged version.
+        changes_applied: Number of changes applied on top of the base.
+        conflicts: Conflicts resolved by the requested strategy.
+    """
+
+    version_number: int
+    created_at: str
+    checksum: str
+    base_version: int
+    ours_version: int
+    theirs_version: int
+    changes_applied: int
+    conflicts: list[MergeConflictResponse]
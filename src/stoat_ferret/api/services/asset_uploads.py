@@ -0,0 +1,472 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Streaming and resumable asset uploads (BL-515 follow-up).
+
+Asset uploads used to be read into memory whole, hashed on the event loop
+and then written out, so every concurrent upload held its full size in
+RSS. This module keeps memory per upload bounded by `UPLOAD_CHUNK_BYTES`:
+
+- `spool_form_file` parses a ``multipart/form-data`` request body as it
+  streams in and writes the file field into a temporary file under the
+  parts directory, hashing as it goes and stopping at the size limit.
+- `AssetUploadStore` tracks resumable uploads. A client creates a
+  session, appends byte ranges at the current offset (retrying from the
+  last acknowledged offset after a dropped connection), then completes
+  it. The SHA-256 state lives with the session, so completing does not
+  re-read the file.
+
+Both produce a file in ``<assets_dir>/.uploads`` that the router renames
+atomically to its content-addressed name. Sessions live in memory; part
+files left behind by a restart are removed once they are older than the
+session TTL.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import tempfile
+import time
+import uuid
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+import structlog
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+if TYPE_CHECKING:
+    from python_multipart.multipart import MultipartCallbacks
+
+logger = structlog.get_logger(__name__)
+
+# Bytes copied, hashed and written per worker-thread hop.
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+# Allowance for multipart boundaries, part headers and small form fields on
+# top of the file size limit when bounding a whole multipart body.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# Subdirectory of assets_dir holding in-progress uploads (same filesystem,
+# so the final rename is atomic).
+PARTS_DIRNAME = ".uploads"
+
+
+class UploadTooLargeError(Exception):
+    """The upload exceeded the configured or declared size."""
+
+
+class UploadOffsetMismatchError(Exception):
+    """An append did not start at the session's current offset.
+
+    Attributes:
+        offset: The session's current offset, for the client to resume from.
+    """
+
+    def __init__(self, offset: int) -> None:
+        """Record the offset the client should resume from."""
+        super().__init__(f"Upload offset mismatch; current offset is {offset}")
+        self.offset = offset
+
+
+class UploadBusyError(Exception):
+    """Another append to the same session is still in progress."""
+
+
+@dataclass(frozen=True)
+class SpooledUpload:
+    """A fully received upload waiting to be renamed into place.
+
+    Attributes:
+        path: Temporary file under the parts directory.
+        sha256: Hex SHA-256 of the content.
+        size_bytes: Content length.
+    """
+
+    path: Path
+    sha256: str
+    size_bytes: int
+
+
+class InvalidMultipartError(Exception):
+    """The request body is not a well-formed ``multipart/form-data`` form."""
+
+
+@dataclass(frozen=True)
+class SpooledFormFile(SpooledUpload):
+    """A file field spooled straight from a ``multipart/form-data`` body.
+
+    Attributes:
+        filename: Client-supplied filename, if any.
+        content_type: Client-declared content type of the part, if any.
+    """
+
+    filename: str | None = None
+    content_type: str | None = None
+
+
+class _FormFileSpool:
+    """Parser callbacks that buffer one file field's bytes for spooling."""
+
+    def __init__(self, field_name: str, max_bytes: int) -> None:
+        self.field_name = field_name
+        self.max_bytes = max_bytes
+        self.buffer = bytearray()
+        self.size = 0
+        self.found = False
+        self.filename: str | None = None
+        self.content_type: str | None = None
+        self._capturing = False
+        self._header_field = bytearray()
+        self._header_value = bytearray()
+        self._headers: dict[bytes, bytes] = {}
+
+    def on_part_begin(self) -> None:
+        self._headers = {}
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._headers[bytes(self._header_field).lower()] = bytes(self._header_value)
+        self._header_field.clear()
+        self._header_value.clear()
+
+    def on_headers_finished(self) -> None:
+        _, params = parse_options_header(self._headers.get(b"content-disposition"))
+        if self.found or params.get(b"name", b"").decode("latin-1") != self.field_name:
+            return
+        self.found = self._capturing = True
+        filename = params.get(b"filename")
+        self.filename = filename.decode("utf-8", "replace") if filename is not None else None
+        content_type = self._headers.get(b"content-type")
+        self.content_type = content_type.decode("latin-1").strip() if content_type else None
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._capturing:
+            self.size += end - start
+            if self.size <= self.max_bytes:
+                self.buffer += data[start:end]
+
+    def on_part_end(self) -> None:
+        self._capturing = False
+
+
+async def spool_form_file(
+    chunks: AsyncIterator[bytes],
+    content_type: str | None,
+    parts_dir: Path,
+    max_bytes: int,
+    *,
+    field_name: str = "file",
+) -> SpooledFormFile | None:
+    """Stream a ``multipart/form-data`` body, spooling one file field to disk.
+
+    The body is parsed as it arrives: bytes of the ``field_name`` part are
+    buffered up to `UPLOAD_CHUNK_BYTES`, and each block is written and
+    hashed in a worker thread. Other fields are discarded. Nothing is
+    buffered by the framework first, so the file is written to disk once
+    and the size limit is enforced while the body is still arriving; the
+    whole body is also capped at ``max_bytes`` plus
+    `MULTIPART_OVERHEAD_BYTES`.
+
+    Args:
+        chunks: Request body stream (``Request.stream()``).
+        content_type: The request's ``Content-Type`` header.
+        parts_dir: Directory for the temporary file (created if missing).
+        max_bytes: Size limit for the file field.
+        field_name: Form field holding the file.
+
+    Returns:
+        The spooled file, or None if the form has no ``field_name`` part.
+
+    Raises:
+        InvalidMultipartError: If the body is not ``multipart/form-data``
+            or is malformed.
+        UploadTooLargeError: As soon as the file field exceeds ``max_bytes``
+            or the body exceeds the overall cap. The temporary file is
+            removed.
+    """
+    mime, params = parse_options_header(content_type)
+    boundary = params.get(b"boundary")
+    if mime != b"multipart/form-data" or not boundary:
+        raise InvalidMultipartError("Expected a multipart/form-data body with a boundary")
+
+    spool = _FormFileSpool(field_name, max_bytes)
+    callbacks: MultipartCallbacks = {
+        "on_part_begin": spool.on_part_begin,
+        "on_header_field": spool.on_header_field,
+        "on_header_value": spool.on_header_value,
+        "on_header_end": spool.on_header_end,
+        "on_headers_finished": spool.on_headers_finished,
+        "on_part_data": spool.on_part_data,
+        "on_part_end": spool.on_part_end,
+    }
+    parser = MultipartParser(boundary, callbacks)
+    dst, path = await asyncio.to_thread(_open_temp, parts_dir)
+    hasher = hashlib.sha256()
+    body_limit = max_bytes + MULTIPART_OVERHEAD_BYTES
+    received = 0
+    try:
+        try:
+            async for chunk in chunks:
+                received += len(chunk)
+                if received > body_limit:
+                    raise UploadTooLargeError(f"Upload exceeds {max_bytes} bytes")
+                parser.write(chunk)
+                if spool.size > max_bytes:
+                    raise UploadTooLargeError(f"Upload exceeds {max_bytes} bytes")
+                if len(spool.buffer) >= UPLOAD_CHUNK_BYTES:
+                    await _flush_block(dst, hasher, spool.buffer)
+            parser.finalize()
+        except MultipartParseError as exc:
+            raise InvalidMultipartError(str(exc)) from None
+        if spool.buffer:
+            await _flush_block(dst, hasher, spool.buffer)
+    except BaseException:
+        await asyncio.to_thread(dst.close)
+        await asyncio.to_thread(path.unlink, missing_ok=True)
+        raise
+    await asyncio.to_thread(dst.close)
+    if not spool.found:
+        await asyncio.to_thread(path.unlink, missing_ok=True)
+        return None
+    return SpooledFormFile(
+        path=path,
+        sha256=hasher.hexdigest(),
+        size_bytes=spool.size,
+        filename=spool.filename,
+        content_type=spool.content_type,
+    )
+
+
+def _open_temp(parts_dir: Path) -> tuple[IO[bytes], Path]:
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    dst = tempfile.NamedTemporaryFile(dir=parts_dir, suffix=".tmp", delete=False)  # noqa: SIM115
+    return dst, Path(dst.name)
+
+
+async def _flush_block(dst: IO[bytes], hasher: Any, buffer: bytearray) -> None:
+    block = bytes(buffer)
+    buffer.clear()
+    await asyncio.to_thread(_write_and_hash, dst, hasher, block)
+
+
+def _write_and_hash(dst: IO[bytes], hasher: Any, block: bytes) -> None:
+    dst.write(block)
+    hasher.update(block)
+
+
+@dataclass
+class UploadSession:
+    """State of one resumable upload.
+
+    Attributes:
+        id: Upload ID returned to the client.
+        kind: Asset kind the upload will be stored as.
+        filename: Client-supplied filename.
+        content_type: Client-declared MIME type, if any.
+        size_bytes: Declared total size, if the client supplied one.
+        path: Part file receiving the bytes.
+        offset: Bytes received and hashed so far.
+        last_activity: Monotonic time of the last create/append.
+    """
+
+    id: str
+    kind: str
+    filename: str
+    content_type: str | None
+    size_bytes: int | None
+    path: Path
+    offset: int = 0
+    last_activity: float = 0.0
+    _hasher: Any = field(default_factory=hashlib.sha256, repr=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    @property
+    def busy(self) -> bool:
+        """True while an append is writing to the session."""
+        return self._lock.locked()
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 of the bytes received so far."""
+        return str(self._hasher.hexdigest())
+
+
+class AssetUploadStore:
+    """In-memory registry of resumable uploads backed by part files.
+
+    Held on ``app.state.asset_upload_store``; the app lifespan builds it
+    with `open_upload_store` at startup. Sessions idle for longer than the
+    TTL are discarded (with their part files) whenever the store is accessed.
+    """
+
+    def __init__(
+        self,
+        parts_dir: Path,
+        *,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty store and sweep stale part files.
+
+        Args:
+            parts_dir: Directory for part files (created if missing).
+            ttl_seconds: Idle time after which a session is discarded.
+            clock: Monotonic clock (injectable for tests).
+        """
+        self.parts_dir = parts_dir
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._sessions: dict[str, UploadSession] = {}
+        parts_dir.mkdir(parents=True, exist_ok=True)
+        self._sweep_orphans()
+
+    def create(
+        self,
+        *,
+        kind: str,
+        filename: str,
+        content_type: str | None = None,
+        size_bytes: int | None = None,
+    ) -> UploadSession:
+        """Start a new upload with an empty part file."""
+        self.purge_expired()
+        upload_id = str(uuid.uuid4())
+        path = self.parts_dir / f"{upload_id}.part"
+        path.touch()
+        session = UploadSession(
+            id=upload_id,
+            kind=kind,
+            filename=filename,
+            content_type=content_type,
+            size_bytes=size_bytes,
+            path=path,
+            last_activity=self._clock(),
+        )
+        self._sessions[upload_id] = session
+        return session
+
+    def get(self, upload_id: str) -> UploadSession | None:
+        """Return a live session, or None if unknown or expired."""
+        self.purge_expired()
+        return self._sessions.get(upload_id)
+
+    def remaining_seconds(self, session: UploadSession) -> float:
+        """Seconds until ``session`` expires if left idle."""
+        return max(0.0, self._ttl - (self._clock() - session.last_activity))
+
+    async def append(
+        self,
+        session: UploadSession,
+        chunks: AsyncIterator[bytes],
+        *,
+        offset: int,
+        max_bytes: int,
+    ) -> int:
+        """Append a byte range to ``session`` starting at ``offset``.
+
+        Incoming chunks are buffered up to `UPLOAD_CHUNK_BYTES` and each
+        block is written and hashed in a worker thread. Blocks written
+        before a dropped connection stay acknowledged, so the client
+        resumes from the returned (or re-queried) offset.
+
+        Args:
+            session: Target session.
+            chunks: Request body stream.
+            offset: Offset the client believes it is writing at.
+            max_bytes: Configured size limit.
+
+        Returns:
+            The new offset.
+
+        Raises:
+            UploadBusyError: If another append is running.
+            UploadOffsetMismatchError: If ``offset`` is not the current offset.
+            UploadTooLargeError: If the range would exceed ``max_bytes`` or
+                the declared size. The session is discarded.
+        """
+        if session.busy:
+            raise UploadBusyError(session.id)
+        async with session._lock:
+            if offset != session.offset:
+                raise UploadOffsetMismatchError(session.offset)
+            limit = max_bytes if session.size_bytes is None else min(max_bytes, session.size_bytes)
+            dst = await asyncio.to_thread(open, session.path, "ab")
+            try:
+                buffer = bytearray()
+                async for chunk in chunks:
+                    buffer += chunk
+                    if session.offset + len(buffer) > limit:
+                        self.discard(session.id)
+                        raise UploadTooLargeError(f"Upload exceeds {limit} bytes")
+                    if len(buffer) >= UPLOAD_CHUNK_BYTES:
+                        await self._flush(session, dst, buffer)
+                if buffer:
+                    await self._flush(session, dst, buffer)
+            finally:
+                await asyncio.to_thread(dst.close)
+                session.last_activity = self._clock()
+            return session.offset
+
+    def detach(self, upload_id: str) -> UploadSession | None:
+        """Remove a session from the store without deleting its part file."""
+        return self._sessions.pop(upload_id, None)
+
+    def discard(self, upload_id: str) -> None:
+        """Remove a session and delete its part file."""
+        session = self._sessions.pop(upload_id, None)
+        if session is not None:
+            session.path.unlink(missing_ok=True)
+
+    def purge_expired(self) -> None:
+        """Discard sessions idle for longer than the TTL."""
+        now = self._clock()
+        expired = [
+            upload_id
+            for upload_id, session in self._sessions.items()
+            if not session.busy and now - session.last_activity > self._ttl
+        ]
+        for upload_id in expired:
+            logger.info("asset.upload_expired", upload_id=upload_id)
+            self.discard(upload_id)
+
+    async def _flush(self, session: UploadSession, dst: IO[bytes], buffer: bytearray) -> None:
+        block = bytes(buffer)
+        buffer.clear()
+        await asyncio.to_thread(_write_and_hash, dst, session._hasher, block)
+        session.offset += len(block)
+
+    def _sweep_orphans(self) -> None:
+        """Delete part/temp files older than the TTL (left by a restart)."""
+        cutoff = time.time() - self._ttl
+        for path in self.parts_dir.iterdir():
+            if path.suffix not in (".part", ".tmp"):
+                continue
+            with contextlib.suppress(OSError):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+
+
+async def open_upload_store(parts_dir: Path, *, ttl_seconds: float) -> AssetUploadStore:
+    """Create an `AssetUploadStore` in a worker thread.
+
+    Construction creates ``parts_dir`` and sweeps orphaned part files,
+    which is blocking filesystem I/O that must stay off the event loop.
+
+    Args:
+        parts_dir: Directory for part files (created if missing).
+        ttl_seconds: Idle time after which a session is discarded.
+
+    Returns:
+        The new store.
+    """
+    return await asyncio.to_thread(AssetUploadStore, parts_dir, ttl_seconds=ttl_seconds)
@@ -0,0 +1,206 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Pre-serialised, pre-compressed discovery payloads.
+
+Agents fetch ``GET /api/v1/effects``, ``GET /api/v1/schema/{resource}`` and
+``GET /openapi.json`` at the start of every session. Their content only
+changes when the effect registry changes or the process restarts, yet each
+call used to rebuild the models, serialise them and (behind a compressing
+proxy) compress them again. `DiscoveryCache` keeps each payload as:
+
+- the JSON body, serialised once;
+- gzip and, when the optional ``brotli`` package is installed, Brotli
+  encodings of it;
+- a strong ``ETag`` derived from the body. Compressed representations get
+  their own tag (``"<digest>-gzip"``, ``"<digest>-br"``), as RFC 9110
+  requires for strong validators.
+
+Entries are rebuilt when the caller's version key changes (for effects, the
+registry's ``version``). `payload_response` negotiates ``Accept-Encoding``
+and answers ``If-None-Match`` hits with ``304 Not Modified``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import importlib
+import importlib.util
+import json
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Request, Response, status
+
+# Brotli needs the optional ``brotli`` package; gzip is always available.
+_BROTLI_AVAILABLE = importlib.util.find_spec("brotli") is not None
+
+DISCOVERY_CACHE_CONTROL = "no-cache"
+
+_GZIP_LEVEL = 9
+_BROTLI_QUALITY = 11
+
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    """One discovery payload in every encoding it is served with.
+
+    Attributes:
+        identity: Uncompressed JSON body.
+        etag: Strong ETag of the uncompressed body.
+        encodings: Compressed bodies by content coding (``gzip``, ``br``).
+    """
+
+    identity: bytes
+    etag: str
+    encodings: dict[str, bytes]
+
+    def etag_for(self, coding: str | None) -> str:
+        """Return the ETag of the representation with content coding ``coding``.
+
+        Args:
+            coding: ``gzip``, ``br`` or None for the uncompressed body.
+
+        Returns:
+            The quoted strong ETag.
+        """
+        if coding is None:
+            return self.etag
+        return f'{self.etag[:-1]}-{coding}"'
+
+
+def encode_payload(content: Any) -> EncodedPayload:
+    """Serialise ``content`` and compress it once.
+
+    The JSON matches FastAPI's ``JSONResponse`` rendering.
+
+    Args:
+        content: JSON-compatible value (e.g. a ``model_dump(mode="json")``).
+
+    Returns:
+        The encoded payload.
+    """
+    body = json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    # mtime=0 keeps the gzip bytes (and so their ETag) stable across restarts
+    encodings = {"gzip": gzip.compress(body, compresslevel=_GZIP_LEVEL, mtime=0)}
+    if _BROTLI_AVAILABLE:
+        brotli = importlib.import_module("brotli")
+        encodings["br"] = brotli.compress(body, quality=_BROTLI_QUALITY)
+    return EncodedPayload(identity=body, etag=etag, encodings=encodings)
+
+
+class DiscoveryCache:
+    """Named discovery payloads, rebuilt when their version key changes."""
+
+    def __init__(self) -> None:
+        # name -> (version key, payload)
+        self._entries: dict[str, tuple[Hashable, EncodedPayload]] = {}
+
+    def get(self, name: str, version: Hashable, build: Callable[[], Any]) -> EncodedPayload:
+        """Return the payload ``name``, building it when missing or stale.
+
+        Args:
+            name: Payload name, e.g. ``effects`` or ``schema:clip``.
+            version: Key identifying the payload's source state; a
+                different value rebuilds the payload.
+            build: Returns the JSON-compatible content. Exceptions
+                propagate and nothing is cached.
+
+        Returns:
+            The cached or freshly encoded payload.
+        """
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        payload = encode_payload(build())
+        self._entries[name] = (version, payload)
+        return payload
+
+    def clear(self) -> None:
+        """Drop every payload."""
+        self._entries.clear()
+
+
+def get_discovery_cache(request: Request) -> DiscoveryCache:
+    """Return the app's discovery cache, creating it on first use.
+
+    Args:
+        request: The incoming request.
+
+    Returns:
+        The cache stored on ``app.state.discovery_cache``.
+    """
+    cache: DiscoveryCache | None = getattr(request.app.state, "discovery_cache", None)
+    if cache is None:
+        cache = DiscoveryCache()
+        request.app.state.discovery_cache = cache
+    return cache
+
+
+def _accepted_codings(accept_encoding: str | None) -> set[str]:
+    """Content codings the client accepts with a non-zero quality."""
+    accepted: set[str] = set()
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _choose_coding(payload: EncodedPayload, accept_encoding: str | None) -> str | None:
+    """Pick the best available coding: Brotli, then gzip, else identity."""
+    accepted = _accepted_codings(accept_encoding)
+    for coding in ("br", "gzip"):
+        if coding in payload.encodings and (coding in accepted or "*" in accepted):
+            return coding
+    return None
+
+
+def _if_none_match_hits(if_none_match: str | None, payload: EncodedPayload) -> bool:
+    """Weak comparison of ``If-None-Match`` against every representation's tag."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    tags = {payload.etag_for(None), *(payload.etag_for(c) for c in payload.encodings)}
+    return "*" in candidates or not candidates.isdisjoint(tags)
+
+
+def payload_response(request: Request, payload: EncodedPayload) -> Response:
+    """Serve ``payload`` with content negotiation and conditional GET.
+
+    Args:
+        request: The incoming request (``Accept-Encoding``, ``If-None-Match``).
+        payload: The encoded payload.
+
+    Returns:
+        A ``304 Not Modified`` response when ``If-None-Match`` matches any
+        representation of the payload, otherwise a JSON response in the
+        best encoding the client accepts.
+    """
+    coding = _choose_coding(payload, request.headers.get("accept-encoding"))
+    headers = {
+        "ETag": payload.etag_for(coding),
+        "Cache-Control": DISCOVERY_CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+    if _if_none_match_hits(request.headers.get("if-none-match"), payload):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if coding is None:
+        body = payload.identity
+    else:
+        body = payload.encodings[coding]
+        headers["Content-Encoding"] = coding
+    return Response(content=body, media_type="application/json", headers=headers)
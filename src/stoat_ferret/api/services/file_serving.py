@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Streamed, conditionally cached serving of on-disk media artifacts.
+
+Preview segments, thumbnail strips, waveform images and video thumbnails
+used to be read into memory (or served with Starlette's mtime/size ETag
+and no revalidation support). `serve_file` builds on `FileResponse`:
+
+- The body is streamed from disk in chunks (or handed to the server with
+  the ASGI ``http.response.pathsend`` extension where supported), so a
+  file is never copied into Python memory as a whole.
+- ``Range``/``If-Range`` requests get ``206 Partial Content`` (Starlette
+  0.39+, hence the ``fastapi>=0.115.3`` floor).
+- The strong ``ETag`` is derived from file identity (inode, size and
+  mtime in nanoseconds). A file rewritten at the same path gets a new tag.
+- ``If-None-Match`` hits return ``304 Not Modified`` without opening the
+  file.
+- Artifacts requested through a content-addressed URL (one carrying the
+  current `file_version`) are marked ``immutable``; everything else must
+  revalidate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from collections.abc import Mapping
+from pathlib import Path
+
+from fastapi import Request, Response, status
+from fastapi.responses import FileResponse
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+def file_version(stat_result: os.stat_result) -> str:
+    """Return a short token identifying one version of a file on disk.
+
+    Args:
+        stat_result: Result of ``os.stat`` on the file.
+
+    Returns:
+        A 16-character hex digest of inode, size and mtime (ns).
+    """
+    identity = f"{stat_result.st_ino}-{stat_result.st_size}-{stat_result.st_mtime_ns}"
+    return hashlib.blake2b(identity.encode(), digest_size=8).hexdigest()
+
+
+def _if_none_match_hits(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against ``etag`` (RFC 9110)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def serve_file(
+    request: Request,
+    path: str | Path,
+    *,
+    media_type: str,
+    immutable: bool = False,
+    headers: Mapping[str, str] | None = None,
+    stat_result: os.stat_result | None = None,
+) -> Response:
+    """Stream ``path`` with a file-identity ETag and Range support.
+
+    Args:
+        request: The incoming request (for ``If-None-Match``).
+        path: File to serve. Callers check existence first.
+        media_type: Response ``Content-Type``.
+        immutable: Mark the response cacheable forever. Only pass True
+            when the URL itself identifies this version of the file.
+        headers: Extra headers for both the 200/206 and 304 responses.
+        stat_result: Pre-computed ``os.stat`` of ``path``, if the caller
+            already has one.
+
+    Returns:
+        A ``304 Not Modified`` response or a streaming `FileResponse`.
+
+    Raises:
+        OSError: If the file cannot be stat'ed.
+    """
+    if stat_result is None:
+        stat_result = os.stat(path)
+    etag = f'"{file_version(stat_result)}"'
+    response_headers = {
+        **(headers or {}),
+        "ETag": etag,
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL,
+    }
+    if _if_none_match_hits(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=response_headers)
+    return FileResponse(
+        path,
+        media_type=media_type,
+        headers=response_headers,
+        stat_result=stat_result,
+    )
@@ -0,0 +1,166 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""TTL caches backing the readiness probe.
+
+Kubernetes-style deployments call ``GET /health/ready`` several times a
+second per replica. Running every subsystem check (and spawning
+``ffmpeg -version``) on each call is wasted work, so readiness is served
+from two caches:
+
+- A short-lived snapshot of all check results (``health_snapshot_ttl_seconds``).
+- Longer-lived capability probes such as the FFmpeg version
+  (``health_capability_ttl_seconds``), which only change on redeploy.
+
+Both use stale-while-revalidate: once an entry expires the stale value is
+still returned immediately while a single background task refreshes it.
+Only the very first call for an entry waits for the probe.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class CachedProbe(Generic[T]):
+    """Single-flight, TTL-cached result of an async probe.
+
+    The probe callable is supplied on each `get` so it can close over the
+    current request; concurrent callers share one in-flight probe.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        *,
+        name: str,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise an empty cache entry.
+
+        Args:
+            ttl_seconds: How long a result is fresh. 0 disables caching and
+                runs the probe on every call.
+            name: Probe name used in log events.
+            clock: Monotonic clock (injectable for tests).
+        """
+        self._ttl = ttl_seconds
+        self._name = name
+        self._clock = clock
+        self._value: T | None = None
+        self._has_value = False
+        self._fetched_at = 0.0
+        self._refresh: asyncio.Task[T] | None = None
+
+    @property
+    def age_seconds(self) -> float | None:
+        """Seconds since the cached value was produced, or None if empty."""
+        if not self._has_value:
+            return None
+        return self._clock() - self._fetched_at
+
+    @property
+    def refreshing(self) -> bool:
+        """True while a probe is running."""
+        return self._refresh is not None and not self._refresh.done()
+
+    async def get(self, probe: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value, probing only when empty or expired.
+
+        Args:
+            probe: Zero-argument coroutine factory producing a fresh value.
+
+        Returns:
+            The fresh or stale cached value; on a cold cache, the probe result.
+        """
+        if self._ttl <= 0:
+            return await probe()
+        if self._has_value:
+            if self._clock() - self._fetched_at >= self._ttl:
+                self._start_refresh(probe)
+            return self._value  # type: ignore[return-value]
+        # Shield so a caller's timeout does not cancel the probe other callers share.
+        return await asyncio.shield(self._start_refresh(probe))
+
+    def invalidate(self) -> None:
+        """Drop the cached value so the next `get` probes synchronously."""
+        self._has_value = False
+        self._value = None
+
+    async def aclose(self) -> None:
+        """Cancel an in-flight background refresh."""
+        if self._refresh is not None and not self._refresh.done():
+            self._refresh.cancel()
+            await asyncio.wait({self._refresh}, timeout=5.0)
+        self._refresh = None
+
+    def _start_refresh(self, probe: Callable[[], Awaitable[T]]) -> asyncio.Task[T]:
+        if self._refresh is None or self._refresh.done():
+            self._refresh = asyncio.create_task(self._run(probe))
+            self._refresh.add_done_callback(self._log_failure)
+        return self._refresh
+
+    async def _run(self, probe: Callable[[], Awaitable[T]]) -> T:
+        value = await probe()
+        self._value = value
+        self._fetched_at = self._clock()
+        self._has_value = True
+        return value
+
+    def _log_failure(self, task: asyncio.Task[T]) -> None:
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.warning("health.probe_refresh_failed", probe=self._name, error=repr(exc))
+
+
+@dataclass
+class ReadinessSnapshot:
+    """Results of one full run of the readiness checks.
+
+    Attributes:
+        checks: Per-check result dicts keyed by check name.
+        critical_healthy: Whether every critical check reported "ok".
+        any_degraded: Whether any non-critical check reported non-"ok".
+    """
+
+    checks: dict[str, dict[str, Any]]
+    critical_healthy: bool
+    any_degraded: bool
+
+
+@dataclass
+class HealthCache:
+    """Per-app readiness caches, held on ``app.state.health_cache``.
+
+    Attributes:
+        snapshot: Cached full set of readiness check results.
+        ffmpeg: Cached FFmpeg version probe.
+    """
+
+    snapshot: CachedProbe[ReadinessSnapshot]
+    ffmpeg: CachedProbe[dict[str, Any]]
+
+    @classmethod
+    def create(cls, snapshot_ttl_seconds: float, capability_ttl_seconds: float) -> HealthCache:
+        """Build empty caches with the given TTLs."""
+        return cls(
+            snapshot=CachedProbe(snapshot_ttl_seconds, name="readiness_snapshot"),
+            ffmpeg=CachedProbe(capability_ttl_seconds, name="ffmpeg_version"),
+        )
+
+    async def aclose(self) -> None:
+        """Cancel background refreshes (called on app shutdown)."""
+        await self.snapshot.aclose()
+        await self.ffmpeg.aclose()
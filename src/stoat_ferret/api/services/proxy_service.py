@@ -5,20 +5,35 @@
 
 Orchestrates FFmpeg proxy transcoding as background jobs with progress
 reporting, storage quota management, and stale proxy detection.
+
+Proxies record the source's sampled fingerprint checksum (see
+`stoat_ferret.api.services.source_fingerprint`). When a video repository
+is supplied, the fingerprint stored on the ``videos`` row lets staleness
+checks answer from ``stat`` alone while the source is unchanged; a full
+hash computed for a legacy proxy is written back to the row so it is
+computed once rather than on every check.
 """
 
 from __future__ import annotations
 
-import hashlib
 import os
 import time
+from dataclasses import replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from stoat_ferret.api.services.source_fingerprint import (
+    FULL_HASH_BUFFER_BYTES,
+    SourceFingerprint,
+    compute_full_sha256,
+    current_checksum,
+    fingerprint_from_video,
+    needs_full_hash,
+)
 from stoat_ferret.api.websocket.events import EventType, build_event
-from stoat_ferret.db.models import ProxyFile, ProxyQuality, ProxyStatus
+from stoat_ferret.db.models import ProxyFile, ProxyQuality, ProxyStatus, Video
 from stoat_ferret.ffmpeg.async_executor import ProgressInfo
 from stoat_ferret.preview.metrics import (
     proxy_evictions_total,
@@ -31,6 +46,7 @@ if TYPE_CHECKING:
     import asyncio
 
     from stoat_ferret.api.websocket.manager import ConnectionManager
+    from stoat_ferret.db.async_repository import AsyncVideoRepository
     from stoat_ferret.db.proxy_repository import AsyncProxyRepository
     from stoat_ferret.ffmpeg.async_executor import AsyncFFmpegExecutor
     from stoat_ferret.jobs.queue import AsyncJobQueue
@@ -115,8 +131,11 @@ def build_ffmpeg_args(
     ]
 
 
-def compute_file_checksum(file_path: str, chunk_size: int = 8192) -> str:
-    """Compute SHA-256 checksum of a file.
+def compute_file_checksum(file_path: str, chunk_size: int = FULL_HASH_BUFFER_BYTES) -> str:
+    """Compute SHA-256 checksum of a whole file.
+
+    Only needed to compare against proxies recorded before sampled
+    fingerprints; new proxies use `current_checksum`.
 
     Args:
         file_path: Path to the file.
@@ -125,11 +144,7 @@ def compute_file_checksum(file_path: str, chunk_size: int = 8192) -> str:
     Returns:
         Hex-encoded SHA-256 hash string.
     """
-    sha256 = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        while chunk := f.read(chunk_size):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+    return compute_full_sha256(file_path, buffer_bytes=chunk_size)
 
 
 class ProxyService:
@@ -147,6 +162,7 @@ class ProxyService:
         async_executor: AsyncFFmpegExecutor,
         ws_manager: ConnectionManager | None = None,
         job_queue: AsyncJobQueue | None = None,
+        video_repository: AsyncVideoRepository | None = None,
         proxy_dir: str = "proxies",
         max_storage_bytes: int = DEFAULT_MAX_STORAGE_BYTES,
         cleanup_threshold: float = CLEANUP_THRESHOLD,
@@ -158,6 +174,8 @@ class ProxyService:
             async_executor: Async FFmpeg executor for transcoding.
             ws_manager: Optional WebSocket manager for progress broadcasting.
             job_queue: Optional job queue for progress tracking.
+            video_repository: Optional video repository holding stored source
+                fingerprints. Without it every check hashes the source.
             proxy_dir: Directory to store proxy files.
             max_storage_bytes: Maximum storage quota in bytes.
             cleanup_threshold: Fraction triggering cleanup (0.0-1.0).
@@ -166,6 +184,7 @@ class ProxyService:
         self._executor = async_executor
         self._ws_manager = ws_manager
         self._job_queue = job_queue
+        self._video_repo = video_repository
         self._proxy_dir = proxy_dir
         self.max_storage_bytes = max_storage_bytes
         self.cleanup_threshold = cleanup_threshold
@@ -214,8 +233,9 @@ class ProxyService:
         # Check storage quota and evict if necessary
         await self._check_quota_and_evict()
 
-        # Compute source checksum
-        source_checksum = await _run_in_thread(compute_file_checksum, source_path)
+        # Source checksum (free when the stored fingerprint is current)
+        known = await self._stored_fingerprint(video_id)
+        source_checksum = await _run_in_thread(current_checksum, source_path, None, known)
 
         # Create proxy directory
         proxy_dir = Path(self._proxy_dir)
@@ -382,6 +402,13 @@ class ProxyService:
     async def check_stale(self, proxy_id: str, source_path: str) -> bool:
         """Check if a proxy is stale by comparing source checksums.
 
+        The source's current checksum is derived in the scheme the proxy
+        recorded (sampled fingerprint, or full SHA-256 for older proxies).
+        A stored fingerprint whose size/mtime/inode still match the file
+        answers without reading it. When a legacy proxy forces a full hash
+        that matches, it is stored as the row's ``content_sha256`` so later
+        checks of the unchanged file are stat-only too.
+
         Args:
             proxy_id: The proxy file ID.
             source_path: Path to the current source video.
@@ -396,8 +423,10 @@ class ProxyService:
         if proxy is None:
             raise ValueError(f"Proxy {proxy_id} not found")
 
-        current_checksum = await _run_in_thread(compute_file_checksum, source_path)
-        if current_checksum != proxy.source_checksum:
+        video = await self._stored_video(proxy.source_video_id)
+        known = fingerprint_from_video(video) if video is not None else None
+        checksum = await _run_in_thread(current_checksum, source_path, proxy.source_checksum, known)
+        if checksum != proxy.source_checksum:
             await self._repo.update_status(proxy.id, ProxyStatus.STALE)
             proxy_files_total.labels(status="ready").dec()
             proxy_files_total.labels(status="stale").inc()
@@ -407,8 +436,51 @@ class ProxyService:
                 video_id=proxy.source_video_id,
             )
             return True
+        if (
+            video is not None
+            and known is not None
+            and known.full_sha256 is None
+            and needs_full_hash(proxy.source_checksum)
+        ):
+            # The full hash just computed matched; keep it so the next check
+            # of the unchanged file is stat-only.
+            stat_result = await _run_in_thread(os.stat, source_path)
+            if known.matches_stat(stat_result):
+                await self._store_fingerprint(video, replace(known, full_sha256=checksum))
         return False
 
+    async def _stored_fingerprint(self, video_id: str) -> SourceFingerprint | None:
+        """Return the fingerprint stored on the video's row, if available."""
+        video = await self._stored_video(video_id)
+        return fingerprint_from_video(video) if video is not None else None
+
+    async def _stored_video(self, video_id: str) -> Video | None:
+        """Return the video's row, if a video repository was supplied."""
+        if self._video_repo is None:
+            return None
+        return await self._video_repo.get(video_id)
+
+    async def _store_fingerprint(self, video: Video, fingerprint: SourceFingerprint) -> None:
+        """Write ``fingerprint`` (including its full hash) back to the video's row.
+
+        Only the fingerprint columns are written, so edits made to the row
+        while the full hash was computed are preserved.
+        """
+        if self._video_repo is None:
+            return
+        try:
+            await self._video_repo.update_fingerprint(
+                video.id,
+                path=video.path,
+                file_size=fingerprint.size_bytes,
+                file_mtime_ns=fingerprint.mtime_ns,
+                file_inode=fingerprint.inode,
+                sampled_sha256=fingerprint.sampled_sha256,
+                content_sha256=fingerprint.full_sha256,
+            )
+        except Exception:
+            logger.warning("proxy_fingerprint_store_failed", video_id=video.id, exc_info=True)
+
     async def _check_quota_and_evict(self) -> None:
         """Check storage quota and evict LRU proxies if over threshold."""
         total = await self._repo.total_size_bytes()
@@ -23,6 +23,7 @@ import structlog
 
 from stoat_ferret.api.websocket.events import EventType, build_event
 from stoat_ferret.db.qc_repository import AsyncQCReportRepository, QCReportRecord
+from stoat_ferret.ffmpeg.governor import ThreadGovernor, apply_thread_limits, thread_lease
 
 if TYPE_CHECKING:
     from stoat_ferret.api.settings import Settings
@@ -141,6 +142,7 @@ class QCService:
         connection_manager: ConnectionManager,
         settings: Settings,
         subprocess_factory: Callable[..., Any] | None = None,
+        governor: ThreadGovernor | None = None,
     ) -> None:
         """Initialise the service.
 
@@ -149,11 +151,13 @@ class QCService:
             connection_manager: WebSocket broadcast channel.
             settings: Application settings.
             subprocess_factory: Override for asyncio.create_subprocess_exec (testing only).
+            governor: Optional thread governor limiting each FFmpeg pass.
         """
         self._repo = repository
         self._ws = connection_manager
         self._settings = settings
         self._subprocess = subprocess_factory or asyncio.create_subprocess_exec
+        self._governor = governor
 
     async def run_checks(
         self,
@@ -284,8 +288,10 @@ class QCService:
 
     async def _run_ffmpeg(self, *args: str) -> tuple[str, str, int]:
         """Run an FFmpeg command and return (stdout, stderr, returncode)."""
-        proc = await self._subprocess("ffmpeg", *args, stdout=PIPE, stderr=PIPE)
-        stdout_b, stderr_b = await proc.communicate()
+        with thread_lease(self._governor, "qc") as lease:
+            argv = list(args) if lease is None else apply_thread_limits(list(args), lease.threads)
+            proc = await self._subprocess("ffmpeg", *argv, stdout=PIPE, stderr=PIPE)
+            stdout_b, stderr_b = await proc.communicate()
         returncode = proc.returncode if proc.returncode is not None else 0
         return (
             stdout_b.decode("utf-8", errors="replace"),
@@ -16,6 +16,7 @@ import structlog
 
 from stoat_ferret.api.schemas.video import ScanError, ScanResponse
 from stoat_ferret.api.services.proxy_service import PROXY_JOB_TYPE
+from stoat_ferret.api.services.source_fingerprint import fingerprint_file, fingerprint_from_video
 from stoat_ferret.api.settings import get_settings
 from stoat_ferret.api.websocket.events import EventType, build_event
 from stoat_ferret.db.async_repository import AsyncVideoRepository
@@ -387,6 +388,10 @@ async def _scan_one_file(
         # Check if already exists
         existing = await repository.get_by_path(str_path)
 
+        # Refresh the stored fingerprint (stat-only when the file is unchanged)
+        known = fingerprint_from_video(existing) if existing else None
+        fingerprint = await asyncio.to_thread(fingerprint_file, str_path, known)
+
         # Probe video metadata
         metadata = await ffprobe_video(str_path)
 
@@ -411,13 +416,17 @@ async def _scan_one_file(
             height=metadata.height,
             video_codec=metadata.video_codec,
             audio_codec=metadata.audio_codec,
-            file_size=file_path.stat().st_size,
+            file_size=fingerprint.size_bytes,
             thumbnail_path=thumbnail_path,
             created_at=existing.created_at if existing else datetime.now(timezone.utc),
             updated_at=datetime.now(timezone.utc),
             subtitle_count=metadata.subtitle_count,
             data_count=metadata.data_count,
             subtitle_streams=metadata.subtitle_streams,
+            file_mtime_ns=fingerprint.mtime_ns,
+            file_inode=fingerprint.inode,
+            sampled_sha256=fingerprint.sampled_sha256,
+            content_sha256=fingerprint.full_sha256,
         )
 
         if existing:
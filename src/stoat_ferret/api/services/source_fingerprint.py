@@ -0,0 +1,202 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tiered fingerprints for source media files.
+
+Proxy staleness used to be decided by a full SHA-256 of the source read
+in 8 KiB chunks, both when a proxy was generated and on every rescan. On
+multi-GB camera files that is a full read each time. Fingerprints are
+resolved in three tiers, each used only when the cheaper one cannot
+answer:
+
+1. **Stat identity** — size, ``st_mtime_ns`` and inode. If these match
+   the values stored on the ``videos`` row, the stored hashes are reused
+   without opening the file.
+2. **Sampled hash** — SHA-256 over the file size and three
+   `SAMPLE_BLOCK_BYTES` blocks (head, middle, tail). Container headers,
+   indexes and trailers live in those regions, so edits and re-exports
+   change it while reading at most a few MiB. This is the token proxies
+   record as their ``source_checksum``.
+3. **Full hash** — SHA-256 of the whole file with `FULL_HASH_BUFFER_BYTES`
+   reads, computed only on demand (``full=True``) or to compare against a
+   legacy full-hash checksum.
+
+All functions here are blocking; callers run them via ``asyncio.to_thread``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from stoat_ferret.db.models import Video
+
+# Size of each head/middle/tail block read for the sampled hash.
+SAMPLE_BLOCK_BYTES = 1024 * 1024
+
+# Read size for full hashes (large reads keep syscall overhead negligible).
+FULL_HASH_BUFFER_BYTES = 4 * 1024 * 1024
+
+# Prefix distinguishing sampled-hash checksums from legacy full SHA-256 ones.
+SAMPLED_CHECKSUM_PREFIX = "sampled:"
+
+
+@dataclass(frozen=True)
+class SourceFingerprint:
+    """Identity and content hashes of one version of a source file.
+
+    Attributes:
+        size_bytes: File size.
+        mtime_ns: Modification time in nanoseconds.
+        inode: Inode number (0 where the platform does not report one).
+        sampled_sha256: Hex SHA-256 of the size plus head/middle/tail blocks.
+        full_sha256: Hex SHA-256 of the whole file, if it has been computed.
+    """
+
+    size_bytes: int
+    mtime_ns: int
+    inode: int
+    sampled_sha256: str
+    full_sha256: str | None = None
+
+    @property
+    def checksum(self) -> str:
+        """Cache key recorded by proxies (and other derived artifacts)."""
+        return f"{SAMPLED_CHECKSUM_PREFIX}{self.sampled_sha256}"
+
+    def checksum_for(self, recorded: str | None) -> str:
+        """Return this fingerprint's checksum in the same scheme as ``recorded``.
+
+        Raises:
+            ValueError: If ``recorded`` is a legacy full-hash checksum and the
+                full hash has not been computed.
+        """
+        if not needs_full_hash(recorded):
+            return self.checksum
+        if self.full_sha256 is None:
+            raise ValueError("Full hash required to compare with a legacy checksum")
+        return self.full_sha256
+
+    def matches_stat(self, stat_result: os.stat_result) -> bool:
+        """Return True if ``stat_result`` describes the fingerprinted version."""
+        return (
+            stat_result.st_size == self.size_bytes
+            and stat_result.st_mtime_ns == self.mtime_ns
+            and stat_result.st_ino == self.inode
+        )
+
+
+def needs_full_hash(recorded: str | None) -> bool:
+    """Return True if ``recorded`` is a legacy full SHA-256 checksum."""
+    return recorded is not None and not recorded.startswith(SAMPLED_CHECKSUM_PREFIX)
+
+
+def compute_full_sha256(path: str, *, buffer_bytes: int = FULL_HASH_BUFFER_BYTES) -> str:
+    """Return the SHA-256 of the whole file.
+
+    Args:
+        path: File to hash.
+        buffer_bytes: Read size.
+
+    Returns:
+        Hex digest.
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb", buffering=0) as f:
+        while chunk := f.read(buffer_bytes):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def compute_sampled_sha256(
+    path: str, size_bytes: int, *, block_bytes: int = SAMPLE_BLOCK_BYTES
+) -> str:
+    """Return the SHA-256 of ``size_bytes`` plus the head, middle and tail blocks.
+
+    Files no larger than three blocks are hashed whole.
+
+    Args:
+        path: File to hash.
+        size_bytes: File size (from the same ``stat`` as the fingerprint).
+        block_bytes: Size of each sampled block.
+
+    Returns:
+        Hex digest.
+    """
+    sha256 = hashlib.sha256(size_bytes.to_bytes(8, "big"))
+    with open(path, "rb") as f:
+        if size_bytes <= 3 * block_bytes:
+            sha256.update(f.read())
+            return sha256.hexdigest()
+        for offset in (0, (size_bytes - block_bytes) // 2, size_bytes - block_bytes):
+            f.seek(offset)
+            sha256.update(f.read(block_bytes))
+    return sha256.hexdigest()
+
+
+def fingerprint_file(
+    path: str, known: SourceFingerprint | None = None, *, full: bool = False
+) -> SourceFingerprint:
+    """Fingerprint ``path``, reusing ``known`` when the file is unchanged.
+
+    Args:
+        path: File to fingerprint.
+        known: Previously stored fingerprint of the same path, if any.
+        full: Also compute (or reuse) the full-file hash.
+
+    Returns:
+        The current fingerprint.
+
+    Raises:
+        OSError: If the file cannot be stat'ed or read.
+    """
+    stat_result = os.stat(path)
+    if known is not None and known.matches_stat(stat_result):
+        if full and known.full_sha256 is None:
+            return replace(known, full_sha256=compute_full_sha256(path))
+        return known
+    return SourceFingerprint(
+        size_bytes=stat_result.st_size,
+        mtime_ns=stat_result.st_mtime_ns,
+        inode=stat_result.st_ino,
+        sampled_sha256=compute_sampled_sha256(path, stat_result.st_size),
+        full_sha256=compute_full_sha256(path) if full else None,
+    )
+
+
+def current_checksum(
+    path: str, recorded: str | None = None, known: SourceFingerprint | None = None
+) -> str:
+    """Return the checksum of ``path`` in the same scheme as ``recorded``.
+
+    Checksums recorded with `SAMPLED_CHECKSUM_PREFIX` are compared by
+    sampled hash; anything else is a legacy full SHA-256 and needs the
+    full-hash tier. Either way a ``known`` fingerprint whose stat identity
+    still matches answers without reading the file.
+
+    Args:
+        path: Current source file.
+        recorded: Checksum stored with the derived artifact, or None for a
+            new artifact (sampled scheme).
+        known: Fingerprint stored on the ``videos`` row, if any.
+
+    Returns:
+        A checksum directly comparable with ``recorded``.
+    """
+    return fingerprint_file(path, known, full=needs_full_hash(recorded)).checksum_for(recorded)
+
+
+def fingerprint_from_video(video: Video) -> SourceFingerprint | None:
+    """Return the fingerprint stored on a ``videos`` row, if it has one."""
+    if video.file_mtime_ns is None or video.sampled_sha256 is None:
+        return None
+    return SourceFingerprint(
+        size_bytes=video.file_size,
+        mtime_ns=video.file_mtime_ns,
+        inode=video.file_inode or 0,
+        sampled_sha256=video.sampled_sha256,
+        full_sha256=video.content_sha256,
+    )
@@ -0,0 +1,281 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Incrementally maintained model behind ``GET /api/v1/system/state``.
+
+Agents poll the system state endpoint frequently. Rebuilding it from two
+``list_by_status`` queries on every call made each poll a pair of SQLite
+round-trips, so `SystemStateTracker` keeps the active render jobs in
+memory instead:
+
+- Render jobs are seeded once from the render repository and then kept
+  current through the repository's change listeners, which fire on every
+  create, status/progress update and delete.
+- Generic queue jobs and the WebSocket connection count already live in
+  memory; they are re-read on each access and compared against the last
+  fingerprint.
+
+Every observed change bumps a monotonically increasing ``version``. The
+router turns it into an ``ETag`` for conditional requests and uses
+`SystemStateTracker.wait_for_change` for ``wait_for_version`` long-polls.
+The version restarts with the process; the ETag carries a per-process
+epoch so a restart never produces a false 304.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+import structlog
+
+from stoat_ferret.api.schemas.system_state import JobSummary, SystemState
+from stoat_ferret.render.models import RenderJob, RenderStatus
+
+logger = structlog.get_logger(__name__)
+
+# Render statuses reported in active_jobs, in response order.
+_ACTIVE_RENDER_STATUSES: tuple[RenderStatus, ...] = (RenderStatus.RUNNING, RenderStatus.QUEUED)
+
+
+def _render_summary(job: RenderJob) -> JobSummary:
+    return JobSummary(
+        job_id=job.id,
+        job_type="render",
+        status=job.status.value,
+        progress=job.progress,
+        submitted_at=job.created_at,
+    )
+
+
+def _compute_uptime_seconds(app_state: object) -> float:
+    """Return seconds elapsed since the startup gate opened.
+
+    Uses ``app.state._startup_timestamp`` (an ISO8601 string set by the
+    lifespan once all subsystems are ready). Returns ``0.0`` before the
+    startup gate opens so the response schema (``uptime_seconds: float``)
+    stays populated even during boot races.
+    """
+    startup_ts = getattr(app_state, "_startup_timestamp", None)
+    if not startup_ts:
+        return 0.0
+    try:
+        started = datetime.fromisoformat(startup_ts)
+    except (TypeError, ValueError):
+        return 0.0
+    if started.tzinfo is None:
+        started = started.replace(tzinfo=timezone.utc)
+    now = datetime.now(timezone.utc)
+    return max(0.0, (now - started).total_seconds())
+
+
+class SystemStateTracker:
+    """Versioned, in-memory view of active jobs and open connections.
+
+    Subsystems are resolved from ``app.state`` on every refresh, so a
+    subsystem that is swapped or removed after startup is picked up (and a
+    replaced render repository is re-seeded). Missing or failing
+    subsystems contribute nothing rather than raising (NFR-003).
+    """
+
+    def __init__(self, app_state: Any, *, recheck_interval_seconds: float = 1.0) -> None:
+        """Create an empty tracker; the first refresh seeds it.
+
+        Args:
+            app_state: The application's ``app.state``.
+            recheck_interval_seconds: How often a long-poll re-reads the
+                in-memory sources, which do not signal their own changes.
+        """
+        self._app_state = app_state
+        self._recheck_interval = recheck_interval_seconds
+        self._epoch = uuid.uuid4().hex[:12]
+        self._version = 0
+        self._changed = asyncio.Event()
+        self._render_repo: Any = None
+        self._listening = False
+        self._render_live = False
+        self._seed_lock = asyncio.Lock()
+        self._touched_while_seeding: set[str] | None = None
+        self._render_jobs: dict[str, JobSummary] = {}
+        self._queue_jobs: list[JobSummary] = []
+        self._connections = 0
+        self._fingerprint: tuple[Any, ...] | None = None
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every observed change."""
+        return self._version
+
+    @property
+    def etag(self) -> str:
+        """Weak ETag for the current version (timestamp/uptime excluded)."""
+        return f'W/"{self._epoch}-{self._version}"'
+
+    async def snapshot(self) -> SystemState:
+        """Refresh the in-memory sources and return the current state."""
+        await self._refresh()
+        return self._build()
+
+    async def wait_for_change(self, after_version: int, timeout_seconds: float) -> bool:
+        """Block until ``version`` exceeds ``after_version`` or the timeout expires.
+
+        A version ahead of the tracker (a client carrying a number from
+        before a restart) returns immediately so the caller resynchronises.
+
+        Args:
+            after_version: Last version the caller has seen.
+            timeout_seconds: Maximum seconds to wait.
+
+        Returns:
+            True when the state changed, False on timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        while True:
+            await self._refresh()
+            if self._version != after_version:
+                return True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            changed = self._changed
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    changed.wait(), timeout=min(remaining, self._recheck_interval)
+                )
+
+    def close(self) -> None:
+        """Detach from the render repository (called on app shutdown)."""
+        self._detach()
+
+    async def _refresh(self) -> None:
+        await self._sync_render_jobs()
+        self._sync_in_memory()
+
+    async def _sync_render_jobs(self) -> None:
+        repo = getattr(self._app_state, "render_repository", None)
+        if repo is not self._render_repo:
+            self._detach()
+            self._render_repo = repo
+            self._render_live = False
+            if self._render_jobs:
+                self._render_jobs = {}
+                self._bump()
+        if repo is None or self._render_live:
+            return
+
+        if not self._listening:
+            add_listener = getattr(repo, "add_listener", None)
+            if add_listener is not None:
+                add_listener(self._on_render_change)
+                self._listening = True
+
+        async with self._seed_lock:
+            if self._render_live:
+                return
+            self._touched_while_seeding = set()
+            try:
+                jobs: list[RenderJob] = []
+                for status in _ACTIVE_RENDER_STATUSES:
+                    jobs.extend(await repo.list_by_status(status))
+            except Exception as exc:
+                logger.warning("system_state.render_repository_unavailable", error=str(exc))
+                return
+            finally:
+                touched = self._touched_while_seeding or set()
+                self._touched_while_seeding = None
+
+            # Changes that arrived while the queries ran are newer than the rows.
+            seeded = {job.id: _render_summary(job) for job in jobs if job.id not in touched}
+            seeded.update(
+                (job_id, summary)
+                for job_id, summary in self._render_jobs.items()
+                if job_id in touched
+            )
+            if seeded != self._render_jobs:
+                self._render_jobs = seeded
+                self._bump()
+            # Without listener support the repository is re-read every time.
+            self._render_live = self._listening
+
+    def _on_render_change(self, job_id: str, job: RenderJob | None) -> None:
+        if self._touched_while_seeding is not None:
+            self._touched_while_seeding.add(job_id)
+        if job is None or job.status not in _ACTIVE_RENDER_STATUSES:
+            if self._render_jobs.pop(job_id, None) is not None:
+                self._bump()
+            return
+        summary = _render_summary(job)
+        if self._render_jobs.get(job_id) != summary:
+            self._render_jobs[job_id] = summary
+            self._bump()
+
+    def _sync_in_memory(self) -> None:
+        queue_jobs: list[JobSummary] = []
+        job_queue = getattr(self._app_state, "job_queue", None)
+        if job_queue is not None:
+            try:
+                queue_jobs = [
+                    JobSummary(
+                        job_id=snap.job_id,
+                        job_type=snap.job_type,
+                        status=snap.status.value,
+                        progress=snap.progress,
+                        submitted_at=snap.submitted_at,
+                    )
+                    for snap in job_queue.list_jobs()
+                ]
+            except Exception as exc:
+                # NFR-003: graceful partial state — log and report no queue
+                # jobs rather than surfacing a 500.
+                logger.warning("system_state.job_queue_unavailable", error=str(exc))
+
+        connections = 0
+        ws_manager = getattr(self._app_state, "ws_manager", None)
+        if ws_manager is not None:
+            try:
+                connections = int(ws_manager.active_connections)
+            except Exception as exc:
+                logger.warning("system_state.ws_manager_unavailable", error=str(exc))
+
+        fingerprint = (
+            tuple((job.job_id, job.status, job.progress) for job in queue_jobs),
+            connections,
+        )
+        self._queue_jobs = queue_jobs
+        self._connections = connections
+        if fingerprint != self._fingerprint:
+            self._fingerprint = fingerprint
+            self._bump()
+
+    def _build(self) -> SystemState:
+        render_jobs = sorted(
+            self._render_jobs.values(),
+            key=lambda job: (
+                _ACTIVE_RENDER_STATUSES.index(RenderStatus(job.status)),
+                job.submitted_at,
+                job.job_id,
+            ),
+        )
+        return SystemState(
+            timestamp=datetime.now(timezone.utc),
+            active_jobs=[*self._queue_jobs, *render_jobs],
+            active_connections=self._connections,
+            uptime_seconds=_compute_uptime_seconds(self._app_state),
+            version=self._version,
+        )
+
+    def _bump(self) -> None:
+        self._version += 1
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _detach(self) -> None:
+        if self._listening and self._render_repo is not None:
+            remove_listener = getattr(self._render_repo, "remove_listener", None)
+            if remove_listener is not None:
+                remove_listener(self._on_render_change)
+        self._listening = False
@@ -6,44 +6,288 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import importlib.util
+import io
 import json
+import math
 import os
 import pathlib
+import queue
+import random
 import subprocess
+import sys
 import tempfile
+import threading
+import time
+import wave
+from array import array
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import httpx
 import structlog
+from prometheus_client import Counter, Gauge
+
+from stoat_ferret.api.websocket.events import EventType, build_event
 
 if TYPE_CHECKING:
     from stoat_ferret.api.settings import Settings
+    from stoat_ferret.api.websocket.manager import ConnectionManager
     from stoat_ferret.db.tts_cue_repository import AsyncTtsCueRepository
 
 logger = structlog.get_logger(__name__)
 
 _OPENROUTER_TTS_URL = "https://openrouter.ai/api/v1/audio/speech"
 _TTS_FORMAT_MISMATCH_MSG = "TTS output format mismatch: expected channels=2 sample_rate=48000"
+_TARGET_SAMPLE_RATE = 48000
+_TARGET_CHANNELS = 2
+# HTTP/2 for remote backends needs the optional ``h2`` package (httpx[http2]).
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+tts_cache_requests_total = Counter(
+    "stoat_tts_cache_requests_total",
+    "TTS cache lookups by result",
+    ["result"],
+)
+tts_cache_evictions_total = Counter(
+    "stoat_tts_cache_evictions_total",
+    "TTS cache entries evicted to stay under STOAT_TTS_CACHE_MAX_BYTES",
+)
+tts_cache_bytes = Gauge(
+    "stoat_tts_cache_bytes",
+    "Bytes of synthesised audio held in the TTS cache",
+)
+
+_MANIFEST_NAME = "manifest.json"
+_CACHE_SUFFIXES = (".flac", ".wav")
+
+
+@dataclass
+class TtsCacheStats:
+    """Snapshot of TTS cache counters.
+
+    Attributes:
+        entries: Number of cached audio files.
+        bytes: Total size of cached audio files.
+        max_bytes: Size bound (0 = unbounded).
+        hits: Lookups served from the cache since the manifest was created.
+        misses: Lookups that required synthesis.
+        evictions: Entries removed to stay under the size bound.
+    """
+
+    entries: int
+    bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+def _encode_flac(wav_bytes: bytes) -> bytes | None:
+    """Losslessly compress WAV bytes to FLAC via FFmpeg; None if encoding fails."""
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-f",
+                "wav",
+                "-i",
+                "pipe:0",
+                "-c:a",
+                "flac",
+                "-f",
+                "flac",
+                "pipe:1",
+            ],
+            input=wav_bytes,
+            capture_output=True,
+        )
+    except OSError as exc:
+        logger.warning("tts.cache_flac_encode_failed", error=str(exc))
+        return None
+    if result.returncode != 0 or not result.stdout:
+        logger.warning("tts.cache_flac_encode_failed", error=result.stderr.decode()[-500:])
+        return None
+    return result.stdout
 
 
 class TtsCache:
-    """Content-addressable cache for synthesised audio files keyed by SHA256."""
+    """Content-addressable, size-bounded cache for synthesised audio keyed by SHA256.
+
+    Entries are tracked in ``manifest.json`` (file, size, last access) with
+    hit/miss/eviction counters. When the total size exceeds `max_bytes`, the
+    least recently used entries are evicted; evicted keys are queued for
+    `take_evicted` so cues pointing at them can be reset. With ``audio_format="flac"``
+    audio is stored losslessly compressed; FFmpeg decodes it directly when
+    the render command reads it, so there is no separate decode step.
+    Audio files found on disk without a manifest entry (for example from
+    before the manifest existed) are adopted on first lookup.
+    """
+
+    def __init__(self, cache_dir: str, *, max_bytes: int = 0, audio_format: str = "wav") -> None:
+        """Initialise cache with given directory path.
 
-    def __init__(self, cache_dir: str) -> None:
-        """Initialise cache with given directory path."""
+        Args:
+            cache_dir: Directory holding cached audio and the manifest.
+            max_bytes: Size bound in bytes; 0 disables eviction.
+            audio_format: ``flac`` to store compressed audio, ``wav`` to store
+                the synthesised WAV as-is.
+        """
         self._cache_dir = pathlib.Path(cache_dir)
+        self._max_bytes = max(0, max_bytes)
+        self._flac = audio_format == "flac"
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0}
+        self._evicted: list[str] = []
+        self._dirty = False
+        self._load_manifest()
 
     def hit(self, cache_key: str) -> pathlib.Path | None:
-        """Return path if a cached WAV exists for this cache key, else None."""
-        path = self._cache_dir / f"{cache_key}.wav"
-        return path if path.exists() else None
+        """Return the cached audio path for this key (marking it used), else None."""
+        with self._lock:
+            path = self._lookup_unlocked(cache_key)
+            if path is None:
+                self._counters["misses"] += 1
+                tts_cache_requests_total.labels(result="miss").inc()
+            else:
+                self._entries[cache_key]["last_access"] = time.time()
+                self._counters["hits"] += 1
+                tts_cache_requests_total.labels(result="hit").inc()
+            self._dirty = True
+            return path
 
     def store(self, cache_key: str, audio_bytes: bytes) -> pathlib.Path:
-        """Write audio bytes to cache and return the stored path."""
+        """Write audio to the cache, evicting LRU entries if over the bound.
+
+        Args:
+            cache_key: Content hash of the synthesis request.
+            audio_bytes: 48 kHz stereo WAV bytes.
+
+        Returns:
+            Path of the stored file (``.flac`` or ``.wav``).
+        """
+        encoded = _encode_flac(audio_bytes) if self._flac else None
+        suffix = ".flac" if encoded is not None else ".wav"
+        data = encoded if encoded is not None else audio_bytes
+        with self._lock:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            self._remove_unlocked(cache_key)
+            path = self._cache_dir / f"{cache_key}{suffix}"
+            path.write_bytes(data)
+            self._entries[cache_key] = {
+                "file": path.name,
+                "bytes": len(data),
+                "last_access": time.time(),
+            }
+            self._evict_unlocked(keep=cache_key)
+            self._write_manifest_unlocked()
+            return path
+
+    def take_evicted(self) -> list[str]:
+        """Return and clear the keys evicted since the last call."""
+        with self._lock:
+            evicted, self._evicted = self._evicted, []
+            return evicted
+
+    def stats(self) -> TtsCacheStats:
+        """Return current cache counters."""
+        with self._lock:
+            return TtsCacheStats(
+                entries=len(self._entries),
+                bytes=self._total_bytes_unlocked(),
+                max_bytes=self._max_bytes,
+                hits=self._counters["hits"],
+                misses=self._counters["misses"],
+                evictions=self._counters["evictions"],
+            )
+
+    def flush(self) -> None:
+        """Persist access times and counters recorded since the last write."""
+        with self._lock:
+            if self._dirty:
+                self._write_manifest_unlocked()
+
+    def _lookup_unlocked(self, cache_key: str) -> pathlib.Path | None:
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            path = self._cache_dir / str(entry["file"])
+            if path.exists():
+                return path
+            del self._entries[cache_key]
+        for suffix in _CACHE_SUFFIXES:
+            path = self._cache_dir / f"{cache_key}{suffix}"
+            if path.exists():
+                self._entries[cache_key] = {
+                    "file": path.name,
+                    "bytes": path.stat().st_size,
+                    "last_access": time.time(),
+                }
+                return path
+        return None
+
+    def _remove_unlocked(self, cache_key: str) -> None:
+        entry = self._entries.pop(cache_key, None)
+        names = {f"{cache_key}{suffix}" for suffix in _CACHE_SUFFIXES}
+        if entry is not None:
+            names.add(entry["file"])
+        for name in names:
+            with contextlib.suppress(FileNotFoundError):
+                (self._cache_dir / name).unlink()
+
+    def _evict_unlocked(self, keep: str) -> None:
+        if self._max_bytes <= 0:
+            return
+        total = self._total_bytes_unlocked()
+        by_age = sorted(
+            (key for key in self._entries if key != keep),
+            key=lambda key: self._entries[key]["last_access"],
+        )
+        for key in by_age:
+            if total <= self._max_bytes:
+                break
+            total -= self._entries[key]["bytes"]
+            self._remove_unlocked(key)
+            self._evicted.append(key)
+            self._counters["evictions"] += 1
+            tts_cache_evictions_total.inc()
+            logger.info("tts.cache_evicted", cache_key=key)
+
+    def _total_bytes_unlocked(self) -> int:
+        return sum(int(entry["bytes"]) for entry in self._entries.values())
+
+    def _load_manifest(self) -> None:
+        path = self._cache_dir / _MANIFEST_NAME
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            logger.warning("tts.cache_manifest_unreadable", path=str(path), error=str(exc))
+            return
+        self._entries = {
+            key: entry
+            for key, entry in data.get("entries", {}).items()
+            if (self._cache_dir / entry.get("file", "")).is_file()
+        }
+        for name in self._counters:
+            self._counters[name] = int(data.get(name, 0))
+        tts_cache_bytes.set(self._total_bytes_unlocked())
+
+    def _write_manifest_unlocked(self) -> None:
         self._cache_dir.mkdir(parents=True, exist_ok=True)
-        path = self._cache_dir / f"{cache_key}.wav"
-        path.write_bytes(audio_bytes)
-        return path
+        path = self._cache_dir / _MANIFEST_NAME
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({**self._counters, "entries": self._entries}), encoding="utf-8")
+        os.replace(tmp, path)
+        self._dirty = False
+        tts_cache_bytes.set(self._total_bytes_unlocked())
 
 
 def _reconcile_to_48k_stereo(input_path: str) -> bytes:
@@ -132,13 +376,329 @@ def _write_and_reconcile(raw_audio: bytes) -> bytes:
             os.unlink(raw_path)
 
 
+def _resample_linear(samples: array[int], src_rate: int, dst_rate: int) -> array[int]:
+    """Resample one channel of 16-bit samples by linear interpolation.
+
+    The interpolation offsets and weights repeat every ``dst_rate / gcd``
+    output samples, so they are computed once per period and reused.
+    """
+    if src_rate == dst_rate or not samples:
+        return samples
+    g = math.gcd(src_rate, dst_rate)
+    up, down = dst_rate // g, src_rate // g
+    n_out = len(samples) * dst_rate // src_rate
+    padded = samples.tolist()
+    padded.extend([padded[-1]] * (down + 1))
+    period = [divmod(k * down, up) for k in range(up)]
+    out: list[int] = []
+    for start in range(0, (n_out + up - 1) // up * down, down):
+        out.extend(
+            [(padded[start + o] * (up - w) + padded[start + o + 1] * w) // up for o, w in period]
+        )
+    del out[n_out:]
+    return array("h", out)
+
+
+def _reconcile_pcm_in_process(wav_bytes: bytes) -> bytes | None:
+    """Convert 16-bit PCM WAV bytes to 48 kHz stereo WAV without FFmpeg.
+
+    Piper emits 16-bit mono PCM at the voice's native rate (typically 16 or
+    22.05 kHz), for which linear interpolation on the decoded samples is
+    sufficient for narration.
+
+    Args:
+        wav_bytes: Input WAV file contents.
+
+    Returns:
+        48 kHz stereo WAV bytes, or None if the input is not 16-bit PCM
+        with one or two channels (the caller then falls back to FFmpeg).
+    """
+    try:
+        with wave.open(io.BytesIO(wav_bytes), "rb") as src:
+            channels = src.getnchannels()
+            width = src.getsampwidth()
+            rate = src.getframerate()
+            frames = src.readframes(src.getnframes())
+    except (wave.Error, EOFError):
+        return None
+    if width != 2 or channels not in (1, 2) or rate <= 0:
+        return None
+
+    samples = array("h")
+    samples.frombytes(frames[: len(frames) // 2 * 2])
+    if sys.byteorder == "big":
+        samples.byteswap()
+    planes = [
+        _resample_linear(samples[c::channels], rate, _TARGET_SAMPLE_RATE) for c in range(channels)
+    ]
+    left, right = planes[0], planes[-1]
+    stereo = array("h", bytes(4 * len(left)))
+    stereo[0::2] = left
+    stereo[1::2] = right
+    if sys.byteorder == "big":
+        stereo.byteswap()
+
+    out = io.BytesIO()
+    with wave.open(out, "wb") as dst:
+        dst.setnchannels(_TARGET_CHANNELS)
+        dst.setsampwidth(2)
+        dst.setframerate(_TARGET_SAMPLE_RATE)
+        dst.writeframes(stereo.tobytes())
+    return out.getvalue()
+
+
+def _validate_48k_stereo(wav_bytes: bytes) -> None:
+    """Check a WAV header for 48 kHz stereo.
+
+    Raises:
+        RuntimeError: If the bytes are not a 48 kHz stereo WAV.
+    """
+    try:
+        with wave.open(io.BytesIO(wav_bytes), "rb") as wav:
+            ok = (
+                wav.getnchannels() == _TARGET_CHANNELS and wav.getframerate() == _TARGET_SAMPLE_RATE
+            )
+    except (wave.Error, EOFError):
+        ok = False
+    if not ok:
+        raise RuntimeError(_TTS_FORMAT_MISMATCH_MSG)
+
+
+def _reconcile_wav_bytes(wav_bytes: bytes) -> bytes:
+    """Reconcile WAV bytes to 48 kHz stereo, in-process when possible.
+
+    Falls back to the FFmpeg/ffprobe path for inputs that are not 16-bit PCM.
+
+    Raises:
+        RuntimeError: If reconciliation or validation fails.
+    """
+    converted = _reconcile_pcm_in_process(wav_bytes)
+    if converted is None:
+        return _write_and_reconcile(wav_bytes)
+    _validate_48k_stereo(converted)
+    return converted
+
+
+# Longest wait for Piper to finish one utterance before the worker is killed
+_PIPER_READ_TIMEOUT_SECONDS = 120.0
+
+
+class PiperWorker:
+    """Long-lived Piper process that keeps one voice model loaded.
+
+    Requests are written to stdin as JSON lines (``--json-input``). Piper
+    writes each utterance to the request's ``output_file`` and prints the
+    path on stdout once the file is complete. Stdout is read by a daemon
+    thread so a response can be awaited with a deadline on every platform;
+    a worker that misses it is killed.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        *,
+        executable: str = "piper",
+        read_timeout: float = _PIPER_READ_TIMEOUT_SECONDS,
+    ) -> None:
+        """Start the Piper process for `model_path`.
+
+        Raises:
+            OSError: If the Piper executable cannot be started.
+        """
+        self.model_path = model_path
+        self._read_timeout = read_timeout
+        self._lines: queue.Queue[str] = queue.Queue()
+        self._proc = subprocess.Popen(
+            [executable, "--model", model_path, "--json-input"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        threading.Thread(
+            target=self._read_stdout, name=f"piper-stdout-{self._proc.pid}", daemon=True
+        ).start()
+
+    def _read_stdout(self) -> None:
+        """Forward Piper's stdout lines to the response queue; "" marks EOF."""
+        stdout = self._proc.stdout
+        if stdout is not None:
+            with contextlib.suppress(OSError, ValueError):
+                for line in stdout:
+                    self._lines.put(line)
+        self._lines.put("")
+
+    @property
+    def alive(self) -> bool:
+        """True while the Piper process is running."""
+        return self._proc.poll() is None
+
+    def synthesise(self, text: str) -> bytes:
+        """Synthesise one utterance and return Piper's raw WAV output.
+
+        Raises:
+            RuntimeError: If the worker has exited, produced no output, or did
+                not respond within the read timeout (the worker is killed).
+        """
+        stdin = self._proc.stdin
+        if stdin is None:
+            raise RuntimeError("Piper synthesis failed: worker pipes are closed")
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+            out_path = tmp.name
+        try:
+            try:
+                stdin.write(json.dumps({"text": text, "output_file": out_path}) + "\n")
+                stdin.flush()
+                line = self._lines.get(timeout=self._read_timeout)
+            except queue.Empty:
+                self.kill()
+                raise RuntimeError(
+                    f"Piper synthesis failed: no response within {self._read_timeout:g}s"
+                ) from None
+            except (OSError, ValueError):
+                line = ""
+            if not line:
+                raise RuntimeError(
+                    f"Piper synthesis failed: worker exited (code {self._proc.poll()})"
+                )
+            audio = pathlib.Path(out_path).read_bytes()
+            if not audio:
+                raise RuntimeError("Piper synthesis failed: empty output")
+            return audio
+        finally:
+            if os.path.exists(out_path):
+                os.unlink(out_path)
+
+    def kill(self) -> None:
+        """Kill the Piper process immediately."""
+        with contextlib.suppress(OSError):
+            self._proc.kill()
+        self._proc.wait()
+
+    def close(self) -> None:
+        """Close stdin so Piper exits, killing it if it does not stop promptly."""
+        if self._proc.stdin is not None:
+            with contextlib.suppress(OSError):
+                self._proc.stdin.close()
+        try:
+            self._proc.wait(timeout=5.0)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+
+
+class PiperWorkerPool:
+    """Per-voice pools of warm `PiperWorker` processes.
+
+    Workers start on demand, up to `workers_per_voice` per model, and are
+    reused for later utterances, so each ONNX model is loaded once per worker
+    rather than once per cue. Thread-safe: synthesis runs in executor threads.
+    """
+
+    def __init__(
+        self,
+        workers_per_voice: int = 2,
+        worker_factory: Callable[[str], PiperWorker] = PiperWorker,
+    ) -> None:
+        """Initialise an empty pool."""
+        self._max_per_voice = max(1, workers_per_voice)
+        self._factory = worker_factory
+        self._idle: dict[str, list[PiperWorker]] = {}
+        self._started: dict[str, int] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def synthesise(self, model_path: str, text: str) -> bytes:
+        """Synthesise `text` on a worker for `model_path`, waiting if all are busy.
+
+        A worker whose request fails is closed rather than returned to the
+        pool: its request/response stream may be out of step.
+
+        Raises:
+            RuntimeError: If the pool is closed or the worker fails.
+        """
+        worker = self._acquire(model_path)
+        try:
+            audio = worker.synthesise(text)
+        except BaseException:
+            self._discard(worker)
+            raise
+        self._release(worker)
+        return audio
+
+    def worker_count(self, model_path: str) -> int:
+        """Number of live workers (busy or idle) for `model_path`."""
+        with self._cond:
+            return self._started.get(model_path, 0)
+
+    def close(self) -> None:
+        """Stop idle workers; busy workers are stopped when they are released."""
+        with self._cond:
+            self._closed = True
+            idle = [worker for workers in self._idle.values() for worker in workers]
+            self._idle.clear()
+            self._started.clear()
+            self._cond.notify_all()
+        for worker in idle:
+            worker.close()
+
+    def _acquire(self, model_path: str) -> PiperWorker:
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Piper worker pool is closed")
+                idle = self._idle.setdefault(model_path, [])
+                if idle:
+                    return idle.pop()
+                if self._started.get(model_path, 0) < self._max_per_voice:
+                    self._started[model_path] = self._started.get(model_path, 0) + 1
+                    break
+                self._cond.wait()
+        try:
+            worker = self._factory(model_path)
+        except Exception:
+            self._forget(model_path)
+            raise
+        logger.info("tts.piper_worker_started", model=model_path)
+        return worker
+
+    def _release(self, worker: PiperWorker) -> None:
+        with self._cond:
+            if worker.alive and not self._closed:
+                self._idle.setdefault(worker.model_path, []).append(worker)
+                self._cond.notify()
+                return
+        self._discard(worker)
+
+    def _discard(self, worker: PiperWorker) -> None:
+        self._forget(worker.model_path)
+        worker.close()
+
+    def _forget(self, model_path: str) -> None:
+        with self._cond:
+            if self._started.get(model_path, 0) > 0:
+                self._started[model_path] -= 1
+            self._cond.notify()
+
+
 class PiperBackend:
     """Piper local TTS backend (GPL-3.0 subprocess invocation).
 
     Piper is invoked as a subprocess — not imported — so the GPL-3.0 license does
     not propagate to stoat-and-ferret. See NOTICE.md for full disclosure.
+    Synthesis runs on warm per-voice workers from a `PiperWorkerPool`, and the
+    output is reconciled to 48 kHz stereo in-process.
     """
 
+    def __init__(self, workers_per_voice: int = 2, pool: PiperWorkerPool | None = None) -> None:
+        """Initialise backend with a worker pool (created if not given)."""
+        self._pool = pool if pool is not None else PiperWorkerPool(workers_per_voice)
+
+    def close(self) -> None:
+        """Stop all Piper workers."""
+        self._pool.close()
+
     def synthesise(self, text: str, voice: str, settings: Settings) -> bytes:
         """Synthesise text using the Piper local backend.
 
@@ -151,7 +711,8 @@ class PiperBackend:
             48 kHz stereo WAV bytes.
 
         Raises:
-            RuntimeError: If model is missing and download fails, or if Piper fails.
+            RuntimeError: If model is missing and download fails, if Piper fails,
+                or if the output cannot be reconciled to 48 kHz stereo.
         """
         models_dir = pathlib.Path(settings.tts_piper_models_dir)
         voice_model = voice if voice.endswith(".onnx") else f"{voice}.onnx"
@@ -162,29 +723,8 @@ class PiperBackend:
             if not pathlib.Path(resolved_model).exists():
                 raise RuntimeError(f"Piper model not found and download failed: {resolved_model}")
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            raw_output_path = tmp.name
-
-        try:
-            result = subprocess.run(
-                [
-                    "piper",
-                    "--model",
-                    resolved_model,
-                    "--output_file",
-                    str(pathlib.Path(raw_output_path).resolve()),
-                ],
-                input=text,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
-                raise RuntimeError(f"Piper synthesis failed: {result.stderr}")
-
-            return _reconcile_to_48k_stereo(raw_output_path)
-        finally:
-            if os.path.exists(raw_output_path):
-                os.unlink(raw_output_path)
+        raw_wav = self._pool.synthesise(resolved_model, text)
+        return _reconcile_wav_bytes(raw_wav)
 
     def _try_download_model(self, voice: str, models_dir: pathlib.Path) -> None:
         """Attempt to download Piper ONNX model from HuggingFace.
@@ -208,11 +748,62 @@ class PiperBackend:
 
 
 class KokoroBackend:
-    """Kokoro cloud TTS backend via OpenRouter (Apache 2.0)."""
+    """Kokoro cloud TTS backend via OpenRouter (Apache 2.0).
+
+    All requests share one pooled ``httpx.AsyncClient`` with keep-alive, so a
+    long script reuses a handful of connections instead of opening one (and
+    a TLS handshake) per cue. HTTP/2 is negotiated when the optional ``h2``
+    package is installed. Rate-limit (429), 5xx and transport failures are
+    retried with jittered exponential backoff, honouring ``Retry-After``.
+    Call `aclose` on shutdown.
+    """
 
-    def __init__(self, transport: httpx.AsyncBaseTransport | None = None) -> None:
-        """Initialise backend with an optional custom transport (for testing)."""
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport | None = None,
+        *,
+        endpoint: str = _OPENROUTER_TTS_URL,
+        max_connections: int = 8,
+        max_retries: int = 3,
+        retry_base_delay_s: float = 0.5,
+    ) -> None:
+        """Initialise backend; the HTTP client is created on first use.
+
+        Args:
+            transport: Custom transport (for testing).
+            endpoint: Speech endpoint URL.
+            max_connections: Upper bound on open connections to the endpoint.
+            max_retries: Retries after the first attempt for retryable failures.
+            retry_base_delay_s: Backoff base; attempt ``n`` waits up to
+                ``retry_base_delay_s * 2**n`` seconds.
+        """
         self._transport = transport
+        self._endpoint = endpoint
+        self._max_connections = max_connections
+        self._max_retries = max_retries
+        self._retry_base_delay_s = retry_base_delay_s
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                transport=self._transport,
+                http2=_HTTP2_AVAILABLE and self._transport is None,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+                # Requests beyond max_connections queue for a free connection
+                # rather than failing with PoolTimeout.
+                timeout=httpx.Timeout(60.0, connect=10.0, pool=None),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def synthesise(self, text: str, voice: str, settings: Settings) -> bytes:
         """Synthesise text using Kokoro via OpenRouter API.
@@ -226,31 +817,25 @@ class KokoroBackend:
             48 kHz stereo WAV bytes.
 
         Raises:
-            RuntimeError: If API key is missing, or HTTP 429/400/5xx occurs.
+            RuntimeError: If API key is missing, or HTTP 429/400/5xx persists
+                after retries.
+            httpx.TransportError: If the endpoint stays unreachable after retries.
         """
         if settings.openrouter_api_key is None:
             raise RuntimeError("openrouter_kokoro requires STOAT_OPENROUTER_API_KEY")
 
-        client_kwargs: dict[str, object] = {}
-        if self._transport is not None:
-            client_kwargs["transport"] = self._transport
-            client_kwargs["base_url"] = "http://test"
-
-        async with httpx.AsyncClient(**client_kwargs) as client:  # type: ignore[arg-type]
-            response = await client.post(
-                _OPENROUTER_TTS_URL if self._transport is None else "/tts",
-                headers={
-                    "Authorization": f"Bearer {settings.openrouter_api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": "kokoro",
-                    "input": text,
-                    "voice": voice,
-                    "response_format": "wav",
-                },
-                timeout=60.0,
-            )
+        response = await self._post_with_retry(
+            headers={
+                "Authorization": f"Bearer {settings.openrouter_api_key}",
+                "Content-Type": "application/json",
+            },
+            body={
+                "model": "kokoro",
+                "input": text,
+                "voice": voice,
+                "response_format": "wav",
+            },
+        )
 
         if response.status_code == 429:
             raise RuntimeError("TTS rate limited (429): Kokoro quota exceeded")
@@ -263,10 +848,57 @@ class KokoroBackend:
         raw_audio = response.content
         return await asyncio.to_thread(_write_and_reconcile, raw_audio)
 
+    async def _post_with_retry(
+        self, headers: dict[str, str], body: dict[str, str]
+    ) -> httpx.Response:
+        """POST to the endpoint, retrying 429/5xx responses and transport errors."""
+        client = self._get_client()
+        attempt = 0
+        while True:
+            try:
+                response = await client.post(self._endpoint, headers=headers, json=body)
+            except httpx.TransportError as exc:
+                if attempt >= self._max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(
+                    "tts.remote_retry", attempt=attempt + 1, error=str(exc), delay_s=delay
+                )
+            else:
+                retryable = response.status_code == 429 or response.status_code >= 500
+                if not retryable or attempt >= self._max_retries:
+                    return response
+                delay = max(self._backoff(attempt), _retry_after_s(response))
+                logger.warning(
+                    "tts.remote_retry",
+                    attempt=attempt + 1,
+                    status_code=response.status_code,
+                    delay_s=delay,
+                )
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given zero-based attempt."""
+        return random.uniform(0, self._retry_base_delay_s * 2**attempt)
+
+
+def _retry_after_s(response: httpx.Response) -> float:
+    """Return the ``Retry-After`` delay in seconds (capped at 60), or 0 if absent."""
+    try:
+        return min(float(response.headers.get("Retry-After", 0)), 60.0)
+    except ValueError:
+        return 0.0
+
 
 _background_tasks: set[asyncio.Task[Any]] = set()
 
 
+def _audio_present(path: str | None) -> bool:
+    """Return True if a cue's generated audio file still exists."""
+    return path is not None and os.path.isfile(path)
+
+
 def _create_retained_task(coro: Any) -> asyncio.Task[Any]:
     """Create an asyncio task with strong reference retention."""
     task: asyncio.Task[Any] = asyncio.create_task(coro)
@@ -279,21 +911,47 @@ class TtsService:
     """Orchestrates async TTS synthesis dispatch.
 
     Manages active synthesis tasks, idempotency guard, status transitions,
-    and cache layer. Must be shut down gracefully via shutdown() on server stop.
+    and cache layer. Backend synthesis is bounded by
+    ``settings.tts_max_concurrent_synthesis``; cache hits are not. Must be shut
+    down gracefully via shutdown() on server stop.
     """
 
     def __init__(
         self,
         repository: AsyncTtsCueRepository,
         settings: Settings,
+        connection_manager: ConnectionManager | None = None,
     ) -> None:
-        """Initialise TtsService with repository and settings."""
+        """Initialise TtsService with repository and settings.
+
+        Args:
+            repository: TTS cue repository.
+            settings: Application settings.
+            connection_manager: WebSocket broadcast channel for
+                ``tts.synthesis_progress`` events; None disables them.
+        """
         self._repo = repository
         self._settings = settings
-        self._cache = TtsCache(settings.tts_cache_dir)
-        self._piper = PiperBackend()
-        self._kokoro = KokoroBackend()
+        self._ws = connection_manager
+        self._cache = TtsCache(
+            settings.tts_cache_dir,
+            max_bytes=settings.tts_cache_max_bytes,
+            audio_format=settings.tts_cache_format,
+        )
+        self._piper = PiperBackend(workers_per_voice=settings.tts_piper_workers_per_voice)
+        self._kokoro = KokoroBackend(
+            max_connections=settings.tts_remote_max_connections,
+            max_retries=settings.tts_remote_max_retries,
+            retry_base_delay_s=settings.tts_remote_retry_base_delay_s,
+        )
         self._active_tasks: dict[str, asyncio.Task[Any]] = {}
+        self._progress_tasks: set[asyncio.Task[Any]] = set()
+        self._synthesis_slots = asyncio.Semaphore(settings.tts_max_concurrent_synthesis)
+
+    @property
+    def cache(self) -> TtsCache:
+        """The audio cache backing this service."""
+        return self._cache
 
     async def synthesise_cue(self, cue_id: str) -> bool:
         """Dispatch async synthesis for a TTS cue.
@@ -334,6 +992,87 @@ class TtsService:
         )
         return True
 
+    async def synthesise_project(self, project_id: str) -> dict[str, int]:
+        """Dispatch synthesis for every cue in a project that lacks usable audio.
+
+        Pending and failed cues are dispatched, as are ready cues whose cached
+        audio has since been evicted. Synthesis runs in the background, bounded
+        by ``settings.tts_max_concurrent_synthesis``; one
+        ``tts.synthesis_progress`` event is broadcast as each dispatched or
+        already-running cue finishes.
+
+        Args:
+            project_id: Project whose cues to synthesise.
+
+        Returns:
+            Counts: ``total`` cues, newly ``dispatched``, already
+            ``in_progress``, and ``ready`` (audio present, nothing to do).
+        """
+        cues = await self._repo.list_by_project(project_id)
+        counts = {"total": len(cues), "dispatched": 0, "in_progress": 0, "ready": 0}
+        tracked: list[str] = []
+        for cue in cues:
+            if cue.status == "synthesising":
+                counts["in_progress"] += 1
+                tracked.append(cue.id)
+            elif cue.status == "ready" and _audio_present(cue.generated_asset_id):
+                counts["ready"] += 1
+            else:
+                await self.synthesise_cue(cue.id)
+                counts["dispatched"] += 1
+                tracked.append(cue.id)
+
+        if tracked:
+            task = _create_retained_task(self._report_progress(project_id, tracked))
+            self._progress_tasks.add(task)
+            task.add_done_callback(self._progress_tasks.discard)
+        logger.info("tts.project_synthesis_started", project_id=project_id, **counts)
+        return counts
+
+    async def _report_progress(self, project_id: str, cue_ids: list[str]) -> None:
+        """Broadcast a progress event as each tracked cue's synthesis finishes."""
+        pending = {
+            task: cue_id
+            for cue_id in cue_ids
+            if (task := self._active_tasks.get(cue_id)) is not None
+        }
+        total = len(cue_ids)
+        # Cues whose task finished before we looked are reported up front.
+        running = set(pending.values())
+        finished = [cue_id for cue_id in cue_ids if cue_id not in running]
+        completed = failed = 0
+
+        async def report(cue_id: str) -> None:
+            nonlocal completed, failed
+            cue = await self._repo.get(cue_id)
+            status = cue.status if cue is not None else "failed"
+            if status == "ready":
+                completed += 1
+            else:
+                failed += 1
+            if self._ws is not None:
+                await self._ws.broadcast(
+                    build_event(
+                        EventType.TTS_SYNTHESIS_PROGRESS,
+                        payload={
+                            "project_id": project_id,
+                            "cue_id": cue_id,
+                            "cue_status": status,
+                            "completed": completed,
+                            "failed": failed,
+                            "total": total,
+                            "done": completed + failed == total,
+                        },
+                    )
+                )
+
+        for cue_id in finished:
+            await report(cue_id)
+        while pending:
+            done, _ = await asyncio.wait(set(pending), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                await report(pending.pop(task))
+
     async def _do_synthesise(self, cue_id: str) -> None:
         """Internal: perform the actual synthesis and update cue status."""
         cue = await self._repo.get(cue_id)
@@ -342,7 +1081,7 @@ class TtsService:
             return
 
         # Check cache before synthesis
-        cached_path = self._cache.hit(cue.cache_key)
+        cached_path = await asyncio.to_thread(self._cache.hit, cue.cache_key)
         if cached_path is not None:
             # TODO(future-bl): Register TTS audio as a real asset-library entry (UUID,
             # content_hash, mime_type, kind, size_bytes) rather than storing the cache
@@ -358,9 +1097,11 @@ class TtsService:
             return
 
         try:
-            audio_bytes = await self._run_backend(cue.text, cue.voice, cue.backend)
-            cached_path = self._cache.store(cue.cache_key, audio_bytes)
+            async with self._synthesis_slots:
+                audio_bytes = await self._run_backend(cue.text, cue.voice, cue.backend)
+            cached_path = await asyncio.to_thread(self._cache.store, cue.cache_key, audio_bytes)
             await self._repo.update_status(cue_id, "ready", generated_asset_id=str(cached_path))
+            await self._reset_evicted_cues()
             logger.info(
                 "tts.synthesis_complete",
                 cue_id=cue_id,
@@ -377,6 +1118,15 @@ class TtsService:
                 error=error_text,
             )
 
+    async def _reset_evicted_cues(self) -> None:
+        """Return ready cues whose audio the cache just evicted to pending."""
+        evicted = self._cache.take_evicted()
+        if not evicted:
+            return
+        reset = await self._repo.reset_evicted(evicted)
+        if reset:
+            logger.info("tts.evicted_cues_reset", cache_keys=len(evicted), cues=reset)
+
     async def _run_backend(self, text: str, voice: str, backend: str) -> bytes:
         """Dispatch synthesis to the appropriate backend.
 
@@ -398,12 +1148,19 @@ class TtsService:
         raise RuntimeError(f"Unknown TTS backend: {backend}")
 
     async def shutdown(self) -> None:
-        """Cancel all active synthesis tasks and wait for them to finish."""
-        tasks = list(self._active_tasks.values())
-        if not tasks:
-            return
-        for task in tasks:
-            task.cancel()
-        # LRN-406: asyncio.wait() with timeout prevents stall on Python 3.10
-        await asyncio.wait(set(tasks), timeout=15.0)
-        self._active_tasks.clear()
+        """Cancel active synthesis tasks, then stop Piper workers and remote connections.
+
+        The cache manifest is flushed last so recorded access times survive
+        a restart.
+        """
+        tasks = [*self._active_tasks.values(), *self._progress_tasks]
+        if tasks:
+            for task in tasks:
+                task.cancel()
+            # LRN-406: asyncio.wait() with timeout prevents stall on Python 3.10
+            await asyncio.wait(set(tasks), timeout=15.0)
+            self._active_tasks.clear()
+            self._progress_tasks.clear()
+        await asyncio.to_thread(self._piper.close)
+        await self._kokoro.aclose()
+        await asyncio.to_thread(self._cache.flush)
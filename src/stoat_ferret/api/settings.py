@@ -35,6 +35,69 @@ class Settings(BaseSettings):
         default="data/stoat.db",
         description="Path to SQLite database file",
     )
+    database_read_pool_size: int = Field(
+        default=4,
+        ge=0,
+        le=64,
+        description=(
+            "Number of read-only SQLite connections serving SELECT queries alongside "
+            "the single writer connection (0 routes every query to the writer)"
+        ),
+    )
+    database_mmap_size_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        description="SQLite PRAGMA mmap_size applied to every database connection",
+    )
+    database_cache_size_kib: int = Field(
+        default=16 * 1024,
+        ge=0,
+        description="SQLite page cache size per database connection, in KiB",
+    )
+    database_busy_timeout_ms: int = Field(
+        default=5000,
+        ge=0,
+        description="SQLite PRAGMA busy_timeout applied to every database connection",
+    )
+    database_commit_window_ms: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1000.0,
+        description=(
+            "How long a group commit on the writer connection waits for concurrent "
+            "commits to join before issuing COMMIT (0 disables the wait)"
+        ),
+    )
+    audit_queue_max_entries: int = Field(
+        default=10_000,
+        ge=0,
+        le=1_000_000,
+        description=(
+            "Maximum audit entries buffered for batched background writes; entries "
+            "beyond this are dropped. 0 writes and commits each entry synchronously"
+        ),
+    )
+    audit_batch_size: int = Field(
+        default=500,
+        ge=1,
+        le=10_000,
+        description="Maximum audit entries written per background transaction",
+    )
+    audit_flush_interval_ms: float = Field(
+        default=250.0,
+        ge=10.0,
+        le=60_000.0,
+        description="Longest time a buffered audit entry waits before being written",
+    )
+    audit_retention_days: int = Field(
+        default=0,
+        ge=0,
+        le=36_500,
+        description=(
+            "Delete audit_log entries older than this many days, checked hourly "
+            "(0 keeps entries forever)"
+        ),
+    )
 
     # API Server
     api_host: str = Field(
@@ -88,6 +151,30 @@ class Settings(BaseSettings):
         ge=0,
         description="Maximum log file size in bytes before rotation (default 10MB)",
     )
+    log_queue_enabled: bool = Field(
+        default=True,
+        description=(
+            "Render and write log records on a background listener thread instead of "
+            "the calling thread"
+        ),
+    )
+    log_queue_max_records: int = Field(
+        default=10_000,
+        ge=1,
+        le=1_000_000,
+        description=(
+            "Maximum log records waiting for the listener thread; excess records are dropped"
+        ),
+    )
+    log_sample_rate: int = Field(
+        default=1,
+        ge=1,
+        le=10_000,
+        description=(
+            "Keep one in this many high-frequency debug events (ws_broadcast, "
+            "render_service.frame_captured); 1 keeps every event"
+        ),
+    )
 
     # Batch rendering
     batch_parallel_limit: int = Field(
@@ -146,6 +233,36 @@ class Settings(BaseSettings):
         le=60,
         description="Grace period for FFmpeg to finalize after cancel",
     )
+    render_max_clips_per_pass: int = Field(
+        default=32,
+        ge=0,
+        le=1000,
+        description=(
+            "Clips (input decoders) per FFmpeg pass (STOAT_RENDER_MAX_CLIPS_PER_PASS). "
+            "Larger timelines render in windows to mezzanine files that are then "
+            "concatenated; 0 always renders in a single pass."
+        ),
+    )
+    render_telemetry_max_samples: int = Field(
+        default=500,
+        ge=0,
+        le=100_000,
+        description=(
+            "Recent render telemetry samples used to pick encoder presets for "
+            "deadline/size targets and to estimate output size and ETA "
+            "(STOAT_RENDER_TELEMETRY_MAX_SAMPLES); 0 disables telemetry."
+        ),
+    )
+    ffmpeg_thread_budget: int = Field(
+        default=0,
+        ge=0,
+        le=1024,
+        description=(
+            "Total threads shared by all concurrent FFmpeg processes "
+            "(STOAT_FFMPEG_THREAD_BUDGET). A quarter is reserved for previews and "
+            "thumbnails; 0 uses the host CPU count."
+        ),
+    )
     render_disk_degraded_threshold: float = Field(
         default=0.9,
         ge=0.0,
@@ -169,6 +286,15 @@ class Settings(BaseSettings):
         ge=1,
         description="Keep-last-N version retention per project. None retains all versions.",
     )
+    version_keyframe_interval: int = Field(
+        default=20,
+        ge=1,
+        description=(
+            "Store a full compressed keyframe every N project versions; versions in "
+            "between are stored as JSON-patch deltas against the preceding keyframe. "
+            "1 stores every version as a keyframe."
+        ),
+    )
 
     # Thumbnail strips
     thumbnail_strip_interval: float = Field(
@@ -277,6 +403,26 @@ class Settings(BaseSettings):
             "(STOAT_SYNTHETIC_MONITORING_INTERVAL_SECONDS)."
         ),
     )
+
+    # Readiness probe caching
+    health_snapshot_ttl_seconds: float = Field(
+        default=2.0,
+        ge=0.0,
+        le=60.0,
+        description=(
+            "Seconds a /health/ready check snapshot is served before a background "
+            "refresh (STOAT_HEALTH_SNAPSHOT_TTL_SECONDS). 0 runs every check on each probe."
+        ),
+    )
+    health_capability_ttl_seconds: float = Field(
+        default=300.0,
+        ge=0.0,
+        le=86400.0,
+        description=(
+            "Seconds the FFmpeg version probe is cached before a background refresh "
+            "(STOAT_HEALTH_CAPABILITY_TTL_SECONDS). 0 spawns ffmpeg -version on every check run."
+        ),
+    )
     batch_rendering: bool = Field(
         default=True,
         description="Enable batch rendering support (STOAT_BATCH_RENDERING).",
@@ -337,6 +483,15 @@ class Settings(BaseSettings):
             "(STOAT_ASSETS_MAX_SIZE_BYTES). Default 104857600 (100 MB)."
         ),
     )
+    assets_upload_session_ttl_seconds: int = Field(
+        default=86_400,
+        ge=60,
+        le=604_800,
+        description=(
+            "Idle time in seconds after which an unfinished resumable asset upload "
+            "and its partial file are discarded (STOAT_ASSETS_UPLOAD_SESSION_TTL_SECONDS)."
+        ),
+    )
 
     # TTS narration (BL-516)
     openrouter_api_key: str | None = Field(
@@ -368,6 +523,52 @@ class Settings(BaseSettings):
             "this directory must be writable."
         ),
     )
+    tts_piper_workers_per_voice: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description=(
+            "Maximum warm Piper processes kept per voice model "
+            "(STOAT_TTS_PIPER_WORKERS_PER_VOICE). Each worker keeps its ONNX model "
+            "loaded between cues."
+        ),
+    )
+    tts_max_concurrent_synthesis: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description=(
+            "Maximum TTS cues synthesised at once across all backends "
+            "(STOAT_TTS_MAX_CONCURRENT_SYNTHESIS). Cache hits do not count."
+        ),
+    )
+    tts_remote_max_connections: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description=(
+            "Maximum pooled keep-alive connections to the OpenRouter TTS endpoint "
+            "(STOAT_TTS_REMOTE_MAX_CONNECTIONS). Further requests queue for a connection."
+        ),
+    )
+    tts_remote_max_retries: int = Field(
+        default=3,
+        ge=0,
+        le=10,
+        description=(
+            "Retries for remote TTS requests that fail with 429, 5xx or a transport "
+            "error (STOAT_TTS_REMOTE_MAX_RETRIES)."
+        ),
+    )
+    tts_remote_retry_base_delay_s: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=30.0,
+        description=(
+            "Base delay for jittered exponential backoff between remote TTS retries "
+            "(STOAT_TTS_REMOTE_RETRY_BASE_DELAY_S). Retry-After is honoured if longer."
+        ),
+    )
     tts_cache_dir: str = Field(
         default="data/tts_cache",
         description=(
@@ -377,6 +578,21 @@ class Settings(BaseSettings):
             "manually to reclaim disk space."
         ),
     )
+    tts_cache_max_bytes: int = Field(
+        default=1024 * 1024 * 1024,
+        ge=0,
+        description=(
+            "Size bound for the TTS audio cache in bytes (STOAT_TTS_CACHE_MAX_BYTES). "
+            "Least recently used entries are evicted once exceeded; 0 disables eviction."
+        ),
+    )
+    tts_cache_format: Literal["flac", "wav"] = Field(
+        default="flac",
+        description=(
+            "Storage format for cached TTS audio (STOAT_TTS_CACHE_FORMAT). 'flac' is "
+            "lossless and roughly halves disk use; falls back to WAV if FFmpeg cannot encode."
+        ),
+    )
 
     # AGPL §13 source-offer (BL-525)
     source_url: str = Field(
@@ -56,6 +56,7 @@ class EventType(str, Enum):
     QC_STARTED = "qc.started"
     QC_CHECK_COMPLETED = "qc.check_completed"
     QC_COMPLETED = "qc.completed"
+    TTS_SYNTHESIS_PROGRESS = "tts.synthesis_progress"
 
 
 def _next_event_id(scope: str) -> str:
@@ -8,7 +8,7 @@ from stoat_ferret.db.async_repository import (
     AsyncSQLiteVideoRepository,
     AsyncVideoRepository,
 )
-from stoat_ferret.db.audit import AuditLogger
+from stoat_ferret.db.audit import AuditLogger, BufferedAuditLogger
 from stoat_ferret.db.clip_repository import (
     AsyncClipRepository,
     AsyncInMemoryClipRepository,
@@ -35,6 +35,7 @@ from stoat_ferret.db.timeline_repository import (
 __all__ = [
     "AuditEntry",
     "AuditLogger",
+    "BufferedAuditLogger",
     "AsyncClipRepository",
     "AsyncInMemoryClipRepository",
     "AsyncSQLiteClipRepository",
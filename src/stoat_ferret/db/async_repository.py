@@ -9,6 +9,7 @@ import copy
 import json
 import re
 import sqlite3
+from dataclasses import replace
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Protocol
 
@@ -101,6 +102,37 @@ class AsyncVideoRepository(Protocol):
         """
         ...
 
+    async def update_fingerprint(
+        self,
+        id: str,
+        *,
+        path: str,
+        file_size: int,
+        file_mtime_ns: int | None,
+        file_inode: int | None,
+        sampled_sha256: str | None,
+        content_sha256: str | None,
+    ) -> bool:
+        """Update only a video's source fingerprint columns.
+
+        Unlike ``update()``, every other column is left as stored, so edits
+        made to the row since it was read are not overwritten. The write is
+        skipped when the row's path no longer matches ``path``.
+
+        Args:
+            id: The video ID.
+            path: The source path the fingerprint was taken from.
+            file_size: Source file size in bytes.
+            file_mtime_ns: Source modification time in nanoseconds.
+            file_inode: Source inode (or file index) number.
+            sampled_sha256: Sampled-content SHA-256 hex digest.
+            content_sha256: Full-content SHA-256 hex digest.
+
+        Returns:
+            True if the row was updated, False if no row matched.
+        """
+        ...
+
     async def count(self) -> int:
         """Return the total number of videos in the repository.
 
@@ -149,9 +181,10 @@ class AsyncSQLiteVideoRepository:
                     frame_rate_numerator, frame_rate_denominator,
                     width, height, video_codec, audio_codec,
                     file_size, thumbnail_path, created_at, updated_at,
-                    subtitle_count, data_count, subtitle_streams
+                    subtitle_count, data_count, subtitle_streams,
+                    file_mtime_ns, file_inode, sampled_sha256, content_sha256
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     video.id,
@@ -171,6 +204,10 @@ class AsyncSQLiteVideoRepository:
                     video.subtitle_count,
                     video.data_count,
                     json.dumps(video.subtitle_streams),
+                    video.file_mtime_ns,
+                    video.file_inode,
+                    video.sampled_sha256,
+                    video.content_sha256,
                 ),
             )
             await self._conn.commit()
@@ -241,7 +278,11 @@ class AsyncSQLiteVideoRepository:
                 updated_at = ?,
                 subtitle_count = ?,
                 data_count = ?,
-                subtitle_streams = ?
+                subtitle_streams = ?,
+                file_mtime_ns = ?,
+                file_inode = ?,
+                sampled_sha256 = ?,
+                content_sha256 = ?
             WHERE id = ?
             """,
             (
@@ -260,6 +301,10 @@ class AsyncSQLiteVideoRepository:
                 video.subtitle_count,
                 video.data_count,
                 json.dumps(video.subtitle_streams),
+                video.file_mtime_ns,
+                video.file_inode,
+                video.sampled_sha256,
+                video.content_sha256,
                 video.id,
             ),
         )
@@ -268,6 +313,33 @@ class AsyncSQLiteVideoRepository:
             raise ValueError(f"Video {video.id} does not exist")
         return video
 
+    async def update_fingerprint(
+        self,
+        id: str,
+        *,
+        path: str,
+        file_size: int,
+        file_mtime_ns: int | None,
+        file_inode: int | None,
+        sampled_sha256: str | None,
+        content_sha256: str | None,
+    ) -> bool:
+        """Update only a video's source fingerprint columns."""
+        cursor = await self._conn.execute(
+            """
+            UPDATE videos SET
+                file_size = ?,
+                file_mtime_ns = ?,
+                file_inode = ?,
+                sampled_sha256 = ?,
+                content_sha256 = ?
+            WHERE id = ? AND path = ?
+            """,
+            (file_size, file_mtime_ns, file_inode, sampled_sha256, content_sha256, id, path),
+        )
+        await self._conn.commit()
+        return cursor.rowcount > 0
+
     async def delete(self, id: str) -> bool:
         """Delete a video by its ID."""
         cursor = await self._conn.execute("DELETE FROM videos WHERE id = ?", (id,))
@@ -299,6 +371,10 @@ class AsyncSQLiteVideoRepository:
             subtitle_count=row["subtitle_count"] if "subtitle_count" in row_keys else 0,
             data_count=row["data_count"] if "data_count" in row_keys else 0,
             subtitle_streams=subtitle_streams,
+            file_mtime_ns=row["file_mtime_ns"] if "file_mtime_ns" in row_keys else None,
+            file_inode=row["file_inode"] if "file_inode" in row_keys else None,
+            sampled_sha256=row["sampled_sha256"] if "sampled_sha256" in row_keys else None,
+            content_sha256=row["content_sha256"] if "content_sha256" in row_keys else None,
         )
 
 
@@ -400,6 +476,31 @@ class AsyncInMemoryVideoRepository:
         self._videos[video.id] = copy.deepcopy(video)
         return copy.deepcopy(video)
 
+    async def update_fingerprint(
+        self,
+        id: str,
+        *,
+        path: str,
+        file_size: int,
+        file_mtime_ns: int | None,
+        file_inode: int | None,
+        sampled_sha256: str | None,
+        content_sha256: str | None,
+    ) -> bool:
+        """Update only a video's source fingerprint columns."""
+        video = self._videos.get(id)
+        if video is None or video.path != path:
+            return False
+        self._videos[id] = replace(
+            video,
+            file_size=file_size,
+            file_mtime_ns=file_mtime_ns,
+            file_inode=file_inode,
+            sampled_sha256=sampled_sha256,
+            content_sha256=content_sha256,
+        )
+        return True
+
     async def delete(self, id: str) -> bool:
         """Delete a video by its ID."""
         video = self._videos.get(id)
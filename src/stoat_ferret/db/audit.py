@@ -1,16 +1,60 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # Copyright (C) 2026 Grant Wickman
 
-"""Audit logging for tracking data modifications."""
+"""Audit logging for tracking data modifications.
+
+`AuditLogger` writes and commits each entry as it is logged.
+`BufferedAuditLogger` keeps the same interface but only queues entries;
+a background task writes them in batched transactions on a worker thread,
+so repository writes no longer wait on an audit commit.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
 import sqlite3
-from datetime import datetime, timezone
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import structlog
+from prometheus_client import Counter
 
 from stoat_ferret.db.models import AuditEntry
 
+logger = structlog.get_logger(__name__)
+
+audit_entries_dropped_total = Counter(
+    "stoat_audit_entries_dropped_total",
+    "Audit entries discarded because the buffered writer queue was full",
+)
+audit_writer_errors_total = Counter(
+    "stoat_audit_writer_errors_total",
+    "Audit writer failures by stage",
+    ["stage"],
+)
+
+_INSERT_SQL = """
+    INSERT INTO audit_log
+        (id, timestamp, operation, entity_type, entity_id, changes_json, context)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _entry_params(entry: AuditEntry) -> tuple[str | None, ...]:
+    return (
+        entry.id,
+        entry.timestamp.isoformat(),
+        entry.operation,
+        entry.entity_type,
+        entry.entity_id,
+        entry.changes_json,
+        entry.context,
+    )
+
 
 class AuditLogger:
     """Logger for recording audit trail of data changes.
@@ -47,31 +91,8 @@ class AuditLogger:
         Returns:
             The created audit entry.
         """
-        entry = AuditEntry(
-            id=AuditEntry.new_id(),
-            timestamp=datetime.now(timezone.utc),
-            operation=operation,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            changes_json=json.dumps(changes) if changes else None,
-            context=context,
-        )
-        self._conn.execute(
-            """
-            INSERT INTO audit_log
-                (id, timestamp, operation, entity_type, entity_id, changes_json, context)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                entry.id,
-                entry.timestamp.isoformat(),
-                entry.operation,
-                entry.entity_type,
-                entry.entity_id,
-                entry.changes_json,
-                entry.context,
-            ),
-        )
+        entry = self._new_entry(operation, entity_type, entity_id, changes, context)
+        self._conn.execute(_INSERT_SQL, _entry_params(entry))
         self._conn.commit()
         return entry
 
@@ -97,6 +118,63 @@ class AuditLogger:
         )
         return [self._row_to_entry(row) for row in cursor.fetchall()]
 
+    def purge_before(self, cutoff: datetime, *, slice_size: timedelta = timedelta(days=1)) -> int:
+        """Delete entries older than ``cutoff``, one time slice per transaction.
+
+        Deleting a multi-million-row backlog in a single statement would
+        hold the write lock for the whole scan. Instead the range from the
+        oldest entry up to ``cutoff`` is walked in ``slice_size`` steps
+        (using the timestamp index), committing after each slice.
+
+        Args:
+            cutoff: Entries with a timestamp before this are deleted.
+            slice_size: Width of the time range deleted per transaction.
+
+        Returns:
+            Number of entries deleted.
+        """
+        start = self._oldest_timestamp()
+        if start is None:
+            return 0
+        deleted = 0
+        while start < cutoff:
+            end = min(start + slice_size, cutoff)
+            deleted += self._delete_before(end)
+            start = end
+        return deleted
+
+    def _oldest_timestamp(self) -> datetime | None:
+        row = self._conn.execute("SELECT MIN(timestamp) FROM audit_log").fetchone()
+        if row is None or row[0] is None:
+            return None
+        return datetime.fromisoformat(str(row[0]))
+
+    def _delete_before(self, end: datetime) -> int:
+        cursor = self._conn.execute(
+            "DELETE FROM audit_log WHERE timestamp < ?",
+            (end.isoformat(),),
+        )
+        self._conn.commit()
+        return cursor.rowcount
+
+    def _new_entry(
+        self,
+        operation: str,
+        entity_type: str,
+        entity_id: str,
+        changes: dict[str, object] | None,
+        context: str | None,
+    ) -> AuditEntry:
+        return AuditEntry(
+            id=AuditEntry.new_id(),
+            timestamp=datetime.now(timezone.utc),
+            operation=operation,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            changes_json=json.dumps(changes) if changes else None,
+            context=context,
+        )
+
     def _row_to_entry(self, row: tuple[object, ...]) -> AuditEntry:
         """Convert a database row to an AuditEntry object."""
         return AuditEntry(
@@ -108,3 +186,273 @@ class AuditLogger:
             changes_json=str(row[5]) if row[5] is not None else None,
             context=str(row[6]) if row[6] is not None else None,
         )
+
+
+@dataclass
+class AuditSinkStats:
+    """Counters for a `BufferedAuditLogger`.
+
+    Attributes:
+        queued: Entries accepted by `BufferedAuditLogger.log_change`.
+        written: Entries committed to ``audit_log``.
+        batches: Batched transactions committed.
+        dropped: Entries discarded because the queue was full.
+        write_errors: Batches that failed to write (their entries are lost).
+        purged: Entries deleted by retention.
+    """
+
+    queued: int = 0
+    written: int = 0
+    batches: int = 0
+    dropped: int = 0
+    write_errors: int = 0
+    purged: int = 0
+
+
+class BufferedAuditLogger(AuditLogger):
+    """Audit logger that writes entries in batches off the request path.
+
+    `log_change` only appends to a bounded in-memory queue and returns.
+    A background task started with `start` drains the queue every
+    ``flush_interval_s`` (or as soon as ``batch_size`` entries are waiting)
+    and writes each batch with one ``executemany`` and one commit in a
+    worker thread. `aclose` writes whatever is still queued.
+
+    When the queue is full, new entries are dropped and counted in
+    ``stats.dropped`` rather than blocking the caller. `get_history`
+    includes queued entries, so reads see every accepted change.
+
+    The connection must be opened with ``check_same_thread=False``; all
+    use of it is serialised by an internal lock that `log_change` never
+    takes, so queueing never waits on a commit in progress.
+    """
+
+    RETENTION_INTERVAL_S: float = 3600.0
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        max_pending: int = 10_000,
+        batch_size: int = 500,
+        flush_interval_s: float = 0.25,
+        retention: timedelta | None = None,
+    ) -> None:
+        """Initialize the logger; call `start` from a running event loop.
+
+        Args:
+            conn: SQLite connection shared with the writer thread.
+            max_pending: Maximum queued entries before new ones are dropped.
+            batch_size: Maximum entries written per transaction.
+            flush_interval_s: Longest time an entry waits in the queue.
+            retention: Age after which entries are purged, checked hourly.
+                None keeps entries forever.
+        """
+        super().__init__(conn)
+        self._max_pending = max(1, max_pending)
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval_s
+        self._retention = retention
+        self._pending: deque[AuditEntry] = deque()
+        self._in_flight: list[AuditEntry] = []
+        self._lock = threading.Lock()
+        self._conn_lock = threading.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task[None] | None = None
+        self.stats = AuditSinkStats()
+
+    @property
+    def pending(self) -> int:
+        """Number of entries queued but not yet written."""
+        with self._lock:
+            return len(self._pending)
+
+    def log_change(
+        self,
+        operation: str,
+        entity_type: str,
+        entity_id: str,
+        changes: dict[str, object] | None = None,
+        context: str | None = None,
+    ) -> AuditEntry:
+        """Queue a data modification for the next batch.
+
+        Args:
+            operation: Type of operation (INSERT, UPDATE, DELETE).
+            entity_type: Type of entity being modified (e.g., "video").
+            entity_id: ID of the entity being modified.
+            changes: Dictionary of field changes for UPDATE operations.
+            context: Optional context (e.g., user ID, request ID).
+
+        Returns:
+            The audit entry. It is written asynchronously, or not at all if
+            the queue was full (see ``stats.dropped``).
+        """
+        entry = self._new_entry(operation, entity_type, entity_id, changes, context)
+        with self._lock:
+            full = len(self._pending) >= self._max_pending
+            if full:
+                self.stats.dropped += 1
+                audit_entries_dropped_total.inc()
+            else:
+                self._pending.append(entry)
+                self.stats.queued += 1
+            backlog = len(self._pending)
+        if full:
+            logger.warning(
+                "audit.entry_dropped",
+                operation=operation,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                dropped_total=self.stats.dropped,
+            )
+        elif backlog >= self._batch_size:
+            self._signal()
+        return entry
+
+    def get_history(self, entity_id: str, limit: int = 100) -> list[AuditEntry]:
+        """Get audit history for an entity, including entries still queued.
+
+        This waits for any batch commit in progress, so on the event loop
+        use `aget_history` instead.
+
+        Args:
+            entity_id: ID of the entity to get history for.
+            limit: Maximum number of entries to return.
+
+        Returns:
+            List of audit entries, most recent first.
+        """
+        # Holding the connection lock keeps a batch from committing between
+        # the queue snapshot and the read, so no entry is missed or doubled.
+        with self._conn_lock:
+            with self._lock:
+                queued = [
+                    entry
+                    for entry in (*self._in_flight, *self._pending)
+                    if entry.entity_id == entity_id
+                ]
+            written = super().get_history(entity_id, limit)
+        merged = sorted(queued + written, key=lambda entry: entry.timestamp, reverse=True)
+        return merged[:limit]
+
+    async def aget_history(self, entity_id: str, limit: int = 100) -> list[AuditEntry]:
+        """Run `get_history` on a worker thread so the event loop never waits on a commit.
+
+        Args:
+            entity_id: ID of the entity to get history for.
+            limit: Maximum number of entries to return.
+
+        Returns:
+            List of audit entries, most recent first.
+        """
+        return await asyncio.to_thread(self.get_history, entity_id, limit)
+
+    def purge_before(self, cutoff: datetime, *, slice_size: timedelta = timedelta(days=1)) -> int:
+        """Delete written entries older than ``cutoff`` (see `AuditLogger.purge_before`).
+
+        The connection lock is taken per slice, so queued batches and
+        history reads can run between slices of a long purge.
+        """
+        deleted = super().purge_before(cutoff, slice_size=slice_size)
+        self.stats.purged += deleted
+        return deleted
+
+    async def start(self) -> None:
+        """Start the background writer task (idempotent)."""
+        if self._task is None or self._task.done():
+            self._loop = asyncio.get_running_loop()
+            self._task = asyncio.create_task(self._run(), name="audit-writer")
+
+    async def flush(self) -> None:
+        """Write every entry queued so far."""
+        async with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = [
+                        self._pending.popleft()
+                        for _ in range(min(self._batch_size, len(self._pending)))
+                    ]
+                    self._in_flight = batch
+                if not batch:
+                    return
+                await asyncio.to_thread(self._write_batch, batch)
+
+    async def aclose(self) -> None:
+        """Stop the writer task, then write the remaining queue."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        # Any failure is logged and the loop carries on: a dead writer task
+        # would silently let the queue fill and every later entry be dropped.
+        loop = asyncio.get_running_loop()
+        next_purge = loop.time()
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=self._flush_interval)
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception:
+                audit_writer_errors_total.labels(stage="flush").inc()
+                logger.exception("audit.writer_flush_failed")
+            if self._retention is not None and loop.time() >= next_purge:
+                next_purge = loop.time() + self.RETENTION_INTERVAL_S
+                await self._purge_expired(self._retention)
+
+    async def _purge_expired(self, retention: timedelta) -> None:
+        cutoff = datetime.now(timezone.utc) - retention
+        try:
+            deleted = await asyncio.to_thread(self.purge_before, cutoff)
+        except Exception as exc:
+            audit_writer_errors_total.labels(stage="retention").inc()
+            logger.warning("audit.retention_failed", error=str(exc))
+            return
+        if deleted:
+            logger.info("audit.retention_purged", deleted=deleted, cutoff=cutoff.isoformat())
+
+    def _oldest_timestamp(self) -> datetime | None:
+        with self._conn_lock:
+            return super()._oldest_timestamp()
+
+    def _delete_before(self, end: datetime) -> int:
+        with self._conn_lock:
+            return super()._delete_before(end)
+
+    def _write_batch(self, batch: list[AuditEntry]) -> None:
+        with self._conn_lock:
+            try:
+                self._conn.executemany(_INSERT_SQL, [_entry_params(entry) for entry in batch])
+                self._conn.commit()
+            except Exception as exc:
+                self.stats.write_errors += 1
+                audit_writer_errors_total.labels(stage="write").inc()
+                logger.error("audit.batch_write_failed", entries=len(batch), error=str(exc))
+                with contextlib.suppress(sqlite3.Error):
+                    self._conn.rollback()
+            else:
+                self.stats.written += len(batch)
+                self.stats.batches += 1
+            finally:
+                with self._lock:
+                    self._in_flight = []
+
+    def _signal(self) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._wake.set()
+        else:
+            loop.call_soon_threadsafe(self._wake.set)
@@ -14,6 +14,61 @@ import aiosqlite
 
 from stoat_ferret.db.models import Clip
 
+_INSERT_CLIP = """
+    INSERT INTO clips (id, project_id, source_video_id, in_point, out_point,
+                       timeline_position, effects_json, created_at, updated_at,
+                       track_id, timeline_start, timeline_end,
+                       clip_type, generator_params, source_asset_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_CLIP = """
+    UPDATE clips SET
+        in_point = ?, out_point = ?, timeline_position = ?,
+        effects_json = ?, updated_at = ?,
+        track_id = ?, timeline_start = ?, timeline_end = ?
+    WHERE id = ?
+"""
+
+
+def _insert_params(clip: Clip) -> tuple[Any, ...]:
+    """Bind parameters for `_INSERT_CLIP`."""
+    effects_json = json.dumps(clip.effects) if clip.effects is not None else None
+    gen_json = json.dumps(clip.generator_params) if clip.generator_params is not None else None
+    return (
+        clip.id,
+        clip.project_id,
+        clip.source_video_id,
+        clip.in_point,
+        clip.out_point,
+        clip.timeline_position,
+        effects_json,
+        clip.created_at.isoformat(),
+        clip.updated_at.isoformat(),
+        clip.track_id,
+        clip.timeline_start,
+        clip.timeline_end,
+        clip.clip_type,
+        gen_json,
+        clip.source_asset_id,
+    )
+
+
+def _update_params(clip: Clip) -> tuple[Any, ...]:
+    """Bind parameters for `_UPDATE_CLIP`."""
+    effects_json = json.dumps(clip.effects) if clip.effects is not None else None
+    return (
+        clip.in_point,
+        clip.out_point,
+        clip.timeline_position,
+        effects_json,
+        clip.updated_at.isoformat(),
+        clip.track_id,
+        clip.timeline_start,
+        clip.timeline_end,
+        clip.id,
+    )
+
 
 class AsyncClipRepository(Protocol):
     """Protocol for async clip repository operations.
@@ -73,6 +128,39 @@ class AsyncClipRepository(Protocol):
         """
         ...
 
+    async def add_many(self, clips: list[Clip]) -> list[Clip]:
+        """Add several clips in one transaction.
+
+        Args:
+            clips: The clips to add.
+
+        Returns:
+            The added clips.
+
+        Raises:
+            ValueError: If any clip ID already exists or a foreign key
+                constraint fails; no clip is added in that case.
+        """
+        ...
+
+    async def update_many(self, clips: list[Clip]) -> list[Clip]:
+        """Update several existing clips in one transaction.
+
+        Effects are stored on the clip row, so this also persists effect
+        changes for every clip in the batch.
+
+        Args:
+            clips: The clips with updated fields.
+
+        Returns:
+            The updated clips.
+
+        Raises:
+            ValueError: If any clip does not exist; no clip is updated in
+                that case.
+        """
+        ...
+
     async def delete(self, id: str) -> bool:
         """Delete a clip by its ID.
 
@@ -115,37 +203,8 @@ class AsyncSQLiteClipRepository:
 
     async def add(self, clip: Clip) -> Clip:
         """Add a clip to the repository."""
-        effects_json = json.dumps(clip.effects) if clip.effects is not None else None
-        generator_params_json = (
-            json.dumps(clip.generator_params) if clip.generator_params is not None else None
-        )
         try:
-            await self._conn.execute(
-                """
-                INSERT INTO clips (id, project_id, source_video_id, in_point, out_point,
-                                  timeline_position, effects_json, created_at, updated_at,
-                                  track_id, timeline_start, timeline_end,
-                                  clip_type, generator_params, source_asset_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    clip.id,
-                    clip.project_id,
-                    clip.source_video_id,
-                    clip.in_point,
-                    clip.out_point,
-                    clip.timeline_position,
-                    effects_json,
-                    clip.created_at.isoformat(),
-                    clip.updated_at.isoformat(),
-                    clip.track_id,
-                    clip.timeline_start,
-                    clip.timeline_end,
-                    clip.clip_type,
-                    generator_params_json,
-                    clip.source_asset_id,
-                ),
-            )
+            await self._conn.execute(_INSERT_CLIP, _insert_params(clip))
             await self._conn.commit()
         except aiosqlite.IntegrityError as e:
             raise ValueError(f"Clip already exists or foreign key violation: {e}") from e
@@ -168,32 +227,39 @@ class AsyncSQLiteClipRepository:
 
     async def update(self, clip: Clip) -> Clip:
         """Update an existing clip."""
-        effects_json = json.dumps(clip.effects) if clip.effects is not None else None
-        cursor = await self._conn.execute(
-            """
-            UPDATE clips SET
-                in_point = ?, out_point = ?, timeline_position = ?,
-                effects_json = ?, updated_at = ?,
-                track_id = ?, timeline_start = ?, timeline_end = ?
-            WHERE id = ?
-            """,
-            (
-                clip.in_point,
-                clip.out_point,
-                clip.timeline_position,
-                effects_json,
-                clip.updated_at.isoformat(),
-                clip.track_id,
-                clip.timeline_start,
-                clip.timeline_end,
-                clip.id,
-            ),
-        )
+        cursor = await self._conn.execute(_UPDATE_CLIP, _update_params(clip))
         await self._conn.commit()
         if cursor.rowcount == 0:
             raise ValueError(f"Clip {clip.id} does not exist")
         return clip
 
+    async def add_many(self, clips: list[Clip]) -> list[Clip]:
+        """Add several clips in one transaction."""
+        try:
+            await self._conn.executemany(_INSERT_CLIP, [_insert_params(c) for c in clips])
+            await self._conn.commit()
+        except aiosqlite.IntegrityError as e:
+            await self._conn.rollback()
+            raise ValueError(f"Clip already exists or foreign key violation: {e}") from e
+        return clips
+
+    async def update_many(self, clips: list[Clip]) -> list[Clip]:
+        """Update several existing clips in one transaction."""
+        if not clips:
+            return clips
+        ids = [c.id for c in clips]
+        placeholders = ",".join("?" * len(ids))
+        cursor = await self._conn.execute(
+            f"SELECT COUNT(*) FROM clips WHERE id IN ({placeholders})", ids
+        )
+        row = await cursor.fetchone()
+        assert row is not None  # COUNT(*) always returns a row
+        if int(row[0]) != len(set(ids)):
+            raise ValueError("One or more clips in the batch do not exist")
+        await self._conn.executemany(_UPDATE_CLIP, [_update_params(c) for c in clips])
+        await self._conn.commit()
+        return clips
+
     async def delete(self, id: str) -> bool:
         """Delete a clip by its ID."""
         cursor = await self._conn.execute("DELETE FROM clips WHERE id = ?", (id,))
@@ -202,40 +268,10 @@ class AsyncSQLiteClipRepository:
 
     async def split_atomic(self, clip_a: Clip, clip_b: Clip, original_id: str) -> tuple[Clip, Clip]:
         """Create clip_a and clip_b and delete original in a single atomic transaction."""
-        _insert = """
-            INSERT INTO clips (id, project_id, source_video_id, in_point, out_point,
-                               timeline_position, effects_json, created_at, updated_at,
-                               track_id, timeline_start, timeline_end,
-                               clip_type, generator_params, source_asset_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
-        def _params(clip: Clip) -> tuple[Any, ...]:
-            effects_json = json.dumps(clip.effects) if clip.effects is not None else None
-            gen_json = (
-                json.dumps(clip.generator_params) if clip.generator_params is not None else None
-            )
-            return (
-                clip.id,
-                clip.project_id,
-                clip.source_video_id,
-                clip.in_point,
-                clip.out_point,
-                clip.timeline_position,
-                effects_json,
-                clip.created_at.isoformat(),
-                clip.updated_at.isoformat(),
-                clip.track_id,
-                clip.timeline_start,
-                clip.timeline_end,
-                clip.clip_type,
-                gen_json,
-                clip.source_asset_id,
-            )
-
         try:
-            await self._conn.execute(_insert, _params(clip_a))
-            await self._conn.execute(_insert, _params(clip_b))
+            await self._conn.executemany(
+                _INSERT_CLIP, [_insert_params(clip_a), _insert_params(clip_b)]
+            )
             await self._conn.execute("DELETE FROM clips WHERE id = ?", (original_id,))
             await self._conn.commit()
         except aiosqlite.IntegrityError as e:
@@ -310,6 +346,23 @@ class AsyncInMemoryClipRepository:
         self._clips[clip.id] = copy.deepcopy(clip)
         return copy.deepcopy(clip)
 
+    async def add_many(self, clips: list[Clip]) -> list[Clip]:
+        """Add several clips in one transaction."""
+        ids = [c.id for c in clips]
+        if len(set(ids)) != len(ids) or any(i in self._clips for i in ids):
+            raise ValueError("Clip already exists")
+        for clip in clips:
+            self._clips[clip.id] = copy.deepcopy(clip)
+        return copy.deepcopy(clips)
+
+    async def update_many(self, clips: list[Clip]) -> list[Clip]:
+        """Update several existing clips in one transaction."""
+        if any(c.id not in self._clips for c in clips):
+            raise ValueError("One or more clips in the batch do not exist")
+        for clip in clips:
+            self._clips[clip.id] = copy.deepcopy(clip)
+        return copy.deepcopy(clips)
+
     async def delete(self, id: str) -> bool:
         """Delete a clip by its ID."""
         if id not in self._clips:
@@ -0,0 +1,279 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Read-connection pool plus a single serialized writer for the SQLite database.
+
+aiosqlite runs every statement of a connection on that connection's own
+thread, so with one shared connection a long read (render listing, FTS
+search, version listing) queues behind every write and vice versa.
+`SQLiteConnectionPool` keeps the shared-connection interface the
+repositories already use (``execute``, ``executemany``, ``commit``,
+``rollback``, ``row_factory``) but routes statements:
+
+- Writes, PRAGMAs and DDL go to the one writer connection.
+- Plain ``SELECT``/``WITH`` reads go to the least busy of several read-only
+  WAL connections, so they run in parallel with each other and with writes.
+- A task that has written but not yet committed keeps reading from the
+  writer until it commits or rolls back, so it sees its own changes.
+
+``commit()`` is a group commit. All writes share the writer connection, so
+one COMMIT covers every write issued before it. Callers that ask to commit
+while a commit is already running wait for it and are then covered by the
+next one, rather than each issuing their own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_READ_POOL_SIZE = 4
+DEFAULT_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+DEFAULT_CACHE_SIZE_KIB = 16 * 1024
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+
+_LEADING_COMMENTS = re.compile(r"^(\s+|--[^\n]*\n?|/\*.*?\*/)+", re.DOTALL)
+_WRITE_KEYWORDS = re.compile(r"\b(INSERT|UPDATE|DELETE|REPLACE|UPSERT)\b", re.IGNORECASE)
+
+# Set for the current task once it has written on the shared writer and not
+# yet committed; its reads then stay on the writer so they see those writes.
+_pending_write: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "stoat_sqlite_pending_write", default=False
+)
+
+
+def is_read_only_statement(sql: str) -> bool:
+    """Return True if `sql` can safely run on a read-only connection.
+
+    Args:
+        sql: A single SQL statement.
+
+    Returns:
+        True for ``SELECT`` statements and ``WITH`` queries that contain no
+        data-modifying keyword; False for everything else (including PRAGMAs).
+    """
+    head = _LEADING_COMMENTS.sub("", sql, count=1)[:6].upper()
+    if head.startswith("SELECT"):
+        return True
+    if head.startswith("WITH"):
+        return _WRITE_KEYWORDS.search(sql) is None
+    return False
+
+
+@dataclass
+class PoolStats:
+    """Routing and commit counters for a `SQLiteConnectionPool`.
+
+    Attributes:
+        reads_routed: Statements executed on a read-only connection.
+        reads_on_writer: Read statements kept on the writer (no readers, or
+            the calling task had uncommitted writes).
+        writes: Statements executed on the writer (excluding reads above).
+        commits_requested: Calls to `SQLiteConnectionPool.commit`.
+        commits_executed: COMMITs actually issued on the writer.
+    """
+
+    reads_routed: int = 0
+    reads_on_writer: int = 0
+    writes: int = 0
+    commits_requested: int = 0
+    commits_executed: int = 0
+
+
+class SQLiteConnectionPool:
+    """One writer connection plus a pool of read-only WAL connections.
+
+    Drop-in replacement for the shared ``aiosqlite.Connection`` held in
+    ``app.state.db``; see the module docstring for the routing rules.
+    In-memory databases cannot be shared between connections, so for
+    ``:memory:`` (or ``read_pool_size=0``) every statement uses the writer.
+    """
+
+    def __init__(
+        self,
+        database_path: str | Path,
+        *,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+        mmap_size_bytes: int = DEFAULT_MMAP_SIZE_BYTES,
+        cache_size_kib: int = DEFAULT_CACHE_SIZE_KIB,
+        busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+        commit_window_ms: float = 0.0,
+    ) -> None:
+        """Configure the pool; call `open` before use.
+
+        Args:
+            database_path: SQLite database file, or ``:memory:``.
+            read_pool_size: Number of read-only connections. 0 routes all
+                statements to the writer.
+            mmap_size_bytes: ``PRAGMA mmap_size`` for every connection.
+            cache_size_kib: Page cache size per connection, in KiB.
+            busy_timeout_ms: ``PRAGMA busy_timeout`` for every connection.
+            commit_window_ms: How long a group commit waits for more callers
+                to join before issuing COMMIT. 0 only batches callers that
+                queue up behind a commit already in progress.
+        """
+        self._path = str(database_path)
+        in_memory = self._path == ":memory:" or self._path.startswith("file::memory:")
+        self._read_pool_size = 0 if in_memory else max(0, read_pool_size)
+        self._reader_uri = "" if in_memory else Path(self._path).resolve().as_uri() + "?mode=ro"
+        self._mmap_size = mmap_size_bytes
+        self._cache_size_kib = cache_size_kib
+        self._busy_timeout_ms = busy_timeout_ms
+        self._commit_window = commit_window_ms / 1000
+        self._writer: aiosqlite.Connection | None = None
+        self._readers: list[aiosqlite.Connection] = []
+        self._reader_load: list[int] = []
+        self._row_factory: Any = aiosqlite.Row
+        self._commit_lock = asyncio.Lock()
+        self._commit_tickets = 0
+        self._committed_through = 0
+        self.stats = PoolStats()
+
+    async def open(self) -> None:
+        """Open the writer, switch the database to WAL, then open the readers."""
+        writer = await aiosqlite.connect(self._path)
+        await self._apply_pragmas(writer)
+        await writer.execute("PRAGMA journal_mode=WAL")
+        await writer.execute("PRAGMA synchronous=NORMAL")
+        await writer.execute("PRAGMA foreign_keys=ON")
+        writer.row_factory = self._row_factory
+        self._writer = writer
+
+        for _ in range(self._read_pool_size):
+            reader = await aiosqlite.connect(self._reader_uri, uri=True)
+            await self._apply_pragmas(reader)
+            await reader.execute("PRAGMA query_only=ON")
+            reader.row_factory = self._row_factory
+            self._readers.append(reader)
+            self._reader_load.append(0)
+        logger.info(
+            "sqlite_pool_opened",
+            database_path=self._path,
+            read_pool_size=len(self._readers),
+        )
+
+    async def close(self) -> None:
+        """Close every connection, readers first."""
+        for reader in self._readers:
+            await reader.close()
+        self._readers.clear()
+        self._reader_load.clear()
+        if self._writer is not None:
+            await self._writer.close()
+            self._writer = None
+
+    async def __aenter__(self) -> SQLiteConnectionPool:
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    @property
+    def writer(self) -> aiosqlite.Connection:
+        """The writer connection.
+
+        Raises:
+            RuntimeError: If the pool has not been opened.
+        """
+        if self._writer is None:
+            raise RuntimeError("SQLiteConnectionPool is not open")
+        return self._writer
+
+    @property
+    def read_pool_size(self) -> int:
+        """Number of open read-only connections."""
+        return len(self._readers)
+
+    @property
+    def row_factory(self) -> Any:
+        """Row factory applied to every connection in the pool."""
+        return self._row_factory
+
+    @row_factory.setter
+    def row_factory(self, factory: Any) -> None:
+        self._row_factory = factory
+        for conn in [self._writer, *self._readers]:
+            if conn is not None:
+                conn.row_factory = factory
+
+    @property
+    def in_transaction(self) -> bool:
+        """True if the writer has uncommitted changes."""
+        return self.writer.in_transaction
+
+    async def execute(self, sql: str, parameters: Iterable[Any] | None = None) -> aiosqlite.Cursor:
+        """Execute one statement on the connection chosen by the routing rules.
+
+        Args:
+            sql: SQL statement.
+            parameters: Bound parameters.
+
+        Returns:
+            The cursor, bound to whichever connection ran the statement.
+        """
+        if not is_read_only_statement(sql):
+            self.stats.writes += 1
+            cursor = await self.writer.execute(sql, parameters)
+            if self.writer.in_transaction:
+                _pending_write.set(True)
+            return cursor
+        if not self._readers or _pending_write.get():
+            self.stats.reads_on_writer += 1
+            return await self.writer.execute(sql, parameters)
+
+        index = min(range(len(self._readers)), key=self._reader_load.__getitem__)
+        self._reader_load[index] += 1
+        self.stats.reads_routed += 1
+        try:
+            return await self._readers[index].execute(sql, parameters)
+        finally:
+            self._reader_load[index] -= 1
+
+    async def executemany(self, sql: str, parameters: Iterable[Iterable[Any]]) -> aiosqlite.Cursor:
+        """Execute a statement for each parameter set on the writer."""
+        self.stats.writes += 1
+        cursor = await self.writer.executemany(sql, parameters)
+        if self.writer.in_transaction:
+            _pending_write.set(True)
+        return cursor
+
+    async def commit(self) -> None:
+        """Commit the writer's open transaction, coalescing concurrent callers.
+
+        Each caller takes a ticket. A caller whose ticket was already covered
+        by a commit that started after it asked returns without issuing its
+        own COMMIT.
+        """
+        self.stats.commits_requested += 1
+        self._commit_tickets += 1
+        ticket = self._commit_tickets
+        async with self._commit_lock:
+            if self._committed_through < ticket:
+                if self._commit_window > 0:
+                    await asyncio.sleep(self._commit_window)
+                covered = self._commit_tickets
+                await self.writer.commit()
+                self.stats.commits_executed += 1
+                self._committed_through = covered
+        _pending_write.set(False)
+
+    async def rollback(self) -> None:
+        """Roll back the writer's open transaction."""
+        await self.writer.rollback()
+        _pending_write.set(False)
+
+    async def _apply_pragmas(self, conn: aiosqlite.Connection) -> None:
+        await conn.execute(f"PRAGMA busy_timeout={int(self._busy_timeout_ms)}")
+        await conn.execute(f"PRAGMA cache_size=-{int(self._cache_size_kib)}")
+        await conn.execute(f"PRAGMA mmap_size={int(self._mmap_size)}")
@@ -0,0 +1,178 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Minimal JSON Patch (RFC 6902) diff and apply for stored timeline documents.
+
+Only the ``add``, ``remove`` and ``replace`` operations are produced or
+accepted. `diff` preserves key order: when a dict's keys would end up in a
+different order after patching, the whole dict is replaced instead, so
+``json.dumps(apply_patch(a, diff(a, b)))`` reproduces ``json.dumps(b)``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+JsonPatch = list[dict[str, Any]]
+
+
+class JsonPatchError(ValueError):
+    """Raised when a patch cannot be applied to a document."""
+
+
+def escape_token(token: str) -> str:
+    """Escape a single JSON Pointer reference token.
+
+    Args:
+        token: Raw dict key or list index.
+
+    Returns:
+        The token with ``~`` and ``/`` escaped per RFC 6901.
+    """
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape_token(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _same(a: Any, b: Any) -> bool:
+    """Strict equality that keeps ``1``, ``1.0`` and ``True`` apart."""
+    return type(a) is type(b) and a == b
+
+
+def diff(a: Any, b: Any, path: str = "") -> JsonPatch:
+    """Compute a patch that transforms document `a` into document `b`.
+
+    Args:
+        a: Source JSON document (parsed).
+        b: Target JSON document (parsed).
+        path: JSON Pointer prefix for the generated operations.
+
+    Returns:
+        List of patch operations; empty when the documents are identical.
+    """
+    if isinstance(a, dict) and isinstance(b, dict):
+        return _diff_dict(a, b, path)
+    if isinstance(a, list) and isinstance(b, list):
+        return _diff_list(a, b, path)
+    if _same(a, b):
+        return []
+    return [{"op": "replace", "path": path, "value": b}]
+
+
+def _diff_dict(a: dict[str, Any], b: dict[str, Any], path: str) -> JsonPatch:
+    patched_order = [k for k in a if k in b] + [k for k in b if k not in a]
+    if patched_order != list(b):
+        return [{"op": "replace", "path": path, "value": b}]
+
+    ops: JsonPatch = []
+    for key in a:
+        if key not in b:
+            ops.append({"op": "remove", "path": f"{path}/{escape_token(key)}"})
+    for key, value in b.items():
+        child = f"{path}/{escape_token(key)}"
+        if key in a:
+            ops.extend(diff(a[key], value, child))
+        else:
+            ops.append({"op": "add", "path": child, "value": value})
+    return ops
+
+
+def _diff_list(a: list[Any], b: list[Any], path: str) -> JsonPatch:
+    prefix = 0
+    limit = min(len(a), len(b))
+    while prefix < limit and _deep_same(a[prefix], b[prefix]):
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and _deep_same(a[-1 - suffix], b[-1 - suffix]):
+        suffix += 1
+
+    a_mid = a[prefix : len(a) - suffix]
+    b_mid = b[prefix : len(b) - suffix]
+    shared = min(len(a_mid), len(b_mid))
+
+    ops: JsonPatch = []
+    for i in range(shared):
+        ops.extend(diff(a_mid[i], b_mid[i], f"{path}/{prefix + i}"))
+    for _ in range(len(a_mid) - shared):
+        ops.append({"op": "remove", "path": f"{path}/{prefix + shared}"})
+    for i in range(shared, len(b_mid)):
+        ops.append({"op": "add", "path": f"{path}/{prefix + i}", "value": b_mid[i]})
+    return ops
+
+
+def _deep_same(a: Any, b: Any) -> bool:
+    return not diff(a, b) if isinstance(a, (dict, list)) else _same(a, b)
+
+
+def _resolve_parent(doc: Any, path: str) -> tuple[Any, str]:
+    """Walk to the container holding the last token of `path`."""
+    tokens = [_unescape_token(t) for t in path.split("/")[1:]]
+    node = doc
+    for token in tokens[:-1]:
+        try:
+            node = node[int(token)] if isinstance(node, list) else node[token]
+        except (KeyError, IndexError, ValueError, TypeError) as exc:
+            raise JsonPatchError(f"Path not found: {path}") from exc
+    return node, tokens[-1]
+
+
+def _list_index(container: list[Any], token: str, path: str, *, allow_end: bool) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    try:
+        index = int(token)
+    except ValueError as exc:
+        raise JsonPatchError(f"Invalid list index in path: {path}") from exc
+    upper = len(container) if allow_end else len(container) - 1
+    if index < 0 or index > upper:
+        raise JsonPatchError(f"List index out of range: {path}")
+    return index
+
+
+def apply_patch(doc: Any, patch: JsonPatch) -> Any:
+    """Apply `patch` to `doc` in place.
+
+    Args:
+        doc: Parsed JSON document to modify.
+        patch: Operations produced by `diff` (or any RFC 6902 add/remove/replace).
+
+    Returns:
+        The patched document (a new object when the root itself is replaced).
+
+    Raises:
+        JsonPatchError: If an operation is unsupported or its path does not resolve.
+    """
+    for op in patch:
+        kind = op.get("op")
+        path = op.get("path")
+        if not isinstance(path, str) or (path and not path.startswith("/")):
+            raise JsonPatchError(f"Invalid path: {path!r}")
+        if kind not in ("add", "remove", "replace"):
+            raise JsonPatchError(f"Unsupported patch operation: {kind!r}")
+
+        if path == "":
+            if kind == "remove":
+                raise JsonPatchError("Cannot remove the document root")
+            doc = op["value"]
+            continue
+
+        parent, token = _resolve_parent(doc, path)
+        if isinstance(parent, list):
+            if kind == "add":
+                parent.insert(_list_index(parent, token, path, allow_end=True), op["value"])
+            elif kind == "remove":
+                del parent[_list_index(parent, token, path, allow_end=False)]
+            else:
+                parent[_list_index(parent, token, path, allow_end=False)] = op["value"]
+        elif isinstance(parent, dict):
+            if kind != "add" and token not in parent:
+                raise JsonPatchError(f"Path not found: {path}")
+            if kind == "remove":
+                del parent[token]
+            else:
+                parent[token] = op["value"]
+        else:
+            raise JsonPatchError(f"Path not found: {path}")
+    return doc
@@ -528,6 +528,11 @@ class Video:
     subtitle_count: int = 0
     data_count: int = 0
     subtitle_streams: list[dict[str, Any]] = field(default_factory=list)
+    # Source fingerprint (see api/services/source_fingerprint.py); None until scanned.
+    file_mtime_ns: int | None = None
+    file_inode: int | None = None
+    sampled_sha256: str | None = None
+    content_sha256: str | None = None
 
     @property
     def frame_rate(self) -> float:
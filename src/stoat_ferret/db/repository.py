@@ -138,9 +138,10 @@ class SQLiteVideoRepository:
                     frame_rate_numerator, frame_rate_denominator,
                     width, height, video_codec, audio_codec,
                     file_size, thumbnail_path, created_at, updated_at,
-                    subtitle_count, data_count, subtitle_streams
+                    subtitle_count, data_count, subtitle_streams,
+                    file_mtime_ns, file_inode, sampled_sha256, content_sha256
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     video.id,
@@ -160,6 +161,10 @@ class SQLiteVideoRepository:
                     video.subtitle_count,
                     video.data_count,
                     json.dumps(video.subtitle_streams),
+                    video.file_mtime_ns,
+                    video.file_inode,
+                    video.sampled_sha256,
+                    video.content_sha256,
                 ),
             )
             self._conn.commit()
@@ -223,7 +228,11 @@ class SQLiteVideoRepository:
                 updated_at = ?,
                 subtitle_count = ?,
                 data_count = ?,
-                subtitle_streams = ?
+                subtitle_streams = ?,
+                file_mtime_ns = ?,
+                file_inode = ?,
+                sampled_sha256 = ?,
+                content_sha256 = ?
             WHERE id = ?
             """,
             (
@@ -242,6 +251,10 @@ class SQLiteVideoRepository:
                 video.subtitle_count,
                 video.data_count,
                 json.dumps(video.subtitle_streams),
+                video.file_mtime_ns,
+                video.file_inode,
+                video.sampled_sha256,
+                video.content_sha256,
                 video.id,
             ),
         )
@@ -310,6 +323,10 @@ class SQLiteVideoRepository:
             subtitle_count=row["subtitle_count"] if "subtitle_count" in row_keys else 0,
             data_count=row["data_count"] if "data_count" in row_keys else 0,
             subtitle_streams=subtitle_streams,
+            file_mtime_ns=row["file_mtime_ns"] if "file_mtime_ns" in row_keys else None,
+            file_inode=row["file_inode"] if "file_inode" in row_keys else None,
+            sampled_sha256=row["sampled_sha256"] if "sampled_sha256" in row_keys else None,
+            content_sha256=row["content_sha256"] if "content_sha256" in row_keys else None,
         )
 
 
@@ -30,6 +30,7 @@ TABLE_PREVIEW_SESSIONS = "preview_sessions"
 TABLE_RENDER_JOBS = "render_jobs"
 TABLE_RENDER_CHECKPOINTS = "render_checkpoints"
 TABLE_ENCODER_CACHE = "encoder_cache"
+TABLE_RENDER_TELEMETRY = "render_telemetry"
 TABLE_MARKERS = "project_markers"
 TABLE_QC_REPORTS = "qc_reports"
 TABLE_DELIVERY_PROFILES = "delivery_profiles"
@@ -54,7 +55,11 @@ CREATE TABLE IF NOT EXISTS videos (
     updated_at TEXT NOT NULL,
     subtitle_count INTEGER NOT NULL DEFAULT 0,
     data_count INTEGER NOT NULL DEFAULT 0,
-    subtitle_streams TEXT NOT NULL DEFAULT '[]'
+    subtitle_streams TEXT NOT NULL DEFAULT '[]',
+    file_mtime_ns INTEGER,
+    file_inode INTEGER,
+    sampled_sha256 TEXT,
+    content_sha256 TEXT
 );
 """
 
@@ -109,6 +114,11 @@ AUDIT_LOG_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_audit_log_entity ON audit_log(entity_id, timestamp);
 """
 
+# Serves retention's time-sliced deletes (AuditLogger.purge_before).
+AUDIT_LOG_TIMESTAMP_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_audit_log_timestamp ON audit_log(timestamp);
+"""
+
 PROJECTS_TABLE = """
 CREATE TABLE IF NOT EXISTS projects (
     id TEXT PRIMARY KEY,
@@ -179,6 +189,11 @@ CREATE INDEX IF NOT EXISTS idx_project_versions_project
     ON project_versions(project_id, version_number);
 """
 
+PROJECT_VERSIONS_CHECKSUM_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_project_versions_checksum
+    ON project_versions(project_id, checksum);
+"""
+
 BATCH_JOBS_TABLE = """
 CREATE TABLE IF NOT EXISTS batch_jobs (
     id INTEGER PRIMARY KEY,
@@ -351,6 +366,31 @@ ENCODER_CACHE_CODEC_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_encoder_cache_codec ON encoder_cache(codec);
 """
 
+RENDER_TELEMETRY_TABLE = """
+CREATE TABLE IF NOT EXISTS render_telemetry (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    encoder TEXT NOT NULL,
+    preset TEXT NOT NULL,
+    quality TEXT NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    fps REAL NOT NULL,
+    filter_cost INTEGER NOT NULL,
+    duration_s REAL NOT NULL,
+    elapsed_s REAL NOT NULL,
+    speed_ratio REAL NOT NULL,
+    output_bytes INTEGER NOT NULL,
+    bitrate_bps REAL NOT NULL,
+    created_at TEXT NOT NULL
+);
+"""
+
+RENDER_TELEMETRY_ENCODER_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_render_telemetry_encoder
+ON render_telemetry(encoder, quality);
+"""
+
 QC_REPORTS_TABLE = """
 CREATE TABLE IF NOT EXISTS qc_reports (
     id TEXT PRIMARY KEY,
@@ -441,6 +481,15 @@ VIDEOS_AUXILIARY_COLUMNS = [
     ("subtitle_streams", "TEXT NOT NULL DEFAULT '[]'"),
 ]
 
+# Columns to add to videos table for tiered source fingerprints: stat
+# identity plus sampled and (on-demand) full SHA-256 (file_size is reused).
+VIDEOS_FINGERPRINT_COLUMNS = [
+    ("file_mtime_ns", "INTEGER"),
+    ("file_inode", "INTEGER"),
+    ("sampled_sha256", "TEXT"),
+    ("content_sha256", "TEXT"),
+]
+
 
 # Columns to add to render_jobs table for partial-file fingerprint.
 # Each entry is (column_name, column_type).
@@ -481,6 +530,14 @@ TRACKS_AUDIO_COLUMNS = [
     ("weight", "REAL DEFAULT 1.0"),
 ]
 
+# Columns to add to project_versions for keyframe/delta storage. Legacy rows
+# keep their full text in timeline_json and read back as encoding 'raw'.
+PROJECT_VERSIONS_STORAGE_COLUMNS = [
+    ("encoding", "TEXT NOT NULL DEFAULT 'raw'"),
+    ("payload", "BLOB"),
+    ("base_version", "INTEGER"),
+]
+
 
 # Columns to add to projects table for audio mix.
 PROJECTS_AUDIO_MIX_COLUMNS = [
@@ -503,6 +560,15 @@ def _alter_videos_add_auxiliary_columns(conn: sqlite3.Connection) -> None:
     _add_columns_idempotent(conn, TABLE_VIDEOS, VIDEOS_AUXILIARY_COLUMNS)
 
 
+def _alter_videos_add_fingerprint_columns(conn: sqlite3.Connection) -> None:
+    """Add source fingerprint columns to videos table idempotently.
+
+    Args:
+        conn: SQLite database connection.
+    """
+    _add_columns_idempotent(conn, TABLE_VIDEOS, VIDEOS_FINGERPRINT_COLUMNS)
+
+
 def _alter_render_jobs_add_partial_columns(conn: sqlite3.Connection) -> None:
     """Add partial_file_detected column to render_jobs table idempotently.
 
@@ -578,6 +644,15 @@ def _alter_tracks_add_audio_columns_sync(conn: sqlite3.Connection) -> None:
     _add_columns_idempotent(conn, TABLE_TRACKS, TRACKS_AUDIO_COLUMNS)
 
 
+def _alter_project_versions_add_storage_columns(conn: sqlite3.Connection) -> None:
+    """Add encoding, payload, base_version columns to project_versions idempotently.
+
+    Args:
+        conn: SQLite database connection.
+    """
+    _add_columns_idempotent(conn, TABLE_PROJECT_VERSIONS, PROJECT_VERSIONS_STORAGE_COLUMNS)
+
+
 def create_tables(conn: sqlite3.Connection) -> None:
     """Create all database tables and indexes.
 
@@ -598,6 +673,7 @@ def create_tables(conn: sqlite3.Connection) -> None:
     cursor.execute(VIDEOS_FTS_UPDATE_TRIGGER)
     cursor.execute(AUDIT_LOG_TABLE)
     cursor.execute(AUDIT_LOG_INDEX)
+    cursor.execute(AUDIT_LOG_TIMESTAMP_INDEX)
     cursor.execute(PROJECTS_TABLE)
     cursor.execute(CLIPS_TABLE)
     cursor.execute(CLIPS_PROJECT_INDEX)
@@ -606,6 +682,7 @@ def create_tables(conn: sqlite3.Connection) -> None:
     cursor.execute(TRACKS_PROJECT_INDEX)
     cursor.execute(PROJECT_VERSIONS_TABLE)
     cursor.execute(PROJECT_VERSIONS_PROJECT_INDEX)
+    cursor.execute(PROJECT_VERSIONS_CHECKSUM_INDEX)
     cursor.execute(BATCH_JOBS_TABLE)
     cursor.execute(BATCH_JOBS_BATCH_ID_INDEX)
     cursor.execute(PROXY_FILES_TABLE)
@@ -624,6 +701,8 @@ def create_tables(conn: sqlite3.Connection) -> None:
     cursor.execute(RENDER_CHECKPOINTS_JOB_INDEX)
     cursor.execute(ENCODER_CACHE_TABLE)
     cursor.execute(ENCODER_CACHE_CODEC_INDEX)
+    cursor.execute(RENDER_TELEMETRY_TABLE)
+    cursor.execute(RENDER_TELEMETRY_ENCODER_INDEX)
     cursor.execute(PROJECT_MARKERS_TABLE)
     cursor.execute(PROJECT_MARKERS_PROJECT_INDEX)
     cursor.execute(QC_REPORTS_TABLE)
@@ -635,6 +714,7 @@ def create_tables(conn: sqlite3.Connection) -> None:
     cursor.execute(TTS_CUE_TABLE)
     cursor.execute(TTS_CUE_PROJECT_INDEX)
     _alter_videos_add_auxiliary_columns(conn)
+    _alter_videos_add_fingerprint_columns(conn)
     _alter_clips_add_timeline_columns(conn)
     _alter_clips_add_generator_columns(conn)
     _alter_clips_add_image_columns(conn)
@@ -643,6 +723,7 @@ def create_tables(conn: sqlite3.Connection) -> None:
     _alter_render_jobs_add_partial_columns(conn)
     _alter_render_jobs_add_evidence_columns(conn)
     _alter_tracks_add_audio_columns_sync(conn)
+    _alter_project_versions_add_storage_columns(conn)
     conn.commit()
 
 
@@ -655,6 +736,15 @@ async def _alter_videos_add_auxiliary_columns_async(db: aiosqlite.Connection) ->
     await _add_columns_idempotent_async(db, TABLE_VIDEOS, VIDEOS_AUXILIARY_COLUMNS)
 
 
+async def _alter_videos_add_fingerprint_columns_async(db: aiosqlite.Connection) -> None:
+    """Add source fingerprint columns to videos table idempotently (async).
+
+    Args:
+        db: aiosqlite database connection.
+    """
+    await _add_columns_idempotent_async(db, TABLE_VIDEOS, VIDEOS_FINGERPRINT_COLUMNS)
+
+
 async def _alter_projects_add_audio_mix_column_async(
     db: aiosqlite.Connection,
 ) -> None:
@@ -738,6 +828,17 @@ async def _alter_tracks_add_audio_columns_async(db: aiosqlite.Connection) -> Non
     await _add_columns_idempotent_async(db, TABLE_TRACKS, TRACKS_AUDIO_COLUMNS)
 
 
+async def _alter_project_versions_add_storage_columns_async(db: aiosqlite.Connection) -> None:
+    """Add encoding, payload, base_version columns to project_versions idempotently (async).
+
+    Args:
+        db: aiosqlite database connection.
+    """
+    await _add_columns_idempotent_async(
+        db, TABLE_PROJECT_VERSIONS, PROJECT_VERSIONS_STORAGE_COLUMNS
+    )
+
+
 async def create_tables_async(db: aiosqlite.Connection) -> None:
     """Create all database tables and indexes asynchronously.
 
@@ -756,6 +857,7 @@ async def create_tables_async(db: aiosqlite.Connection) -> None:
     await db.execute(VIDEOS_FTS_UPDATE_TRIGGER)
     await db.execute(AUDIT_LOG_TABLE)
     await db.execute(AUDIT_LOG_INDEX)
+    await db.execute(AUDIT_LOG_TIMESTAMP_INDEX)
     await db.execute(PROJECTS_TABLE)
     await db.execute(CLIPS_TABLE)
     await db.execute(CLIPS_PROJECT_INDEX)
@@ -764,6 +866,7 @@ async def create_tables_async(db: aiosqlite.Connection) -> None:
     await db.execute(TRACKS_PROJECT_INDEX)
     await db.execute(PROJECT_VERSIONS_TABLE)
     await db.execute(PROJECT_VERSIONS_PROJECT_INDEX)
+    await db.execute(PROJECT_VERSIONS_CHECKSUM_INDEX)
     await db.execute(BATCH_JOBS_TABLE)
     await db.execute(BATCH_JOBS_BATCH_ID_INDEX)
     await db.execute(PROXY_FILES_TABLE)
@@ -782,6 +885,8 @@ async def create_tables_async(db: aiosqlite.Connection) -> None:
     await db.execute(RENDER_CHECKPOINTS_JOB_INDEX)
     await db.execute(ENCODER_CACHE_TABLE)
     await db.execute(ENCODER_CACHE_CODEC_INDEX)
+    await db.execute(RENDER_TELEMETRY_TABLE)
+    await db.execute(RENDER_TELEMETRY_ENCODER_INDEX)
     await db.execute(PROJECT_MARKERS_TABLE)
     await db.execute(PROJECT_MARKERS_PROJECT_INDEX)
     await db.execute(QC_REPORTS_TABLE)
@@ -793,6 +898,7 @@ async def create_tables_async(db: aiosqlite.Connection) -> None:
     await db.execute(TTS_CUE_TABLE)
     await db.execute(TTS_CUE_PROJECT_INDEX)
     await _alter_videos_add_auxiliary_columns_async(db)
+    await _alter_videos_add_fingerprint_columns_async(db)
     await _alter_clips_add_timeline_columns_async(db)
     await _alter_clips_add_generator_columns_async(db)
     await _alter_clips_add_image_columns_async(db)
@@ -801,4 +907,5 @@ async def create_tables_async(db: aiosqlite.Connection) -> None:
     await _alter_render_jobs_add_partial_columns_async(db)
     await _alter_render_jobs_add_evidence_columns_async(db)
     await _alter_tracks_add_audio_columns_async(db)
+    await _alter_project_versions_add_storage_columns_async(db)
     await db.commit()
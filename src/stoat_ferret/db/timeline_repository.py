@@ -12,6 +12,30 @@ import aiosqlite
 
 from stoat_ferret.db.models import Clip, Track
 
+_INSERT_TRACK = """
+    INSERT INTO tracks (
+        id, project_id, track_type, label, z_index, muted, locked,
+        kind, volume_envelope, weight
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _track_params(track: Track) -> tuple[Any, ...]:
+    """Bind parameters for `_INSERT_TRACK`."""
+    return (
+        track.id,
+        track.project_id,
+        track.track_type,
+        track.label,
+        track.z_index,
+        int(track.muted),
+        int(track.locked),
+        track.kind,
+        track.volume_envelope,
+        track.weight,
+    )
+
 
 class AsyncTimelineRepository(Protocol):
     """Protocol for async timeline repository operations.
@@ -35,6 +59,37 @@ class AsyncTimelineRepository(Protocol):
         """
         ...
 
+    async def create_tracks(self, tracks: list[Track]) -> list[Track]:
+        """Create several tracks in one transaction.
+
+        Args:
+            tracks: The tracks to create.
+
+        Returns:
+            The created tracks.
+
+        Raises:
+            ValueError: If any track ID already exists or a foreign key
+                constraint fails; no track is created in that case.
+        """
+        ...
+
+    async def replace_tracks(self, project_id: str, tracks: list[Track]) -> list[Track]:
+        """Atomically replace all tracks of a project.
+
+        Args:
+            project_id: The project whose tracks are replaced.
+            tracks: The new tracks.
+
+        Returns:
+            The created tracks.
+
+        Raises:
+            ValueError: If a new track conflicts or violates a foreign key;
+                the existing tracks are kept in that case.
+        """
+        ...
+
     async def get_track(self, track_id: str) -> Track | None:
         """Get a track by its ID.
 
@@ -131,32 +186,33 @@ class AsyncSQLiteTimelineRepository:
     async def create_track(self, track: Track) -> Track:
         """Create a track in the repository."""
         try:
-            await self._conn.execute(
-                """
-                INSERT INTO tracks (
-                    id, project_id, track_type, label, z_index, muted, locked,
-                    kind, volume_envelope, weight
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    track.id,
-                    track.project_id,
-                    track.track_type,
-                    track.label,
-                    track.z_index,
-                    int(track.muted),
-                    int(track.locked),
-                    track.kind,
-                    track.volume_envelope,
-                    track.weight,
-                ),
-            )
+            await self._conn.execute(_INSERT_TRACK, _track_params(track))
             await self._conn.commit()
         except aiosqlite.IntegrityError as e:
             raise ValueError(f"Track already exists or foreign key violation: {e}") from e
         return track
 
+    async def create_tracks(self, tracks: list[Track]) -> list[Track]:
+        """Create several tracks in one transaction."""
+        try:
+            await self._conn.executemany(_INSERT_TRACK, [_track_params(t) for t in tracks])
+            await self._conn.commit()
+        except aiosqlite.IntegrityError as e:
+            await self._conn.rollback()
+            raise ValueError(f"Track already exists or foreign key violation: {e}") from e
+        return tracks
+
+    async def replace_tracks(self, project_id: str, tracks: list[Track]) -> list[Track]:
+        """Atomically replace all tracks of a project."""
+        try:
+            await self._conn.execute("DELETE FROM tracks WHERE project_id = ?", (project_id,))
+            await self._conn.executemany(_INSERT_TRACK, [_track_params(t) for t in tracks])
+            await self._conn.commit()
+        except aiosqlite.IntegrityError as e:
+            await self._conn.rollback()
+            raise ValueError(f"Track already exists or foreign key violation: {e}") from e
+        return tracks
+
     async def get_track(self, track_id: str) -> Track | None:
         """Get a track by its ID."""
         cursor = await self._conn.execute("SELECT * FROM tracks WHERE id = ?", (track_id,))
@@ -298,6 +354,25 @@ class AsyncInMemoryTimelineRepository:
         self._tracks[track.id] = copy.deepcopy(track)
         return copy.deepcopy(track)
 
+    async def create_tracks(self, tracks: list[Track]) -> list[Track]:
+        """Create several tracks in one transaction."""
+        ids = [t.id for t in tracks]
+        if len(set(ids)) != len(ids) or any(i in self._tracks for i in ids):
+            raise ValueError("Track already exists")
+        for track in tracks:
+            self._tracks[track.id] = copy.deepcopy(track)
+        return copy.deepcopy(tracks)
+
+    async def replace_tracks(self, project_id: str, tracks: list[Track]) -> list[Track]:
+        """Atomically replace all tracks of a project."""
+        remaining = {k: t for k, t in self._tracks.items() if t.project_id != project_id}
+        ids = [t.id for t in tracks]
+        if len(set(ids)) != len(ids) or any(i in remaining for i in ids):
+            raise ValueError("Track already exists")
+        remaining.update((t.id, copy.deepcopy(t)) for t in tracks)
+        self._tracks = remaining
+        return copy.deepcopy(tracks)
+
     async def get_track(self, track_id: str) -> Track | None:
         """Get a track by its ID."""
         track = self._tracks.get(track_id)
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import copy
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Protocol
 
@@ -47,6 +48,10 @@ class AsyncTtsCueRepository(Protocol):
         """Update the synthesis status of a TTS cue."""
         ...
 
+    async def reset_evicted(self, cache_keys: Sequence[str]) -> int:
+        """Return ready cues whose cached audio was evicted to pending."""
+        ...
+
 
 class AsyncSQLiteTtsCueRepository:
     """Async SQLite implementation of AsyncTtsCueRepository."""
@@ -166,6 +171,32 @@ class AsyncSQLiteTtsCueRepository:
             return None
         return await self.get(cue_id)
 
+    async def reset_evicted(self, cache_keys: Sequence[str]) -> int:
+        """Return ready cues whose cached audio was evicted to pending.
+
+        Args:
+            cache_keys: Cache keys whose audio files were removed.
+
+        Returns:
+            Number of cues reset.
+        """
+        from datetime import timezone
+
+        if not cache_keys:
+            return 0
+        now = datetime.now(timezone.utc).isoformat()
+        placeholders = ", ".join("?" for _ in cache_keys)
+        cursor = await self._conn.execute(
+            f"""
+            UPDATE tts_cue
+            SET status = 'pending', generated_asset_id = NULL, error = NULL, updated_at = ?
+            WHERE status = 'ready' AND cache_key IN ({placeholders})
+            """,
+            (now, *cache_keys),
+        )
+        await self._conn.commit()
+        return cursor.rowcount
+
 
 class AsyncInMemoryTtsCueRepository:
     """In-memory implementation for testing."""
@@ -229,6 +260,21 @@ class AsyncInMemoryTtsCueRepository:
         self._cues[cue_id] = updated
         return copy.deepcopy(updated)
 
+    async def reset_evicted(self, cache_keys: Sequence[str]) -> int:
+        """Return ready cues whose cached audio was evicted to pending."""
+        from datetime import timezone
+
+        keys = set(cache_keys)
+        reset = 0
+        for cue in self._cues.values():
+            if cue.status == "ready" and cue.cache_key in keys:
+                cue.status = "pending"
+                cue.generated_asset_id = None
+                cue.error = None
+                cue.updated_at = datetime.now(timezone.utc)
+                reset += 1
+        return reset
+
 
 def _row_to_cue(row: aiosqlite.Row) -> TtsCue:
     """Convert a database row to a TtsCue object."""
@@ -0,0 +1,358 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Structural diff and three-way merge of stored timeline snapshots.
+
+Snapshots are compared as trees rather than text. Lists whose items are all
+dicts with a unique string ``id`` (tracks, clips, and effects when they carry
+ids) are matched by id, so inserting a clip yields one ``add`` instead of a
+cascade of positional edits. Other lists and scalars are compared as values.
+
+Every dict and id-keyed list node is fingerprinted with `compute_checksum`
+when a snapshot is first indexed, and indexed snapshots are cached by their
+version checksum. Diffing two indexed snapshots descends only into subtrees
+whose fingerprints differ, so the work is proportional to the size of the
+change rather than the size of the timeline.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from stoat_ferret.db.json_patch import escape_token
+from stoat_ferret.db.version_repository import compute_checksum
+
+ChangeOp = Literal["add", "remove", "replace"]
+MergeStrategy = Literal["fail", "ours", "theirs"]
+
+# Number of indexed snapshots kept in memory, keyed by version checksum.
+_INDEX_CACHE_SIZE = 64
+
+
+class _Missing:
+    """Sentinel for an absent value (distinct from JSON null)."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING: Any = _Missing()
+
+
+@dataclass(frozen=True)
+class TimelineChange:
+    """One structural change between two snapshots.
+
+    Attributes:
+        op: ``add``, ``remove`` or ``replace``.
+        path: Segments from the document root; id-keyed list items are
+            addressed by their ``id``.
+        before: Value in the source snapshot (MISSING for ``add``).
+        after: Value in the target snapshot (MISSING for ``remove``).
+        index: Position of an added item in its id-keyed list, else None.
+    """
+
+    op: ChangeOp
+    path: tuple[str, ...]
+    before: Any = MISSING
+    after: Any = MISSING
+    index: int | None = None
+
+    @property
+    def pointer(self) -> str:
+        """The path as a JSON Pointer string."""
+        return "".join(f"/{escape_token(segment)}" for segment in self.path)
+
+
+@dataclass(frozen=True)
+class MergeConflict:
+    """Changes from both sides that touch the same or nested paths.
+
+    Attributes:
+        path: The shorter of the two conflicting paths.
+        ours: The change from the "ours" side.
+        theirs: The change from the "theirs" side.
+    """
+
+    path: tuple[str, ...]
+    ours: TimelineChange
+    theirs: TimelineChange
+
+
+@dataclass
+class MergeResult:
+    """Outcome of a three-way merge.
+
+    Attributes:
+        document: The merged snapshot (None when conflicts blocked the merge).
+        applied: Changes applied on top of the base snapshot.
+        conflicts: Conflicts found; resolved by strategy unless it is ``fail``.
+    """
+
+    document: Any
+    applied: list[TimelineChange] = field(default_factory=list)
+    conflicts: list[MergeConflict] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class _Node:
+    """Fingerprinted snapshot node; leaves are stored as plain values."""
+
+    value: Any
+    digest: str
+    keyed: bool
+    children: dict[str, Any]
+
+
+def _keyed_ids(items: list[Any]) -> list[str] | None:
+    """Return item ids if `items` is an id-keyed list, else None."""
+    ids = []
+    for item in items:
+        if not isinstance(item, dict) or not isinstance(item.get("id"), str):
+            return None
+        ids.append(item["id"])
+    return ids if len(set(ids)) == len(ids) else None
+
+
+def _build(value: Any) -> Any:
+    """Build the fingerprinted tree for a parsed JSON value."""
+    if isinstance(value, dict):
+        children = {key: _build(child) for key, child in value.items()}
+    elif isinstance(value, list) and value and (ids := _keyed_ids(value)) is not None:
+        children = {item_id: _build(item) for item_id, item in zip(ids, value, strict=True)}
+    else:
+        return value
+    digest = compute_checksum(json.dumps(value, sort_keys=True, separators=(",", ":")))
+    return _Node(value=value, digest=digest, keyed=isinstance(value, list), children=children)
+
+
+_index_cache: OrderedDict[str, Any] = OrderedDict()
+
+
+def index_snapshot(timeline_json: str, checksum: str | None = None) -> Any:
+    """Parse and fingerprint a snapshot, reusing a cached index when possible.
+
+    Args:
+        timeline_json: Serialized timeline snapshot.
+        checksum: The snapshot's stored checksum, used as the cache key.
+            Computed when omitted.
+
+    Returns:
+        The snapshot's fingerprinted tree.
+
+    Raises:
+        ValueError: If `timeline_json` is not valid JSON.
+    """
+    key = checksum or compute_checksum(timeline_json)
+    cached = _index_cache.get(key)
+    if cached is not None:
+        _index_cache.move_to_end(key)
+        return cached
+    tree = _build(json.loads(timeline_json))
+    _index_cache[key] = tree
+    if len(_index_cache) > _INDEX_CACHE_SIZE:
+        _index_cache.popitem(last=False)
+    return tree
+
+
+def _plain(node: Any) -> Any:
+    return node.value if isinstance(node, _Node) else node
+
+
+def _same_leaf(a: Any, b: Any) -> bool:
+    return type(a) is type(b) and a == b
+
+
+def _diff_nodes(a: Any, b: Any, path: tuple[str, ...], out: list[TimelineChange]) -> None:
+    if isinstance(a, _Node) and isinstance(b, _Node) and a.keyed == b.keyed:
+        if a.digest == b.digest:
+            return
+        for key, child in a.children.items():
+            if key not in b.children:
+                out.append(TimelineChange("remove", (*path, key), before=_plain(child)))
+        for position, (key, child) in enumerate(b.children.items()):
+            if key in a.children:
+                _diff_nodes(a.children[key], child, (*path, key), out)
+            else:
+                out.append(
+                    TimelineChange(
+                        "add",
+                        (*path, key),
+                        after=_plain(child),
+                        index=position if b.keyed else None,
+                    )
+                )
+        return
+    # An empty list on one side of an id-keyed list is treated as keyed too,
+    # so the first clip on a track is an "add" rather than a list replace.
+    if isinstance(a, _Node) and a.keyed and b == []:
+        for key, child in a.children.items():
+            out.append(TimelineChange("remove", (*path, key), before=_plain(child)))
+        return
+    if a == [] and isinstance(b, _Node) and b.keyed:
+        for position, (key, child) in enumerate(b.children.items()):
+            out.append(TimelineChange("add", (*path, key), after=_plain(child), index=position))
+        return
+    plain_a, plain_b = _plain(a), _plain(b)
+    if isinstance(a, _Node) or isinstance(b, _Node) or not _same_leaf(plain_a, plain_b):
+        out.append(TimelineChange("replace", path, before=plain_a, after=plain_b))
+
+
+def diff_snapshots(a: Any, b: Any) -> list[TimelineChange]:
+    """Compute the structural changes that turn snapshot `a` into `b`.
+
+    Args:
+        a: Source snapshot tree from `index_snapshot`.
+        b: Target snapshot tree from `index_snapshot`.
+
+    Returns:
+        Changes in document order; empty when the snapshots are equivalent.
+    """
+    out: list[TimelineChange] = []
+    _diff_nodes(a, b, (), out)
+    return out
+
+
+def _is_prefix(short: tuple[str, ...], long: tuple[str, ...]) -> bool:
+    return len(short) <= len(long) and long[: len(short)] == short
+
+
+def _find_conflicts(
+    ours: list[TimelineChange], theirs: list[TimelineChange]
+) -> tuple[list[MergeConflict], set[int], set[int]]:
+    """Pair up overlapping changes.
+
+    Returns:
+        The conflicts, the indexes of conflicting "ours" changes, and the
+        indexes of conflicting "theirs" changes. Identical changes made on
+        both sides are not conflicts; the "theirs" copy is marked as a
+        duplicate by including its index with no conflict entry.
+    """
+    by_prefix: dict[tuple[str, ...], list[int]] = {}
+    for i, change in enumerate(ours):
+        for depth in range(len(change.path) + 1):
+            by_prefix.setdefault(change.path[:depth], []).append(i)
+    ours_by_path = {change.path: i for i, change in enumerate(ours)}
+
+    conflicts: list[MergeConflict] = []
+    ours_hit: set[int] = set()
+    theirs_hit: set[int] = set()
+    for j, change in enumerate(theirs):
+        candidates = set(by_prefix.get(change.path, []))
+        for depth in range(len(change.path)):
+            ancestor = ours_by_path.get(change.path[:depth])
+            if ancestor is not None:
+                candidates.add(ancestor)
+        for i in sorted(candidates):
+            mine = ours[i]
+            if (
+                mine.path == change.path
+                and mine.op == change.op
+                and json.dumps(mine.after, sort_keys=True, default=repr)
+                == json.dumps(change.after, sort_keys=True, default=repr)
+            ):
+                theirs_hit.add(j)
+                continue
+            shorter = mine.path if _is_prefix(mine.path, change.path) else change.path
+            conflicts.append(MergeConflict(path=shorter, ours=mine, theirs=change))
+            ours_hit.add(i)
+            theirs_hit.add(j)
+    return conflicts, ours_hit, theirs_hit
+
+
+def _locate(container: Any, segment: str) -> Any:
+    if isinstance(container, list):
+        for item in container:
+            if isinstance(item, dict) and item.get("id") == segment:
+                return item
+        raise KeyError(segment)
+    return container[segment]
+
+
+def apply_changes(document: Any, changes: list[TimelineChange]) -> Any:
+    """Apply structural changes to a parsed snapshot in place.
+
+    Args:
+        document: Parsed snapshot to modify.
+        changes: Changes from `diff_snapshots`, in order.
+
+    Returns:
+        The modified document (a new object if the root was replaced).
+
+    Raises:
+        ValueError: If a change's path does not resolve in `document`.
+    """
+    for change in changes:
+        if not change.path:
+            document = copy.deepcopy(change.after)
+            continue
+        try:
+            parent = document
+            for segment in change.path[:-1]:
+                parent = _locate(parent, segment)
+            key = change.path[-1]
+            if isinstance(parent, list):
+                positions = {
+                    item.get("id"): n for n, item in enumerate(parent) if isinstance(item, dict)
+                }
+                if change.op == "add":
+                    index = len(parent) if change.index is None else change.index
+                    parent.insert(min(index, len(parent)), copy.deepcopy(change.after))
+                elif change.op == "remove":
+                    del parent[positions[key]]
+                else:
+                    parent[positions[key]] = copy.deepcopy(change.after)
+            elif change.op == "remove":
+                del parent[key]
+            else:
+                parent[key] = copy.deepcopy(change.after)
+        except (KeyError, IndexError, TypeError) as exc:
+            raise ValueError(f"Cannot apply {change.op} at {change.pointer}") from exc
+    return document
+
+
+def merge_snapshots(
+    base: Any, ours: Any, theirs: Any, strategy: MergeStrategy = "fail"
+) -> MergeResult:
+    """Three-way merge two snapshots that diverged from a common base.
+
+    Non-overlapping changes from both sides are combined. Two changes
+    conflict when they touch the same path with different results, or when
+    one touches a path nested inside the other (e.g. one side edits a clip
+    the other removed).
+
+    Args:
+        base: Common ancestor snapshot tree.
+        ours: First descendant snapshot tree.
+        theirs: Second descendant snapshot tree.
+        strategy: ``fail`` leaves conflicts unresolved and returns no
+            document; ``ours``/``theirs`` keeps that side's change.
+
+    Returns:
+        The merge result.
+    """
+    ours_changes = diff_snapshots(base, ours)
+    theirs_changes = diff_snapshots(base, theirs)
+    conflicts, ours_hit, theirs_hit = _find_conflicts(ours_changes, theirs_changes)
+    if conflicts and strategy == "fail":
+        return MergeResult(document=None, conflicts=conflicts)
+
+    if strategy == "theirs":
+        kept_ours = [c for i, c in enumerate(ours_changes) if i not in ours_hit]
+        conflicting_theirs = {id(c.theirs) for c in conflicts}
+        kept_theirs = [
+            c
+            for j, c in enumerate(theirs_changes)
+            if j not in theirs_hit or id(c) in conflicting_theirs
+        ]
+    else:
+        kept_ours = ours_changes
+        kept_theirs = [c for j, c in enumerate(theirs_changes) if j not in theirs_hit]
+
+    applied = kept_ours + kept_theirs
+    document = apply_changes(copy.deepcopy(_plain(base)), applied)
+    return MergeResult(document=document, applied=applied, conflicts=conflicts)
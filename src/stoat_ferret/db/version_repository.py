@@ -1,18 +1,44 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # Copyright (C) 2026 Grant Wickman
 
-"""Version repository implementations for project timeline versioning."""
+"""Version repository implementations for project timeline versioning.
+
+The SQLite repository stores versions as content-addressed keyframes and
+deltas rather than one full JSON blob per version:
+
+- ``keyframe``: the zlib-compressed timeline JSON.
+- ``delta``: a zlib-compressed JSON Patch against the keyframe named by
+  ``base_version``; at most one patch is applied on read.
+- ``raw``: legacy rows written before keyframe storage, read from
+  ``timeline_json`` unchanged.
+
+A new keyframe is written every ``keyframe_interval`` versions, or whenever
+a delta would not round-trip byte-for-byte or would not be smaller than the
+keyframe. Saving content whose checksum already exists in the project reuses
+that version's storage (an empty or identical delta).
+"""
 
 from __future__ import annotations
 
 import copy
 import hashlib
+import json
+import zlib
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Protocol
 
 import aiosqlite
 
+from stoat_ferret.db.json_patch import JsonPatchError, apply_patch, diff
+
+# Storage encodings for project_versions rows.
+ENCODING_RAW = "raw"
+ENCODING_KEYFRAME = "keyframe"
+ENCODING_DELTA = "delta"
+
+DEFAULT_KEYFRAME_INTERVAL = 20
+
 
 @dataclass
 class VersionRecord:
@@ -35,6 +61,23 @@ class VersionRecord:
     created_at: datetime
 
 
+@dataclass
+class VersionSummary:
+    """Metadata for a saved version, without the timeline payload.
+
+    Attributes:
+        project_id: The project this version belongs to.
+        version_number: Version number within the project.
+        checksum: SHA-256 hex digest of the version's timeline JSON.
+        created_at: When this version was created.
+    """
+
+    project_id: str
+    version_number: int
+    checksum: str
+    created_at: datetime
+
+
 def compute_checksum(timeline_json: str) -> str:
     """Compute SHA-256 checksum for timeline JSON data.
 
@@ -79,6 +122,32 @@ class AsyncVersionRepository(Protocol):
         """
         ...
 
+    async def list_version_summaries(
+        self, project_id: str, limit: int | None = None, offset: int = 0
+    ) -> list[VersionSummary]:
+        """List version metadata for a project without loading timeline data.
+
+        Args:
+            project_id: The project to list versions for.
+            limit: Maximum number of summaries to return (None for all).
+            offset: Number of most-recent versions to skip.
+
+        Returns:
+            Version summaries, most recent first.
+        """
+        ...
+
+    async def count_versions(self, project_id: str) -> int:
+        """Count stored versions for a project.
+
+        Args:
+            project_id: The project to count versions for.
+
+        Returns:
+            Number of versions.
+        """
+        ...
+
     async def get_version(self, project_id: str, version_number: int) -> VersionRecord | None:
         """Get a specific version by project and version number.
 
@@ -125,31 +194,61 @@ class AsyncVersionRepository(Protocol):
         ...
 
 
+@dataclass
+class _StoredVersion:
+    """Encoded form of a version as written to project_versions."""
+
+    encoding: str
+    payload: bytes | None
+    base_version: int | None
+
+
 class AsyncSQLiteVersionRepository:
-    """Async SQLite implementation of the VersionRepository protocol."""
+    """Async SQLite implementation of the VersionRepository protocol.
 
-    def __init__(self, conn: aiosqlite.Connection) -> None:
+    Versions are stored as keyframes and deltas (see module docstring);
+    callers always see the reconstructed ``timeline_json``.
+    """
+
+    def __init__(
+        self,
+        conn: aiosqlite.Connection,
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+    ) -> None:
         """Initialize the repository with an async database connection.
 
         Args:
             conn: Async SQLite database connection.
+            keyframe_interval: Write a full keyframe every N versions; versions
+                in between are stored as deltas. 1 disables deltas.
         """
         self._conn = conn
         self._conn.row_factory = aiosqlite.Row
+        self._keyframe_interval = max(1, keyframe_interval)
 
     async def save(self, project_id: str, timeline_json: str) -> VersionRecord:
         """Save a new version of a project timeline."""
         checksum = compute_checksum(timeline_json)
         next_version = await self._next_version_number(project_id)
         now = datetime.now(timezone.utc)
+        stored = await self._encode(project_id, next_version, timeline_json, checksum)
 
         cursor = await self._conn.execute(
             """
             INSERT INTO project_versions
-                (project_id, version_number, timeline_json, checksum, created_at)
-            VALUES (?, ?, ?, ?, ?)
+                (project_id, version_number, timeline_json, checksum, created_at,
+                 encoding, payload, base_version)
+            VALUES (?, ?, '', ?, ?, ?, ?, ?)
             """,
-            (project_id, next_version, timeline_json, checksum, now.isoformat()),
+            (
+                project_id,
+                next_version,
+                checksum,
+                now.isoformat(),
+                stored.encoding,
+                stored.payload,
+                stored.base_version,
+            ),
         )
         await self._conn.commit()
 
@@ -172,20 +271,64 @@ class AsyncSQLiteVersionRepository:
             """,
             (project_id,),
         )
-        rows = await cursor.fetchall()
-        return [self._row_to_record(row) for row in rows]
-
-    async def get_version(self, project_id: str, version_number: int) -> VersionRecord | None:
-        """Get a specific version by project and version number."""
+        rows = list(await cursor.fetchall())
+        # Deltas reference keyframes within the same project, so every base a
+        # delta needs is already among these rows.
+        keyframes = {
+            row["version_number"]: self._decode_keyframe(row)
+            for row in rows
+            if row["encoding"] != ENCODING_DELTA
+        }
+        records = []
+        for row in rows:
+            if row["encoding"] == ENCODING_DELTA:
+                text = self._apply_delta(row, keyframes.get(row["base_version"]))
+            else:
+                text = keyframes[row["version_number"]]
+            records.append(self._row_to_record(row, text))
+        return records
+
+    async def list_version_summaries(
+        self, project_id: str, limit: int | None = None, offset: int = 0
+    ) -> list[VersionSummary]:
+        """List version metadata, most recent first, without reading payloads."""
         cursor = await self._conn.execute(
             """
-            SELECT * FROM project_versions
-            WHERE project_id = ? AND version_number = ?
+            SELECT project_id, version_number, checksum, created_at
+            FROM project_versions
+            WHERE project_id = ?
+            ORDER BY version_number DESC
+            LIMIT ? OFFSET ?
             """,
-            (project_id, version_number),
+            (project_id, -1 if limit is None else limit, offset),
+        )
+        rows = await cursor.fetchall()
+        return [
+            VersionSummary(
+                project_id=row["project_id"],
+                version_number=row["version_number"],
+                checksum=row["checksum"],
+                created_at=datetime.fromisoformat(row["created_at"]),
+            )
+            for row in rows
+        ]
+
+    async def count_versions(self, project_id: str) -> int:
+        """Count stored versions for a project."""
+        cursor = await self._conn.execute(
+            "SELECT COUNT(*) FROM project_versions WHERE project_id = ?",
+            (project_id,),
         )
         row = await cursor.fetchone()
-        return self._row_to_record(row) if row else None
+        assert row is not None  # COUNT always returns a row
+        return int(row[0])
+
+    async def get_version(self, project_id: str, version_number: int) -> VersionRecord | None:
+        """Get a specific version by project and version number."""
+        row = await self._fetch_row(project_id, version_number)
+        if row is None:
+            return None
+        return self._row_to_record(row, await self._reconstruct(row))
 
     async def restore(self, project_id: str, version_number: int) -> VersionRecord:
         """Restore a previous version as a new version."""
@@ -204,20 +347,68 @@ class AsyncSQLiteVersionRepository:
         return await self.save(project_id, source.timeline_json)
 
     async def delete_old_versions(self, project_id: str, keep_count: int) -> int:
-        """Delete old versions beyond the keep-last-N threshold."""
+        """Delete old versions beyond the keep-last-N threshold.
+
+        Kept deltas whose keyframe falls outside the retained window are
+        re-encoded first: the oldest becomes a keyframe and the rest are
+        re-based onto it.
+        """
         cursor = await self._conn.execute(
             """
-            DELETE FROM project_versions
-            WHERE project_id = ?
-              AND version_number NOT IN (
+            SELECT MIN(version_number) FROM (
                 SELECT version_number FROM project_versions
                 WHERE project_id = ?
                 ORDER BY version_number DESC
                 LIMIT ?
-              )
+            )
             """,
-            (project_id, project_id, keep_count),
+            (project_id, keep_count),
         )
+        row = await cursor.fetchone()
+        cutoff = row[0] if row is not None else None
+
+        if cutoff is not None:
+            cursor = await self._conn.execute(
+                """
+                SELECT * FROM project_versions
+                WHERE project_id = ? AND encoding = ? AND version_number >= ?
+                  AND base_version < ?
+                ORDER BY version_number
+                """,
+                (project_id, ENCODING_DELTA, cutoff, cutoff),
+            )
+            orphans = list(await cursor.fetchall())
+            rebased: list[tuple[int, _StoredVersion]] = []
+            base: tuple[int, str] | None = None
+            for orphan in orphans:
+                text = await self._reconstruct(orphan)
+                if base is None:
+                    stored = self._encode_keyframe(text)
+                    base = (orphan["version_number"], text)
+                else:
+                    stored = self._encode_against(base[0], base[1], text)
+                rebased.append((orphan["version_number"], stored))
+            await self._conn.executemany(
+                """
+                UPDATE project_versions
+                SET encoding = ?, payload = ?, base_version = ?
+                WHERE project_id = ? AND version_number = ?
+                """,
+                [
+                    (stored.encoding, stored.payload, stored.base_version, project_id, number)
+                    for number, stored in rebased
+                ],
+            )
+
+        if cutoff is None:
+            cursor = await self._conn.execute(
+                "DELETE FROM project_versions WHERE project_id = ?", (project_id,)
+            )
+        else:
+            cursor = await self._conn.execute(
+                "DELETE FROM project_versions WHERE project_id = ? AND version_number < ?",
+                (project_id, cutoff),
+            )
         await self._conn.commit()
         return cursor.rowcount
 
@@ -239,11 +430,131 @@ class AsyncSQLiteVersionRepository:
         current_max = row[0]
         return 1 if current_max is None else current_max + 1
 
-    def _row_to_record(self, row: aiosqlite.Row) -> VersionRecord:
+    async def _fetch_row(self, project_id: str, version_number: int) -> aiosqlite.Row | None:
+        cursor = await self._conn.execute(
+            """
+            SELECT * FROM project_versions
+            WHERE project_id = ? AND version_number = ?
+            """,
+            (project_id, version_number),
+        )
+        return await cursor.fetchone()
+
+    async def _encode(
+        self, project_id: str, version_number: int, timeline_json: str, checksum: str
+    ) -> _StoredVersion:
+        """Choose the storage encoding for a new version.
+
+        Args:
+            project_id: The project ID.
+            version_number: Number the new version will get.
+            timeline_json: Serialized timeline data.
+            checksum: SHA-256 of ``timeline_json``.
+
+        Returns:
+            The encoding, payload and base version to store.
+        """
+        # Content addressing: identical content shares an existing version's storage.
+        cursor = await self._conn.execute(
+            """
+            SELECT version_number, encoding, payload, base_version
+            FROM project_versions
+            WHERE project_id = ? AND checksum = ?
+            ORDER BY version_number DESC
+            LIMIT 1
+            """,
+            (project_id, checksum),
+        )
+        same = await cursor.fetchone()
+        if same is not None:
+            if same["encoding"] == ENCODING_DELTA:
+                return _StoredVersion(ENCODING_DELTA, same["payload"], same["base_version"])
+            return _StoredVersion(ENCODING_DELTA, zlib.compress(b"[]"), same["version_number"])
+
+        cursor = await self._conn.execute(
+            """
+            SELECT * FROM project_versions
+            WHERE project_id = ? AND encoding != ?
+            ORDER BY version_number DESC
+            LIMIT 1
+            """,
+            (project_id, ENCODING_DELTA),
+        )
+        keyframe = await cursor.fetchone()
+        if keyframe is None or (
+            version_number - keyframe["version_number"] >= self._keyframe_interval
+        ):
+            return self._encode_keyframe(timeline_json)
+        return self._encode_against(
+            keyframe["version_number"], self._decode_keyframe(keyframe), timeline_json
+        )
+
+    @staticmethod
+    def _encode_keyframe(timeline_json: str) -> _StoredVersion:
+        return _StoredVersion(ENCODING_KEYFRAME, zlib.compress(timeline_json.encode()), None)
+
+    @classmethod
+    def _encode_against(
+        cls, base_version: int, base_json: str, timeline_json: str
+    ) -> _StoredVersion:
+        """Encode ``timeline_json`` as a delta against a keyframe when that pays off.
+
+        Falls back to a keyframe when either side is not JSON, when the patched
+        base does not serialize back to exactly ``timeline_json``, or when the
+        delta is not smaller than the keyframe would be.
+        """
+        keyframe = cls._encode_keyframe(timeline_json)
+        try:
+            patch = diff(json.loads(base_json), json.loads(timeline_json))
+            rebuilt = json.dumps(apply_patch(json.loads(base_json), patch))
+        except ValueError:
+            return keyframe
+        if rebuilt != timeline_json:
+            return keyframe
+        payload = zlib.compress(json.dumps(patch, separators=(",", ":")).encode())
+        assert keyframe.payload is not None
+        if len(payload) >= len(keyframe.payload):
+            return keyframe
+        return _StoredVersion(ENCODING_DELTA, payload, base_version)
+
+    async def _reconstruct(self, row: aiosqlite.Row) -> str:
+        """Rebuild the timeline JSON stored in ``row``."""
+        if row["encoding"] != ENCODING_DELTA:
+            return self._decode_keyframe(row)
+        base = await self._fetch_row(row["project_id"], row["base_version"])
+        return self._apply_delta(row, self._decode_keyframe(base) if base else None)
+
+    @staticmethod
+    def _decode_keyframe(row: aiosqlite.Row) -> str:
+        if row["encoding"] == ENCODING_RAW:
+            return str(row["timeline_json"])
+        try:
+            return zlib.decompress(row["payload"]).decode()
+        except (zlib.error, TypeError, UnicodeDecodeError) as exc:
+            raise ValueError(
+                f"Version {row['version_number']} for project {row['project_id']} "
+                f"has a corrupt payload"
+            ) from exc
+
+    @staticmethod
+    def _apply_delta(row: aiosqlite.Row, base_json: str | None) -> str:
+        label = f"Version {row['version_number']} for project {row['project_id']}"
+        if base_json is None:
+            raise ValueError(f"{label} references missing keyframe {row['base_version']}")
+        try:
+            patch = json.loads(zlib.decompress(row["payload"]))
+            if not patch:
+                return base_json
+            return json.dumps(apply_patch(json.loads(base_json), patch))
+        except (zlib.error, TypeError, JsonPatchError, ValueError) as exc:
+            raise ValueError(f"{label} has a corrupt delta") from exc
+
+    def _row_to_record(self, row: aiosqlite.Row, timeline_json: str) -> VersionRecord:
         """Convert a database row to a VersionRecord.
 
         Args:
             row: Database row.
+            timeline_json: The reconstructed timeline JSON for the row.
 
         Returns:
             VersionRecord instance.
@@ -252,7 +563,7 @@ class AsyncSQLiteVersionRepository:
             id=row["id"],
             project_id=row["project_id"],
             version_number=row["version_number"],
-            timeline_json=row["timeline_json"],
+            timeline_json=timeline_json,
             checksum=row["checksum"],
             created_at=datetime.fromisoformat(row["created_at"]),
         )
@@ -296,6 +607,27 @@ class AsyncInMemoryVersionRepository:
         sorted_versions = sorted(project_versions, key=lambda v: v.version_number, reverse=True)
         return [copy.deepcopy(v) for v in sorted_versions]
 
+    async def list_version_summaries(
+        self, project_id: str, limit: int | None = None, offset: int = 0
+    ) -> list[VersionSummary]:
+        """List version metadata, most recent first."""
+        project_versions = self._versions.get(project_id, [])
+        sorted_versions = sorted(project_versions, key=lambda v: v.version_number, reverse=True)
+        end = None if limit is None else offset + limit
+        return [
+            VersionSummary(
+                project_id=v.project_id,
+                version_number=v.version_number,
+                checksum=v.checksum,
+                created_at=v.created_at,
+            )
+            for v in sorted_versions[offset:end]
+        ]
+
+    async def count_versions(self, project_id: str) -> int:
+        """Count stored versions for a project."""
+        return len(self._versions.get(project_id, []))
+
     async def get_version(self, project_id: str, version_number: int) -> VersionRecord | None:
         """Get a specific version by project and version number."""
         project_versions = self._versions.get(project_id, [])
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Any
 
@@ -26,6 +27,9 @@ _CURVE_NAME_MAP: dict[str, str] = {
     "ease_in_out": "EaseInOut",
 }
 
+# Distinct automation envelopes whose compiled expressions are kept
+_COMPILED_AUTOMATION_CACHE_SIZE = 1024
+
 
 class EffectValidationError:
     """Structured validation error from JSON schema validation.
@@ -43,12 +47,20 @@ class EffectValidationError:
         return f"EffectValidationError(path={self.path!r}, message={self.message!r})"
 
 
+def _compile_validator(definition: EffectDefinition) -> jsonschema.Draft7Validator:
+    """Build the JSON schema validator for an effect's parameters.
+
+    Validators are built once per registration: constructing one resolves
+    the schema's keywords into validation callables, which dominated the
+    cost of validating a single parameter dict.
+    """
+    return jsonschema.Draft7Validator(definition.parameter_schema)
+
+
 def _validate_scalar_parameters(
-    definition: EffectDefinition, scalar_parameters: dict[str, Any]
+    validator: jsonschema.Draft7Validator, scalar_parameters: dict[str, Any]
 ) -> list[EffectValidationError]:
     """Validate non-automation scalar parameters against the effect's JSON schema."""
-    schema = definition.parameter_schema
-    validator = jsonschema.Draft7Validator(schema)
     errors: list[EffectValidationError] = []
     for error in validator.iter_errors(scalar_parameters):
         path = ".".join(str(p) for p in error.absolute_path) if error.absolute_path else ""
@@ -68,11 +80,20 @@ def _build_rust_keyframes(envelope: AutomationEnvelope) -> str:
     Raises:
         ValueError: If the Rust compiler rejects the envelope.
     """
-    rust_keyframes = [
-        Keyframe(t=kf.t, value=kf.value, curve=_CURVE_NAME_MAP[kf.curve])
-        for kf in envelope.keyframes
-    ]
-    automation = Automation(default=envelope.default, keyframes=rust_keyframes)
+    return _compile_keyframes(
+        envelope.default,
+        tuple((kf.t, kf.value, _CURVE_NAME_MAP[kf.curve]) for kf in envelope.keyframes),
+    )
+
+
+@functools.lru_cache(maxsize=_COMPILED_AUTOMATION_CACHE_SIZE)
+def _compile_keyframes(default: float, keyframes: tuple[tuple[float, float, str], ...]) -> str:
+    """Compile keyframes, memoized: previews re-send the same envelopes on every tweak.
+
+    Rejected envelopes raise ValueError, which ``lru_cache`` does not store.
+    """
+    rust_keyframes = [Keyframe(t=t, value=value, curve=curve) for t, value, curve in keyframes]
+    automation = Automation(default=default, keyframes=rust_keyframes)
     return compile_automation(automation)
 
 
@@ -131,15 +152,24 @@ class EffectRegistry:
 
     def __init__(self) -> None:
         self._effects: dict[str, EffectDefinition] = {}
+        self._validators: dict[str, jsonschema.Draft7Validator] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every registration; keys caches of built filters."""
+        return self._version
 
     def register(self, effect_type: str, definition: EffectDefinition) -> None:
-        """Register an effect definition.
+        """Register an effect definition and precompile its parameter validator.
 
         Args:
             effect_type: Unique identifier for the effect (e.g., "text_overlay").
             definition: The effect definition with schema, hints, and preview.
         """
         self._effects[effect_type] = definition
+        self._validators[effect_type] = _compile_validator(definition)
+        self._version += 1
         logger.info("effect_registered", effect_type=effect_type)
 
     def get(self, effect_type: str) -> EffectDefinition | None:
@@ -177,12 +207,12 @@ class EffectRegistry:
         Raises:
             KeyError: If the effect type is not registered.
         """
-        definition = self._effects.get(effect_type)
-        if definition is None:
+        validator = self._validators.get(effect_type)
+        if validator is None:
             msg = f"Unknown effect type: {effect_type}"
             raise KeyError(msg)
 
-        return _validate_scalar_parameters(definition, parameters)
+        return _validate_scalar_parameters(validator, parameters)
 
     def validate_with_automation(
         self, effect_type: str, parameters: dict[str, Any]
@@ -234,10 +264,42 @@ class EffectRegistry:
 
         # Run JSON schema validation on scalar parameters only.
         if not errors:
-            errors.extend(_validate_scalar_parameters(definition, scalar_parameters))
+            errors.extend(
+                _validate_scalar_parameters(self._validators[effect_type], scalar_parameters)
+            )
 
         return errors, compiled_expression
 
+    def validate_stack(
+        self, effects: list[dict[str, Any]]
+    ) -> list[tuple[int, str, list[EffectValidationError]]]:
+        """Validate a stored effect stack (e.g. a clip's ``effects``) in one call.
+
+        Each entry goes through :meth:`validate_with_automation` with the
+        precompiled validators. Unknown effect types are reported as errors
+        instead of raising, so one bad entry does not hide the rest.
+
+        Args:
+            effects: Stored entries with ``effect_type`` and ``parameters`` keys.
+
+        Returns:
+            ``(index, effect_type, errors)`` for each invalid entry, in stack
+            order. Empty when the whole stack is valid.
+        """
+        invalid: list[tuple[int, str, list[EffectValidationError]]] = []
+        for index, entry in enumerate(effects):
+            effect_type = str(entry.get("effect_type", ""))
+            if effect_type not in self._effects:
+                error = EffectValidationError(
+                    path="", message=f"Unknown effect type: {effect_type}"
+                )
+                invalid.append((index, effect_type, [error]))
+                continue
+            errors, _ = self.validate_with_automation(effect_type, entry.get("parameters") or {})
+            if errors:
+                invalid.append((index, effect_type, errors))
+        return invalid
+
     def build_automation_filter_string(self, effect_type: str, compiled_expression: str) -> str:
         """Build a filter string for a time-varying expression.
 
@@ -17,10 +17,14 @@ from stoat_ferret.ffmpeg.executor import (
     RealFFmpegExecutor,
     RecordingFFmpegExecutor,
 )
+from stoat_ferret.ffmpeg.governor import ThreadGovernor, ThreadLease, apply_thread_limits
 from stoat_ferret.ffmpeg.metrics import (
     ffmpeg_active_processes,
     ffmpeg_execution_duration_seconds,
     ffmpeg_executions_total,
+    ffmpeg_thread_budget,
+    ffmpeg_thread_leases,
+    ffmpeg_threads_allocated,
 )
 from stoat_ferret.ffmpeg.observable import ObservableFFmpegExecutor
 from stoat_ferret.ffmpeg.probe import FFprobeError, VideoMetadata, ffprobe_video
@@ -37,10 +41,16 @@ __all__ = [
     "RealAsyncFFmpegExecutor",
     "RealFFmpegExecutor",
     "RecordingFFmpegExecutor",
+    "ThreadGovernor",
+    "ThreadLease",
     "VideoMetadata",
+    "apply_thread_limits",
     "ffmpeg_active_processes",
     "ffmpeg_execution_duration_seconds",
     "ffmpeg_executions_total",
+    "ffmpeg_thread_budget",
+    "ffmpeg_thread_leases",
+    "ffmpeg_threads_allocated",
     "ffprobe_video",
     "parse_progress_line",
 ]
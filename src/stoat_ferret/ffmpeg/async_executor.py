@@ -20,6 +20,7 @@ from typing import Protocol
 import structlog
 
 from stoat_ferret.ffmpeg.executor import ExecutionResult
+from stoat_ferret.ffmpeg.governor import ThreadGovernor, apply_thread_limits, thread_lease
 
 logger = structlog.get_logger(__name__)
 
@@ -109,13 +110,23 @@ class RealAsyncFFmpegExecutor:
     Supports cooperative cancellation via an asyncio.Event.
     """
 
-    def __init__(self, ffmpeg_path: str = "ffmpeg") -> None:
+    def __init__(
+        self,
+        ffmpeg_path: str = "ffmpeg",
+        *,
+        governor: ThreadGovernor | None = None,
+        workload: str = "proxy",
+    ) -> None:
         """Initialize with the path to ffmpeg executable.
 
         Args:
             ffmpeg_path: Path to the ffmpeg executable.
+            governor: Optional thread governor limiting each process's threads.
+            workload: Workload name the governor leases threads for.
         """
         self.ffmpeg_path = ffmpeg_path
+        self._governor = governor
+        self._workload = workload
 
     async def run(
         self,
@@ -134,7 +145,29 @@ class RealAsyncFFmpegExecutor:
         Returns:
             ExecutionResult with the outcome of the execution.
         """
-        command = [self.ffmpeg_path, *args]
+        with thread_lease(self._governor, self._workload) as lease:
+            if lease is not None:
+                args = apply_thread_limits(args, lease.threads)
+            return await self._run_command(
+                [self.ffmpeg_path, *args], progress_callback, cancel_event
+            )
+
+    async def _run_command(
+        self,
+        command: list[str],
+        progress_callback: ProgressCallback | None,
+        cancel_event: asyncio.Event | None,
+    ) -> ExecutionResult:
+        """Spawn ``command`` and collect its result.
+
+        Args:
+            command: Full argv including the ffmpeg executable.
+            progress_callback: Optional async callback invoked with ProgressInfo.
+            cancel_event: Optional event; when set, the process is terminated.
+
+        Returns:
+            ExecutionResult with the outcome of the execution.
+        """
         start = time.monotonic()
 
         logger.info("async_ffmpeg_started", command=command)
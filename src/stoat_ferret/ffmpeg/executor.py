@@ -18,6 +18,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
 
+from stoat_ferret.ffmpeg.governor import ThreadGovernor, apply_thread_limits, thread_lease
+
 
 @dataclass
 class ExecutionResult:
@@ -68,13 +70,23 @@ class RealFFmpegExecutor:
     as a subprocess.
     """
 
-    def __init__(self, ffmpeg_path: str = "ffmpeg") -> None:
+    def __init__(
+        self,
+        ffmpeg_path: str = "ffmpeg",
+        *,
+        governor: ThreadGovernor | None = None,
+        workload: str = "thumbnail",
+    ) -> None:
         """Initialize with the path to ffmpeg executable.
 
         Args:
             ffmpeg_path: Path to the ffmpeg executable.
+            governor: Optional thread governor limiting each process's threads.
+            workload: Workload name the governor leases threads for.
         """
         self.ffmpeg_path = ffmpeg_path
+        self._governor = governor
+        self._workload = workload
 
     def run(
         self,
@@ -93,15 +105,18 @@ class RealFFmpegExecutor:
         Returns:
             ExecutionResult with the outcome of the execution.
         """
-        command = [self.ffmpeg_path, *args]
-        start = time.monotonic()
-
-        result = subprocess.run(
-            command,
-            input=stdin,
-            capture_output=True,
-            timeout=timeout,
-        )
+        with thread_lease(self._governor, self._workload) as lease:
+            if lease is not None:
+                args = apply_thread_limits(args, lease.threads)
+            command = [self.ffmpeg_path, *args]
+            start = time.monotonic()
+
+            result = subprocess.run(
+                command,
+                input=stdin,
+                capture_output=True,
+                timeout=timeout,
+            )
 
         duration = time.monotonic() - start
 
@@ -0,0 +1,250 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""CPU thread budgeting across concurrent FFmpeg processes.
+
+Every FFmpeg process defaults to one codec thread per core (and as many
+filter threads again), so a few concurrent renders plus proxy, waveform
+and QC jobs oversubscribe the host and all of them slow down. The
+`ThreadGovernor` owns a global thread budget and hands each process a
+thread count when it spawns:
+
+- Interactive workloads (``preview``, ``thumbnail``) draw from a reserve of
+  a quarter of the budget that batch work never touches, and may borrow
+  idle batch capacity on top.
+- Batch workloads (``render``, ``proxy``, ``waveform``, ``qc``) share the
+  rest. A process gets half of the free batch capacity, but never less than
+  an even share across ``batch_slots`` while that much is free, so a lone
+  render is not starved of cores and later renders still get a fair share.
+
+Allocation never blocks: when the budget is exhausted a process still gets
+one thread, so the governor bounds oversubscription without queueing work.
+Counts are fixed when the process spawns and are not rebalanced while it
+runs. `apply_thread_limits` rewrites an argv to honour a count.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+
+import structlog
+
+from stoat_ferret.ffmpeg.metrics import (
+    ffmpeg_thread_budget,
+    ffmpeg_thread_leases,
+    ffmpeg_threads_allocated,
+)
+
+logger = structlog.get_logger(__name__)
+
+INTERACTIVE_WORKLOADS = frozenset({"preview", "thumbnail"})
+BATCH_WORKLOADS = frozenset({"render", "proxy", "waveform", "qc"})
+
+# FFmpeg options that take no value, so a bare word after them is an output.
+_FLAG_OPTIONS = frozenset(
+    {
+        "-accurate_seek",
+        "-an",
+        "-autorotate",
+        "-benchmark",
+        "-copy_unknown",
+        "-copyts",
+        "-dn",
+        "-hide_banner",
+        "-ignore_unknown",
+        "-n",
+        "-noaccurate_seek",
+        "-noautorotate",
+        "-nostats",
+        "-nostdin",
+        "-re",
+        "-shortest",
+        "-sn",
+        "-start_at_zero",
+        "-stats",
+        "-vn",
+        "-xerror",
+        "-y",
+    }
+)
+
+
+@dataclass(frozen=True)
+class ThreadLease:
+    """Threads granted to one FFmpeg process.
+
+    Attributes:
+        workload: Workload name the lease was taken for.
+        threads: Thread count the process must be limited to.
+    """
+
+    workload: str
+    threads: int
+
+
+class ThreadGovernor:
+    """Assign FFmpeg thread counts from a global core budget.
+
+    Thread-safe: the sync executor spawns from worker threads while the
+    async executors spawn from the event loop.
+
+    Args:
+        budget: Total threads to share; 0 uses ``os.cpu_count()``.
+        batch_slots: Batch processes expected to run at once (normally
+            ``render_max_concurrent``); sets the per-process batch share.
+    """
+
+    def __init__(self, budget: int = 0, *, batch_slots: int = 4) -> None:
+        self._budget = budget if budget > 0 else os.cpu_count() or 1
+        self._reserve = max(1, self._budget // 4)
+        self._batch_slots = max(1, batch_slots)
+        self._lock = threading.Lock()
+        self._in_use: dict[str, int] = {}
+        self._leases: dict[str, int] = {}
+        ffmpeg_thread_budget.set(self._budget)
+
+    @property
+    def budget(self) -> int:
+        """Total threads shared across all workloads."""
+        return self._budget
+
+    def acquire(self, workload: str) -> ThreadLease:
+        """Grant threads to a new FFmpeg process.
+
+        Args:
+            workload: One of `INTERACTIVE_WORKLOADS` or `BATCH_WORKLOADS`.
+
+        Returns:
+            The lease; pass it to `release` when the process exits.
+
+        Raises:
+            ValueError: If ``workload`` is not a known workload.
+        """
+        if workload not in INTERACTIVE_WORKLOADS and workload not in BATCH_WORKLOADS:
+            raise ValueError(f"Unknown FFmpeg workload: {workload!r}")
+        with self._lock:
+            interactive_used = sum(self._in_use.get(w, 0) for w in INTERACTIVE_WORKLOADS)
+            batch_used = sum(self._in_use.get(w, 0) for w in BATCH_WORKLOADS)
+            if workload in INTERACTIVE_WORKLOADS:
+                free = max(
+                    self._reserve - interactive_used,
+                    self._budget - interactive_used - batch_used,
+                )
+                cap = max(1, self._budget // 2)
+            else:
+                batch_budget = self._budget - self._reserve
+                # Interactive work borrowing past its reserve is taken from batch.
+                borrowed = max(0, interactive_used - self._reserve)
+                free = batch_budget - batch_used - borrowed
+                per_slot = max(1, batch_budget // self._batch_slots)
+                cap = max(per_slot, free // 2)
+            threads = max(1, min(free, cap))
+            self._in_use[workload] = self._in_use.get(workload, 0) + threads
+            self._leases[workload] = self._leases.get(workload, 0) + 1
+            ffmpeg_threads_allocated.labels(workload=workload).set(self._in_use[workload])
+            ffmpeg_thread_leases.labels(workload=workload).set(self._leases[workload])
+        logger.debug("ffmpeg_threads_leased", workload=workload, threads=threads)
+        return ThreadLease(workload=workload, threads=threads)
+
+    def release(self, lease: ThreadLease) -> None:
+        """Return a lease's threads to the budget.
+
+        Args:
+            lease: Lease returned by `acquire`.
+        """
+        with self._lock:
+            self._in_use[lease.workload] = max(0, self._in_use[lease.workload] - lease.threads)
+            self._leases[lease.workload] = max(0, self._leases[lease.workload] - 1)
+            ffmpeg_threads_allocated.labels(workload=lease.workload).set(
+                self._in_use[lease.workload]
+            )
+            ffmpeg_thread_leases.labels(workload=lease.workload).set(self._leases[lease.workload])
+
+    @contextmanager
+    def lease(self, workload: str) -> Iterator[ThreadLease]:
+        """Hold a lease for the duration of a ``with`` block.
+
+        Args:
+            workload: Workload name passed to `acquire`.
+
+        Yields:
+            The granted lease.
+        """
+        granted = self.acquire(workload)
+        try:
+            yield granted
+        finally:
+            self.release(granted)
+
+    def allocations(self) -> dict[str, int]:
+        """Return threads currently leased per workload."""
+        with self._lock:
+            return {w: n for w, n in self._in_use.items() if n}
+
+
+def thread_lease(
+    governor: ThreadGovernor | None, workload: str
+) -> AbstractContextManager[ThreadLease | None]:
+    """Lease threads from ``governor``, or yield None when there is none.
+
+    Args:
+        governor: Optional governor; None leaves FFmpeg threading unlimited.
+        workload: Workload name passed to `ThreadGovernor.acquire`.
+
+    Returns:
+        Context manager yielding the lease or None.
+    """
+    if governor is None:
+        return nullcontext()
+    return governor.lease(workload)
+
+
+def apply_thread_limits(args: list[str], threads: int) -> list[str]:
+    """Limit an FFmpeg argv to ``threads`` decoder, filter and encoder threads.
+
+    Adds ``-filter_threads`` (and ``-filter_complex_threads`` for filter
+    graphs) as global options, ``-threads`` before every ``-i`` for the
+    decoders, and ``-threads`` before every output path for its encoders
+    (for libx264/libx265 this sets the encoder's own thread pool).
+    ``-threads`` is a per-file option, so each output of a multi-output
+    command needs its own. Commands that already choose a ``-threads``
+    value are returned unchanged.
+
+    Args:
+        args: FFmpeg arguments, excluding the executable.
+        threads: Thread count to apply.
+
+    Returns:
+        A new argument list.
+    """
+    if "-threads" in args:
+        return list(args)
+    count = str(threads)
+    limited = ["-filter_threads", count]
+    if "-filter_complex" in args or "-filter_complex_script" in args:
+        limited.extend(["-filter_complex_threads", count])
+    last = len(args) - 1
+    for i, arg in enumerate(args):
+        if arg == "-i" or _is_output_path(arg, args[i - 1] if i else None, last=i == last):
+            limited.extend(["-threads", count])
+        limited.append(arg)
+    return limited
+
+
+def _is_output_path(arg: str, previous: str | None, *, last: bool) -> bool:
+    """Return True if ``arg`` is an output file rather than an option or its value.
+
+    A trailing bare word is always the (final) output; earlier ones count
+    when they do not follow an option that takes a value.
+    """
+    if arg.startswith("-") and arg != "-":
+        return False
+    if previous == "-i":
+        return False
+    if last or previous is None or previous == "-":
+        return True
+    return not previous.startswith("-") or previous in _FLAG_OPTIONS
@@ -7,6 +7,7 @@ Provides metrics for tracking FFmpeg command executions including:
 - Total execution counts by status
 - Execution duration histograms
 - Active process gauges
+- Thread budget allocations per workload
 """
 
 from prometheus_client import Counter, Gauge, Histogram
@@ -27,3 +28,20 @@ ffmpeg_active_processes = Gauge(
     "stoat_ferret_ffmpeg_active_processes",
     "Number of currently running FFmpeg processes",
 )
+
+ffmpeg_thread_budget = Gauge(
+    "stoat_ferret_ffmpeg_thread_budget",
+    "Total threads the governor shares across FFmpeg processes",
+)
+
+ffmpeg_threads_allocated = Gauge(
+    "stoat_ferret_ffmpeg_threads_allocated",
+    "Threads currently leased to running FFmpeg processes",
+    ["workload"],  # preview, thumbnail, render, proxy, waveform, qc
+)
+
+ffmpeg_thread_leases = Gauge(
+    "stoat_ferret_ffmpeg_thread_leases",
+    "Running FFmpeg processes holding a thread lease",
+    ["workload"],
+)
@@ -162,3 +162,140 @@ def _parse_ffprobe_output(data: dict[str, Any], file_path: Path) -> VideoMetadat
         data_count=len(data_streams),
         subtitle_streams=subtitle_stream_list,
     )
+
+
+@dataclass(frozen=True)
+class KeyframeIndex:
+    """Keyframe positions and stream parameters of a video stream.
+
+    Attributes:
+        codec_name: Video codec as reported by ffprobe (e.g. ``h264``).
+        pix_fmt: Pixel format (e.g. ``yuv420p``), or None if unreported.
+        keyframes: Keyframe presentation times in seconds, ascending.
+        profile: Codec profile (e.g. ``High``), or None if unreported.
+        level: Codec level as reported by ffprobe (``41`` for H.264 level
+            4.1, ``123`` for HEVC level 4.1), or None if unreported.
+        color_range: Colour range (``tv``/``pc``), or None if unspecified.
+        color_space: Matrix coefficients (e.g. ``bt709``), or None if unspecified.
+        color_transfer: Transfer characteristics, or None if unspecified.
+        color_primaries: Colour primaries, or None if unspecified.
+    """
+
+    codec_name: str
+    pix_fmt: str | None
+    keyframes: tuple[float, ...]
+    profile: str | None = None
+    level: int | None = None
+    color_range: str | None = None
+    color_space: str | None = None
+    color_transfer: str | None = None
+    color_primaries: str | None = None
+
+
+async def ffprobe_keyframes(
+    path: str,
+    start_s: float,
+    end_s: float,
+    ffprobe_path: str = "ffprobe",
+) -> KeyframeIndex:
+    """List the keyframes of the first video stream between two times.
+
+    Reads packet headers only (no decoding), limited to the requested
+    interval, so the cost scales with the span rather than the file.
+
+    Args:
+        path: Path to the video file.
+        start_s: Interval start in seconds.
+        end_s: Interval end in seconds.
+        ffprobe_path: Path to the ffprobe executable.
+
+    Returns:
+        KeyframeIndex for the interval.
+
+    Raises:
+        FFprobeError: If ffprobe is not installed, times out, or fails.
+        ValueError: If the file has no video stream.
+    """
+    try:
+        result = await asyncio.to_thread(
+            subprocess.run,
+            [
+                ffprobe_path,
+                "-v",
+                "quiet",
+                "-select_streams",
+                "v:0",
+                "-read_intervals",
+                f"{start_s}%{end_s}",
+                "-show_entries",
+                (
+                    "stream=codec_name,pix_fmt,profile,level,color_range,color_space,"
+                    "color_transfer,color_primaries:packet=pts_time,flags"
+                ),
+                "-print_format",
+                "json",
+                path,
+            ],
+            capture_output=True,
+            timeout=60,
+        )
+    except FileNotFoundError:
+        raise FFprobeError(f"ffprobe not found at: {ffprobe_path}. Is FFmpeg installed?") from None
+    except subprocess.TimeoutExpired:
+        raise FFprobeError(f"ffprobe timed out reading keyframes: {path}") from None
+
+    if result.returncode != 0:
+        stderr_text = result.stderr.decode(errors="replace")
+        raise FFprobeError(f"ffprobe failed for {path}: {stderr_text}")
+
+    try:
+        data = json.loads(result.stdout)
+    except json.JSONDecodeError as e:
+        raise FFprobeError(f"Failed to parse ffprobe output: {e}") from e
+
+    return _parse_keyframe_output(data, path)
+
+
+def _parse_keyframe_output(data: dict[str, Any], path: str) -> KeyframeIndex:
+    """Parse ``ffprobe -show_entries packet=pts_time,flags`` JSON output.
+
+    Args:
+        data: Parsed JSON from ffprobe.
+        path: Original file path for error messages.
+
+    Returns:
+        KeyframeIndex with keyframe times sorted ascending.
+
+    Raises:
+        ValueError: If no video stream is reported.
+    """
+    streams = data.get("streams", [])
+    if not streams:
+        raise ValueError(f"No video stream found in: {path}")
+    keyframes = sorted(
+        {
+            float(packet["pts_time"])
+            for packet in data.get("packets", [])
+            if "K" in packet.get("flags", "") and packet.get("pts_time") not in (None, "N/A")
+        }
+    )
+    stream = streams[0]
+    level = stream.get("level")
+    return KeyframeIndex(
+        codec_name=stream.get("codec_name", "unknown"),
+        pix_fmt=stream.get("pix_fmt"),
+        keyframes=tuple(keyframes),
+        profile=_reported(stream.get("profile")),
+        level=level if isinstance(level, int) and level > 0 else None,
+        color_range=_reported(stream.get("color_range")),
+        color_space=_reported(stream.get("color_space")),
+        color_transfer=_reported(stream.get("color_transfer")),
+        color_primaries=_reported(stream.get("color_primaries")),
+    )
+
+
+def _reported(value: Any) -> str | None:
+    """Return an ffprobe string field, or None when it is absent or ``unknown``."""
+    if not isinstance(value, str) or value in ("", "unknown"):
+        return None
+    return value
@@ -6,17 +6,115 @@
 Provides a centralized logging configuration using structlog with support for
 both JSON output (production) and console output (development), plus rotating
 file-based logging for persistent log output.
+
+Two optional stages keep logging off the event loop's critical path:
+
+- Queue mode (``queue_mode=True``): the root logger only gets a `QueueHandler`
+  that enqueues the record. A `QueueListener` thread owns the stdout and
+  file handlers, so JSON/console rendering and file I/O happen off the
+  event loop. The queue is bounded; when it is full, records are dropped and
+  counted rather than blocking the caller.
+- Sampling: events in `HIGH_FREQUENCY_EVENTS` (per-broadcast and per-frame
+  debug events) keep only one in ``sample_rate`` emissions. WARNING and
+  above are never sampled.
+
+Every structlog call is first checked against the stdlib level, so a
+disabled DEBUG call returns before timestamping or rendering.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from collections.abc import Iterable, MutableMapping
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Any
 
 import structlog
 
+# Debug events emitted per WebSocket broadcast or per captured render frame.
+HIGH_FREQUENCY_EVENTS: frozenset[str] = frozenset(
+    {
+        "ws_broadcast",
+        "render_service.frame_captured",
+    }
+)
+
+_listener: QueueListener | None = None
+_atexit_registered = False
+
+
+class EventSampler:
+    """structlog processor keeping one in every ``rate`` matching events.
+
+    Counting is per event name. Events at WARNING or above always pass.
+    The counter is not locked; a race between threads only shifts which
+    emission is kept.
+    """
+
+    def __init__(self, events: Iterable[str], rate: int) -> None:
+        """Initialise the sampler.
+
+        Args:
+            events: Event names subject to sampling.
+            rate: Keep one in this many emissions (1 keeps all).
+        """
+        self._events = frozenset(events)
+        self._rate = max(1, rate)
+        self._counts: dict[str, int] = {}
+
+    def __call__(
+        self, logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+    ) -> MutableMapping[str, Any]:
+        """Drop the event unless it is the first of its sampling window."""
+        event = event_dict.get("event")
+        if self._rate == 1 or event not in self._events:
+            return event_dict
+        if method_name in ("warning", "warn", "error", "exception", "critical", "fatal"):
+            return event_dict
+        count = self._counts.get(event, 0)
+        self._counts[event] = count + 1
+        if count % self._rate:
+            raise structlog.DropEvent
+        event_dict["sample_rate"] = self._rate
+        return event_dict
+
+
+class StructlogQueueHandler(QueueHandler):
+    """`QueueHandler` that defers formatting to the listener thread.
+
+    The stock handler formats each record before enqueueing it, which would
+    render JSON on the caller's thread. structlog records carry their
+    event dict in ``record.msg`` and need no preparation. For stdlib
+    records, only the ``%`` arguments are merged into the message. A full
+    queue drops the record instead of raising.
+    """
+
+    def __init__(self, record_queue: queue.Queue[logging.LogRecord]) -> None:
+        """Initialise the handler over a bounded queue."""
+        super().__init__(record_queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return the record unformatted, with stdlib ``%`` args merged."""
+        if not isinstance(record.msg, dict) and record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue without blocking; count the record if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
 
 def configure_logging(
     json_format: bool = True,
@@ -24,6 +122,10 @@ def configure_logging(
     log_dir: str | Path = "logs",
     max_bytes: int = 10_485_760,
     backup_count: int = 5,
+    *,
+    queue_mode: bool = False,
+    queue_max_records: int = 10_000,
+    sample_rate: int = 1,
 ) -> None:
     """Configure structlog for the application.
 
@@ -35,6 +137,12 @@ def configure_logging(
         log_dir: Directory for log files (default: "logs").
         max_bytes: Maximum log file size in bytes before rotation (default: 10MB).
         backup_count: Number of rotated backup files to keep (default: 5).
+        queue_mode: If True, render and write records on a background
+            listener thread behind a `StructlogQueueHandler`.
+        queue_max_records: Capacity of the queue in queue mode; records
+            beyond it are dropped.
+        sample_rate: Keep one in this many `HIGH_FREQUENCY_EVENTS` below
+            WARNING (1 disables sampling).
     """
     shared_processors: list[structlog.typing.Processor] = [
         structlog.stdlib.add_log_level,
@@ -50,6 +158,9 @@ def configure_logging(
 
     structlog.configure(
         processors=[
+            # Level check first so disabled calls skip the rest of the chain.
+            structlog.stdlib.filter_by_level,
+            EventSampler(HIGH_FREQUENCY_EVENTS, sample_rate),
             *shared_processors,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
@@ -65,6 +176,19 @@ def configure_logging(
     )
 
     root = logging.getLogger()
+    log_path = Path(log_dir)
+    log_path.mkdir(parents=True, exist_ok=True)
+
+    if queue_mode:
+        # The listener owns the stdout/file handlers; direct ones left by an
+        # earlier non-queue call would render every record a second time.
+        _remove_direct_handlers(root)
+        _start_queue_listener(root, formatter, log_path, max_bytes, backup_count, queue_max_records)
+        root.setLevel(level)
+        return
+
+    # Switching back from queue mode: stop the listener and its queue handler.
+    shutdown_logging()
 
     # Idempotency: only add a handler if root has no StreamHandler already.
     # Use exact type match to avoid matching subclasses (e.g. pytest's LogCaptureHandler).
@@ -75,18 +199,85 @@ def configure_logging(
         root.addHandler(handler)
 
     # File handler: rotating log file for persistent output
-    log_path = Path(log_dir)
-    log_path.mkdir(parents=True, exist_ok=True)
-
     has_file_handler = any(type(h) is RotatingFileHandler for h in root.handlers)
     if not has_file_handler:
-        file_handler = RotatingFileHandler(
-            filename=str(log_path / "stoat-ferret.log"),
-            maxBytes=max_bytes,
-            backupCount=backup_count,
-            encoding="utf-8",
-        )
-        file_handler.setFormatter(formatter)
-        root.addHandler(file_handler)
+        root.addHandler(_file_handler(formatter, log_path, max_bytes, backup_count))
 
     root.setLevel(level)
+
+
+def shutdown_logging() -> None:
+    """Drain the queue, stop the listener thread and close its handlers.
+
+    No-op outside queue mode. Called on application shutdown and at
+    interpreter exit; `configure_logging` can start a new listener later.
+    """
+    global _listener
+    listener = _listener
+    if listener is None:
+        return
+    _listener = None
+    root = logging.getLogger()
+    for queue_handler in [h for h in root.handlers if isinstance(h, StructlogQueueHandler)]:
+        root.removeHandler(queue_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def dropped_log_records() -> int:
+    """Return how many records the active queue handler has dropped."""
+    return sum(
+        h.dropped for h in logging.getLogger().handlers if isinstance(h, StructlogQueueHandler)
+    )
+
+
+def _remove_direct_handlers(root: logging.Logger) -> None:
+    """Remove and close the stdout and file handlers `configure_logging` adds."""
+    for handler in [
+        h for h in root.handlers if type(h) in (logging.StreamHandler, RotatingFileHandler)
+    ]:
+        root.removeHandler(handler)
+        handler.close()
+
+
+def _file_handler(
+    formatter: logging.Formatter, log_path: Path, max_bytes: int, backup_count: int
+) -> RotatingFileHandler:
+    file_handler = RotatingFileHandler(
+        filename=str(log_path / "stoat-ferret.log"),
+        maxBytes=max_bytes,
+        backupCount=backup_count,
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(formatter)
+    return file_handler
+
+
+def _start_queue_listener(
+    root: logging.Logger,
+    formatter: logging.Formatter,
+    log_path: Path,
+    max_bytes: int,
+    backup_count: int,
+    queue_max_records: int,
+) -> None:
+    global _listener, _atexit_registered
+    # Idempotency: one queue handler and listener per process.
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    record_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=queue_max_records)
+    _listener = QueueListener(
+        record_queue,
+        stream_handler,
+        _file_handler(formatter, log_path, max_bytes, backup_count),
+        respect_handler_level=True,
+    )
+    _listener.start()
+    root.addHandler(StructlogQueueHandler(record_queue))
+    if not _atexit_registered:
+        atexit.register(shutdown_logging)
+        _atexit_registered = True
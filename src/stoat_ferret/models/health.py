@@ -22,6 +22,9 @@ class HealthStatus(BaseModel):
     from ``database_version`` in BL-267 to avoid a semantic collision with
     the new ``/api/v1/version`` endpoint, where ``database_version`` refers
     to the alembic revision hash of the schema.
+
+    ``snapshot_age_seconds`` is how old the cached check results in
+    ``checks`` are; readiness checks are not rerun on every probe.
     """
 
     model_config = ConfigDict(from_attributes=True)
@@ -33,4 +36,5 @@ class HealthStatus(BaseModel):
     core_version: str | None = None
     ws_buffer_utilization: float = 0.0
     uptime_seconds: float | None = None
+    snapshot_age_seconds: float = 0.0
     checks: dict[str, Any] = {}
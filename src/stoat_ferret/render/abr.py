@@ -0,0 +1,205 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Adaptive bitrate (ABR) ladders as render outputs.
+
+A render output with ``output_format`` ``hls`` or ``dash`` is a ladder: the
+same picture at several sizes and bitrates, segmented for adaptive
+streaming. Ladders are extra outputs (see render/multi_output.py), so they
+are encoded from the job's single decode rather than by re-encoding the
+finished file:
+
+- The ladder's video branch is cropped once, split per rendition and scaled
+  to each rendition's height.
+- Every rendition is encoded at its own target bitrate, capped at
+  ``max_bitrate_kbps`` with a buffer of twice that.
+- Keyframes are aligned across renditions: a keyframe is forced on every
+  segment boundary, the GOP is fixed to one segment, and x264 scene-cut
+  keyframes are disabled, so players can switch rendition at any segment.
+- Audio is encoded once and shared by all renditions.
+
+``hls`` writes MPEG-TS segments, one media playlist per rendition plus an
+audio-only playlist, and ``master.m3u8``. ``dash`` writes CMAF (fragmented
+MP4) segments with ``manifest.mpd`` and HLS playlists over the same
+segments, so one ladder serves both protocols. Both go to a directory next
+to the primary output.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from stoat_ferret.api.schemas.render import RenderOutputSpec
+from stoat_ferret.render.tuning import PRESET_ENCODERS
+
+# Manifest written at the top of each ladder directory (the output's path)
+MANIFEST_FILENAMES: dict[str, str] = {"hls": "master.m3u8", "dash": "manifest.mpd"}
+
+# Per-rendition playlists and segments; FFmpeg substitutes %v with the stream index
+_HLS_PLAYLIST = "stream_%v.m3u8"
+_HLS_SEGMENT = "stream_%v_%05d.ts"
+
+_AUDIO_GROUP = "audio"
+
+# Rate-control buffer as a multiple of the maximum bitrate
+_BUFSIZE_FACTOR = 2
+
+
+def ladder_dir(primary_path: str, name: str) -> Path:
+    """Return the directory a ladder output is written to.
+
+    Args:
+        primary_path: Path of the job's primary output.
+        name: Name of the ladder output.
+
+    Returns:
+        ``<dir>/<stem>_<name>`` next to the primary output.
+    """
+    primary = Path(primary_path)
+    return primary.with_name(f"{primary.stem}_{name}")
+
+
+def prepare_ladder_dirs(outputs: list[RenderOutputSpec]) -> None:
+    """Create the directories ladder outputs are written to.
+
+    FFmpeg's HLS and DASH muxers write segments next to the manifest but do
+    not create its directory.
+
+    Args:
+        outputs: Extra deliverables with ``output_path`` assigned.
+    """
+    for spec in outputs:
+        if spec.is_ladder and spec.output_path:
+            Path(spec.output_path).parent.mkdir(parents=True, exist_ok=True)
+
+
+def ladder_output(
+    spec: RenderOutputSpec,
+    *,
+    video: str,
+    audio: str | None,
+    index: int,
+    shared: list[tuple[str, str]],
+    settings: Mapping[str, Any],
+) -> tuple[list[str], list[str]]:
+    """Build the filtergraph and output options of a ladder output.
+
+    Args:
+        spec: Ladder output with ``output_path`` assigned.
+        video: Filtergraph label of the ladder's video branch.
+        audio: Audio branch label or stream specifier, or None when silent.
+        index: Position of the output, used to keep filter labels unique.
+        shared: Primary output options to repeat (trimming, frame rate, metadata).
+        settings: Render plan settings (frame rate and encoder preset).
+
+    Returns:
+        Tuple of (filtergraph segments, output options ending with the
+        muxer's output URL).
+    """
+    count = len(spec.renditions)
+    branches = [f"[abr{index}_{i}]" for i in range(count)]
+    scaled = [f"[abr{index}_out{i}]" for i in range(count)]
+    prefix = ""
+    if spec.crop_aspect:
+        num, den = spec.crop_aspect.split(":")
+        prefix = (
+            f"crop=w=trunc(min(iw\\,ih*{num}/{den})/2)*2:h=trunc(min(ih\\,iw*{den}/{num})/2)*2,"
+        )
+    segments = [f"{video}{prefix}split={count}{''.join(branches)}"]
+    segments.extend(
+        f"{branch}scale=-2:{rendition.height}{label}"
+        for branch, rendition, label in zip(branches, spec.renditions, scaled, strict=True)
+    )
+
+    options: list[str] = []
+    for label in scaled:
+        options.extend(["-map", label])
+    if audio is not None:
+        options.extend(["-map", audio])
+    codec = spec.codec or "libx264"
+    options.extend(["-c:v", codec])
+    for i, rendition in enumerate(spec.renditions):
+        maxrate = rendition.max_bitrate_kbps or rendition.video_bitrate_kbps
+        options.extend(
+            [
+                f"-b:v:{i}",
+                f"{rendition.video_bitrate_kbps}k",
+                f"-maxrate:v:{i}",
+                f"{maxrate}k",
+                f"-bufsize:v:{i}",
+                f"{maxrate * _BUFSIZE_FACTOR}k",
+            ]
+        )
+    preset = spec.encoder_preset or settings.get("encoder_preset")
+    if codec in PRESET_ENCODERS and preset:
+        options.extend(["-preset", str(preset)])
+    options.extend(_keyframe_options(codec, spec.segment_seconds, settings))
+    if audio is not None:
+        options.extend(["-c:a", "aac", "-b:a", f"{spec.audio_bitrate_kbps}k"])
+    else:
+        options.append("-an")
+    for flag, value in shared:
+        options.extend([flag, value])
+    options.extend(_muxer_options(spec, count, has_audio=audio is not None))
+    return segments, options
+
+
+def _keyframe_options(codec: str, segment: float, settings: Mapping[str, Any]) -> list[str]:
+    seconds = f"{segment:g}"
+    gop = max(1, round(float(settings.get("fps") or 30.0) * segment))
+    options = [
+        "-force_key_frames",
+        f"expr:gte(t,n_forced*{seconds})",
+        "-g",
+        str(gop),
+        "-keyint_min",
+        str(gop),
+    ]
+    if codec == "libx264":
+        options.extend(["-sc_threshold", "0"])
+    return options
+
+
+def _muxer_options(spec: RenderOutputSpec, count: int, *, has_audio: bool) -> list[str]:
+    manifest = Path(str(spec.output_path))
+    seconds = f"{spec.segment_seconds:g}"
+    if spec.output_format == "dash":
+        return [
+            "-f",
+            "dash",
+            "-seg_duration",
+            seconds,
+            "-use_template",
+            "1",
+            "-use_timeline",
+            "1",
+            "-adaptation_sets",
+            "id=0,streams=v id=1,streams=a" if has_audio else "id=0,streams=v",
+            "-hls_playlist",
+            "1",
+            str(manifest),
+        ]
+    if has_audio:
+        variants = [f"v:{i},agroup:{_AUDIO_GROUP}" for i in range(count)]
+        variants.append(f"a:0,agroup:{_AUDIO_GROUP}")
+    else:
+        variants = [f"v:{i}" for i in range(count)]
+    return [
+        "-f",
+        "hls",
+        "-hls_time",
+        seconds,
+        "-hls_playlist_type",
+        "vod",
+        "-hls_flags",
+        "independent_segments",
+        "-hls_segment_filename",
+        str(manifest.parent / _HLS_SEGMENT),
+        "-master_pl_name",
+        manifest.name,
+        "-var_stream_map",
+        " ".join(variants),
+        str(manifest.parent / _HLS_PLAYLIST),
+    ]
@@ -19,6 +19,7 @@ from typing import Any
 
 import structlog
 
+from stoat_ferret.ffmpeg.governor import ThreadGovernor, ThreadLease, apply_thread_limits
 from stoat_ferret.render.metrics import render_encoder_active, render_speed_ratio
 from stoat_ferret.render.models import RenderJob
 
@@ -92,6 +93,8 @@ class RenderExecutor:
         progress_callback: Optional async callback invoked with
             (job_id, progress, elapsed_seconds, frame, fps).
         ffmpeg_path: Path to the ffmpeg executable.
+        governor: Optional thread governor; each render process is limited
+            to the threads it leases for the ``render`` workload.
     """
 
     def __init__(
@@ -101,11 +104,13 @@ class RenderExecutor:
         cancel_grace_seconds: int = 10,
         progress_callback: ProgressCallback | None = None,
         ffmpeg_path: str = "ffmpeg",
+        governor: ThreadGovernor | None = None,
     ) -> None:
         self._timeout_seconds = timeout_seconds
         self._cancel_grace_seconds = cancel_grace_seconds
         self._progress_callback = progress_callback
         self._ffmpeg_path = ffmpeg_path
+        self._governor = governor
         self._active_processes: dict[str, asyncio.subprocess.Process] = {}
         self._temp_files: dict[str, list[Path]] = {}
         self._job_start_times: dict[str, float] = {}
@@ -170,12 +175,19 @@ class RenderExecutor:
         self._job_durations_us[job_id] = total_duration_us
         render_encoder_active.labels(encoder_name=encoder_name).inc()
 
-        process = await asyncio.create_subprocess_exec(
-            *command,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        lease = self._lease_threads()
+        if lease is not None:
+            command = [command[0], *apply_thread_limits(command[1:], lease.threads)]
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except BaseException:
+            self._release_threads(lease)
+            raise
         self._active_processes[job_id] = process
 
         stderr_lines: list[bytes] = []
@@ -196,6 +208,7 @@ class RenderExecutor:
         finally:
             self._active_processes.pop(job_id, None)
             render_encoder_active.labels(encoder_name=encoder_name).dec()
+            self._release_threads(lease)
             self._job_start_times.pop(job_id, None)
             self._job_durations_us.pop(job_id, None)
             self._cleanup_temp_files(job_id)
@@ -210,6 +223,17 @@ class RenderExecutor:
         self._persist_evidence(job, command, process.returncode, stderr_lines)
         return success
 
+    def _lease_threads(self) -> ThreadLease | None:
+        """Lease render threads from the governor, if one is configured."""
+        if self._governor is None:
+            return None
+        return self._governor.acquire("render")
+
+    def _release_threads(self, lease: ThreadLease | None) -> None:
+        """Return a lease taken by `_lease_threads`."""
+        if self._governor is not None and lease is not None:
+            self._governor.release(lease)
+
     async def cancel(self, job_id: str) -> bool:
         """Cancel a running render job gracefully.
 
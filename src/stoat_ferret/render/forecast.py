@@ -0,0 +1,243 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Start and finish time forecasts for the render queue.
+
+`QueueForecaster` predicts how long each render job takes and simulates the
+queue to predict when every running and queued job will finish:
+
+- A job's size is its plan cost: the sum of segment ``cost_estimate`` values
+  (what ``RenderPlan.total_cost()`` returns), or frame count when the plan
+  carries no segments.
+- Completed jobs teach the forecaster how many cost units per wall-clock
+  second each encoder and preset gets through, including probing, staged
+  passes and everything else between dequeue and completion.
+- Encoders with no completed job yet fall back to the telemetry prediction
+  from `EncoderTuner`, then to real time.
+- Running jobs blend the prediction with their observed progress
+  (`blend_eta`), so estimates settle quickly instead of swinging on the
+  first few percent.
+- Queued jobs are list-scheduled in FIFO order onto the concurrency slots
+  freed by running jobs.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from stoat_ferret.render.models import RenderJob
+from stoat_ferret.render.tuning import EncodeProfile, EncoderTuner, blend_eta, preset_in_effect
+
+ForecastBasis = Literal["observed", "telemetry", "default"]
+
+# Weight of the newest completed job in the per-encoder throughput average
+_SMOOTHING = 0.3
+
+
+@dataclass(frozen=True)
+class RunningJob:
+    """A running job as seen by the forecaster.
+
+    Attributes:
+        job: The render job.
+        elapsed_s: Wall-clock seconds since the job started, if known.
+    """
+
+    job: RenderJob
+    elapsed_s: float | None = None
+
+
+@dataclass(frozen=True)
+class JobForecast:
+    """Predicted timing for one render job.
+
+    Attributes:
+        job_id: Render job ID.
+        status: "running" or "queued".
+        predicted_seconds: Predicted wall-clock time for the whole job.
+        starts_in_seconds: Seconds until the job starts (0 when running).
+        finishes_in_seconds: Seconds until the job finishes.
+        basis: Where the prediction came from: "observed" (completed jobs),
+            "telemetry" (encoder telemetry) or "default" (real time).
+    """
+
+    job_id: str
+    status: Literal["running", "queued"]
+    predicted_seconds: float
+    starts_in_seconds: float
+    finishes_in_seconds: float
+    basis: ForecastBasis
+
+
+def plan_cost(plan: dict[str, Any]) -> float:
+    """Return the estimated render cost of a render plan.
+
+    Mirrors ``RenderPlan.total_cost()``: the sum of segment cost estimates
+    (frames times active clips). Plans without segments are costed by
+    frame count.
+
+    Args:
+        plan: Parsed render plan JSON.
+
+    Returns:
+        Cost in frame units (0.0 when the plan has no duration).
+    """
+    try:
+        segments = plan.get("segments") or []
+        cost = sum(float(s.get("cost_estimate", 0.0)) for s in segments if isinstance(s, dict))
+        if cost > 0:
+            return cost
+        settings = plan.get("settings") or {}
+        return max(0.0, float(plan.get("total_duration", 0.0)) * float(settings.get("fps", 30.0)))
+    except (TypeError, ValueError, AttributeError):
+        return 0.0
+
+
+def _parse_plan(render_plan_json: str) -> dict[str, Any]:
+    try:
+        plan = json.loads(render_plan_json)
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    return plan if isinstance(plan, dict) else {}
+
+
+def _encoder_key(settings: dict[str, Any]) -> tuple[str, str]:
+    encoder = str(settings.get("codec", "libx264"))
+    return encoder, preset_in_effect(encoder, settings.get("encoder_preset"))
+
+
+class QueueForecaster:
+    """Predict render job durations and simulate the queue.
+
+    Args:
+        tuner: Optional encoder tuner used for encoders with no completed job.
+    """
+
+    def __init__(self, tuner: EncoderTuner | None = None) -> None:
+        self._tuner = tuner
+        # (encoder, preset) -> plan cost units per wall-clock second
+        self._throughput: dict[tuple[str, str], float] = {}
+
+    def observe(self, render_plan_json: str, elapsed_s: float) -> None:
+        """Learn from a completed job.
+
+        Args:
+            render_plan_json: Serialized render plan of the job.
+            elapsed_s: Wall-clock seconds from start to completion.
+        """
+        plan = _parse_plan(render_plan_json)
+        cost = plan_cost(plan)
+        if cost <= 0 or elapsed_s <= 0:
+            return
+        key = _encoder_key(plan.get("settings") or {})
+        rate = cost / elapsed_s
+        previous = self._throughput.get(key)
+        self._throughput[key] = (
+            rate if previous is None else _SMOOTHING * rate + (1 - _SMOOTHING) * previous
+        )
+
+    def observed_seconds(self, render_plan_json: str) -> float | None:
+        """Predict a job's duration from completed jobs with the same encoder.
+
+        Args:
+            render_plan_json: Serialized render plan.
+
+        Returns:
+            Predicted wall-clock seconds, or None without a completed job to go on.
+        """
+        plan = _parse_plan(render_plan_json)
+        rate = self._throughput.get(_encoder_key(plan.get("settings") or {}))
+        cost = plan_cost(plan)
+        if rate is None or cost <= 0:
+            return None
+        return cost / rate
+
+    def predict(self, render_plan_json: str) -> tuple[float, ForecastBasis]:
+        """Predict a job's wall-clock duration.
+
+        Args:
+            render_plan_json: Serialized render plan.
+
+        Returns:
+            Tuple of (seconds, basis); see `JobForecast.basis`.
+        """
+        observed = self.observed_seconds(render_plan_json)
+        if observed is not None:
+            return observed, "observed"
+        plan = _parse_plan(render_plan_json)
+        settings = plan.get("settings") or {}
+        try:
+            duration = max(0.0, float(plan.get("total_duration", 0.0) or 0.0))
+            profile = EncodeProfile.from_settings(settings)
+        except (TypeError, ValueError, AttributeError):
+            return 0.0, "default"
+        if self._tuner is not None and duration > 0:
+            prediction = self._tuner.predict(profile, settings.get("encoder_preset"))
+            if prediction is not None:
+                return prediction.elapsed_seconds(duration), "telemetry"
+        return duration, "default"
+
+    def forecast(
+        self,
+        running: list[RunningJob],
+        queued: list[RenderJob],
+        max_concurrent: int,
+    ) -> list[JobForecast]:
+        """Predict start and finish times for running and queued jobs.
+
+        Args:
+            running: Jobs currently running.
+            queued: Jobs waiting to run, in dequeue (FIFO) order.
+            max_concurrent: Maximum simultaneously running jobs.
+
+        Returns:
+            One forecast per job: running jobs first, then queued jobs in order.
+        """
+        forecasts: list[JobForecast] = []
+        slots: list[float] = []
+        for entry in running:
+            predicted, basis = self.predict(entry.job.render_plan)
+            progress = min(max(entry.job.progress, 0.0), 1.0)
+            remaining: float | None = None
+            if entry.elapsed_s is not None:
+                remaining = blend_eta(entry.elapsed_s, progress, predicted)
+            if remaining is None:
+                remaining = predicted * (1 - progress)
+            forecasts.append(
+                JobForecast(
+                    job_id=entry.job.id,
+                    status="running",
+                    predicted_seconds=predicted,
+                    starts_in_seconds=0.0,
+                    finishes_in_seconds=remaining,
+                    basis=basis,
+                )
+            )
+            slots.append(remaining)
+        capacity = max(1, max_concurrent)
+        # Slots not taken by running jobs are free now
+        slots.extend([0.0] * (capacity - len(slots)))
+        heapq.heapify(slots)
+        # With more running jobs than slots, the first queued job starts only
+        # once enough of them finish to bring the count under the limit.
+        while len(slots) > capacity:
+            heapq.heappop(slots)
+        for job in queued:
+            predicted, basis = self.predict(job.render_plan)
+            start = heapq.heappop(slots)
+            finish = start + predicted
+            heapq.heappush(slots, finish)
+            forecasts.append(
+                JobForecast(
+                    job_id=job.id,
+                    status="queued",
+                    predicted_seconds=predicted,
+                    starts_in_seconds=start,
+                    finishes_in_seconds=finish,
+                    basis=basis,
+                )
+            )
+        return forecasts
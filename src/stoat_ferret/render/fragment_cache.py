@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Memoized per-clip filter fragments for render command building.
+
+Building a render command turns every clip's effects into filter strings
+through each effect definition's ``build_fn``. Retries, staged passes and
+repeated renders of the same project rebuild identical strings, which on
+large timelines is a noticeable share of the command build.
+`ClipFragmentCache` keeps the built fragments per clip, keyed on:
+
+- the clip row version (``updated_at``, bumped by every clip and clip-effect
+  mutation),
+- a hash of the clip's effect list, so edits that keep the timestamp (or
+  in-memory clips in tests) still miss,
+- the effect registry and its ``version``, which changes when an effect
+  definition is registered or replaced.
+
+Each clip holds one entry: a lookup with a different key rebuilds and
+replaces it, so a mutated clip's stale fragments are dropped on its next
+render. Entries are evicted least recently used beyond ``max_entries``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from stoat_ferret.db.models import Clip
+    from stoat_ferret.effects.registry import EffectRegistry
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+@dataclass(frozen=True)
+class VideoFragment:
+    """A built video effect filter.
+
+    Attributes:
+        filter_str: FFmpeg filter string from the effect's ``build_fn``.
+        window: ``(start_s, end_s)`` when the effect is windowed, else None.
+        timeline_t_capable: Whether the filter accepts timeline ``t`` expressions.
+    """
+
+    filter_str: str
+    window: tuple[float, float] | None
+    timeline_t_capable: bool
+
+
+@dataclass(frozen=True)
+class ClipFragments:
+    """Built effect filters of one clip.
+
+    Attributes:
+        video: Video effect filters in application order.
+        audio: Audio effect filter chains in application order.
+    """
+
+    video: tuple[VideoFragment, ...]
+    audio: tuple[str, ...]
+
+
+def effects_digest(effects: list[dict[str, Any]] | None) -> str:
+    """Return a stable hash of a clip's effect list.
+
+    Args:
+        effects: The clip's ``effects`` (effect type, parameters, window).
+
+    Returns:
+        Hex digest; equal for effect lists with equal content.
+    """
+    canonical = json.dumps(effects or [], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ClipFragmentCache:
+    """Per-clip memo of built effect filters.
+
+    Args:
+        max_entries: Maximum clips held before least recently used eviction.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self._max_entries = max(1, max_entries)
+        # clip ID -> (version key, value)
+        self._entries: OrderedDict[str, tuple[tuple[Any, ...], ClipFragments]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        clip: Clip,
+        registry: EffectRegistry | None,
+        build: Callable[[Clip], ClipFragments],
+    ) -> ClipFragments:
+        """Return the clip's fragments, building them when missing or stale.
+
+        Args:
+            clip: The clip whose effects are built.
+            registry: Effect registry ``build`` resolves effects through.
+            build: Builds the fragments for ``clip``. Exceptions propagate
+                and nothing is cached.
+
+        Returns:
+            The cached or freshly built fragments.
+        """
+        key = (
+            clip.updated_at,
+            effects_digest(clip.effects),
+            id(registry),
+            registry.version if registry is not None else None,
+        )
+        entry = self._entries.get(clip.id)
+        if entry is not None and entry[0] == key:
+            self._entries.move_to_end(clip.id)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        value = build(clip)
+        self._entries[clip.id] = (key, value)
+        self._entries.move_to_end(clip.id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, clip_id: str) -> None:
+        """Drop a clip's entry (e.g. when the clip is deleted).
+
+        Args:
+            clip_id: ID of the clip.
+        """
+        self._entries.pop(clip_id, None)
@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Hierarchical rendering for timelines with many clips.
+
+The multi-clip command passes every clip as its own ``-i`` input into a
+single ``filter_complex``, so FFmpeg opens one demuxer and decoder (with
+its frame pool) per clip for the whole render. Memory and file handles grow
+with clip count, and timelines with hundreds of clips exhaust RAM or the
+descriptor limit.
+
+When a timeline has more clips than ``STOAT_RENDER_MAX_CLIPS_PER_PASS``,
+the worker instead:
+
+1. groups the clips into windows with `group_clip_windows`, never splitting
+   a clip from the clip its outgoing transition blends into;
+2. renders each window, one at a time, with the normal multi-clip command
+   into a Matroska mezzanine using the job's video codec and quality and
+   PCM audio, so at most one window's decoders are open at once;
+3. joins the mezzanines with the concat demuxer (`build_concat_command`),
+   stream-copying video and encoding the PCM audio once with the output
+   container's default audio codec.
+
+Because every window is encoded with identical video settings, the final
+pass does not re-encode video.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from stoat_ferret.db.models import Clip
+
+# Audio codec for mezzanines (lossless; encoded once in the concat pass).
+MEZZANINE_AUDIO_CODEC = "pcm_s16le"
+
+# Container for mezzanines (accepts every video codec the renderer emits).
+MEZZANINE_SUFFIX = ".mkv"
+
+
+@dataclass(frozen=True)
+class HierarchicalRenderCommands:
+    """FFmpeg invocations and files for a hierarchical render.
+
+    Attributes:
+        window_commands: One multi-clip command per window, in timeline order.
+        window_durations: Output seconds of each window, for weighting progress.
+        concat: Command joining the mezzanines into the job output.
+        concat_list: Contents of the concat demuxer list file.
+        concat_list_path: Where ``concat_list`` must be written.
+        mezzanine_paths: Mezzanine files, in timeline order.
+    """
+
+    window_commands: list[list[str]]
+    window_durations: tuple[float, ...]
+    concat: list[str]
+    concat_list: str
+    concat_list_path: Path
+    mezzanine_paths: tuple[Path, ...]
+
+
+def group_clip_windows(
+    clips: Sequence[Clip],
+    transitions: Sequence[dict[str, Any]],
+    max_clips: int,
+) -> list[list[Clip]]:
+    """Group timeline clips into render windows of about ``max_clips`` clips.
+
+    A window only ends after a clip with no outgoing transition, so a chain
+    of transitions can make a window longer than ``max_clips``. A trailing
+    single clip joins the previous window so every window is a multi-clip
+    render.
+
+    Args:
+        clips: Timeline clips in render order.
+        transitions: ``settings.transitions`` entries (keyed by ``clip_a_id``).
+        max_clips: Target clips per window (at least 2).
+
+    Returns:
+        Windows in timeline order covering every clip exactly once.
+    """
+    linked = {t["clip_a_id"] for t in transitions}
+    windows: list[list[Clip]] = []
+    current: list[Clip] = []
+    for clip in clips:
+        current.append(clip)
+        if len(current) >= max_clips and clip.id not in linked:
+            windows.append(current)
+            current = []
+    if len(current) == 1 and windows:
+        windows[-1].extend(current)
+    elif current:
+        windows.append(current)
+    return windows
+
+
+def format_concat_list(paths: Sequence[Path]) -> str:
+    """Return an ffconcat list naming ``paths`` relative to their directory."""
+    return "ffconcat version 1.0\n" + "".join(f"file '{path.name}'\n" for path in paths)
+
+
+def build_concat_command(
+    concat_list_path: Path,
+    output_path: str,
+    *,
+    ffmetadata_path: str | None = None,
+) -> list[str]:
+    """Build the command joining mezzanines into the job output.
+
+    Args:
+        concat_list_path: ffconcat list of mezzanines.
+        output_path: Final output file.
+        ffmetadata_path: Optional ffmetadata file for chapters/metadata.
+
+    Returns:
+        FFmpeg argv copying video and encoding audio once.
+    """
+    cmd = ["ffmpeg", "-f", "concat", "-safe", "0", "-i", str(concat_list_path)]
+    if ffmetadata_path:
+        cmd.extend(["-i", ffmetadata_path])
+    cmd.extend(["-map", "0:v", "-map", "0:a?", "-c:v", "copy", "-progress", "pipe:1"])
+    if ffmetadata_path:
+        cmd.extend(["-map_chapters", "1", "-map_metadata", "1"])
+    cmd.extend(["-y", output_path])
+    return cmd
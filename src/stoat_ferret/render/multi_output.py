@@ -0,0 +1,298 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Multi-output rendering: one decode, many deliverables.
+
+Deliveries often need the same timeline in several shapes (1080p H.264,
+720p, audio-only, a vertical crop). Rendering each as its own job repeats
+the decode and filter graph, which is most of the cost. A render plan can
+instead list extra deliverables in ``settings.outputs``, and
+`add_secondary_outputs` rewrites the primary FFmpeg command so a single
+process produces all of them:
+
+- The primary command's final video and audio (filtergraph labels or input
+  streams) are fanned out with ``split``/``asplit``; a ``-vf`` chain is
+  first moved into ``-filter_complex`` so its output can be split too.
+- Each extra output gets its own branch (centre crop to ``crop_aspect``,
+  then scale), its own ``-map`` flags and encoder options, and the
+  primary's output-side trimming (``-ss``/``-t``), frame rate and chapter
+  and metadata mapping.
+- Soft subtitle streams stay on the primary output.
+- ``hls`` and ``dash`` outputs are adaptive bitrate ladders; their branch is
+  handed to render/abr.py, which splits it once more per rendition.
+
+The tee muxer is not used: it only duplicates one encoded stream into
+several containers, and the deliverables here differ in size or codec.
+All outputs are fed by the same filter graph, so they advance together and
+the job's progress applies to each of them.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from stoat_ferret.api.schemas.render import RenderOutputSpec, RenderPlanSettings
+from stoat_ferret.render.abr import MANIFEST_FILENAMES, ladder_dir, ladder_output
+from stoat_ferret.render.tuning import PRESET_ENCODERS
+
+# Video encoder used when an output does not name one
+_DEFAULT_CODEC: dict[str, str] = {"webm": "libvpx-vp9"}
+
+# Output options that take no value
+_FLAGS_WITHOUT_VALUE = frozenset({"-an", "-vn", "-sn", "-dn", "-shortest"})
+
+# Primary output options every extra output repeats (audio-only outputs skip -r)
+_SHARED_OPTIONS = ("-ss", "-t", "-r", "-map_chapters", "-map_metadata")
+
+_LABEL_SOURCE = "[mo_src]"
+
+
+def plan_outputs(render_plan_json: str) -> list[RenderOutputSpec]:
+    """Return the extra deliverables declared in a render plan.
+
+    Args:
+        render_plan_json: Serialized render plan.
+
+    Returns:
+        The plan's ``settings.outputs`` (empty for malformed plans, which
+        the command builder reports).
+    """
+    try:
+        settings = json.loads(render_plan_json).get("settings") or {}
+        return RenderPlanSettings.model_validate(settings).outputs
+    except (json.JSONDecodeError, AttributeError, TypeError, ValidationError):
+        return []
+
+
+def assign_output_paths(
+    outputs: list[RenderOutputSpec], primary_path: str
+) -> list[RenderOutputSpec]:
+    """Place each extra output next to the primary output.
+
+    ``<dir>/<stem>.mp4`` gets ``<dir>/<stem>_<name>.<format>`` siblings;
+    ladders get their manifest in a ``<dir>/<stem>_<name>/`` directory.
+
+    Args:
+        outputs: Extra deliverables.
+        primary_path: Path of the primary output.
+
+    Returns:
+        Copies of ``outputs`` with ``output_path`` set.
+    """
+    primary = Path(primary_path)
+    return [
+        spec.model_copy(
+            update={
+                "output_path": str(
+                    ladder_dir(primary_path, spec.name) / MANIFEST_FILENAMES[spec.output_format]
+                    if spec.is_ladder
+                    else primary.with_name(f"{primary.stem}_{spec.name}.{spec.output_format}")
+                )
+            }
+        )
+        for spec in outputs
+    ]
+
+
+def _parse_output_options(options: list[str]) -> list[tuple[str, str | None]]:
+    pairs: list[tuple[str, str | None]] = []
+    i = 0
+    while i < len(options):
+        flag = options[i]
+        if flag in _FLAGS_WITHOUT_VALUE or i + 1 >= len(options):
+            pairs.append((flag, None))
+            i += 1
+        else:
+            pairs.append((flag, options[i + 1]))
+            i += 2
+    return pairs
+
+
+def _take(pairs: list[tuple[str, str | None]], flag: str) -> str | None:
+    for i, (name, value) in enumerate(pairs):
+        if name == flag:
+            del pairs[i]
+            return value
+    return None
+
+
+def _is_label(spec: str) -> bool:
+    return spec.startswith("[")
+
+
+def _is_subtitle_map(spec: str | None) -> bool:
+    return spec is not None and spec.rstrip("?").endswith(":s")
+
+
+def _video_filters(spec: RenderOutputSpec) -> list[str]:
+    filters: list[str] = []
+    if spec.crop_aspect:
+        num, den = spec.crop_aspect.split(":")
+        filters.append(
+            f"crop=w=trunc(min(iw\\,ih*{num}/{den})/2)*2:h=trunc(min(ih\\,iw*{den}/{num})/2)*2"
+        )
+    if spec.width or spec.height:
+        filters.append(f"scale={spec.width or -2}:{spec.height or -2}")
+    return filters
+
+
+def add_secondary_outputs(
+    command: list[str],
+    outputs: list[RenderOutputSpec],
+    *,
+    quality_crf: Mapping[str, str],
+    settings: Mapping[str, Any],
+) -> list[str]:
+    """Extend a single-output render command with extra outputs.
+
+    Args:
+        command: Primary FFmpeg command (output path last).
+        outputs: Extra deliverables with ``output_path`` assigned.
+        quality_crf: CRF per public quality preset, for x264/x265 outputs.
+        settings: Render plan settings (fallback quality and encoder preset).
+
+    Returns:
+        A command writing the primary output followed by every extra output.
+
+    Raises:
+        ValueError: If an output has no path, or an audio-only output is
+            requested from a render without audio.
+    """
+    if not outputs:
+        return command
+    last_input = max((i for i, arg in enumerate(command[:-1]) if arg == "-i"), default=-1)
+    if last_input < 0:
+        raise ValueError("render command has no inputs")
+    head = command[: last_input + 2]
+    pairs = _parse_output_options(command[last_input + 2 : -1])
+    primary_path = command[-1]
+
+    graph = _take(pairs, "-filter_complex")
+    segments: list[str] = [graph] if graph else []
+    vf = _take(pairs, "-vf")
+    av_maps = [i for i, (f, v) in enumerate(pairs) if f == "-map" and not _is_subtitle_map(v)]
+    silent = any(f == "-an" for f, _ in pairs)
+    if vf is not None:
+        segments.append(f"[0:v]{vf}{_LABEL_SOURCE}")
+        if av_maps:
+            pairs[av_maps[0]] = ("-map", _LABEL_SOURCE)
+        else:
+            pairs[:0] = [("-map", _LABEL_SOURCE)] + ([] if silent else [("-map", "0:a?")])
+    elif not av_maps:
+        pairs[:0] = [("-map", "0:v")] + ([] if silent else [("-map", "0:a?")])
+    av_maps = [i for i, (f, v) in enumerate(pairs) if f == "-map" and not _is_subtitle_map(v)]
+    video_src = pairs[av_maps[0]][1] or "0:v"
+    audio_src = pairs[av_maps[1]][1] if len(av_maps) > 1 and not silent else None
+
+    for spec in outputs:
+        if spec.output_path is None:
+            raise ValueError(f"render output '{spec.name}' has no output path")
+        if spec.audio_only and audio_src is None:
+            raise ValueError(f"render output '{spec.name}' is audio-only but the render is silent")
+
+    video_users = [spec for spec in outputs if not spec.audio_only]
+    audio_users = outputs if audio_src is not None else []
+    video_branches = _fan_out(segments, pairs, av_maps[0], video_src, len(video_users), "v")
+    audio_branches = (
+        _fan_out(segments, pairs, av_maps[1], audio_src, len(audio_users), "a")
+        if audio_src is not None
+        else []
+    )
+    shared = [(f, v) for f, v in pairs if f in _SHARED_OPTIONS and v is not None]
+
+    extra: list[str] = []
+    video_for = dict(zip((s.name for s in video_users), video_branches, strict=True))
+    audio_for = dict(zip((s.name for s in audio_users), audio_branches, strict=True))
+    for index, spec in enumerate(outputs):
+        if spec.is_ladder:
+            ladder_segments, options = ladder_output(
+                spec,
+                video=video_for[spec.name],
+                audio=audio_for.get(spec.name),
+                index=index,
+                shared=shared,
+                settings=settings,
+            )
+            segments.extend(ladder_segments)
+            extra.extend(options)
+            continue
+        if spec.name in video_for:
+            source = video_for[spec.name]
+            filters = _video_filters(spec)
+            if filters:
+                label = f"[mo_out{index}]"
+                segments.append(f"{_pad(source)}{','.join(filters)}{label}")
+                source = label
+            extra.extend(["-map", source])
+            extra.extend(_encoder_options(spec, quality_crf, settings))
+        if spec.name in audio_for:
+            extra.extend(["-map", audio_for[spec.name]])
+        elif not spec.audio_only:
+            extra.append("-an")
+        for flag, value in shared:
+            if not (spec.audio_only and flag == "-r"):
+                extra.extend([flag, value])
+        extra.append(str(spec.output_path))
+
+    rebuilt = list(head)
+    if segments:
+        rebuilt.extend(["-filter_complex", ";".join(segments)])
+    for option, argument in pairs:
+        rebuilt.append(option)
+        if argument is not None:
+            rebuilt.append(argument)
+    rebuilt.append(primary_path)
+    return rebuilt + extra
+
+
+def _pad(source: str) -> str:
+    return source if _is_label(source) else f"[{source.rstrip('?')}]"
+
+
+def _fan_out(
+    segments: list[str],
+    pairs: list[tuple[str, str | None]],
+    map_index: int,
+    source: str,
+    count: int,
+    kind: str,
+) -> list[str]:
+    """Split ``source`` into ``count`` branches for extra outputs.
+
+    A filtergraph label can only be consumed once, so it is split into one
+    more branch than needed and the primary's ``-map`` moves to branch 0.
+    Input streams can be mapped by every output directly; video streams
+    still go through ``split`` so crop and scale branches share one copy.
+    """
+    if count == 0:
+        return []
+    if _is_label(source):
+        labels = [f"[mo_{kind}{i}]" for i in range(count + 1)]
+        split = "split" if kind == "v" else "asplit"
+        segments.append(f"{source}{split}={count + 1}{''.join(labels)}")
+        pairs[map_index] = ("-map", labels[0])
+        return labels[1:]
+    if kind == "a":
+        return [source] * count
+    labels = [f"[mo_{kind}{i}]" for i in range(1, count + 1)]
+    segments.append(f"{_pad(source)}split={count}{''.join(labels)}")
+    return labels
+
+
+def _encoder_options(
+    spec: RenderOutputSpec, quality_crf: Mapping[str, str], settings: Mapping[str, Any]
+) -> list[str]:
+    codec = spec.codec or _DEFAULT_CODEC.get(spec.output_format, "libx264")
+    options = ["-c:v", codec]
+    quality = spec.quality_preset or str(settings.get("quality_preset", "standard"))
+    if codec in ("libx264", "libx265") and quality in quality_crf:
+        options.extend(["-crf", quality_crf[quality]])
+    preset = spec.encoder_preset or settings.get("encoder_preset")
+    if codec in PRESET_ENCODERS and preset:
+        options.extend(["-preset", str(preset)])
+    return options
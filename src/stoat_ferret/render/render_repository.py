@@ -10,6 +10,8 @@ established repository triple pattern used by other domain entities.
 from __future__ import annotations
 
 import copy
+import dataclasses
+from collections.abc import Callable
 from datetime import datetime, timezone
 from typing import Protocol, runtime_checkable
 
@@ -26,6 +28,9 @@ from stoat_ferret.render.models import (
 
 logger = structlog.get_logger(__name__)
 
+RenderJobListener = Callable[[str, RenderJob | None], None]
+"""Change callback: ``(job_id, job_after_change)``; ``None`` means deleted."""
+
 
 @runtime_checkable
 class AsyncRenderRepository(Protocol):
@@ -178,7 +183,35 @@ class AsyncRenderRepository(Protocol):
         ...
 
 
-class AsyncSQLiteRenderRepository:
+class _RenderJobNotifier:
+    """Change-listener registry shared by the concrete repositories.
+
+    Listeners are called synchronously after every committed create,
+    status/progress update and delete, so in-process views (the system
+    state tracker) can follow render jobs without re-querying the store.
+    """
+
+    def __init__(self) -> None:
+        self._listeners: list[RenderJobListener] = []
+
+    def add_listener(self, listener: RenderJobListener) -> None:
+        """Register a callback for render job changes."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: RenderJobListener) -> None:
+        """Unregister a callback; a no-op when it is not registered."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, job_id: str, job: RenderJob | None) -> None:
+        for listener in self._listeners:
+            try:
+                listener(job_id, job)
+            except Exception:
+                logger.warning("render_repository.listener_failed", job_id=job_id, exc_info=True)
+
+
+class AsyncSQLiteRenderRepository(_RenderJobNotifier):
     """Async SQLite implementation of the render repository."""
 
     def __init__(self, conn: aiosqlite.Connection) -> None:
@@ -187,6 +220,7 @@ class AsyncSQLiteRenderRepository:
         Args:
             conn: Async SQLite database connection.
         """
+        super().__init__()
         self._conn = conn
         self._conn.row_factory = aiosqlite.Row
 
@@ -218,6 +252,7 @@ class AsyncSQLiteRenderRepository:
             ),
         )
         await self._conn.commit()
+        self._notify(job.id, job)
         return job
 
     async def get(self, job_id: str) -> RenderJob | None:
@@ -341,9 +376,26 @@ class AsyncSQLiteRenderRepository:
             ),
         )
         await self._conn.commit()
+        self._notify(
+            job_id,
+            dataclasses.replace(
+                current,
+                status=status,
+                error_message=error_message,
+                progress=progress,
+                retry_count=retry_count,
+                updated_at=now,
+                completed_at=completed_at,
+            ),
+        )
 
     async def update_progress(self, job_id: str, progress: float) -> None:
-        """Update the progress of a render job."""
+        """Update the progress of a render job.
+
+        The write only applies while the job still has the status that was
+        read, so a progress tick racing a cancel neither overwrites the
+        terminal row nor notifies listeners with the stale running snapshot.
+        """
         if not 0.0 <= progress <= 1.0:
             raise ValueError(f"Progress must be between 0.0 and 1.0, got {progress}")
 
@@ -352,11 +404,19 @@ class AsyncSQLiteRenderRepository:
             raise ValueError(f"Render job {job_id} not found")
 
         now = datetime.now(timezone.utc)
-        await self._conn.execute(
-            "UPDATE render_jobs SET progress = ?, updated_at = ? WHERE id = ?",
-            (progress, now.isoformat(), job_id),
+        cursor = await self._conn.execute(
+            "UPDATE render_jobs SET progress = ?, updated_at = ? WHERE id = ? AND status = ?",
+            (progress, now.isoformat(), job_id, current.status.value),
         )
         await self._conn.commit()
+        if cursor.rowcount != 1:
+            logger.debug(
+                "render_repository.stale_progress_ignored",
+                job_id=job_id,
+                expected_status=current.status.value,
+            )
+            return
+        self._notify(job_id, dataclasses.replace(current, progress=progress, updated_at=now))
 
     async def update_partial_signal(self, job_id: str, detected: bool) -> None:
         """Set the partial_file_detected flag for a cancelled job."""
@@ -398,7 +458,10 @@ class AsyncSQLiteRenderRepository:
             (job_id,),
         )
         await self._conn.commit()
-        return cursor.rowcount > 0
+        deleted = cursor.rowcount > 0
+        if deleted:
+            self._notify(job_id, None)
+        return deleted
 
     def _row_to_job(self, row: aiosqlite.Row) -> RenderJob:
         """Convert a database row to a RenderJob.
@@ -430,7 +493,7 @@ class AsyncSQLiteRenderRepository:
         )
 
 
-class InMemoryRenderRepository:
+class InMemoryRenderRepository(_RenderJobNotifier):
     """In-memory implementation for testing.
 
     Stores deepcopy-isolated objects so callers cannot mutate internal state.
@@ -438,11 +501,13 @@ class InMemoryRenderRepository:
 
     def __init__(self) -> None:
         """Initialize the repository with empty storage."""
+        super().__init__()
         self._jobs: dict[str, RenderJob] = {}
 
     async def create(self, job: RenderJob) -> RenderJob:
         """Persist a new render job in memory."""
         self._jobs[job.id] = copy.deepcopy(job)
+        self._notify(job.id, copy.deepcopy(job))
         return copy.deepcopy(job)
 
     async def get(self, job_id: str) -> RenderJob | None:
@@ -511,6 +576,7 @@ class InMemoryRenderRepository:
 
         job.status = status
         job.updated_at = now
+        self._notify(job_id, copy.deepcopy(job))
 
     async def update_progress(self, job_id: str, progress: float) -> None:
         """Update the progress of a render job."""
@@ -523,6 +589,7 @@ class InMemoryRenderRepository:
 
         job.progress = progress
         job.updated_at = datetime.now(timezone.utc)
+        self._notify(job_id, copy.deepcopy(job))
 
     async def update_partial_signal(self, job_id: str, detected: bool) -> None:
         """Set the partial_file_detected flag for a cancelled job."""
@@ -550,5 +617,6 @@ class InMemoryRenderRepository:
         """Delete a render job by ID."""
         if job_id in self._jobs:
             del self._jobs[job_id]
+            self._notify(job_id, None)
             return True
         return False
@@ -16,12 +16,16 @@ import json
 import shutil
 import time
 from contextlib import suppress
+from dataclasses import asdict, replace
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import structlog
 from PIL import Image
+from pydantic import ValidationError
 
+from stoat_ferret.api.schemas.render import RenderPlanSettings
 from stoat_ferret.api.settings import Settings
 from stoat_ferret.api.websocket.events import EventType, build_event, clear_event_counter
 from stoat_ferret.api.websocket.manager import ConnectionManager
@@ -32,14 +36,18 @@ if TYPE_CHECKING:
 from stoat_ferret.db.markers_repository import Marker
 from stoat_ferret.render.checkpoints import RenderCheckpointManager
 from stoat_ferret.render.executor import RenderExecutor
+from stoat_ferret.render.forecast import JobForecast, QueueForecaster, RunningJob
 from stoat_ferret.render.metrics import (
     render_disk_usage_bytes,
     render_duration_seconds,
     render_jobs_total,
 )
 from stoat_ferret.render.models import OutputFormat, QualityPreset, RenderJob, RenderStatus
+from stoat_ferret.render.multi_output import plan_outputs
 from stoat_ferret.render.queue import QueueFullError, RenderQueue
 from stoat_ferret.render.render_repository import AsyncRenderRepository
+from stoat_ferret.render.telemetry import RenderTelemetrySample, filter_cost
+from stoat_ferret.render.tuning import EncodeProfile, EncoderTuner, blend_eta, preset_in_effect
 
 try:
     from stoat_ferret_core import (
@@ -64,6 +72,53 @@ def _build_assertions_from_profile(profile: Any) -> dict[str, float | None]:
     }
 
 
+def _option_value(command: list[str], flag: str) -> str | None:
+    """Return the value of the last ``flag`` in an FFmpeg argv, or None."""
+    value: str | None = None
+    for i, arg in enumerate(command[:-1]):
+        if arg == flag:
+            value = command[i + 1]
+    return value
+
+
+def _telemetry_sample(
+    job: RenderJob,
+    command: list[str],
+    command_filter_cost: int,
+    total_duration_s: float,
+    render_elapsed: float,
+) -> RenderTelemetrySample | None:
+    """Build a telemetry sample for a finished encode, or None if it has no signal."""
+    encoder = _option_value(command, "-c:v")
+    if encoder in (None, "copy") or total_duration_s <= 0 or render_elapsed <= 0:
+        return None
+    try:
+        output_bytes = Path(job.output_path).stat().st_size
+        settings_data = json.loads(job.render_plan).get("settings", {})
+        profile = EncodeProfile.from_settings(settings_data)
+    except (OSError, json.JSONDecodeError, AttributeError, ValueError, TypeError):
+        return None
+    if output_bytes <= 0:
+        return None
+    return RenderTelemetrySample(
+        id=None,
+        job_id=job.id,
+        encoder=str(encoder),
+        preset=preset_in_effect(str(encoder), _option_value(command, "-preset")),
+        quality=profile.quality,
+        width=profile.width,
+        height=profile.height,
+        fps=profile.fps,
+        filter_cost=command_filter_cost,
+        duration_s=total_duration_s,
+        elapsed_s=render_elapsed,
+        speed_ratio=total_duration_s / render_elapsed,
+        output_bytes=output_bytes,
+        bitrate_bps=output_bytes * 8 / total_duration_s,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
 def generate_ffmetadata(
     markers: list[Marker],
     metadata_title: str | None = None,
@@ -180,11 +235,15 @@ class RenderService:
         checkpoint_manager: Checkpoint manager for crash recovery.
         connection_manager: WebSocket connection manager for broadcasting.
         settings: Application settings.
+        tuner: Optional encoder tuner; records telemetry for completed renders
+            and uses it to pick presets, size the disk-space check, and
+            estimate ETAs.
     """
 
     # Throttle constants
     THROTTLE_INTERVAL: float = 0.5  # seconds between broadcasts
     THROTTLE_PROGRESS_DELTA: float = 0.05  # 5% progress delta
+    FORECAST_INTERVAL: float = 5.0  # seconds between progress-driven queue forecasts
 
     def __init__(
         self,
@@ -197,6 +256,7 @@ class RenderService:
         settings: Settings,
         qc_service: QCService | None = None,
         dp_repo: DeliveryProfileRepository | None = None,
+        tuner: EncoderTuner | None = None,
     ) -> None:
         self._repo = repository
         self._queue = queue
@@ -208,6 +268,11 @@ class RenderService:
         self._shutting_down = False
         self._qc_service = qc_service
         self._dp_repo = dp_repo
+        self._tuner = tuner
+        self._forecaster = QueueForecaster(tuner)
+        # Per-job monotonic start time, for queue forecasts and throughput learning
+        self._job_started: dict[str, float] = {}
+        self._last_forecast_broadcast = 0.0
         # Serializes concurrent noop-mode submissions to prevent state race (BL-388)
         self._submit_lock = asyncio.Lock()
         # In noop mode FFmpeg is irrelevant — always treat as available so
@@ -247,6 +312,38 @@ class RenderService:
         """
         return self._ffmpeg_available
 
+    @property
+    def executor(self) -> RenderExecutor:
+        """The executor that runs this service's FFmpeg commands."""
+        return self._executor
+
+    async def get_job(self, job_id: str) -> RenderJob | None:
+        """Return the current state of a job.
+
+        Args:
+            job_id: The render job ID.
+
+        Returns:
+            The job, or None if it does not exist.
+        """
+        return await self._repo.get(job_id)
+
+    async def update_job_status(
+        self,
+        job_id: str,
+        status: RenderStatus,
+        *,
+        error_message: str | None = None,
+    ) -> None:
+        """Set a job's status directly, bypassing retry handling.
+
+        Args:
+            job_id: The render job ID.
+            status: The new status.
+            error_message: Optional error message to record.
+        """
+        await self._repo.update_status(job_id, status, error_message=error_message)
+
     async def submit_job(
         self,
         *,
@@ -288,6 +385,9 @@ class RenderService:
         # Pre-flight: validate settings via Rust
         self._validate_settings(render_plan_json)
 
+        # Pick an encoder preset for deadline/size targets from telemetry
+        render_plan_json = self._plan_encoder_preset(render_plan_json)
+
         # Pre-flight: check disk space
         self._check_disk_space(output_path, render_plan_json, quality_preset)
 
@@ -345,7 +445,87 @@ class RenderService:
 
         return job
 
-    async def run_job(self, job: RenderJob, command: list[str]) -> None:
+    def note_job_started(self, job_id: str) -> None:
+        """Record that a dequeued job has started work.
+
+        Called by the worker before any pass of the job runs, so queue
+        forecasts and throughput learning cover the whole job rather than
+        only the final FFmpeg command.
+
+        Args:
+            job_id: The render job ID.
+        """
+        self._job_started[job_id] = time.monotonic()
+
+    async def forecast_queue(self) -> list[JobForecast]:
+        """Predict start and finish times for every running and queued job.
+
+        Returns:
+            Forecasts for running jobs, then queued jobs in dequeue order.
+        """
+        now = time.monotonic()
+        running = [
+            RunningJob(
+                job,
+                now - self._job_started[job.id] if job.id in self._job_started else None,
+            )
+            for job in await self._repo.list_by_status(RenderStatus.RUNNING)
+        ]
+        queued = await self._repo.list_by_status(RenderStatus.QUEUED)
+        return self._forecaster.forecast(running, queued, self._queue._max_concurrent)
+
+    async def run_pass(
+        self,
+        job: RenderJob,
+        command: list[str],
+        *,
+        duration_s: float = 0.0,
+        progress_range: tuple[float, float] = (0.0, 1.0),
+    ) -> bool:
+        """Run an intermediate FFmpeg pass of a staged render.
+
+        Unlike `run_job`, the job is neither completed nor failed: the caller
+        decides what a failed pass means. Progress of the pass is mapped onto
+        ``progress_range`` of the job's overall progress, persisted and
+        broadcast like `run_job` progress.
+
+        Args:
+            job: The render job the pass belongs to.
+            command: Full FFmpeg command arguments; progress needs
+                ``-progress pipe:1``.
+            duration_s: Output duration of the pass; 0 reports no progress.
+            progress_range: Job progress at the start and end of the pass.
+
+        Returns:
+            True if FFmpeg completed successfully.
+        """
+        self._job_started.setdefault(job.id, time.monotonic())
+        start, end = progress_range
+
+        async def progress_callback(
+            jid: str,
+            progress: float,
+            elapsed_seconds: float,
+            frame: int | None,
+            fps: float | None,
+        ) -> None:
+            overall = start + (end - start) * min(max(progress, 0.0), 1.0)
+            await self._repo.update_progress(jid, overall)
+            await self._broadcast_throttled_progress(jid, overall, frame_count=frame, fps=fps)
+            await self._broadcast_throttled_forecast()
+
+        self._executor._progress_callback = progress_callback
+        return await self._executor.execute(
+            job, command, total_duration_us=int(duration_s * 1_000_000)
+        )
+
+    async def run_job(
+        self,
+        job: RenderJob,
+        command: list[str],
+        *,
+        progress_range: tuple[float, float] = (0.0, 1.0),
+    ) -> None:
         """Execute a render job with progress tracking and retry logic.
 
         Dequeues the job, runs it via the executor with progress broadcasting,
@@ -354,9 +534,12 @@ class RenderService:
         Args:
             job: The render job to execute.
             command: Full FFmpeg command arguments.
+            progress_range: Job progress at the start and end of this command,
+                when earlier passes (see `run_pass`) covered the rest.
         """
         job_id = job.id
         log = logger.bind(job_id=job_id)
+        self._job_started.setdefault(job_id, time.monotonic())
 
         # Parse total duration for progress calculation
         total_duration_us = self._extract_duration_us(job.render_plan)
@@ -373,6 +556,11 @@ class RenderService:
         # Track milestones already logged to avoid duplicates
         logged_milestones: set[int] = set()
         total_duration_s = total_duration_us / 1_000_000 if total_duration_us > 0 else 0.0
+        command_filter_cost = filter_cost(command)
+        predicted_elapsed_s = self._predict_elapsed(
+            job.render_plan, command, command_filter_cost, total_duration_s
+        )
+        range_start, range_end = progress_range
 
         async def progress_callback(
             jid: str,
@@ -382,8 +570,16 @@ class RenderService:
             fps: float | None,
         ) -> None:
             eta_seconds, speed_ratio = self._log_progress_milestones(
-                log, logged_milestones, progress, elapsed_seconds, total_duration_s
+                log,
+                logged_milestones,
+                progress,
+                elapsed_seconds,
+                total_duration_s,
+                predicted_elapsed_s,
             )
+            # ETA and speed describe this command; the job's progress also
+            # counts any passes that ran before it.
+            progress = range_start + (range_end - range_start) * progress
 
             await self._repo.update_progress(jid, progress)
             await self._broadcast_throttled_progress(
@@ -397,6 +593,7 @@ class RenderService:
                 encoder_type=encoder_type,
             )
             await self._broadcast_throttled_frame(jid, progress)
+            await self._broadcast_throttled_forecast()
 
         # Wire progress callback into executor
         self._executor._progress_callback = progress_callback
@@ -411,6 +608,9 @@ class RenderService:
         await self._persist_evidence(job_id)
 
         if success:
+            await self._record_telemetry(
+                job, command, command_filter_cost, total_duration_s, render_elapsed
+            )
             await self._finalize_success(job, render_elapsed, log)
         else:
             if await self._finalize_failure(job, log):
@@ -429,6 +629,7 @@ class RenderService:
         progress: float,
         elapsed_seconds: float,
         total_duration_s: float,
+        predicted_elapsed_s: float | None = None,
     ) -> tuple[float | None, float | None]:
         """Log progress milestones and compute ETA/speed ratio.
 
@@ -438,6 +639,7 @@ class RenderService:
             progress: Current progress value 0.0-1.0.
             elapsed_seconds: Wall-clock seconds elapsed since render start.
             total_duration_s: Total render duration in seconds.
+            predicted_elapsed_s: Encode time predicted from telemetry, if any.
 
         Returns:
             Tuple of (eta_seconds, speed_ratio), either of which may be None.
@@ -453,7 +655,9 @@ class RenderService:
                 )
 
         eta_seconds: float | None = None
-        if _HAS_RUST_BINDINGS:
+        if predicted_elapsed_s is not None:
+            eta_seconds = blend_eta(elapsed_seconds, progress, predicted_elapsed_s)
+        elif _HAS_RUST_BINDINGS:
             eta_seconds = estimate_eta(elapsed_seconds, progress)
 
         speed_ratio: float | None = None
@@ -462,6 +666,76 @@ class RenderService:
 
         return eta_seconds, speed_ratio
 
+    def _predict_elapsed(
+        self,
+        render_plan_json: str,
+        command: list[str],
+        command_filter_cost: int,
+        total_duration_s: float,
+    ) -> float | None:
+        """Predict the encode time of ``command``.
+
+        Uses encoder telemetry when the tuner has some for the command's
+        encoder, otherwise the throughput of completed jobs with the same
+        encoder.
+
+        Args:
+            render_plan_json: Serialized RenderPlan JSON.
+            command: FFmpeg command about to run.
+            command_filter_cost: `filter_cost` of ``command``.
+            total_duration_s: Output duration in seconds.
+
+        Returns:
+            Predicted wall-clock seconds, or None without a usable prediction.
+        """
+        encoder = _option_value(command, "-c:v")
+        if total_duration_s <= 0 or encoder in (None, "copy"):
+            return None
+        if self._tuner is not None:
+            try:
+                settings_data = json.loads(render_plan_json).get("settings", {})
+                profile = EncodeProfile.from_settings(settings_data, command_filter_cost)
+            except (json.JSONDecodeError, AttributeError, ValueError, TypeError):
+                return None
+            profile = replace(profile, encoder=str(encoder))
+            prediction = self._tuner.predict(profile, _option_value(command, "-preset"))
+            if prediction is not None:
+                return prediction.elapsed_seconds(total_duration_s)
+        return self._forecaster.observed_seconds(render_plan_json)
+
+    async def _record_telemetry(
+        self,
+        job: RenderJob,
+        command: list[str],
+        command_filter_cost: int,
+        total_duration_s: float,
+        render_elapsed: float,
+    ) -> None:
+        """Record encoder speed and bitrate for a successful render.
+
+        Stream-copy commands (the concat pass of smart and hierarchical
+        renders) are skipped: they say nothing about encoder performance.
+        So are multi-output renders, whose speed is shared by several encoders.
+
+        Args:
+            job: The render job that succeeded.
+            command: FFmpeg command that ran.
+            command_filter_cost: `filter_cost` of ``command``.
+            total_duration_s: Output duration in seconds.
+            render_elapsed: Wall-clock render time in seconds.
+        """
+        if self._tuner is None or plan_outputs(job.render_plan):
+            return
+        sample = _telemetry_sample(
+            job, command, command_filter_cost, total_duration_s, render_elapsed
+        )
+        if sample is None:
+            return
+        try:
+            await self._tuner.record(sample)
+        except Exception:
+            logger.warning("render_service.telemetry_record_failed", job_id=job.id, exc_info=True)
+
     async def _persist_evidence(self, job_id: str) -> None:
         """Persist evidence collected by the executor for the given job.
 
@@ -478,14 +752,20 @@ class RenderService:
     async def _finalize_success(self, job: RenderJob, render_elapsed: float, log: Any) -> None:
         """Handle success-path finalization for a render job.
 
-        Verifies the output file exists and has non-zero size, then
-        either completes the job or triggers failure handling.
+        Verifies the output file, and every extra output of a multi-output
+        render, exists and has non-zero size, then either completes the job
+        or triggers failure handling.
 
         Args:
             job: The render job that succeeded.
             render_elapsed: Wall-clock render time in seconds.
             log: Bound structlog logger for the job.
         """
+        missing = [
+            spec.name
+            for spec in plan_outputs(job.render_plan)
+            if not self._output_file_ok(spec.output_path)
+        ]
         if not self._output_file_ok(job.output_path):
             log.error(
                 "render_worker.zero_byte_output",
@@ -495,6 +775,12 @@ class RenderService:
             await self._handle_failure(
                 job, "Output file missing or zero-byte after FFmpeg completion"
             )
+        elif missing:
+            log.error("render_worker.zero_byte_output", job_id=job.id, outputs=missing)
+            await self._handle_failure(
+                job,
+                "Output file missing or zero-byte after FFmpeg completion: " + ", ".join(missing),
+            )
         else:
             await self._complete_job(job, render_elapsed)
 
@@ -599,6 +885,10 @@ class RenderService:
         """
         await self._repo.update_status(job.id, RenderStatus.COMPLETED)
         render_jobs_total.labels(status="completed").inc()
+        started = self._job_started.get(job.id)
+        self._forecaster.observe(
+            job.render_plan, time.monotonic() - started if started is not None else elapsed_seconds
+        )
         if elapsed_seconds > 0:
             render_duration_seconds.observe(elapsed_seconds)
         self._update_disk_usage(job.output_path)
@@ -650,7 +940,8 @@ class RenderService:
         """Run optional QC and delivery-profile checks after job completion.
 
         No-ops when QC service is absent or no delivery profile is attached.
-        On QC failure, transitions the job to QC_FAILED.
+        Every output of a multi-output render is checked. On QC failure,
+        transitions the job to QC_FAILED.
 
         Args:
             job: The completed render job.
@@ -664,17 +955,34 @@ class RenderService:
             delivery_profile_id = None
         if not delivery_profile_id:
             return
+        # Primary output first, then each extra output (failures prefixed by name)
+        artifacts: list[tuple[str | None, str]] = [(None, job.output_path)]
+        artifacts.extend(
+            (spec.name, spec.output_path)
+            for spec in plan_outputs(job.render_plan)
+            if spec.output_path is not None
+        )
         try:
             assertions = await self._load_delivery_profile_assertions(delivery_profile_id)
-            qc_report = await self._qc_service.run_checks(
-                artifact_path=job.output_path,
-                job_id=job.id,
-                delivery_profile_id=delivery_profile_id,
-                assertions=assertions,
-            )
-            if qc_report.overall_verdict != "pass":
+            failed_ids: list[str] = []
+            qc_failed = False
+            for name, artifact_path in artifacts:
+                qc_report = await self._qc_service.run_checks(
+                    artifact_path=artifact_path,
+                    job_id=job.id,
+                    delivery_profile_id=delivery_profile_id,
+                    assertions=assertions,
+                )
+                if qc_report.overall_verdict == "pass":
+                    continue
+                qc_failed = True
                 checks_dict = json.loads(qc_report.checks)
-                failed_ids = [cid for cid, c in checks_dict.items() if c.get("pass") is False]
+                failed_ids.extend(
+                    cid if name is None else f"{name}:{cid}"
+                    for cid, c in checks_dict.items()
+                    if c.get("pass") is False
+                )
+            if qc_failed:
                 error_message = (
                     "QC failed: " + ", ".join(failed_ids)
                     if failed_ids
@@ -709,6 +1017,7 @@ class RenderService:
             # Transition: running -> failed -> queued (retry)
             await self._repo.update_status(job.id, RenderStatus.FAILED, error_message=error_message)
             await self._repo.update_status(job.id, RenderStatus.QUEUED)
+            self._job_started.pop(job.id, None)
             log.info(
                 "render_service.job_retrying",
                 retry_count=current.retry_count + 1,
@@ -957,9 +1266,15 @@ class RenderService:
         return self._frame_buffer.get(job_id)
 
     async def _broadcast_queue_status(self) -> None:
-        """Broadcast render.queue_status event with current queue snapshot."""
+        """Broadcast render.queue_status event with current queue snapshot.
+
+        The payload carries a start/finish forecast for every running and
+        queued job.
+        """
         active_count = await self._queue.get_active_count()
         pending_count = await self._queue.get_queue_depth()
+        forecast = await self.forecast_queue()
+        self._last_forecast_broadcast = time.monotonic()
 
         await self._ws.broadcast(
             build_event(
@@ -969,12 +1284,23 @@ class RenderService:
                     "pending_count": pending_count,
                     "max_concurrent": self._queue._max_concurrent,
                     "max_queue_depth": self._queue._max_depth,
+                    "forecast": [asdict(f) for f in forecast],
                 },
             )
         )
 
+    async def _broadcast_throttled_forecast(self) -> None:
+        """Re-broadcast queue status at most every FORECAST_INTERVAL seconds.
+
+        Called from progress updates so queued jobs' start and finish
+        estimates follow the running jobs' actual progress.
+        """
+        if time.monotonic() - self._last_forecast_broadcast < self.FORECAST_INTERVAL:
+            return
+        await self._broadcast_queue_status()
+
     def _clear_throttle_state(self, job_id: str) -> None:
-        """Remove throttle state and frame buffer for a completed/failed/cancelled job.
+        """Remove per-job throttle, frame and timing state for a finished job.
 
         Args:
             job_id: The render job ID to clean up.
@@ -984,6 +1310,7 @@ class RenderService:
             del self._last_broadcast_time[k]
         self._last_broadcast_progress.pop(job_id, None)
         self._frame_buffer.pop(job_id, None)
+        self._job_started.pop(job_id, None)
         clear_event_counter(job_id)
 
     def _update_disk_usage(self, output_path: str) -> None:
@@ -1031,6 +1358,86 @@ class RenderService:
         except (ValueError, TypeError) as exc:
             raise PreflightError(f"Invalid render settings: {exc}") from exc
 
+    def _estimate_output_bytes(
+        self,
+        settings_data: dict[str, Any],
+        duration: float,
+        quality_preset: QualityPreset,
+    ) -> int | None:
+        """Estimate output size from telemetry, falling back to the Rust constants.
+
+        Args:
+            settings_data: Render plan settings.
+            duration: Output duration in seconds.
+            quality_preset: Quality preset for the Rust estimate.
+
+        Returns:
+            Estimated bytes, or None when no estimate is available.
+        """
+        if self._tuner is not None:
+            with suppress(ValueError, TypeError):
+                prediction = self._tuner.predict(
+                    EncodeProfile.from_settings(settings_data),
+                    settings_data.get("encoder_preset"),
+                )
+                if prediction is not None:
+                    return prediction.output_bytes(duration)
+        if not _HAS_RUST_BINDINGS:
+            return None
+        codec = settings_data.get("codec", "libx264")
+        return int(estimate_output_size(duration, codec, quality_preset.value))
+
+    def _plan_encoder_preset(self, render_plan_json: str) -> str:
+        """Choose ``settings.encoder_preset`` for renders with a deadline or size target.
+
+        Leaves the plan unchanged when no tuner is configured, the plan sets
+        its own preset or no target, or telemetry cannot meet the targets.
+
+        Args:
+            render_plan_json: Serialized RenderPlan JSON.
+
+        Returns:
+            The plan JSON, with ``encoder_preset`` added when one was chosen.
+
+        Raises:
+            PreflightError: If a deadline or size target is invalid.
+        """
+        if self._tuner is None:
+            return render_plan_json
+        try:
+            plan_data = json.loads(render_plan_json)
+        except json.JSONDecodeError:
+            return render_plan_json
+        settings_data = plan_data.get("settings")
+        if not isinstance(settings_data, dict) or settings_data.get("encoder_preset"):
+            return render_plan_json
+        if "deadline_seconds" not in settings_data and "max_output_bytes" not in settings_data:
+            return render_plan_json
+        try:
+            plan_settings = RenderPlanSettings.model_validate(settings_data)
+        except ValidationError as exc:
+            raise PreflightError(f"Invalid render settings: {exc}") from exc
+        duration = plan_data.get("total_duration") or 0.0
+        if not isinstance(duration, (int, float)) or duration <= 0:
+            return render_plan_json
+
+        preset = self._tuner.choose_preset(
+            EncodeProfile.from_settings(settings_data),
+            float(duration),
+            deadline_s=plan_settings.deadline_seconds,
+            max_bytes=plan_settings.max_output_bytes,
+        )
+        if preset is None:
+            return render_plan_json
+        settings_data["encoder_preset"] = preset
+        logger.info(
+            "render_service.encoder_preset_planned",
+            encoder_preset=preset,
+            deadline_seconds=plan_settings.deadline_seconds,
+            max_output_bytes=plan_settings.max_output_bytes,
+        )
+        return json.dumps(plan_data)
+
     def _check_disk_space(
         self,
         output_path: str,
@@ -1039,8 +1446,10 @@ class RenderService:
     ) -> None:
         """Check that sufficient disk space is available.
 
-        Uses the Rust estimate_output_size() binding to estimate the output
-        file size, then checks against available disk space.
+        Estimates the output file size from render telemetry when the tuner
+        has samples for the encoder and quality, otherwise with the Rust
+        estimate_output_size() binding, then checks against available disk
+        space.
 
         Args:
             output_path: Output file path for rendered video.
@@ -1050,16 +1459,14 @@ class RenderService:
         Raises:
             PreflightError: If insufficient disk space.
         """
-        if not _HAS_RUST_BINDINGS:
-            return
-
         try:
             plan_data = json.loads(render_plan_json)
             duration = plan_data.get("total_duration", 0.0)
             settings_data = plan_data.get("settings", {})
-            codec = settings_data.get("codec", "libx264")
 
-            estimated_bytes = estimate_output_size(duration, codec, quality_preset.value)
+            estimated_bytes = self._estimate_output_bytes(settings_data, duration, quality_preset)
+            if estimated_bytes is None:
+                return
 
             output_dir = Path(output_path).parent
             if output_dir.exists():
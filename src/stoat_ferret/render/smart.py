@@ -0,0 +1,476 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Smart rendering: stream-copy untouched, GOP-aligned clip ranges.
+
+The regular command builders push every clip through the filter graph and
+a full re-encode. For cut-only edits of long recordings that is almost all
+wasted work. When a render plan sets ``settings.smart_render``,
+`plan_smart_render` splits the timeline into spans:
+
+- **copy** spans cover the keyframe-aligned interior of a clip with no
+  effects whose source codec, pixel format, dimensions and frame rate
+  already match the render settings;
+- **encode** spans cover the partial GOPs at each cut and whole clips with
+  (simple, non-windowed) video effects. They are encoded with the copied
+  source's profile, level and colour description so the spliced bitstream
+  decodes as one stream.
+
+`build_smart_commands` turns the spans into FFmpeg invocations: one
+prepare pass per span that writes it to its own MPEG-TS segment (copying
+video for copy spans, encoding the rest, and encoding all audio to AAC so
+segments are uniform), and one pass that joins the segments with the
+concat demuxer and stream-copies them into the output. Only the encode
+spans cost encoder time; the rest is I/O, so progress is weighted by the
+encoded seconds of each prepare pass.
+
+Timelines the planner cannot handle (transitions, image/generator clips,
+TTS or subtitle inputs, audio or windowed effects, non-x264/x265 output,
+clips that mix with and without audio, copy sources whose profile or level
+the encoder cannot reproduce or that disagree with each other) return None
+and render normally.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from stoat_ferret.api.schemas.render import RenderPlanSettings
+from stoat_ferret.db.async_repository import AsyncVideoRepository
+from stoat_ferret.db.models import Clip
+from stoat_ferret.effects.registry import EffectRegistry
+from stoat_ferret.ffmpeg.probe import KeyframeIndex, ffprobe_keyframes
+from stoat_ferret.render.hierarchical import format_concat_list
+
+logger = structlog.get_logger(__name__)
+
+# Output encoders whose bitstream can be spliced with stream-copied source
+# packets, mapped to the source codec_name they must match.
+COPYABLE_CODECS: dict[str, str] = {"libx264": "h264", "libx265": "hevc"}
+
+# Pixel format encode spans are produced in; copy spans must match it.
+SMART_PIX_FMT = "yuv420p"
+
+# Copy spans shorter than this are re-encoded instead (not worth a splice).
+MIN_COPY_SECONDS = 2.0
+
+# ffprobe profile names mapped to the encoder's ``-profile:v`` value. Other
+# profiles (10-bit, 4:2:2, ...) cannot be reproduced for a splice.
+_ENCODER_PROFILES: dict[str, dict[str, str]] = {
+    "libx264": {
+        "Constrained Baseline": "baseline",
+        "Baseline": "baseline",
+        "Main": "main",
+        "High": "high",
+    },
+    "libx265": {"Main": "main"},
+}
+
+# Frame-rate mismatch tolerated when deciding a clip is passthrough.
+_FPS_TOLERANCE = 0.01
+
+# Gaps smaller than this between a cut and a keyframe are treated as aligned.
+_ALIGN_EPSILON_S = 1e-3
+
+KeyframeProbe = Callable[[str, float, float], Awaitable[KeyframeIndex]]
+
+
+@dataclass(frozen=True)
+class StreamParams:
+    """Bitstream parameters encode spans must share with copied source packets.
+
+    Attributes:
+        profile: Codec profile as reported by ffprobe (e.g. ``High``).
+        level: Codec level as reported by ffprobe.
+        color_range: Colour range, or None if unspecified.
+        color_space: Matrix coefficients, or None if unspecified.
+        color_transfer: Transfer characteristics, or None if unspecified.
+        color_primaries: Colour primaries, or None if unspecified.
+    """
+
+    profile: str | None
+    level: int | None
+    color_range: str | None = None
+    color_space: str | None = None
+    color_transfer: str | None = None
+    color_primaries: str | None = None
+
+    @classmethod
+    def from_index(cls, index: KeyframeIndex) -> StreamParams:
+        """Take the stream parameters reported by a keyframe probe."""
+        return cls(
+            profile=index.profile,
+            level=index.level,
+            color_range=index.color_range,
+            color_space=index.color_space,
+            color_transfer=index.color_transfer,
+            color_primaries=index.color_primaries,
+        )
+
+
+def encoder_args(codec: str, params: StreamParams) -> tuple[str, ...] | None:
+    """Encoder options reproducing ``params``, or None if ``codec`` cannot.
+
+    Args:
+        codec: Output encoder (a key of `COPYABLE_CODECS`).
+        params: Parameters of the copied source stream.
+
+    Returns:
+        ``-profile:v``, level and colour options for encode spans, or None
+        when the profile or level is unknown or not reproducible.
+    """
+    profile = _ENCODER_PROFILES.get(codec, {}).get(params.profile or "")
+    if profile is None or params.level is None:
+        return None
+    args = ["-profile:v", profile]
+    if codec == "libx264":
+        level = "1b" if params.level == 9 else f"{params.level // 10}.{params.level % 10}"
+        args.extend(["-level", level])
+    else:
+        # libx265 has no -level option; HEVC levels are reported as 30 x level.
+        args.extend(["-x265-params", f"level-idc={params.level / 30:g}"])
+    for flag, value in (
+        ("-color_range", params.color_range),
+        ("-colorspace", params.color_space),
+        ("-color_trc", params.color_transfer),
+        ("-color_primaries", params.color_primaries),
+    ):
+        if value is not None:
+            args.extend([flag, value])
+    return tuple(args)
+
+
+@dataclass(frozen=True)
+class SmartSpan:
+    """A contiguous source range rendered as one segment.
+
+    Attributes:
+        source_path: Source media file.
+        start_s: Start time in the source, in seconds.
+        end_s: End time in the source, in seconds.
+        copy: True to stream-copy video, False to re-encode it.
+        video_filters: Effect filter chains applied when re-encoding.
+    """
+
+    source_path: str
+    start_s: float
+    end_s: float
+    copy: bool
+    video_filters: tuple[str, ...] = ()
+
+    @property
+    def duration_s(self) -> float:
+        """Span length in seconds."""
+        return self.end_s - self.start_s
+
+
+@dataclass(frozen=True)
+class SmartRenderPlan:
+    """Ordered spans for a smart render and how much of it is copied.
+
+    Attributes:
+        spans: Spans in timeline order.
+        has_audio: Whether the sources carry audio (all or none do).
+        encode_args: Encoder options matching encode spans to the copied
+            stream (see `encoder_args`).
+    """
+
+    spans: tuple[SmartSpan, ...]
+    has_audio: bool
+    encode_args: tuple[str, ...] = ()
+
+    @property
+    def copied_seconds(self) -> float:
+        """Timeline seconds that are stream-copied."""
+        return sum(span.duration_s for span in self.spans if span.copy)
+
+    @property
+    def encoded_seconds(self) -> float:
+        """Timeline seconds that are re-encoded."""
+        return sum(span.duration_s for span in self.spans if not span.copy)
+
+
+@dataclass(frozen=True)
+class SmartRenderCommands:
+    """FFmpeg invocations and files for executing a `SmartRenderPlan`.
+
+    Attributes:
+        prepare: One command per span, writing it to its segment file.
+        encode_seconds: Re-encoded seconds of each prepare command (0 for
+            stream copies), for weighting progress.
+        concat: Command joining the segments into the job output.
+        concat_list: Contents of the concat demuxer list file.
+        concat_list_path: Where ``concat_list`` must be written.
+        segment_paths: Segment files, in timeline order.
+    """
+
+    prepare: tuple[list[str], ...]
+    encode_seconds: tuple[float, ...]
+    concat: list[str]
+    concat_list: str
+    concat_list_path: Path
+    segment_paths: tuple[Path, ...]
+
+
+def split_at_keyframes(
+    source_path: str,
+    start_s: float,
+    end_s: float,
+    keyframes: Sequence[float],
+    *,
+    min_copy_s: float = MIN_COPY_SECONDS,
+) -> list[SmartSpan]:
+    """Split an untouched clip range into encoded edges and a copied middle.
+
+    The copy span runs from the first keyframe at or after ``start_s`` to
+    the last keyframe at or before ``end_s``; the partial GOPs on either
+    side are re-encoded.
+
+    Args:
+        source_path: Source media file.
+        start_s: Clip in-point in seconds.
+        end_s: Clip out-point in seconds.
+        keyframes: Keyframe times of the source, ascending.
+        min_copy_s: Shortest copy span worth splicing.
+
+    Returns:
+        One to three spans covering ``[start_s, end_s)``.
+    """
+    inside = [k for k in keyframes if start_s - _ALIGN_EPSILON_S <= k <= end_s + _ALIGN_EPSILON_S]
+    if len(inside) < 2 or inside[-1] - inside[0] < min_copy_s:
+        return [SmartSpan(source_path, start_s, end_s, copy=False)]
+    first, last = max(inside[0], start_s), min(inside[-1], end_s)
+    spans: list[SmartSpan] = []
+    if first - start_s > _ALIGN_EPSILON_S:
+        spans.append(SmartSpan(source_path, start_s, first, copy=False))
+    spans.append(SmartSpan(source_path, first, last, copy=True))
+    if end_s - last > _ALIGN_EPSILON_S:
+        spans.append(SmartSpan(source_path, last, end_s, copy=False))
+    return spans
+
+
+def _clip_video_filters(
+    clip: Clip, effect_registry: EffectRegistry | None
+) -> tuple[str, ...] | None:
+    """Return the clip's video effect chains, or None if smart mode cannot apply them."""
+    filters: list[str] = []
+    for effect_data in clip.effects or []:
+        if effect_registry is None or effect_data.get("window"):
+            return None
+        defn = effect_registry.get(effect_data.get("effect_type", ""))
+        if (
+            defn is None
+            or defn.stream_kind == "a"
+            or defn.arity != 1
+            or defn.timebase_mutating
+            or not defn.chain_safe
+        ):
+            return None
+        filters.append(defn.build_fn(effect_data.get("parameters", {})))
+    return tuple(filters)
+
+
+def _unsupported_reason(
+    clips: Sequence[Clip],
+    settings: dict[str, Any],
+    render_settings: RenderPlanSettings,
+    has_tts: bool,
+) -> str | None:
+    if settings.get("codec", "libx264") not in COPYABLE_CODECS:
+        return "codec_not_copyable"
+    if has_tts or render_settings.soft_subtitles:
+        return "extra_inputs"
+    if settings.get("transitions") or settings.get("filter_graph"):
+        return "transitions_or_filter_graph"
+    if any(clip.clip_type != "file" for clip in clips):
+        return "non_file_clip"
+    return None
+
+
+async def plan_smart_render(
+    clips: Sequence[Clip],
+    settings: dict[str, Any],
+    render_settings: RenderPlanSettings,
+    *,
+    video_repository: AsyncVideoRepository,
+    effect_registry: EffectRegistry | None = None,
+    has_tts: bool = False,
+    windows: Sequence[tuple[float, float]] | None = None,
+    probe: KeyframeProbe = ffprobe_keyframes,
+    min_copy_s: float = MIN_COPY_SECONDS,
+) -> SmartRenderPlan | None:
+    """Plan a smart render, or return None to fall back to a full render.
+
+    Args:
+        clips: Timeline clips in render order.
+        settings: ``render_plan.settings`` (codec, fps, width, height, ...).
+        render_settings: Parsed render settings (``smart_render`` opt-in).
+        video_repository: Video repository for source lookups.
+        effect_registry: Registry resolving clip effects to filter strings.
+        has_tts: Whether TTS audio inputs will be mixed in.
+        windows: Optional per-clip ``(start_s, end_s)`` source ranges
+            overriding the clips' in/out points.
+        probe: Keyframe probe (injectable for tests).
+        min_copy_s: Shortest copy span worth splicing.
+
+    Returns:
+        The plan, or None when smart rendering is off, unsupported for this
+        timeline, or would copy nothing.
+    """
+    if not render_settings.smart_render:
+        return None
+    log = logger.bind(clip_count=len(clips))
+    reason = _unsupported_reason(clips, settings, render_settings, has_tts)
+    if reason is not None:
+        log.info("smart_render.fallback", reason=reason)
+        return None
+
+    codec: str = settings.get("codec", "libx264")
+    target_codec = COPYABLE_CODECS[codec]
+    fps = float(settings.get("fps", 30.0))
+    width = settings.get("width", 1920)
+    height = settings.get("height", 1080)
+
+    spans: list[SmartSpan] = []
+    audio: set[bool] = set()
+    copied_params: set[StreamParams] = set()
+    for i, clip in enumerate(clips):
+        video_filters = _clip_video_filters(clip, effect_registry)
+        if video_filters is None:
+            log.info("smart_render.fallback", reason="unsupported_effect", clip_id=clip.id)
+            return None
+        video = await video_repository.get(clip.source_video_id) if clip.source_video_id else None
+        if video is None or not video.path:
+            log.info("smart_render.fallback", reason="source_missing", clip_id=clip.id)
+            return None
+        audio.add(video.audio_codec is not None)
+        start_s, end_s = (
+            windows[i]
+            if windows
+            else (clip.in_point / video.frame_rate, clip.out_point / video.frame_rate)
+        )
+        passthrough = (
+            not video_filters
+            and video.video_codec == target_codec
+            and (video.width, video.height) == (width, height)
+            and abs(video.frame_rate - fps) < _FPS_TOLERANCE
+        )
+        if passthrough:
+            index = await probe(video.path, start_s, end_s)
+            if index.codec_name == target_codec and index.pix_fmt == SMART_PIX_FMT:
+                clip_spans = split_at_keyframes(
+                    video.path, start_s, end_s, index.keyframes, min_copy_s=min_copy_s
+                )
+                if any(span.copy for span in clip_spans):
+                    copied_params.add(StreamParams.from_index(index))
+                spans.extend(clip_spans)
+                continue
+        spans.append(SmartSpan(video.path, start_s, end_s, copy=False, video_filters=video_filters))
+
+    if len(audio) > 1:
+        log.info("smart_render.fallback", reason="mixed_audio")
+        return None
+    if not copied_params:
+        log.info("smart_render.fallback", reason="nothing_to_copy")
+        return None
+    if len(copied_params) > 1:
+        log.info("smart_render.fallback", reason="stream_params_mismatch")
+        return None
+    encode_args = encoder_args(codec, next(iter(copied_params)))
+    if encode_args is None:
+        log.info("smart_render.fallback", reason="stream_params_unmatched")
+        return None
+    plan = SmartRenderPlan(spans=tuple(spans), has_audio=audio == {True}, encode_args=encode_args)
+    log.info(
+        "smart_render.planned",
+        span_count=len(plan.spans),
+        copied_seconds=round(plan.copied_seconds, 3),
+        encoded_seconds=round(plan.encoded_seconds, 3),
+    )
+    return plan
+
+
+def _encode_filter(span: SmartSpan, width: int, height: int, fps: float) -> str:
+    """Video chain for an encode span, normalised to the copy spans' format."""
+    return ",".join(
+        [
+            *span.video_filters,
+            f"scale={width}:{height}",
+            "setsar=1",
+            f"fps={fps}",
+            f"format={SMART_PIX_FMT}",
+        ]
+    )
+
+
+def build_smart_commands(
+    plan: SmartRenderPlan,
+    settings: dict[str, Any],
+    *,
+    work_dir: Path,
+    output_path: str,
+    crf: str | None = None,
+    ffmetadata_path: str | None = None,
+) -> SmartRenderCommands:
+    """Build the prepare and concat FFmpeg commands for a plan.
+
+    Args:
+        plan: Spans to render.
+        settings: ``render_plan.settings`` (codec, fps, width, height,
+            audio_sample_rate).
+        work_dir: Directory for segment files and the concat list.
+        output_path: Final output file.
+        crf: CRF for encode spans, if the codec takes one.
+        ffmetadata_path: Optional ffmetadata file for chapters/metadata.
+
+    Returns:
+        The commands and file layout.
+    """
+    codec: str = settings.get("codec", "libx264")
+    fps = float(settings.get("fps", 30.0))
+    width = int(settings.get("width", 1920))
+    height = int(settings.get("height", 1080))
+    sample_rate = str(settings.get("audio_sample_rate", 48000))
+
+    segment_paths = tuple(work_dir / f"segment_{i:05d}.ts" for i in range(len(plan.spans)))
+    prepare: list[list[str]] = []
+    for span, segment in zip(plan.spans, segment_paths, strict=True):
+        command = ["ffmpeg", "-y", "-ss", str(span.start_s), "-t", str(span.duration_s)]
+        command.extend(["-i", span.source_path, "-map", "0:v:0"])
+        if plan.has_audio:
+            command.extend(["-map", "0:a:0", "-c:a", "aac", "-ar", sample_rate, "-ac", "2"])
+        if span.copy:
+            command.extend(["-c:v", "copy"])
+        else:
+            command.extend(["-vf", _encode_filter(span, width, height, fps), "-c:v", codec])
+            command.extend(plan.encode_args)
+            if crf is not None:
+                command.extend(["-crf", crf])
+        command.extend(["-progress", "pipe:1", "-f", "mpegts", str(segment)])
+        prepare.append(command)
+
+    concat_list_path = work_dir / "segments.ffconcat"
+    concat_list = format_concat_list(segment_paths)
+    concat: list[str] = ["ffmpeg", "-f", "concat", "-safe", "0", "-i", str(concat_list_path)]
+    if ffmetadata_path:
+        concat.extend(["-i", ffmetadata_path])
+    concat.extend(["-map", "0:v"])
+    if plan.has_audio:
+        concat.extend(["-map", "0:a"])
+    concat.extend(["-c", "copy", "-progress", "pipe:1"])
+    if ffmetadata_path:
+        concat.extend(["-map_chapters", "1", "-map_metadata", "1"])
+    concat.extend(["-y", output_path])
+    return SmartRenderCommands(
+        prepare=tuple(prepare),
+        encode_seconds=tuple(0.0 if span.copy else span.duration_s for span in plan.spans),
+        concat=concat,
+        concat_list=concat_list,
+        concat_list_path=concat_list_path,
+        segment_paths=segment_paths,
+    )
@@ -0,0 +1,200 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Render telemetry repository implementations.
+
+Provides Protocol, SQLite, and InMemory implementations following the
+established repository triple pattern. One row is written per successful
+encode, recording how fast the encoder ran and how large its output was so
+the preset planner (`stoat_ferret.render.tuning`) can predict both for new
+jobs.
+"""
+
+from __future__ import annotations
+
+import copy
+import re
+from dataclasses import dataclass, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Protocol, runtime_checkable
+
+import aiosqlite
+
+# Filter separators in a filtergraph (escaped commas belong to filter arguments)
+_FILTER_SEPARATOR = re.compile(r"(?<!\\)[;,]")
+
+_GRAPH_OPTIONS = frozenset({"-filter_complex", "-vf", "-af", "-filter:v", "-filter:a"})
+
+
+@dataclass
+class RenderTelemetrySample:
+    """Encoder performance observed for one completed render.
+
+    Attributes:
+        id: Database row ID (None before persistence).
+        job_id: Render job the sample came from.
+        encoder: Video encoder (e.g., "libx264").
+        preset: Encoder ``-preset`` in effect ("" when the encoder has none).
+        quality: Render plan ``quality_preset`` (selects the CRF).
+        width: Output width in pixels.
+        height: Output height in pixels.
+        fps: Output frame rate.
+        filter_cost: Inputs plus filter instances in the command (see `filter_cost`).
+        duration_s: Rendered media duration in seconds.
+        elapsed_s: Wall-clock encode time in seconds.
+        speed_ratio: ``duration_s / elapsed_s`` (above 1.0 is faster than real time).
+        output_bytes: Size of the output file.
+        bitrate_bps: Overall output bitrate in bits per second.
+        created_at: When the render finished.
+    """
+
+    id: int | None
+    job_id: str
+    encoder: str
+    preset: str
+    quality: str
+    width: int
+    height: int
+    fps: float
+    filter_cost: int
+    duration_s: float
+    elapsed_s: float
+    speed_ratio: float
+    output_bytes: int
+    bitrate_bps: float
+    created_at: datetime
+
+
+@runtime_checkable
+class AsyncRenderTelemetryRepository(Protocol):
+    """Protocol for async render telemetry persistence."""
+
+    async def add(self, sample: RenderTelemetrySample) -> RenderTelemetrySample:
+        """Insert a sample and return it with its ID populated."""
+        ...
+
+    async def list_recent(self, limit: int) -> list[RenderTelemetrySample]:
+        """Return up to ``limit`` samples, newest first."""
+        ...
+
+
+_COLUMNS = (
+    "job_id, encoder, preset, quality, width, height, fps, filter_cost, "
+    "duration_s, elapsed_s, speed_ratio, output_bytes, bitrate_bps, created_at"
+)
+
+
+class AsyncSQLiteRenderTelemetryRepository:
+    """Async SQLite implementation of the render telemetry repository."""
+
+    def __init__(self, conn: aiosqlite.Connection) -> None:
+        """Initialize the repository with an async database connection.
+
+        Args:
+            conn: Async SQLite database connection.
+        """
+        self._conn = conn
+
+    async def add(self, sample: RenderTelemetrySample) -> RenderTelemetrySample:
+        """Insert a sample into SQLite."""
+        cursor = await self._conn.execute(
+            f"INSERT INTO render_telemetry ({_COLUMNS}) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                sample.job_id,
+                sample.encoder,
+                sample.preset,
+                sample.quality,
+                sample.width,
+                sample.height,
+                sample.fps,
+                sample.filter_cost,
+                sample.duration_s,
+                sample.elapsed_s,
+                sample.speed_ratio,
+                sample.output_bytes,
+                sample.bitrate_bps,
+                sample.created_at.isoformat(),
+            ),
+        )
+        await self._conn.commit()
+        return replace(sample, id=cursor.lastrowid)
+
+    async def list_recent(self, limit: int) -> list[RenderTelemetrySample]:
+        """Return up to ``limit`` samples from SQLite, newest first."""
+        cursor = await self._conn.execute(
+            f"SELECT id, {_COLUMNS} FROM render_telemetry ORDER BY id DESC LIMIT ?",
+            (limit,),
+        )
+        rows = await cursor.fetchall()
+        return [
+            RenderTelemetrySample(
+                id=row[0],
+                job_id=row[1],
+                encoder=row[2],
+                preset=row[3],
+                quality=row[4],
+                width=row[5],
+                height=row[6],
+                fps=row[7],
+                filter_cost=row[8],
+                duration_s=row[9],
+                elapsed_s=row[10],
+                speed_ratio=row[11],
+                output_bytes=row[12],
+                bitrate_bps=row[13],
+                created_at=datetime.fromisoformat(row[14]),
+            )
+            for row in rows
+        ]
+
+
+class InMemoryRenderTelemetryRepository:
+    """In-memory implementation for testing.
+
+    Stores deepcopy-isolated objects so callers cannot mutate internal state.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the repository with empty storage."""
+        self._samples: list[RenderTelemetrySample] = []
+
+    async def add(self, sample: RenderTelemetrySample) -> RenderTelemetrySample:
+        """Insert a sample into memory."""
+        stored = replace(sample, id=len(self._samples) + 1)
+        self._samples.append(stored)
+        return copy.deepcopy(stored)
+
+    async def list_recent(self, limit: int) -> list[RenderTelemetrySample]:
+        """Return up to ``limit`` samples from memory, newest first."""
+        return [copy.deepcopy(s) for s in reversed(self._samples[-limit:])] if limit > 0 else []
+
+
+def filter_cost(command: list[str]) -> int:
+    """Estimate the decode and filtering work in an FFmpeg command.
+
+    Counts ``-i`` inputs plus filter instances in inline filtergraphs and in
+    ``-filter_complex_script`` files. A coarse proxy, but renders with more
+    inputs and filters reliably encode more slowly at the same resolution.
+
+    Args:
+        command: FFmpeg argv.
+
+    Returns:
+        Number of inputs plus filters.
+    """
+    cost = 0
+    for i, arg in enumerate(command[:-1]):
+        value = command[i + 1]
+        if arg == "-i":
+            cost += 1
+        elif arg in _GRAPH_OPTIONS:
+            cost += len(_FILTER_SEPARATOR.split(value))
+        elif arg == "-filter_complex_script":
+            try:
+                graph = Path(value).read_text(encoding="utf-8")
+            except OSError:
+                continue
+            cost += len(_FILTER_SEPARATOR.split(graph.strip()))
+    return cost
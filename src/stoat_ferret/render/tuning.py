@@ -0,0 +1,315 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Encoder preset planning from render telemetry.
+
+`EncoderTuner` keeps a window of recent `RenderTelemetrySample` rows in
+memory and predicts, for a new render, how fast each x264/x265 ``-preset``
+will encode and how large the output will be:
+
+- Samples are matched on encoder and quality (which fixes the CRF) and
+  normalised by output pixel rate, so a 720p sample informs a 1080p job.
+- Samples whose filter cost is close to the job's weigh more than others.
+- A preset with no samples of its own is extrapolated from the other
+  presets' samples using typical relative speed and size factors.
+
+Predictions drive three things: `EncoderTuner.choose_preset` picks an
+``encoder_preset`` for jobs with a deadline or size target, the render
+service sizes its disk-space pre-flight from `EncoderTuner.predict`, and
+`blend_eta` replaces pure linear extrapolation of progress with a blend of
+the predicted encode time and observed progress.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from stoat_ferret.render.telemetry import AsyncRenderTelemetryRepository, RenderTelemetrySample
+
+logger = structlog.get_logger(__name__)
+
+# x264/x265 presets, fastest first
+ENCODER_PRESETS = (
+    "ultrafast",
+    "superfast",
+    "veryfast",
+    "faster",
+    "fast",
+    "medium",
+    "slow",
+    "slower",
+    "veryslow",
+)
+
+# Encoders that accept -preset from ENCODER_PRESETS (medium when omitted)
+PRESET_ENCODERS = frozenset({"libx264", "libx265"})
+DEFAULT_PRESET = "medium"
+
+# Typical encode speed and output size at a fixed CRF relative to medium.
+# Only used to extrapolate to presets that have no telemetry yet.
+_PRESET_SPEED = {
+    "ultrafast": 8.0,
+    "superfast": 5.5,
+    "veryfast": 3.5,
+    "faster": 2.0,
+    "fast": 1.5,
+    "medium": 1.0,
+    "slow": 0.6,
+    "slower": 0.3,
+    "veryslow": 0.15,
+}
+_PRESET_SIZE = {
+    "ultrafast": 2.0,
+    "superfast": 1.45,
+    "veryfast": 1.1,
+    "faster": 1.05,
+    "fast": 1.02,
+    "medium": 1.0,
+    "slow": 0.97,
+    "slower": 0.95,
+    "veryslow": 0.93,
+}
+
+
+@dataclass(frozen=True)
+class EncodeProfile:
+    """The parts of a render that determine encoder speed and bitrate.
+
+    Attributes:
+        encoder: Video encoder (e.g., "libx264").
+        quality: Render plan ``quality_preset``.
+        width: Output width in pixels.
+        height: Output height in pixels.
+        fps: Output frame rate.
+        filter_cost: Inputs plus filters in the command, when known.
+    """
+
+    encoder: str
+    quality: str
+    width: int
+    height: int
+    fps: float
+    filter_cost: int | None = None
+
+    @classmethod
+    def from_settings(
+        cls, settings: dict[str, Any], filter_cost: int | None = None
+    ) -> EncodeProfile:
+        """Build a profile from render plan settings, using the worker's defaults."""
+        return cls(
+            encoder=str(settings.get("codec", "libx264")),
+            quality=str(settings.get("quality_preset", "standard")),
+            width=int(settings.get("width", 1920)),
+            height=int(settings.get("height", 1080)),
+            fps=float(settings.get("fps", 30.0)),
+            filter_cost=filter_cost,
+        )
+
+    @property
+    def pixel_rate(self) -> float:
+        """Output pixels per second of media."""
+        return max(1.0, self.width * self.height * self.fps)
+
+
+@dataclass(frozen=True)
+class EncodePrediction:
+    """Predicted encoder behaviour for one profile and preset.
+
+    Attributes:
+        speed_ratio: Media seconds encoded per wall-clock second.
+        bitrate_bps: Output bitrate in bits per second.
+        samples: Telemetry samples the prediction is based on.
+    """
+
+    speed_ratio: float
+    bitrate_bps: float
+    samples: int
+
+    def elapsed_seconds(self, duration_s: float) -> float:
+        """Predicted wall-clock time to encode ``duration_s`` of media."""
+        return duration_s / self.speed_ratio
+
+    def output_bytes(self, duration_s: float) -> int:
+        """Predicted output size for ``duration_s`` of media."""
+        return int(self.bitrate_bps * duration_s / 8)
+
+
+def preset_in_effect(encoder: str, preset: str | None) -> str:
+    """Return the preset an encoder actually runs with ("" if it has none)."""
+    if encoder not in PRESET_ENCODERS:
+        return ""
+    return preset or DEFAULT_PRESET
+
+
+class EncoderTuner:
+    """Predict encode speed and size from recent render telemetry.
+
+    Args:
+        repository: Telemetry persistence.
+        max_samples: Most recent samples kept for prediction.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncRenderTelemetryRepository,
+        *,
+        max_samples: int = 500,
+    ) -> None:
+        self._repo = repository
+        self._max_samples = max(1, max_samples)
+        self._samples: deque[RenderTelemetrySample] = deque(maxlen=self._max_samples)
+
+    async def load(self) -> None:
+        """Load the most recent samples from the repository."""
+        recent = await self._repo.list_recent(self._max_samples)
+        self._samples.clear()
+        self._samples.extend(reversed(recent))
+        logger.info("render_tuning.loaded", samples=len(self._samples))
+
+    async def record(self, sample: RenderTelemetrySample) -> None:
+        """Persist a sample and use it for future predictions.
+
+        Args:
+            sample: Telemetry from a completed render.
+        """
+        stored = await self._repo.add(sample)
+        self._samples.append(stored)
+
+    def predict(self, profile: EncodeProfile, preset: str | None = None) -> EncodePrediction | None:
+        """Predict speed and bitrate for ``profile`` encoded with ``preset``.
+
+        Args:
+            profile: The render to predict.
+            preset: Encoder preset; None means the encoder default.
+
+        Returns:
+            The prediction, or None without telemetry for the encoder and quality.
+        """
+        preset = preset_in_effect(profile.encoder, preset)
+        matching = [
+            s
+            for s in self._samples
+            if s.encoder == profile.encoder
+            and s.quality == profile.quality
+            and s.speed_ratio > 0
+            and s.bitrate_bps > 0
+        ]
+        exact = [s for s in matching if s.preset == preset]
+        if exact:
+            return _weighted_prediction(profile, ((s, 1.0, 1.0) for s in exact), len(exact))
+        if preset not in _PRESET_SPEED:
+            return None
+        scalable = [s for s in matching if s.preset in _PRESET_SPEED]
+        if not scalable:
+            return None
+        scaled = (
+            (
+                s,
+                _PRESET_SPEED[preset] / _PRESET_SPEED[s.preset],
+                _PRESET_SIZE[preset] / _PRESET_SIZE[s.preset],
+            )
+            for s in scalable
+        )
+        return _weighted_prediction(profile, scaled, len(scalable))
+
+    def choose_preset(
+        self,
+        profile: EncodeProfile,
+        duration_s: float,
+        *,
+        deadline_s: float | None = None,
+        max_bytes: int | None = None,
+    ) -> str | None:
+        """Pick an encoder preset meeting a deadline and/or output size target.
+
+        With a size target, returns the fastest preset predicted to meet
+        every target. With only a deadline, returns the slowest preset that
+        meets it: at a fixed CRF slower presets only make the file smaller.
+
+        Args:
+            profile: The render to plan.
+            duration_s: Media duration to encode.
+            deadline_s: Maximum wall-clock encode time.
+            max_bytes: Maximum output size.
+
+        Returns:
+            A preset name, or None when the encoder has no presets, no
+            targets are given, or no preset is predicted to meet them.
+        """
+        if profile.encoder not in PRESET_ENCODERS or (deadline_s is None and max_bytes is None):
+            return None
+        meeting: list[str] = []
+        for preset in ENCODER_PRESETS:
+            prediction = self.predict(profile, preset)
+            if prediction is None:
+                continue
+            if deadline_s is not None and prediction.elapsed_seconds(duration_s) > deadline_s:
+                continue
+            if max_bytes is not None and prediction.output_bytes(duration_s) > max_bytes:
+                continue
+            meeting.append(preset)
+        if not meeting:
+            logger.info(
+                "render_tuning.no_preset_meets_targets",
+                encoder=profile.encoder,
+                deadline_s=deadline_s,
+                max_bytes=max_bytes,
+            )
+            return None
+        return meeting[0] if max_bytes is not None else meeting[-1]
+
+
+def _weighted_prediction(
+    profile: EncodeProfile,
+    samples: Iterable[tuple[RenderTelemetrySample, float, float]],
+    count: int,
+) -> EncodePrediction:
+    """Average per-pixel throughput and bits in log space, weighted by filter cost."""
+    total_weight = log_throughput = log_bits_per_pixel = 0.0
+    for sample, speed_scale, size_scale in samples:
+        pixel_rate = max(1.0, sample.width * sample.height * sample.fps)
+        weight = 1.0
+        if profile.filter_cost is not None:
+            weight = 1.0 / (
+                1.0 + abs(math.log((profile.filter_cost + 1) / (sample.filter_cost + 1)))
+            )
+        total_weight += weight
+        log_throughput += weight * math.log(sample.speed_ratio * pixel_rate * speed_scale)
+        log_bits_per_pixel += weight * math.log(sample.bitrate_bps / pixel_rate * size_scale)
+    return EncodePrediction(
+        speed_ratio=math.exp(log_throughput / total_weight) / profile.pixel_rate,
+        bitrate_bps=math.exp(log_bits_per_pixel / total_weight) * profile.pixel_rate,
+        samples=count,
+    )
+
+
+def blend_eta(elapsed_s: float, progress: float, predicted_elapsed_s: float | None) -> float | None:
+    """Estimate remaining render time from progress and a predicted total.
+
+    Early in a render, progress-based extrapolation is noisy (startup and
+    probing dominate), so the estimate leans on the telemetry prediction and
+    shifts to observed progress as the render advances.
+
+    Args:
+        elapsed_s: Wall-clock seconds since the render started.
+        progress: Progress 0.0-1.0.
+        predicted_elapsed_s: Predicted total encode time, if known.
+
+    Returns:
+        Remaining seconds, or None when neither source is usable.
+    """
+    linear: float | None = None
+    if 0 < progress <= 1 and elapsed_s > 0:
+        linear = elapsed_s * (1 - progress) / progress
+    if predicted_elapsed_s is None:
+        return linear
+    prior = max(0.0, predicted_elapsed_s - elapsed_s)
+    if linear is None:
+        return prior
+    return progress * linear + (1 - progress) * prior
@@ -14,9 +14,10 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
+import shutil
 import sys
 import tempfile
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -26,11 +27,30 @@ from stoat_ferret.api.schemas.render import RenderPlanSettings, SoftSubtitleSpec
 from stoat_ferret.db.async_repository import AsyncVideoRepository
 from stoat_ferret.db.clip_repository import AsyncClipRepository
 from stoat_ferret.db.markers_repository import MarkerRepository
-from stoat_ferret.db.models import Clip
+from stoat_ferret.db.models import Clip, Video
 from stoat_ferret.effects.registry import EffectRegistry
+from stoat_ferret.ffmpeg.probe import ffprobe_keyframes
+from stoat_ferret.render.abr import prepare_ladder_dirs
+from stoat_ferret.render.fragment_cache import ClipFragmentCache, ClipFragments, VideoFragment
+from stoat_ferret.render.hierarchical import (
+    MEZZANINE_AUDIO_CODEC,
+    MEZZANINE_SUFFIX,
+    HierarchicalRenderCommands,
+    build_concat_command,
+    format_concat_list,
+    group_clip_windows,
+)
 from stoat_ferret.render.models import RenderJob, RenderStatus
+from stoat_ferret.render.multi_output import add_secondary_outputs, plan_outputs
 from stoat_ferret.render.queue import RenderQueue
 from stoat_ferret.render.service import RenderService, generate_ffmetadata
+from stoat_ferret.render.smart import (
+    KeyframeProbe,
+    SmartRenderCommands,
+    build_smart_commands,
+    plan_smart_render,
+)
+from stoat_ferret.render.tuning import PRESET_ENCODERS
 
 if TYPE_CHECKING:
     from stoat_ferret.api.services.tts_service import TtsService
@@ -50,6 +70,9 @@ _QUALITY_CRF: dict[str, str] = {
 # Required top-level fields in render_plan JSON
 _REQUIRED_PLAN_FIELDS = ("settings", "total_duration")
 
+# Share of a staged render's progress given to the final stream-copy concat pass.
+_CONCAT_PROGRESS_SHARE = 0.1
+
 # Windows CreateProcessW command-line string limit (including null terminator)
 WINDOWS_ARGV_LIMIT = 32_767
 
@@ -184,19 +207,44 @@ def _build_tts_audio_filter(
     return ";".join(parts) + ";" + amix, mix_label
 
 
+def _cue_audio_missing(cue: Any) -> bool:
+    """Return True if a ready cue's audio file has gone (e.g. evicted from the TTS cache)."""
+    return cue.status == "ready" and not (
+        cue.generated_asset_id and Path(cue.generated_asset_id).is_file()
+    )
+
+
 async def _dispatch_and_wait_for_cues(cues: Any, tts_service: Any) -> None:
-    """Dispatch pending TTS cues and wait up to 15 s for in-flight synthesis (LRN-406)."""
+    """Dispatch TTS cues lacking audio and wait for all of them concurrently.
+
+    Pending cues and ready cues whose audio was evicted are dispatched first,
+    so every cue synthesises in parallel (bounded by the service's
+    concurrency limit). The wait fails if no cue finishes within 15 s of the
+    previous one (LRN-406).
+    """
     for cue in cues:
         if cue.status == "failed":
             raise CommandBuildError(f"TTS synthesis failed for cue {cue.id}: {cue.error}")
-        if cue.status in ("pending", "synthesising"):
-            if cue.status == "pending":
-                await tts_service.synthesise_cue(cue.id)
-            task = tts_service._active_tasks.get(cue.id)
-            if task is not None:
-                done, _ = await asyncio.wait({task}, timeout=15.0)
-                if not done:
-                    raise CommandBuildError(f"TTS synthesis timeout for cue {cue.id}")
+
+    waiting: dict[Any, str] = {}
+    for cue in cues:
+        if cue.status == "pending" or _cue_audio_missing(cue):
+            await tts_service.synthesise_cue(cue.id)
+        elif cue.status != "synthesising":
+            continue
+        task = tts_service._active_tasks.get(cue.id)
+        if task is not None:
+            waiting[task] = cue.id
+
+    while waiting:
+        done, _ = await asyncio.wait(
+            set(waiting), timeout=15.0, return_when=asyncio.FIRST_COMPLETED
+        )
+        if not done:
+            stalled = next(iter(waiting.values()))
+            raise CommandBuildError(f"TTS synthesis timeout for cue {stalled}")
+        for task in done:
+            waiting.pop(task, None)
 
 
 def _build_tts_audio_inputs(cues: Any) -> list[TtsCueAudioInput]:
@@ -229,8 +277,9 @@ async def _run_tts_preflight(
 ) -> list[TtsCueAudioInput]:
     """Ensure all TTS cues for the project are synthesised before rendering.
 
-    For pending cues: dispatches synthesis and waits up to 15 s (LRN-406).
-    For synthesising cues: waits for the in-flight task up to 15 s.
+    For pending cues and ready cues whose audio was evicted from the cache:
+    dispatches synthesis. All in-flight cues are then awaited together; the
+    wait times out if none completes within 15 s (LRN-406).
     For failed cues: raises CommandBuildError immediately.
     For ready cues: returns TtsCueAudioInput records for audio injection.
 
@@ -316,12 +365,15 @@ async def _resolve_clip_source(
     video_repository: AsyncVideoRepository,
     asset_repository: AsyncAssetRepository | None,
     fps: float,
+    videos: dict[str, Video | None] | None = None,
 ) -> tuple[str, str | None, float]:
     """Resolve source path, audio codec, and frame rate for a clip.
 
     Returns ``(source_path, audio_codec, frame_rate)``.  Timing values (duration,
     segment boundaries) are NOT returned; callers derive timing from the render
-    plan segment or clip in/out points as appropriate to their path.
+    plan segment or clip in/out points as appropriate to their path. ``videos``
+    memoizes video lookups for one command build, where many clips usually cut
+    from the same few sources.
     """
     if clip.clip_type == "image":
         if asset_repository is None:
@@ -339,7 +391,12 @@ async def _resolve_clip_source(
     else:  # file
         if clip.source_video_id is None:
             raise CommandBuildError(f"File clip {clip.id} has no source_video_id")
-        vid = await video_repository.get(clip.source_video_id)
+        if videos is not None and clip.source_video_id in videos:
+            vid = videos[clip.source_video_id]
+        else:
+            vid = await video_repository.get(clip.source_video_id)
+            if videos is not None:
+                videos[clip.source_video_id] = vid
         if vid is None or not vid.path:
             raise CommandBuildError(
                 f"Video {clip.source_video_id} not found for project {project_id}"
@@ -347,52 +404,78 @@ async def _resolve_clip_source(
         return vid.path, vid.audio_codec, vid.frame_rate
 
 
+def _build_clip_fragments(clip: Clip, effect_registry: EffectRegistry | None) -> ClipFragments:
+    """Build a clip's effect filter strings through the registry's ``build_fn``.
+
+    Raises:
+        CommandBuildError: If an effect type is not registered.
+    """
+    video: list[VideoFragment] = []
+    audio: list[str] = []
+    if effect_registry and clip.effects:
+        for effect_data in clip.effects:
+            effect_type = effect_data.get("effect_type", "")
+            defn = effect_registry.get(effect_type)
+            if defn is None:
+                raise CommandBuildError(f"Unknown effect type {effect_type!r} on clip {clip.id!r}")
+            filter_str = defn.build_fn(effect_data.get("parameters", {}))
+            window = effect_data.get("window")
+            if defn.stream_kind == "a":
+                audio.append(filter_str)
+                if window:
+                    logger.warning(
+                        "audio_effect_windowed_skipped",
+                        effect_type=effect_type,
+                        clip_id=clip.id,
+                    )
+            else:
+                video.append(
+                    VideoFragment(
+                        filter_str,
+                        (window["start_s"], window["end_s"]) if window else None,
+                        defn.timeline_t_capable,
+                    )
+                )
+    return ClipFragments(video=tuple(video), audio=tuple(audio))
+
+
 def _build_clip_render_effects(
     clip: Clip,
     effect_registry: EffectRegistry | None,
+    fragment_cache: ClipFragmentCache | None = None,
 ) -> tuple[list[Any], list[str]]:
     """Build the RenderEffect list and audio filter chains for a clip.
 
     Returns ``([RenderEffect.none()], [])`` when no effects are present.
     Audio effects (stream_kind="a") are collected as filter chain strings in the
     second element of the tuple; they must be assembled into an audio filtergraph
-    segment by the caller.
+    segment by the caller. Filter strings come from ``fragment_cache`` when the
+    clip is unchanged since it was last built.
     """
     from stoat_ferret_core import RenderEffect
 
+    if fragment_cache is not None:
+        fragments = fragment_cache.get(
+            clip, effect_registry, lambda c: _build_clip_fragments(c, effect_registry)
+        )
+    else:
+        fragments = _build_clip_fragments(clip, effect_registry)
     render_effects: list[Any] = []
-    audio_filter_chains: list[str] = []
-    if effect_registry and clip.effects:
-        for effect_data in clip.effects:
-            effect_type = effect_data.get("effect_type", "")
-            defn = effect_registry.get(effect_type)
-            if defn is None:
-                raise CommandBuildError(f"Unknown effect type {effect_type!r} on clip {clip.id!r}")
-            else:
-                filter_str = defn.build_fn(effect_data.get("parameters", {}))
-                window = effect_data.get("window")
-                if defn.stream_kind == "a":
-                    audio_filter_chains.append(filter_str)
-                    if window:
-                        logger.warning(
-                            "audio_effect_windowed_skipped",
-                            effect_type=effect_type,
-                            clip_id=clip.id,
-                        )
-                elif window:
-                    render_effects.append(
-                        RenderEffect.windowed_custom(
-                            filter_str,
-                            window["start_s"],
-                            window["end_s"],
-                            defn.timeline_t_capable,
-                        )
-                    )
-                else:
-                    render_effects.append(RenderEffect.custom(filter_str))
+    for fragment in fragments.video:
+        if fragment.window is not None:
+            render_effects.append(
+                RenderEffect.windowed_custom(
+                    fragment.filter_str,
+                    fragment.window[0],
+                    fragment.window[1],
+                    fragment.timeline_t_capable,
+                )
+            )
+        else:
+            render_effects.append(RenderEffect.custom(fragment.filter_str))
     if not render_effects:
         render_effects.append(RenderEffect.none())
-    return render_effects, audio_filter_chains
+    return render_effects, list(fragments.audio)
 
 
 async def build_command_for_job(
@@ -403,12 +486,15 @@ async def build_command_for_job(
     effect_registry: EffectRegistry | None = None,
     tts_inputs: list[TtsCueAudioInput] | None = None,
     asset_repository: AsyncAssetRepository | None = None,
+    fragment_cache: ClipFragmentCache | None = None,
 ) -> list[str]:
     """Build an FFmpeg argument list for a render job.
 
     Parses render_plan JSON, resolves the project's input media path via
     repository lookups, selects the first renderable segment, and assembles
-    a shell-ready FFmpeg command. Does not invoke FFmpeg.
+    a shell-ready FFmpeg command. Does not invoke FFmpeg. Extra deliverables
+    in ``settings.outputs`` are added as further outputs of the same command
+    (see `add_secondary_outputs`).
 
     Args:
         job: The render job containing render_plan JSON and output_path.
@@ -418,6 +504,8 @@ async def build_command_for_job(
         effect_registry: Optional registry for resolving per-clip effect types to filter strings.
         tts_inputs: Optional pre-synthesised TTS cue audio inputs for voice track injection.
         asset_repository: Optional asset repository for resolving soft subtitle asset paths.
+        fragment_cache: Optional cache of per-clip effect filters, reused across
+            retries and repeated renders of unchanged clips.
 
     Returns:
         A list of strings representing the full FFmpeg command
@@ -425,7 +513,8 @@ async def build_command_for_job(
 
     Raises:
         ValueError: If output_path is empty, render_plan JSON is malformed,
-            a required field is missing, or no renderable content exists.
+            a required field is missing, no renderable content exists, or an
+            extra output cannot be produced.
         CommandBuildError: If the project has no clips or the video is not found.
     """
     if not job.output_path:
@@ -463,10 +552,220 @@ async def build_command_for_job(
         video_repository=video_repository,
         asset_repository=asset_repository,
         effect_registry=effect_registry,
+        fragment_cache=fragment_cache,
+        videos={},
     )
     if len(clips) > 1:
-        return await _build_multi_clip_command(ctx, clips)
-    return await _build_single_clip_command(ctx, clips, segments, total_duration)
+        command = await _build_multi_clip_command(ctx, clips)
+    else:
+        command = await _build_single_clip_command(ctx, clips, segments, total_duration)
+    if render_settings.outputs:
+        command = add_secondary_outputs(
+            command, render_settings.outputs, quality_crf=_QUALITY_CRF, settings=settings
+        )
+    return command
+
+
+def _smart_render_requested(render_plan_json: str) -> bool:
+    """Return True if the plan opts into smart rendering and is well-formed.
+
+    Malformed plans return False so `build_command_for_job` reports them.
+    """
+    try:
+        plan = json.loads(render_plan_json)
+        return bool(plan["settings"].get("smart_render")) and "total_duration" in plan
+    except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+        return False
+
+
+async def build_smart_render_for_job(
+    job: RenderJob,
+    clip_repository: AsyncClipRepository,
+    video_repository: AsyncVideoRepository,
+    work_dir: Path,
+    ffmetadata_path: str | None = None,
+    effect_registry: EffectRegistry | None = None,
+    has_tts: bool = False,
+    probe: KeyframeProbe = ffprobe_keyframes,
+) -> SmartRenderCommands | None:
+    """Build smart-render commands for a job, or None to render normally.
+
+    Only plans when ``settings.smart_render`` is set. A single-clip timeline
+    renders the same segment window as `_build_single_clip_command`.
+
+    Args:
+        job: The render job containing render_plan JSON and output_path.
+        clip_repository: Async clip repository for project clip lookup.
+        video_repository: Async video repository for source lookups.
+        work_dir: Directory for intermediate segments and the concat list.
+        ffmetadata_path: Optional path to an ffmetadata file for chapter embedding.
+        effect_registry: Optional registry for resolving per-clip effects.
+        has_tts: Whether TTS cue audio will be mixed in (forces a normal render).
+        probe: Keyframe probe (injectable for tests).
+
+    Returns:
+        The prepare/concat commands, or None.
+    """
+    if not _smart_render_requested(job.render_plan):
+        return None
+    plan = json.loads(job.render_plan)
+    settings: dict[str, Any] = plan["settings"]
+    render_settings = RenderPlanSettings.model_validate(settings)
+    clips = await clip_repository.list_by_project(job.project_id)
+    if not clips:
+        return None
+
+    windows: list[tuple[float, float]] | None = None
+    if len(clips) == 1 and clips[0].source_video_id:
+        video = await video_repository.get(clips[0].source_video_id)
+        if video is None:
+            return None
+        segment = _resolve_segment(plan.get("segments", []), plan["total_duration"], job.id)
+        start = clips[0].in_point / video.frame_rate + segment.get("timeline_start", 0.0)
+        end = clips[0].in_point / video.frame_rate + segment["timeline_end"]
+        windows = [(start, end)]
+
+    smart_plan = await plan_smart_render(
+        clips,
+        settings,
+        render_settings,
+        video_repository=video_repository,
+        effect_registry=effect_registry,
+        has_tts=has_tts,
+        windows=windows,
+        probe=probe,
+    )
+    if smart_plan is None:
+        return None
+    quality_preset: str = settings.get("quality_preset", "standard")
+    return build_smart_commands(
+        smart_plan,
+        settings,
+        work_dir=work_dir,
+        output_path=job.output_path,
+        crf=_QUALITY_CRF.get(quality_preset),
+        ffmetadata_path=ffmetadata_path,
+    )
+
+
+async def build_hierarchical_render_for_job(
+    job: RenderJob,
+    clip_repository: AsyncClipRepository,
+    video_repository: AsyncVideoRepository,
+    work_dir: Path,
+    max_clips_per_pass: int,
+    ffmetadata_path: str | None = None,
+    effect_registry: EffectRegistry | None = None,
+    has_tts: bool = False,
+    asset_repository: AsyncAssetRepository | None = None,
+    fragment_cache: ClipFragmentCache | None = None,
+) -> HierarchicalRenderCommands | None:
+    """Build windowed mezzanine and concat commands for a large timeline.
+
+    Returns None (render with the single multi-clip command) when
+    ``max_clips_per_pass`` is below 2, the timeline fits in one pass, TTS
+    cues or soft subtitles must be laid over the whole timeline, or some
+    windows would carry audio and others not.
+
+    Args:
+        job: The render job containing render_plan JSON and output_path.
+        clip_repository: Async clip repository for project clip lookup.
+        video_repository: Async video repository for source lookups.
+        work_dir: Directory for mezzanines and the concat list.
+        max_clips_per_pass: Target clips (decoders) per window.
+        ffmetadata_path: Optional ffmetadata file, applied in the concat pass.
+        effect_registry: Optional registry for resolving per-clip effects.
+        has_tts: Whether TTS cue audio will be mixed in.
+        asset_repository: Optional asset repository for image clip sources.
+        fragment_cache: Optional cache of per-clip effect filters.
+
+    Returns:
+        The per-window and concat commands, or None.
+    """
+    if max_clips_per_pass < 2 or has_tts:
+        return None
+    try:
+        plan = json.loads(job.render_plan)
+        settings: dict[str, Any] = plan["settings"]
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return None  # build_command_for_job reports malformed plans
+    render_settings = RenderPlanSettings.model_validate(settings)
+    if render_settings.soft_subtitles:
+        return None
+    clips = await clip_repository.list_by_project(job.project_id)
+    if len(clips) <= max_clips_per_pass:
+        return None
+    windows = group_clip_windows(clips, settings.get("transitions", []), max_clips_per_pass)
+    if len(windows) < 2:
+        return None
+
+    fps: float = settings.get("fps", 30.0)
+    transition_durations: dict[str, float] = {
+        t["clip_a_id"]: t["duration"] for t in settings.get("transitions", [])
+    }
+    videos: dict[str, Video | None] = {}
+    window_audio: list[bool] = []
+    window_durations: list[float] = []
+    for window in windows:
+        has_audio = False
+        duration_s = 0.0
+        for clip in window:
+            framerate = fps
+            if clip.clip_type == "file":
+                _, audio_codec, framerate = await _resolve_clip_source(
+                    clip, job.project_id, video_repository, asset_repository, fps, videos
+                )
+                has_audio = has_audio or audio_codec is not None
+            # Windows end on a clip without an outgoing transition, so every
+            # transition here overlaps two clips of the same window.
+            duration_s += _clip_duration_s(clip, framerate, fps)
+            duration_s -= transition_durations.get(clip.id, 0.0)
+        window_audio.append(has_audio)
+        window_durations.append(duration_s)
+    if len(set(window_audio)) > 1:
+        logger.info("render_worker.hierarchical_skipped", job_id=job.id, reason="mixed_audio")
+        return None
+
+    mezzanine_paths = tuple(
+        work_dir / f"window_{i:04d}{MEZZANINE_SUFFIX}" for i in range(len(windows))
+    )
+    window_commands: list[list[str]] = []
+    for window, mezzanine in zip(windows, mezzanine_paths, strict=True):
+        ctx = _RenderCommandContext(
+            job=replace(job, output_path=str(mezzanine)),
+            settings=settings,
+            render_settings=render_settings,
+            ffmetadata_path=None,
+            tts_inputs=None,
+            video_repository=video_repository,
+            asset_repository=asset_repository,
+            effect_registry=effect_registry,
+            fragment_cache=fragment_cache,
+            videos=videos,
+        )
+        command = await _build_multi_clip_command(ctx, window)
+        if window_audio[0]:
+            command[-1:-1] = ["-c:a", MEZZANINE_AUDIO_CODEC]
+        window_commands.append(command)
+
+    concat_list_path = work_dir / "windows.ffconcat"
+    logger.info(
+        "render_worker.hierarchical_planned",
+        job_id=job.id,
+        clip_count=len(clips),
+        window_count=len(windows),
+        max_window_clips=max(len(window) for window in windows),
+    )
+    return HierarchicalRenderCommands(
+        window_commands=window_commands,
+        window_durations=tuple(window_durations),
+        concat=build_concat_command(
+            concat_list_path, job.output_path, ffmetadata_path=ffmetadata_path
+        ),
+        concat_list=format_concat_list(mezzanine_paths),
+        concat_list_path=concat_list_path,
+        mezzanine_paths=mezzanine_paths,
+    )
 
 
 @dataclass
@@ -481,6 +780,24 @@ class _RenderCommandContext:
     video_repository: AsyncVideoRepository
     asset_repository: AsyncAssetRepository | None
     effect_registry: EffectRegistry | None
+    fragment_cache: ClipFragmentCache | None = None
+    # Video rows looked up during this build, by ID (None disables the memo)
+    videos: dict[str, Video | None] | None = None
+
+
+def _clip_duration_s(clip: Clip, framerate: float, fps: float) -> float:
+    """Return a clip's rendered duration in seconds.
+
+    Args:
+        clip: The clip.
+        framerate: Source frame rate (file clips).
+        fps: Project frame rate (generator clips).
+    """
+    if clip.clip_type == "image":
+        return (clip.timeline_end or 0.0) - (clip.timeline_start or 0.0)
+    if clip.clip_type == "generator":
+        return (clip.out_point - clip.in_point) / fps
+    return (clip.out_point - clip.in_point) / framerate
 
 
 async def _build_clip_input_list(
@@ -523,16 +840,15 @@ async def _build_clip_input_list(
 
     for i, clip in enumerate(clips):
         source_path_mc, clip_audio_codec, framerate_mc = await _resolve_clip_source(
-            clip, ctx.job.project_id, ctx.video_repository, ctx.asset_repository, fps_mc
+            clip,
+            ctx.job.project_id,
+            ctx.video_repository,
+            ctx.asset_repository,
+            fps_mc,
+            ctx.videos,
         )
-        if clip.clip_type == "image":
-            timeline_start_mc = clip.timeline_start or 0.0
-            timeline_end_mc = clip.timeline_end or 0.0
-            duration_secs = timeline_end_mc - timeline_start_mc
-        elif clip.clip_type == "generator":
-            duration_secs = (clip.out_point - clip.in_point) / fps_mc
-        else:  # file
-            duration_secs = (clip.out_point - clip.in_point) / framerate_mc
+        duration_secs = _clip_duration_s(clip, framerate_mc, fps_mc)
+        if clip.clip_type == "file":
             if source_audio_codec_mc is None and clip_audio_codec:
                 source_audio_codec_mc = clip_audio_codec
                 source_audio_input_idx_mc = i
@@ -545,7 +861,9 @@ async def _build_clip_input_list(
             in_point_secs_list.append(clip.in_point / framerate_mc)
         else:
             in_point_secs_list.append(0.0)  # image and generator clips: no source seek
-        render_effects, audio_filter_chains = _build_clip_render_effects(clip, ctx.effect_registry)
+        render_effects, audio_filter_chains = _build_clip_render_effects(
+            clip, ctx.effect_registry, ctx.fragment_cache
+        )
         per_clip_audio_filters.append(audio_filter_chains)
         outgoing: Any = None
         if clip.id in transition_lookup:
@@ -821,6 +1139,8 @@ async def _build_multi_clip_command(
     multi_cmd.extend(["-c:v", codec_mc])
     if codec_mc in ("libx264", "libx265") and quality_preset_mc in _QUALITY_CRF:
         multi_cmd.extend(["-crf", _QUALITY_CRF[quality_preset_mc]])
+    if codec_mc in PRESET_ENCODERS and ctx.render_settings.encoder_preset:
+        multi_cmd.extend(["-preset", ctx.render_settings.encoder_preset])
     multi_cmd.extend(["-r", str(fps_mc)])
     multi_cmd.extend(["-progress", "pipe:1"])
     if ctx.ffmetadata_path:
@@ -1133,6 +1453,8 @@ async def _build_single_clip_command(
     # Quality via CRF for software x264/x265
     if codec in ("libx264", "libx265") and quality_preset in _QUALITY_CRF:
         cmd.extend(["-crf", _QUALITY_CRF[quality_preset]])
+    if codec in PRESET_ENCODERS and ctx.render_settings.encoder_preset:
+        cmd.extend(["-preset", ctx.render_settings.encoder_preset])
 
     # Frame rate
     cmd.extend(["-r", str(fps)])
@@ -1172,6 +1494,11 @@ class RenderWorkerLoop:
         effect_registry: Optional registry for resolving per-clip effect types to filter strings.
         tts_service: Optional TTS service for pre-render synthesis preflight.
         tts_cue_repository: Optional TTS cue repository for preflight status checks.
+        asset_repository: Optional asset repository for image and subtitle assets.
+        max_clips_per_pass: Clips per FFmpeg pass before a timeline is rendered
+            hierarchically (0 disables).
+        fragment_cache: Cache of per-clip effect filters shared by every job
+            (a private one is created when omitted).
     """
 
     def __init__(
@@ -1186,6 +1513,8 @@ class RenderWorkerLoop:
         tts_service: TtsService | None = None,
         tts_cue_repository: AsyncTtsCueRepository | None = None,
         asset_repository: AsyncAssetRepository | None = None,
+        max_clips_per_pass: int = 0,
+        fragment_cache: ClipFragmentCache | None = None,
     ) -> None:
         self.service = service
         self.queue = queue
@@ -1196,6 +1525,8 @@ class RenderWorkerLoop:
         self.tts_service = tts_service
         self.tts_cue_repository = tts_cue_repository
         self.asset_repository = asset_repository
+        self.max_clips_per_pass = max_clips_per_pass
+        self.fragment_cache = fragment_cache if fragment_cache is not None else ClipFragmentCache()
         self.logger = structlog.get_logger(__name__)
 
     async def run(self) -> None:
@@ -1222,9 +1553,11 @@ class RenderWorkerLoop:
 
     async def _run_job(self, job: RenderJob) -> None:
         """Build command and execute a single render job, managing temp file lifecycle."""
+        self.service.note_job_started(job.id)
         ffmetadata_path: str | None = None
         tmp_path: Path | None = None
         filter_tmp_path: Path | None = None
+        work_dir: Path | None = None
         try:
             metadata_title = _extract_metadata_title(job.render_plan)
             markers = []
@@ -1247,6 +1580,14 @@ class RenderWorkerLoop:
                 if not tts_inputs:
                     tts_inputs = None
 
+            # Staged renders end in a stream-copy concat, which cannot fan out
+            outputs = plan_outputs(job.render_plan)
+            staged = _smart_render_requested(job.render_plan) or self.max_clips_per_pass >= 2
+            if staged and not outputs:
+                work_dir = Path(await asyncio.to_thread(tempfile.mkdtemp, prefix="render_"))
+                if await self._try_staged_render(job, work_dir, ffmetadata_path, bool(tts_inputs)):
+                    return
+
             command = await build_command_for_job(
                 job,
                 self.clip_repository,
@@ -1255,10 +1596,13 @@ class RenderWorkerLoop:
                 self.effect_registry,
                 tts_inputs,
                 self.asset_repository,
+                self.fragment_cache,
             )
             command, filter_tmp_path = await asyncio.to_thread(
-                _maybe_route_filter_to_file, command, job, self.service._executor
+                _maybe_route_filter_to_file, command, job, self.service.executor
             )
+            if outputs:
+                await asyncio.to_thread(prepare_ladder_dirs, outputs)
             await self.service.run_job(job, command)
         finally:
             if tmp_path is not None:
@@ -1267,6 +1611,108 @@ class RenderWorkerLoop:
             if filter_tmp_path is not None:
                 with contextlib.suppress(OSError):
                     filter_tmp_path.unlink(missing_ok=True)
+            if work_dir is not None:
+                await asyncio.to_thread(shutil.rmtree, work_dir, True)
+
+    async def _try_staged_render(
+        self,
+        job: RenderJob,
+        work_dir: Path,
+        ffmetadata_path: str | None,
+        has_tts: bool,
+    ) -> bool:
+        """Render via intermediate files when smart or hierarchical rendering applies.
+
+        Smart rendering (stream copy of untouched ranges) is tried first,
+        then hierarchical rendering for timelines over the per-pass clip
+        limit. The intermediate passes run through ``service.run_pass``; the final
+        concat pass goes through ``service.run_job`` so completion, progress
+        and QC behave as for a normal render.
+
+        Returns:
+            True if the job was handled (rendered, or cancelled during an
+            intermediate pass); False to fall back to the single-pass render.
+        """
+        smart = await build_smart_render_for_job(
+            job,
+            self.clip_repository,
+            self.video_repository,
+            work_dir,
+            ffmetadata_path,
+            self.effect_registry,
+            has_tts,
+        )
+        if smart is not None:
+            return await self._run_intermediate_passes(
+                job,
+                list(zip(smart.prepare, smart.encode_seconds, strict=True)),
+                smart.concat_list_path,
+                smart.concat_list,
+                smart.concat,
+                "smart_render",
+            )
+        hierarchical = await build_hierarchical_render_for_job(
+            job,
+            self.clip_repository,
+            self.video_repository,
+            work_dir,
+            self.max_clips_per_pass,
+            ffmetadata_path,
+            self.effect_registry,
+            has_tts,
+            self.asset_repository,
+            self.fragment_cache,
+        )
+        if hierarchical is not None:
+            return await self._run_intermediate_passes(
+                job,
+                list(zip(hierarchical.window_commands, hierarchical.window_durations, strict=True)),
+                hierarchical.concat_list_path,
+                hierarchical.concat_list,
+                hierarchical.concat,
+                "hierarchical",
+            )
+        return False
+
+    async def _run_intermediate_passes(
+        self,
+        job: RenderJob,
+        passes: list[tuple[list[str], float]],
+        concat_list_path: Path,
+        concat_list: str,
+        concat: list[str],
+        strategy: str,
+    ) -> bool:
+        """Run intermediate passes one at a time, then the concat pass.
+
+        Each pass is paired with the seconds of output it encodes. The passes
+        share the job's progress in proportion to those seconds, and the
+        concat pass takes the last `_CONCAT_PROGRESS_SHARE`. Passes with 0
+        seconds (stream copies) report no progress.
+        """
+        await asyncio.to_thread(concat_list_path.write_text, concat_list)
+        total_s = sum(duration_s for _, duration_s in passes)
+        passes_share = 1.0 - _CONCAT_PROGRESS_SHARE if total_s > 0 else 0.0
+        done_s = 0.0
+        for command, duration_s in passes:
+            command, _ = await asyncio.to_thread(
+                _maybe_route_filter_to_file, command, job, self.service.executor
+            )
+            start = passes_share * done_s / total_s if total_s > 0 else 0.0
+            done_s += duration_s
+            end = passes_share * done_s / total_s if total_s > 0 else 0.0
+            if not await self.service.run_pass(
+                job, command, duration_s=duration_s, progress_range=(start, end)
+            ):
+                current = await self.service.get_job(job.id)
+                if current is not None and current.status == RenderStatus.CANCELLED:
+                    return True
+                self.logger.warning(
+                    "render_worker.staged_render_fallback", job_id=job.id, strategy=strategy
+                )
+                return False
+        await self.service.run_job(job, concat, progress_range=(passes_share, 1.0))
+        return True
 
     async def _handle_job_error(self, job: RenderJob, exc: Exception) -> None:
         """Handle a job execution exception.
@@ -1293,7 +1739,7 @@ class RenderWorkerLoop:
                 error_message=str(handler_exc),
             )
             try:
-                await self.service._repo.update_status(
+                await self.service.update_job_status(
                     job.id,
                     RenderStatus.FAILED,
                     error_message=f"failure handler error: {handler_exc}",
@@ -4907,6 +4907,8 @@ class GenericProceduralImageBuilder:
     def synthesise(self, output_path: str) -> None:
         """Render and save the procedural image to a PNG file.
 
+        Rendering runs across all cores with the GIL released.
+
         Args:
             output_path: Destination file path (parent directories are created).
 
@@ -4916,6 +4918,52 @@ class GenericProceduralImageBuilder:
         """
         ...
 
+    @property
+    def pix_fmt(self) -> str:
+        """Raw pixel format of frames from render_frame / write_frames.
+
+        Returns the FFmpeg rawvideo -pix_fmt name: "rgba" or "gray".
+        """
+        ...
+
+    def render_frame(self, at_time: float | None = None) -> bytes:
+        """Render a single raw frame at the given time.
+
+        Args:
+            at_time: The t value. Defaults to the builder's at_time.
+
+        Returns:
+            Raw packed pixels (width * height * channels bytes) in pix_fmt.
+
+        Raises:
+            ValueError: If the render times out.
+        """
+        ...
+
+    def write_frames(self, sink: object, start_time: float, end_time: float, fps: float) -> int:
+        """Render frames over [start_time, end_time) and write each to sink.
+
+        Frame i is rendered at t = start_time + i / fps. Frames are rendered on
+        a background thread (GIL released) up to two frames ahead of the sink,
+        and each frame is passed to sink.write(bytes) -- typically the stdin of
+        an FFmpeg process reading
+        ``-f rawvideo -pix_fmt <pix_fmt> -s <width>x<height> -r <fps> -i pipe:0``.
+
+        Args:
+            sink: Object with a write(bytes) method.
+            start_time: t value of the first frame.
+            end_time: Exclusive end of the time range.
+            fps: Frames per second. Must be > 0.
+
+        Returns:
+            Number of frames written.
+
+        Raises:
+            ValueError: If the time range or fps is invalid, or a frame render
+                times out.
+        """
+        ...
+
     def __repr__(self) -> str: ...
 
 class MultiTrackAudioMixer:
@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Event-loop latency under log load.
+
+Emits a burst of INFO records from a coroutine, in chunks between which a
+ticker task measures how late its 1ms sleeps wake up. In synchronous mode
+each log call renders JSON and writes to stdout and the rotating file on
+the event loop thread; in queue mode the call only enqueues the record and
+the listener thread does the rest.
+
+Run with::
+
+    uv run pytest tests/benchmarks/test_logging_perf.py --benchmark-only --no-cov -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+import structlog
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from stoat_ferret.logging import configure_logging, shutdown_logging
+
+RECORDS = 5_000
+CHUNK = 50
+TICK_S = 0.001
+# Queue mode must spend at least this much less time logging on the loop thread.
+MIN_SPEEDUP = 2.0
+
+
+async def _log_burst() -> tuple[float, float]:
+    """Log RECORDS events; return (seconds blocked in log calls, worst tick lag)."""
+    log = structlog.get_logger("benchmark.logging")
+    loop = asyncio.get_running_loop()
+    lags: list[float] = []
+    stop = asyncio.Event()
+
+    async def ticker() -> None:
+        while not stop.is_set():
+            start = loop.time()
+            await asyncio.sleep(TICK_S)
+            lags.append(loop.time() - start - TICK_S)
+
+    tick_task = asyncio.create_task(ticker())
+    blocked = 0.0
+    for chunk in range(RECORDS // CHUNK):
+        start = time.perf_counter()
+        for n in range(CHUNK):
+            log.info("render_progress", job_id="job-1", frame=chunk * CHUNK + n, progress=n / CHUNK)
+        blocked += time.perf_counter() - start
+        await asyncio.sleep(0)
+    stop.set()
+    await tick_task
+    return blocked, max(lags, default=0.0)
+
+
+def _run(log_dir: Path, *, queue_mode: bool) -> tuple[float, float]:
+    structlog.reset_defaults()
+    configure_logging(log_dir=log_dir, queue_mode=queue_mode)
+    try:
+        return asyncio.run(_log_burst())
+    finally:
+        shutdown_logging()
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+            handler.close()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_root_logger() -> Generator[None, None, None]:
+    """Detach pytest's capture handlers, which format every record in both modes."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    root.handlers = []
+    yield
+    root.handlers, root.level = saved_handlers, saved_level
+    structlog.reset_defaults()
+
+
+@pytest.mark.benchmark
+def test_queue_logging_frees_event_loop(benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+    """Queue mode blocks the event loop far less than synchronous handlers.
+
+    The benchmark times the queue-mode burst; the synchronous run is
+    measured once for the speedup assertion.
+    """
+    sync_blocked, sync_lag = _run(tmp_path / "sync", queue_mode=False)
+
+    results: list[tuple[float, float]] = []
+    benchmark.pedantic(
+        lambda: results.append(_run(tmp_path / "queue", queue_mode=True)),
+        rounds=3,
+        iterations=1,
+    )
+    queue_blocked = min(blocked for blocked, _ in results)
+    benchmark.extra_info["sync_blocked_s"] = sync_blocked
+    benchmark.extra_info["queue_blocked_s"] = queue_blocked
+    benchmark.extra_info["sync_max_tick_lag_s"] = sync_lag
+    benchmark.extra_info["queue_max_tick_lag_s"] = min(lag for _, lag in results)
+    benchmark.extra_info["speedup"] = sync_blocked / queue_blocked
+
+    assert sync_blocked / queue_blocked >= MIN_SPEEDUP, (
+        f"queue mode blocked the loop for {queue_blocked * 1000:.0f}ms vs "
+        f"{sync_blocked * 1000:.0f}ms synchronously (< {MIN_SPEEDUP}x)"
+    )
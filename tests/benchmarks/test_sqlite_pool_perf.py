@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""SQLite read concurrency under write load.
+
+Compares a single shared ``aiosqlite`` connection (the pre-pool layout)
+with :class:`SQLiteConnectionPool` on the same workload: a writer task
+inserting and committing rows in a loop while several reader tasks run a
+deliberately slow aggregate query. With one connection every read queues
+behind writes and other reads on the connection's thread; the pool runs
+reads on its read-only WAL connections in parallel with the writer.
+
+Run with::
+
+    uv run pytest tests/benchmarks/test_sqlite_pool_perf.py --benchmark-only --no-cov -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from stoat_ferret.db.connection_pool import SQLiteConnectionPool
+
+SEED_ROWS = 20_000
+READERS = 4
+READS_PER_READER = 10
+# The pool must finish the read workload at least this much faster.
+MIN_SPEEDUP = 1.5
+
+_READ_SQL = "SELECT COUNT(*), SUM(LENGTH(payload)) FROM events WHERE payload LIKE '%7%'"
+
+
+async def _seed(path: Path) -> None:
+    async with aiosqlite.connect(path) as conn:
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, payload TEXT NOT NULL)")
+        await conn.executemany(
+            "INSERT INTO events (payload) VALUES (?)",
+            ((f"event-{n}-" + "x" * 200,) for n in range(SEED_ROWS)),
+        )
+        await conn.commit()
+
+
+async def _run_workload(db: Any) -> float:
+    """Run the read workload against `db` while a writer loops; return read wall time."""
+    stop = asyncio.Event()
+
+    async def writer() -> None:
+        n = 0
+        while not stop.is_set():
+            await db.execute("INSERT INTO events (payload) VALUES (?)", (f"write-{n}",))
+            await db.commit()
+            n += 1
+
+    async def reader() -> None:
+        for _ in range(READS_PER_READER):
+            cursor = await db.execute(_READ_SQL)
+            await cursor.fetchall()
+
+    write_task = asyncio.create_task(writer())
+    start = time.perf_counter()
+    await asyncio.gather(*(reader() for _ in range(READERS)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await write_task
+    return elapsed
+
+
+async def _single_connection(path: Path) -> float:
+    async with aiosqlite.connect(path) as conn:
+        return await _run_workload(conn)
+
+
+async def _pooled(path: Path) -> float:
+    async with SQLiteConnectionPool(path, read_pool_size=READERS) as pool:
+        return await _run_workload(pool)
+
+
+@pytest.fixture
+def seeded_db(tmp_path: Path) -> Path:
+    """A WAL database pre-filled with SEED_ROWS event rows."""
+    path = tmp_path / "pool-bench.db"
+    asyncio.run(_seed(path))
+    return path
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="read parallelism needs more than one CPU")
+def test_pooled_reads_under_write_load(benchmark: BenchmarkFixture, seeded_db: Path) -> None:
+    """Pooled reads under a concurrent write loop beat the shared connection.
+
+    The benchmark times the pooled workload; the single-connection run is
+    measured once for the speedup assertion.
+    """
+    baseline = asyncio.run(_single_connection(seeded_db))
+
+    pooled = benchmark.pedantic(lambda: asyncio.run(_pooled(seeded_db)), rounds=3, iterations=1)
+    benchmark.extra_info["single_connection_s"] = baseline
+    benchmark.extra_info["speedup"] = baseline / pooled
+
+    assert baseline / pooled >= MIN_SPEEDUP, (
+        f"pooled reads took {pooled * 1000:.0f}ms vs {baseline * 1000:.0f}ms "
+        f"on one connection (< {MIN_SPEEDUP}x)"
+    )
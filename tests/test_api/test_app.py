@@ -60,6 +60,20 @@ def test_openapi_docs_available(client: TestClient) -> None:
     assert data["info"]["version"] == "0.3.0"
 
 
+@pytest.mark.api
+def test_openapi_document_supports_conditional_get(client: TestClient) -> None:
+    """/openapi.json carries a strong ETag and revalidates to 304."""
+    response = client.get("/openapi.json")
+    etag = response.headers["etag"]
+    assert not etag.startswith("W/")
+    assert response.headers["vary"] == "Accept-Encoding"
+
+    cached = client.get("/openapi.json", headers={"If-None-Match": etag})
+
+    assert cached.status_code == 304
+    assert [r.path for r in client.app.routes].count("/openapi.json") == 1
+
+
 @pytest.mark.api
 def test_injected_repositories_in_state(client: TestClient) -> None:
     """Injected repositories are stored in app.state after startup."""
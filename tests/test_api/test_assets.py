@@ -199,6 +199,35 @@ def test_upload_size_limit_returns_413(asset_client: TestClient, tmp_path: Path)
     assert resp.status_code == 413
 
 
+@pytest.mark.api
+def test_upload_declared_oversize_rejected_before_reading(
+    asset_client: TestClient, tmp_path: Path
+) -> None:
+    """A Content-Length far above the limit is rejected without spooling anything."""
+    asset_client.app.state._settings = Settings(  # type: ignore[attr-defined]
+        assets_dir=tmp_path / "assets", assets_max_size_bytes=10
+    )
+    resp = asset_client.post(
+        "/api/v1/assets",
+        files={"file": ("big.png", b"X" * 200_000, "image/png")},
+        params={"kind": "image"},
+    )
+    assert resp.status_code == 413
+    assert not (tmp_path / "assets" / ".uploads").exists()
+
+
+@pytest.mark.api
+def test_upload_without_file_field_returns_422(asset_client: TestClient) -> None:
+    """A form with no ``file`` part fails validation like a missing body field."""
+    resp = asset_client.post(
+        "/api/v1/assets",
+        files={"image": ("img.png", _make_png(), "image/png")},
+        params={"kind": "image"},
+    )
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["loc"] == ["body", "file"]
+
+
 @pytest.mark.api
 def test_upload_empty_file_returns_422(asset_client: TestClient) -> None:
     """Empty file upload returns 422."""
@@ -456,3 +485,131 @@ def test_delete_asset_twice_returns_404(asset_client: TestClient) -> None:
 
     resp = asset_client.delete(f"/api/v1/assets/{asset_id}")
     assert resp.status_code == 404
+
+
+@pytest.mark.api
+def test_upload_leaves_no_spool_files(asset_client: TestClient, tmp_path: Path) -> None:
+    """Accepted and rejected uploads both clean up their temp files."""
+    asset_client.post(
+        "/api/v1/assets",
+        files={"file": ("img.png", _make_png(), "image/png")},
+        params={"kind": "image"},
+    )
+    asset_client.post(
+        "/api/v1/assets",
+        files={"file": ("fake.png", b"not-an-image", "image/png")},
+        params={"kind": "image"},
+    )
+
+    assert list((tmp_path / "assets" / ".uploads").iterdir()) == []
+    assert len(list((tmp_path / "assets").glob("*.png"))) == 1
+
+
+# ---------------------------------------------------------------------------
+# Resumable uploads: /api/v1/assets/uploads
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.api
+def test_resumable_upload_in_ranges(asset_client: TestClient, tmp_path: Path) -> None:
+    """An upload sent in several ranges is stored under its content hash."""
+    data = b"ID3" + bytes(range(256)) * 40
+    created = asset_client.post(
+        "/api/v1/assets/uploads",
+        json={
+            "kind": "audio",
+            "filename": "bed.mp3",
+            "size_bytes": len(data),
+            "content_type": "audio/mpeg",
+        },
+    )
+    assert created.status_code == 201
+    upload_id = created.json()["upload_id"]
+    assert created.json()["offset"] == 0
+
+    offset = 0
+    for start in range(0, len(data), 4096):
+        resp = asset_client.patch(
+            f"/api/v1/assets/uploads/{upload_id}",
+            content=data[start : start + 4096],
+            headers={"Upload-Offset": str(offset)},
+        )
+        assert resp.status_code == 200
+        offset = resp.json()["offset"]
+    assert offset == len(data)
+
+    done = asset_client.post(f"/api/v1/assets/uploads/{upload_id}/complete")
+    assert done.status_code == 201
+    body = done.json()
+    assert body["kind"] == "audio"
+    assert body["mime_type"] == "audio/mpeg"
+    assert body["size_bytes"] == len(data)
+    assert asset_client.get(f"/api/v1/assets/{body['id']}/file").content == data
+    assert asset_client.get(f"/api/v1/assets/uploads/{upload_id}").status_code == 404
+
+
+@pytest.mark.api
+def test_resumable_upload_rejects_wrong_offset(asset_client: TestClient) -> None:
+    """A range not starting at the current offset is rejected with 409."""
+    upload_id = asset_client.post(
+        "/api/v1/assets/uploads", json={"kind": "font", "filename": "a.ttf"}
+    ).json()["upload_id"]
+    asset_client.patch(
+        f"/api/v1/assets/uploads/{upload_id}", content=b"abcd", headers={"Upload-Offset": "0"}
+    )
+
+    resp = asset_client.patch(
+        f"/api/v1/assets/uploads/{upload_id}", content=b"efgh", headers={"Upload-Offset": "0"}
+    )
+
+    assert resp.status_code == 409
+    assert asset_client.get(f"/api/v1/assets/uploads/{upload_id}").json()["offset"] == 4
+
+
+@pytest.mark.api
+def test_resumable_upload_incomplete_returns_409(asset_client: TestClient) -> None:
+    """Completing before the declared size has arrived is rejected."""
+    upload_id = asset_client.post(
+        "/api/v1/assets/uploads", json={"kind": "lut", "filename": "a.cube", "size_bytes": 10}
+    ).json()["upload_id"]
+    asset_client.patch(
+        f"/api/v1/assets/uploads/{upload_id}", content=b"abcd", headers={"Upload-Offset": "0"}
+    )
+
+    assert asset_client.post(f"/api/v1/assets/uploads/{upload_id}/complete").status_code == 409
+
+
+@pytest.mark.api
+def test_resumable_upload_size_limit_returns_413(asset_client: TestClient, tmp_path: Path) -> None:
+    """Oversized declarations and ranges past the limit return 413."""
+    asset_client.app.state._settings = Settings(  # type: ignore[attr-defined]
+        assets_dir=tmp_path / "assets", assets_max_size_bytes=10
+    )
+    declared = asset_client.post(
+        "/api/v1/assets/uploads", json={"kind": "audio", "filename": "a.wav", "size_bytes": 11}
+    )
+    assert declared.status_code == 413
+
+    upload_id = asset_client.post(
+        "/api/v1/assets/uploads", json={"kind": "audio", "filename": "a.wav"}
+    ).json()["upload_id"]
+    resp = asset_client.patch(
+        f"/api/v1/assets/uploads/{upload_id}", content=b"X" * 11, headers={"Upload-Offset": "0"}
+    )
+    assert resp.status_code == 413
+    assert asset_client.get(f"/api/v1/assets/uploads/{upload_id}").status_code == 404
+
+
+@pytest.mark.api
+def test_abort_upload_deletes_part_file(asset_client: TestClient, tmp_path: Path) -> None:
+    """DELETE discards the session and its partial file."""
+    upload_id = asset_client.post(
+        "/api/v1/assets/uploads", json={"kind": "audio", "filename": "a.wav"}
+    ).json()["upload_id"]
+    asset_client.patch(
+        f"/api/v1/assets/uploads/{upload_id}", content=b"abcd", headers={"Upload-Offset": "0"}
+    )
+
+    assert asset_client.delete(f"/api/v1/assets/uploads/{upload_id}").status_code == 204
+    assert list((tmp_path / "assets" / ".uploads").iterdir()) == []
+    assert asset_client.delete(f"/api/v1/assets/uploads/{upload_id}").status_code == 404
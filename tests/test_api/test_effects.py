@@ -18,6 +18,7 @@ from stoat_ferret.db.async_repository import AsyncInMemoryVideoRepository
 from stoat_ferret.db.clip_repository import AsyncInMemoryClipRepository
 from stoat_ferret.db.models import Clip, Project
 from stoat_ferret.db.project_repository import AsyncInMemoryProjectRepository
+from stoat_ferret.effects import registry as registry_module
 from stoat_ferret.effects.definitions import (
     ACROSSFADE,
     AUDIO_DUCKING,
@@ -260,6 +261,44 @@ def test_injected_registry_used_by_endpoint() -> None:
         assert data["effects"][0]["filter_preview"] == "custom_filter=test"
 
 
+@pytest.mark.api
+def test_effect_catalogue_revalidates_until_registry_changes() -> None:
+    """GET /effects answers If-None-Match with 304 until an effect is registered."""
+
+    def _definition(preview: str) -> EffectDefinition:
+        return EffectDefinition(
+            name="Custom",
+            description="A custom effect",
+            parameter_schema={"type": "object", "properties": {}},
+            ai_hints={},
+            preview_fn=lambda: preview,
+            build_fn=lambda params: preview,
+        )
+
+    registry = EffectRegistry()
+    registry.register("custom_effect", _definition("custom=1"))
+    app = create_app(
+        video_repository=AsyncInMemoryVideoRepository(),
+        project_repository=AsyncInMemoryProjectRepository(),
+        clip_repository=AsyncInMemoryClipRepository(),
+        effect_registry=registry,
+    )
+
+    with TestClient(app) as client:
+        first = client.get("/api/v1/effects", headers={"Accept-Encoding": "gzip"})
+        etag = first.headers["etag"]
+        assert first.headers["content-encoding"] == "gzip"
+        assert first.json()["effects"][0]["filter_preview"] == "custom=1"
+
+        cached = client.get("/api/v1/effects", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+
+        registry.register("custom_effect", _definition("custom=2"))
+        changed = client.get("/api/v1/effects", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()["effects"][0]["filter_preview"] == "custom=2"
+
+
 @pytest.mark.api
 def test_effect_registry_stored_on_app_state() -> None:
     """create_app() with effect_registry stores it on app.state."""
@@ -392,6 +431,119 @@ async def test_apply_effect_stores_on_clip(
     assert "drawtext" in updated_clip.effects[0]["filter_string"]
 
 
+@pytest.mark.api
+async def test_validate_project_effects_reports_invalid_entries(
+    client: TestClient,
+    project_repository: AsyncInMemoryProjectRepository,
+    clip_repository: AsyncInMemoryClipRepository,
+) -> None:
+    """POST /projects/{id}/effects/validate checks every clip stack and transition."""
+    now = datetime.now(timezone.utc)
+    await project_repository.add(
+        Project(
+            id="proj-1",
+            name="Test",
+            output_width=1920,
+            output_height=1080,
+            output_fps=30,
+            created_at=now,
+            updated_at=now,
+            transitions=[
+                {
+                    "id": "tr-1",
+                    "source_clip_id": "clip-1",
+                    "target_clip_id": "clip-2",
+                    "transition_type": "missing_transition",
+                    "parameters": {},
+                }
+            ],
+        )
+    )
+    for i, effects in enumerate(
+        [
+            [{"effect_type": "text_overlay", "parameters": {"text": "ok"}}],
+            [
+                {"effect_type": "text_overlay", "parameters": {"text": "ok"}},
+                {"effect_type": "text_overlay", "parameters": {"fontsize": 12}},
+            ],
+        ],
+        start=1,
+    ):
+        await clip_repository.add(
+            Clip(
+                id=f"clip-{i}",
+                project_id="proj-1",
+                source_video_id="video-1",
+                in_point=0,
+                out_point=100,
+                timeline_position=(i - 1) * 100,
+                created_at=now,
+                updated_at=now,
+                effects=effects,
+            )
+        )
+
+    response = client.post("/api/v1/projects/proj-1/effects/validate")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["valid"] is False
+    assert (data["clips_checked"], data["effects_checked"]) == (2, 4)
+    assert [(i["target"], i["target_id"], i["index"]) for i in data["issues"]] == [
+        ("clip", "clip-2", 1),
+        ("transition", "tr-1", 0),
+    ]
+
+
+@pytest.mark.api
+async def test_validate_project_effects_checks_transitions_like_apply(
+    client: TestClient,
+    project_repository: AsyncInMemoryProjectRepository,
+) -> None:
+    """Stored transitions get the same scalar-only check as POST /effects/transition."""
+    now = datetime.now(timezone.utc)
+    parameters = {
+        "transition": "fade",
+        "duration": {"default": 1.0, "keyframes": [{"t": 0, "value": 1.0}]},
+        "offset": 0.0,
+    }
+    await project_repository.add(
+        Project(
+            id="proj-1",
+            name="Test",
+            output_width=1920,
+            output_height=1080,
+            output_fps=30,
+            created_at=now,
+            updated_at=now,
+            transitions=[
+                {"id": "tr-1", "transition_type": "xfade", "parameters": parameters},
+                {"id": "tr-2", "transition_type": "missing_transition", "parameters": {}},
+            ],
+        )
+    )
+    expected = create_default_registry().validate("xfade", parameters)
+
+    response = client.post("/api/v1/projects/proj-1/effects/validate")
+
+    assert response.status_code == 200
+    issues = response.json()["issues"]
+    assert [(i["target_id"], i["effect_type"]) for i in issues] == [
+        ("tr-1", "xfade"),
+        ("tr-2", "missing_transition"),
+    ]
+    assert issues[0]["errors"] == [{"path": e.path, "message": e.message} for e in expected]
+    assert issues[1]["errors"][0]["message"] == "Unknown transition type: missing_transition"
+
+
+@pytest.mark.api
+def test_validate_project_effects_project_not_found_returns_404(client: TestClient) -> None:
+    """Bulk validation of an unknown project returns 404."""
+    response = client.post("/api/v1/projects/nope/effects/validate")
+
+    assert response.status_code == 404
+
+
 @pytest.mark.api
 async def test_apply_effect_unknown_type_returns_400(
     client: TestClient,
@@ -685,6 +837,44 @@ def test_schema_validation_unknown_effect_raises_keyerror() -> None:
         registry.validate("nonexistent", {})
 
 
+@pytest.mark.api
+def test_registry_reuses_precompiled_validator(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Validation does not construct a JSON schema validator per call."""
+    registry = create_default_registry()
+    constructed: list[object] = []
+    original = registry_module.jsonschema.Draft7Validator
+
+    def _counting(schema: Any) -> Any:
+        constructed.append(schema)
+        return original(schema)
+
+    monkeypatch.setattr(registry_module.jsonschema, "Draft7Validator", _counting)
+    for _ in range(3):
+        assert registry.validate("text_overlay", {"text": "Hello"}) == []
+        registry.validate_with_automation("text_overlay", {"text": "Hello"})
+
+    assert constructed == []
+
+
+@pytest.mark.api
+def test_validate_stack_reports_each_invalid_entry() -> None:
+    """validate_stack reports bad entries by index without raising on unknown types."""
+    registry = create_default_registry()
+    stack = [
+        {"effect_type": "text_overlay", "parameters": {"text": "ok"}},
+        {"effect_type": "text_overlay", "parameters": {"text": "x", "fontsize": "big"}},
+        {"effect_type": "nonexistent", "parameters": {}},
+    ]
+
+    invalid = registry.validate_stack(stack)
+
+    assert [(index, effect_type) for index, effect_type, _ in invalid] == [
+        (1, "text_overlay"),
+        (2, "nonexistent"),
+    ]
+    assert invalid[1][2][0].message == "Unknown effect type: nonexistent"
+
+
 # ---- Registry dispatch tests ----
 
 
@@ -13,6 +13,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from stoat_ferret.api.routers.health import _check_ffmpeg
+from stoat_ferret.api.services.health_cache import HealthCache
 from tests.conftest import requires_ffmpeg
 
 
@@ -266,6 +267,69 @@ def test_readiness_structure(client: TestClient) -> None:
         assert "encoder_available" in render_check
 
 
+# ---------------------------------------------------------------------------
+# Readiness caching and concurrency
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.api
+def test_readiness_serves_cached_snapshot(client: TestClient) -> None:
+    """A probe within the snapshot TTL does not rerun the checks."""
+    first = client.get("/health/ready")
+    with patch(
+        "stoat_ferret.api.routers.health._check_database",
+        new_callable=AsyncMock,
+        return_value={"status": "error", "error": "should not run"},
+    ) as mock_db:
+        second = client.get("/health/ready")
+
+    mock_db.assert_not_awaited()
+    assert second.json()["checks"] == first.json()["checks"]
+    assert second.json()["snapshot_age_seconds"] >= 0.0
+
+
+@pytest.mark.api
+def test_readiness_reuses_ffmpeg_probe_across_snapshots(client: TestClient) -> None:
+    """ffmpeg -version runs once per capability TTL, not once per check run."""
+    client.app.state.health_cache = HealthCache.create(  # type: ignore[union-attr]
+        snapshot_ttl_seconds=0.0, capability_ttl_seconds=300.0
+    )
+    with (
+        patch("stoat_ferret.api.routers.health.shutil.which", return_value="/usr/bin/ffmpeg"),
+        patch("stoat_ferret.api.routers.health.subprocess.run") as mock_run,
+    ):
+        mock_run.return_value = MagicMock(stdout="ffmpeg version 6.0 Copyright (c) 2000-2023\n")
+        responses = [client.get("/health/ready") for _ in range(3)]
+
+    assert mock_run.call_count == 1
+    assert all(r.json()["checks"]["ffmpeg"]["version"] == "6.0" for r in responses)
+
+
+@pytest.mark.api
+def test_readiness_checks_run_concurrently(client: TestClient) -> None:
+    """Non-critical checks overlap; run in sequence each would wait forever."""
+    started = 0
+    all_started = asyncio.Event()
+
+    async def _rendezvous(*_: object) -> dict[str, str]:
+        nonlocal started
+        started += 1
+        if started == 3:
+            all_started.set()
+        await all_started.wait()
+        return {"status": "ok"}
+
+    with (
+        patch("stoat_ferret.api.routers.health._check_preview", side_effect=_rendezvous),
+        patch("stoat_ferret.api.routers.health._check_proxy", side_effect=_rendezvous),
+        patch("stoat_ferret.api.routers.health._check_render", side_effect=_rendezvous),
+    ):
+        response = client.get("/health/ready")
+
+    checks = response.json()["checks"]
+    assert [checks[name]["status"] for name in ("preview", "proxy", "render")] == ["ok"] * 3
+
+
 # ---------------------------------------------------------------------------
 # Interface contract tests for _check_ffmpeg()
 # ---------------------------------------------------------------------------
@@ -13,7 +13,7 @@ from __future__ import annotations
 import asyncio
 import json
 from collections.abc import Generator
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -28,6 +28,7 @@ from stoat_ferret.render.encoder_cache import (
     EncoderCacheEntry,
     InMemoryEncoderCacheRepository,
 )
+from stoat_ferret.render.forecast import JobForecast
 from stoat_ferret.render.models import OutputFormat, QualityPreset, RenderJob, RenderStatus
 from stoat_ferret.render.render_repository import InMemoryRenderRepository
 from stoat_ferret.render.service import RenderService
@@ -132,6 +133,7 @@ def mock_render_service(render_repo: InMemoryRenderRepository) -> AsyncMock:
     service.submit_job = AsyncMock(side_effect=fake_submit)
     service.cancel_job = AsyncMock(return_value=True)
     service.recover = AsyncMock(return_value=[])
+    service.forecast_queue = AsyncMock(return_value=[])
     return service
 
 
@@ -240,6 +242,26 @@ class TestCreateRenderJob:
         assert resp.status_code == 400
         assert resp.json()["detail"]["code"] == "INVALID_PRESET"
 
+    def test_create_job_invalid_outputs(self, render_client: TestClient) -> None:
+        """POST /render with repeated output names returns 422."""
+        plan = {"settings": {"outputs": [{"name": "small"}, {"name": "small"}]}}
+        resp = render_client.post(
+            "/api/v1/render",
+            json={"project_id": TEST_PROJECT_UUID, "render_plan": json.dumps(plan)},
+        )
+        assert resp.status_code == 422
+        assert resp.json()["detail"]["code"] == "INVALID_RENDER_OUTPUTS"
+
+    def test_create_job_places_outputs_next_to_primary(
+        self, noop_render_client: TestClient
+    ) -> None:
+        """Extra outputs are written beside the primary output and listed on the job."""
+        plan = {"settings": {"outputs": [{"name": "audio", "output_format": "m4a"}]}}
+        data = _create_job_via_api(noop_render_client, render_plan=json.dumps(plan))
+        [output] = data["outputs"]
+        assert output["name"] == "audio"
+        assert output["output_path"] == data["output_path"].removesuffix(".mp4") + "_audio.m4a"
+
     def test_create_job_preflight_failure(
         self,
         render_client: TestClient,
@@ -368,6 +390,7 @@ class TestListRenderJobs:
             "completed_at",
             "partial_file_detected",
             "warnings",
+            "outputs",
         }
         assert set(item.keys()) == expected_fields
 
@@ -1532,9 +1555,38 @@ class TestGetQueueStatus:
             "disk_total_bytes",
             "completed_today",
             "failed_today",
+            "forecast",
         }
         assert set(resp.json().keys()) == expected_fields
 
+    def test_queue_status_includes_forecast(
+        self,
+        queue_client: TestClient,
+        mock_render_service: AsyncMock,
+    ) -> None:
+        """GET /render/queue returns the render service's per-job forecast."""
+        mock_render_service.forecast_queue.return_value = [
+            JobForecast(
+                job_id="job-1",
+                status="queued",
+                predicted_seconds=60.0,
+                starts_in_seconds=30.0,
+                finishes_in_seconds=90.0,
+                basis="observed",
+            )
+        ]
+        before = datetime.now(timezone.utc)
+
+        resp = queue_client.get("/api/v1/render/queue")
+
+        assert resp.status_code == 200
+        [entry] = resp.json()["forecast"]
+        assert entry["job_id"] == "job-1"
+        assert entry["basis"] == "observed"
+        finishes_at = datetime.fromisoformat(entry["finishes_at"])
+        assert finishes_at - datetime.fromisoformat(entry["starts_at"]) == timedelta(seconds=60)
+        assert finishes_at >= before + timedelta(seconds=90)
+
     def test_queue_unavailable_returns_503(self) -> None:
         """GET /render/queue returns 503 when render queue is not on app.state."""
         app = create_app(render_repository=InMemoryRenderRepository())
@@ -177,3 +177,17 @@ def test_preview_is_stateless(client: TestClient) -> None:
     assert resp1.status_code == 200
     assert resp2.status_code == 200
     assert resp1.json() == resp2.json()
+
+
+def test_preview_command_is_memoized(client: TestClient) -> None:
+    """Repeated settings are served from the preview command cache."""
+    from stoat_ferret.api.routers.render import _preview_command
+
+    payload = {"output_format": "mkv", "quality_preset": "high", "encoder": "libx264"}
+    client.post("/api/v1/render/preview", json=payload)
+    hits = _preview_command.cache_info().hits
+
+    resp = client.post("/api/v1/render/preview", json=payload)
+
+    assert resp.status_code == 200
+    assert _preview_command.cache_info().hits == hits + 1
@@ -139,6 +139,18 @@ class TestSettings:
         errors = exc_info.value.errors()
         assert any(e["loc"] == ("version_retention_count",) for e in errors)
 
+    def test_version_keyframe_interval_default(self) -> None:
+        """Version keyframe interval defaults to 20."""
+        settings = Settings()
+        assert settings.version_keyframe_interval == 20
+
+    def test_version_keyframe_interval_rejects_zero(self) -> None:
+        """Version keyframe interval of 0 is rejected (minimum is 1)."""
+        with pytest.raises(ValidationError) as exc_info:
+            Settings(version_keyframe_interval=0)
+        errors = exc_info.value.errors()
+        assert any(e["loc"] == ("version_keyframe_interval",) for e in errors)
+
     def test_render_mode_default(self) -> None:
         """render_mode defaults to 'real'."""
         settings = Settings()
@@ -242,3 +242,75 @@ def test_system_state_render_repository_absent_valid(
     data = response.json()
     render_summaries = [j for j in data["active_jobs"] if j["job_type"] == "render"]
     assert render_summaries == []
+
+
+@pytest.mark.api
+def test_system_state_etag_returns_304_until_state_changes(
+    client: TestClient,
+    render_repository: InMemoryRenderRepository,
+) -> None:
+    """If-None-Match with the current ETag yields 304 until a job changes."""
+    first = client.get("/api/v1/system/state")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    unchanged = client.get("/api/v1/system/state", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.headers["etag"] == etag
+    assert unchanged.content == b""
+
+    render_job = RenderJob.create(
+        project_id="proj-render-3",
+        output_path="/tmp/out.mp4",
+        output_format=OutputFormat.MP4,
+        quality_preset=QualityPreset.STANDARD,
+        render_plan="{}",
+    )
+    client.portal.call(render_repository.create, render_job)  # type: ignore[union-attr]
+
+    changed = client.get("/api/v1/system/state", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["version"] > first.json()["version"]
+    assert [j["job_id"] for j in changed.json()["active_jobs"]] == [render_job.id]
+
+
+@pytest.mark.api
+def test_system_state_wait_for_version_times_out_with_same_version(
+    client: TestClient,
+) -> None:
+    """A long-poll with no change returns the unchanged state at the deadline."""
+    version = client.get("/api/v1/system/state").json()["version"]
+
+    start = time.perf_counter()
+    response = client.get(
+        "/api/v1/system/state",
+        params={"wait_for_version": version, "timeout": 0.2},
+    )
+    assert time.perf_counter() - start >= 0.2
+    assert response.status_code == 200
+    assert response.json()["version"] == version
+
+
+@pytest.mark.api
+def test_system_state_wait_for_stale_version_returns_immediately(
+    client: TestClient,
+) -> None:
+    """A version the client already moved past returns without waiting."""
+    version = client.get("/api/v1/system/state").json()["version"]
+
+    start = time.perf_counter()
+    response = client.get(
+        "/api/v1/system/state",
+        params={"wait_for_version": version + 50, "timeout": 30},
+    )
+    assert time.perf_counter() - start < 5
+    assert response.status_code == 200
+
+
+@pytest.mark.api
+def test_system_state_rejects_out_of_range_timeout(client: TestClient) -> None:
+    """timeout above 300 s is a 422."""
+    response = client.get("/api/v1/system/state", params={"wait_for_version": 0, "timeout": 301})
+    assert response.status_code == 422
@@ -652,6 +652,168 @@ def test_delete_timeline_clip_project_not_found(client: TestClient) -> None:
     assert data["detail"]["code"] == "NOT_FOUND"
 
 
+# ---------------------------------------------------------------------------
+# POST /projects/{project_id}/timeline/batch
+# ---------------------------------------------------------------------------
+
+
+async def _setup_batch_project(
+    project_repository: AsyncInMemoryProjectRepository,
+    timeline_repository: AsyncInMemoryTimelineRepository,
+    clip_repository: AsyncInMemoryClipRepository,
+) -> None:
+    """Create proj-1 with two tracks and three unplaced clips."""
+    from stoat_ferret.db.models import Project
+
+    await project_repository.add(Project(**_make_project()))  # type: ignore[arg-type]
+    await timeline_repository.create_tracks(
+        [
+            Track(id="track-1", project_id="proj-1", track_type="video", label="V1", z_index=0),
+            Track(id="track-2", project_id="proj-1", track_type="video", label="V2", z_index=1),
+        ]
+    )
+    video = make_test_video()
+    await clip_repository.add_many(
+        [
+            Clip(
+                id=f"clip-{i}",
+                project_id="proj-1",
+                source_video_id=video.id,
+                in_point=0,
+                out_point=100,
+                timeline_position=0,
+                created_at=_NOW,
+                updated_at=_NOW,
+                effects=[{"effect_type": "volume", "parameters": {}, "filter_string": "volume=1"}],
+            )
+            for i in range(1, 4)
+        ]
+    )
+
+
+@pytest.mark.api
+async def test_batch_timeline_applies_operations_in_order(
+    client: TestClient,
+    project_repository: AsyncInMemoryProjectRepository,
+    timeline_repository: AsyncInMemoryTimelineRepository,
+    clip_repository: AsyncInMemoryClipRepository,
+) -> None:
+    """Batch applies every operation, later ones seeing earlier results."""
+    await _setup_batch_project(project_repository, timeline_repository, clip_repository)
+
+    response = client.post(
+        "/api/v1/projects/proj-1/timeline/batch",
+        json={
+            "operations": [
+                {
+                    "op": "add_clip",
+                    "clip_id": "clip-1",
+                    "track_id": "track-1",
+                    "timeline_start": 0.0,
+                    "timeline_end": 5.0,
+                },
+                {
+                    "op": "add_clip",
+                    "clip_id": "clip-2",
+                    "track_id": "track-1",
+                    "timeline_start": 5.0,
+                    "timeline_end": 9.0,
+                },
+                {"op": "update_clip", "clip_id": "clip-2", "track_id": "track-2"},
+                {"op": "remove_effect", "clip_id": "clip-3", "index": 0},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [c["id"] for c in data["tracks"][0]["clips"]] == ["clip-1"]
+    assert [c["id"] for c in data["tracks"][1]["clips"]] == ["clip-2"]
+    assert data["duration"] == 9.0
+    moved = await clip_repository.get("clip-2")
+    assert moved is not None
+    assert moved.track_id == "track-2"
+    stripped = await clip_repository.get("clip-3")
+    assert stripped is not None
+    assert stripped.effects == []
+
+
+@pytest.mark.api
+async def test_batch_timeline_failure_writes_nothing(
+    client: TestClient,
+    project_repository: AsyncInMemoryProjectRepository,
+    timeline_repository: AsyncInMemoryTimelineRepository,
+    clip_repository: AsyncInMemoryClipRepository,
+) -> None:
+    """A failing operation rejects the whole batch and reports its index."""
+    await _setup_batch_project(project_repository, timeline_repository, clip_repository)
+
+    response = client.post(
+        "/api/v1/projects/proj-1/timeline/batch",
+        json={
+            "operations": [
+                {
+                    "op": "add_clip",
+                    "clip_id": "clip-1",
+                    "track_id": "track-1",
+                    "timeline_start": 0.0,
+                    "timeline_end": 5.0,
+                },
+                {"op": "update_clip", "clip_id": "clip-1", "timeline_start": 6.0},
+            ]
+        },
+    )
+
+    assert response.status_code == 422
+    detail = response.json()["detail"]
+    assert detail["code"] == "INVALID_POSITION"
+    assert detail["operation_index"] == 1
+    clip = await clip_repository.get("clip-1")
+    assert clip is not None
+    assert clip.track_id is None
+
+
+@pytest.mark.api
+async def test_batch_timeline_unknown_track(
+    client: TestClient,
+    project_repository: AsyncInMemoryProjectRepository,
+    timeline_repository: AsyncInMemoryTimelineRepository,
+    clip_repository: AsyncInMemoryClipRepository,
+) -> None:
+    """Batch reports TRACK_NOT_FOUND for a track outside the project."""
+    await _setup_batch_project(project_repository, timeline_repository, clip_repository)
+
+    response = client.post(
+        "/api/v1/projects/proj-1/timeline/batch",
+        json={"operations": [{"op": "update_clip", "clip_id": "clip-1", "track_id": "nope"}]},
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"]["code"] == "TRACK_NOT_FOUND"
+    assert response.json()["detail"]["operation_index"] == 0
+
+
+@pytest.mark.api
+def test_batch_timeline_project_not_found(client: TestClient) -> None:
+    """Batch returns 404 for unknown project."""
+    response = client.post(
+        "/api/v1/projects/nonexistent/timeline/batch",
+        json={"operations": [{"op": "remove_clip", "clip_id": "clip-1"}]},
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"]["code"] == "NOT_FOUND"
+
+
+@pytest.mark.api
+def test_batch_timeline_rejects_unknown_op(client: TestClient) -> None:
+    """Batch rejects operations with an unknown op discriminator."""
+    response = client.post(
+        "/api/v1/projects/proj-1/timeline/batch",
+        json={"operations": [{"op": "explode", "clip_id": "clip-1"}]},
+    )
+    assert response.status_code == 422
+
+
 # ---------------------------------------------------------------------------
 # Full CRUD workflow (black box)
 # ---------------------------------------------------------------------------
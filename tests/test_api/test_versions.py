@@ -5,11 +5,13 @@
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 
 import pytest
 from fastapi.testclient import TestClient
 
+from stoat_ferret.api.routers import versions as versions_router
 from stoat_ferret.api.settings import get_settings
 from stoat_ferret.db.models import Project
 from stoat_ferret.db.project_repository import AsyncInMemoryProjectRepository
@@ -307,3 +309,160 @@ async def test_retention_per_project_isolation(
 
     # Cleanup
     get_settings.cache_clear()
+
+
+def _timeline_json(**clip_starts: float) -> str:
+    """Build a one-track timeline snapshot with the given clip starts."""
+    clips = [{"id": cid, "timeline_start": start} for cid, start in clip_starts.items()]
+    return json.dumps({"project_id": "proj-v1", "tracks": [{"id": "t1", "clips": clips}]})
+
+
+@pytest.mark.api
+async def test_diff_versions_reports_structural_changes(
+    client: TestClient,
+    project_repository: AsyncInMemoryProjectRepository,
+    version_repository: AsyncInMemoryVersionRepository,
+) -> None:
+    """Diff lists only the changed clip fields, addressed by id."""
+    project_id = await _seed_project(project_repository)
+    await version_repository.save(project_id, _timeline_json(c1=0.0, c2=5.0))
+    await version_repository.save(project_id, _timeline_json(c1=0.0, c2=8.0, c3=12.0))
+
+    response = client.get(f"/api/v1/projects/{project_id}/versions/1/diff/2")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["identical"] is False
+    assert data["changes"] == [
+        {
+            "op": "replace",
+            "path": "/tracks/t1/clips/c2/timeline_start",
+            "before": 5.0,
+            "after": 8.0,
+        },
+        {
+            "op": "add",
+            "path": "/tracks/t1/clips/c3",
+            "before": None,
+            "after": {"id": "c3", "timeline_start": 12.0},
+        },
+    ]
+
+
+@pytest.mark.api
+async def test_diff_versions_identical_by_checksum(
+    client: TestClient,
+    project_repository: AsyncInMemoryProjectRepository,
+    version_repository: AsyncInMemoryVersionRepository,
+) -> None:
+    """Versions with the same checksum are reported identical without changes."""
+    project_id = await _seed_project(project_repository)
+    await version_repository.save(project_id, _timeline_json(c1=0.0))
+    await version_repository.save(project_id, _timeline_json(c1=0.0))
+
+    response = client.get(f"/api/v1/projects/{project_id}/versions/1/diff/2")
+
+    assert response.status_code == 200
+    assert response.json()["identical"] is True
+    assert response.json()["changes"] == []
+
+
+@pytest.mark.api
+async def test_diff_versions_not_found(
+    client: TestClient,
+    project_repository: AsyncInMemoryProjectRepository,
+) -> None:
+    """Diff against a missing version returns 404."""
+    project_id = await _seed_project(project_repository)
+
+    response = client.get(f"/api/v1/projects/{project_id}/versions/1/diff/2")
+
+    assert response.status_code == 404
+    assert response.json()["detail"]["code"] == "PROJECT_VERSION_NOT_FOUND"
+
+
+@pytest.mark.api
+async def test_merge_versions_combines_changes(
+    client: TestClient,
+    project_repository: AsyncInMemoryProjectRepository,
+    version_repository: AsyncInMemoryVersionRepository,
+) -> None:
+    """Disjoint edits from two versions merge into a new version."""
+    project_id = await _seed_project(project_repository)
+    await version_repository.save(project_id, _timeline_json(c1=0.0, c2=5.0))
+    await version_repository.save(project_id, _timeline_json(c1=1.0, c2=5.0))
+    await version_repository.save(project_id, _timeline_json(c1=0.0, c2=6.0))
+
+    response = client.post(
+        f"/api/v1/projects/{project_id}/versions/merge",
+        json={"base_version": 1, "ours_version": 2, "theirs_version": 3},
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["version_number"] == 4
+    assert data["changes_applied"] == 2
+    assert data["conflicts"] == []
+    merged = await version_repository.get_version(project_id, 4)
+    assert merged is not None
+    assert json.loads(merged.timeline_json) == json.loads(_timeline_json(c1=1.0, c2=6.0))
+
+
+@pytest.mark.api
+async def test_merge_versions_conflict_returns_409(
+    client: TestClient,
+    project_repository: AsyncInMemoryProjectRepository,
+    version_repository: AsyncInMemoryVersionRepository,
+) -> None:
+    """Conflicting edits fail with 409 unless a strategy is given."""
+    project_id = await _seed_project(project_repository)
+    await version_repository.save(project_id, _timeline_json(c1=0.0))
+    await version_repository.save(project_id, _timeline_json(c1=1.0))
+    await version_repository.save(project_id, _timeline_json(c1=2.0))
+    body = {"base_version": 1, "ours_version": 2, "theirs_version": 3}
+
+    conflict = client.post(f"/api/v1/projects/{project_id}/versions/merge", json=body)
+    resolved = client.post(
+        f"/api/v1/projects/{project_id}/versions/merge",
+        json={**body, "strategy": "theirs"},
+    )
+
+    assert conflict.status_code == 409
+    detail = conflict.json()["detail"]
+    assert detail["code"] == "VERSION_MERGE_CONFLICT"
+    assert detail["conflicts"][0]["path"] == "/tracks/t1/clips/c1/timeline_start"
+    assert resolved.status_code == 201
+    assert len(resolved.json()["conflicts"]) == 1
+    merged = await version_repository.get_version(project_id, resolved.json()["version_number"])
+    assert merged is not None
+    assert json.loads(merged.timeline_json) == json.loads(_timeline_json(c1=2.0))
+
+
+@pytest.mark.api
+async def test_merge_versions_unapplicable_changes_return_409(
+    client: TestClient,
+    project_repository: AsyncInMemoryProjectRepository,
+    version_repository: AsyncInMemoryVersionRepository,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Changes that do not apply to the base fail with 409, not a server error."""
+    project_id = await _seed_project(project_repository)
+    await version_repository.save(project_id, _timeline_json(c1=0.0, c2=5.0))
+    await version_repository.save(project_id, _timeline_json(c1=1.0, c2=5.0))
+    await version_repository.save(project_id, _timeline_json(c1=0.0, c2=6.0))
+
+    def _unapplicable(*_args: object, **_kwargs: object) -> None:
+        raise ValueError("Cannot apply replace at /tracks/t1/clips/c9")
+
+    monkeypatch.setattr(versions_router, "merge_snapshots", _unapplicable)
+
+    response = client.post(
+        f"/api/v1/projects/{project_id}/versions/merge",
+        json={"base_version": 1, "ours_version": 2, "theirs_version": 3},
+    )
+
+    assert response.status_code == 409
+    detail = response.json()["detail"]
+    assert detail["code"] == "VERSION_MERGE_NOT_APPLICABLE"
+    assert "/tracks/t1/clips/c9" in detail["message"]
+    assert await version_repository.get_version(project_id, 4) is None
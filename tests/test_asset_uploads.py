@@ -0,0 +1,218 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Unit tests for streaming and resumable asset upload helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from stoat_ferret.api.services.asset_uploads import (
+    UPLOAD_CHUNK_BYTES,
+    AssetUploadStore,
+    InvalidMultipartError,
+    UploadBusyError,
+    UploadOffsetMismatchError,
+    UploadTooLargeError,
+    open_upload_store,
+    spool_form_file,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
+_BOUNDARY = "stoatboundary"
+_FORM_CONTENT_TYPE = f"multipart/form-data; boundary={_BOUNDARY}"
+
+
+def _form_body(data: bytes, *, field: str = "file", extra_field: bool = True) -> bytes:
+    parts = []
+    if extra_field:
+        parts.append(
+            f'--{_BOUNDARY}\r\nContent-Disposition: form-data; name="note"\r\n\r\nhi\r\n'.encode()
+        )
+    parts.append(
+        (
+            f"--{_BOUNDARY}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="clip.wav"\r\n'
+            "Content-Type: audio/wav\r\n\r\n"
+        ).encode()
+        + data
+        + f"\r\n--{_BOUNDARY}--\r\n".encode()
+    )
+    return b"".join(parts)
+
+
+def _split(body: bytes, size: int) -> list[bytes]:
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+async def test_spool_form_file_hashes_while_streaming(tmp_path: Path) -> None:
+    """The file part is spooled and hashed across chunk boundaries; other fields are ignored."""
+    data = os.urandom(UPLOAD_CHUNK_BYTES * 2 + 17)
+    body = _form_body(data)
+
+    spooled = await spool_form_file(
+        _chunks(*_split(body, 64 * 1024 + 3)), _FORM_CONTENT_TYPE, tmp_path / "parts", len(data)
+    )
+
+    assert spooled is not None
+    assert spooled.size_bytes == len(data)
+    assert spooled.sha256 == hashlib.sha256(data).hexdigest()
+    assert spooled.path.read_bytes() == data
+    assert spooled.path.parent == tmp_path / "parts"
+    assert spooled.filename == "clip.wav"
+    assert spooled.content_type == "audio/wav"
+
+
+async def test_spool_form_file_stops_mid_stream_over_limit(tmp_path: Path) -> None:
+    """Exceeding the limit raises before the rest of the body is read and leaves nothing behind."""
+    body = _form_body(b"x" * 100_000)
+    chunks = _split(body, 1000)
+    consumed = 0
+
+    async def stream() -> AsyncIterator[bytes]:
+        nonlocal consumed
+        for chunk in chunks:
+            consumed += 1
+            yield chunk
+
+    with pytest.raises(UploadTooLargeError):
+        await spool_form_file(stream(), _FORM_CONTENT_TYPE, tmp_path, 10_000)
+    assert consumed < len(chunks)
+    assert os.listdir(tmp_path) == []
+
+
+async def test_spool_form_file_missing_field_or_bad_body(tmp_path: Path) -> None:
+    """A form without the field yields None; a non-multipart or malformed body raises."""
+    body = _form_body(b"data", field="other")
+    assert await spool_form_file(_chunks(body), _FORM_CONTENT_TYPE, tmp_path, 100) is None
+
+    with pytest.raises(InvalidMultipartError):
+        await spool_form_file(_chunks(b"{}"), "application/json", tmp_path, 100)
+    with pytest.raises(InvalidMultipartError):
+        await spool_form_file(_chunks(b"junk"), _FORM_CONTENT_TYPE, tmp_path, 100)
+    assert os.listdir(tmp_path) == []
+
+
+async def test_append_buffers_and_hashes_incrementally(tmp_path: Path) -> None:
+    """Ranges from several requests accumulate into one file and digest."""
+    store = AssetUploadStore(tmp_path, ttl_seconds=60)
+    session = store.create(kind="audio", filename="bed.wav")
+    first = os.urandom(UPLOAD_CHUNK_BYTES + 5)
+    second = b"tail"
+
+    offset = await store.append(
+        session, _chunks(first[:100], first[100:]), offset=0, max_bytes=10**9
+    )
+    offset = await store.append(session, _chunks(second), offset=offset, max_bytes=10**9)
+
+    assert offset == len(first) + len(second)
+    assert session.sha256 == hashlib.sha256(first + second).hexdigest()
+    assert session.path.read_bytes() == first + second
+
+
+async def test_append_offset_and_concurrency_checks(tmp_path: Path) -> None:
+    """Wrong offsets and overlapping appends are rejected without writing."""
+    store = AssetUploadStore(tmp_path, ttl_seconds=60)
+    session = store.create(kind="font", filename="a.ttf")
+    await store.append(session, _chunks(b"abcd"), offset=0, max_bytes=100)
+
+    with pytest.raises(UploadOffsetMismatchError) as excinfo:
+        await store.append(session, _chunks(b"zz"), offset=0, max_bytes=100)
+    assert excinfo.value.offset == 4
+
+    gate = asyncio.Event()
+
+    async def slow() -> AsyncIterator[bytes]:
+        await gate.wait()
+        yield b"efgh"
+
+    running = asyncio.create_task(store.append(session, slow(), offset=4, max_bytes=100))
+    await asyncio.sleep(0)
+    with pytest.raises(UploadBusyError):
+        await store.append(session, _chunks(b"x"), offset=4, max_bytes=100)
+    gate.set()
+    assert await running == 8
+    assert session.path.read_bytes() == b"abcdefgh"
+
+
+async def test_append_past_declared_size_discards_session(tmp_path: Path) -> None:
+    """Going past the declared size raises 413-style and drops the session."""
+    store = AssetUploadStore(tmp_path, ttl_seconds=60)
+    session = store.create(kind="lut", filename="a.cube", size_bytes=4)
+
+    with pytest.raises(UploadTooLargeError):
+        await store.append(session, _chunks(b"abc", b"de"), offset=0, max_bytes=100)
+
+    assert store.get(session.id) is None
+    assert not session.path.exists()
+
+
+def test_idle_sessions_expire_and_orphans_are_swept(tmp_path: Path) -> None:
+    """Idle sessions are discarded; stale part files from a restart are removed."""
+    orphan = tmp_path / "old.part"
+    orphan.write_bytes(b"x")
+    stale = time.time() - 120
+    os.utime(orphan, (stale, stale))
+    fresh = tmp_path / "fresh.tmp"
+    fresh.write_bytes(b"x")
+
+    clock = _Clock()
+    store = AssetUploadStore(tmp_path, ttl_seconds=60, clock=clock)
+    assert not orphan.exists()
+    assert fresh.exists()
+
+    session = store.create(kind="audio", filename="a.wav")
+    clock.now += 30
+    assert store.remaining_seconds(session) == 30
+    clock.now += 31
+    assert store.get(session.id) is None
+    assert not session.path.exists()
+
+
+async def test_open_upload_store_sweeps_in_worker_thread(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The startup sweep of orphaned part files runs off the event loop."""
+    orphan = tmp_path / "parts" / "old.part"
+    orphan.parent.mkdir()
+    orphan.write_bytes(b"x")
+    stale = time.time() - 120
+    os.utime(orphan, (stale, stale))
+    loop = asyncio.get_running_loop()
+    sweep = AssetUploadStore._sweep_orphans
+    swept_on_loop: list[bool] = []
+
+    def recording_sweep(self: AssetUploadStore) -> None:
+        try:
+            swept_on_loop.append(asyncio.get_running_loop() is loop)
+        except RuntimeError:
+            swept_on_loop.append(False)
+        sweep(self)
+
+    monkeypatch.setattr(AssetUploadStore, "_sweep_orphans", recording_sweep)
+
+    store = await open_upload_store(tmp_path / "parts", ttl_seconds=60)
+
+    assert store.parts_dir == tmp_path / "parts"
+    assert swept_on_loop == [False]
+    assert not orphan.exists()
@@ -238,6 +238,70 @@ class TestAsyncUpdate:
         assert await repository.get_by_path("/videos/new.mp4") is not None
 
 
+@pytest.mark.contract
+class TestAsyncUpdateFingerprint:
+    """Tests for async update_fingerprint() method."""
+
+    async def test_updates_only_fingerprint_columns(self, repository: AsyncRepositoryType) -> None:
+        """Fingerprint columns change; every other column keeps its stored value."""
+        video = make_test_video()
+        await repository.add(video)
+        await repository.update(replace(video, filename="renamed.mp4"))
+
+        updated = await repository.update_fingerprint(
+            video.id,
+            path=video.path,
+            file_size=42,
+            file_mtime_ns=123,
+            file_inode=7,
+            sampled_sha256="ab" * 32,
+            content_sha256="cd" * 32,
+        )
+
+        assert updated is True
+        retrieved = await repository.get(video.id)
+        assert retrieved is not None
+        assert retrieved.filename == "renamed.mp4"
+        assert retrieved.file_size == 42
+        assert retrieved.file_mtime_ns == 123
+        assert retrieved.file_inode == 7
+        assert retrieved.sampled_sha256 == "ab" * 32
+        assert retrieved.content_sha256 == "cd" * 32
+
+    async def test_path_mismatch_is_skipped(self, repository: AsyncRepositoryType) -> None:
+        """A fingerprint taken from an old path is not written to a moved row."""
+        video = make_test_video()
+        await repository.add(video)
+
+        updated = await repository.update_fingerprint(
+            video.id,
+            path="/videos/elsewhere.mp4",
+            file_size=42,
+            file_mtime_ns=123,
+            file_inode=7,
+            sampled_sha256=None,
+            content_sha256=None,
+        )
+
+        assert updated is False
+        retrieved = await repository.get(video.id)
+        assert retrieved is not None
+        assert retrieved.file_size == video.file_size
+
+    async def test_nonexistent_returns_false(self, repository: AsyncRepositoryType) -> None:
+        """Updating the fingerprint of a missing video returns False."""
+        updated = await repository.update_fingerprint(
+            "nonexistent-id",
+            path="/videos/none.mp4",
+            file_size=1,
+            file_mtime_ns=None,
+            file_inode=None,
+            sampled_sha256=None,
+            content_sha256=None,
+        )
+        assert updated is False
+
+
 @pytest.mark.contract
 class TestAsyncCount:
     """Tests for async count() method."""
@@ -9,13 +9,13 @@ import asyncio
 import json
 import sqlite3
 from dataclasses import replace
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import aiosqlite
 import pytest
 
-from stoat_ferret.db.audit import AuditLogger
+from stoat_ferret.db.audit import AuditLogger, BufferedAuditLogger, audit_entries_dropped_total
 from stoat_ferret.db.models import AuditEntry, Video
 from stoat_ferret.db.repository import SQLiteVideoRepository
 from stoat_ferret.db.schema import create_tables
@@ -138,6 +138,214 @@ class TestAuditLogger:
         assert history[0].entity_id == "entity-1"
 
 
+class TestAuditRetention:
+    """Tests for AuditLogger.purge_before."""
+
+    def _insert_at(self, conn: sqlite3.Connection, entity_id: str, when: datetime) -> None:
+        conn.execute(
+            "INSERT INTO audit_log (id, timestamp, operation, entity_type, entity_id)"
+            " VALUES (?, ?, 'INSERT', 'video', ?)",
+            (AuditEntry.new_id(), when.isoformat(), entity_id),
+        )
+        conn.commit()
+
+    def test_purge_deletes_only_older_entries(
+        self, conn: sqlite3.Connection, audit_logger: AuditLogger
+    ) -> None:
+        """Entries before the cutoff are deleted across several day slices."""
+        now = datetime.now(timezone.utc)
+        for days in (40, 35, 31):
+            self._insert_at(conn, "old", now - timedelta(days=days))
+        self._insert_at(conn, "recent", now - timedelta(days=1))
+
+        deleted = audit_logger.purge_before(now - timedelta(days=30))
+
+        assert deleted == 3
+        assert audit_logger.get_history("old") == []
+        assert len(audit_logger.get_history("recent")) == 1
+
+    def test_purge_on_empty_table_is_noop(self, audit_logger: AuditLogger) -> None:
+        """An empty audit log purges nothing."""
+        assert audit_logger.purge_before(datetime.now(timezone.utc)) == 0
+
+
+class TestBufferedAuditLogger:
+    """Tests for batched background audit writes."""
+
+    @pytest.fixture
+    def shared_conn(self, tmp_path: Path) -> sqlite3.Connection:
+        """Provide a file-backed connection usable from the writer thread."""
+        connection = sqlite3.connect(str(tmp_path / "audit.db"), check_same_thread=False)
+        create_tables(connection)
+        return connection
+
+    def _row_count(self, conn: sqlite3.Connection) -> int:
+        return int(conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0])
+
+    async def test_log_change_queues_without_writing(self, shared_conn: sqlite3.Connection) -> None:
+        """Entries are queued, visible via get_history, and written on flush."""
+        audit = BufferedAuditLogger(shared_conn)
+        audit.log_change("INSERT", "video", "v1")
+        audit.log_change("UPDATE", "video", "v1", {"width": {"old": 1, "new": 2}})
+
+        assert self._row_count(shared_conn) == 0
+        assert [e.operation for e in audit.get_history("v1")] == ["UPDATE", "INSERT"]
+
+        await audit.flush()
+        assert self._row_count(shared_conn) == 2
+        assert audit.pending == 0
+        assert [e.operation for e in audit.get_history("v1")] == ["UPDATE", "INSERT"]
+
+    async def test_aget_history_does_not_block_the_loop(
+        self, shared_conn: sqlite3.Connection
+    ) -> None:
+        """A history read waiting on a commit in progress leaves the loop free."""
+        audit = BufferedAuditLogger(shared_conn)
+        audit.log_change("INSERT", "video", "v1")
+
+        audit._conn_lock.acquire()
+        try:
+            read = asyncio.create_task(audit.aget_history("v1"))
+            await asyncio.sleep(0.05)
+            assert not read.done()
+        finally:
+            audit._conn_lock.release()
+
+        assert [e.operation for e in await read] == ["INSERT"]
+
+    async def test_purge_releases_lock_between_slices(
+        self, shared_conn: sqlite3.Connection
+    ) -> None:
+        """Each purge slice takes the connection lock on its own."""
+        now = datetime.now(timezone.utc)
+        for days in (5, 4, 3):
+            shared_conn.execute(
+                "INSERT INTO audit_log (id, timestamp, operation, entity_type, entity_id)"
+                " VALUES (?, ?, 'INSERT', 'video', 'old')",
+                (AuditEntry.new_id(), (now - timedelta(days=days)).isoformat()),
+            )
+        shared_conn.commit()
+        audit = BufferedAuditLogger(shared_conn)
+        delete_before = audit._delete_before
+        held: list[bool] = []
+
+        def recording_delete(end: datetime) -> int:
+            held.append(audit._conn_lock.locked())
+            return delete_before(end)
+
+        audit._delete_before = recording_delete  # type: ignore[method-assign]
+
+        assert audit.purge_before(now - timedelta(days=1)) == 3
+        assert len(held) > 1
+        assert not any(held)
+        assert audit.stats.purged == 3
+
+    async def test_batches_split_by_batch_size(self, shared_conn: sqlite3.Connection) -> None:
+        """Each transaction holds at most batch_size entries."""
+        audit = BufferedAuditLogger(shared_conn, batch_size=4)
+        for i in range(10):
+            audit.log_change("INSERT", "video", f"v{i}")
+
+        await audit.flush()
+
+        assert audit.stats.written == 10
+        assert audit.stats.batches == 3
+
+    async def test_full_queue_drops_entries(self, shared_conn: sqlite3.Connection) -> None:
+        """Entries beyond max_pending are dropped and counted, not blocked on."""
+        audit = BufferedAuditLogger(shared_conn, max_pending=3)
+        before = audit_entries_dropped_total._value.get()
+        for i in range(5):
+            audit.log_change("INSERT", "video", f"v{i}")
+
+        assert audit.pending == 3
+        assert audit.stats.dropped == 2
+        assert audit_entries_dropped_total._value.get() == before + 2
+        await audit.flush()
+        assert self._row_count(shared_conn) == 3
+
+    async def test_writer_survives_unexpected_error(self, shared_conn: sqlite3.Connection) -> None:
+        """A non-SQLite failure in a flush is logged and the writer keeps running."""
+        audit = BufferedAuditLogger(shared_conn, flush_interval_s=0.01)
+        write_batch = audit._write_batch
+        calls = 0
+
+        def flaky_write(batch: list[AuditEntry]) -> None:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("unexpected")
+            write_batch(batch)
+
+        audit._write_batch = flaky_write  # type: ignore[method-assign]
+        await audit.start()
+        try:
+            audit.log_change("INSERT", "video", "v1")
+            for _ in range(100):
+                if calls:
+                    break
+                await asyncio.sleep(0.01)
+            audit.log_change("INSERT", "video", "v2")
+            for _ in range(100):
+                if audit.stats.written:
+                    break
+                await asyncio.sleep(0.01)
+            assert audit._task is not None
+            assert not audit._task.done()
+        finally:
+            await audit.aclose()
+
+        assert self._row_count(shared_conn) == 1
+
+    async def test_background_task_writes_after_interval(
+        self, shared_conn: sqlite3.Connection
+    ) -> None:
+        """The writer task drains the queue without an explicit flush."""
+        audit = BufferedAuditLogger(shared_conn, flush_interval_s=0.01)
+        await audit.start()
+        try:
+            audit.log_change("INSERT", "video", "v1")
+            for _ in range(100):
+                if audit.stats.written:
+                    break
+                await asyncio.sleep(0.01)
+            assert self._row_count(shared_conn) == 1
+        finally:
+            await audit.aclose()
+
+    async def test_aclose_writes_remaining_entries(self, shared_conn: sqlite3.Connection) -> None:
+        """Shutdown flushes everything still queued."""
+        audit = BufferedAuditLogger(shared_conn, flush_interval_s=60.0)
+        await audit.start()
+        for i in range(3):
+            audit.log_change("DELETE", "video", f"v{i}")
+
+        await audit.aclose()
+
+        assert self._row_count(shared_conn) == 3
+
+    async def test_retention_purges_in_background(self, shared_conn: sqlite3.Connection) -> None:
+        """With retention set, the writer task purges expired entries."""
+        shared_conn.execute(
+            "INSERT INTO audit_log (id, timestamp, operation, entity_type, entity_id)"
+            " VALUES ('old', ?, 'INSERT', 'video', 'v-old')",
+            ((datetime.now(timezone.utc) - timedelta(days=10)).isoformat(),),
+        )
+        shared_conn.commit()
+        audit = BufferedAuditLogger(shared_conn, flush_interval_s=0.01, retention=timedelta(days=7))
+        await audit.start()
+        try:
+            for _ in range(100):
+                if audit.stats.purged:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await audit.aclose()
+
+        assert audit.stats.purged == 1
+        assert self._row_count(shared_conn) == 0
+
+
 class TestAuditEntry:
     """Tests for the AuditEntry model."""
 
@@ -381,3 +589,27 @@ class TestLifespanAuditWiring:
         # Attempting to use it should raise ProgrammingError
         with pytest.raises(sqlite3.ProgrammingError):
             audit._conn.execute("SELECT 1")
+
+    def test_lifespan_flushes_buffered_audit_on_shutdown(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Entries still buffered at shutdown are written before the connection closes."""
+        from fastapi.testclient import TestClient
+
+        from stoat_ferret.api.app import create_app
+
+        db_path = tmp_path / "test.db"
+        monkeypatch.setenv("STOAT_DATABASE_PATH", str(db_path))
+        monkeypatch.setenv("STOAT_AUDIT_FLUSH_INTERVAL_MS", "60000")
+
+        app = create_app()
+        with TestClient(app):
+            audit = app.state.audit_logger
+            assert isinstance(audit, BufferedAuditLogger)
+            audit.log_change("INSERT", "video", "flushed-on-shutdown")
+
+        with sqlite3.connect(str(db_path)) as check:
+            rows = check.execute(
+                "SELECT COUNT(*) FROM audit_log WHERE entity_id = 'flushed-on-shutdown'"
+            ).fetchone()
+        assert rows[0] == 1
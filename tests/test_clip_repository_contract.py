@@ -205,6 +205,70 @@ class TestAsyncClipUpdate:
             await clip_repository.update(clip)
 
 
+@pytest.mark.contract
+class TestAsyncClipBulkWrites:
+    """Tests for add_many() and update_many() methods."""
+
+    async def test_add_many(self, clip_repository: AsyncClipRepositoryType) -> None:
+        """add_many inserts every clip."""
+        clips = [make_test_clip(timeline_position=i * 100) for i in range(3)]
+        await clip_repository.add_many(clips)
+
+        listed = await clip_repository.list_by_project("project-1")
+        assert [c.id for c in listed] == [c.id for c in clips]
+
+    async def test_add_many_duplicate_adds_nothing(
+        self, clip_repository: AsyncClipRepositoryType
+    ) -> None:
+        """A duplicate ID in the batch raises ValueError and no clip is added."""
+        existing = make_test_clip()
+        await clip_repository.add(existing)
+        fresh = make_test_clip(timeline_position=100)
+
+        with pytest.raises(ValueError):
+            await clip_repository.add_many([fresh, make_test_clip(id=existing.id)])
+
+        assert await clip_repository.get(fresh.id) is None
+
+    async def test_update_many_persists_fields_and_effects(
+        self, clip_repository: AsyncClipRepositoryType
+    ) -> None:
+        """update_many writes timeline fields and effects for every clip."""
+        clips = [make_test_clip(timeline_position=i * 100) for i in range(2)]
+        await clip_repository.add_many(clips)
+
+        effects = [{"effect_type": "volume", "parameters": {"volume": 0.5}, "filter_string": "x"}]
+        await clip_repository.update_many(
+            [
+                replace(clips[0], timeline_start=1.0, timeline_end=2.0),
+                replace(clips[1], effects=effects),
+            ]
+        )
+
+        first = await clip_repository.get(clips[0].id)
+        second = await clip_repository.get(clips[1].id)
+        assert first is not None
+        assert second is not None
+        assert (first.timeline_start, first.timeline_end) == (1.0, 2.0)
+        assert second.effects == effects
+
+    async def test_update_many_missing_clip_updates_nothing(
+        self, clip_repository: AsyncClipRepositoryType
+    ) -> None:
+        """A missing clip in the batch raises ValueError and nothing is updated."""
+        clip = make_test_clip()
+        await clip_repository.add(clip)
+
+        with pytest.raises(ValueError):
+            await clip_repository.update_many(
+                [replace(clip, timeline_position=999), make_test_clip()]
+            )
+
+        retrieved = await clip_repository.get(clip.id)
+        assert retrieved is not None
+        assert retrieved.timeline_position == 0
+
+
 @pytest.mark.contract
 class TestAsyncClipDelete:
     """Tests for async delete() method."""
@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for the SQLite read-pool / single-writer connection manager."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import aiosqlite
+import pytest
+
+from stoat_ferret.db.connection_pool import SQLiteConnectionPool, is_read_only_statement
+
+
+@pytest.fixture
+async def pool(tmp_path: Path) -> AsyncGenerator[SQLiteConnectionPool, None]:
+    """Open a two-reader pool on a file database with one table."""
+    async with SQLiteConnectionPool(tmp_path / "pool.db", read_pool_size=2) as opened:
+        await opened.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        await opened.commit()
+        yield opened
+
+
+@pytest.mark.parametrize(
+    ("sql", "expected"),
+    [
+        ("SELECT * FROM items", True),
+        ("  select 1", True),
+        ("-- comment\nSELECT 1", True),
+        ("WITH x AS (SELECT 1) SELECT * FROM x", True),
+        ("WITH x AS (SELECT 1) INSERT INTO items SELECT * FROM x", False),
+        ("INSERT INTO items VALUES (1, 'a')", False),
+        ("PRAGMA foreign_keys=ON", False),
+        ("CREATE TABLE t (x)", False),
+    ],
+)
+def test_is_read_only_statement(sql: str, expected: bool) -> None:
+    """Only SELECT and non-modifying WITH queries are routed to readers."""
+    assert is_read_only_statement(sql) is expected
+
+
+async def test_open_applies_pragmas(pool: SQLiteConnectionPool) -> None:
+    """The writer runs in WAL with synchronous=NORMAL and FK enforcement."""
+    journal = await (await pool.writer.execute("PRAGMA journal_mode")).fetchone()
+    synchronous = await (await pool.writer.execute("PRAGMA synchronous")).fetchone()
+    foreign_keys = await (await pool.writer.execute("PRAGMA foreign_keys")).fetchone()
+    busy = await (await pool.writer.execute("PRAGMA busy_timeout")).fetchone()
+
+    assert journal is not None
+    assert synchronous is not None
+    assert foreign_keys is not None
+    assert busy is not None
+    assert (journal[0], synchronous[0], foreign_keys[0], busy[0]) == ("wal", 1, 1, 5000)
+    assert pool.read_pool_size == 2
+
+
+async def test_reads_route_to_readers(pool: SQLiteConnectionPool) -> None:
+    """Committed rows are read through the read-only pool."""
+    await pool.execute("INSERT INTO items (name) VALUES (?)", ("a",))
+    await pool.commit()
+
+    cursor = await pool.execute("SELECT name FROM items")
+    rows = await cursor.fetchall()
+
+    assert [row["name"] for row in rows] == ["a"]
+    assert pool.stats.reads_routed == 1
+    assert pool.stats.reads_on_writer == 0
+
+
+async def test_uncommitted_writes_are_read_from_writer(pool: SQLiteConnectionPool) -> None:
+    """A task reads its own uncommitted writes, then returns to the readers."""
+    await pool.execute("INSERT INTO items (name) VALUES (?)", ("pending",))
+
+    cursor = await pool.execute("SELECT COUNT(*) FROM items")
+    row = await cursor.fetchone()
+    assert row is not None
+    assert row[0] == 1
+    assert pool.stats.reads_on_writer == 1
+
+    await pool.commit()
+    await pool.execute("SELECT COUNT(*) FROM items")
+    assert pool.stats.reads_routed == 1
+
+
+async def test_other_tasks_do_not_see_uncommitted_writes(pool: SQLiteConnectionPool) -> None:
+    """Readers only observe committed data written by another task."""
+
+    async def write_without_commit() -> None:
+        await pool.execute("INSERT INTO items (name) VALUES (?)", ("pending",))
+
+    await asyncio.create_task(write_without_commit())
+
+    row = await (await pool.execute("SELECT COUNT(*) FROM items")).fetchone()
+    assert row is not None
+    assert row[0] == 0
+    assert pool.in_transaction
+    await pool.rollback()
+
+
+async def test_readers_are_read_only(pool: SQLiteConnectionPool) -> None:
+    """Reader connections reject writes even if one slips through routing."""
+    reader = pool._readers[0]
+    with pytest.raises(sqlite3.OperationalError):
+        await reader.execute("INSERT INTO items (name) VALUES ('x')")
+
+
+async def test_concurrent_commits_are_coalesced(tmp_path: Path) -> None:
+    """Commits queued behind an in-progress commit share the next COMMIT."""
+    async with SQLiteConnectionPool(
+        tmp_path / "group.db", read_pool_size=1, commit_window_ms=20
+    ) as pool:
+        await pool.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        await pool.commit()
+        executed_before = pool.stats.commits_executed
+
+        async def write(n: int) -> None:
+            await pool.execute("INSERT INTO items (name) VALUES (?)", (f"row{n}",))
+            await pool.commit()
+
+        await asyncio.gather(*(write(n) for n in range(10)))
+
+        assert pool.stats.commits_executed - executed_before < 10
+        row = await (await pool.execute("SELECT COUNT(*) FROM items")).fetchone()
+        assert row is not None
+        assert row[0] == 10
+        assert not pool.in_transaction
+
+
+async def test_row_factory_propagates(pool: SQLiteConnectionPool) -> None:
+    """Setting row_factory on the pool applies it to every connection."""
+    pool.row_factory = None
+    row = await (await pool.execute("SELECT 1 AS one")).fetchone()
+    assert row == (1,)
+    pool.row_factory = aiosqlite.Row
+
+
+async def test_memory_database_uses_writer_only() -> None:
+    """In-memory databases cannot be shared, so no readers are opened."""
+    async with SQLiteConnectionPool(":memory:", read_pool_size=4) as pool:
+        await pool.execute("CREATE TABLE t (x INTEGER)")
+        await pool.execute("INSERT INTO t VALUES (1)")
+        await pool.commit()
+        row = await (await pool.execute("SELECT x FROM t")).fetchone()
+
+        assert pool.read_pool_size == 0
+        assert row is not None
+        assert row["x"] == 1
+
+
+async def test_use_before_open_raises(tmp_path: Path) -> None:
+    """Statements on an unopened pool fail clearly."""
+    pool = SQLiteConnectionPool(tmp_path / "closed.db")
+    with pytest.raises(RuntimeError, match="not open"):
+        await pool.execute("CREATE TABLE t (x)")
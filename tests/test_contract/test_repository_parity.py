@@ -297,7 +297,8 @@ class TestClipParity:
         )
         await sqlite_conn.execute(
             "INSERT INTO videos VALUES ('video-1','/t.mp4','t.mp4',1000,24,1,1920,1080,"
-            "'h264',NULL,1000000,NULL,'2024-01-01','2024-01-01',0,0,'[]')"
+            "'h264',NULL,1000000,NULL,'2024-01-01','2024-01-01',0,0,'[]',"
+            "NULL,NULL,NULL,NULL)"
         )
         await sqlite_conn.commit()
 
@@ -324,7 +325,8 @@ class TestClipParity:
         )
         await sqlite_conn.execute(
             "INSERT INTO videos VALUES ('video-1','/t.mp4','t.mp4',1000,24,1,1920,1080,"
-            "'h264',NULL,1000000,NULL,'2024-01-01','2024-01-01',0,0,'[]')"
+            "'h264',NULL,1000000,NULL,'2024-01-01','2024-01-01',0,0,'[]',"
+            "NULL,NULL,NULL,NULL)"
         )
         await sqlite_conn.commit()
 
@@ -11,9 +11,12 @@ All tests run without FFmpeg, Piper, or real network calls.
 from __future__ import annotations
 
 import asyncio
+import io
 import json
 import os
-from collections.abc import AsyncGenerator
+import sys
+import threading
+from collections.abc import AsyncGenerator, Generator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -51,15 +54,59 @@ def _make_settings(
     api_key: str | None = "test-key",
     piper_models_dir: str = "/tmp/piper_models",
     cache_dir: str = "/tmp/tts_cache",
+    max_concurrent_synthesis: int = 4,
 ) -> Any:
     """Return a minimal settings-like object for tests."""
     s = MagicMock()
     s.openrouter_api_key = api_key
     s.tts_piper_models_dir = piper_models_dir
     s.tts_cache_dir = cache_dir
+    s.tts_cache_max_bytes = 0
+    s.tts_cache_format = "wav"
+    s.tts_remote_max_connections = 8
+    s.tts_remote_max_retries = 0
+    s.tts_remote_retry_base_delay_s = 0.0
+    s.tts_piper_workers_per_voice = 2
+    s.tts_max_concurrent_synthesis = max_concurrent_synthesis
     return s
 
 
+def _pcm_wav_bytes(samples: list[int], *, sample_rate: int = 22050, channels: int = 1) -> bytes:
+    """Return a 16-bit PCM WAV holding `samples` (interleaved when stereo)."""
+    import struct
+    import wave
+
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(struct.pack(f"<{len(samples)}h", *samples))
+    return buf.getvalue()
+
+
+class _FakePiperWorker:
+    """In-process stand-in for PiperWorker that returns fixed WAV bytes."""
+
+    def __init__(self, model_path: str, audio: bytes = b"", *, fail: bool = False) -> None:
+        self.model_path = model_path
+        self.audio = audio
+        self.fail = fail
+        self.alive = True
+        self.calls: list[str] = []
+        self.closed = False
+
+    def synthesise(self, text: str) -> bytes:
+        self.calls.append(text)
+        if self.fail:
+            self.alive = False
+            raise RuntimeError("Piper synthesis failed: worker exited (code 1)")
+        return self.audio
+
+    def close(self) -> None:
+        self.closed = True
+
+
 def _make_cue(
     cue_id: str = "cue-001",
     *,
@@ -148,6 +195,70 @@ class TestTtsCache:
         assert cache.hit("key1").read_bytes() == b"aaa"  # type: ignore[union-attr]
         assert cache.hit("key2").read_bytes() == b"bbb"  # type: ignore[union-attr]
 
+    def test_lru_entry_evicted_over_bound(self, tmp_path: Path) -> None:
+        cache = TtsCache(str(tmp_path), max_bytes=10)
+        cache.store("old", b"aaaa")
+        cache.store("mid", b"bbbb")
+        assert cache.hit("old") is not None  # "mid" is now least recently used
+        cache.store("new", b"cccc")
+
+        assert cache.hit("mid") is None
+        assert cache.hit("old") is not None
+        assert cache.hit("new") is not None
+        stats = cache.stats()
+        assert stats.entries == 2
+        assert stats.bytes == 8
+        assert stats.evictions == 1
+        assert cache.take_evicted() == ["mid"]
+        assert cache.take_evicted() == []
+
+    def test_newest_entry_kept_even_if_over_bound(self, tmp_path: Path) -> None:
+        cache = TtsCache(str(tmp_path), max_bytes=2)
+        path = cache.store("big", b"abcdef")
+        assert path.exists()
+        assert cache.hit("big") == path
+
+    def test_manifest_persists_counters_and_entries(self, tmp_path: Path) -> None:
+        cache = TtsCache(str(tmp_path))
+        cache.store("k", b"data")
+        cache.hit("k")
+        cache.hit("missing")
+        cache.flush()
+
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        assert manifest["entries"]["k"]["bytes"] == 4
+        reopened = TtsCache(str(tmp_path)).stats()
+        assert (reopened.entries, reopened.hits, reopened.misses) == (1, 1, 1)
+
+    def test_stray_file_adopted(self, tmp_path: Path) -> None:
+        (tmp_path / "legacy.wav").write_bytes(b"wav")
+        cache = TtsCache(str(tmp_path))
+        assert cache.hit("legacy") == tmp_path / "legacy.wav"
+        assert cache.stats().bytes == 3
+
+    def test_flac_stored_when_encoder_succeeds(self, tmp_path: Path) -> None:
+        cache = TtsCache(str(tmp_path), audio_format="flac")
+        encoded = MagicMock(returncode=0, stdout=b"fLaC-data", stderr=b"")
+        with patch(
+            "stoat_ferret.api.services.tts_service.subprocess.run", return_value=encoded
+        ) as run:
+            path = cache.store("k", b"RIFF-data")
+
+        assert path == tmp_path / "k.flac"
+        assert path.read_bytes() == b"fLaC-data"
+        assert run.call_args.kwargs["input"] == b"RIFF-data"
+
+    def test_flac_falls_back_to_wav(self, tmp_path: Path) -> None:
+        cache = TtsCache(str(tmp_path), audio_format="flac")
+        with patch(
+            "stoat_ferret.api.services.tts_service.subprocess.run",
+            side_effect=FileNotFoundError("ffmpeg"),
+        ):
+            path = cache.store("k", b"RIFF-data")
+
+        assert path == tmp_path / "k.wav"
+        assert path.read_bytes() == b"RIFF-data"
+
 
 # ---------------------------------------------------------------------------
 # KokoroBackend
@@ -161,6 +272,65 @@ def _make_kokoro_transport(status_code: int, content: bytes = b"") -> httpx.Mock
     return httpx.MockTransport(handler)
 
 
+class _KokoroStandIn:
+    """Local HTTP/1.1 stand-in for the OpenRouter speech endpoint.
+
+    Counts accepted TCP connections and requests. Responses are served from
+    `statuses` in order (then 200 with `audio`).
+    """
+
+    def __init__(self, audio: bytes) -> None:
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        stand_in = self
+        self.audio = audio
+        self.statuses: list[int] = []
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                with stand_in._lock:
+                    stand_in.connections += 1
+
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with stand_in._lock:
+                    stand_in.requests += 1
+                    status = stand_in.statuses.pop(0) if stand_in.statuses else 200
+                body = stand_in.audio if status == 200 else b"unavailable"
+                self.send_response(status)
+                self.send_header("Content-Type", "audio/wav")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}/api/v1/audio/speech"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def kokoro_stand_in() -> Generator[_KokoroStandIn, None, None]:
+    """Run a local Kokoro stand-in server for the duration of a test."""
+    server = _KokoroStandIn(_minimal_wav_bytes())
+    yield server
+    server.close()
+
+
 class TestKokoroBackend:
     async def test_missing_api_key_raises(self) -> None:
         backend = KokoroBackend()
@@ -170,7 +340,7 @@ class TestKokoroBackend:
 
     async def test_429_raises_rate_limited(self) -> None:
         transport = _make_kokoro_transport(429)
-        backend = KokoroBackend(transport=transport)
+        backend = KokoroBackend(transport=transport, max_retries=0)
         settings = _make_settings()
         with pytest.raises(RuntimeError, match="429"):
             await backend.synthesise("hello", "af_heart", settings)
@@ -184,7 +354,7 @@ class TestKokoroBackend:
 
     async def test_500_raises_backend_error(self) -> None:
         transport = _make_kokoro_transport(500, b"internal error")
-        backend = KokoroBackend(transport=transport)
+        backend = KokoroBackend(transport=transport, max_retries=0)
         settings = _make_settings()
         with pytest.raises(RuntimeError, match="500"):
             await backend.synthesise("hello", "af_heart", settings)
@@ -240,6 +410,94 @@ class TestKokoroBackend:
 
         assert result == wav
 
+    async def test_retryable_status_retried_then_succeeds(self) -> None:
+        statuses = [503, 429, 200]
+        seen: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            status = statuses[len(seen)]
+            seen.append(status)
+            return httpx.Response(status, content=b"wav" if status == 200 else b"")
+
+        backend = KokoroBackend(
+            transport=httpx.MockTransport(handler), max_retries=3, retry_base_delay_s=0.0
+        )
+        with patch("stoat_ferret.api.services.tts_service._write_and_reconcile", side_effect=bytes):
+            result = await backend.synthesise("hello", "af_heart", _make_settings())
+
+        assert result == b"wav"
+        assert seen == [503, 429, 200]
+
+    async def test_400_is_not_retried(self) -> None:
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(400, content=b"bad voice")
+
+        backend = KokoroBackend(transport=httpx.MockTransport(handler), max_retries=3)
+        with pytest.raises(RuntimeError, match="400"):
+            await backend.synthesise("hello", "af_heart", _make_settings())
+        assert calls == 1
+
+    async def test_retry_after_is_honoured(self) -> None:
+        responses = [httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200)]
+        backend = KokoroBackend(
+            transport=httpx.MockTransport(lambda _: responses.pop(0)),
+            max_retries=1,
+            retry_base_delay_s=0.0,
+        )
+        with (
+            patch(
+                "stoat_ferret.api.services.tts_service.asyncio.sleep", new_callable=AsyncMock
+            ) as sleep,
+            patch("stoat_ferret.api.services.tts_service._write_and_reconcile", side_effect=bytes),
+        ):
+            await backend.synthesise("hello", "af_heart", _make_settings())
+
+        sleep.assert_awaited_once_with(2.0)
+
+    async def test_transport_error_exhausts_retries(self) -> None:
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            raise httpx.ConnectError("refused", request=request)
+
+        backend = KokoroBackend(
+            transport=httpx.MockTransport(handler), max_retries=2, retry_base_delay_s=0.0
+        )
+        with pytest.raises(httpx.ConnectError):
+            await backend.synthesise("hello", "af_heart", _make_settings())
+        assert calls == 3
+
+    async def test_200_cues_share_pooled_connections(self, kokoro_stand_in: _KokoroStandIn) -> None:
+        backend = KokoroBackend(endpoint=kokoro_stand_in.url, max_connections=4)
+        settings = _make_settings()
+        with patch("stoat_ferret.api.services.tts_service._write_and_reconcile", side_effect=bytes):
+            results = await asyncio.gather(
+                *(backend.synthesise(f"cue {n}", "af_heart", settings) for n in range(200))
+            )
+        await backend.aclose()
+
+        assert len(results) == 200
+        assert kokoro_stand_in.requests == 200
+        assert kokoro_stand_in.connections <= 4
+
+    async def test_stand_in_5xx_retried_on_same_connection(
+        self, kokoro_stand_in: _KokoroStandIn
+    ) -> None:
+        kokoro_stand_in.statuses = [502]
+        backend = KokoroBackend(endpoint=kokoro_stand_in.url, max_retries=1, retry_base_delay_s=0.0)
+        with patch("stoat_ferret.api.services.tts_service._write_and_reconcile", side_effect=bytes):
+            result = await backend.synthesise("hello", "af_heart", _make_settings())
+        await backend.aclose()
+
+        assert result == _minimal_wav_bytes()
+        assert (kokoro_stand_in.requests, kokoro_stand_in.connections) == (2, 1)
+
 
 # ---------------------------------------------------------------------------
 # PiperBackend
@@ -259,60 +517,196 @@ class TestPiperBackend:
         ):
             backend.synthesise("hello", "missing_voice", settings)
 
-    def test_piper_subprocess_failure_raises(self, tmp_path: Path) -> None:
-        from stoat_ferret.api.services.tts_service import PiperBackend
+    def test_piper_worker_failure_raises(self, tmp_path: Path) -> None:
+        from stoat_ferret.api.services.tts_service import PiperBackend, PiperWorkerPool
 
-        backend = PiperBackend()
         model_file = tmp_path / "en_US-ryan-medium.onnx"
         model_file.write_bytes(b"fake model")
         settings = _make_settings(piper_models_dir=str(tmp_path))
+        pool = PiperWorkerPool(worker_factory=lambda m: _FakePiperWorker(m, fail=True))
+        backend = PiperBackend(pool=pool)
 
-        fail_result = MagicMock()
-        fail_result.returncode = 1
-        fail_result.stderr = "piper error"
-
-        with (
-            patch("subprocess.run", return_value=fail_result),
-            patch("os.path.exists", return_value=True),
-            patch("os.unlink"),
-            pytest.raises(RuntimeError, match="Piper synthesis failed"),
-        ):
+        with pytest.raises(RuntimeError, match="Piper synthesis failed"):
             backend.synthesise("hello", "en_US-ryan-medium", settings)
+        # The dead worker is discarded rather than returned to the pool.
+        assert pool.worker_count(str(model_file.resolve())) == 0
 
-    def test_piper_happy_path_calls_reconcile(self, tmp_path: Path) -> None:
-        from stoat_ferret.api.services.tts_service import PiperBackend
+    def test_piper_happy_path_reconciles_in_process(self, tmp_path: Path) -> None:
+        from stoat_ferret.api.services.tts_service import PiperBackend, PiperWorkerPool
 
-        backend = PiperBackend()
         model_file = tmp_path / "en_US-ryan-medium.onnx"
         model_file.write_bytes(b"fake model")
         settings = _make_settings(piper_models_dir=str(tmp_path))
+        raw = _pcm_wav_bytes([0, 1000, -1000, 500] * 100, sample_rate=22050)
+        pool = PiperWorkerPool(worker_factory=lambda m: _FakePiperWorker(m, raw))
+        backend = PiperBackend(pool=pool)
 
-        wav = _minimal_wav_bytes()
-        piper_result = MagicMock()
-        piper_result.returncode = 0
+        with patch("subprocess.run") as mock_run:
+            result = backend.synthesise("hello", "en_US-ryan-medium", settings)
 
-        probe_out = json.dumps({"streams": [{"channels": 2, "sample_rate": "48000"}]}).encode()
-        ffmpeg_result = MagicMock()
-        ffmpeg_result.returncode = 0
-        probe_result = MagicMock()
-        probe_result.returncode = 0
-        probe_result.stdout = probe_out
+        mock_run.assert_not_called()
+        import wave
 
-        open_mock = MagicMock(
-            return_value=MagicMock(
-                __enter__=MagicMock(return_value=MagicMock(read=MagicMock(return_value=wav))),
-                __exit__=MagicMock(return_value=False),
-            )
+        with wave.open(io.BytesIO(result), "rb") as wav:
+            assert (wav.getnchannels(), wav.getframerate()) == (2, 48000)
+            assert wav.getnframes() == 400 * 48000 // 22050
+
+    def test_piper_reuses_warm_worker(self, tmp_path: Path) -> None:
+        from stoat_ferret.api.services.tts_service import PiperBackend, PiperWorkerPool
+
+        model_file = tmp_path / "en_US-ryan-medium.onnx"
+        model_file.write_bytes(b"fake model")
+        settings = _make_settings(piper_models_dir=str(tmp_path))
+        raw = _pcm_wav_bytes([0] * 10, sample_rate=48000)
+        started: list[_FakePiperWorker] = []
+
+        def factory(model: str) -> _FakePiperWorker:
+            worker = _FakePiperWorker(model, raw)
+            started.append(worker)
+            return worker
+
+        backend = PiperBackend(pool=PiperWorkerPool(worker_factory=factory))
+        for text in ("one", "two", "three"):
+            backend.synthesise(text, "en_US-ryan-medium", settings)
+
+        assert len(started) == 1
+        assert started[0].calls == ["one", "two", "three"]
+        backend.close()
+        assert started[0].closed
+
+
+# ---------------------------------------------------------------------------
+# PiperWorkerPool / PiperWorker
+# ---------------------------------------------------------------------------
+
+
+class TestPiperWorkerPool:
+    def test_workers_per_voice_is_bounded(self) -> None:
+        from stoat_ferret.api.services.tts_service import PiperWorkerPool
+
+        gate = threading.Event()
+        started: list[str] = []
+
+        class _BlockingWorker(_FakePiperWorker):
+            def synthesise(self, text: str) -> bytes:
+                gate.wait(timeout=5)
+                return super().synthesise(text)
+
+        def factory(model: str) -> _BlockingWorker:
+            started.append(model)
+            return _BlockingWorker(model)
+
+        pool = PiperWorkerPool(workers_per_voice=2, worker_factory=factory)
+        threads = [
+            threading.Thread(target=pool.synthesise, args=("voice-a", str(n))) for n in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        gate.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert started == ["voice-a", "voice-a"]
+        assert pool.worker_count("voice-a") == 2
+
+    def test_separate_workers_per_voice(self) -> None:
+        from stoat_ferret.api.services.tts_service import PiperWorkerPool
+
+        pool = PiperWorkerPool(worker_factory=_FakePiperWorker)
+        pool.synthesise("voice-a", "x")
+        pool.synthesise("voice-b", "y")
+
+        assert pool.worker_count("voice-a") == 1
+        assert pool.worker_count("voice-b") == 1
+
+    def test_failed_worker_is_closed_not_reused(self) -> None:
+        """A worker that raises while still alive is discarded, not returned idle."""
+        from stoat_ferret.api.services.tts_service import PiperWorkerPool
+
+        workers: list[_FakePiperWorker] = []
+
+        class _DesyncedWorker(_FakePiperWorker):
+            def synthesise(self, text: str) -> bytes:
+                self.calls.append(text)
+                raise RuntimeError("Piper synthesis failed: unexpected response")
+
+        def factory(model: str) -> _FakePiperWorker:
+            worker = _DesyncedWorker(model) if not workers else _FakePiperWorker(model)
+            workers.append(worker)
+            return worker
+
+        pool = PiperWorkerPool(worker_factory=factory)
+        with pytest.raises(RuntimeError, match="unexpected response"):
+            pool.synthesise("voice-a", "x")
+
+        assert workers[0].alive
+        assert workers[0].closed
+        assert pool.worker_count("voice-a") == 0
+
+        pool.synthesise("voice-a", "y")
+        assert len(workers) == 2
+        assert workers[0].calls == ["x"]
+
+    def test_closed_pool_rejects_work(self) -> None:
+        from stoat_ferret.api.services.tts_service import PiperWorkerPool
+
+        pool = PiperWorkerPool(worker_factory=_FakePiperWorker)
+        pool.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.synthesise("voice-a", "x")
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="fake piper uses a shebang script")
+    def test_worker_speaks_json_lines_protocol(self, tmp_path: Path) -> None:
+        """A real long-lived process serves several utterances over stdin/stdout."""
+        from stoat_ferret.api.services.tts_service import PiperWorker
+
+        script = tmp_path / "fake-piper"
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import json, os, sys, wave\n"
+            "for line in sys.stdin:\n"
+            "    req = json.loads(line)\n"
+            "    with wave.open(req['output_file'], 'wb') as w:\n"
+            "        w.setnchannels(1); w.setsampwidth(2); w.setframerate(22050)\n"
+            "        w.writeframes(b'\\x00\\x00' * len(req['text']))\n"
+            "    print(req['output_file'], flush=True)\n"
+            "    print(os.getpid(), file=sys.stderr)\n"
         )
-        with (
-            patch("subprocess.run", side_effect=[piper_result, ffmpeg_result, probe_result]),
-            patch("builtins.open", open_mock),
-            patch("os.path.exists", return_value=True),
-            patch("os.unlink"),
-        ):
-            result = backend.synthesise("hello", "en_US-ryan-medium", settings)
+        script.chmod(0o755)
+
+        worker = PiperWorker("model.onnx", executable=str(script))
+        try:
+            first = worker.synthesise("hi")
+            second = worker.synthesise("hello")
+            assert worker.alive
+        finally:
+            worker.close()
+
+        import wave
+
+        with wave.open(io.BytesIO(first), "rb") as wav:
+            assert wav.getnframes() == 2
+        with wave.open(io.BytesIO(second), "rb") as wav:
+            assert wav.getnframes() == 5
+        assert not worker.alive
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="fake piper uses a shebang script")
+    def test_hung_worker_times_out_and_is_killed(self, tmp_path: Path) -> None:
+        from stoat_ferret.api.services.tts_service import PiperWorker
+
+        script = tmp_path / "fake-piper"
+        script.write_text(
+            f"#!{sys.executable}\nimport sys, time\nsys.stdin.readline()\ntime.sleep(60)\n"
+        )
+        script.chmod(0o755)
 
-        assert result == wav
+        worker = PiperWorker("model.onnx", executable=str(script), read_timeout=0.5)
+        try:
+            with pytest.raises(RuntimeError, match="no response within 0.5s"):
+                worker.synthesise("hi")
+            assert not worker.alive
+        finally:
+            worker.close()
 
 
 # ---------------------------------------------------------------------------
@@ -399,6 +793,54 @@ class TestReconcileTo48kStereo:
             _reconcile_to_48k_stereo(dummy_path)
 
 
+class TestReconcileInProcess:
+    def test_mono_22k_resampled_to_48k_stereo(self) -> None:
+        from stoat_ferret.api.services.tts_service import _reconcile_pcm_in_process
+
+        raw = _pcm_wav_bytes([0, 2205, 4410, 6615], sample_rate=22050)
+        result = _reconcile_pcm_in_process(raw)
+
+        import struct
+        import wave
+
+        assert result is not None
+        with wave.open(io.BytesIO(result), "rb") as wav:
+            assert (wav.getnchannels(), wav.getsampwidth(), wav.getframerate()) == (2, 2, 48000)
+            frames = wav.readframes(wav.getnframes())
+        samples = struct.unpack(f"<{len(frames) // 2}h", frames)
+        left, right = samples[0::2], samples[1::2]
+        assert left == right
+        assert list(left) == sorted(left)  # linear ramp stays monotonic
+        assert left[0] == 0
+
+    def test_stereo_48k_passes_through(self) -> None:
+        from stoat_ferret.api.services.tts_service import _reconcile_pcm_in_process
+
+        samples = [1, -1, 2, -2, 3, -3]
+        raw = _pcm_wav_bytes(samples, sample_rate=48000, channels=2)
+        result = _reconcile_pcm_in_process(raw)
+
+        import wave
+
+        assert result is not None
+        with wave.open(io.BytesIO(result), "rb") as wav:
+            assert wav.readframes(3) == raw[44:]
+
+    def test_non_pcm_falls_back_to_ffmpeg(self) -> None:
+        from stoat_ferret.api.services.tts_service import (
+            _reconcile_pcm_in_process,
+            _reconcile_wav_bytes,
+        )
+
+        assert _reconcile_pcm_in_process(b"ID3 not a wav") is None
+        with patch(
+            "stoat_ferret.api.services.tts_service._write_and_reconcile",
+            return_value=b"converted",
+        ) as fallback:
+            assert _reconcile_wav_bytes(b"ID3 not a wav") == b"converted"
+        fallback.assert_called_once_with(b"ID3 not a wav")
+
+
 # ---------------------------------------------------------------------------
 # TtsService
 # ---------------------------------------------------------------------------
@@ -463,6 +905,30 @@ class TestTtsService:
         assert updated is not None
         assert updated.status == "ready"
 
+    async def test_evicting_audio_resets_ready_cue_to_pending(self, tmp_path: Path) -> None:
+        repo = AsyncInMemoryTtsCueRepository()
+        first = _make_cue("cue-001", cache_key="first")
+        second = _make_cue("cue-002", cache_key="second")
+        await repo.create(first)
+        await repo.create(second)
+        service = self._make_service(repo, cache_dir=str(tmp_path))
+        audio = _minimal_wav_bytes()
+        service._cache = TtsCache(str(tmp_path), max_bytes=len(audio))
+
+        with patch.object(service, "_run_backend", return_value=audio):
+            await service.synthesise_cue(first.id)
+            await asyncio.wait(set(service._active_tasks.values()), timeout=5)
+            await service.synthesise_cue(second.id)
+            await asyncio.wait(set(service._active_tasks.values()), timeout=5)
+
+        evicted = await repo.get(first.id)
+        kept = await repo.get(second.id)
+        assert evicted is not None
+        assert kept is not None
+        assert evicted.status == "pending"
+        assert evicted.generated_asset_id is None
+        assert kept.status == "ready"
+
     async def test_synthesis_success_sets_ready(self, tmp_path: Path) -> None:
         repo = AsyncInMemoryTtsCueRepository()
         cue = _make_cue()
@@ -510,6 +976,82 @@ class TestTtsService:
 
         assert service._active_tasks == {}
 
+    async def test_backend_concurrency_is_bounded(self, tmp_path: Path) -> None:
+        repo = AsyncInMemoryTtsCueRepository()
+        cues = [_make_cue(f"cue-{n}", cache_key=f"key-{n}") for n in range(6)]
+        for cue in cues:
+            await repo.create(cue)
+        service = TtsService(
+            repository=repo,
+            settings=_make_settings(cache_dir=str(tmp_path), max_concurrent_synthesis=2),
+        )
+        running = 0
+        peak = 0
+
+        async def _tracking_backend(*_: Any) -> bytes:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return _minimal_wav_bytes()
+
+        with patch.object(service, "_run_backend", side_effect=_tracking_backend):
+            for cue in cues:
+                await service.synthesise_cue(cue.id)
+            await asyncio.wait(set(service._active_tasks.values()), timeout=5)
+
+        assert peak == 2
+        for cue in cues:
+            updated = await repo.get(cue.id)
+            assert updated is not None
+            assert updated.status == "ready"
+
+    async def test_synthesise_project_reports_progress(self, tmp_path: Path) -> None:
+        repo = AsyncInMemoryTtsCueRepository()
+        pending = [_make_cue(f"cue-{n}", cache_key=f"key-{n}") for n in range(3)]
+        for cue in pending:
+            await repo.create(cue)
+        ready = _make_cue("cue-ready", cache_key="key-ready")
+        await repo.create(ready)
+        audio = tmp_path / "ready.wav"
+        audio.write_bytes(b"wav")
+        await repo.update_status(ready.id, "ready", generated_asset_id=str(audio))
+        ws = MagicMock()
+        ws.broadcast = AsyncMock()
+        service = TtsService(
+            repository=repo,
+            settings=_make_settings(cache_dir=str(tmp_path)),
+            connection_manager=ws,
+        )
+
+        with patch.object(service, "_run_backend", return_value=_minimal_wav_bytes()):
+            counts = await service.synthesise_project("proj-001")
+            await asyncio.wait(set(service._progress_tasks), timeout=5)
+
+        assert counts == {"total": 4, "dispatched": 3, "in_progress": 0, "ready": 1}
+        payloads = [call.args[0]["payload"] for call in ws.broadcast.await_args_list]
+        assert [p["completed"] for p in payloads] == [1, 2, 3]
+        assert {p["cue_id"] for p in payloads} == {c.id for c in pending}
+        assert payloads[-1]["done"] is True
+        assert all(p["total"] == 3 for p in payloads)
+
+    async def test_synthesise_project_redispatches_evicted_audio(self, tmp_path: Path) -> None:
+        repo = AsyncInMemoryTtsCueRepository()
+        cue = _make_cue()
+        await repo.create(cue)
+        await repo.update_status(cue.id, "ready", generated_asset_id=str(tmp_path / "gone.wav"))
+        service = self._make_service(repo, cache_dir=str(tmp_path))
+
+        with patch.object(service, "_run_backend", return_value=_minimal_wav_bytes()):
+            counts = await service.synthesise_project("proj-001")
+            await asyncio.wait(set(service._progress_tasks), timeout=5)
+
+        assert counts["dispatched"] == 1
+        updated = await repo.get(cue.id)
+        assert updated is not None
+        assert updated.generated_asset_id == str(service.cache.hit(cue.cache_key))
+
     async def test_run_backend_unknown_raises(self, tmp_path: Path) -> None:
         repo = AsyncInMemoryTtsCueRepository()
         service = self._make_service(repo, cache_dir=str(tmp_path))
@@ -571,7 +1113,9 @@ class TestTtsRendererPreflight:
         repo = AsyncInMemoryTtsCueRepository()
         cue = _make_cue(status="pending")
         await repo.create(cue)
-        audio_path = str(tmp_path / "tts_audio.wav")
+        audio_file = tmp_path / "tts_audio.wav"
+        audio_file.write_bytes(_minimal_wav_bytes())
+        audio_path = str(audio_file)
         await repo.update_status(cue.id, "ready", generated_asset_id=audio_path)
 
         service = MagicMock()
@@ -586,6 +1130,52 @@ class TestTtsRendererPreflight:
         assert result[0].start_s == 0.0
         assert result[0].weight == 1.0
 
+    async def test_pending_cues_awaited_concurrently(self) -> None:
+        from stoat_ferret.render.worker import _run_tts_preflight
+
+        repo = AsyncInMemoryTtsCueRepository()
+        cues = [_make_cue(f"cue-{n}", cache_key=f"key-{n}") for n in range(3)]
+        for cue in cues:
+            await repo.create(cue)
+        release = asyncio.Event()
+        tasks: dict[str, asyncio.Task[None]] = {}
+
+        async def _finish(cue_id: str) -> None:
+            await release.wait()
+            await repo.update_status(cue_id, "ready", generated_asset_id=f"/{cue_id}.wav")
+
+        async def _dispatch(cue_id: str) -> bool:
+            tasks[cue_id] = asyncio.create_task(_finish(cue_id))
+            return True
+
+        service = MagicMock()
+        service._active_tasks = tasks
+        service.synthesise_cue = AsyncMock(side_effect=_dispatch)
+
+        preflight = asyncio.create_task(_run_tts_preflight("proj-001", service, repo))
+        await asyncio.sleep(0.01)
+        # Every cue is dispatched before any has finished.
+        assert service.synthesise_cue.await_count == 3
+        release.set()
+        result = await asyncio.wait_for(preflight, timeout=5)
+
+        assert [inp.cue_id for inp in result] == [c.id for c in cues]
+
+    async def test_ready_cue_with_evicted_audio_is_resynthesised(self, tmp_path: Path) -> None:
+        from stoat_ferret.render.worker import _run_tts_preflight
+
+        repo = AsyncInMemoryTtsCueRepository()
+        cue = _make_cue(status="pending")
+        await repo.create(cue)
+        await repo.update_status(cue.id, "ready", generated_asset_id=str(tmp_path / "gone.wav"))
+        service = MagicMock()
+        service._active_tasks = {}
+        service.synthesise_cue = AsyncMock(return_value=True)
+
+        await _run_tts_preflight("proj-001", service, repo)
+
+        service.synthesise_cue.assert_awaited_once_with(cue.id)
+
     async def test_format_mismatch_error_propagated(self) -> None:
         from stoat_ferret.render.worker import CommandBuildError, _run_tts_preflight
 
@@ -795,6 +1385,44 @@ class TestTtsCueResponseSchema:
         assert data["audio_path"] is None
 
 
+class TestSynthesiseAllEndpoint:
+    async def test_returns_counts_and_dispatches(self) -> None:
+        app = FastAPI()
+        app.include_router(tts_router)
+        service = MagicMock()
+        service.synthesise_project = AsyncMock(
+            return_value={"total": 3, "dispatched": 2, "in_progress": 0, "ready": 1}
+        )
+        app.state.tts_service = service
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+        ) as client:
+            resp = await client.post(f"/api/v1/projects/{_HTTP_PROJECT_ID}/tts/synthesise-all")
+
+        assert resp.status_code == 202
+        assert resp.json() == {
+            "project_id": _HTTP_PROJECT_ID,
+            "total": 3,
+            "dispatched": 2,
+            "in_progress": 0,
+            "ready": 1,
+        }
+        service.synthesise_project.assert_awaited_once_with(_HTTP_PROJECT_ID)
+
+    async def test_service_missing_returns_503(self) -> None:
+        app = FastAPI()
+        app.include_router(tts_router)
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+        ) as client:
+            resp = await client.post(f"/api/v1/projects/{_HTTP_PROJECT_ID}/tts/synthesise-all")
+
+        assert resp.status_code == 503
+        assert resp.json()["detail"]["code"] == "TTS_SERVICE_UNAVAILABLE"
+
+
 # ---------------------------------------------------------------------------
 # build_command_for_job TTS audio mixing (BL-578)
 # ---------------------------------------------------------------------------
@@ -43,6 +43,7 @@ class TestCreateTablesAsync:
             # Indexes
             assert "idx_videos_path" in names
             assert "idx_audit_log_entity" in names
+            assert "idx_audit_log_timestamp" in names
             assert "idx_clips_project" in names
             assert "idx_clips_timeline" in names
             assert "idx_tracks_project" in names
@@ -78,6 +78,10 @@ def test_videos_table_has_correct_columns(db_conn: sqlite3.Connection) -> None:
         "subtitle_count",
         "data_count",
         "subtitle_streams",
+        "file_mtime_ns",
+        "file_inode",
+        "sampled_sha256",
+        "content_sha256",
     }
     assert columns == expected_columns
 
@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for pre-serialised, pre-compressed discovery payloads."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Any
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from stoat_ferret.api.services import discovery_cache
+from stoat_ferret.api.services.discovery_cache import (
+    DiscoveryCache,
+    encode_payload,
+    get_discovery_cache,
+    payload_response,
+)
+
+_CONTENT = {"effects": [{"effect_type": "blur", "name": "Blur — gaussian"}] * 20, "total": 20}
+
+
+@pytest.fixture
+def built() -> list[int]:
+    return []
+
+
+@pytest.fixture
+def client(built: list[int]) -> TestClient:
+    app = FastAPI()
+
+    def _build() -> dict[str, Any]:
+        built.append(1)
+        return _CONTENT
+
+    @app.get("/catalogue")
+    async def catalogue(request: Request, version: int = 0) -> Response:
+        payload = get_discovery_cache(request).get("catalogue", version, _build)
+        return payload_response(request, payload)
+
+    return TestClient(app)
+
+
+def test_payload_is_built_once_per_version(client: TestClient, built: list[int]) -> None:
+    """Repeated requests reuse the encoded payload until the version changes."""
+    for _ in range(3):
+        client.get("/catalogue")
+    client.get("/catalogue", params={"version": 1})
+
+    assert len(built) == 2
+
+
+def test_body_matches_json_response_rendering(client: TestClient) -> None:
+    """The identity body is the compact UTF-8 JSON FastAPI would render."""
+    response = client.get("/catalogue", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert "content-encoding" not in response.headers
+    assert response.content == encode_payload(_CONTENT).identity
+    assert response.json() == _CONTENT
+
+
+def test_gzip_body_is_served_when_accepted(client: TestClient) -> None:
+    """gzip clients get the pre-compressed body with a coding-specific ETag."""
+    payload = encode_payload(_CONTENT)
+
+    response = client.get("/catalogue", headers={"Accept-Encoding": "br;q=0, gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == payload.etag_for("gzip")
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json() == _CONTENT
+
+
+def test_brotli_is_preferred_when_available(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With a Brotli encoding cached, clients accepting ``br`` receive it."""
+    payload = encode_payload(_CONTENT)
+    payload.encodings["br"] = b"brotli-bytes"
+    monkeypatch.setattr(discovery_cache, "encode_payload", lambda _content: payload)
+
+    response = client.get(
+        "/catalogue", headers={"Accept-Encoding": "gzip, br"}, params={"version": 7}
+    )
+
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["etag"] == payload.etag_for("br")
+
+
+@pytest.mark.parametrize("coding", ["identity", "gzip"])
+def test_if_none_match_returns_304(client: TestClient, coding: str) -> None:
+    """Any representation's tag (weak or strong) revalidates to 304."""
+    first = client.get("/catalogue", headers={"Accept-Encoding": coding})
+
+    response = client.get(
+        "/catalogue",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": f"W/{first.headers['etag']}"},
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == encode_payload(_CONTENT).etag_for("gzip")
+
+
+def test_changed_content_gets_a_new_etag() -> None:
+    """The strong ETag follows the body; gzip bytes are reproducible."""
+    first = encode_payload(_CONTENT)
+    again = encode_payload(json.loads(json.dumps(_CONTENT)))
+    changed = encode_payload({**_CONTENT, "total": 21})
+
+    assert again.etag == first.etag
+    assert again.encodings["gzip"] == first.encodings["gzip"]
+    assert gzip.decompress(first.encodings["gzip"]) == first.identity
+    assert changed.etag != first.etag
+
+
+def test_failed_build_is_not_cached() -> None:
+    """A build that raises leaves no entry behind."""
+    cache = DiscoveryCache()
+
+    def _fail() -> Any:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cache.get("effects", 1, _fail)
+
+    assert cache.get("effects", 1, lambda: {"ok": True}).identity == b'{"ok":true}'
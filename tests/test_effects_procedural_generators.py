@@ -842,6 +842,66 @@ def test_generic_procedural_performance(tmp_path: pathlib.Path) -> None:
     assert out.stat().st_size > 0
 
 
+def test_generic_procedural_render_frame_raw_bytes() -> None:
+    """render_frame returns packed pixels in pix_fmt, one byte per channel."""
+    from stoat_ferret_core import GenericProceduralImageBuilder
+
+    rgba = GenericProceduralImageBuilder("x", 16, 8)
+    gray = GenericProceduralImageBuilder("x", 16, 8, output_format="grayscale")
+    assert rgba.pix_fmt == "rgba"
+    assert gray.pix_fmt == "gray"
+
+    frame = gray.render_frame()
+    assert len(frame) == 16 * 8
+    assert frame[0] < 5
+    assert frame[15] > 250
+    assert len(rgba.render_frame()) == 16 * 8 * 4
+
+
+def test_generic_procedural_write_frames_streams_sequence() -> None:
+    """write_frames writes one frame per 1/fps step over [start, end) to the sink."""
+    import io
+
+    from stoat_ferret_core import GenericProceduralImageBuilder
+
+    builder = GenericProceduralImageBuilder("sin(t)*0.5+0.5", 4, 4, output_format="grayscale")
+    sink = io.BytesIO()
+    written = builder.write_frames(sink, 0.0, 1.0, 10.0)
+
+    assert written == 10
+    data = sink.getvalue()
+    assert len(data) == 10 * 16
+    frames = [data[i * 16 : (i + 1) * 16] for i in range(10)]
+    assert frames[3] == builder.render_frame(0.3)
+    assert frames[0] != frames[5]
+
+
+def test_generic_procedural_write_frames_invalid_range() -> None:
+    """write_frames rejects an empty time range or non-positive fps."""
+    import io
+
+    from stoat_ferret_core import GenericProceduralImageBuilder
+
+    builder = GenericProceduralImageBuilder("x", 4, 4)
+    with pytest.raises(ValueError):
+        builder.write_frames(io.BytesIO(), 1.0, 1.0, 30.0)
+    with pytest.raises(ValueError):
+        builder.write_frames(io.BytesIO(), 0.0, 1.0, 0.0)
+
+
+def test_generic_procedural_write_frames_propagates_sink_error() -> None:
+    """An exception from sink.write stops the render and propagates."""
+    from stoat_ferret_core import GenericProceduralImageBuilder
+
+    class _BrokenPipe:
+        def write(self, data: bytes) -> int:
+            raise BrokenPipeError("ffmpeg exited")
+
+    builder = GenericProceduralImageBuilder("x", 4, 4)
+    with pytest.raises(BrokenPipeError):
+        builder.write_frames(_BrokenPipe(), 0.0, 10.0, 30.0)
+
+
 # ===========================================================================
 # BL-575: WrongArity — procedural parser arity errors
 # ===========================================================================
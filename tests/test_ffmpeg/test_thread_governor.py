@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for CPU thread budgeting across concurrent FFmpeg processes."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from stoat_ferret.ffmpeg.executor import RealFFmpegExecutor
+from stoat_ferret.ffmpeg.governor import ThreadGovernor, apply_thread_limits
+from stoat_ferret.render.executor import RenderExecutor
+from stoat_ferret.render.models import OutputFormat, QualityPreset, RenderJob
+
+
+def _job() -> RenderJob:
+    return RenderJob.create(
+        project_id="proj-threads",
+        output_path="/tmp/proj-threads/output.mp4",
+        output_format=OutputFormat.MP4,
+        quality_preset=QualityPreset.STANDARD,
+        render_plan="{}",
+    )
+
+
+class TestThreadGovernor:
+    """Allocation from the global budget."""
+
+    def test_lone_render_uses_half_of_batch_capacity(self) -> None:
+        governor = ThreadGovernor(16, batch_slots=4)
+
+        assert governor.acquire("render").threads == 6
+
+    def test_saturated_batch_leaves_interactive_reserve(self) -> None:
+        governor = ThreadGovernor(16, batch_slots=4)
+        renders = [governor.acquire("render") for _ in range(4)]
+
+        preview = governor.acquire("preview")
+
+        # Renders split the 12 batch threads; the 4-thread reserve stays free.
+        assert [lease.threads for lease in renders] == [6, 3, 3, 1]
+        assert preview.threads == 4
+
+    def test_exhausted_budget_still_grants_one_thread(self) -> None:
+        governor = ThreadGovernor(4, batch_slots=1)
+        for _ in range(3):
+            governor.acquire("proxy")
+
+        assert governor.acquire("qc").threads == 1
+
+    def test_lease_returns_threads_on_exit(self) -> None:
+        governor = ThreadGovernor(8)
+
+        with governor.lease("thumbnail") as lease:
+            assert governor.allocations() == {"thumbnail": lease.threads}
+
+        assert governor.allocations() == {}
+
+    def test_unknown_workload_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unknown FFmpeg workload"):
+            ThreadGovernor(8).acquire("transcode")
+
+
+class TestApplyThreadLimits:
+    """Thread options are placed where FFmpeg applies them."""
+
+    def test_limits_decoders_filters_and_encoder(self) -> None:
+        args = ["-y", "-i", "a.mp4", "-i", "b.mp4", "-filter_complex", "[0][1]concat", "out.mp4"]
+
+        limited = apply_thread_limits(args, 3)
+
+        assert limited == [
+            "-filter_threads",
+            "3",
+            "-filter_complex_threads",
+            "3",
+            "-y",
+            "-threads",
+            "3",
+            "-i",
+            "a.mp4",
+            "-threads",
+            "3",
+            "-i",
+            "b.mp4",
+            "-filter_complex",
+            "[0][1]concat",
+            "-threads",
+            "3",
+            "out.mp4",
+        ]
+
+    def test_limits_every_output_encoder(self) -> None:
+        args = [
+            "-y",
+            "-i",
+            "in.mp4",
+            "-map",
+            "0:v",
+            "-c:v",
+            "libx264",
+            "hi.mp4",
+            "-map",
+            "0:v",
+            "-s",
+            "640x360",
+            "lo.mp4",
+            "-f",
+            "null",
+            "-",
+        ]
+
+        limited = apply_thread_limits(args, 2)
+
+        for output in ("hi.mp4", "lo.mp4", "-"):
+            position = limited.index(output, limited.index("-i") + 2)
+            assert limited[position - 2 : position] == ["-threads", "2"]
+        assert limited.count("-threads") == 4
+
+    def test_explicit_threads_left_alone(self) -> None:
+        args = ["-i", "a.mp4", "-threads", "1", "out.mp4"]
+
+        assert apply_thread_limits(args, 4) == args
+
+
+def test_sync_executor_applies_lease(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[str]] = []
+
+    def _run(command: list[str], **_: Any) -> subprocess.CompletedProcess[bytes]:
+        calls.append(command)
+        return subprocess.CompletedProcess(command, 0, b"", b"")
+
+    monkeypatch.setattr(subprocess, "run", _run)
+    governor = ThreadGovernor(8)
+    executor = RealFFmpegExecutor(governor=governor, workload="thumbnail")
+
+    executor.run(["-i", "in.mp4", "-frames:v", "1", "out.jpg"])
+
+    assert calls[0][:3] == ["ffmpeg", "-filter_threads", "4"]
+    assert calls[0][-3:] == ["-threads", "4", "out.jpg"]
+    assert governor.allocations() == {}
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX echo")
+async def test_render_executor_releases_lease_after_process() -> None:
+    governor = ThreadGovernor(8)
+    executor = RenderExecutor(timeout_seconds=5, governor=governor)
+
+    assert await executor.execute(_job(), ["echo", "out.mp4"]) is True
+    assert governor.allocations() == {}
+
+
+async def test_render_executor_releases_lease_when_spawn_fails() -> None:
+    governor = ThreadGovernor(8)
+    executor = RenderExecutor(timeout_seconds=5, governor=governor)
+
+    with (
+        patch("asyncio.create_subprocess_exec", AsyncMock(side_effect=OSError("missing"))),
+        pytest.raises(OSError),
+    ):
+        await executor.execute(_job(), ["ffmpeg", "-i", "in.mp4", "out.mp4"])
+
+    assert governor.allocations() == {}
@@ -0,0 +1,153 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for streamed media serving with file-identity ETags."""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from stoat_ferret.api.routers import preview
+from stoat_ferret.api.services.file_serving import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    file_version,
+    serve_file,
+)
+from stoat_ferret.db.models import PreviewQuality, PreviewSession, PreviewStatus
+from stoat_ferret.preview.manager import PreviewManager
+
+_PAYLOAD = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def media_file(tmp_path: Path) -> Path:
+    path = tmp_path / "strip.jpg"
+    path.write_bytes(_PAYLOAD)
+    return path
+
+
+@pytest.fixture
+def client(media_file: Path) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/file")
+    async def get_file(request: Request, immutable: bool = False) -> Response:
+        return serve_file(request, media_file, media_type="image/jpeg", immutable=immutable)
+
+    return TestClient(app)
+
+
+def test_full_response_carries_identity_etag(client: TestClient, media_file: Path) -> None:
+    """A plain GET streams the file with a strong ETag and must revalidate."""
+    response = client.get("/file")
+
+    assert response.status_code == 200
+    assert response.content == _PAYLOAD
+    assert response.headers["etag"] == f'"{file_version(media_file.stat())}"'
+    assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+    assert response.headers["accept-ranges"] == "bytes"
+
+
+def test_if_none_match_returns_304(client: TestClient) -> None:
+    """A matching (or weak-prefixed) If-None-Match skips the body."""
+    etag = client.get("/file").headers["etag"]
+
+    for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        response = client.get("/file", headers={"If-None-Match": header})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    assert client.get("/file", headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_range_request_returns_partial_content(client: TestClient) -> None:
+    """Byte ranges are served as 206 with the requested slice."""
+    response = client.get("/file", headers={"Range": "bytes=100-199"})
+
+    assert response.status_code == 206
+    assert response.content == _PAYLOAD[100:200]
+    assert response.headers["content-range"] == f"bytes 100-199/{len(_PAYLOAD)}"
+
+
+def test_rewritten_file_gets_new_etag(client: TestClient, media_file: Path) -> None:
+    """Replacing the file at the same path invalidates the old ETag."""
+    etag = client.get("/file").headers["etag"]
+    stat = media_file.stat()
+    media_file.write_bytes(_PAYLOAD[::-1])
+    os.utime(media_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    response = client.get("/file", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_immutable_flag_sets_cache_control(client: TestClient) -> None:
+    """Content-addressed responses are cacheable forever."""
+    response = client.get("/file", params={"immutable": "true"})
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+
+class TestPreviewSegments:
+    """Manifest segment URIs are versioned; matching versions are immutable."""
+
+    @pytest.fixture
+    def preview_client(self, tmp_path: Path) -> TestClient:
+        (tmp_path / "segment_000.ts").write_bytes(b"\x47" * 188)
+        (tmp_path / "manifest.m3u8").write_text(
+            "#EXTM3U\n#EXT-X-PLAYLIST-TYPE:VOD\n#EXTINF:2.0,\nsegment_000.ts\n"
+            "#EXTINF:2.0,\nsegment_001.ts\n#EXT-X-ENDLIST\n"
+        )
+        now = datetime.now(timezone.utc)
+        manager = MagicMock(spec=PreviewManager)
+        manager.get_status = AsyncMock(
+            return_value=PreviewSession(
+                id="sess",
+                project_id="proj",
+                status=PreviewStatus.READY,
+                quality_level=PreviewQuality.MEDIUM,
+                created_at=now,
+                updated_at=now,
+                expires_at=now + timedelta(hours=1),
+                manifest_path=str(tmp_path / "manifest.m3u8"),
+            )
+        )
+        app = FastAPI()
+        app.include_router(preview.router)
+        app.state.preview_manager = manager
+        return TestClient(app)
+
+    def test_manifest_versions_existing_segments(
+        self, preview_client: TestClient, tmp_path: Path
+    ) -> None:
+        """Segments on disk get ?v=; segments not yet written are left alone."""
+        version = file_version((tmp_path / "segment_000.ts").stat())
+
+        response = preview_client.get("/api/v1/preview/sess/manifest.m3u8")
+
+        lines = response.text.splitlines()
+        assert f"segment_000.ts?v={version}" in lines
+        assert "segment_001.ts" in lines
+        assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+
+    def test_versioned_segment_is_immutable(self, preview_client: TestClient) -> None:
+        """Only a request carrying the current version is marked immutable."""
+        manifest = preview_client.get("/api/v1/preview/sess/manifest.m3u8").text
+        uri = next(line for line in manifest.splitlines() if line.startswith("segment_000"))
+
+        versioned = preview_client.get(f"/api/v1/preview/sess/{uri}")
+        stale = preview_client.get("/api/v1/preview/sess/segment_0.ts?v=stale")
+
+        assert versioned.status_code == 200
+        assert versioned.headers["content-type"] == "video/MP2T"
+        assert versioned.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+        assert versioned.headers["x-content-type-options"] == "nosniff"
+        assert stale.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
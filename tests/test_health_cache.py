@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for the readiness probe TTL caches."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from stoat_ferret.api.services.health_cache import CachedProbe, HealthCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingProbe:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        await self.release.wait()
+        return self.calls
+
+
+async def test_cold_get_waits_for_probe_then_serves_cached() -> None:
+    """The first call runs the probe; calls within the TTL reuse the value."""
+    clock = _Clock()
+    probe = _CountingProbe()
+    cached: CachedProbe[int] = CachedProbe(10.0, name="test", clock=clock)
+
+    assert await cached.get(probe) == 1
+    clock.now += 5
+    assert await cached.get(probe) == 1
+    assert probe.calls == 1
+    assert cached.age_seconds == 5.0
+
+
+async def test_concurrent_cold_callers_share_one_probe() -> None:
+    """Callers arriving while the first probe runs do not start another."""
+    probe = _CountingProbe()
+    probe.release.clear()
+    cached: CachedProbe[int] = CachedProbe(10.0, name="test")
+
+    waiters = [asyncio.create_task(cached.get(probe)) for _ in range(5)]
+    await asyncio.sleep(0)
+    probe.release.set()
+
+    assert await asyncio.gather(*waiters) == [1] * 5
+    assert probe.calls == 1
+
+
+async def test_expired_value_served_while_refreshing_in_background() -> None:
+    """After the TTL the stale value is returned at once and refreshed behind it."""
+    clock = _Clock()
+    probe = _CountingProbe()
+    cached: CachedProbe[int] = CachedProbe(10.0, name="test", clock=clock)
+    await cached.get(probe)
+
+    probe.release.clear()
+    clock.now += 11
+    assert await cached.get(probe) == 1
+    assert cached.refreshing
+    assert await cached.get(probe) == 1  # no second refresh while one runs
+
+    probe.release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert await cached.get(probe) == 2
+    assert probe.calls == 2
+
+
+async def test_failed_refresh_keeps_stale_value() -> None:
+    """A background refresh that raises leaves the previous value in place."""
+    clock = _Clock()
+    cached: CachedProbe[int] = CachedProbe(1.0, name="test", clock=clock)
+
+    async def ok() -> int:
+        return 7
+
+    async def broken() -> int:
+        raise RuntimeError("probe failed")
+
+    await cached.get(ok)
+    clock.now += 2
+    assert await cached.get(broken) == 7
+    await asyncio.sleep(0)
+    assert await cached.get(ok) == 7
+
+
+async def test_cold_probe_error_propagates_and_is_not_cached() -> None:
+    """A failing first probe raises to the caller; the next call probes again."""
+    cached: CachedProbe[int] = CachedProbe(10.0, name="test")
+
+    async def broken() -> int:
+        raise asyncio.TimeoutError
+
+    with pytest.raises(asyncio.TimeoutError):
+        await cached.get(broken)
+    assert cached.age_seconds is None
+
+    probe = _CountingProbe()
+    assert await cached.get(probe) == 1
+
+
+async def test_zero_ttl_probes_every_call() -> None:
+    """TTL 0 disables caching."""
+    probe = _CountingProbe()
+    cached: CachedProbe[int] = CachedProbe(0.0, name="test")
+
+    assert [await cached.get(probe) for _ in range(3)] == [1, 2, 3]
+
+
+async def test_health_cache_aclose_cancels_refresh() -> None:
+    """Shutdown cancels a refresh that is still running."""
+    cache = HealthCache.create(snapshot_ttl_seconds=1.0, capability_ttl_seconds=1.0)
+    blocked = asyncio.Event()
+
+    async def never() -> dict[str, str]:
+        await blocked.wait()
+        return {"status": "ok"}
+
+    waiter = asyncio.create_task(cache.ffmpeg.get(never))
+    await asyncio.sleep(0)
+    assert cache.ffmpeg.refreshing
+
+    await cache.aclose()
+    assert not cache.ffmpeg.refreshing
+    waiter.cancel()
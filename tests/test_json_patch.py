@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for the JSON Patch diff/apply helpers used by version storage."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from stoat_ferret.db.json_patch import JsonPatchError, apply_patch, diff
+
+
+def _roundtrip(a: Any, b: Any) -> Any:
+    patch = diff(a, b)
+    return apply_patch(json.loads(json.dumps(a)), json.loads(json.dumps(patch)))
+
+
+@pytest.mark.parametrize(
+    ("a", "b"),
+    [
+        ({"x": 1}, {"x": 2}),
+        ({"x": 1, "y": 2}, {"x": 1}),
+        ({"x": 1}, {"x": 1, "y": [1, 2]}),
+        ([1, 2, 3, 4], [1, 9, 3, 4]),
+        ([1, 2, 3, 4], [1, 4]),
+        ([1, 4], [1, 2, 3, 4]),
+        ([], [{"id": "c1"}]),
+        ({"a/b": 1, "c~d": 2}, {"a/b": 3, "c~d": 4}),
+        ({"tracks": [{"clips": [{"id": 1, "in": 0}]}]}, {"tracks": [{"clips": []}]}),
+        (1, True),
+        ({"a": 1}, [1]),
+    ],
+)
+def test_diff_apply_roundtrip(a: Any, b: Any) -> None:
+    """Applying diff(a, b) to a yields b, serialized identically."""
+    assert json.dumps(_roundtrip(a, b)) == json.dumps(b)
+
+
+def test_identical_documents_produce_empty_patch() -> None:
+    """Equal documents diff to no operations."""
+    doc = {"tracks": [{"id": "t1", "clips": [{"id": "c1", "start": 0.0}]}]}
+    assert diff(doc, json.loads(json.dumps(doc))) == []
+
+
+def test_diff_is_proportional_to_change() -> None:
+    """A single changed field in a long list produces a single replace."""
+    a = {"clips": [{"id": i, "start": i * 10} for i in range(500)]}
+    b = json.loads(json.dumps(a))
+    b["clips"][250]["start"] = -1
+
+    assert diff(a, b) == [{"op": "replace", "path": "/clips/250/start", "value": -1}]
+
+
+def test_key_reorder_replaces_dict() -> None:
+    """A key-order change replaces the dict so serialization order is preserved."""
+    a = {"x": 1, "y": 2}
+    b = {"y": 2, "x": 1}
+    patch = diff(a, b)
+
+    assert patch == [{"op": "replace", "path": "", "value": b}]
+    assert list(_roundtrip(a, b)) == ["y", "x"]
+
+
+def test_apply_rejects_missing_path() -> None:
+    """Removing a key that does not exist raises JsonPatchError."""
+    with pytest.raises(JsonPatchError):
+        apply_patch({"x": 1}, [{"op": "remove", "path": "/y"}])
+
+
+def test_apply_rejects_unsupported_op() -> None:
+    """Operations outside add/remove/replace are rejected."""
+    with pytest.raises(JsonPatchError, match="Unsupported"):
+        apply_patch({}, [{"op": "move", "from": "/a", "path": "/b"}])
+
+
+def test_apply_list_append_marker() -> None:
+    """The '-' index appends to a list."""
+    assert apply_patch([1], [{"op": "add", "path": "/-", "value": 2}]) == [1, 2]
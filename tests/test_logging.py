@@ -5,21 +5,39 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import queue
 from collections.abc import Generator
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
 
 import pytest
 import structlog
 
-from stoat_ferret.logging import configure_logging
+from stoat_ferret.logging import (
+    EventSampler,
+    StructlogQueueHandler,
+    configure_logging,
+    dropped_log_records,
+    shutdown_logging,
+)
 
 
 @pytest.fixture(autouse=True)
-def _clean_root_handlers() -> Generator[None, None, None]:
-    """Remove handlers added by configure_logging between tests."""
+def _clean_root_handlers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[None, None, None]:
+    """Keep the default ``logs`` dir out of the repo and remove added handlers."""
+    monkeypatch.chdir(tmp_path)
     yield
+    shutdown_logging()
     root = logging.getLogger()
-    root.handlers = [h for h in root.handlers if type(h) is not logging.StreamHandler]
+    for handler in [
+        h for h in root.handlers if type(h) in (logging.StreamHandler, RotatingFileHandler)
+    ]:
+        root.removeHandler(handler)
+        handler.close()
 
 
 class TestConfigureLogging:
@@ -66,3 +84,99 @@ class TestConfigureLogging:
 
         root = logging.getLogger()
         assert root.level == logging.INFO
+
+
+def _log_lines(log_dir: Path) -> list[dict[str, object]]:
+    text = (log_dir / "stoat-ferret.log").read_text(encoding="utf-8")
+    return [json.loads(line) for line in text.splitlines() if line]
+
+
+class TestQueueLogging:
+    """Tests for queue mode (records rendered on a listener thread)."""
+
+    def test_root_gets_only_queue_handler(self, tmp_path: Path) -> None:
+        """Queue mode installs one queue handler and no direct stream handler."""
+        structlog.reset_defaults()
+
+        configure_logging(log_dir=tmp_path, queue_mode=True)
+        configure_logging(log_dir=tmp_path, queue_mode=True)
+
+        root = logging.getLogger()
+        assert len([h for h in root.handlers if isinstance(h, StructlogQueueHandler)]) == 1
+        assert not [h for h in root.handlers if type(h) is logging.StreamHandler]
+
+    def test_queue_mode_replaces_direct_handlers(self, tmp_path: Path) -> None:
+        """Switching to queue mode leaves the queue handler as root's only handler."""
+        structlog.reset_defaults()
+
+        configure_logging(log_dir=tmp_path)
+        configure_logging(log_dir=tmp_path, queue_mode=True)
+
+        # pytest's capture handlers are subclasses, so compare exact types.
+        ours = (logging.StreamHandler, RotatingFileHandler, StructlogQueueHandler)
+        handlers = [type(h) for h in logging.getLogger().handlers if type(h) in ours]
+        assert handlers == [StructlogQueueHandler]
+
+    def test_records_written_by_listener(self, tmp_path: Path) -> None:
+        """structlog and stdlib records reach the file once the queue drains."""
+        structlog.reset_defaults()
+        configure_logging(log_dir=tmp_path, level=logging.INFO, queue_mode=True)
+
+        structlog.get_logger("test_queue").info("queued_event", key="value")
+        structlog.get_logger("test_queue").debug("filtered_event")
+        logging.getLogger("test_stdlib").warning("stdlib %s", "message")
+        shutdown_logging()
+
+        lines = _log_lines(tmp_path)
+        assert [line["event"] for line in lines] == ["queued_event", "stdlib message"]
+        assert lines[0]["key"] == "value"
+        assert not [h for h in logging.getLogger().handlers if isinstance(h, StructlogQueueHandler)]
+
+    def test_full_queue_drops_instead_of_blocking(self) -> None:
+        """Records beyond the queue capacity are counted and discarded."""
+        handler = StructlogQueueHandler(queue.Queue(maxsize=1))
+        root = logging.getLogger()
+        root.addHandler(handler)
+        try:
+            for n in range(3):
+                handler.handle(logging.makeLogRecord({"msg": f"record {n}"}))
+            assert handler.dropped == 2
+            assert dropped_log_records() == 2
+        finally:
+            root.removeHandler(handler)
+
+    def test_prepare_keeps_event_dict_unformatted(self) -> None:
+        """structlog event dicts pass through; stdlib args are merged early."""
+        handler = StructlogQueueHandler(queue.Queue())
+        event = {"event": "render_progress"}
+        structlog_record = logging.makeLogRecord({"msg": event})
+        stdlib_record = logging.makeLogRecord({"msg": "%d%%", "args": (50,)})
+
+        assert handler.prepare(structlog_record).msg is event
+        prepared = handler.prepare(stdlib_record)
+        assert (prepared.msg, prepared.args) == ("50%", None)
+
+
+class TestEventSampler:
+    """Tests for sampling of high-frequency events."""
+
+    def test_keeps_one_in_rate_per_event(self) -> None:
+        """Only every rate-th emission of a sampled event survives."""
+        sampler = EventSampler({"ws_broadcast"}, 3)
+        kept = 0
+        for _ in range(7):
+            try:
+                event_dict = sampler(None, "debug", {"event": "ws_broadcast"})
+            except structlog.DropEvent:
+                continue
+            kept += 1
+            assert event_dict["sample_rate"] == 3
+        assert kept == 3
+
+    def test_other_events_and_warnings_pass(self) -> None:
+        """Unsampled event names and WARNING+ calls are never dropped."""
+        sampler = EventSampler({"ws_broadcast"}, 100)
+        sampler(None, "debug", {"event": "ws_broadcast"})
+
+        assert sampler(None, "debug", {"event": "render_started"}) == {"event": "render_started"}
+        assert sampler(None, "warning", {"event": "ws_broadcast"}) == {"event": "ws_broadcast"}
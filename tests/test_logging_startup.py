@@ -114,11 +114,14 @@ class TestLifespanLogging:
             async with lifespan(app):
                 pass
 
-        # Default log level is INFO, with default rotation settings
+        # Default log level is INFO, with default rotation and queue settings
         mock_configure.assert_called_once_with(
             level=logging.INFO,
             max_bytes=10_485_760,
             backup_count=5,
+            queue_mode=True,
+            queue_max_records=10_000,
+            sample_rate=1,
         )
 
     async def test_configure_logging_called_before_deps_injected_check(self) -> None:
@@ -0,0 +1,169 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for adaptive bitrate ladder outputs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from stoat_ferret.api.schemas.render import RenderOutputSpec
+from stoat_ferret.render.abr import prepare_ladder_dirs
+from stoat_ferret.render.multi_output import add_secondary_outputs, assign_output_paths
+
+_CRF = {"draft": "28", "standard": "23", "high": "18"}
+_SETTINGS = {"quality_preset": "standard", "encoder_preset": "fast", "fps": 25.0}
+
+_LADDER = [
+    {"height": 1080, "video_bitrate_kbps": 5000, "max_bitrate_kbps": 5500},
+    {"height": 720, "video_bitrate_kbps": 2800},
+    {"height": 360, "video_bitrate_kbps": 800},
+]
+
+_COMMAND = [
+    "ffmpeg",
+    "-i",
+    "a.mp4",
+    "-i",
+    "b.mp4",
+    "-filter_complex",
+    "[0:v][1:v]concat=n=2[final];[0:a][1:a]concat=n=2:v=0:a=1[aout]",
+    "-map",
+    "[final]",
+    "-map",
+    "[aout]",
+    "-c:v",
+    "libx264",
+    "-r",
+    "25.0",
+    "-progress",
+    "pipe:1",
+    "/out/job.mp4",
+]
+
+
+def _ladder(command: list[str], **spec: Any) -> list[str]:
+    outputs = assign_output_paths(
+        [RenderOutputSpec.model_validate({"name": "abr", "renditions": _LADDER, **spec})],
+        "/out/job.mp4",
+    )
+    return add_secondary_outputs(command, outputs, quality_crf=_CRF, settings=_SETTINGS)
+
+
+def _value(command: list[str], flag: str) -> str:
+    return command[command.index(flag) + 1]
+
+
+def test_ladder_manifest_lives_in_its_own_directory() -> None:
+    specs = [
+        RenderOutputSpec(name="hls", output_format="hls", renditions=_LADDER[:1]),
+        RenderOutputSpec(name="cmaf", output_format="dash", renditions=_LADDER[:1]),
+    ]
+
+    hls, cmaf = assign_output_paths(specs, "/out/job.mp4")
+
+    assert hls.output_path == str(Path("/out/job_hls/master.m3u8"))
+    assert cmaf.output_path == str(Path("/out/job_cmaf/manifest.mpd"))
+
+
+def test_hls_ladder_scales_each_rendition_from_one_branch() -> None:
+    command = _ladder(_COMMAND, output_format="hls", crop_aspect="9:16")
+
+    graph = _value(command, "-filter_complex")
+    assert "[final]split=2[mo_v0][mo_v1]" in graph
+    assert "[mo_v1]crop=w=trunc(min(iw\\,ih*9/16)/2)*2" in graph
+    assert "split=3[abr0_0][abr0_1][abr0_2]" in graph
+    assert "[abr0_1]scale=-2:720[abr0_out1]" in graph
+    ladder = command[command.index("/out/job.mp4") + 1 :]
+    maps = [ladder[i + 1] for i in range(0, 8, 2) if ladder[i] == "-map"]
+    assert maps == ["[abr0_out0]", "[abr0_out1]", "[abr0_out2]", "[mo_a1]"]
+
+
+def test_hls_ladder_sets_per_rendition_bitrates_and_aligned_keyframes() -> None:
+    command = _ladder(_COMMAND, output_format="hls", segment_seconds=2)
+
+    assert _value(command, "-b:v:0") == "5000k"
+    assert _value(command, "-maxrate:v:0") == "5500k"
+    assert _value(command, "-bufsize:v:0") == "11000k"
+    assert _value(command, "-maxrate:v:2") == "800k"
+    assert _value(command, "-force_key_frames") == "expr:gte(t,n_forced*2)"
+    # 2 s at 25 fps, with no scene-cut keyframes in between
+    assert (_value(command, "-g"), _value(command, "-keyint_min")) == ("50", "50")
+    assert _value(command, "-sc_threshold") == "0"
+    assert _value(command, "-b:a") == "128k"
+
+
+def test_hls_ladder_muxer_writes_master_playlist() -> None:
+    command = _ladder(_COMMAND, output_format="hls")
+
+    assert _value(command, "-f") == "hls"
+    assert _value(command, "-hls_time") == "4"
+    assert _value(command, "-master_pl_name") == "master.m3u8"
+    assert _value(command, "-var_stream_map") == (
+        "v:0,agroup:audio v:1,agroup:audio v:2,agroup:audio a:0,agroup:audio"
+    )
+    assert _value(command, "-hls_segment_filename") == str(Path("/out/job_abr/stream_%v_%05d.ts"))
+    assert command[-1] == str(Path("/out/job_abr/stream_%v.m3u8"))
+    # Shared output options are repeated for the ladder
+    assert command.count("-r") == 2
+
+
+def test_dash_ladder_of_silent_render_is_video_only_cmaf() -> None:
+    silent = [
+        "ffmpeg",
+        "-i",
+        "in.png",
+        "-filter_complex",
+        "[0:v]null[final]",
+        "-map",
+        "[final]",
+        "-an",
+        "/out/job.mp4",
+    ]
+
+    command = _ladder(silent, output_format="dash", codec="libvpx-vp9")
+
+    ladder = command[command.index("/out/job.mp4") + 1 :]
+    assert "-c:a" not in ladder
+    assert "-an" in ladder
+    assert "-sc_threshold" not in ladder
+    assert _value(ladder, "-adaptation_sets") == "id=0,streams=v"
+    assert _value(ladder, "-hls_playlist") == "1"
+    assert ladder[-1] == str(Path("/out/job_abr/manifest.mpd"))
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        {"name": "abr", "output_format": "hls"},
+        {"name": "abr", "output_format": "hls", "renditions": _LADDER, "height": 720},
+        {"name": "small", "output_format": "mp4", "renditions": _LADDER},
+        {
+            "name": "abr",
+            "output_format": "dash",
+            "renditions": [{"height": 720, "video_bitrate_kbps": 3000, "max_bitrate_kbps": 2000}],
+        },
+    ],
+)
+def test_invalid_ladder_specs_are_rejected(spec: dict[str, Any]) -> None:
+    with pytest.raises(ValidationError):
+        RenderOutputSpec.model_validate(spec)
+
+
+def test_prepare_ladder_dirs_creates_manifest_directory(tmp_path: Path) -> None:
+    outputs = assign_output_paths(
+        [
+            RenderOutputSpec(name="abr", output_format="hls", renditions=_LADDER[:1]),
+            RenderOutputSpec(name="small"),
+        ],
+        str(tmp_path / "job.mp4"),
+    )
+
+    prepare_ladder_dirs(outputs)
+
+    assert (tmp_path / "job_abr").is_dir()
+    assert not (tmp_path / "job_small.mp4").exists()
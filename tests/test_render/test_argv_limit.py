@@ -276,7 +276,7 @@ async def test_run_job_routes_long_filter_and_cleans_up(
 
     mock_executor = _make_executor()
     mock_service = MagicMock()
-    mock_service._executor = mock_executor
+    mock_service.executor = mock_executor
     mock_service.run_job = AsyncMock()
 
     worker = RenderWorkerLoop(
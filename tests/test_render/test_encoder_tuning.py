@@ -0,0 +1,226 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for render telemetry and telemetry-driven encoder tuning."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiosqlite
+import pytest
+
+from stoat_ferret.api.settings import Settings
+from stoat_ferret.api.websocket.manager import ConnectionManager
+from stoat_ferret.db.schema import create_tables_async
+from stoat_ferret.render.models import OutputFormat, QualityPreset, RenderJob
+from stoat_ferret.render.queue import RenderQueue
+from stoat_ferret.render.render_repository import InMemoryRenderRepository
+from stoat_ferret.render.service import RenderService
+from stoat_ferret.render.telemetry import (
+    AsyncSQLiteRenderTelemetryRepository,
+    InMemoryRenderTelemetryRepository,
+    RenderTelemetrySample,
+    filter_cost,
+)
+from stoat_ferret.render.tuning import EncodeProfile, EncoderTuner, blend_eta
+
+_PROFILE_1080 = EncodeProfile("libx264", "medium", 1920, 1080, 30.0)
+
+
+def _sample(
+    *,
+    preset: str = "medium",
+    width: int = 1920,
+    height: int = 1080,
+    speed_ratio: float = 2.0,
+    bitrate_bps: float = 8_000_000,
+    filter_cost: int = 4,
+) -> RenderTelemetrySample:
+    duration = 60.0
+    return RenderTelemetrySample(
+        id=None,
+        job_id="job",
+        encoder="libx264",
+        preset=preset,
+        quality="medium",
+        width=width,
+        height=height,
+        fps=30.0,
+        filter_cost=filter_cost,
+        duration_s=duration,
+        elapsed_s=duration / speed_ratio,
+        speed_ratio=speed_ratio,
+        output_bytes=int(bitrate_bps * duration / 8),
+        bitrate_bps=bitrate_bps,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+async def _tuner(*samples: RenderTelemetrySample) -> EncoderTuner:
+    tuner = EncoderTuner(InMemoryRenderTelemetryRepository())
+    for sample in samples:
+        await tuner.record(sample)
+    return tuner
+
+
+class TestPredict:
+    """Predictions from recorded samples."""
+
+    async def test_normalises_by_pixel_rate(self) -> None:
+        tuner = await _tuner(_sample(width=1280, height=720, bitrate_bps=4_000_000))
+
+        prediction = tuner.predict(_PROFILE_1080)
+
+        assert prediction is not None
+        assert prediction.speed_ratio == pytest.approx(2.0 * (1280 * 720) / (1920 * 1080))
+        assert prediction.bitrate_bps == pytest.approx(4_000_000 * (1920 * 1080) / (1280 * 720))
+
+    async def test_extrapolates_unseen_preset(self) -> None:
+        tuner = await _tuner(_sample(preset="medium", speed_ratio=1.0))
+
+        fast = tuner.predict(_PROFILE_1080, "veryfast")
+        slow = tuner.predict(_PROFILE_1080, "slow")
+
+        assert fast is not None
+        assert slow is not None
+        assert fast.speed_ratio > 1.0 > slow.speed_ratio
+        assert fast.bitrate_bps > slow.bitrate_bps
+
+    async def test_prefers_samples_with_similar_filter_cost(self) -> None:
+        tuner = await _tuner(
+            _sample(speed_ratio=4.0, filter_cost=2), _sample(speed_ratio=1.0, filter_cost=40)
+        )
+        heavy = EncodeProfile("libx264", "medium", 1920, 1080, 30.0, filter_cost=40)
+
+        prediction = tuner.predict(heavy)
+
+        assert prediction is not None
+        assert prediction.speed_ratio < 2.0
+
+    async def test_no_telemetry_for_encoder(self) -> None:
+        tuner = await _tuner(_sample())
+
+        assert tuner.predict(EncodeProfile("libvpx-vp9", "medium", 1920, 1080, 30.0)) is None
+
+
+class TestChoosePreset:
+    """Preset selection against deadline and size targets."""
+
+    async def test_size_target_picks_fastest_preset_meeting_it(self) -> None:
+        tuner = await _tuner(_sample(preset="medium", bitrate_bps=8_000_000))
+        # medium would write 60 MB for 60 s; veryfast (x1.1) 66 MB, superfast 87 MB.
+        preset = tuner.choose_preset(_PROFILE_1080, 60.0, max_bytes=67_000_000)
+
+        assert preset == "veryfast"
+
+    async def test_deadline_alone_picks_slowest_preset_meeting_it(self) -> None:
+        tuner = await _tuner(_sample(preset="medium", speed_ratio=1.0))
+
+        # 60 s of media in 120 s needs speed >= 0.5: slow (0.6) fits, slower (0.3) does not.
+        assert tuner.choose_preset(_PROFILE_1080, 60.0, deadline_s=120.0) == "slow"
+
+    async def test_unreachable_targets_leave_default(self) -> None:
+        tuner = await _tuner(_sample(preset="medium", speed_ratio=0.01))
+
+        assert tuner.choose_preset(_PROFILE_1080, 60.0, deadline_s=1.0) is None
+
+
+def test_blend_eta_moves_from_prediction_to_progress() -> None:
+    assert blend_eta(10.0, 0.0, 100.0) == pytest.approx(90.0)
+    # Half way through, prediction (90 s left) and extrapolation (10 s left) weigh equally.
+    assert blend_eta(10.0, 0.5, 100.0) == pytest.approx(50.0)
+    assert blend_eta(10.0, 0.5, None) == pytest.approx(10.0)
+
+
+def test_filter_cost_counts_inputs_and_filters() -> None:
+    command = [
+        "ffmpeg",
+        "-i",
+        "a.mp4",
+        "-i",
+        "b.mp4",
+        "-filter_complex",
+        "[0:v]scale=1280:720[a];[1:v]eq=contrast=1.1\\,gamma=1[b];[a][b]concat=n=2",
+        "out.mp4",
+    ]
+
+    assert filter_cost(command) == 5
+
+
+async def test_sqlite_repository_returns_newest_first() -> None:
+    async with aiosqlite.connect(":memory:") as conn:
+        await create_tables_async(conn)
+        repo = AsyncSQLiteRenderTelemetryRepository(conn)
+        await repo.add(_sample(preset="fast"))
+        await repo.add(_sample(preset="slow"))
+
+        recent = await repo.list_recent(10)
+
+    assert [s.preset for s in recent] == ["slow", "fast"]
+    assert recent[0].id is not None
+
+
+def _service(tuner: EncoderTuner) -> RenderService:
+    repo = InMemoryRenderRepository()
+    ws = ConnectionManager()
+    ws.broadcast = AsyncMock()  # type: ignore[method-assign]
+    checkpoints = MagicMock()
+    service = RenderService(
+        repository=repo,
+        queue=RenderQueue(repo, max_concurrent=4, max_depth=50),
+        executor=MagicMock(),
+        checkpoint_manager=checkpoints,
+        connection_manager=ws,
+        settings=Settings(),
+        tuner=tuner,
+    )
+    service._ffmpeg_available = True
+    return service
+
+
+def _plan(**settings: Any) -> str:
+    base = {"codec": "libx264", "quality_preset": "medium", "width": 1920, "height": 1080}
+    return json.dumps({"total_duration": 60.0, "settings": {**base, "fps": 30.0, **settings}})
+
+
+async def test_submit_plans_encoder_preset_for_size_target(tmp_path: Path) -> None:
+    service = _service(await _tuner(_sample(preset="medium", bitrate_bps=8_000_000)))
+
+    with patch("stoat_ferret.render.service._HAS_RUST_BINDINGS", False):
+        job = await service.submit_job(
+            project_id="p",
+            output_path=str(tmp_path / "out.mp4"),
+            output_format=OutputFormat.MP4,
+            quality_preset=QualityPreset.STANDARD,
+            render_plan_json=_plan(max_output_bytes=67_000_000),
+        )
+
+    assert json.loads(job.render_plan)["settings"]["encoder_preset"] == "veryfast"
+
+
+async def test_successful_encode_is_recorded(tmp_path: Path) -> None:
+    telemetry = InMemoryRenderTelemetryRepository()
+    tuner = EncoderTuner(telemetry)
+    service = _service(tuner)
+    output = tmp_path / "out.mp4"
+    output.write_bytes(b"\0" * 3000)
+    job = RenderJob.create(
+        project_id="p",
+        output_path=str(output),
+        output_format=OutputFormat.MP4,
+        quality_preset=QualityPreset.STANDARD,
+        render_plan=_plan(),
+    )
+    command = ["ffmpeg", "-i", "a.mp4", "-c:v", "libx264", "-preset", "fast", str(output)]
+
+    await service._record_telemetry(job, command, filter_cost(command), 60.0, 30.0)
+    await service._record_telemetry(job, ["ffmpeg", "-c:v", "copy", str(output)], 1, 60.0, 1.0)
+
+    [sample] = await telemetry.list_recent(10)
+    assert (sample.preset, sample.speed_ratio, sample.bitrate_bps) == ("fast", 2.0, 400.0)
+    assert tuner.predict(EncodeProfile("libx264", "medium", 1920, 1080, 30.0), "fast") is not None
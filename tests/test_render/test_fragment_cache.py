@@ -0,0 +1,164 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for memoized per-clip effect filter fragments."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from stoat_ferret.db.models import Clip
+from stoat_ferret.effects.definitions import EffectDefinition
+from stoat_ferret.effects.registry import EffectRegistry
+from stoat_ferret.render.fragment_cache import ClipFragmentCache, VideoFragment
+from stoat_ferret.render.worker import (
+    CommandBuildError,
+    _build_clip_fragments,
+    _resolve_clip_source,
+)
+
+_NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _definition(build: Any, stream_kind: str = "v") -> EffectDefinition:
+    return EffectDefinition(
+        name="test",
+        description="test effect",
+        parameter_schema={},
+        ai_hints={},
+        preview_fn=lambda: "",
+        build_fn=build,
+        stream_kind=stream_kind,
+    )
+
+
+def _registry() -> tuple[EffectRegistry, MagicMock]:
+    build = MagicMock(side_effect=lambda p: f"eq=brightness={p['b']}")
+    registry = EffectRegistry()
+    registry.register("bright", _definition(build))
+    registry.register("loud", _definition(lambda p: f"volume={p['v']}", stream_kind="a"))
+    return registry, build
+
+
+def _clip(clip_id: str = "c1", **changes: Any) -> Clip:
+    clip = Clip(
+        id=clip_id,
+        project_id="p",
+        source_video_id="v1",
+        in_point=0,
+        out_point=30,
+        timeline_position=0,
+        created_at=_NOW,
+        updated_at=_NOW,
+        effects=[
+            {"effect_type": "bright", "parameters": {"b": 0.1}},
+            {
+                "effect_type": "bright",
+                "parameters": {"b": 0.2},
+                "window": {"start_s": 1.0, "end_s": 2.0},
+            },
+            {"effect_type": "loud", "parameters": {"v": 2}},
+        ],
+    )
+    return replace(clip, **changes)
+
+
+def _get(cache: ClipFragmentCache, clip: Clip, registry: EffectRegistry) -> Any:
+    return cache.get(clip, registry, lambda c: _build_clip_fragments(c, registry))
+
+
+def test_fragments_split_video_and_audio_effects() -> None:
+    registry, _ = _registry()
+
+    fragments = _build_clip_fragments(_clip(), registry)
+
+    assert fragments.video == (
+        VideoFragment("eq=brightness=0.1", None, False),
+        VideoFragment("eq=brightness=0.2", (1.0, 2.0), False),
+    )
+    assert fragments.audio == ("volume=2",)
+
+
+def test_unchanged_clip_is_built_once() -> None:
+    registry, build = _registry()
+    cache = ClipFragmentCache()
+
+    first = _get(cache, _clip(), registry)
+    second = _get(cache, _clip(), registry)
+
+    assert second is first
+    assert build.call_count == 2  # two "bright" effects, built on the first lookup only
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"updated_at": _NOW + timedelta(seconds=1)},
+        {"effects": [{"effect_type": "bright", "parameters": {"b": 0.5}}]},
+    ],
+)
+def test_mutated_clip_replaces_its_entry(changes: dict[str, Any]) -> None:
+    registry, _ = _registry()
+    cache = ClipFragmentCache()
+    _get(cache, _clip(), registry)
+
+    _get(cache, _clip(**changes), registry)
+
+    assert cache.misses == 2
+    assert len(cache) == 1
+
+
+def test_registering_an_effect_invalidates_fragments() -> None:
+    registry, _ = _registry()
+    cache = ClipFragmentCache()
+    _get(cache, _clip(), registry)
+
+    registry.register("bright", _definition(lambda p: f"eq=contrast={p['b']}"))
+    fragments = _get(cache, _clip(), registry)
+
+    assert fragments.video[0].filter_str == "eq=contrast=0.1"
+
+
+def test_least_recently_used_clip_is_evicted() -> None:
+    registry, _ = _registry()
+    cache = ClipFragmentCache(max_entries=2)
+    _get(cache, _clip("a"), registry)
+    _get(cache, _clip("b"), registry)
+    _get(cache, _clip("a"), registry)
+
+    _get(cache, _clip("c"), registry)
+    _get(cache, _clip("a"), registry)
+
+    assert (cache.hits, cache.misses) == (2, 3)
+    cache.invalidate("a")
+    assert len(cache) == 1
+
+
+def test_build_errors_are_not_cached() -> None:
+    registry, _ = _registry()
+    cache = ClipFragmentCache()
+    clip = _clip(effects=[{"effect_type": "missing", "parameters": {}}])
+
+    with pytest.raises(CommandBuildError, match="Unknown effect type"):
+        _get(cache, clip, registry)
+
+    assert len(cache) == 0
+
+
+async def test_video_lookups_are_memoized_within_a_build() -> None:
+    video = MagicMock(path="/media/v1.mp4", audio_codec="aac", frame_rate=30.0)
+    repo = MagicMock()
+    repo.get = AsyncMock(return_value=video)
+    videos: dict[str, Any] = {}
+
+    for clip_id in ("a", "b", "c"):
+        resolved = await _resolve_clip_source(_clip(clip_id), "p", repo, None, 30.0, videos)
+
+    assert resolved == ("/media/v1.mp4", "aac", 30.0)
+    repo.get.assert_awaited_once_with("v1")
@@ -0,0 +1,251 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for hierarchical (windowed mezzanine) rendering of large timelines."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from stoat_ferret.db.models import Clip, Video
+from stoat_ferret.render import worker
+from stoat_ferret.render.hierarchical import (
+    MEZZANINE_AUDIO_CODEC,
+    build_concat_command,
+    group_clip_windows,
+)
+from stoat_ferret.render.models import OutputFormat, QualityPreset, RenderJob, RenderStatus
+from stoat_ferret.render.worker import RenderWorkerLoop, build_hierarchical_render_for_job
+
+_PROJECT_ID = "proj-hier-001"
+
+
+def _clips(count: int) -> list[Clip]:
+    now = datetime.now(timezone.utc)
+    return [
+        Clip(
+            id=f"c{i}",
+            project_id=_PROJECT_ID,
+            source_video_id="vid",
+            in_point=0,
+            out_point=30,
+            timeline_position=i * 30,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def _video(audio_codec: str | None = "aac") -> Video:
+    now = datetime.now(timezone.utc)
+    return Video(
+        id="vid",
+        path="/media/a.mp4",
+        filename="a.mp4",
+        duration_frames=300,
+        frame_rate_numerator=30,
+        frame_rate_denominator=1,
+        width=1920,
+        height=1080,
+        video_codec="h264",
+        audio_codec=audio_codec,
+        file_size=1,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _job(settings: dict[str, Any] | None = None) -> RenderJob:
+    now = datetime.now(timezone.utc)
+    return RenderJob(
+        id="job-hier",
+        project_id=_PROJECT_ID,
+        status=RenderStatus.RUNNING,
+        output_path="/renders/out.mp4",
+        output_format=OutputFormat.MP4,
+        quality_preset=QualityPreset.STANDARD,
+        render_plan=json.dumps({"total_duration": 10.0, "settings": settings or {}}),
+        progress=0.0,
+        error_message=None,
+        retry_count=0,
+        created_at=now,
+        updated_at=now,
+        completed_at=None,
+    )
+
+
+@pytest.fixture
+def fake_multi_clip(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    """Stand in for the translator-backed multi-clip builder."""
+    windows: list[list[str]] = []
+
+    async def _build(ctx: Any, clips: list[Clip]) -> list[str]:
+        windows.append([clip.id for clip in clips])
+        return ["ffmpeg", *(a for clip in clips for a in ("-i", clip.id)), ctx.job.output_path]
+
+    monkeypatch.setattr(worker, "_build_multi_clip_command", _build)
+    return windows
+
+
+class TestGroupClipWindows:
+    """Windows respect the clip budget without splitting transitions."""
+
+    def test_splits_at_budget(self) -> None:
+        windows = group_clip_windows(_clips(7), [], 3)
+
+        # The trailing single clip joins the last window.
+        assert [[c.id for c in w] for w in windows] == [
+            ["c0", "c1", "c2"],
+            ["c3", "c4", "c5", "c6"],
+        ]
+
+    def test_transition_straddling_edge_extends_window(self) -> None:
+        transitions = [{"clip_a_id": "c2"}, {"clip_a_id": "c3"}]
+
+        windows = group_clip_windows(_clips(8), transitions, 3)
+
+        assert [[c.id for c in w] for w in windows] == [
+            ["c0", "c1", "c2", "c3", "c4"],
+            ["c5", "c6", "c7"],
+        ]
+
+
+def test_concat_copies_video_and_maps_metadata() -> None:
+    cmd = build_concat_command(Path("/w/windows.ffconcat"), "/out.mp4", ffmetadata_path="/m.txt")
+
+    assert cmd[cmd.index("-c:v") + 1] == "copy"
+    assert "0:a?" in cmd
+    assert cmd[cmd.index("-map_chapters") + 1] == "1"
+    assert cmd[-1] == "/out.mp4"
+
+
+async def test_large_timeline_renders_windows_to_mezzanines(
+    tmp_path: Path, fake_multi_clip: list[list[str]]
+) -> None:
+    clip_repo = AsyncMock()
+    clip_repo.list_by_project = AsyncMock(return_value=_clips(5))
+    video_repo = AsyncMock()
+    video_repo.get = AsyncMock(return_value=_video())
+
+    commands = await build_hierarchical_render_for_job(
+        _job(), clip_repo, video_repo, tmp_path, max_clips_per_pass=2
+    )
+
+    assert commands is not None
+    assert fake_multi_clip == [["c0", "c1"], ["c2", "c3", "c4"]]
+    for command, mezzanine in zip(commands.window_commands, commands.mezzanine_paths, strict=True):
+        assert command[-1] == str(mezzanine)
+        assert command[-3:-1] == ["-c:a", MEZZANINE_AUDIO_CODEC]
+    assert commands.concat[-1] == "/renders/out.mp4"
+    assert "window_0001.mkv" in commands.concat_list
+    assert commands.window_durations == pytest.approx((2.0, 3.0))
+
+
+async def test_window_durations_drop_transition_overlap(
+    tmp_path: Path, fake_multi_clip: list[list[str]]
+) -> None:
+    """A transition inside a window shortens its output by the overlap."""
+    clip_repo = AsyncMock()
+    clip_repo.list_by_project = AsyncMock(return_value=_clips(5))
+    video_repo = AsyncMock()
+    video_repo.get = AsyncMock(return_value=_video())
+    settings = {"transitions": [{"clip_a_id": "c0", "transition_type": "fade", "duration": 0.5}]}
+
+    commands = await build_hierarchical_render_for_job(
+        _job(settings), clip_repo, video_repo, tmp_path, max_clips_per_pass=2
+    )
+
+    assert commands is not None
+    assert commands.window_durations == pytest.approx((1.5, 3.0))
+
+
+async def test_window_passes_report_progress_by_duration(
+    tmp_path: Path, fake_multi_clip: list[list[str]]
+) -> None:
+    """Each window pass reports its share of the job's progress."""
+    clip_repo = AsyncMock()
+    clip_repo.list_by_project = AsyncMock(return_value=_clips(5))
+    video_repo = AsyncMock()
+    video_repo.get = AsyncMock(return_value=_video())
+    service = MagicMock()
+    service.run_pass = AsyncMock(return_value=True)
+    service.run_job = AsyncMock()
+    loop = RenderWorkerLoop(
+        service=service,
+        queue=MagicMock(),
+        clip_repository=clip_repo,
+        video_repository=video_repo,
+        max_clips_per_pass=2,
+    )
+
+    assert await loop._try_staged_render(_job(), tmp_path, None, False)
+
+    calls = service.run_pass.await_args_list
+    assert [call.kwargs["duration_s"] for call in calls] == pytest.approx([2.0, 3.0])
+    assert [call.kwargs["progress_range"] for call in calls] == [
+        pytest.approx((0.0, 0.36)),
+        pytest.approx((0.36, 0.9)),
+    ]
+    assert service.run_job.await_args.kwargs["progress_range"] == pytest.approx((0.9, 1.0))
+
+
+@pytest.mark.parametrize(
+    ("clip_count", "settings"),
+    [
+        (2, {}),
+        (
+            5,
+            {
+                "soft_subtitles": [
+                    {"source_asset_id": "00000000-0000-0000-0000-000000000001", "language": "en"}
+                ]
+            },
+        ),
+    ],
+)
+async def test_small_or_subtitled_timelines_render_in_one_pass(
+    tmp_path: Path, clip_count: int, settings: dict[str, Any]
+) -> None:
+    clip_repo = AsyncMock()
+    clip_repo.list_by_project = AsyncMock(return_value=_clips(clip_count))
+
+    commands = await build_hierarchical_render_for_job(
+        _job(settings), clip_repo, AsyncMock(), tmp_path, max_clips_per_pass=2
+    )
+
+    assert commands is None
+
+
+async def test_failed_window_falls_back_to_single_pass(
+    tmp_path: Path, fake_multi_clip: list[list[str]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failing mezzanine pass hands the job back to the normal command."""
+    clip_repo = AsyncMock()
+    clip_repo.list_by_project = AsyncMock(return_value=_clips(4))
+    video_repo = AsyncMock()
+    video_repo.get = AsyncMock(return_value=_video())
+    service = MagicMock()
+    service.run_pass = AsyncMock(return_value=False)
+    service.get_job = AsyncMock(return_value=_job())
+    service.run_job = AsyncMock()
+    monkeypatch.setattr(worker, "build_command_for_job", AsyncMock(return_value=["ffmpeg", "flat"]))
+    loop = RenderWorkerLoop(
+        service=service,
+        queue=MagicMock(),
+        clip_repository=clip_repo,
+        video_repository=video_repo,
+        max_clips_per_pass=2,
+    )
+
+    await loop._run_job(_job())
+
+    assert service.run_pass.await_count == 1
+    service.run_job.assert_awaited_once()
+    assert service.run_job.await_args.args[1] == ["ffmpeg", "flat"]
@@ -0,0 +1,299 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for multi-output rendering (one decode, many deliverables)."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from stoat_ferret.api.schemas.render import RenderOutputSpec, RenderPlanSettings
+from stoat_ferret.api.settings import Settings
+from stoat_ferret.api.websocket.manager import ConnectionManager
+from stoat_ferret.render.models import OutputFormat, QualityPreset, RenderJob, RenderStatus
+from stoat_ferret.render.multi_output import (
+    add_secondary_outputs,
+    assign_output_paths,
+)
+from stoat_ferret.render.queue import RenderQueue
+from stoat_ferret.render.render_repository import InMemoryRenderRepository
+from stoat_ferret.render.service import RenderService
+
+_CRF = {"draft": "28", "standard": "23", "high": "18"}
+_SETTINGS = {"quality_preset": "standard", "encoder_preset": "fast"}
+
+
+def _outputs(*specs: dict[str, Any]) -> list[RenderOutputSpec]:
+    outputs = [RenderOutputSpec.model_validate(spec) for spec in specs]
+    return assign_output_paths(outputs, "/out/job.mp4")
+
+
+def _fan_out(command: list[str], *specs: dict[str, Any]) -> list[str]:
+    return add_secondary_outputs(command, _outputs(*specs), quality_crf=_CRF, settings=_SETTINGS)
+
+
+def _graph(command: list[str]) -> str:
+    return command[command.index("-filter_complex") + 1]
+
+
+def _output_args(command: list[str], path: str) -> list[str]:
+    """Options of the extra output written to ``path``."""
+    end = command.index(path)
+    start = max(i for i, arg in enumerate(command[:end]) if arg.startswith("/out/"))
+    return command[start + 1 : end]
+
+
+_MULTI_CLIP = [
+    "ffmpeg",
+    "-i",
+    "a.mp4",
+    "-i",
+    "b.mp4",
+    "-i",
+    "meta.txt",
+    "-filter_complex",
+    "[0:v][1:v]concat=n=2[final];[0:a][1:a]concat=n=2:v=0:a=1[aout]",
+    "-map",
+    "[final]",
+    "-map",
+    "[aout]",
+    "-c:v",
+    "libx264",
+    "-crf",
+    "23",
+    "-r",
+    "30.0",
+    "-progress",
+    "pipe:1",
+    "-map_chapters",
+    "2",
+    "-map_metadata",
+    "2",
+    "/out/job.mp4",
+]
+
+
+def test_output_paths_sit_next_to_primary() -> None:
+    [vertical, audio] = _outputs({"name": "vertical"}, {"name": "audio", "output_format": "m4a"})
+
+    assert vertical.output_path == "/out/job_vertical.mp4"
+    assert audio.output_path == "/out/job_audio.m4a"
+
+
+def test_graph_labels_are_split_once_for_all_outputs() -> None:
+    command = _fan_out(
+        _MULTI_CLIP,
+        {"name": "720p", "width": 1280, "height": 720},
+        {"name": "audio", "output_format": "m4a"},
+    )
+
+    graph = _graph(command)
+    assert command.count("-filter_complex") == 1
+    assert "[final]split=2[mo_v0][mo_v1]" in graph
+    assert "[aout]asplit=3[mo_a0][mo_a1][mo_a2]" in graph
+    assert "[mo_v1]scale=1280:720[mo_out0]" in graph
+    # The primary output now maps branch 0 and keeps progress reporting.
+    assert command[9:13] == ["-map", "[mo_v0]", "-map", "[mo_a0]"]
+    assert command.count("-progress") == 1
+
+
+def test_secondary_outputs_get_own_encoder_and_shared_options() -> None:
+    command = _fan_out(
+        _MULTI_CLIP,
+        {"name": "720p", "width": 1280, "height": 720, "quality_preset": "high"},
+        {"name": "audio", "output_format": "m4a"},
+    )
+
+    assert _output_args(command, "/out/job_720p.mp4") == [
+        "-map",
+        "[mo_out0]",
+        "-c:v",
+        "libx264",
+        "-crf",
+        "18",
+        "-preset",
+        "fast",
+        "-map",
+        "[mo_a1]",
+        "-r",
+        "30.0",
+        "-map_chapters",
+        "2",
+        "-map_metadata",
+        "2",
+    ]
+    assert _output_args(command, "/out/job_audio.m4a") == [
+        "-map",
+        "[mo_a2]",
+        "-map_chapters",
+        "2",
+        "-map_metadata",
+        "2",
+    ]
+    assert command[-1] == "/out/job_audio.m4a"
+
+
+def test_vf_chain_moves_into_filter_complex() -> None:
+    legacy = [
+        "ffmpeg",
+        "-i",
+        "in.mp4",
+        "-ss",
+        "5.0",
+        "-t",
+        "10.0",
+        "-vf",
+        "scale=1920:1080",
+        "-c:v",
+        "libx264",
+        "-r",
+        "30.0",
+        "-progress",
+        "pipe:1",
+        "/out/job.mp4",
+    ]
+
+    command = _fan_out(legacy, {"name": "vertical", "crop_aspect": "9:16", "height": 1920})
+
+    assert "-vf" not in command
+    graph = _graph(command)
+    assert graph.startswith("[0:v]scale=1920:1080[mo_src];[mo_src]split=2[mo_v0][mo_v1]")
+    assert "crop=w=trunc(min(iw\\,ih*9/16)/2)*2" in graph
+    assert graph.endswith("scale=-2:1920[mo_out0]")
+    # Source audio is optional, so each output maps it directly.
+    assert command.count("0:a?") == 2
+    secondary = _output_args(command, "/out/job_vertical.mp4")
+    assert secondary[-6:] == ["-ss", "5.0", "-t", "10.0", "-r", "30.0"]
+
+
+def test_silent_render_rejects_audio_only_output() -> None:
+    silent = ["ffmpeg", "-i", "in.png", "-filter_complex", "[0:v]null[final]", "-map", "[final]"]
+    silent += ["-an", "/out/job.mp4"]
+
+    with pytest.raises(ValueError, match="audio-only"):
+        _fan_out(silent, {"name": "audio", "output_format": "mp3"})
+
+    command = _fan_out(silent, {"name": "small", "width": 640})
+    assert _output_args(command, "/out/job_small.mp4")[-1] == "-an"
+
+
+def test_subtitle_maps_stay_on_primary() -> None:
+    command = [
+        "ffmpeg",
+        "-i",
+        "in.mp4",
+        "-i",
+        "subs.srt",
+        "-vf",
+        "scale=1920:1080",
+        "-map",
+        "0:v",
+        "-map",
+        "0:a",
+        "-map",
+        "1:s",
+        "-c:v",
+        "libx264",
+        "-c:s",
+        "mov_text",
+        "/out/job.mp4",
+    ]
+
+    fanned = _fan_out(command, {"name": "webm", "output_format": "webm"})
+
+    secondary = _output_args(fanned, "/out/job_webm.webm")
+    assert "1:s" not in secondary
+    assert secondary[:4] == ["-map", "[mo_v1]", "-c:v", "libvpx-vp9"]
+    assert secondary[-2:] == ["-map", "0:a"]
+
+
+def test_plan_settings_reject_duplicate_output_names() -> None:
+    with pytest.raises(ValidationError, match="unique"):
+        RenderPlanSettings.model_validate({"outputs": [{"name": "a"}, {"name": "a"}]})
+
+
+def _plan(outputs: list[RenderOutputSpec], **settings: Any) -> str:
+    return json.dumps(
+        {
+            "total_duration": 10.0,
+            "settings": {
+                "codec": "libx264",
+                "outputs": [o.model_dump(mode="json") for o in outputs],
+                **settings,
+            },
+        }
+    )
+
+
+def _job(tmp_path: Path, outputs: list[RenderOutputSpec], **settings: Any) -> RenderJob:
+    return RenderJob.create(
+        project_id="proj-multi",
+        output_path=str(tmp_path / "job.mp4"),
+        output_format=OutputFormat.MP4,
+        quality_preset=QualityPreset.STANDARD,
+        render_plan=_plan(outputs, **settings),
+    )
+
+
+def _service(qc_service: Any = None) -> tuple[RenderService, InMemoryRenderRepository]:
+    repo = InMemoryRenderRepository()
+    ws = ConnectionManager()
+    ws.broadcast = AsyncMock()  # type: ignore[method-assign]
+    service = RenderService(
+        repository=repo,
+        queue=RenderQueue(repo, max_concurrent=1, max_depth=50),
+        executor=MagicMock(),
+        checkpoint_manager=AsyncMock(),
+        connection_manager=ws,
+        settings=Settings(),
+        qc_service=qc_service,
+    )
+    return service, repo
+
+
+async def test_job_fails_when_an_extra_output_is_missing(tmp_path: Path) -> None:
+    outputs = assign_output_paths(
+        [RenderOutputSpec(name="720p"), RenderOutputSpec(name="audio", output_format="m4a")],
+        str(tmp_path / "job.mp4"),
+    )
+    service, repo = _service()
+    job = await repo.create(_job(tmp_path, outputs))
+    await repo.update_status(job.id, RenderStatus.RUNNING)
+    (tmp_path / "job.mp4").write_bytes(b"\0" * 10)
+    (tmp_path / "job_720p.mp4").write_bytes(b"\0" * 10)
+
+    service._handle_failure = AsyncMock()  # type: ignore[method-assign]
+
+    await service._finalize_success(job, 1.0, MagicMock())
+
+    message = service._handle_failure.call_args.args[1]
+    assert message.endswith("after FFmpeg completion: audio")
+
+
+async def test_qc_runs_on_every_output(tmp_path: Path) -> None:
+    outputs = assign_output_paths([RenderOutputSpec(name="720p")], str(tmp_path / "job.mp4"))
+    passed = MagicMock(overall_verdict="pass", checks="{}")
+    failed = MagicMock(
+        overall_verdict="fail", checks=json.dumps({"loudness_integrated": {"pass": False}})
+    )
+    qc_service = AsyncMock()
+    qc_service.run_checks = AsyncMock(side_effect=[passed, failed])
+    service, repo = _service(qc_service)
+    job = await repo.create(_job(tmp_path, outputs, delivery_profile_id="dp-1"))
+    await repo.update_status(job.id, RenderStatus.RUNNING)
+    await repo.update_status(job.id, RenderStatus.COMPLETED)
+
+    await service._run_completion_qc(job)
+
+    artifacts = [c.kwargs["artifact_path"] for c in qc_service.run_checks.call_args_list]
+    assert artifacts == [job.output_path, str(tmp_path / "job_720p.mp4")]
+    stored = await repo.get(job.id)
+    assert stored is not None
+    assert stored.status == RenderStatus.QC_FAILED
+    assert stored.error_message == "QC failed: 720p:loudness_integrated"
@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for render queue start/finish forecasting."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from stoat_ferret.api.settings import Settings
+from stoat_ferret.api.websocket.events import EventType
+from stoat_ferret.api.websocket.manager import ConnectionManager
+from stoat_ferret.render.forecast import QueueForecaster, RunningJob, plan_cost
+from stoat_ferret.render.models import OutputFormat, QualityPreset, RenderJob, RenderStatus
+from stoat_ferret.render.queue import RenderQueue
+from stoat_ferret.render.render_repository import InMemoryRenderRepository
+from stoat_ferret.render.service import RenderService
+from stoat_ferret.render.telemetry import (
+    InMemoryRenderTelemetryRepository,
+    RenderTelemetrySample,
+)
+from stoat_ferret.render.tuning import EncoderTuner
+
+
+def _plan(duration: float, *, codec: str = "libx264", **extra: Any) -> str:
+    settings = {"codec": codec, "quality_preset": "medium", "width": 1920, "height": 1080}
+    return json.dumps({"total_duration": duration, "settings": {**settings, "fps": 30.0}, **extra})
+
+
+def _job(duration: float, *, progress: float = 0.0, codec: str = "libx264") -> RenderJob:
+    job = RenderJob.create(
+        project_id="proj-eta",
+        output_path="/tmp/proj-eta/out.mp4",
+        output_format=OutputFormat.MP4,
+        quality_preset=QualityPreset.STANDARD,
+        render_plan=_plan(duration, codec=codec),
+    )
+    job.progress = progress
+    return job
+
+
+def test_plan_cost_prefers_segment_estimates() -> None:
+    plan = json.loads(_plan(10.0, segments=[{"cost_estimate": 120.0}, {"cost_estimate": 80.0}]))
+
+    assert plan_cost(plan) == 200.0
+    assert plan_cost(json.loads(_plan(10.0))) == 300.0
+
+
+def test_observed_throughput_is_per_encoder() -> None:
+    forecaster = QueueForecaster()
+    # 300 frames in 30 s: 10 cost units per second for libx264.
+    forecaster.observe(_plan(10.0), 30.0)
+
+    assert forecaster.predict(_plan(20.0)) == (pytest.approx(60.0), "observed")
+    assert forecaster.predict(_plan(20.0, codec="libvpx-vp9")) == (20.0, "default")
+
+
+def test_observed_throughput_is_smoothed() -> None:
+    forecaster = QueueForecaster()
+    forecaster.observe(_plan(10.0), 30.0)
+    forecaster.observe(_plan(10.0), 10.0)
+
+    # 0.3 * 30 + 0.7 * 10 units per second
+    assert forecaster.observed_seconds(_plan(10.0)) == pytest.approx(300.0 / 16.0)
+
+
+async def test_telemetry_used_before_any_completed_job() -> None:
+    tuner = EncoderTuner(InMemoryRenderTelemetryRepository())
+    await tuner.record(
+        RenderTelemetrySample(
+            id=None,
+            job_id="old",
+            encoder="libx264",
+            preset="medium",
+            quality="medium",
+            width=1920,
+            height=1080,
+            fps=30.0,
+            filter_cost=2,
+            duration_s=60.0,
+            elapsed_s=120.0,
+            speed_ratio=0.5,
+            output_bytes=1000,
+            bitrate_bps=8000.0,
+            created_at=datetime.now(timezone.utc),
+        )
+    )
+
+    assert QueueForecaster(tuner).predict(_plan(30.0)) == (pytest.approx(60.0), "telemetry")
+
+
+def test_queued_jobs_fill_slots_as_running_jobs_finish() -> None:
+    forecaster = QueueForecaster()
+    running = [RunningJob(_job(100.0, progress=0.5)), RunningJob(_job(20.0))]
+    queued = [_job(30.0), _job(40.0), _job(10.0)]
+
+    forecast = forecaster.forecast(running, queued, max_concurrent=2)
+
+    # Real-time default: running jobs finish in 50 s and 20 s.
+    assert [(f.status, f.starts_in_seconds, f.finishes_in_seconds) for f in forecast] == [
+        ("running", 0.0, 50.0),
+        ("running", 0.0, 20.0),
+        ("queued", 20.0, 50.0),
+        ("queued", 50.0, 90.0),
+        ("queued", 50.0, 60.0),
+    ]
+
+
+def test_running_job_blends_prediction_with_progress() -> None:
+    forecaster = QueueForecaster()
+    # Predicted 100 s; 40 s in at 50 % progress extrapolates to 40 s left.
+    [forecast] = forecaster.forecast([RunningJob(_job(100.0, progress=0.5), 40.0)], [], 4)
+
+    assert forecast.finishes_in_seconds == pytest.approx(0.5 * 40.0 + 0.5 * 60.0)
+
+
+def test_queue_over_capacity_waits_for_enough_finishes() -> None:
+    forecaster = QueueForecaster()
+    running = [RunningJob(_job(d)) for d in (10.0, 20.0, 30.0)]
+
+    forecast = forecaster.forecast(running, [_job(5.0)], max_concurrent=2)
+
+    assert forecast[-1].starts_in_seconds == 20.0
+
+
+def _service() -> tuple[RenderService, InMemoryRenderRepository, ConnectionManager]:
+    repo = InMemoryRenderRepository()
+    ws = ConnectionManager()
+    ws.broadcast = AsyncMock()  # type: ignore[method-assign]
+    service = RenderService(
+        repository=repo,
+        queue=RenderQueue(repo, max_concurrent=1, max_depth=50),
+        executor=MagicMock(),
+        checkpoint_manager=AsyncMock(),
+        connection_manager=ws,
+        settings=Settings(),
+    )
+    return service, repo, ws
+
+
+async def test_queue_status_broadcast_carries_forecast() -> None:
+    service, repo, ws = _service()
+    running = await repo.create(_job(30.0))
+    await repo.update_status(running.id, RenderStatus.RUNNING)
+    queued = await repo.create(_job(10.0))
+
+    await service._broadcast_queue_status()
+
+    event = ws.broadcast.call_args.args[0]  # type: ignore[attr-defined]
+    assert event["type"] == EventType.RENDER_QUEUE_STATUS.value
+    forecast = event["payload"]["forecast"]
+    assert [(f["job_id"], f["starts_in_seconds"]) for f in forecast] == [
+        (running.id, 0.0),
+        (queued.id, 30.0),
+    ]
+
+
+async def test_completed_job_teaches_forecaster(monkeypatch: pytest.MonkeyPatch) -> None:
+    service, repo, _ = _service()
+    job = await repo.create(_job(10.0))
+    await repo.update_status(job.id, RenderStatus.RUNNING)
+    now = [100.0]
+    monkeypatch.setattr(
+        "stoat_ferret.render.service.time", SimpleNamespace(monotonic=lambda: now[0])
+    )
+    service.note_job_started(job.id)
+    now[0] = 130.0
+    monkeypatch.setattr(service, "_run_completion_qc", AsyncMock())
+
+    await service._complete_job(job, 5.0)
+
+    # Whole-job wall time (30 s from start), not the final command's 5 s, is learned.
+    assert service._forecaster.observed_seconds(_plan(10.0)) == pytest.approx(30.0)
@@ -0,0 +1,471 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for smart rendering: keyframe-aligned stream copy of untouched ranges."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from stoat_ferret.api.schemas.render import RenderPlanSettings
+from stoat_ferret.db.models import Clip, Video
+from stoat_ferret.effects.definitions import EffectDefinition
+from stoat_ferret.effects.registry import EffectRegistry
+from stoat_ferret.ffmpeg.probe import KeyframeIndex, _parse_keyframe_output, ffprobe_keyframes
+from stoat_ferret.render.models import OutputFormat, QualityPreset, RenderJob, RenderStatus
+from stoat_ferret.render.smart import (
+    SmartSpan,
+    StreamParams,
+    build_smart_commands,
+    encoder_args,
+    plan_smart_render,
+    split_at_keyframes,
+)
+from stoat_ferret.render.worker import RenderWorkerLoop, build_smart_render_for_job
+
+STOAT_TEST_FFMPEG = os.getenv("STOAT_TEST_FFMPEG", "")
+
+_PROJECT_ID = "proj-smart-001"
+_SETTINGS: dict[str, Any] = {
+    "codec": "libx264",
+    "fps": 30,
+    "width": 1920,
+    "height": 1080,
+    "quality_preset": "standard",
+    "audio_sample_rate": 48000,
+    "smart_render": True,
+}
+# Two-second GOPs over a 60-second source.
+_KEYFRAMES = tuple(float(t) for t in range(0, 61, 2))
+
+
+def _make_clip(clip_id: str, in_point: int, out_point: int, **kwargs: Any) -> Clip:
+    now = datetime.now(timezone.utc)
+    return Clip(
+        id=clip_id,
+        project_id=_PROJECT_ID,
+        source_video_id="vid",
+        in_point=in_point,
+        out_point=out_point,
+        timeline_position=0,
+        created_at=now,
+        updated_at=now,
+        **kwargs,
+    )
+
+
+def _make_video(**kwargs: Any) -> Video:
+    now = datetime.now(timezone.utc)
+    fields: dict[str, Any] = {
+        "id": "vid",
+        "path": "/media/camera.mp4",
+        "filename": "camera.mp4",
+        "duration_frames": 1800,
+        "frame_rate_numerator": 30,
+        "frame_rate_denominator": 1,
+        "width": 1920,
+        "height": 1080,
+        "video_codec": "h264",
+        "audio_codec": "aac",
+        "file_size": 50_000_000,
+        "created_at": now,
+        "updated_at": now,
+    }
+    fields.update(kwargs)
+    return Video(**fields)
+
+
+def _video_repo(video: Video) -> AsyncMock:
+    repo = AsyncMock()
+    repo.get = AsyncMock(return_value=video)
+    return repo
+
+
+def _index(**kwargs: Any) -> KeyframeIndex:
+    fields: dict[str, Any] = {
+        "codec_name": "h264",
+        "pix_fmt": "yuv420p",
+        "keyframes": _KEYFRAMES,
+        "profile": "High",
+        "level": 40,
+        "color_range": "tv",
+        "color_space": "bt709",
+        "color_transfer": "bt709",
+        "color_primaries": "bt709",
+    }
+    fields.update(kwargs)
+    return KeyframeIndex(**fields)
+
+
+async def _probe(path: str, start_s: float, end_s: float) -> KeyframeIndex:
+    return _index()
+
+
+def _registry() -> EffectRegistry:
+    registry = EffectRegistry()
+    for name, stream_kind in (("tint", ""), ("gain", "a")):
+        registry.register(
+            name,
+            EffectDefinition(
+                name=name,
+                description=name,
+                parameter_schema={"type": "object", "properties": {}},
+                ai_hints={},
+                preview_fn=lambda name=name: f"{name}=1",
+                build_fn=lambda _params, name=name: f"{name}=1",
+                stream_kind=stream_kind,
+            ),
+        )
+    return registry
+
+
+class TestSplitAtKeyframes:
+    """Untouched ranges split into encoded edges around a copied GOP-aligned middle."""
+
+    def test_unaligned_cut_encodes_partial_gops(self) -> None:
+        spans = split_at_keyframes("/m.mp4", 3.0, 15.5, _KEYFRAMES)
+
+        assert spans == [
+            SmartSpan("/m.mp4", 3.0, 4.0, copy=False),
+            SmartSpan("/m.mp4", 4.0, 14.0, copy=True),
+            SmartSpan("/m.mp4", 14.0, 15.5, copy=False),
+        ]
+
+    def test_aligned_cut_is_copied_whole(self) -> None:
+        assert split_at_keyframes("/m.mp4", 4.0, 10.0, _KEYFRAMES) == [
+            SmartSpan("/m.mp4", 4.0, 10.0, copy=True)
+        ]
+
+    def test_short_range_is_encoded(self) -> None:
+        assert split_at_keyframes("/m.mp4", 3.0, 5.5, _KEYFRAMES) == [
+            SmartSpan("/m.mp4", 3.0, 5.5, copy=False)
+        ]
+
+
+class TestEncoderArgs:
+    """Encode spans reproduce the copied stream's profile, level and colour."""
+
+    def test_x264_matches_profile_level_and_colour(self) -> None:
+        params = StreamParams.from_index(_index(level=41))
+
+        assert encoder_args("libx264", params) == (
+            "-profile:v",
+            "high",
+            "-level",
+            "4.1",
+            "-color_range",
+            "tv",
+            "-colorspace",
+            "bt709",
+            "-color_trc",
+            "bt709",
+            "-color_primaries",
+            "bt709",
+        )
+
+    def test_x265_level_goes_through_x265_params(self) -> None:
+        params = StreamParams(profile="Main", level=123)
+
+        assert encoder_args("libx265", params) == (
+            "-profile:v",
+            "main",
+            "-x265-params",
+            "level-idc=4.1",
+        )
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            StreamParams(profile=None, level=40),
+            StreamParams(profile="High", level=None),
+            StreamParams(profile="High 10", level=40),
+        ],
+    )
+    def test_unknown_or_unreproducible_params_return_none(self, params: StreamParams) -> None:
+        assert encoder_args("libx264", params) is None
+
+
+class TestPlanSmartRender:
+    """Eligibility and span planning."""
+
+    async def _plan(
+        self, clips: list[Clip], video: Video, probe: Any = _probe, **settings: Any
+    ) -> Any:
+        merged = {**_SETTINGS, **settings}
+        return await plan_smart_render(
+            clips,
+            merged,
+            RenderPlanSettings.model_validate(merged),
+            video_repository=_video_repo(video),
+            effect_registry=_registry(),
+            probe=probe,
+        )
+
+    async def test_effected_clip_is_encoded_and_untouched_clip_copied(self) -> None:
+        clips = [
+            _make_clip("a", 90, 450),
+            _make_clip("b", 600, 750, effects=[{"effect_type": "tint", "parameters": {}}]),
+        ]
+
+        plan = await self._plan(clips, _make_video())
+
+        assert plan is not None
+        assert plan.has_audio
+        assert [(s.start_s, s.end_s, s.copy) for s in plan.spans] == [
+            (3.0, 4.0, False),
+            (4.0, 14.0, True),
+            (14.0, 15.0, False),
+            (20.0, 25.0, False),
+        ]
+        assert plan.spans[-1].video_filters == ("tint=1",)
+        assert plan.copied_seconds == pytest.approx(10.0)
+        assert plan.encode_args[:4] == ("-profile:v", "high", "-level", "4.0")
+
+    async def test_unmatchable_profile_falls_back(self) -> None:
+        async def probe(path: str, start_s: float, end_s: float) -> KeyframeIndex:
+            return _index(profile="High 4:4:4 Predictive")
+
+        assert await self._plan([_make_clip("a", 90, 450)], _make_video(), probe=probe) is None
+
+    async def test_copy_sources_with_different_params_fall_back(self) -> None:
+        async def probe(path: str, start_s: float, end_s: float) -> KeyframeIndex:
+            return _index(level=40 if start_s < 10 else 41)
+
+        clips = [_make_clip("a", 90, 450), _make_clip("b", 600, 1200)]
+
+        assert await self._plan(clips, _make_video(), probe=probe) is None
+
+    @pytest.mark.parametrize(
+        ("clip_kwargs", "video_kwargs", "settings"),
+        [
+            ({}, {}, {"smart_render": False}),
+            ({}, {}, {"codec": "libvpx-vp9"}),
+            ({}, {}, {"transitions": [{"clip_a_id": "a"}]}),
+            ({"effects": [{"effect_type": "gain", "parameters": {}}]}, {}, {}),
+            (
+                {"effects": [{"effect_type": "tint", "window": {"start_s": 0, "end_s": 1}}]},
+                {},
+                {},
+            ),
+            ({}, {"video_codec": "hevc"}, {}),
+            ({}, {"width": 1280, "height": 720}, {}),
+        ],
+    )
+    async def test_unsupported_timelines_fall_back(
+        self, clip_kwargs: dict[str, Any], video_kwargs: dict[str, Any], settings: dict[str, Any]
+    ) -> None:
+        plan = await self._plan(
+            [_make_clip("a", 90, 450, **clip_kwargs)], _make_video(**video_kwargs), **settings
+        )
+
+        assert plan is None
+
+
+async def test_worker_builds_prepare_and_concat_commands(tmp_path: Path) -> None:
+    """A single-clip job renders its selected segment via segments + concat copy."""
+    now = datetime.now(timezone.utc)
+    job = RenderJob(
+        id="job-smart",
+        project_id=_PROJECT_ID,
+        status=RenderStatus.RUNNING,
+        output_path="/renders/out.mp4",
+        output_format=OutputFormat.MP4,
+        quality_preset=QualityPreset.STANDARD,
+        render_plan=json.dumps({"total_duration": 12.0, "settings": _SETTINGS}),
+        progress=0.0,
+        error_message=None,
+        retry_count=0,
+        created_at=now,
+        updated_at=now,
+        completed_at=None,
+    )
+    clip_repo = AsyncMock()
+    clip_repo.list_by_project = AsyncMock(return_value=[_make_clip("a", 45, 405)])
+
+    commands = await build_smart_render_for_job(
+        job, clip_repo, _video_repo(_make_video()), tmp_path, "/tmp/meta.txt", probe=_probe
+    )
+
+    assert commands is not None
+    assert len(commands.segment_paths) == 3
+    prepare = commands.prepare
+    assert [command[command.index("-ss") + 1] for command in prepare] == ["1.5", "2.0", "12.0"]
+    assert [command[command.index("-c:v") + 1] for command in prepare] == [
+        "libx264",
+        "copy",
+        "libx264",
+    ]
+    assert [command[-1] for command in prepare] == [str(p) for p in commands.segment_paths]
+    assert ["-crf" in command for command in prepare] == [True, False, True]
+    assert ["-profile:v" in command for command in prepare] == [True, False, True]
+    assert ["-color_primaries" in command for command in prepare] == [True, False, True]
+    assert commands.encode_seconds == pytest.approx((0.5, 0.0, 1.5))
+    assert commands.concat_list.splitlines()[1:] == [
+        f"file '{path.name}'" for path in commands.segment_paths
+    ]
+    concat = commands.concat
+    assert concat[concat.index("-c") + 1] == "copy"
+    assert concat[-2:] == ["-y", "/renders/out.mp4"]
+    assert "-map_chapters" in concat
+
+
+async def test_prepare_passes_report_progress_by_encoded_seconds(tmp_path: Path) -> None:
+    """Encode passes share the job's progress by length; copies and concat follow."""
+    service = MagicMock()
+    service.run_pass = AsyncMock(return_value=True)
+    service.run_job = AsyncMock()
+    loop = RenderWorkerLoop(
+        service=service,
+        queue=MagicMock(),
+        clip_repository=AsyncMock(),
+        video_repository=AsyncMock(),
+    )
+    job = MagicMock(id="job-smart")
+
+    handled = await loop._run_intermediate_passes(
+        job,
+        [(["ffmpeg", "a"], 0.5), (["ffmpeg", "b"], 0.0), (["ffmpeg", "c"], 1.5)],
+        tmp_path / "segments.ffconcat",
+        "ffconcat version 1.0\n",
+        ["ffmpeg", "concat"],
+        "smart_render",
+    )
+
+    assert handled
+    ranges = [call.kwargs["progress_range"] for call in service.run_pass.await_args_list]
+    assert ranges == [
+        pytest.approx((0.0, 0.225)),
+        pytest.approx((0.225, 0.225)),
+        pytest.approx((0.225, 0.9)),
+    ]
+    assert [call.kwargs["duration_s"] for call in service.run_pass.await_args_list] == [
+        0.5,
+        0.0,
+        1.5,
+    ]
+    assert service.run_job.await_args.kwargs["progress_range"] == pytest.approx((0.9, 1.0))
+
+
+def test_parse_keyframe_output_keeps_keyframe_packets() -> None:
+    data = {
+        "streams": [{"codec_name": "h264", "pix_fmt": "yuv420p"}],
+        "packets": [
+            {"pts_time": "2.000000", "flags": "K__"},
+            {"pts_time": "0.000000", "flags": "K_"},
+            {"pts_time": "0.033333", "flags": "__"},
+            {"pts_time": "2.000000", "flags": "K_"},
+            {"flags": "K_"},
+        ],
+    }
+
+    index = _parse_keyframe_output(data, "/m.mp4")
+
+    assert index == KeyframeIndex(codec_name="h264", pix_fmt="yuv420p", keyframes=(0.0, 2.0))
+
+
+def test_parse_keyframe_output_reads_profile_level_and_colour() -> None:
+    data = {
+        "streams": [
+            {
+                "codec_name": "h264",
+                "pix_fmt": "yuv420p",
+                "profile": "Main",
+                "level": 31,
+                "color_range": "tv",
+                "color_space": "bt709",
+                "color_transfer": "unknown",
+            }
+        ],
+        "packets": [],
+    }
+
+    index = _parse_keyframe_output(data, "/m.mp4")
+
+    assert StreamParams.from_index(index) == StreamParams(
+        profile="Main", level=31, color_range="tv", color_space="bt709"
+    )
+
+
+def _run(command: list[str]) -> subprocess.CompletedProcess[bytes]:
+    return subprocess.run(command, capture_output=True, timeout=120, check=False)
+
+
+@pytest.mark.skipif(not STOAT_TEST_FFMPEG, reason="requires STOAT_TEST_FFMPEG=1 and real ffmpeg")
+async def test_spliced_output_decodes_end_to_end(tmp_path: Path) -> None:
+    """Copied and re-encoded spans join into a stream that decodes without errors."""
+    source = tmp_path / "source.mp4"
+    generated = await asyncio.to_thread(
+        _run,
+        [
+            "ffmpeg",
+            "-y",
+            "-f",
+            "lavfi",
+            "-i",
+            "testsrc2=size=320x240:rate=30:duration=12",
+            "-f",
+            "lavfi",
+            "-i",
+            "sine=frequency=440:duration=12",
+            "-c:v",
+            "libx264",
+            "-profile:v",
+            "main",
+            "-level",
+            "3.0",
+            "-pix_fmt",
+            "yuv420p",
+            "-g",
+            "60",
+            "-color_primaries",
+            "bt709",
+            "-color_trc",
+            "bt709",
+            "-colorspace",
+            "bt709",
+            "-c:a",
+            "aac",
+            str(source),
+        ],
+    )
+    assert generated.returncode == 0, generated.stderr.decode(errors="replace")
+    settings = {**_SETTINGS, "width": 320, "height": 240}
+    video = _make_video(path=str(source), width=320, height=240, duration_frames=360)
+    clips = [_make_clip("a", 15, 255), _make_clip("b", 285, 345)]
+
+    plan = await plan_smart_render(
+        clips,
+        settings,
+        RenderPlanSettings.model_validate(settings),
+        video_repository=_video_repo(video),
+        probe=ffprobe_keyframes,
+    )
+    assert plan is not None
+    assert plan.copied_seconds > 0
+    output = tmp_path / "out.mp4"
+    commands = build_smart_commands(
+        plan, settings, work_dir=tmp_path, output_path=str(output), crf="23"
+    )
+    await asyncio.to_thread(commands.concat_list_path.write_text, commands.concat_list)
+    for command in (*commands.prepare, commands.concat):
+        result = await asyncio.to_thread(_run, command)
+        assert result.returncode == 0, result.stderr.decode(errors="replace")
+
+    decoded = await asyncio.to_thread(
+        _run, ["ffmpeg", "-v", "error", "-xerror", "-i", str(output), "-f", "null", "-"]
+    )
+    assert decoded.returncode == 0
+    assert decoded.stderr == b""
+    index = await ffprobe_keyframes(str(output), 0.0, 12.0)
+    assert StreamParams.from_index(index) == StreamParams.from_index(
+        await ffprobe_keyframes(str(source), 0.0, 12.0)
+    )
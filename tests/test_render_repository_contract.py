@@ -753,3 +753,99 @@ class TestRenderSerializationRoundTrip:
         # Allow minor differences from serialization
         assert abs((fetched.created_at - created.created_at).total_seconds()) < 1.0
         assert abs((fetched.updated_at - created.updated_at).total_seconds()) < 1.0
+
+
+# ============================================================
+# Change listeners
+# ============================================================
+
+
+class TestRenderChangeListeners:
+    """Contract tests for add_listener/remove_listener change callbacks."""
+
+    async def test_listener_sees_every_change(
+        self, render_repository: AsyncRenderRepositoryType
+    ) -> None:
+        """Create, status, progress and delete each notify with the post-change job."""
+        changes: list[tuple[str, RenderStatus | None, float | None]] = []
+        render_repository.add_listener(
+            lambda job_id, job: changes.append(
+                (job_id, job.status if job else None, job.progress if job else None)
+            )
+        )
+        job = await render_repository.create(_make_job())
+        await render_repository.update_status(job.id, RenderStatus.RUNNING)
+        await render_repository.update_progress(job.id, 0.5)
+        await render_repository.update_status(job.id, RenderStatus.COMPLETED)
+        await render_repository.delete(job.id)
+
+        assert changes == [
+            (job.id, RenderStatus.QUEUED, 0.0),
+            (job.id, RenderStatus.RUNNING, 0.0),
+            (job.id, RenderStatus.RUNNING, 0.5),
+            (job.id, RenderStatus.COMPLETED, 1.0),
+            (job.id, None, None),
+        ]
+
+    async def test_removed_listener_and_failed_update_not_notified(
+        self, render_repository: AsyncRenderRepositoryType
+    ) -> None:
+        """Removed listeners are silent, and a rejected transition notifies nobody."""
+        changes: list[str] = []
+
+        def listener(job_id: str, job: RenderJob | None) -> None:
+            changes.append(job_id)
+
+        render_repository.add_listener(listener)
+        job = await render_repository.create(_make_job())
+        with pytest.raises(ValueError):
+            await render_repository.update_status(job.id, RenderStatus.COMPLETED)
+        render_repository.remove_listener(listener)
+        await render_repository.update_status(job.id, RenderStatus.RUNNING)
+
+        assert changes == [job.id]
+
+    async def test_progress_racing_cancel_is_dropped(self) -> None:
+        """A progress write that read RUNNING before a cancel neither lands nor notifies."""
+        conn = await aiosqlite.connect(":memory:")
+        try:
+            await create_tables_async(conn)
+            repo = AsyncSQLiteRenderRepository(conn)
+            job = await repo.create(_make_job())
+            await repo.update_status(job.id, RenderStatus.RUNNING)
+            stale = await repo.get(job.id)
+            await repo.update_status(job.id, RenderStatus.CANCELLED)
+
+            changes: list[RenderStatus | None] = []
+            repo.add_listener(lambda job_id, job: changes.append(job.status if job else None))
+
+            async def stale_get(job_id: str) -> RenderJob | None:
+                return stale
+
+            repo.get = stale_get  # type: ignore[method-assign]
+            await repo.update_progress(job.id, 0.5)
+            del repo.get
+
+            fetched = await repo.get(job.id)
+            assert fetched is not None
+            assert fetched.status == RenderStatus.CANCELLED
+            assert fetched.progress == 0.0
+            assert changes == []
+        finally:
+            await conn.close()
+
+    async def test_raising_listener_does_not_break_writes(
+        self, render_repository: AsyncRenderRepositoryType
+    ) -> None:
+        """A listener that raises is logged and the write still succeeds."""
+
+        def broken(job_id: str, job: RenderJob | None) -> None:
+            raise RuntimeError("listener failed")
+
+        render_repository.add_listener(broken)
+        job = await render_repository.create(_make_job())
+        await render_repository.update_status(job.id, RenderStatus.RUNNING)
+
+        fetched = await render_repository.get(job.id)
+        assert fetched is not None
+        assert fetched.status == RenderStatus.RUNNING
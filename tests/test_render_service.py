@@ -1005,6 +1005,83 @@ class TestETAAndSpeedRatio:
 # ---------------------------------------------------------------------------
 
 
+class TestStagedPassProgress:
+    """Intermediate passes and the final pass map onto the job's overall progress."""
+
+    async def _running_job(self, repo: InMemoryRenderRepository) -> RenderJob:
+        job = RenderJob.create(
+            project_id="proj-1",
+            output_path="/tmp/out.mp4",
+            output_format=OutputFormat.MP4,
+            quality_preset=QualityPreset.STANDARD,
+            render_plan=_make_plan_json(total_duration=60.0),
+        )
+        await repo.create(job)
+        await repo.update_status(job.id, RenderStatus.RUNNING)
+        return job
+
+    async def test_run_pass_maps_progress_into_range(self) -> None:
+        """Half of a pass spanning 20-60% of the job is 40% job progress."""
+        with _PATCH_NO_RUST:
+            service, repo, _, executor = _build_service()
+            job = await self._running_job(repo)
+            durations: list[int] = []
+
+            async def fake_execute(
+                job_obj: RenderJob,
+                cmd: list[str],
+                *,
+                total_duration_us: int = 0,
+            ) -> bool:
+                durations.append(total_duration_us)
+                cb = executor._progress_callback
+                if cb is not None:
+                    await cb(job_obj.id, 0.5, 1.0, None, None)
+                return True
+
+            executor.execute = fake_execute  # type: ignore[assignment]
+
+            assert await service.run_pass(
+                job, ["ffmpeg"], duration_s=2.5, progress_range=(0.2, 0.6)
+            )
+
+            stored = await service.get_job(job.id)
+            assert stored is not None
+            assert stored.progress == pytest.approx(0.4)
+            assert stored.status == RenderStatus.RUNNING
+            assert durations == [2_500_000]
+
+    async def test_run_job_offsets_progress_after_earlier_passes(self) -> None:
+        """The final pass's progress starts where the intermediate passes ended."""
+        with _PATCH_NO_RUST:
+            service, repo, ws, executor = _build_service()
+            job = await self._running_job(repo)
+            ws.broadcast.reset_mock()
+
+            async def fake_execute(
+                job_obj: RenderJob,
+                cmd: list[str],
+                *,
+                total_duration_us: int = 0,
+            ) -> bool:
+                cb = executor._progress_callback
+                if cb is not None:
+                    await cb(job_obj.id, 0.5, 1.0, None, None)
+                return False
+
+            executor.execute = fake_execute  # type: ignore[assignment]
+
+            await service.run_job(job, ["ffmpeg"], progress_range=(0.9, 1.0))
+
+            events = [c[0][0] for c in ws.broadcast.call_args_list]
+            progress = [
+                e["payload"]["progress"]
+                for e in events
+                if e["type"] == EventType.RENDER_PROGRESS.value
+            ]
+            assert progress == [pytest.approx(0.95)]
+
+
 class TestRenderWorkerIntegration:
     """Integration tests: job state progression QUEUED → RUNNING → COMPLETED."""
 
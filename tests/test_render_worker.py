@@ -682,8 +682,7 @@ def _make_worker_loop(
         service = MagicMock()
         service.run_job = AsyncMock(return_value=None)
         service._handle_failure = AsyncMock(return_value=None)
-        service._repo = MagicMock()
-        service._repo.update_status = AsyncMock(return_value=None)
+        service.update_job_status = AsyncMock(return_value=None)
 
     if queue is None:
         queue = MagicMock()
@@ -745,7 +744,9 @@ class TestWorkerLoop:
             with pytest.raises(asyncio.CancelledError):
                 await loop.run()
 
-        mock_build.assert_called_once_with(job, clip_repo, video_repo, None, None, None, None)
+        mock_build.assert_called_once_with(
+            job, clip_repo, video_repo, None, None, None, None, loop.fragment_cache
+        )
 
     @pytest.mark.asyncio
     async def test_run_job_called_with_built_command(self) -> None:
@@ -876,8 +877,7 @@ class TestWorkerLoop:
         service = MagicMock()
         service.run_job = AsyncMock()
         service._handle_failure = AsyncMock()
-        service._repo = MagicMock()
-        service._repo.update_status = AsyncMock()
+        service.update_job_status = AsyncMock()
 
         queue = MagicMock()
         clip_repo = AsyncMock()
@@ -971,8 +971,7 @@ class TestWorkerLoopErrors:
         service = MagicMock()
         service.run_job = AsyncMock(side_effect=RuntimeError("execution failed"))
         service._handle_failure = AsyncMock(side_effect=RuntimeError("handler failed"))
-        service._repo = MagicMock()
-        service._repo.update_status = AsyncMock(return_value=None)
+        service.update_job_status = AsyncMock(return_value=None)
 
         with patch(
             "stoat_ferret.render.worker.build_command_for_job",
@@ -985,15 +984,14 @@ class TestWorkerLoopErrors:
 
     @pytest.mark.asyncio
     async def test_direct_status_update_when_handler_fails(self) -> None:
-        """AC-2.3: If _handle_failure raises, repo.update_status called directly with FAILED."""
+        """AC-2.3: If _handle_failure raises, the job status is set to FAILED directly."""
         job = _make_job()
         queue = MagicMock()
         queue.dequeue = AsyncMock(side_effect=[job, asyncio.CancelledError()])
         service = MagicMock()
         service.run_job = AsyncMock(side_effect=RuntimeError("execution failed"))
         service._handle_failure = AsyncMock(side_effect=RuntimeError("handler failed"))
-        service._repo = MagicMock()
-        service._repo.update_status = AsyncMock(return_value=None)
+        service.update_job_status = AsyncMock(return_value=None)
 
         with patch(
             "stoat_ferret.render.worker.build_command_for_job",
@@ -1004,8 +1002,8 @@ class TestWorkerLoopErrors:
             with pytest.raises(asyncio.CancelledError):
                 await loop.run()
 
-        service._repo.update_status.assert_awaited_once()
-        call_args = service._repo.update_status.call_args
+        service.update_job_status.assert_awaited_once()
+        call_args = service.update_job_status.call_args
         assert call_args[0][0] == job.id
         assert call_args[0][1] == RenderStatus.FAILED
 
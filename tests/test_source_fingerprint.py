@@ -0,0 +1,305 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for tiered source fingerprints and their use in proxy staleness."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from stoat_ferret.api.services import source_fingerprint
+from stoat_ferret.api.services.proxy_service import ProxyService
+from stoat_ferret.api.services.scan import scan_directory
+from stoat_ferret.api.services.source_fingerprint import (
+    SAMPLE_BLOCK_BYTES,
+    SAMPLED_CHECKSUM_PREFIX,
+    current_checksum,
+    fingerprint_file,
+    fingerprint_from_video,
+)
+from stoat_ferret.db.async_repository import AsyncInMemoryVideoRepository
+from stoat_ferret.db.models import ProxyFile, ProxyQuality, ProxyStatus, Video
+from stoat_ferret.db.proxy_repository import InMemoryProxyRepository
+from stoat_ferret.ffmpeg.async_executor import FakeAsyncFFmpegExecutor
+
+_LARGE_SIZE = 4 * SAMPLE_BLOCK_BYTES + 123
+
+
+def _rewrite_byte(path: Path, offset: int) -> None:
+    """Flip one byte in place and bump mtime so the stat identity changes."""
+    stat = path.stat()
+    with open(path, "r+b") as f:
+        f.seek(offset)
+        byte = f.read(1)
+        f.seek(offset)
+        f.write(bytes([byte[0] ^ 0xFF]))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def large_file(tmp_path: Path) -> Path:
+    path = tmp_path / "camera.mov"
+    path.write_bytes(os.urandom(_LARGE_SIZE))
+    return path
+
+
+@pytest.fixture
+def no_hashing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail the test if any tier beyond stat reads the file."""
+
+    def _fail(*_args: object, **_kwargs: object) -> str:
+        raise AssertionError("file was hashed")
+
+    monkeypatch.setattr(source_fingerprint, "compute_sampled_sha256", _fail)
+    monkeypatch.setattr(source_fingerprint, "compute_full_sha256", _fail)
+
+
+def test_sampled_hash_tracks_head_middle_and_tail(large_file: Path) -> None:
+    """Edits in sampled regions change the sampled hash; full hash is on demand."""
+    first = fingerprint_file(str(large_file))
+    assert first.full_sha256 is None
+    assert first.size_bytes == _LARGE_SIZE
+
+    for offset in (10, _LARGE_SIZE // 2, _LARGE_SIZE - 10):
+        _rewrite_byte(large_file, offset)
+        assert fingerprint_file(str(large_file)).sampled_sha256 != first.sampled_sha256
+        _rewrite_byte(large_file, offset)
+
+    full = fingerprint_file(str(large_file), full=True)
+    assert full.full_sha256 == hashlib.sha256(large_file.read_bytes()).hexdigest()
+
+
+def test_unchanged_stat_reuses_known_fingerprint(large_file: Path, no_hashing: None) -> None:
+    """A matching size/mtime/inode answers without opening the file."""
+    stat = large_file.stat()
+    known = source_fingerprint.SourceFingerprint(
+        size_bytes=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        inode=stat.st_ino,
+        sampled_sha256="cafe",
+        full_sha256="beef",
+    )
+
+    assert fingerprint_file(str(large_file), known) is known
+    assert current_checksum(str(large_file), None, known) == f"{SAMPLED_CHECKSUM_PREFIX}cafe"
+    assert current_checksum(str(large_file), "f" * 64, known) == "beef"
+
+
+def test_current_checksum_follows_recorded_scheme(large_file: Path) -> None:
+    """Legacy full-hash checksums are compared by full hash."""
+    legacy = hashlib.sha256(large_file.read_bytes()).hexdigest()
+
+    assert current_checksum(str(large_file), legacy) == legacy
+    assert current_checksum(str(large_file)).startswith(SAMPLED_CHECKSUM_PREFIX)
+
+
+async def test_scan_stores_fingerprint_and_proxy_reuses_it(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Scan writes the fingerprint to the row; staleness checks then use stat only."""
+    source = tmp_path / "clip.mp4"
+    source.write_bytes(os.urandom(2048))
+    videos = AsyncInMemoryVideoRepository()
+    with patch("stoat_ferret.api.services.scan.ffprobe_video") as mock_probe:
+        mock_probe.return_value = AsyncMock(
+            duration_frames=300,
+            frame_rate_numerator=30,
+            frame_rate_denominator=1,
+            width=1280,
+            height=720,
+            video_codec="h264",
+            audio_codec=None,
+            subtitle_count=0,
+            data_count=0,
+            subtitle_streams=[],
+        )
+        await scan_directory(str(tmp_path), recursive=False, repository=videos)
+
+    video = await videos.get_by_path(str(source.absolute()))
+    assert video is not None
+    stored = fingerprint_from_video(video)
+    assert stored is not None
+    assert stored.size_bytes == 2048
+
+    proxies = InMemoryProxyRepository()
+    service = ProxyService(
+        proxy_repository=proxies,
+        async_executor=FakeAsyncFFmpegExecutor(),
+        video_repository=videos,
+        proxy_dir=str(tmp_path / "proxies"),
+    )
+    proxy = await service.generate_proxy(
+        video_id=video.id,
+        source_path=video.path,
+        source_width=1280,
+        source_height=720,
+        duration_us=10_000_000,
+    )
+    assert proxy.source_checksum == stored.checksum
+
+    def _fail(*_args: object, **_kwargs: object) -> str:
+        raise AssertionError("file was hashed")
+
+    with monkeypatch.context() as m:
+        m.setattr(source_fingerprint, "compute_sampled_sha256", _fail)
+        assert await service.check_stale(proxy.id, video.path) is False
+
+    _rewrite_byte(source, 0)
+    assert await service.check_stale(proxy.id, video.path) is True
+    updated = await proxies.get(proxy.id)
+    assert updated is not None
+    assert updated.status == ProxyStatus.STALE
+
+
+async def test_legacy_proxy_full_hash_is_persisted_once(
+    large_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A legacy full-hash proxy hashes the source once; the row then answers by stat."""
+    now = datetime.now(timezone.utc)
+    scanned = fingerprint_file(str(large_file))
+    videos = AsyncInMemoryVideoRepository()
+    video = await videos.add(
+        Video(
+            id="legacy",
+            path=str(large_file),
+            filename=large_file.name,
+            duration_frames=1,
+            frame_rate_numerator=24,
+            frame_rate_denominator=1,
+            width=1920,
+            height=1080,
+            video_codec="h264",
+            file_size=_LARGE_SIZE,
+            created_at=now,
+            updated_at=now,
+            file_mtime_ns=scanned.mtime_ns,
+            file_inode=scanned.inode,
+            sampled_sha256=scanned.sampled_sha256,
+        )
+    )
+    proxies = InMemoryProxyRepository()
+    legacy = source_fingerprint.compute_full_sha256(str(large_file))
+    await proxies.add(
+        ProxyFile(
+            id="proxy-legacy",
+            source_video_id=video.id,
+            quality=ProxyQuality.HIGH,
+            file_path="/proxies/legacy.mp4",
+            file_size_bytes=1,
+            status=ProxyStatus.PENDING,
+            source_checksum=legacy,
+            generated_at=None,
+            last_accessed_at=now,
+        )
+    )
+    service = ProxyService(
+        proxy_repository=proxies,
+        async_executor=FakeAsyncFFmpegExecutor(),
+        video_repository=videos,
+    )
+
+    assert await service.check_stale("proxy-legacy", video.path) is False
+    stored = await videos.get(video.id)
+    assert stored is not None
+    assert stored.content_sha256 == legacy
+
+    def _fail(*_args: object, **_kwargs: object) -> str:
+        raise AssertionError("file was hashed")
+
+    with monkeypatch.context() as m:
+        m.setattr(source_fingerprint, "compute_full_sha256", _fail)
+        m.setattr(source_fingerprint, "compute_sampled_sha256", _fail)
+        assert await service.check_stale("proxy-legacy", video.path) is False
+
+
+async def test_legacy_full_hash_store_keeps_concurrent_row_edits(
+    large_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Persisting the full hash writes only fingerprint columns, not a stale row."""
+    now = datetime.now(timezone.utc)
+    scanned = fingerprint_file(str(large_file))
+    videos = AsyncInMemoryVideoRepository()
+    video = await videos.add(
+        Video(
+            id="legacy",
+            path=str(large_file),
+            filename=large_file.name,
+            duration_frames=1,
+            frame_rate_numerator=24,
+            frame_rate_denominator=1,
+            width=1920,
+            height=1080,
+            video_codec="h264",
+            file_size=_LARGE_SIZE,
+            created_at=now,
+            updated_at=now,
+            file_mtime_ns=scanned.mtime_ns,
+            file_inode=scanned.inode,
+            sampled_sha256=scanned.sampled_sha256,
+        )
+    )
+    proxies = InMemoryProxyRepository()
+    legacy = source_fingerprint.compute_full_sha256(str(large_file))
+    await proxies.add(
+        ProxyFile(
+            id="proxy-legacy",
+            source_video_id=video.id,
+            quality=ProxyQuality.HIGH,
+            file_path="/proxies/legacy.mp4",
+            file_size_bytes=1,
+            status=ProxyStatus.PENDING,
+            source_checksum=legacy,
+            generated_at=None,
+            last_accessed_at=now,
+        )
+    )
+    service = ProxyService(
+        proxy_repository=proxies,
+        async_executor=FakeAsyncFFmpegExecutor(),
+        video_repository=videos,
+    )
+    loop = asyncio.get_running_loop()
+    real_full_sha256 = source_fingerprint.compute_full_sha256
+
+    def _hash_while_row_is_edited(path: str) -> str:
+        # Another request edits the row while the slow full hash runs.
+        asyncio.run_coroutine_threadsafe(
+            videos.update(replace(video, thumbnail_path="/thumbs/new.jpg")), loop
+        ).result()
+        return real_full_sha256(path)
+
+    monkeypatch.setattr(source_fingerprint, "compute_full_sha256", _hash_while_row_is_edited)
+
+    assert await service.check_stale("proxy-legacy", video.path) is False
+    stored = await videos.get(video.id)
+    assert stored is not None
+    assert stored.content_sha256 == legacy
+    assert stored.thumbnail_path == "/thumbs/new.jpg"
+
+
+def test_video_without_fingerprint_has_none() -> None:
+    """Rows scanned before fingerprints existed fall back to hashing."""
+    now = datetime.now(timezone.utc)
+    video = Video(
+        id="v",
+        path="/v.mp4",
+        filename="v.mp4",
+        duration_frames=1,
+        frame_rate_numerator=24,
+        frame_rate_denominator=1,
+        width=1,
+        height=1,
+        video_codec="h264",
+        file_size=1,
+        created_at=now,
+        updated_at=now,
+    )
+    assert fingerprint_from_video(video) is None
@@ -0,0 +1,186 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for the incrementally maintained system state tracker."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from stoat_ferret.api.services.system_state import SystemStateTracker
+from stoat_ferret.jobs.queue import InMemoryJobQueue, JobResult, JobStatus, _JobEntry
+from stoat_ferret.render.models import OutputFormat, QualityPreset, RenderJob, RenderStatus
+from stoat_ferret.render.render_repository import InMemoryRenderRepository
+
+
+class _CountingRenderRepository(InMemoryRenderRepository):
+    """In-memory render repository that counts list_by_status queries."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.list_calls = 0
+
+    async def list_by_status(self, status: RenderStatus) -> list[RenderJob]:
+        self.list_calls += 1
+        return await super().list_by_status(status)
+
+
+def _make_render_job() -> RenderJob:
+    return RenderJob.create(
+        project_id="proj-1",
+        output_path="/tmp/out.mp4",
+        output_format=OutputFormat.MP4,
+        quality_preset=QualityPreset.STANDARD,
+        render_plan="{}",
+    )
+
+
+def _app_state(**overrides: Any) -> SimpleNamespace:
+    state: dict[str, Any] = {
+        "job_queue": InMemoryJobQueue(),
+        "render_repository": _CountingRenderRepository(),
+        "ws_manager": SimpleNamespace(active_connections=0),
+    }
+    state.update(overrides)
+    return SimpleNamespace(**state)
+
+
+async def test_render_jobs_tracked_without_requerying() -> None:
+    """After the seed, render changes arrive through listeners, not queries."""
+    app_state = _app_state()
+    repo = app_state.render_repository
+    seeded = await repo.create(_make_render_job())
+    tracker = SystemStateTracker(app_state)
+
+    first = await tracker.snapshot()
+    assert [job.job_id for job in first.active_jobs] == [seeded.id]
+    seed_queries = repo.list_calls
+
+    added = await repo.create(_make_render_job())
+    await repo.update_status(seeded.id, RenderStatus.RUNNING)
+    await repo.update_progress(seeded.id, 0.4)
+    state = await tracker.snapshot()
+
+    assert repo.list_calls == seed_queries
+    assert [(job.job_id, job.status, job.progress) for job in state.active_jobs] == [
+        (seeded.id, "running", 0.4),
+        (added.id, "queued", 0.0),
+    ]
+    assert state.version > first.version
+
+    await repo.update_status(seeded.id, RenderStatus.COMPLETED)
+    state = await tracker.snapshot()
+    assert [job.job_id for job in state.active_jobs] == [added.id]
+
+
+async def test_version_stable_while_nothing_changes() -> None:
+    """Repeated snapshots of an unchanged system keep the same version and ETag."""
+    tracker = SystemStateTracker(_app_state())
+
+    first = await tracker.snapshot()
+    etag = tracker.etag
+    second = await tracker.snapshot()
+
+    assert second.version == first.version
+    assert tracker.etag == etag
+
+
+async def test_in_memory_sources_bump_version() -> None:
+    """Queue job and connection count changes are detected on the next refresh."""
+    ws_manager = SimpleNamespace(active_connections=0)
+    app_state = _app_state(ws_manager=ws_manager)
+    tracker = SystemStateTracker(app_state)
+    version = (await tracker.snapshot()).version
+
+    entry = _JobEntry(job_id="scan-1", job_type="scan", payload={})
+    entry.result = JobResult(job_id="scan-1", status=JobStatus.RUNNING, progress=0.1)
+    app_state.job_queue._jobs["scan-1"] = entry
+    state = await tracker.snapshot()
+    assert state.version == version + 1
+    assert [job.job_id for job in state.active_jobs] == ["scan-1"]
+
+    ws_manager.active_connections = 2
+    state = await tracker.snapshot()
+    assert state.version == version + 2
+    assert state.active_connections == 2
+
+
+async def test_wait_for_change_wakes_on_render_event() -> None:
+    """A long-poll returns as soon as a render job changes."""
+    app_state = _app_state()
+    tracker = SystemStateTracker(app_state, recheck_interval_seconds=60.0)
+    version = (await tracker.snapshot()).version
+
+    waiter = asyncio.create_task(tracker.wait_for_change(version, 5.0))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    await app_state.render_repository.create(_make_render_job())
+
+    assert await asyncio.wait_for(waiter, timeout=1.0) is True
+    assert tracker.version > version
+
+
+async def test_wait_for_change_times_out_and_resyncs() -> None:
+    """No change means False at the deadline; an unknown version returns at once."""
+    tracker = SystemStateTracker(_app_state(), recheck_interval_seconds=0.01)
+    version = (await tracker.snapshot()).version
+
+    assert await tracker.wait_for_change(version, 0.05) is False
+    assert await tracker.wait_for_change(version + 100, 5.0) is True
+
+
+async def test_changes_during_seed_are_not_overwritten() -> None:
+    """A change observed while the seed query runs wins over the seeded row."""
+    repo = _CountingRenderRepository()
+    job = await repo.create(_make_render_job())
+    queried = asyncio.Event()
+    release = asyncio.Event()
+    original = repo.list_by_status
+
+    async def slow_list(status: RenderStatus) -> list[RenderJob]:
+        rows = await original(status)
+        if status == RenderStatus.QUEUED:
+            queried.set()
+            await release.wait()
+        return rows
+
+    repo.list_by_status = slow_list  # type: ignore[method-assign]
+    tracker = SystemStateTracker(_app_state(render_repository=repo))
+
+    snapshot = asyncio.create_task(tracker.snapshot())
+    await queried.wait()
+    await repo.update_status(job.id, RenderStatus.CANCELLED)
+    release.set()
+
+    assert (await snapshot).active_jobs == []
+
+
+async def test_repository_without_listeners_is_read_each_time() -> None:
+    """Repositories lacking add_listener fall back to per-call queries."""
+
+    class _PlainRepository:
+        def __init__(self) -> None:
+            self.jobs: list[RenderJob] = []
+
+        async def list_by_status(self, status: RenderStatus) -> list[RenderJob]:
+            return [job for job in self.jobs if job.status == status]
+
+    repo = _PlainRepository()
+    tracker = SystemStateTracker(_app_state(render_repository=repo))
+    assert (await tracker.snapshot()).active_jobs == []
+
+    repo.jobs.append(_make_render_job())
+    assert len((await tracker.snapshot()).active_jobs) == 1
+
+
+async def test_close_detaches_listener() -> None:
+    """After close the repository no longer drives version bumps."""
+    app_state = _app_state()
+    tracker = SystemStateTracker(app_state)
+    version = (await tracker.snapshot()).version
+
+    tracker.close()
+    await app_state.render_repository.create(_make_render_job())
+    assert tracker.version == version
@@ -166,6 +166,61 @@ class TestTrackCreateAndGet:
         assert result.id == track.id
 
 
+@pytest.mark.contract
+class TestTrackBulkWrites:
+    """Tests for create_tracks() and replace_tracks() methods."""
+
+    async def test_create_tracks(self, timeline_repository: AsyncTimelineRepositoryType) -> None:
+        """create_tracks inserts every track."""
+        tracks = [make_test_track(z_index=i, label=f"Track {i}") for i in range(3)]
+        await timeline_repository.create_tracks(tracks)
+
+        listed = await timeline_repository.get_tracks_by_project("project-1")
+        assert [t.id for t in listed] == [t.id for t in tracks]
+
+    async def test_create_tracks_duplicate_creates_nothing(
+        self, timeline_repository: AsyncTimelineRepositoryType
+    ) -> None:
+        """A duplicate ID in the batch raises ValueError and no track is created."""
+        existing = make_test_track()
+        await timeline_repository.create_track(existing)
+
+        with pytest.raises(ValueError):
+            await timeline_repository.create_tracks(
+                [make_test_track(z_index=1), make_test_track(id=existing.id)]
+            )
+
+        assert await timeline_repository.count_tracks("project-1") == 1
+
+    async def test_replace_tracks(self, timeline_repository: AsyncTimelineRepositoryType) -> None:
+        """replace_tracks swaps one project's tracks and leaves others alone."""
+        await timeline_repository.create_tracks(
+            [make_test_track(z_index=i) for i in range(2)]
+            + [make_test_track(project_id="project-2")]
+        )
+        new_tracks = [make_test_track(label="Audio", track_type="audio")]
+
+        await timeline_repository.replace_tracks("project-1", new_tracks)
+
+        listed = await timeline_repository.get_tracks_by_project("project-1")
+        assert [t.id for t in listed] == [new_tracks[0].id]
+        assert await timeline_repository.count_tracks("project-2") == 1
+
+    async def test_replace_tracks_failure_keeps_existing(
+        self, timeline_repository: AsyncTimelineRepositoryType
+    ) -> None:
+        """A failing replacement raises ValueError and keeps the old tracks."""
+        old = make_test_track()
+        other = make_test_track(project_id="project-2")
+        await timeline_repository.create_tracks([old, other])
+
+        with pytest.raises(ValueError):
+            await timeline_repository.replace_tracks("project-1", [make_test_track(id=other.id)])
+
+        listed = await timeline_repository.get_tracks_by_project("project-1")
+        assert [t.id for t in listed] == [old.id]
+
+
 @pytest.mark.contract
 class TestTrackGetByProject:
     """Tests for get_tracks_by_project() method."""
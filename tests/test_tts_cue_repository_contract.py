@@ -155,3 +155,26 @@ async def test_fk_violation_raises(sqlite_repo: AsyncSQLiteTtsCueRepository) ->
     cue = _make_cue(project_id="nonexistent-project-uuid")
     with pytest.raises(ValueError, match="constraint"):
         await sqlite_repo.create(cue)
+
+
+async def test_reset_evicted_only_touches_ready_cues(
+    sqlite_repo: AsyncSQLiteTtsCueRepository,
+) -> None:
+    ready = await sqlite_repo.create(_make_cue("cue-001", text="one"))
+    failed = await sqlite_repo.create(_make_cue("cue-002", text="two"))
+    other = await sqlite_repo.create(_make_cue("cue-003", text="three"))
+    await sqlite_repo.update_status(ready.id, "ready", generated_asset_id="/cache/one.wav")
+    await sqlite_repo.update_status(failed.id, "failed", error="boom")
+    await sqlite_repo.update_status(other.id, "ready", generated_asset_id="/cache/three.wav")
+
+    reset = await sqlite_repo.reset_evicted([ready.cache_key, failed.cache_key])
+
+    assert reset == 1
+    cue = await sqlite_repo.get(ready.id)
+    assert cue is not None
+    assert cue.status == "pending"
+    assert cue.generated_asset_id is None
+    unchanged = await sqlite_repo.get(other.id)
+    assert unchanged is not None
+    assert unchanged.status == "ready"
+    assert await sqlite_repo.reset_evicted([]) == 0
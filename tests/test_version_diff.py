@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2026 Grant Wickman
+
+"""Tests for structural version diff and three-way merge."""
+
+from __future__ import annotations
+
+import copy
+import json
+from typing import Any
+
+from stoat_ferret.db.version_diff import (
+    apply_changes,
+    diff_snapshots,
+    index_snapshot,
+    merge_snapshots,
+)
+
+
+def _timeline(clips_per_track: int = 3) -> dict[str, Any]:
+    return {
+        "project_id": "p1",
+        "tracks": [
+            {
+                "id": f"t{t}",
+                "label": f"Track {t}",
+                "clips": [
+                    {"id": f"c{t}-{c}", "timeline_start": c * 10.0, "effects": []}
+                    for c in range(clips_per_track)
+                ],
+            }
+            for t in range(2)
+        ],
+        "duration": 30.0,
+    }
+
+
+def _index(doc: dict[str, Any]) -> Any:
+    return index_snapshot(json.dumps(doc))
+
+
+def test_identical_snapshots_have_no_changes() -> None:
+    """Equal snapshots diff to nothing."""
+    doc = _timeline()
+    assert diff_snapshots(_index(doc), _index(copy.deepcopy(doc))) == []
+
+
+def test_field_edit_is_addressed_by_ids() -> None:
+    """A clip field edit is reported at an id-based path."""
+    a = _timeline()
+    b = copy.deepcopy(a)
+    b["tracks"][1]["clips"][2]["timeline_start"] = 99.0
+
+    changes = diff_snapshots(_index(a), _index(b))
+
+    assert [(c.op, c.pointer, c.before, c.after) for c in changes] == [
+        ("replace", "/tracks/t1/clips/c1-2/timeline_start", 20.0, 99.0)
+    ]
+
+
+def test_clip_insert_is_single_add() -> None:
+    """Inserting a clip mid-list is one add, not a cascade of positional edits."""
+    a = _timeline(clips_per_track=50)
+    b = copy.deepcopy(a)
+    new_clip = {"id": "new", "timeline_start": 5.0, "effects": []}
+    b["tracks"][0]["clips"].insert(1, new_clip)
+
+    changes = diff_snapshots(_index(a), _index(b))
+
+    assert len(changes) == 1
+    assert changes[0].op == "add"
+    assert changes[0].pointer == "/tracks/t0/clips/new"
+    assert changes[0].after == new_clip
+
+
+def test_first_clip_on_empty_track_is_add() -> None:
+    """Adding to an empty clip list is an add, and apply reproduces the target."""
+    a = _timeline(clips_per_track=0)
+    b = copy.deepcopy(a)
+    b["tracks"][0]["clips"].append({"id": "x", "timeline_start": 0.0})
+
+    changes = diff_snapshots(_index(a), _index(b))
+
+    assert [(c.op, c.pointer) for c in changes] == [("add", "/tracks/t0/clips/x")]
+    assert apply_changes(copy.deepcopy(a), changes) == b
+
+
+def test_apply_reproduces_target() -> None:
+    """Applying diff(a, b) to a yields b."""
+    a = _timeline()
+    b = copy.deepcopy(a)
+    del b["tracks"][0]["clips"][0]
+    b["tracks"][1]["clips"][1]["effects"] = [{"effect_type": "blur"}]
+    b["tracks"][1]["label"] = "Renamed"
+    b["duration"] = 45.0
+
+    changes = diff_snapshots(_index(a), _index(b))
+
+    assert apply_changes(copy.deepcopy(a), changes) == b
+
+
+def test_merge_combines_disjoint_edits() -> None:
+    """Edits to different clips from both sides are combined."""
+    base = _timeline()
+    ours = copy.deepcopy(base)
+    ours["tracks"][0]["clips"][0]["timeline_start"] = 1.0
+    theirs = copy.deepcopy(base)
+    theirs["tracks"][1]["clips"].append({"id": "added", "timeline_start": 30.0, "effects": []})
+
+    result = merge_snapshots(_index(base), _index(ours), _index(theirs))
+
+    assert result.conflicts == []
+    assert result.document["tracks"][0]["clips"][0]["timeline_start"] == 1.0
+    assert result.document["tracks"][1]["clips"][-1]["id"] == "added"
+    assert len(result.applied) == 2
+
+
+def test_merge_identical_edit_is_not_a_conflict() -> None:
+    """Both sides making the same change merges cleanly."""
+    base = _timeline()
+    edited = copy.deepcopy(base)
+    edited["duration"] = 60.0
+
+    result = merge_snapshots(_index(base), _index(edited), _index(copy.deepcopy(edited)))
+
+    assert result.conflicts == []
+    assert result.document == edited
+
+
+def test_merge_conflict_fails_by_default() -> None:
+    """Editing a clip the other side removed is a conflict."""
+    base = _timeline()
+    ours = copy.deepcopy(base)
+    ours["tracks"][0]["clips"][1]["timeline_start"] = 7.0
+    theirs = copy.deepcopy(base)
+    del theirs["tracks"][0]["clips"][1]
+
+    result = merge_snapshots(_index(base), _index(ours), _index(theirs))
+
+    assert result.document is None
+    assert len(result.conflicts) == 1
+    assert result.conflicts[0].path == ("tracks", "t0", "clips", "c0-1")
+
+
+def test_merge_conflict_strategies() -> None:
+    """ours/theirs strategies resolve conflicts in favour of that side."""
+    base = _timeline()
+    ours = copy.deepcopy(base)
+    ours["tracks"][0]["label"] = "Ours"
+    ours["duration"] = 1.0
+    theirs = copy.deepcopy(base)
+    theirs["tracks"][0]["label"] = "Theirs"
+
+    prefer_ours = merge_snapshots(_index(base), _index(ours), _index(theirs), strategy="ours")
+    prefer_theirs = merge_snapshots(_index(base), _index(ours), _index(theirs), strategy="theirs")
+
+    assert prefer_ours.document["tracks"][0]["label"] == "Ours"
+    assert prefer_theirs.document["tracks"][0]["label"] == "Theirs"
+    # Non-conflicting changes survive either way.
+    assert prefer_ours.document["duration"] == 1.0
+    assert prefer_theirs.document["duration"] == 1.0
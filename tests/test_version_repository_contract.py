@@ -9,6 +9,7 @@ AsyncInMemoryVersionRepository to verify they have identical behavior.
 
 from __future__ import annotations
 
+import json
 from collections.abc import AsyncGenerator
 
 import aiosqlite
@@ -16,6 +17,8 @@ import pytest
 
 from stoat_ferret.db.schema import create_tables_async
 from stoat_ferret.db.version_repository import (
+    ENCODING_DELTA,
+    ENCODING_KEYFRAME,
     AsyncInMemoryVersionRepository,
     AsyncSQLiteVersionRepository,
     VersionRecord,
@@ -51,12 +54,35 @@ async def version_repository(
         await create_tables_async(conn)
         await insert_test_projects(conn)
 
-        yield AsyncSQLiteVersionRepository(conn)
+        # A short keyframe interval exercises delta reconstruction in every test.
+        yield AsyncSQLiteVersionRepository(conn, keyframe_interval=3)
         await conn.close()
     else:
         yield AsyncInMemoryVersionRepository()
 
 
+def _timeline_snapshots(count: int) -> list[str]:
+    """Build successive timeline JSON snapshots that differ by small edits."""
+    doc: dict[str, object] = {
+        "project_id": "project-1",
+        "tracks": [
+            {"id": f"t{t}", "clips": [{"id": f"c{t}-{c}", "start": c * 5.0} for c in range(20)]}
+            for t in range(3)
+        ],
+    }
+    tracks = doc["tracks"]
+    assert isinstance(tracks, list)
+    snapshots = []
+    for i in range(count):
+        clips = tracks[i % 3]["clips"]
+        if i % 4 == 3:
+            clips.insert(2, {"id": f"new-{i}", "start": float(i)})
+        else:
+            clips[i % len(clips)]["start"] = i * 100.0
+        snapshots.append(json.dumps(doc))
+    return snapshots
+
+
 @pytest.mark.contract
 class TestVersionSave:
     """Tests for save() method."""
@@ -134,6 +160,92 @@ class TestVersionList:
         assert v.checksum == compute_checksum('{"data": true}')
 
 
+@pytest.mark.contract
+class TestVersionSummaries:
+    """Tests for list_version_summaries() and count_versions()."""
+
+    async def test_summaries_paginate_most_recent_first(
+        self, version_repository: AsyncVersionRepositoryType
+    ) -> None:
+        """Summaries honour limit/offset and carry checksums."""
+        for i in range(5):
+            await version_repository.save("project-1", f'{{"v": {i + 1}}}')
+
+        page = await version_repository.list_version_summaries("project-1", limit=2, offset=1)
+
+        assert [s.version_number for s in page] == [4, 3]
+        assert page[0].checksum == compute_checksum('{"v": 4}')
+        assert page[0].project_id == "project-1"
+
+    async def test_summaries_without_limit_return_all(
+        self, version_repository: AsyncVersionRepositoryType
+    ) -> None:
+        """limit=None returns every version."""
+        for i in range(3):
+            await version_repository.save("project-1", f'{{"v": {i + 1}}}')
+
+        summaries = await version_repository.list_version_summaries("project-1")
+
+        assert [s.version_number for s in summaries] == [3, 2, 1]
+
+    async def test_count_versions(self, version_repository: AsyncVersionRepositoryType) -> None:
+        """count_versions counts per project."""
+        for i in range(4):
+            await version_repository.save("project-1", f'{{"v": {i + 1}}}')
+        await version_repository.save("project-2", '{"v": 1}')
+
+        assert await version_repository.count_versions("project-1") == 4
+        assert await version_repository.count_versions("project-2") == 1
+        assert await version_repository.count_versions("missing") == 0
+
+
+@pytest.mark.contract
+class TestVersionRoundTrip:
+    """Stored versions read back byte-for-byte across keyframes and deltas."""
+
+    async def test_list_and_get_reproduce_saved_json(
+        self, version_repository: AsyncVersionRepositoryType
+    ) -> None:
+        """Every saved snapshot is returned exactly by get_version and list_versions."""
+        snapshots = _timeline_snapshots(10)
+        for text in snapshots:
+            await version_repository.save("project-1", text)
+
+        listed = await version_repository.list_versions("project-1")
+
+        assert [v.timeline_json for v in reversed(listed)] == snapshots
+        for number, text in enumerate(snapshots, start=1):
+            record = await version_repository.get_version("project-1", number)
+            assert record is not None
+            assert record.timeline_json == text
+
+    async def test_prune_keeps_retained_versions_readable(
+        self, version_repository: AsyncVersionRepositoryType
+    ) -> None:
+        """Pruning past a keyframe leaves the retained versions intact."""
+        snapshots = _timeline_snapshots(8)
+        for text in snapshots:
+            await version_repository.save("project-1", text)
+
+        await version_repository.delete_old_versions("project-1", 4)
+        await version_repository.save("project-1", snapshots[0])
+
+        listed = await version_repository.list_versions("project-1")
+        assert [v.timeline_json for v in reversed(listed)] == snapshots[4:] + [snapshots[0]]
+
+    async def test_non_canonical_json_round_trips(
+        self, version_repository: AsyncVersionRepositoryType
+    ) -> None:
+        """Client-supplied JSON with unusual spacing and non-JSON text are preserved."""
+        texts = ['{"v":1}', '{"v":  2 }', "not json", '{"v": 3}']
+        for text in texts:
+            await version_repository.save("project-1", text)
+
+        listed = await version_repository.list_versions("project-1")
+
+        assert [v.timeline_json for v in reversed(listed)] == texts
+
+
 @pytest.mark.contract
 class TestVersionGet:
     """Tests for get_version() method."""
@@ -303,3 +415,89 @@ class TestVersionMultiProjectIsolation:
         assert len(p1_versions) == 2
         assert len(p2_versions) == 1
         assert p2_versions[0].version_number == 1
+
+
+class TestSQLiteDeltaStorage:
+    """SQLite-specific tests for keyframe/delta encoding."""
+
+    @pytest.fixture
+    async def conn(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Provide an initialised in-memory database with test projects."""
+        conn = await aiosqlite.connect(":memory:")
+        await create_tables_async(conn)
+        await insert_test_projects(conn)
+        yield conn
+        await conn.close()
+
+    async def _encodings(self, conn: aiosqlite.Connection) -> list[tuple[int, str, int | None]]:
+        cursor = await conn.execute(
+            "SELECT version_number, encoding, base_version FROM project_versions "
+            "WHERE project_id = 'project-1' ORDER BY version_number"
+        )
+        return [(r[0], r[1], r[2]) for r in await cursor.fetchall()]
+
+    async def test_keyframe_every_interval(self, conn: aiosqlite.Connection) -> None:
+        """Versions between keyframes are stored as deltas against the keyframe."""
+        repo = AsyncSQLiteVersionRepository(conn, keyframe_interval=3)
+        for text in _timeline_snapshots(7):
+            await repo.save("project-1", text)
+
+        assert await self._encodings(conn) == [
+            (1, ENCODING_KEYFRAME, None),
+            (2, ENCODING_DELTA, 1),
+            (3, ENCODING_DELTA, 1),
+            (4, ENCODING_KEYFRAME, None),
+            (5, ENCODING_DELTA, 4),
+            (6, ENCODING_DELTA, 4),
+            (7, ENCODING_KEYFRAME, None),
+        ]
+
+    async def test_deltas_are_smaller_than_full_json(self, conn: aiosqlite.Connection) -> None:
+        """A small edit stores a payload far smaller than the timeline itself."""
+        repo = AsyncSQLiteVersionRepository(conn)
+        snapshots = _timeline_snapshots(2)
+        for text in snapshots:
+            await repo.save("project-1", text)
+
+        cursor = await conn.execute(
+            "SELECT length(payload), length(timeline_json) FROM project_versions "
+            "WHERE project_id = 'project-1' AND version_number = 2"
+        )
+        row = await cursor.fetchone()
+        assert row is not None
+        assert row[0] * 10 < len(snapshots[1])
+        assert row[1] == 0
+
+    async def test_identical_content_reuses_storage(self, conn: aiosqlite.Connection) -> None:
+        """Saving content already stored references the existing keyframe."""
+        repo = AsyncSQLiteVersionRepository(conn, keyframe_interval=1)
+        await repo.save("project-1", '{"v": 1}')
+        await repo.save("project-1", '{"v": 2}')
+        again = await repo.save("project-1", '{"v": 1}')
+
+        assert again.timeline_json == '{"v": 1}'
+        assert (await self._encodings(conn))[2] == (3, ENCODING_DELTA, 1)
+
+    async def test_legacy_raw_rows_are_readable(self, conn: aiosqlite.Connection) -> None:
+        """Rows written before keyframe storage still read and serve as delta bases."""
+        await conn.execute(
+            """
+            INSERT INTO project_versions
+                (project_id, version_number, timeline_json, checksum, created_at)
+            VALUES ('project-1', 1, ?, ?, '2024-01-01T00:00:00+00:00')
+            """,
+            ('{"clips": [1, 2, 3]}', compute_checksum('{"clips": [1, 2, 3]}')),
+        )
+        await conn.commit()
+        repo = AsyncSQLiteVersionRepository(conn)
+
+        await repo.save("project-1", '{"clips": [1, 2, 3, 4]}')
+        restored = await repo.restore("project-1", 1)
+
+        assert restored.timeline_json == '{"clips": [1, 2, 3]}'
+        listed = await repo.list_versions("project-1")
+        assert [v.timeline_json for v in listed] == [
+            '{"clips": [1, 2, 3]}',
+            '{"clips": [1, 2, 3, 4]}',
+            '{"clips": [1, 2, 3]}',
+        ]
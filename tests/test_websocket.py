@@ -129,8 +129,8 @@ class TestEventTypes:
         assert EventType.PREVIEW_ERROR.value == "preview.error"
 
     def test_event_type_count(self) -> None:
-        """EventType should have exactly 30 members."""
-        assert len(EventType) == 30
+        """EventType should have exactly 31 members."""
+        assert len(EventType) == 31
 
     def test_build_event_schema(self) -> None:
         """build_event should return dict with type, payload, correlation_id, timestamp."""